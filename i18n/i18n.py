@@ -59,6 +59,9 @@ TRANSLATION_FILES_DIR = _get_translation_files_dir()
 ELLIPSIS_UNICODE = "\u2026"
 ELLIPSIS_ASCII = "..."
 
+# Bytes of a baked catalog per source line
+CATALOG_LINE_BYTES = 32
+
 KRUX_LICENSE = """# The MIT License (MIT)
 
 # Copyright (c) 2021-2024 Krux contributors
@@ -320,6 +323,31 @@ def remove_unnecessary():
                 # run black after this
 
 
+def build_catalog(slugs, translations):
+    """
+    Packs the translated slugs as a binary catalog: a little-endian uint16 count,
+    the slugs' crc32 sorted as uint32, count + 1 uint32 offsets and the UTF-8 heap
+    """
+    entries = {}
+    for slug in slugs:
+        if slug in translations and translations[slug] != slug:
+            slug_id = binascii.crc32(slug.encode("utf-8"))
+            if slug_id in entries:
+                raise ValueError("ERROR: crc32 collision on slug '%s'" % slug)
+            entries[slug_id] = translations[slug].encode("utf-8")
+    slug_ids = sorted(entries)
+    heap = b"".join(entries[slug_id] for slug_id in slug_ids)
+    offsets = [0]
+    for slug_id in slug_ids:
+        offsets.append(offsets[-1] + len(entries[slug_id]))
+    return (
+        len(slug_ids).to_bytes(2, "little")
+        + b"".join(slug_id.to_bytes(4, "little") for slug_id in slug_ids)
+        + b"".join(offset.to_bytes(4, "little") for offset in offsets)
+        + heap
+    )
+
+
 def bake_translations():
     """
     Bakes individual translation tables into separate files inside the krux namespace
@@ -344,15 +372,9 @@ def bake_translations():
             join(TRANSLATION_FILES_DIR, translation_filename), "r", encoding="utf8"
         ) as translation_file:
             translations = json.load(translation_file)
-            translations_array = []
-            for slug in code_slugs:
-                if slug not in translations:
-                    translations_array.append(slug)
-                else:
-                    translations_array.append(translations[slug])
             language_code = basename(translation_filename).split(".")[0][:2]
 
-            # Write the individual translation array to a separate Python file
+            # Write the locale's catalog to a separate Python file
             # in the 'translations' subfolder
             with open(
                 join(translations_dir, f"{language_code}.py"),
@@ -361,16 +383,16 @@ def bake_translations():
                 newline="\n",
             ) as language_file:
                 language_file.write(KRUX_LICENSE)
-                language_file.write("# pylint: disable=C0301\n")
-                language_file.write("translation_array = ")
-                language_file.write(repr(translations_array))
-                language_file.write("\n")
+                language_file.write("# pylint: disable=C0103,C0301\n")
+                language_file.write("catalog = (\n")
+                catalog = build_catalog(code_slugs, translations)
+                for i in range(0, len(catalog), CATALOG_LINE_BYTES):
+                    language_file.write(
+                        "    " + repr(catalog[i : i + CATALOG_LINE_BYTES]) + "\n"
+                    )
+                language_file.write(")\n")
                 print("Baked: " + translations_dir + f"/{language_code}.py")
-    # Create an reference array for index lookup
-    reference_array = []
-    for slug in code_slugs:
-        reference_array.append(binascii.crc32(slug.encode("utf-8")))
-    # Create a file with a list of all available languages and index lookup array
+    # Create a file with a list of all available languages
     with open(join(translations_dir, "__init__.py"), "w", encoding="utf8") as init_file:
         init_file.write(KRUX_LICENSE)
         init_file.write("available_languages = [")
@@ -379,9 +401,6 @@ def bake_translations():
         )
         init_file.write("]")
         init_file.write("\n")
-        init_file.write("ref_array = ")
-        init_file.write(repr(reference_array))
-        init_file.write("\n")
 
 
 def create_translation_file(locale):
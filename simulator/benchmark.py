@@ -0,0 +1,58 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Runs headless benchmarks of Krux hot paths against the simulator mocks
+
+Example: poetry run python simulator/benchmark.py firmware --device maixpy_amigo
+"""
+
+import os
+import argparse
+import importlib
+from kruxsim import devices
+from kruxsim.benchmarks import BENCHMARKS, setup_headless
+
+exec_folder = "simulator"
+current_dir = os.getcwd()
+
+# check if is executing in exec_folder, if not, try to change to exec_folder
+if not current_dir.endswith(exec_folder):
+    os.chdir(exec_folder)
+
+parser = argparse.ArgumentParser()
+subparsers = parser.add_subparsers(dest="benchmark", required=True)
+for name, module_name in BENCHMARKS.items():
+    subparser = subparsers.add_parser(name)
+    subparser.add_argument(
+        "--device",
+        type=str,
+        default=devices.AMIGO,
+        required=False,
+    )
+    subparser.set_defaults(module_name=module_name)
+
+    # Benchmark modules import krux lazily, so they can be loaded before mocks
+    importlib.import_module(module_name).add_arguments(subparser)
+
+args = parser.parse_args()
+
+setup_headless(args.device)
+importlib.import_module(args.module_name).run(args)
@@ -25,15 +25,5 @@
 locales=("en-US")
 devices=("maixpy_m5stickv" "maixpy_amigo")
 
-rm -rf krux-screenshots
-
-for locale in "${locales[@]}"
-do
-    for device in "${devices[@]}"
-    do
-        ./generate-device-screenshots.sh $device $locale
-        mkdir -p krux-screenshots/$device/
-        cp screenshots/* krux-screenshots/$device/.
-        #cp -r screenshots krux-screenshots/$device/$locale
-    done
-done
+# Runs headless, one device and locale per CPU, into krux-screenshots/<device>
+poetry run python screenshots.py --devices "${devices[@]}" --locales "${locales[@]}"
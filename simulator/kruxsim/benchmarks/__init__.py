@@ -0,0 +1,103 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import sys
+import time
+from unittest import mock
+
+# Benchmark name -> module in kruxsim.benchmarks exposing run(args)
+BENCHMARKS = {
+    "addresses": "kruxsim.benchmarks.addresses",
+    "bip39": "kruxsim.benchmarks.bip39",
+    "cnc": "kruxsim.benchmarks.cnc",
+    "device": "kruxsim.benchmarks.device",
+    "firmware": "kruxsim.benchmarks.firmware",
+    "flash": "kruxsim.benchmarks.flash",
+    "flashhash": "kruxsim.benchmarks.flashhash",
+    "grbl": "kruxsim.benchmarks.grbl",
+    "kef": "kruxsim.benchmarks.kef",
+    "psbt": "kruxsim.benchmarks.psbt",
+    "tinyseed": "kruxsim.benchmarks.tinyseed",
+    "translations": "kruxsim.benchmarks.translations",
+}
+
+# Hardware modules not needed to exercise krux logic without a window
+HEADLESS_MODULES = (
+    "lcd",
+    "machine",
+    "pmu",
+    "sensor",
+    "image",
+    "shannon",
+)
+
+
+def setup_headless(device):
+    """Registers the simulator mocks that don't need a display"""
+    from kruxsim.mocks import board
+
+    board.register_device(device)
+
+    # pylint: disable=unused-import
+    from kruxsim.mocks import uos_functions
+    from kruxsim.mocks import ujson
+    from kruxsim.mocks import urandom
+    from kruxsim.mocks import usys
+    from kruxsim.mocks import ugc
+    from kruxsim.mocks import utime
+    from kruxsim.mocks import fpioa_manager
+    from kruxsim.mocks import Maix
+    from kruxsim.mocks import flash
+    from kruxsim.mocks import deflate
+    from kruxsim.mocks import secp256k1
+    from kruxsim.mocks import qrcode
+    from kruxsim.mocks import uhashlib_hw
+
+    for name in HEADLESS_MODULES:
+        if name not in sys.modules:
+            sys.modules[name] = mock.MagicMock()
+
+    from kruxsim.mocks import baseconv
+
+
+class Timer:
+    """Context manager measuring elapsed wall time in milliseconds"""
+
+    def __init__(self):
+        self.start = 0
+        self.elapsed_ms = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        self.elapsed_ms = (time.perf_counter() - self.start) * 1000
+
+
+def print_report(title, rows):
+    """Prints benchmark results as an aligned two-column table"""
+    width = max(len(label) for label, _ in rows)
+    print(title)
+    print("-" * len(title))
+    for label, value in rows:
+        print("%s  %s" % (label.ljust(width), value))
+    print()
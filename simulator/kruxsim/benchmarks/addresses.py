@@ -0,0 +1,77 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Times checking that an address belongs to a multisig wallet at several depths"""
+
+from kruxsim.benchmarks import Timer, print_report
+
+DEPTHS = (100, 1000, 10000)
+
+MULTISIG_DESCRIPTOR = "wsh(sortedmulti(2,[55f8fc5d/48h/0h/0h/2h]xpub6EKmKYGYc1WY6t9d3d9SksR8keSaPZbFa6tqsGiH4xVxx8d2YyxSX7WG6yXEX3CmG54dPCxaapDw1XsjwCmfoqP7tbsAeqMVfKvqSAu4ndy/<0;1>/*,[3e15470d/48h/0h/0h/2h]xpub6F2P6Pz5KLPgCc6pTBd2xxCunaSYWc8CdkL28W5z15pJrN3aCYY7mCUAkCMtqrgT2wdhAGgRnJxAkCCUpGKoXKxQ57yffEGmPwtYA3DEXwu/<0;1>/*,[d3a80c8b/48h/0h/0h/2h]xpub6FKYY6y3oVi7ihSCszFKRSeZj5SzrfSsUFXhKqjMV4iigrLhxwMX3mrjioNyLTZ5iD3u4wU9S3tyzpJGxhd5geaXoQ68jGz2M6dfh2zJrUv/<0;1>/*))"
+
+
+def linear_find(wallet, address, limit):
+    """Previous search: derive every address from the account keys and compare"""
+    from embit.networks import NETWORKS
+
+    network = NETWORKS[wallet.which_network()]
+    for i in range(limit):
+        if wallet.descriptor.derive(i, branch_index=0).address(network=network) == (
+            address
+        ):
+            return i
+    return None
+
+
+def run(args):
+    """Times linear search, first indexed lookup and repeated lookup per depth"""
+    from krux.wallet import Wallet
+
+    rows = []
+    for depth in args.depths:
+        wallet = Wallet(None)
+        wallet.load(MULTISIG_DESCRIPTOR, None)
+        address = wallet.descriptor.derive(depth - 1, branch_index=0).address()
+
+        with Timer() as linear:
+            assert linear_find(wallet, address, depth) == depth - 1
+        with Timer() as first:
+            assert wallet.find_address(address, depth) == depth - 1
+        with Timer() as repeated:
+            assert wallet.find_address(address, depth) == depth - 1
+        rows.append(
+            (
+                "depth %d" % depth,
+                "linear %.0f ms  first lookup %.0f ms  repeated %.2f ms  index %d bytes"
+                % (
+                    linear.elapsed_ms,
+                    first.elapsed_ms,
+                    repeated.elapsed_ms,
+                    len(wallet._derived.scripts[0]),
+                ),
+            )
+        )
+    print_report("Address ownership check, 2-of-3 multisig, receive branch", rows)
+
+
+def add_arguments(parser):
+    """Benchmark specific command line arguments"""
+    parser.add_argument("--depths", type=int, nargs="+", default=DEPTHS)
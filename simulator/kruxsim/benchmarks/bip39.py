@@ -0,0 +1,72 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Times BIP39 seed derivation through the firmware entry point, the software
+fallback and a Key rebuilt with the seed already derived this session
+"""
+
+import sys
+from unittest import mock
+
+from kruxsim.benchmarks import Timer, print_report
+
+RUNS = 20
+
+MNEMONIC = " ".join(["abandon"] * 11 + ["about"])
+
+PASSPHRASE = "benchmark"
+
+
+def derive(runs):
+    """Derives the seed runs times, returning the milliseconds per seed"""
+    from krux.bip39 import k_mnemonic_to_seed
+
+    with Timer() as timer:
+        for _ in range(runs):
+            k_mnemonic_to_seed(MNEMONIC, PASSPHRASE)
+    return timer.elapsed_ms / runs
+
+
+def run(args):
+    """Derives the seed with and without the firmware's PBKDF2-HMAC-SHA512"""
+    from embit.networks import NETWORKS
+    from krux import key
+    from krux.key import Key, TYPE_SINGLESIG
+
+    rows = [("firmware entry point", "%.1f ms/seed" % derive(args.runs))]
+    with mock.patch.dict(sys.modules, {"uhashlib_hw": mock.MagicMock(spec=[])}):
+        rows.append(("software fallback", "%.1f ms/seed" % derive(args.runs)))
+
+    key.clear_seeds()
+    with Timer() as timer:
+        Key(MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"], PASSPHRASE)
+    rows.append(("Key, cold", "%.1f ms/key" % timer.elapsed_ms))
+    with Timer() as timer:
+        for _ in range(args.runs):
+            Key(MNEMONIC, TYPE_SINGLESIG, NETWORKS["main"], PASSPHRASE)
+    rows.append(("Key, seed reused", "%.1f ms/key" % (timer.elapsed_ms / args.runs)))
+    key.clear_seeds()
+    print_report("BIP39 seed derivation, %d runs" % args.runs, rows)
+
+
+def add_arguments(parser):
+    """Benchmark specific command line arguments"""
+    parser.add_argument("--runs", type=int, default=RUNS)
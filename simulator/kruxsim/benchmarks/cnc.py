@@ -0,0 +1,71 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Compares the G-code size and estimated machining time of each CNC cut method"""
+
+import io
+
+from kruxsim.benchmarks import Timer, print_report
+
+# SeedQR digits of a 24 words mnemonic
+SEED_QR_DATA = "".join("%04d" % (i * 83 % 2048) for i in range(24))
+
+
+def run(args):
+    """Generates G-code for a SeedQR with each cut method, plain and inverted"""
+    import qrcode
+    from krux.krux_settings import Settings
+    from krux.printers.cnc import FilePrinter, GCodeGenerator, GCodeStats
+
+    cnc = Settings().hardware.printer.cnc
+    code = qrcode.encode(SEED_QR_DATA)
+    for invert in (False, True):
+        rows = []
+        for cut_method in cnc.__class__.cut_method.categories:
+            cnc.invert = invert
+            cnc.cut_method = cut_method
+            printer = FilePrinter()
+            printer.file = io.StringIO()
+            printer.stats = GCodeStats()
+            with Timer() as timer:
+                GCodeGenerator.print_qr_code(printer, code)
+            stats = printer.stats
+            rows.append(
+                (
+                    cut_method,
+                    "%6d lines  %5d KB  rapid %6.1f%s  est. %6.1f min  in %.0f ms"
+                    % (
+                        stats.lines,
+                        stats.size // 1024,
+                        stats.rapid_distance,
+                        cnc.unit,
+                        stats.estimated_minutes(cnc.feed_rate),
+                        timer.elapsed_ms,
+                    ),
+                )
+            )
+        print_report(
+            "SeedQR G-code by cut method%s" % (", inverted" if invert else ""), rows
+        )
+
+
+def add_arguments(parser):
+    """Benchmark specific command line arguments"""
@@ -0,0 +1,73 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Runs the Device Tests benchmark suite headless, against the simulator mocks,
+so its numbers can be compared with a report saved on a device
+"""
+
+import json
+import tempfile
+import tracemalloc
+from unittest import mock
+
+from kruxsim.benchmarks import print_report
+
+
+def run(args):
+    """Runs every device benchmark, with the SD card in a temporary folder"""
+    # gc.mem_alloc reads tracemalloc, so heap peaks are reported
+    tracemalloc.start()
+    from krux.device_benchmarks import all_benchmarks, run_benchmark, report
+    from krux.sd_card import SDHandler
+
+    results = []
+    with tempfile.TemporaryDirectory() as sd_dir:
+        with mock.patch.object(SDHandler, "PATH_STR", sd_dir + "/%s"):
+            for benchmark in all_benchmarks():
+                if args.only and args.only not in benchmark[0]:
+                    continue
+                results.append(run_benchmark(*benchmark))
+    tracemalloc.stop()
+
+    rows = []
+    for result in results:
+        if "error" in result:
+            rows.append((result["name"], "error " + result["error"]))
+        else:
+            rows.append(
+                (
+                    result["name"],
+                    "%10.2f %-12s %7d ms %8d heap"
+                    % (result["rate"], result["unit"], result["ms"], result["heap"]),
+                )
+            )
+    print_report("Device benchmarks (%s)" % args.device, rows)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report(results), file, indent=1)
+        print("Report written to %s" % args.output)
+
+
+def add_arguments(parser):
+    """Benchmark specific command line arguments"""
+    parser.add_argument("--only", type=str, default="")
+    parser.add_argument("--output", type=str, default="")
@@ -0,0 +1,145 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Counts how many bytes of firmware.bin an SD card upgrade reads. The file is
+read twice: once to verify it before the inactive slot is touched, and once
+to write it there, checking it still hashes the same"""
+
+import builtins
+import io
+import os
+import random
+import tempfile
+from unittest import mock
+from embit import ec
+from kruxsim.benchmarks import Timer, print_report
+
+FIRMWARE_SIZE = 2_000_000
+NEW_VERSION = b"99.99.9"
+
+
+class CountingFile(io.RawIOBase):
+    """Wraps a file, counting the bytes read from it in a new entry of reads"""
+
+    def __init__(self, file, reads):
+        super().__init__()
+        self.file = file
+        self.reads = reads
+        self.index = len(reads)
+        reads.append(0)
+
+    def read(self, size=-1):
+        data = self.file.read(size)
+        self.reads[self.index] += len(data)
+        return data
+
+    def readable(self):
+        return True
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+def build_firmware(device_type, size):
+    """Random firmware carrying the markers the upgrade scans for"""
+    rng = random.Random(0)
+    markers = (
+        b'"'
+        + device_type.encode()
+        + b'"'
+        + b"\x00\x00\x00[\x07"
+        + NEW_VERSION
+        + b"\x00\x00\x00\x00\x00\x00\x00\xdf\x07VERSION"
+        + b"\x00\x00\x00\x00\x00\x00\x00\xb4\x10krux/metadata.py"
+    )
+    body = bytes(rng.getrandbits(8) for _ in range(size - len(markers)))
+    half = len(body) // 2
+    return body[:half] + markers + body[half:]
+
+
+def run(args):
+    """Runs an upgrade from a signed random firmware, counting SD reads"""
+    import board
+    from krux import firmware
+    from krux.input import BUTTON_ENTER, BUTTON_PAGE
+
+    key = ec.PrivateKey(bytes(range(1, 33)))
+    firmware_data = build_firmware(board.config["type"], args.size)
+    firmware_hash = firmware.uhashlib_hw.sha256(firmware_data).digest()
+    signature = key.sign(firmware_hash).serialize()
+
+    tmp_dir = tempfile.mkdtemp()
+    sd_files = {}
+    for name, data in (
+        ("firmware.bin", firmware_data),
+        ("firmware.bin.sig", signature),
+    ):
+        sd_files["/sd/" + name] = os.path.join(tmp_dir, name)
+        with open(sd_files["/sd/" + name], "wb") as f:
+            f.write(data)
+
+    # Bytes read by each opening of firmware.bin
+    reads = []
+    real_open = builtins.open
+    real_stat = os.stat
+
+    def sd_open(path, mode="r", *args, **kwargs):
+        if path == "/sd/firmware.bin":
+            return CountingFile(real_open(sd_files[path], "rb", buffering=0), reads)
+        if path in sd_files:
+            return real_open(sd_files[path], "rb", buffering=0)
+        return real_open(path, mode, *args, **kwargs)
+
+    def sd_stat(path, *args, **kwargs):
+        return real_stat(sd_files.get(path, path), *args, **kwargs)
+
+    # Install, then keep files on SD
+    buttons = [BUTTON_ENTER, BUTTON_PAGE]
+    inp = mock.MagicMock(wait_for_button=mock.MagicMock(side_effect=buttons))
+
+    with mock.patch("builtins.open", new=sd_open), mock.patch(
+        "os.stat", new=sd_stat
+    ), mock.patch.object(firmware, "display"), mock.patch.object(
+        firmware, "Input", return_value=inp
+    ), mock.patch.object(
+        firmware, "SIGNER_PUBKEY", key.get_public_key().sec().hex()
+    ), mock.patch.object(
+        firmware.time, "sleep_ms"
+    ), Timer() as timer:
+        upgraded = firmware.upgrade()
+
+    rows = [
+        ("Upgraded", str(upgraded)),
+        ("firmware.bin size", "%d bytes" % len(firmware_data)),
+    ]
+    for label, read in zip(("Verify pass", "Write pass"), reads):
+        rows.append((label, "%d bytes" % read))
+    rows += [
+        ("Passes over file", "%.2f (2 expected)" % (sum(reads) / len(firmware_data))),
+        ("Elapsed", "%.0f ms" % timer.elapsed_ms),
+    ]
+    print_report("Firmware upgrade from SD (flash wait times excluded)", rows)
+
+
+def add_arguments(parser):
+    """Benchmark specific command line arguments"""
+    parser.add_argument("--size", type=int, default=FIRMWARE_SIZE)
@@ -0,0 +1,138 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Measures how much of the flash the flash map and fill flash scans read"""
+
+import sys
+from unittest import mock
+from kruxsim.benchmarks import Timer, print_report
+
+# Part of SPIFFS holding files in the simulated flash
+SPIFFS_USED = 64 * 1024
+
+# Rough K210 SPI flash read throughput, in bytes per second, to estimate
+# device times from the bytes read
+READ_RATE = 4_000_000
+
+
+class CountingFlash:
+    """Flash image counting reads and the bytes they return"""
+
+    def __init__(self, image):
+        self.image = image
+        self.reads = 0
+        self.bytes_read = 0
+
+    def read(self, address, size):
+        self.reads += 1
+        self.bytes_read += size
+        return bytes(self.image[address : address + size])
+
+    def write(self, address, data):
+        self.image[address : address + len(data)] = data
+
+    def erase(self, address, size):
+        self.image[address : address + size] = b"\xff" * size
+
+
+def build_image(used):
+    """Firmware up to SPIFFS, a few used SPIFFS blocks and the rest erased"""
+    from krux.firmware import FLASH_SIZE, SPIFFS_ADDR
+
+    image = bytearray(b"\xff" * FLASH_SIZE)
+    image[:SPIFFS_ADDR] = bytes(i & 0xFF for i in range(SPIFFS_ADDR))
+    image[SPIFFS_ADDR : SPIFFS_ADDR + used] = b"\x00" * used
+    return image
+
+
+def measure(flash, scan):
+    """Runs scan, returning its reads, bytes read and elapsed time"""
+    flash.reads = flash.bytes_read = 0
+    with Timer() as timer:
+        scan()
+    return (flash.reads, flash.bytes_read, timer.elapsed_ms)
+
+
+def run(args):
+    """Compares full block reads with the erased blocks bitmap, as the flash
+    map trusts it and as the wipe and Fill Flash verify it
+    """
+    from krux.firmware import FLASH_SIZE, ERASE_BLOCK_SIZE as BLOCK_SIZE
+
+    flash = CountingFlash(build_image(args.used))
+
+    def full_reads():
+        empty_buf = b"\xff" * BLOCK_SIZE
+        for address in range(0, FLASH_SIZE, BLOCK_SIZE):
+            _ = flash.read(address, BLOCK_SIZE) == empty_buf
+
+    with mock.patch.dict(sys.modules, {"flash": flash}):
+        # Imported here so the module reads the counting flash
+        from krux.flash_blocks import FlashBlocks
+
+        def scan(blocks, verify=False):
+            for address in range(0, FLASH_SIZE, BLOCK_SIZE):
+                blocks.is_erased(address, verify=verify)
+
+        flash_map = FlashBlocks()
+        verified = FlashBlocks()
+
+        def flash_map_after_save():
+            flash_map.spiffs_changed()
+            scan(flash_map)
+
+        results = [
+            ("Full block reads", measure(flash, full_reads)),
+            ("Flash map, first scan", measure(flash, lambda: scan(flash_map))),
+            ("Flash map, cached", measure(flash, lambda: scan(flash_map))),
+            ("Flash map, after a file save", measure(flash, flash_map_after_save)),
+            (
+                "Verified, first scan",
+                measure(flash, lambda: scan(verified, verify=True)),
+            ),
+            (
+                "Verified, cached",
+                measure(flash, lambda: scan(verified, verify=True)),
+            ),
+        ]
+        sys.modules.pop("krux.flash_blocks", None)
+
+    rows = []
+    for label, (reads, bytes_read, elapsed_ms) in results:
+        device_ms = bytes_read * 1000 / args.read_rate
+        rows.append(
+            (
+                label,
+                "%5d reads %9d bytes %7.1f ms host %7.0f ms device"
+                % (reads, bytes_read, elapsed_ms, device_ms),
+            )
+        )
+    print_report(
+        "Flash scan of %d blocks (%d KB of SPIFFS used)"
+        % (FLASH_SIZE // BLOCK_SIZE, args.used // 1024),
+        rows,
+    )
+
+
+def add_arguments(parser):
+    """Benchmark specific command line arguments"""
+    parser.add_argument("--used", type=int, default=SPIFFS_USED)
+    parser.add_argument("--read-rate", type=int, default=READ_RATE)
@@ -0,0 +1,118 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Times the tamper check flash hash, block by block and in chunks"""
+
+import hashlib
+import time
+from unittest import mock
+from kruxsim.benchmarks import Timer, print_report
+from kruxsim.benchmarks.flash import CountingFlash, READ_RATE
+
+# Rough cost of a flash.read call on the device, on top of the transfer
+READ_CALL_US = 300
+
+
+def blocks_hash(flash, display, tc_code_hash, uid):
+    """Hashes each region in its own pass, a block at a time, as before"""
+    from krux.firmware import FLASH_SIZE, SPIFFS_ADDR
+    from krux.pages.flash_tools import BLOCK_SIZE
+
+    hashes = []
+    for range_begin, range_end in ((0, SPIFFS_ADDR), (SPIFFS_ADDR, FLASH_SIZE)):
+        counter = range_begin // BLOCK_SIZE
+        sha256 = hashlib.sha256(tc_code_hash + uid)
+        for address in range(range_begin, range_end, BLOCK_SIZE):
+            counter += 1
+            sha256.update(flash.read(address, BLOCK_SIZE))
+            if counter % 200 == 0:
+                display.draw_hcentered_text("%d%%" % (counter // 41), 0)
+        hashes.append(sha256.digest())
+    return hashes
+
+
+def run(args):
+    """Hashes a random flash image both ways and checks the hashes agree"""
+    import os
+    import random
+    import pygame as pg
+
+    # Pages create the context, whose buttons are read from pygame at startup
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pg.display.init()
+    pg.display.set_mode((1, 1))
+    from krux.firmware import FLASH_SIZE
+    from krux.pages import flash_tools
+
+    rng = random.Random(0)
+    flash = CountingFlash(bytearray(rng.randbytes(FLASH_SIZE)))
+    tc_code_hash = bytes(range(32))
+    uid = bytes(range(32, 64))
+    ctx = mock.MagicMock()
+    ctx.display.width.return_value = 320
+    ctx.display.height.return_value = 480
+
+    def ticks_ms():
+        return int(time.perf_counter() * 1000)
+
+    def chunks_hash(*_):
+        page = flash_tools.FlashHash(ctx, tc_code_hash)
+        return page.hash_pin_with_flash()
+
+    results = {}
+    with mock.patch.dict("sys.modules", {"flash": flash}), mock.patch(
+        "machine.unique_id", return_value=uid, create=True
+    ), mock.patch("time.ticks_ms", new=ticks_ms, create=True), mock.patch(
+        "uhashlib_hw.sha256", new=hashlib.sha256, create=True
+    ):
+        for name, method in (("block by block", blocks_hash), ("chunks", chunks_hash)):
+            flash.reads = flash.bytes_read = 0
+            ctx.display.draw_hcentered_text.reset_mock()
+            with Timer() as timer:
+                hashes = method(flash, ctx.display, tc_code_hash, uid)
+            results[name] = (
+                hashes,
+                flash.reads,
+                ctx.display.draw_hcentered_text.call_count,
+                timer.elapsed_ms,
+            )
+
+    rows = []
+    for name, (hashes, reads, draws, elapsed_ms) in results.items():
+        device_ms = (
+            flash.bytes_read * 1000 / args.read_rate + reads * args.read_call_us / 1000
+        )
+        rows.append(
+            (
+                name,
+                "%4d reads %3d redraws %7.1f ms host %6.0f ms device reads"
+                % (reads, draws, elapsed_ms, device_ms),
+            )
+        )
+    same = results["block by block"][0] == results["chunks"][0]
+    rows.append(("Same hashes", str(same)))
+    print_report("TC Flash Hash of %d MB" % (FLASH_SIZE // 2**20), rows)
+
+
+def add_arguments(parser):
+    """Benchmark specific command line arguments"""
+    parser.add_argument("--read-rate", type=int, default=READ_RATE)
+    parser.add_argument("--read-call-us", type=int, default=READ_CALL_US)
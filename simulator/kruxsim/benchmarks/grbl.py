@@ -0,0 +1,78 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Measures G-code throughput to a simulated GRBL controller, streaming with
+character counting versus waiting for each line's response
+"""
+
+from kruxsim.benchmarks import print_report
+
+# SeedQR digits of a 24 words mnemonic
+SEED_QR_DATA = "".join("%04d" % (i * 83 % 2048) for i in range(24))
+
+
+def run(args):
+    """Sends a SeedQR to the simulated controller in both modes"""
+    import qrcode
+    from krux.krux_settings import Settings
+    from krux.printers.cnc import GRBLPrinter
+    from kruxsim.grbl import SimulatedGRBL, PtyUART, RX_BUFFER_SIZE
+
+    cnc = Settings().hardware.printer.cnc
+    cnc.cut_method = args.cut_method
+    cnc.grbl.baudrate = args.baudrate
+    code = qrcode.encode(SEED_QR_DATA)
+    rows = []
+    for streaming in (True, False):
+        with SimulatedGRBL(args.baudrate, args.parse_ms) as grbl:
+            printer = GRBLPrinter()
+            printer.uart_conn = PtyUART(grbl.master, timeout_ms=100)
+            printer.streaming = streaming
+            printer.print_qr_code(code)
+        elapsed = grbl.elapsed()
+        rows.append(
+            (
+                "streaming" if streaming else "line by line",
+                "%6d lines  %5.1f s  %6.0f lines/s  %5.1f KB/s  "
+                "max RX %3d/%d bytes  %d overflows"
+                % (
+                    grbl.lines,
+                    elapsed,
+                    grbl.lines / elapsed,
+                    grbl.bytes / elapsed / 1024,
+                    grbl.max_buffered,
+                    RX_BUFFER_SIZE,
+                    grbl.overflows,
+                ),
+            )
+        )
+    print_report(
+        "SeedQR to GRBL, %s cut at %d baud, %.1f ms to parse a line"
+        % (args.cut_method, args.baudrate, args.parse_ms),
+        rows,
+    )
+
+
+def add_arguments(parser):
+    """Benchmark specific command line arguments"""
+    parser.add_argument("--cut-method", type=str, default="runs", required=False)
+    parser.add_argument("--baudrate", type=int, default=115200, required=False)
+    parser.add_argument("--parse-ms", type=float, default=1.0, required=False)
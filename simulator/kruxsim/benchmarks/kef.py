@@ -0,0 +1,124 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Times unlocking every entry of a seeds.json with and without stretched keys cached"""
+
+import os
+import tempfile
+from unittest import mock
+
+from kruxsim.benchmarks import Timer, print_report
+
+ENTRIES = 20
+
+ITERATIONS = 100000
+
+KEY = "benchmark key"
+
+# AES-GCM, the default encryption mode
+VERSION = 20
+
+
+def build_seeds_json(entries, iterations):
+    """Stores entries encrypted mnemonics in seeds.json"""
+    from krux import kef
+    from krux.encryption import MnemonicStorage
+
+    storage = MnemonicStorage()
+    for i in range(entries):
+        mnemonic_id = "wallet %d" % i
+        entropy = i.to_bytes(16, "big")
+        cipher = kef.Cipher(KEY, mnemonic_id, iterations)
+        payload = cipher.encrypt(entropy, VERSION, os.urandom(12))
+        envelope = kef.wrap(mnemonic_id, VERSION, iterations, payload)
+        storage.store_encrypted_kef(mnemonic_id, envelope)
+    kef.clear_stretched_keys()
+
+
+def unlock(mnemonic_ids):
+    """Decrypts each mnemonic id with KEY, as the load from storage menu does"""
+    from krux.encryption import MnemonicStorage
+
+    storage = MnemonicStorage()
+    for mnemonic_id in mnemonic_ids:
+        assert storage.decrypt(KEY, mnemonic_id) is not None
+
+
+def run(args):
+    """Unlocks the entries cold, again within the session and after logout"""
+    from krux import encryption, kef
+
+    with tempfile.TemporaryDirectory() as directory:
+        with mock.patch.object(
+            encryption, "FLASH_PATH_STR", os.path.join(directory, "%s")
+        ):
+            build_seeds_json(args.entries, args.iterations)
+            mnemonic_ids = encryption.MnemonicStorage().list_mnemonics()
+            recent = mnemonic_ids[-kef.STRETCHED_KEYS_SIZE :]
+
+            rows = []
+            with Timer() as timer:
+                unlock(mnemonic_ids)
+            rows.append(
+                (
+                    "cold, %d entries" % len(mnemonic_ids),
+                    "%.1f ms/unlock" % (timer.elapsed_ms / len(mnemonic_ids)),
+                )
+            )
+            with Timer() as timer:
+                unlock(recent)
+            rows.append(
+                (
+                    "again, last %d entries" % len(recent),
+                    "%.1f ms/unlock" % (timer.elapsed_ms / len(recent)),
+                )
+            )
+            with Timer() as timer:
+                unlock(mnemonic_ids)
+            rows.append(
+                (
+                    "again, all %d entries" % len(mnemonic_ids),
+                    "%.1f ms/unlock" % (timer.elapsed_ms / len(mnemonic_ids)),
+                )
+            )
+            kef.clear_stretched_keys()
+            with Timer() as timer:
+                unlock(recent)
+            rows.append(
+                (
+                    "after logout, last %d entries" % len(recent),
+                    "%.1f ms/unlock" % (timer.elapsed_ms / len(recent)),
+                )
+            )
+    print_report(
+        "seeds.json unlock latency, %d PBKDF2 iterations" % args.iterations, rows
+    )
+    # Every entry is salted with its own id, so the cold pass has no hits
+    print(
+        "The salt is each entry's id: unlocking other entries with the same key\n"
+        "reruns PBKDF2. Only unlocking an entry again within the session is faster.\n"
+    )
+
+
+def add_arguments(parser):
+    """Benchmark specific command line arguments"""
+    parser.add_argument("--entries", type=int, default=ENTRIES)
+    parser.add_argument("--iterations", type=int, default=ITERATIONS)
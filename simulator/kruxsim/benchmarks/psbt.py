@@ -0,0 +1,155 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Measures the RAM high-water mark of reviewing and signing large PSBTs from SD"""
+
+import os
+import tempfile
+import tracemalloc
+from unittest import mock
+
+from kruxsim.benchmarks import Timer, print_report
+
+INPUT_COUNTS = (50, 500, 2000)
+
+MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+
+# Inputs spend from a pool of receive addresses, as a consolidation would
+ADDRESS_POOL = 50
+
+INPUT_AMOUNT = 10000
+
+
+def build_psbt(key, num_inputs):
+    """Returns a native segwit PSBT spending num_inputs UTXOs of key"""
+    from embit import script
+    from embit.bip32 import parse_path
+    from embit.psbt import PSBT, DerivationPath
+    from embit.transaction import Transaction, TransactionInput, TransactionOutput
+
+    account = key.account
+    account_path = parse_path(key.derivation)
+
+    def derivation(branch, index):
+        pub = account.derive([branch, index]).key
+        return pub, DerivationPath(key.fingerprint, account_path + [branch, index])
+
+    receive = [derivation(0, i) for i in range(ADDRESS_POOL)]
+    change_pub, change_der = derivation(1, 0)
+
+    vin = [TransactionInput(i.to_bytes(32, "little"), i % 4) for i in range(num_inputs)]
+    total = INPUT_AMOUNT * num_inputs
+    vout = [
+        TransactionOutput(total // 2, script.p2wpkh(receive[0][0])),
+        TransactionOutput(total // 2 - 200 * num_inputs, script.p2wpkh(change_pub)),
+    ]
+    psbt = PSBT(Transaction(vin=vin, vout=vout))
+    for i, inp in enumerate(psbt.inputs):
+        pub, der = receive[i % ADDRESS_POOL]
+        inp.witness_utxo = TransactionOutput(INPUT_AMOUNT, script.p2wpkh(pub))
+        inp.bip32_derivations[pub] = der
+    psbt.outputs[1].bip32_derivations[change_pub] = change_der
+    return psbt.serialize()
+
+
+def in_memory_sign(wallet, filename):
+    """Current flow: parse the whole PSBT, review it and write it signed"""
+    from krux.psbt import PSBTSigner
+    from krux.qr import FORMAT_NONE
+    from krux.settings import SD_PATH
+
+    signer = PSBTSigner(wallet, None, FORMAT_NONE, filename)
+    signer.path_mismatch()
+    signer.fill_zero_fingerprint()
+    signer.outputs()
+    signer.sign(trim=False)
+    with open("/%s/signed-%s" % (SD_PATH, filename), "wb") as file:
+        signer.psbt.write_to(file)
+
+
+def streamed_sign(wallet, filename):
+    """Streamed flow: review and sign one scope at a time"""
+    from krux.psbt_stream import PSBTStreamSigner
+
+    signer = PSBTStreamSigner(wallet, filename)
+    signer.path_mismatch()
+    signer.fill_zero_fingerprint()
+    signer.outputs()
+    signer.sign_to_file("signed-stream-" + filename)
+
+
+def measure(function, *args):
+    """Returns the elapsed ms and the peak of traced allocations in bytes"""
+    tracemalloc.start()
+    with Timer() as timer:
+        function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return timer.elapsed_ms, peak
+
+
+def run(args):
+    """Compares in-memory and streamed signing per number of inputs"""
+    from embit.networks import NETWORKS
+    from krux import psbt_stream, settings
+    from krux.key import Key, TYPE_SINGLESIG
+    from krux.wallet import Wallet
+
+    wallet = Wallet(Key(MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
+    rows = []
+    with tempfile.TemporaryDirectory() as sd_dir:
+        sd_path = sd_dir.lstrip("/")
+        with mock.patch.object(settings, "SD_PATH", sd_path), mock.patch.object(
+            psbt_stream, "SD_PATH", sd_path
+        ):
+            for num_inputs in args.inputs:
+                filename = "%d.psbt" % num_inputs
+                file_path = os.path.join(sd_dir, filename)
+                with open(file_path, "wb") as file:
+                    file.write(build_psbt(wallet.key, num_inputs))
+
+                memory_ms, memory_peak = measure(in_memory_sign, wallet, filename)
+                stream_ms, stream_peak = measure(streamed_sign, wallet, filename)
+                with open(os.path.join(sd_dir, "signed-" + filename), "rb") as file:
+                    signed = file.read()
+                with open(
+                    os.path.join(sd_dir, "signed-stream-" + filename), "rb"
+                ) as file:
+                    assert file.read() == signed
+                rows.append(
+                    (
+                        "%d inputs (%d KB)"
+                        % (num_inputs, os.path.getsize(file_path) // 1024),
+                        "in-memory %d KB %.0f ms  streamed %d KB %.0f ms"
+                        % (
+                            memory_peak // 1024,
+                            memory_ms,
+                            stream_peak // 1024,
+                            stream_ms,
+                        ),
+                    )
+                )
+    print_report("PSBT signing from SD, RAM high-water mark", rows)
+
+
+def add_arguments(parser):
+    """Benchmark specific command line arguments"""
+    parser.add_argument("--inputs", type=int, nargs="+", default=INPUT_COUNTS)
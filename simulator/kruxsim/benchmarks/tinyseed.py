@@ -0,0 +1,322 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Compares TinySeed punch detection reading a statistics per dot with the
+grid sampler, on synthetic or recorded grayscale camera frames
+"""
+
+import random
+
+from kruxsim.benchmarks import Timer, print_report
+
+WIDTH, HEIGHT = 320, 240
+BACKGROUND, PLATE, PUNCH = 0x30, 0xB0, 0x48
+
+
+class GrayImage:
+    """The subset of MaixPy's grayscale image used by TinyScanner"""
+
+    def __init__(self, width, height, pixels):
+        self.w = width
+        self.h = height
+        self.pixels = pixels
+        self.pixels_read = 0
+
+    def width(self):
+        """Image width"""
+        return self.w
+
+    def height(self):
+        """Image height"""
+        return self.h
+
+    def get_pixel(self, x, y):
+        """Luminosity of a pixel"""
+        self.pixels_read += 1
+        return self.pixels[y * self.w + x]
+
+    def _roi(self, roi):
+        x, y, w, h = roi or (0, 0, self.w, self.h)
+        values = []
+        for row in range(y, y + h):
+            values.extend(self.pixels[row * self.w + x : row * self.w + x + w])
+        self.pixels_read += len(values)
+        return values
+
+    def get_statistics(self, roi=None):
+        """Statistics of a region, only the median is provided"""
+        values = sorted(self._roi(roi))
+        median = values[len(values) // 2]
+        return Value(median, "median")
+
+    def get_histogram(self, roi=None):
+        """Histogram of a region, only the Otsu threshold is provided"""
+        histogram = [0] * 256
+        for value in self._roi(roi):
+            histogram[value] += 1
+        return Value(Value(otsu(histogram), "value"), "get_threshold")
+
+    def find_blobs(
+        self, thresholds, roi=None, x_stride=1, y_stride=1, area_threshold=0
+    ):
+        """Bounding boxes of 4-connected bright regions, seeded every stride"""
+        low, high = thresholds[0]
+        left, top, width, height = roi or (0, 0, self.w, self.h)
+        right, bottom = left + width, top + height
+        seen = bytearray(self.w * self.h)
+        blobs = []
+        for seed_y in range(top, bottom, y_stride):
+            for seed_x in range(left, right, x_stride):
+                seed = seed_y * self.w + seed_x
+                if seen[seed] or not low <= self.pixels[seed] <= high:
+                    continue
+                self.pixels_read += 1
+                seen[seed] = 1
+                stack = [seed]
+                area = 0
+                x_min, y_min, x_max, y_max = seed_x, seed_y, seed_x, seed_y
+                while stack:
+                    pos = stack.pop()
+                    area += 1
+                    self.pixels_read += 4
+                    y, x = divmod(pos, self.w)
+                    x_min, x_max = min(x_min, x), max(x_max, x)
+                    y_min, y_max = min(y_min, y), max(y_max, y)
+                    for near, inside in (
+                        (pos - 1, x > left),
+                        (pos + 1, x < right - 1),
+                        (pos - self.w, y > top),
+                        (pos + self.w, y < bottom - 1),
+                    ):
+                        if (
+                            inside
+                            and not seen[near]
+                            and low <= self.pixels[near] <= high
+                        ):
+                            seen[near] = 1
+                            stack.append(near)
+                if area >= area_threshold:
+                    rect = (x_min, y_min, x_max - x_min + 1, y_max - y_min + 1)
+                    blobs.append(Value(rect, "rect"))
+        return blobs
+
+    def draw_rectangle(self, *args, **kwargs):
+        """Drawing is left out of the measurements"""
+
+    def draw_line(self, *args, **kwargs):
+        """Drawing is left out of the measurements"""
+
+
+class Value:
+    """Returns a value from a named method, like MaixPy's result objects"""
+
+    def __init__(self, value, method):
+        setattr(self, method, lambda: value)
+
+
+def otsu(histogram):
+    """Threshold maximizing the variance between the two classes"""
+    total = sum(histogram)
+    weighted_total = sum(i * count for i, count in enumerate(histogram))
+    best, threshold = -1, 0
+    weight = weighted = 0
+    for i, count in enumerate(histogram):
+        weight += count
+        weighted += i * count
+        if weight in (0, total):
+            continue
+        mean_low = weighted / weight
+        mean_high = (weighted_total - weighted) / (total - weight)
+        variance = weight * (total - weight) * (mean_low - mean_high) ** 2
+        if variance > best:
+            best, threshold = variance, i
+    return threshold
+
+
+def synthetic_frames(scanner, count, seed):
+    """Plates with random words punched, lit unevenly, noisy and drifting"""
+    rng = random.Random(seed)
+    frames = []
+    left, top, width = 50, 36, 204
+    for _ in range(count):
+        # The hand holding the plate moves a few pixels between frames
+        left += rng.randrange(-3, 4)
+        top += rng.randrange(-3, 4)
+        width += rng.randrange(-2, 3)
+        rect = (left, top, width, int(width / 1.2))
+        numbers = [rng.randrange(1, 2049) for _ in range(12)]
+        pixels = bytearray(
+            BACKGROUND + rng.randrange(-16, 16) for _ in range(WIDTH * HEIGHT)
+        )
+        for y in range(rect[1], rect[1] + rect[3]):
+            for x in range(rect[0], rect[0] + rect[2]):
+                # Light fades towards the lower right corner
+                shade = (x - rect[0]) * 24 // rect[2] + (y - rect[1]) * 24 // rect[3]
+                pixels[y * WIDTH + x] = PLATE - shade + rng.randrange(-12, 12)
+        scanner._map_punches_region(rect)
+        pad_x = scanner.x_regions[1] - scanner.x_regions[0]
+        pad_y = scanner.y_regions[1] - scanner.y_regions[0]
+        for index, (x, y) in enumerate(scanner.dots[0]):
+            if not numbers[index // 12] >> (11 - index % 12) & 1:
+                continue
+            for dot_y in range(y + pad_y // 5, y + pad_y - pad_y // 5):
+                for dot_x in range(x + pad_x // 5, x + pad_x - pad_x // 5):
+                    pixels[dot_y * WIDTH + dot_x] = PUNCH + rng.randrange(-12, 12)
+        frames.append((GrayImage(WIDTH, HEIGHT, pixels), numbers))
+    return frames
+
+
+def recorded_frames(folder):
+    """Grayscale captures saved as image files, their words are unknown"""
+    import os
+    from PIL import Image
+
+    frames = []
+    for name in sorted(os.listdir(folder)):
+        with Image.open(os.path.join(folder, name)) as capture:
+            capture = capture.convert("L")
+            frames.append(
+                (
+                    GrayImage(
+                        capture.width, capture.height, bytearray(capture.tobytes())
+                    ),
+                    None,
+                )
+            )
+    return frames
+
+
+def per_dot_statistics(scanner, img):
+    """Previous detection: a median statistics and a threshold per dot"""
+    from krux.pages.tiny_seed import toggle_bit
+
+    page_seed_numbers = [0] * 12
+    pad_x = scanner.x_regions[1] - scanner.x_regions[0]
+    pad_y = scanner.y_regions[1] - scanner.y_regions[0]
+    for index, (x, y) in enumerate(scanner.dots[0]):
+        eval_rect = (x + 2, y + 2, pad_x - 3, pad_y - 3)
+        dot_l = img.get_statistics(roi=eval_rect).median()
+        if dot_l < scanner._gradient_value(index):
+            page_seed_numbers[index // 12] = toggle_bit(
+                page_seed_numbers[index // 12], 11 - (index % 12)
+            )
+    return page_seed_numbers
+
+
+def run(args):
+    """Times searching the plate with and without tracking, then both punch
+    detections on the tracked plate"""
+    import os
+    from unittest import mock
+    import pygame as pg
+
+    # Pages create the context, whose buttons are read from pygame at startup
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pg.display.init()
+    pg.display.set_mode((1, 1))
+    from krux.pages.tiny_seed import TinyScanner
+
+    scanner = TinyScanner(mock.MagicMock())
+    if args.frames:
+        frames = recorded_frames(args.frames)
+    else:
+        frames = synthetic_frames(scanner, args.count, args.seed)
+
+    methods = (
+        ("statistics per dot", per_dot_statistics),
+        ("grid sampler", TinyScanner._detect_and_draw_punches),
+    )
+    # Per method: elapsed ms, pixels read and frames read as expected
+    totals = {name: [0.0, 0, 0] for name, _ in methods}
+    # Per plate search: elapsed ms and pixels read
+    searches = {"full frame": [0.0, 0], "tracking": [0.0, 0]}
+    detected = 0
+    for img, numbers in frames:
+        tracking = scanner.tracking
+        for name, search in searches.items():
+            scanner.tracking = tracking if name == "tracking" else (None, 0)
+            img.pixels_read = 0
+            with Timer() as timer:
+                rect = scanner._detect_tiny_seed(img)
+            search[0] += timer.elapsed_ms
+            search[1] += img.pixels_read
+        if not rect:
+            continue
+        detected += 1
+        scanner._map_punches_region(rect)
+        scanner._gradient_corners(rect, img)
+        for name, method in methods:
+            img.pixels_read = 0
+            with Timer() as timer:
+                result = method(scanner, img)
+            # Recorded frames' words are unknown, the previous method is the reference
+            if numbers is None:
+                numbers = result
+            total = totals[name]
+            total[0] += timer.elapsed_ms
+            total[1] += img.pixels_read
+            total[2] += result == numbers
+
+    rows = []
+    for name, _ in methods:
+        elapsed, pixels, expected = totals[name]
+        rows.append(
+            (
+                name,
+                "%6.2f ms/frame  %6d pixels read/frame  %d/%d frames %s"
+                % (
+                    elapsed / max(detected, 1),
+                    pixels // max(detected, 1),
+                    expected,
+                    detected,
+                    "agree" if args.frames else "read correctly",
+                ),
+            )
+        )
+    print_report(
+        "TinySeed punches on %d %s frames, plate found on %d"
+        % (len(frames), "recorded" if args.frames else "synthetic", detected),
+        rows,
+    )
+    print_report(
+        "TinySeed plate search",
+        [
+            (
+                name,
+                "%6.2f ms/frame  %6d pixels read/frame"
+                % (elapsed / len(frames), pixels // len(frames)),
+            )
+            for name, (elapsed, pixels) in searches.items()
+        ],
+    )
+
+
+def add_arguments(parser):
+    """Benchmark specific command line arguments"""
+    parser.add_argument(
+        "--frames",
+        type=str,
+        default=None,
+        required=False,
+        help="folder of grayscale captures to use instead of synthetic frames",
+    )
+    parser.add_argument("--count", type=int, default=10, required=False)
+    parser.add_argument("--seed", type=int, default=0, required=False)
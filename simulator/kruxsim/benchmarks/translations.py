@@ -0,0 +1,141 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Compares baked translation catalogs with the previous Python list modules:
+heap held by a loaded locale, locale switch time and settings menu redraws
+"""
+
+import binascii
+import tracemalloc
+from kruxsim.benchmarks import Timer, print_report
+
+REDRAWS = 200
+
+SWITCHES = 100
+
+
+def redraw_settings(namespace):
+    """Fetches every label the settings menus display, returning how many"""
+    count = 0
+    for setting in namespace.setting_list():
+        namespace.label(setting.attr)
+        count += 1
+    for child in namespace.namespace_list():
+        namespace.label(child.namespace.split(".")[-1])
+        count += 1 + redraw_settings(child)
+    return count
+
+
+def catalog_entries(catalog):
+    """Decodes every entry of a catalog, as (crc32, translation) pairs"""
+    from krux.krux_settings import _catalog_lookup
+
+    count = int.from_bytes(catalog[:2], "little")
+    slug_ids = [
+        int.from_bytes(catalog[2 + 4 * i : 6 + 4 * i], "little") for i in range(count)
+    ]
+    return [(slug_id, _catalog_lookup(catalog, slug_id)) for slug_id in slug_ids]
+
+
+class ListLocale:
+    """Previous representation: every translation decoded to a list on the heap,
+    indexed by a crc32 -> position dict
+    """
+
+    def __init__(self, entries):
+        self.translation = [translation for _, translation in entries]
+        self.reference = {slug_id: i for i, (slug_id, _) in enumerate(entries)}
+
+    def t(self, slug):
+        """Previous indexed lookup"""
+        index = self.reference.get(binascii.crc32(slug.encode("utf-8")))
+        return slug if index is None else self.translation[index]
+
+
+def heap_bytes(function):
+    """Heap held by what function returns"""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    kept = function()
+    held = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del kept
+    return held
+
+
+def run(args):
+    """Measures each locale with its list module and with its catalog"""
+    from krux import krux_settings
+    from krux.krux_settings import Settings, locale_control
+
+    settings = Settings()
+    catalog_t = krux_settings.t
+    rows = []
+    for locale in locale_control.locales[1:]:
+        # Modules are frozen in the firmware, so only what a switch creates counts
+        locale_control.load_locale(locale)
+        catalog = locale_control.catalog
+        entries = catalog_entries(catalog)
+
+        list_heap = heap_bytes(lambda: ListLocale(catalog_entries(catalog)))
+        catalog_heap = heap_bytes(
+            lambda: (locale_control.load_locale(locale), redraw_settings(settings))
+        )
+
+        with Timer() as timer:
+            for _ in range(args.switches):
+                ListLocale(catalog_entries(catalog))
+        list_switch = timer.elapsed_ms * 1000 / args.switches
+        with Timer() as timer:
+            for _ in range(args.switches):
+                locale_control.load_locale(locale)
+        catalog_switch = timer.elapsed_ms * 1000 / args.switches
+
+        list_locale = ListLocale(entries)
+        timings = []
+        for mode in ("list", "catalog"):
+            krux_settings.t = list_locale.t if mode == "list" else catalog_t
+            with Timer() as timer:
+                for _ in range(args.redraws):
+                    locale_control.memo.clear()
+                    redraw_settings(settings)
+            timings.append(timer.elapsed_ms * 1000 / args.redraws)
+        krux_settings.t = catalog_t
+        rows.append(
+            (
+                locale,
+                "%d entries  heap %d B list / %d B catalog (%d B baked)  "
+                "switch %.0f us / %.0f us  redraw %.0f us / %.0f us"
+                % (
+                    (len(entries), list_heap, catalog_heap, len(catalog))
+                    + (list_switch, catalog_switch)
+                    + tuple(timings)
+                ),
+            )
+        )
+    locale_control.load_locale(krux_settings.DEFAULT_LOCALE)
+    print_report("Translations, list modules / baked catalogs", rows)
+
+
+def add_arguments(parser):
+    """Benchmark specific command line arguments"""
+    parser.add_argument("--redraws", type=int, default=REDRAWS)
+    parser.add_argument("--switches", type=int, default=SWITCHES)
@@ -0,0 +1,129 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Simulated time for headless runs. Krux's sleeps cost no real time, so
+sequences run as fast as Krux can draw, while the sequence's commands still
+come at the same points of Krux's time as on the real clock
+"""
+
+import _thread
+import threading
+import time
+
+# Simulated time each ticks_ms() call takes, so busy loops move forward
+TICK_MS = 1
+
+virtual_clock = None
+
+
+class VirtualClock:
+    """Clock Krux's thread runs on, held at a limit the simulator moves as the
+    sequence goes on
+    """
+
+    def __init__(self):
+        self.now_ms = 0
+        self.limit_ms = 0
+        # Krux waits for the simulator at the limit or when it has to draw
+        self.parked = False
+        self.flushing = False
+        self.condition = threading.Condition()
+
+    def _park(self):
+        self.parked = True
+        self.condition.notify_all()
+        while self.parked:
+            self.condition.wait()
+
+    def advance(self, ms):
+        """Moves simulated time forward, parking at the limit until it's moved"""
+        if threading.current_thread() is threading.main_thread():
+            # The simulator loop draws the screen, it must never wait here
+            return
+        with self.condition:
+            target = self.now_ms + ms
+            while target > self.limit_ms:
+                self.now_ms = max(self.now_ms, self.limit_ms)
+                self._park()
+            self.now_ms = target
+
+    def flush(self):
+        """Parks until the simulator drew what Krux queued"""
+        if threading.current_thread() is threading.main_thread():
+            return
+        with self.condition:
+            self.flushing = True
+            self._park()
+            self.flushing = False
+
+    def sleep_ms(self, ms):
+        """time.sleep_ms replacement"""
+        self.advance(ms)
+
+    def ticks_ms(self):
+        """time.ticks_ms replacement"""
+        self.advance(TICK_MS)
+        return int(self.now_ms)
+
+    def wait_parked(self, timeout):
+        """Waits up to timeout seconds for Krux to park"""
+        with self.condition:
+            return self.condition.wait_for(lambda: self.parked, timeout)
+
+    def resume(self):
+        """Lets Krux go on after it flushed"""
+        with self.condition:
+            self.parked = False
+            self.condition.notify_all()
+
+    def run_for(self, ms):
+        """Lets simulated time run ms past the point Krux reached"""
+        with self.condition:
+            self.limit_ms = max(self.limit_ms, self.now_ms) + ms
+            self.parked = False
+            self.condition.notify_all()
+
+
+def run_now(function, args, kwargs=None):
+    """_thread.start_new_thread replacement, as only one of Krux's threads
+    can run on the virtual clock"""
+    function(*args, **(kwargs or {}))
+
+
+def install():
+    """Makes Krux's time functions run on a virtual clock"""
+    global virtual_clock
+    virtual_clock = VirtualClock()
+    setattr(time, "sleep_ms", virtual_clock.sleep_ms)
+    setattr(time, "ticks_ms", virtual_clock.ticks_ms)
+    setattr(_thread, "start_new_thread", run_now)
+    return virtual_clock
+
+
+def yield_to_screen(seconds):
+    """Lets the simulator draw what was queued, taking the same time on the
+    virtual clock as on the real one
+    """
+    if virtual_clock:
+        virtual_clock.flush()
+        virtual_clock.sleep_ms(seconds * 1000)
+    else:
+        time.sleep(seconds)
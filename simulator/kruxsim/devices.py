@@ -22,6 +22,10 @@
 import os
 import pygame as pg
 
+# Files are found from here, so the simulator can run in another folder
+SIMULATOR_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FONTS_DIR = os.path.join(SIMULATOR_DIR, "..", "firmware", "font")
+
 M5STICKV = "maixpy_m5stickv"
 AMIGO = "maixpy_amigo"
 PC = "maixpy_pc"
@@ -61,7 +65,7 @@ def load_image(device):
         return None
     if device not in images:
         images[device] = pg.image.load(
-            os.path.join("assets", "%s.png" % device)
+            os.path.join(SIMULATOR_DIR, "assets", "%s.png" % device)
         ).convert_alpha()
     return images[device]
 
@@ -75,28 +79,28 @@ def load_font(device):
         if device in (M5STICKV, CUBE):
             fonts[device] = [
                 pg.freetype.Font(
-                   os.path.join("..", "firmware", "font", "ter-u14n.bdf"),
+                   os.path.join(FONTS_DIR, "ter-u14n.bdf"),
                 ),
                 pg.freetype.Font(
-                   os.path.join("..", "firmware", "font", "FusionPixel-14.bdf"),
+                   os.path.join(FONTS_DIR, "FusionPixel-14.bdf"),
                 ),
             ]
         elif device in (DOCK, YAHBOOM, WONDER_MV, TZT, WONDER_K, EMBEDFIRE):
             fonts[device] = [
                 pg.freetype.Font(
-                    os.path.join("..", "firmware", "font", "ter-u16n.bdf")
+                    os.path.join(FONTS_DIR, "ter-u16n.bdf")
                 ),
                 pg.freetype.Font(
-                    os.path.join("..", "firmware", "font", "unifont-16.bdf")
+                    os.path.join(FONTS_DIR, "unifont-16.bdf")
                 ),
         ]
         else:
             fonts[device] = [
                 pg.freetype.Font(
-                    os.path.join("..", "firmware", "font", "ter-u24b.bdf")
+                    os.path.join(FONTS_DIR, "ter-u24b.bdf")
                 ),
                 pg.freetype.Font(
-                    os.path.join("..", "firmware", "font", "NotoSansCJK-24.bdf")
+                    os.path.join(FONTS_DIR, "NotoSansCJK-24.bdf")
                 ),
             ]
 
@@ -0,0 +1,129 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""A stand-in for a GRBL 1.1 controller on a pseudo terminal, to exercise and
+measure G-code streaming without a machine
+"""
+
+import os
+import select
+import threading
+import time
+import tty
+
+RX_BUFFER_SIZE = 128
+VERSION_REPLY = b"[VER:1.1h.20190830:]\r\n[OPT:V,15,128]\r\nok\r\n"
+
+
+class SimulatedGRBL:
+    """Emulates GRBL's serial side: bytes arrive at the baudrate into a 128
+    bytes receive buffer, and each line is answered with "ok" once parsed
+    """
+
+    def __init__(self, baudrate=115200, parse_ms=1.0):
+        self.master, self.slave = os.openpty()
+        tty.setraw(self.master)
+        tty.setraw(self.slave)
+        # 10 bits per byte: start, 8 data and stop bits
+        self.byte_time = 10.0 / baudrate
+        self.parse_time = parse_ms / 1000
+        self.lines = 0
+        self.bytes = 0
+        self.max_buffered = 0
+        self.overflows = 0
+        self.first_line_at = None
+        self.last_line_at = None
+        self.running = False
+        self.thread = None
+
+    def __enter__(self):
+        self.running = True
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self.running = False
+        self.thread.join()
+        os.close(self.master)
+        os.close(self.slave)
+
+    def elapsed(self):
+        """Seconds between the first and the last line parsed"""
+        if self.first_line_at is None:
+            return 0.0
+        return self.last_line_at - self.first_line_at
+
+    def _serve(self):
+        received = b""
+        # Time each pending line's last byte arrives, the wire and the parser
+        # work concurrently, as GRBL receives bytes on interrupts
+        arrivals = []
+        wire_clock = parse_clock = time.perf_counter()
+        while self.running:
+            ready, _, _ = select.select([self.slave], [], [], 0.01)
+            if ready:
+                data = os.read(self.slave, 1024)
+                wire_clock = max(wire_clock, time.perf_counter())
+                for byte in data:
+                    wire_clock += self.byte_time
+                    if byte == ord("\n"):
+                        arrivals.append(wire_clock)
+                received += data
+                self.bytes += len(data)
+                self.max_buffered = max(self.max_buffered, len(received))
+                if len(received) > RX_BUFFER_SIZE:
+                    self.overflows += 1
+            while arrivals:
+                line, received = received.split(b"\n", 1)
+                parse_clock = max(parse_clock, arrivals.pop(0)) + self.parse_time
+                delay = parse_clock - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                now = time.perf_counter()
+                if self.first_line_at is None:
+                    self.first_line_at = now
+                self.last_line_at = now
+                self.lines += 1
+                os.write(
+                    self.slave, VERSION_REPLY if line.strip() == b"$I" else b"ok\r\n"
+                )
+
+
+class PtyUART:
+    """The krux side of the link, reading like MaixPy's UART: waits up to
+    timeout_ms for data and returns None if none came
+    """
+
+    def __init__(self, fd, timeout_ms=1000):
+        self.fd = fd
+        self.timeout = timeout_ms / 1000
+
+    def read(self):
+        """Returns available bytes or None"""
+        ready, _, _ = select.select([self.fd], [], [], self.timeout)
+        if not ready:
+            return None
+        return os.read(self.fd, 4096)
+
+    def write(self, data):
+        """Sends bytes to the controller"""
+        os.write(self.fd, data)
@@ -19,6 +19,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
+import os
 import sys
 from importlib import util
 from unittest import mock
@@ -45,7 +46,11 @@ def register_device(device):
     global BUTTON_C
     project = devices.AMIGO if device == devices.PC else device
     BOARD_CONFIG = load_file_as_module(
-        "board", "../firmware/MaixPy/projects/%s/builtin_py/board.py" % project
+        "board",
+        os.path.join(
+            devices.SIMULATOR_DIR,
+            "../firmware/MaixPy/projects/%s/builtin_py/board.py" % project,
+        ),
     ).config
     if "LED_W" in BOARD_CONFIG["krux"]["pins"]:
         del BOARD_CONFIG["krux"]["pins"]["LED_W"]
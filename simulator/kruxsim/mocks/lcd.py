@@ -25,10 +25,9 @@ from unittest import mock
 import pygame as pg
 import cv2
 from numpy import zeros_like
-from kruxsim import events
+from kruxsim import clock, events
 from kruxsim.mocks.board import BOARD_CONFIG
 from krux.krux_settings import Settings
-import time
 
 COLOR_BLACK = (0, 0, 0)
 COLOR_WHITE = (255, 255, 255)
@@ -418,7 +417,7 @@ def fill_rectangle(x, y, w, h, color, radius=0):
     global count_call_fill_rectangle
     count_call_fill_rectangle += 1
     if count_call_fill_rectangle > 9:
-        time.sleep(0.01)
+        clock.yield_to_screen(0.01)
         count_call_fill_rectangle = 0
 
 
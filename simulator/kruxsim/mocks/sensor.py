@@ -101,8 +101,9 @@ def find_qrcodes(img):
 
 
 def snapshot():
-    # Temporarily yield execution to allow other threads to run
-    time.sleep(THREAD_DROP_PERIOD)
+    # Temporarily yield execution to allow other threads to run, a frame also
+    # takes time on the virtual clock
+    time.sleep_ms(THREAD_DROP_PERIOD * 1000)
 
     m = mock.MagicMock()
     m.find_qrcodes.return_value = None
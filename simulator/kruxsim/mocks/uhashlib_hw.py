@@ -29,8 +29,13 @@ def pbkdf2_hmac_sha256_wrapper(secret, salt, iterations):
     return hashlib.pbkdf2_hmac("sha256", secret, salt, iterations)
 
 
+def pbkdf2_hmac_sha512_wrapper(secret, salt, iterations):
+    return hashlib.pbkdf2_hmac("sha512", secret, salt, iterations)
+
+
 if "uhashlib_hw" not in sys.modules:
     sys.modules["uhashlib_hw"] = mock.MagicMock(
         pbkdf2_hmac_sha256=pbkdf2_hmac_sha256_wrapper,
+        pbkdf2_hmac_sha512=pbkdf2_hmac_sha512_wrapper,
         sha256=hashlib.sha256,
     )
@@ -33,3 +33,6 @@ def ticks():
 
 if not getattr(time, "ticks_ms", None):
     setattr(time, "ticks_ms", ticks)
+
+if not getattr(time, "ticks_diff", None):
+    setattr(time, "ticks_diff", lambda end, start: end - start)
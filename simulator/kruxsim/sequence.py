@@ -32,8 +32,9 @@ THREAD_PERIOD = 0.05
 
 
 class SequenceExecutor:
-    def __init__(self, sequence_filepath):
+    def __init__(self, sequence_filepath, clock=None):
         self.filepath = sequence_filepath
+        self.clock = clock
         self.command = None
         self.command_params = []
         self.command_fn = None
@@ -50,6 +51,9 @@ class SequenceExecutor:
         self.commands = deque(commands)
 
     def execute(self):
+        if self.clock:
+            self.execute_now()
+            return
         if self.command_fn:
             if time.time() > self.command_timer + THREAD_PERIOD:
                 print("Executing (%s, %r)" % (self.command, self.command_params))
@@ -58,33 +62,56 @@ class SequenceExecutor:
                 self.command_fn = None
                 self.command_params = []
         elif self.commands:
-            cmd, params = self.commands.popleft()
             self.command_timer = time.time()
-            self.command = cmd
-            self.command_params = params
-            if cmd == "press":
-                self.command_fn = self.press_key
-                if BOARD_CONFIG["type"] in ("cube", "dock"):
-                    time.sleep(1)
-            elif cmd == "press_amigo_only" and BOARD_CONFIG["type"] == "amigo":
-                self.command_fn = self.press_key
-            elif cmd == "press_m5stickv_only" and BOARD_CONFIG["type"] == "m5stickv":
-                self.command_fn = self.press_key
-            elif cmd == "touch":
-                self.command_fn = self.touch
-            elif cmd == "qrcode":
-                self.command_fn = self.show_qrcode
-            elif cmd == "screenshot":
-                if BOARD_CONFIG["type"] in ("cube", "dock"):
-                    time.sleep(0.5)
-                self.command_fn = self.request_screenshot
-            elif cmd == "wait":
-                self.command_timer += float(params[0])
-                self.command_fn = self.wait
+            self.command_fn, delay = self.next_command()
+            if self.command_fn == self.wait:
+                self.command_timer += delay
+            else:
+                time.sleep(delay)
 
         # Pause this thread to give other threads time to execute
         time.sleep(THREAD_PERIOD)
 
+    def execute_now(self):
+        """Runs the command whose time came on the virtual clock, then lets it
+        run for as long as the next command takes to come on the real clock"""
+        if self.command_fn:
+            print("Executing (%s, %r)" % (self.command, self.command_params))
+            self.command_fn()
+            self.command_fn = None
+            self.command_params = []
+        if self.commands:
+            self.command_fn, delay = self.next_command()
+            # The windowed loop takes about three periods to get a command done
+            self.clock.run_for((3 * THREAD_PERIOD + delay) * 1000)
+
+    def pending(self):
+        """Whether any command is yet to run"""
+        return bool(self.commands or self.command_fn)
+
+    def next_command(self):
+        """Pops the next command, returning its function and the extra seconds
+        it takes, as cube and dock need more time to draw"""
+        cmd, params = self.commands.popleft()
+        self.command = cmd
+        self.command_params = params
+        slow_board = BOARD_CONFIG["type"] in ("cube", "dock")
+        if cmd == "press":
+            return self.press_key, 1 if slow_board else 0
+        if cmd == "press_amigo_only" and BOARD_CONFIG["type"] == "amigo":
+            return self.press_key, 0
+        if cmd == "press_m5stickv_only" and BOARD_CONFIG["type"] == "m5stickv":
+            return self.press_key, 0
+        if cmd == "touch":
+            return self.touch, 0
+        if cmd == "qrcode":
+            return self.show_qrcode, 0
+        if cmd == "screenshot":
+            return self.request_screenshot, 0.5 if slow_board else 0
+        if cmd == "wait":
+            return self.wait, float(params[0])
+        return None, 0
+
     def press_key(self):
         key = self.command_params[0]
         self.key = None
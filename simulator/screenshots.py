@@ -0,0 +1,189 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Generates the documentation screenshots, running the simulator headless on
+a virtual clock, one process per device and locale at a time
+
+Example: poetry run python simulator/screenshots.py --devices maixpy_amigo
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+SIMULATOR_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Sequences and their simulator flags, in the order they share the SD card.
+# generate-device-screenshots.sh runs these too, list new sequences here
+SEQUENCES = [
+    # Login
+    ("logo.txt", []),
+    ("about.txt", ["--sd"]),
+    ("load-mnemonic-options.txt", ["--sd"]),
+    ("new-mnemonic-options.txt", ["--sd"]),
+    ("load-mnemonic-sequence.txt", ["--sd"]),
+    ("load-mnemonic-double-mnemonic.txt", ["--sd"]),
+    ("edit-mnemonic.txt", ["--sd"]),
+    # Home
+    ("home-options.txt", ["--sd"]),
+    ("encrypt-mnemonic.txt", ["--sd"]),
+    ("extended-public-key-wpkh.txt", ["--sd"]),
+    ("extended-public-key-wsh.txt", ["--sd"]),
+    ("wallet-descriptor-wsh.txt", ["--sd"]),
+    # ("wallet-descriptor-wpkh.txt", ["--sd"]),
+    ("wallet-descriptor-exp-tr-minis.txt", ["--sd"]),
+    ("bip85.txt", ["--sd"]),
+    ("mnemonic-xor.txt", ["--sd"]),
+    ("scan-address.txt", ["--sd"]),
+    ("list-address.txt", ["--sd"]),
+    ("export-address.txt", ["--sd"]),
+    ("sign-psbt.txt", ["--sd"]),
+    ("sign-message.txt", ["--sd"]),
+    ("sign-message-at-address.txt", []),
+    # Tools
+    ("tools-datum-tool.txt", ["--sd"]),
+    ("tools-check-sd.txt", ["--sd"]),
+    ("tools-create-QR.txt", ["--sd"]),
+    # ("tools-mnemonic.txt", ["--sd"]),
+    ("tools-device-tests-test-suite.txt", ["--sd"]),
+    ("tools-print-test-qr.txt", ["--sd"]),
+    ("tools-descriptor-addresses.txt", ["--sd"]),
+    ("tools-flash.txt", ["--sd"]),
+    ("tc-flash-hash.txt", ["--sd"]),
+    # Settings
+    ("all-settings.txt", ["--sd"]),
+    # Other
+    ("qr-transcript.txt", ["--sd", "--printer"]),
+    ("print-qr.txt", ["--sd", "--printer"]),
+]
+
+# Encrypted mnemonics for the "Load -> From Storage" screenshots
+ENCRYPTED_MNEMONICS = {
+    "d668b8b7": {
+        "version": 0,
+        "key_iterations": 100000,
+        "data": "haAyMxFmOVkBE5QixIeJl7P0dYKVeOiuhNodO+qyI2lA+veFUxcXben1OZvKOqTb"
+        "WNI2Oj8SROTpooiS/4WJdA==",
+    },
+    "a56dfd6c": {
+        "version": 0,
+        "key_iterations": 100000,
+        "data": "PY9fBDrqtv2ZyZF47CsZ5QucxzXmOxaJJtjkngEQTfHLyLgHTQ3oX8AbZR6+UXBX"
+        "ZUB+eSOHwJZm1jCO8AaBxQ==",
+    },
+}
+
+
+def prepare_workdir(locale):
+    """Creates a folder with the SD card contents the sequences expect"""
+    workdir = tempfile.mkdtemp(prefix="krux-screenshots-")
+    sd_dir = os.path.join(workdir, "sd")
+    os.makedirs(sd_dir)
+    with open(os.path.join(sd_dir, "settings.json"), "w") as f:
+        json.dump({"settings": {"i18n": {"locale": locale}}}, f)
+    with open(os.path.join(sd_dir, "seeds.json"), "w") as f:
+        json.dump(ENCRYPTED_MNEMONICS, f)
+    return workdir
+
+
+def run_device(device, locale, args):
+    """Runs every sequence for a device and locale, returns the failed ones"""
+    workdir = prepare_workdir(locale)
+    failed = []
+    log_path = os.path.join(args.output, "%s-%s.log" % (device, locale))
+    with open(log_path, "w") as log:
+        for sequence, flags in SEQUENCES:
+            sequence_path = os.path.join(SIMULATOR_DIR, "sequences", sequence)
+            if not os.path.isfile(sequence_path):
+                log.write("Skipping %s, not found\n" % sequence)
+                continue
+            command = [
+                sys.executable,
+                os.path.join(SIMULATOR_DIR, "simulator.py"),
+                "--device",
+                device,
+                "--sequence",
+                sequence_path,
+                "--workdir",
+                workdir,
+            ] + flags
+            if not args.windowed:
+                command.append("--headless")
+            log.write("$ %s\n" % " ".join(command))
+            log.flush()
+            result = subprocess.run(
+                command, stdout=log, stderr=subprocess.STDOUT, check=False
+            )
+            if result.returncode:
+                failed.append(sequence)
+
+    device_dir = os.path.join(args.output, device)
+    os.makedirs(device_dir, exist_ok=True)
+    screenshots_dir = os.path.join(workdir, "screenshots")
+    if os.path.isdir(screenshots_dir):
+        for filename in os.listdir(screenshots_dir):
+            shutil.copy(os.path.join(screenshots_dir, filename), device_dir)
+    shutil.rmtree(workdir)
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--devices", nargs="+", default=["maixpy_m5stickv", "maixpy_amigo"]
+    )
+    parser.add_argument("--locales", nargs="+", default=["en-US"])
+    parser.add_argument("--output", default="krux-screenshots")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--windowed",
+        action="store_true",
+        help="run in simulator windows on the real clock",
+    )
+    args = parser.parse_args()
+    args.output = os.path.abspath(args.output)
+
+    shutil.rmtree(args.output, ignore_errors=True)
+    os.makedirs(args.output)
+    runs = [(device, locale) for locale in args.locales for device in args.devices]
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = pool.map(lambda run: run_device(*run, args), runs)
+        failures = 0
+        for (device, locale), failed in zip(runs, results):
+            for sequence in failed:
+                print("%s %s: %s failed" % (device, locale, sequence))
+            failures += len(failed)
+    print(
+        "%d runs of %d sequences in %.1f s, %d failed"
+        % (len(runs), len(SEQUENCES), time.time() - start, failures)
+    )
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,7 +24,7 @@ import sys
 import argparse
 import threading
 import pygame as pg
-from kruxsim import devices, events
+from kruxsim import clock, devices, events
 
 exec_folder = 'simulator'
 current_dir = os.getcwd()
@@ -74,9 +74,42 @@ parser.add_argument(
     required=False,
     action=argparse.BooleanOptionalAction,
 )
+parser.add_argument(
+    "--headless",
+    type=bool,
+    default=False,
+    required=False,
+    action=argparse.BooleanOptionalAction,
+    help="draw offscreen and run the sequence on a virtual clock",
+)
+parser.add_argument(
+    "--trace-heap",
+    type=bool,
+    default=False,
+    required=False,
+    action=argparse.BooleanOptionalAction,
+    help="trace the Python heap and print the boot report with heap costs",
+)
+parser.add_argument(
+    "--workdir",
+    type=str,
+    default="",
+    required=False,
+    help="folder holding the sd, flash and screenshots folders",
+)
 
 args = parser.parse_args()
 
+if args.headless:
+    if not args.sequence:
+        parser.error("--headless needs a --sequence to run")
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+if args.workdir:
+    if args.sequence:
+        args.sequence = os.path.abspath(args.sequence)
+    os.chdir(args.workdir)
+
 pg.init()
 pg.freetype.init()
 
@@ -93,6 +126,9 @@ from kruxsim.mocks import uos_functions
 from kruxsim.mocks import ujson
 from kruxsim.mocks import urandom
 from kruxsim.mocks import usys
+from kruxsim.mocks import ugc
+
+virtual_clock = clock.install() if args.headless else None
 from kruxsim.mocks import utime
 from kruxsim.mocks import fpioa_manager
 from kruxsim.mocks import Maix
@@ -121,7 +157,7 @@ from kruxsim.mocks import baseconv
 
 sequence_executor = None
 if args.sequence:
-    sequence_executor = SequenceExecutor(args.sequence)
+    sequence_executor = SequenceExecutor(args.sequence, virtual_clock)
 
 buttons.register_sequence_executor(sequence_executor)
 pmu.register_sequence_executor(sequence_executor)
@@ -130,8 +166,16 @@ ft6x36.register_sequence_executor(sequence_executor)
 
 
 def run_krux():
-    with open("../src/boot.py", "r", encoding='utf-8') as boot_file:
-        exec(boot_file.read())
+    if args.trace_heap:
+        import tracemalloc
+        from krux.residency import residency
+
+        tracemalloc.start()
+        residency.recording = True
+        residency.on_boot = print
+    boot_path = os.path.join(devices.SIMULATOR_DIR, "..", "src", "boot.py")
+    with open(boot_path, "r", encoding='utf-8') as boot_file:
+        exec(boot_file.read(), {"__name__": "__main__"})
 
 
 # mock for SD
@@ -174,48 +218,48 @@ EMBEDFIRE_SIZE = (303,407)
 # Use --no-screenshot-scale until fix mask size and devices.screenshot_rect()
 device_screenshot_size = AMIGO_SIZE
 mask_img = pg.image.load(
-    os.path.join("assets", "maixpy_amigo_mask.png")
+    os.path.join(devices.SIMULATOR_DIR, "assets", "maixpy_amigo_mask.png")
     ).convert_alpha()
 if (args.device == devices.M5STICKV):
     device_screenshot_size = M5STICKV_SIZE
     mask_img = pg.image.load(
-        os.path.join("assets", "maixpy_m5stickv_mask.png")
+        os.path.join(devices.SIMULATOR_DIR, "assets", "maixpy_m5stickv_mask.png")
         ).convert_alpha()
 elif (args.device == devices.DOCK):
     device_screenshot_size = DOCK_SIZE
     mask_img = pg.image.load(
-        os.path.join("assets", "maixpy_dock_mask.png")
+        os.path.join(devices.SIMULATOR_DIR, "assets", "maixpy_dock_mask.png")
         ).convert_alpha()
 elif (args.device == devices.YAHBOOM):
     device_screenshot_size = YAHBOOM_SIZE
     mask_img = pg.image.load(
-        os.path.join("assets", "maixpy_yahboom_mask.png")
+        os.path.join(devices.SIMULATOR_DIR, "assets", "maixpy_yahboom_mask.png")
         ).convert_alpha()
 elif (args.device == devices.CUBE):
     device_screenshot_size = CUBE_SIZE
     mask_img = pg.image.load(
-        os.path.join("assets", "maixpy_cube_mask.png")
+        os.path.join(devices.SIMULATOR_DIR, "assets", "maixpy_cube_mask.png")
         ).convert_alpha()
 elif (args.device == devices.WONDER_MV):
     device_screenshot_size = WONDER_MV_SIZE
     mask_img = pg.image.load(
-        os.path.join("assets", "maixpy_wonder_mv_mask.png")
+        os.path.join(devices.SIMULATOR_DIR, "assets", "maixpy_wonder_mv_mask.png")
         ).convert_alpha()
 elif (args.device == devices.TZT):
     device_screenshot_size = TZT_SIZE
     mask_img = pg.image.load(
-        os.path.join("assets", "maixpy_tzt_mask.png")
+        os.path.join(devices.SIMULATOR_DIR, "assets", "maixpy_tzt_mask.png")
         ).convert_alpha()
 elif (args.device == devices.EMBEDFIRE):
     device_screenshot_size = EMBEDFIRE_SIZE
     mask_img = pg.image.load(
-        os.path.join("assets", "maixpy_embed_fire_mask.png")
+        os.path.join(devices.SIMULATOR_DIR, "assets", "maixpy_embed_fire_mask.png")
         ).convert_alpha()
 # TODO: WONDER_K IMG
 # elif (args.device == devices.WONDER_K):
 #     device_screenshot_size = WONDER_K_SIZE
 #     mask_img = pg.image.load(
-#         os.path.join("assets", "maixpy_wonder_k_mask.png")
+#         os.path.join(devices.SIMULATOR_DIR, "assets", "maixpy_wonder_k_mask.png")
 #         ).convert_alpha()
     
 # Handle screenshots filename suffix when scaled
@@ -240,6 +284,9 @@ def shutdown():
     sys.exit()
 
 
+HEADLESS_COMPOSE_PASSES = 100
+
+
 def update_screen():
     if lcd.screen:
         lcd_rect = lcd.screen.get_rect()
@@ -265,6 +312,11 @@ def update_screen():
     pg.display.flip()
 
 def screenshot(filename):
+    if args.headless:
+        # Headless runs only compose the screen when it's saved; repeat it so the
+        # translucent device frame blends in as it does after many windowed frames
+        for _ in range(HEADLESS_COMPOSE_PASSES):
+            update_screen()
     sub = screen.subsurface(devices.screenshot_rect(args.device)).convert_alpha()
     sub.blit(mask_img, sub.get_rect(), None, pg.BLEND_RGBA_SUB)
     if (args.screenshot_scale):
@@ -275,10 +327,61 @@ def screenshot(filename):
 
 import time
 
+
+def handle_event(event):
+    if event.type == pg.QUIT:
+        shutdown()
+    elif event.type >= pg.USEREVENT:
+        if event.type == events.SCREENSHOT_EVENT:
+            screenshot(event.dict["filename"])
+        else:
+            event.dict["f"]()
+            if not args.headless:
+                update_screen()
+    if event.type == pg.KEYDOWN:
+        if event.key == pg.K_RETURN:
+            buttons.buttons_control.enter_event_flag = True
+        if event.key == pg.K_DOWN:
+            buttons.buttons_control.page_event_flag = True
+        if event.key == pg.K_UP:
+            buttons.buttons_control.page_prev_event_flag = True
+        # Press key 's' or 'p' to instant screenshot
+        if event.key == pg.K_s or event.key == pg.K_p:
+            screenshot("%s-%s.png" % (args.device, time.strftime('%d%m%y_%H_%M_%S')))
+    if event.type == pg.MOUSEBUTTONDOWN:
+        if args.device == devices.WONDER_K:
+            gt911.touch_control.trigger_event()
+        elif args.device == devices.EMBEDFIRE:
+            cst816.touch_control.trigger_event()
+        else:
+            ft6x36.touch_control.trigger_event()
+    if event.type == pg.ACTIVEEVENT and event.gain:
+        pg.display.flip()
+
+
+def run_headless():
+    """Runs the sequence on the virtual clock, each command once Krux reaches
+    its time. Pygame is only used while Krux is parked, as posting and reading
+    events at once from both threads isn't safe"""
+    while True:
+        if t.is_alive() and not virtual_clock.wait_parked(0.1):
+            continue
+        for event in pg.event.get():
+            handle_event(event)
+        if virtual_clock.flushing:
+            virtual_clock.resume()
+        elif sequence_executor.pending():
+            sequence_executor.execute()
+        else:
+            shutdown()
+
+
 try:
-    clock = pg.time.Clock()
+    if args.headless:
+        run_headless()
+    frame_clock = pg.time.Clock()
     while True:
-        clock.tick(60)
+        frame_clock.tick(60)
 
         if sequence_executor:
             if not sequence_executor.commands and args.exit_after_sequence:
@@ -286,33 +389,7 @@ try:
             sequence_executor.execute()
 
         for event in pg.event.get():
-            if event.type == pg.QUIT:
-                shutdown()
-            elif event.type >= pg.USEREVENT:
-                if event.type == events.SCREENSHOT_EVENT:
-                    screenshot(event.dict["filename"])
-                else:
-                    event.dict["f"]()
-                    update_screen()
-            if event.type == pg.KEYDOWN:
-                if event.key == pg.K_RETURN:
-                    buttons.buttons_control.enter_event_flag = True
-                if event.key == pg.K_DOWN:
-                    buttons.buttons_control.page_event_flag = True
-                if event.key == pg.K_UP:
-                    buttons.buttons_control.page_prev_event_flag = True
-                # Press key 's' or 'p' to instant screenshot
-                if event.key == pg.K_s or event.key == pg.K_p:
-                    screenshot("%s-%s.png" % (args.device, time.strftime('%d%m%y_%H_%M_%S')))
-            if event.type == pg.MOUSEBUTTONDOWN:
-                if args.device == devices.WONDER_K:
-                    gt911.touch_control.trigger_event()
-                elif args.device == devices.EMBEDFIRE:
-                    cst816.touch_control.trigger_event()
-                else:
-                    ft6x36.touch_control.trigger_event()
-            if event.type == pg.ACTIVEEVENT and event.gain:
-                pg.display.flip()
+            handle_event(event)
 
 except KeyboardInterrupt:
     shutdown()
@@ -21,12 +21,12 @@
 # THE SOFTWARE.
 # pylint: disable=C0103
 
-import sys
 import time
 import gc
 import os
 
 from krux.power import power_manager
+from krux.residency import residency
 
 MIN_SPLASH_WAIT_TIME = 1000
 
@@ -49,15 +49,14 @@ def check_for_updates():
     except OSError:
         return
 
-    from krux import firmware
+    firmware = residency.load("krux.firmware")
 
     if firmware.upgrade():
         power_manager.shutdown()
 
     # Unimport firware
-    sys.modules.pop("krux.firmware")
-    del sys.modules["krux"].firmware
     del firmware
+    residency.unload("krux.firmware")
 
 
 def tc_code_verification(ctx_pin):
@@ -77,33 +76,34 @@ def tc_code_verification(ctx_pin):
     if not Settings().security.boot_flash_hash:
         return True
 
-    from krux.pages.tc_code_verification import TCCodeVerification
+    TCCodeVerification = residency.load(
+        "krux.pages.tc_code_verification"
+    ).TCCodeVerification
 
     pin_verification_page = TCCodeVerification(ctx_pin)
     pin_hash = pin_verification_page.capture(return_hash=True)
     if not pin_hash:
         return False
 
-    from krux.pages.flash_tools import FlashHash
+    FlashHash = residency.load("krux.pages.flash_tools").FlashHash
 
     flash_hash = FlashHash(ctx_pin, pin_hash)
     flash_hash.generate()
 
     # Unimport FlashHash the free memory
-    sys.modules.pop("krux.pages.flash_tools")
-    del sys.modules["krux"].pages.flash_tools
     del FlashHash
+    residency.unload("krux.pages.flash_tools")
 
     # Unimport TCCodeVerification the free memory
-    sys.modules.pop("krux.pages.tc_code_verification")
-    del sys.modules["krux"].pages.tc_code_verification
     del TCCodeVerification
+    residency.unload("krux.pages.tc_code_verification")
     return True
 
 
 def login(ctx_login):
     """Loads and run the Login page"""
-    from krux.pages.login import Login
+    Login = residency.load("krux.pages.login").Login
+    residency.boot_done()
 
     start_from = None
     while True:
@@ -118,10 +118,10 @@ def login(ctx_login):
         # Exited for change in Settings
         start_from = Login.SETTINGS_MENU_INDEX
 
-    # Unimport Login the free memory
-    sys.modules.pop("krux.pages.login")
-    del sys.modules["krux"].pages.login
+    # Unimport Login and the pages it kept resident to free memory
     del Login
+    residency.unload("krux.pages.login")
+    residency.unload_idle()
 
 
 def home(ctx_home):
@@ -135,15 +135,19 @@ def home(ctx_home):
 
 
 preimport_ticks = time.ticks_ms()
+residency.mark("start")
 draw_splash()
+residency.mark("splash")
 check_for_updates()
 gc.collect()
+residency.mark("updates checked")
 
 from krux.context import ctx
 from krux.auto_shutdown import auto_shutdown
 
 ctx.power_manager = power_manager
 auto_shutdown.add_ctx(ctx)
+residency.mark("context")
 
 
 # If importing happened too fast, sleep the difference so the logo
@@ -152,8 +156,11 @@ postimport_ticks = time.ticks_ms()
 if preimport_ticks + MIN_SPLASH_WAIT_TIME > postimport_ticks:
     time.sleep_ms(preimport_ticks + MIN_SPLASH_WAIT_TIME - postimport_ticks)
 
+residency.mark("splash wait")
+
 if not tc_code_verification(ctx):
     power_manager.shutdown()
+residency.mark("tc code verified")
 login(ctx)
 gc.collect()
 home(ctx)
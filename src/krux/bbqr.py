@@ -109,32 +109,80 @@ def deflate_decompress(data):
         raise ValueError("Error decompressing BBQR")
 
 
-def decode_bbqr(parts, encoding, file_type):
-    """Decodes the given data as BBQR, returning the decoded data"""
+class BBQrDecoder:
+    """Decodes BBQr parts as they arrive into a single preallocated buffer"""
 
-    if encoding == "H":
-        from binascii import unhexlify
+    def __init__(self, encoding, file_type, total):
+        if encoding not in KNOWN_ENCODINGS:
+            raise ValueError("Invalid BBQr encoding")
+        if file_type not in KNOWN_FILETYPES:
+            raise ValueError("Invalid BBQr file type")
+        self.encoding = encoding
+        self.file_type = file_type
+        self.total = total
+        # All parts but the last have the same size, known once one is decoded
+        self.part_size = None
+        self.buffer = None
+        self.last_part = None
+        self.last_part_size = None
 
-        data_bytes = bytearray()
-        for _, part in sorted(parts.items()):
-            data_bytes.extend(unhexlify(part))
-        return bytes(data_bytes)
+    def _decode_part(self, part):
+        if self.encoding == "H":
+            from binascii import unhexlify
 
-    import base32
+            return unhexlify(part)
+
+        import base32
 
-    binary_data = b""
-    for _, part in sorted(parts.items()):
         padding = (8 - (len(part) % 8)) % 8
-        padded_part = part + (padding * "=")
-        binary_data += base32.decode(padded_part)
+        return base32.decode(part + (padding * "="))
+
+    def add_part(self, index, part, total=None):
+        """Decodes a part, writing it to its position in the buffer"""
+        if total is not None and total != self.total:
+            raise ValueError("Invalid part total")
+        if not 0 <= index < self.total:
+            raise ValueError("Invalid part index")
+
+        data = self._decode_part(part)
+        if index < self.total - 1:
+            if self.part_size is None:
+                self.part_size = len(data)
+                self.buffer = bytearray(self.part_size * self.total)
+                if self.last_part is not None:
+                    self._write(self.total - 1, self.last_part)
+                    self.last_part = None
+            elif len(data) != self.part_size:
+                raise ValueError("Invalid BBQR part size")
+        else:
+            self.last_part_size = len(data)
+            if self.buffer is None:
+                # Kept aside until the size of the other parts is known
+                self.last_part = data
+                return
+        self._write(index, data)
+
+    def _write(self, index, data):
+        if len(data) > self.part_size:
+            raise ValueError("Invalid BBQR part size")
+        start = index * self.part_size
+        self.buffer[start : start + len(data)] = data
+
+    def result(self):
+        """Returns the data of all parts, decompressed and decoded to its file type"""
+        if self.total == 1:
+            binary_data = self.last_part
+        else:
+            size = (self.total - 1) * self.part_size + self.last_part_size
+            binary_data = memoryview(self.buffer)[:size]
 
-    if encoding == "Z":
-        if file_type in "JU":
-            return deflate_decompress(binary_data).decode("utf-8")
-        return deflate_decompress(binary_data)
-    if file_type in "JU":
-        return binary_data.decode("utf-8")
-    return binary_data
+        if self.encoding == "Z":
+            binary_data = deflate_decompress(binary_data)
+        else:
+            binary_data = bytes(binary_data)
+        if self.file_type in "JU":
+            return binary_data.decode("utf-8")
+        return binary_data
 
 
 def encode_bbqr(data, encoding="Z", file_type="P"):
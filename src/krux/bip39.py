@@ -6,6 +6,8 @@ from embit.wordlists.bip39 import WORDLIST
 
 WORDINDEX = {word: i for i, word in enumerate(WORDLIST)}
 
+PBKDF2_ROUNDS = 2048
+
 
 def entropy_checksum(entropy: bytes, checksum_length_bits: int = 4):
     """
@@ -58,3 +60,19 @@ def k_mnemonic_is_valid(mnemonic: str, wordlist=WORDLIST):
         return True
     except:
         return False
+
+
+def k_mnemonic_to_seed(mnemonic: str, password: str = "", wordlist=WORDLIST):
+    """
+    Derives the 64 bytes seed, with the firmware's PBKDF2-HMAC-SHA512 if available
+    Equivalent to embit.bip39.mnemonic_to_seed
+    """
+    if wordlist is not None:
+        k_mnemonic_bytes(mnemonic, wordlist=wordlist)
+    secret = mnemonic.encode("utf-8")
+    salt = ("mnemonic" + password).encode("utf-8")
+    try:
+        from uhashlib_hw import pbkdf2_hmac_sha512
+    except ImportError:
+        return hashlib.pbkdf2_hmac("sha512", secret, salt, PBKDF2_ROUNDS, 64)
+    return pbkdf2_hmac_sha512(secret, salt, PBKDF2_ROUNDS)
@@ -25,6 +25,7 @@ from .input import Input
 from .camera import Camera
 from .light import Light
 from .kboard import kboard
+from .session_secrets import clear_caches
 
 
 class Context:
@@ -44,6 +45,7 @@ class Context:
     def clear(self):
         """Clears all sensitive data from the context, resetting it"""
         self.wallet = None
+        clear_caches()
         gc.collect()
 
     def is_logged_in(self):
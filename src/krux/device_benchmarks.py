@@ -0,0 +1,375 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Times Krux hot paths on the device, so results can be compared across
+boards and releases
+"""
+
+import gc
+import time
+from hashlib import sha256
+from .wdt import wdt
+
+QR_VERSIONS = (1, 5, 10, 20)
+QR_ENCODES = 10
+
+BBQR_BYTES = 4096
+BBQR_PART_CHARS = 400
+
+UR_BYTES = 2048
+UR_PART_BYTES = 200
+
+PSBT_INPUTS = (1, 10, 50)
+
+ADDRESSES = 20
+
+KEF_PLAIN_BYTES = 32
+KEF_ITERATIONS = 1000
+KEF_OPERATIONS = 20
+
+PBKDF2_ITERATIONS = 10000
+BIP39_SEEDS = 2
+
+SD_BYTES = 64 * 1024
+SD_FILENAME = "krux-benchmark.tmp"
+
+LCD_FRAMES = 20
+
+MNEMONIC = " ".join(["abandon"] * 11 + ["about"])
+
+
+def _data(size):
+    """Deterministic, incompressible bytes"""
+    return b"".join(
+        sha256(i.to_bytes(4, "big")).digest() for i in range(size // 32 + 1)
+    )[:size]
+
+
+def _wallet():
+    from embit.networks import NETWORKS
+    from .key import Key, TYPE_SINGLESIG
+    from .wallet import Wallet
+
+    return Wallet(Key(MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
+
+
+class HeapSampler:
+    """Keeps the highest allocated heap seen while a benchmark runs"""
+
+    def __init__(self):
+        self.start = 0
+        self.peak = 0
+        self.reset()
+
+    def reset(self):
+        """Starts sampling from the current heap"""
+        self.start = gc.mem_alloc()
+        self.peak = self.start
+
+    def sample(self):
+        """Samples the heap, feeding the watchdog between iterations"""
+        wdt.feed()
+        self.peak = max(self.peak, gc.mem_alloc())
+
+
+# Benchmarks prepare their data and return a workload to be timed,
+# the amount of work it does and the unit of that amount
+
+
+def qr_encode(sample, version):
+    """Encodes byte mode QR codes filling the version"""
+    import qrcode
+    from .qr import QR_CAPACITY_BYTE
+
+    data = _data(QR_CAPACITY_BYTE[version - 1])
+
+    def workload():
+        for _ in range(QR_ENCODES):
+            qrcode.encode(data)
+            sample()
+
+    return workload, QR_ENCODES, "codes/s"
+
+
+def bbqr_decode(sample):
+    """Parses every part of a BBQr as the QR scanner does"""
+    from .bbqr import encode_bbqr, int2base36
+    from .qr import QRPartParser
+
+    bbqr = encode_bbqr(_data(BBQR_BYTES))
+    payload = bbqr.payload
+    total = (len(payload) + BBQR_PART_CHARS - 1) // BBQR_PART_CHARS
+    parts = [
+        "B$%s%s%s%s" % (bbqr.encoding, bbqr.file_type, int2base36(total), int2base36(i))
+        + payload[i * BBQR_PART_CHARS : (i + 1) * BBQR_PART_CHARS]
+        for i in range(total)
+    ]
+
+    def workload():
+        parser = QRPartParser()
+        for part in parts:
+            parser.parse(part)
+            sample()
+        if not parser.is_complete():
+            raise ValueError("incomplete")
+        parser.result()
+
+    return workload, total, "parts/s"
+
+
+def ur_decode(sample):
+    """Parses every part of a crypto-psbt UR as the QR scanner does"""
+    from ur.ur import UR
+    from ur.ur_encoder import UREncoder
+    from urtypes.crypto.psbt import PSBT as URTYPE_PSBT, CRYPTO_PSBT
+    from .qr import QRPartParser
+
+    encoder = UREncoder(
+        UR(CRYPTO_PSBT.type, URTYPE_PSBT(_data(UR_BYTES)).to_cbor()), UR_PART_BYTES, 0
+    )
+    parts = [
+        encoder.next_part().upper() for _ in range(encoder.fountain_encoder.seq_len())
+    ]
+
+    def workload():
+        parser = QRPartParser()
+        for part in parts:
+            parser.parse(part)
+            sample()
+        if not parser.is_complete():
+            raise ValueError("incomplete")
+
+    return workload, len(parts), "parts/s"
+
+
+def psbt_sign(sample, num_inputs):
+    """Parses, reviews and signs a native segwit PSBT with num_inputs inputs"""
+    from embit import script
+    from embit.bip32 import parse_path
+    from embit.psbt import PSBT, DerivationPath
+    from embit.transaction import Transaction, TransactionInput, TransactionOutput
+    from .psbt import PSBTSigner
+    from .qr import FORMAT_NONE
+
+    wallet = _wallet()
+    key = wallet.key
+    account_path = parse_path(key.derivation)
+    receive = key.account.derive([0, 0]).key
+    change = key.account.derive([1, 0]).key
+    vin = [TransactionInput(i.to_bytes(32, "little"), 0) for i in range(num_inputs)]
+    vout = [
+        TransactionOutput(5000 * num_inputs, script.p2wpkh(receive)),
+        TransactionOutput(4000 * num_inputs, script.p2wpkh(change)),
+    ]
+    psbt = PSBT(Transaction(vin=vin, vout=vout))
+    for inp in psbt.inputs:
+        inp.witness_utxo = TransactionOutput(10000, script.p2wpkh(receive))
+        inp.bip32_derivations[receive] = DerivationPath(
+            key.fingerprint, account_path + [0, 0]
+        )
+    psbt.outputs[1].bip32_derivations[change] = DerivationPath(
+        key.fingerprint, account_path + [1, 0]
+    )
+    psbt_data = psbt.serialize()
+    del psbt, vin, vout
+
+    def workload():
+        signer = PSBTSigner(wallet, psbt_data, FORMAT_NONE)
+        sample()
+        signer.outputs()
+        sample()
+        signer.sign()
+        sample()
+
+    return workload, num_inputs, "inputs/s"
+
+
+def address_derivation(sample):
+    """Derives receive addresses of a single-sig wallet"""
+    from embit.networks import NETWORKS
+
+    wallet = _wallet()
+    network = NETWORKS["test"]
+
+    def workload():
+        for i in range(ADDRESSES):
+            wallet.descriptor.derive(i, branch_index=0).address(network=network)
+            sample()
+
+    return workload, ADDRESSES, "addresses/s"
+
+
+def kef_encrypt(sample, version):
+    """Encrypts a mnemonic sized plaintext with a stretched key"""
+    from .kef import Cipher, VERSIONS, MODE_IVS
+
+    cipher = Cipher(b"benchmark", b"benchmark", KEF_ITERATIONS)
+    plain = _data(KEF_PLAIN_BYTES)
+    iv = _data(MODE_IVS.get(VERSIONS[version]["mode"], 0))
+
+    def workload():
+        for _ in range(KEF_OPERATIONS):
+            cipher.encrypt(plain, version, iv)
+            sample()
+
+    return workload, KEF_OPERATIONS, "ops/s"
+
+
+def kef_decrypt(sample, version):
+    """Decrypts a mnemonic sized payload with a stretched key"""
+    from .kef import Cipher, VERSIONS, MODE_IVS
+
+    cipher = Cipher(b"benchmark", b"benchmark", KEF_ITERATIONS)
+    iv = _data(MODE_IVS.get(VERSIONS[version]["mode"], 0))
+    payload = cipher.encrypt(_data(KEF_PLAIN_BYTES), version, iv)
+
+    def workload():
+        for _ in range(KEF_OPERATIONS):
+            if cipher.decrypt(payload, version) is None:
+                raise ValueError("decryption failed")
+            sample()
+
+    return workload, KEF_OPERATIONS, "ops/s"
+
+
+def pbkdf2_sha256(sample):
+    """Stretches a key as KEF and the TC Code do"""
+    from uhashlib_hw import pbkdf2_hmac_sha256
+
+    def workload():
+        pbkdf2_hmac_sha256(b"benchmark", b"benchmark", PBKDF2_ITERATIONS)
+        sample()
+
+    return workload, PBKDF2_ITERATIONS, "iterations/s"
+
+
+def pbkdf2_sha512(sample):
+    """Derives BIP39 seeds, 2048 PBKDF2-HMAC-SHA512 iterations each"""
+    from .bip39 import k_mnemonic_to_seed, PBKDF2_ROUNDS
+
+    def workload():
+        for i in range(BIP39_SEEDS):
+            k_mnemonic_to_seed(MNEMONIC, str(i))
+            sample()
+
+    return workload, BIP39_SEEDS * PBKDF2_ROUNDS, "iterations/s"
+
+
+def sd_write(sample):
+    """Writes a file to the SD card"""
+    from .sd_card import SDHandler
+
+    data = _data(SD_BYTES)
+
+    def workload():
+        with SDHandler() as sd:
+            sd.write_binary(SD_FILENAME, data)
+            sample()
+
+    return workload, SD_BYTES // 1024, "KB/s"
+
+
+def sd_read(sample):
+    """Reads back the file written to the SD card"""
+    from .sd_card import SDHandler
+
+    def workload():
+        with SDHandler() as sd:
+            if len(sd.read_binary(SD_FILENAME)) != SD_BYTES:
+                raise ValueError("size mismatch")
+            sample()
+            sd.delete(SD_FILENAME)
+
+    return workload, SD_BYTES // 1024, "KB/s"
+
+
+def lcd_redraw(sample):
+    """Redraws the full screen"""
+    from .display import display
+    from .themes import theme
+
+    def workload():
+        for i in range(LCD_FRAMES):
+            display.fill_rectangle(
+                0,
+                0,
+                display.width(),
+                display.height(),
+                theme.fg_color if i % 2 else theme.bg_color,
+            )
+            sample()
+        display.clear()
+
+    return workload, LCD_FRAMES, "fps"
+
+
+def all_benchmarks():
+    """Names and arguments of every benchmark, in the order they run"""
+    from .kef import VERSIONS
+
+    benchmarks = [("qr encode v%d" % v, qr_encode, v) for v in QR_VERSIONS]
+    benchmarks += [("bbqr decode", bbqr_decode), ("ur decode", ur_decode)]
+    benchmarks += [("psbt sign %d in" % n, psbt_sign, n) for n in PSBT_INPUTS]
+    benchmarks.append(("address derivation", address_derivation))
+    for version in sorted(VERSIONS):
+        name = VERSIONS[version]["name"]
+        benchmarks.append(("kef encrypt " + name, kef_encrypt, version))
+        benchmarks.append(("kef decrypt " + name, kef_decrypt, version))
+    benchmarks += [
+        ("pbkdf2 sha256", pbkdf2_sha256),
+        ("pbkdf2 sha512", pbkdf2_sha512),
+        ("sd write", sd_write),
+        ("sd read", sd_read),
+        ("lcd redraw", lcd_redraw),
+    ]
+    return benchmarks
+
+
+def run_benchmark(name, benchmark, *args):
+    """Times a benchmark, returning its rate, elapsed ms and heap peak"""
+    heap = HeapSampler()
+    try:
+        workload, amount, unit = benchmark(heap.sample, *args)
+        gc.collect()
+        heap.reset()
+        ticks = time.ticks_ms()
+        workload()
+        elapsed = max(time.ticks_ms() - ticks, 1)
+        heap.sample()
+    except Exception as err:
+        return {"name": name, "error": repr(err)}
+    finally:
+        wdt.feed()
+    return {
+        "name": name,
+        "rate": round(amount * 1000 / elapsed, 2),
+        "unit": unit,
+        "ms": elapsed,
+        "heap": heap.peak - heap.start,
+    }
+
+
+def report(results):
+    """Results with the board and firmware version they were measured on"""
+    import board
+    from .metadata import VERSION
+
+    return {"board": board.config["type"], "version": VERSION, "results": results}
@@ -26,7 +26,7 @@ from krux import kef
 from .baseconv import base_encode, base_decode
 from .sd_card import SDHandler
 from embit import bip39
-from .settings import FLASH_PATH, MNEMONICS_FILE
+from .settings import FLASH_PATH, MNEMONICS_FILE, notify_flash_write
 
 FLASH_PATH_STR = "/" + FLASH_PATH + "/%s"
 
@@ -147,6 +147,8 @@ class MnemonicStorage:
                     f.write(json.dumps(mnemonics))
             except:
                 return False
+            finally:
+                notify_flash_write()
         return True
 
     def del_mnemonic(self, mnemonic_id, sd_card=False):
@@ -164,3 +166,4 @@ class MnemonicStorage:
             self.stored.pop(mnemonic_id)
             with open(FLASH_PATH_STR % MNEMONICS_FILE, "w") as f:
                 f.write(json.dumps(self.stored))
+            notify_flash_write()
@@ -53,10 +53,7 @@ ERASE_BLOCK_SIZE = 0x1000
 FLASH_IO_WAIT_TIME = 100
 
 CALVER_SIZE = 7
-READ_FIRMWARE_BUFFER = 2**14
-READ_FIRMWARE_VERSION_BUFFER = 2**10
 FIRMWARE_VERSION_CHUNK_OVERLAP = 120
-DEVICE_TYPE_CHUNK_OVERLAP = 20
 
 
 def find_active_firmware(sector):
@@ -157,33 +154,6 @@ def write_data(
         chunk_read = 0
 
 
-def fsize(firmware_filename):
-    """Returns the size of the firmware"""
-    size = 0
-    with open(firmware_filename, "rb", buffering=0) as file:
-        while True:
-            chunk = file.read(READ_FIRMWARE_BUFFER)
-            if not chunk:
-                break
-            size += len(chunk)
-    return size
-
-
-def sha256(firmware_filename, firmware_size=None):
-    """Returns the sha256 hash of the firmware"""
-    hasher = uhashlib_hw.sha256()
-    # If firmware size is supplied, then we want a sha256 of the firmware with its header
-    if firmware_size is not None:
-        hasher.update(b"\x00" + firmware_size.to_bytes(4, "little"))
-    with open(firmware_filename, "rb", buffering=0) as file:
-        while True:
-            chunk = file.read(READ_FIRMWARE_BUFFER)
-            if not chunk:
-                break
-            hasher.update(chunk)
-    return hasher.digest()
-
-
 def find_all_occurrences(data, pattern):
     """Find all occurrences of the pattern in the data"""
     positions = []
@@ -215,52 +185,74 @@ def extract_calver(context):
     return None
 
 
-def is_this_device(firmware_filename):
-    """Return True if firmware is for this device"""
-    with open(firmware_filename, "rb", buffering=0) as f:
-        firmware_data = b""
-        last_chunk = b""
-        while True:
-            chunk = f.read(READ_FIRMWARE_VERSION_BUFFER)
-            if not chunk:
+class FirmwareReader:
+    """Wraps the firmware file so a sequential read computes its size, its
+    sha256 with and without header, its device type and its version"""
+
+    def __init__(self, file, firmware_size):
+        self.file = file
+        self.size = 0
+        self.hasher = uhashlib_hw.sha256()
+        # sha256 of the firmware with its header, as stored in flash
+        self.header_hasher = uhashlib_hw.sha256()
+        self.header_hasher.update(b"\x00" + firmware_size.to_bytes(4, "little"))
+        self.device_pattern = ('"' + board.config["type"] + '"').encode("ascii")
+        self.is_this_device = False
+        self.version = None
+        self.last_chunk = b""
+
+    def read(self, size):
+        """Reads from the firmware file, updating hashes and scans"""
+        chunk = self.file.read(size)
+        if chunk:
+            self.size += len(chunk)
+            self.hasher.update(chunk)
+            self.header_hasher.update(chunk)
+            self._scan(chunk)
+        return chunk
+
+    def _scan(self, chunk):
+        # Buffer must overlap slightly to avoid missing patterns split between chunks
+        firmware_data = self.last_chunk + chunk
+        self.last_chunk = firmware_data[-FIRMWARE_VERSION_CHUNK_OVERLAP:]
+        if not self.is_this_device:
+            self.is_this_device = firmware_data.find(self.device_pattern) != -1
+        for pos in find_all_occurrences(firmware_data, b"krux/metadata.py"):
+            delta = 100
+            start_range = max(pos - delta, 0)
+            end_range = min(pos + delta, len(firmware_data))
+            version = extract_calver(firmware_data[start_range:end_range])
+            if version:
+                self.version = version
                 break
-            # Buffer must overlap slightly to avoid missing patterns split between chunks
-            firmware_data = last_chunk + chunk
-            last_chunk = chunk[-DEVICE_TYPE_CHUNK_OVERLAP:]
-            if (
-                firmware_data.find(('"' + board.config["type"] + '"').encode("ascii"))
-                != -1
-            ):
-                return True
-    return False
-
 
-def is_version_greater(firmware_filename):
-    """Return the version if greater, else False"""
-    new_version = None
-    with open(firmware_filename, "rb", buffering=0) as f:
-        firmware_data = b""
-        last_chunk = b""
+    def read_all(self, pct_cb, firmware_size):
+        """Reads the whole firmware file, checking it matches its reported size"""
         while True:
-            chunk = f.read(READ_FIRMWARE_VERSION_BUFFER)
-            if not chunk:
+            wdt.feed()
+            pct_cb(self.size / firmware_size)
+            if not self.read(FIRMWARE_WRITE_CHUNCK_SIZE):
                 break
-            # Buffer must overlap slightly to avoid missing patterns split between chunks
-            firmware_data = last_chunk + chunk
-            last_chunk = chunk[-FIRMWARE_VERSION_CHUNK_OVERLAP:]
-            positions = find_all_occurrences(firmware_data, b"krux/metadata.py")
-            if not positions:
-                continue
-            for pos in positions:
-                delta = 100
-                start_range = max(pos - delta, 0)
-                end_range = min(pos + delta, len(firmware_data))
-                context_before = firmware_data[start_range:end_range]
-                version = extract_calver(context_before)
-                if version:
-                    new_version = version
-                    break
+        if self.size != firmware_size:
+            raise ValueError("firmware size mismatch")
+
+    def sha256(self):
+        """Returns the sha256 hash of the firmware read so far"""
+        return self.hasher.digest()
+
+    def sha256_with_header(self):
+        """Returns the sha256 hash of the firmware read so far with its header"""
+        return self.header_hasher.digest()
 
+
+def is_this_device(firmware_reader):
+    """Return True if firmware is for this device"""
+    return firmware_reader.is_this_device
+
+
+def is_version_greater(firmware_reader):
+    """Return the version if greater, else False"""
+    new_version = firmware_reader.version
     try:
         new_ver = tuple(map(int, new_version.split(".")))
         current_version = VERSION.split(".")
@@ -284,7 +276,7 @@ def upgrade():
 
     firmware_path = "/%s/%s" % (SD_PATH, "firmware.bin")
     try:
-        os.stat(firmware_path)
+        new_size = os.stat(firmware_path)[6]
     except:
         return False
 
@@ -319,7 +311,6 @@ def upgrade():
         return False
 
     # Validate firmware file size
-    new_size = fsize(firmware_path)
     if new_size > MAX_FIRMWARE_SIZE:
         display.flash_text(
             "Firmware exceeds max size: %d" % MAX_FIRMWARE_SIZE, theme.error_color
@@ -335,8 +326,26 @@ def upgrade():
         display.flash_text(t("Missing signature file"), theme.error_color)
         return False
 
+    # Read the firmware file once to hash it and scan its device type and
+    # version, without writing anything to the flash
+    try:
+        with open(firmware_path, "rb", buffering=0) as firmware_file:
+            firmware_reader = FirmwareReader(firmware_file, new_size)
+            firmware_reader.read_all(
+                lambda pct: status_text(
+                    t("New firmware detected.")
+                    + "\n\n"
+                    + t("Verifying…")
+                    + "\n\n%d%%" % int(pct * 100)
+                ),
+                new_size,
+            )
+    except:
+        display.flash_text("Error read/write data", theme.error_color)
+        return False
+
     # Validate signature
-    firmware_hash = sha256(firmware_path)
+    firmware_hash = firmware_reader.sha256()
     try:
         # Parse, serialize, and reparse to ensure signature is compact prior to verification
         sig = ec.Signature.parse(ec.Signature.parse(sig).serialize())
@@ -348,13 +357,13 @@ def upgrade():
         return False
 
     # Validate firmware device type
-    if not is_this_device(firmware_path):
+    if not is_this_device(firmware_reader):
         display.flash_text("Firmware not for this device", theme.error_color)
         return False
 
     # Validate firmware file version
     try:
-        new_version = is_version_greater(firmware_path)
+        new_version = is_version_greater(firmware_reader)
 
         if not new_version:
             display.flash_text(
@@ -383,21 +392,24 @@ def upgrade():
 
     # Write new firmware to the opposite slot
     new_address = FIRMWARE_SLOT_2 if address == FIRMWARE_SLOT_1 else FIRMWARE_SLOT_1
-
-    firmware_with_header_hash = sha256(firmware_path, new_size)
     try:
         with open(firmware_path, "rb", buffering=0) as firmware_file:
+            written_reader = FirmwareReader(firmware_file, new_size)
             write_data(
                 lambda pct: status_text(
                     t("Processing…") + "1/3" + "\n\n%d%%" % int(pct * 100)
                 ),
                 new_address,
-                firmware_file,
+                written_reader,
                 new_size,
                 FIRMWARE_WRITE_CHUNCK_SIZE,
                 True,
-                firmware_with_header_hash,
+                firmware_reader.sha256_with_header(),
             )
+        # The boot config is only switched if the file did not change since
+        # it was verified
+        if written_reader.sha256() != firmware_hash:
+            raise ValueError("firmware changed")
 
         write_data(
             lambda pct: status_text(
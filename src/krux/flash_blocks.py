@@ -0,0 +1,92 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2025 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Erased flash blocks, read from flash once and kept up to date by the
+writes Krux makes
+"""
+
+import flash
+from .firmware import FLASH_SIZE, SPIFFS_ADDR, ERASE_BLOCK_SIZE
+
+BLOCK_SIZE = ERASE_BLOCK_SIZE
+TOTAL_BLOCKS = FLASH_SIZE // BLOCK_SIZE
+
+# Used blocks are told apart by their first bytes, sparing a full block read
+PROBE_SIZE = 16
+ERASED_PROBE = b"\xff" * PROBE_SIZE
+ERASED_BLOCK = b"\xff" * BLOCK_SIZE
+
+
+class FlashBlocks:
+    """Bitmap of erased flash blocks, one bit per block"""
+
+    def __init__(self):
+        self.erased = bytearray(TOTAL_BLOCKS // 8)
+        # Blocks from this address on were not read since they may have changed
+        self.stale_from = 0
+
+    def _read_erased(self, address):
+        """Reads a block from flash, stopping at its first bytes if they're used"""
+        if flash.read(address, PROBE_SIZE) != ERASED_PROBE:
+            return False
+        # Comparison stops at the first byte that differs
+        return flash.read(address, BLOCK_SIZE) == ERASED_BLOCK
+
+    def _set(self, address, erased):
+        index = address // BLOCK_SIZE
+        if erased:
+            self.erased[index >> 3] |= 1 << (index & 7)
+        else:
+            self.erased[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def is_erased(self, address, verify=False):
+        """Whether the block at address is erased. Blocks are read in order the
+        first time, then answered from the bitmap. With verify, a block the
+        bitmap already knew as erased is read again before being trusted, as
+        SPIFFS may have used it since.
+        """
+        if self.stale_from <= address:
+            # The block is read below, there's nothing older to verify
+            verify = False
+        while self.stale_from <= address:
+            self._set(self.stale_from, self._read_erased(self.stale_from))
+            self.stale_from += BLOCK_SIZE
+        index = address // BLOCK_SIZE
+        erased = self.erased[index >> 3] >> (index & 7) & 1
+        if erased and verify:
+            erased = self._read_erased(address)
+            self._set(address, erased)
+        return bool(erased)
+
+    def mark_written(self, address):
+        """Records data was written to the block at address"""
+        self._set(address, False)
+
+    def mark_erased(self, address):
+        """Records the block at address was erased"""
+        self._set(address, True)
+
+    def spiffs_changed(self):
+        """Files were written, SPIFFS blocks will be read again"""
+        self.stale_from = min(self.stale_from, SPIFFS_ADDR)
+
+
+flash_blocks = FlashBlocks()
@@ -22,6 +22,7 @@
 
 import ucryptolib
 import uhashlib_hw
+from .session_secrets import SecretCache, register_cache
 
 # KEF: AES, MODEs VERSIONS, MODE_NUMBERS, and MODE_IVS are defined here
 #  to disable a MODE: set its value to None
@@ -134,6 +135,30 @@ MODE_IVS = {
 
 AES_BLOCK_SIZE = 16
 
+# Stretched keys kept for the session, so unlocking the same entry again with
+# the same key doesn't rerun PBKDF2; zeroized by clear_stretched_keys() on logout.
+# The salt is the entry's id, one key tried against other ids isn't a hit
+STRETCHED_KEYS_SIZE = 16
+_stretched_keys = SecretCache(STRETCHED_KEYS_SIZE)
+
+
+def _stretch_key(key, salt, iterations):
+    """Returns the PBKDF2 stretched key, reusing it if already derived this session"""
+    return _stretched_keys.get(
+        lambda: uhashlib_hw.pbkdf2_hmac_sha256(key, salt, iterations),
+        key,
+        salt,
+        iterations.to_bytes(4, "big"),
+    )
+
+
+def clear_stretched_keys():
+    """Zeroizes and forgets all stretched keys of the session"""
+    _stretched_keys.clear()
+
+
+register_cache(__name__, clear_stretched_keys)
+
 
 class Cipher:
     """More than just a helper for AES encrypt/decrypt. Enforces KEF VERSIONS rules"""
@@ -141,7 +166,7 @@ class Cipher:
     def __init__(self, key, salt, iterations):
         key = key if isinstance(key, bytes) else key.encode()
         salt = salt if isinstance(salt, bytes) else salt.encode()
-        self._key = uhashlib_hw.pbkdf2_hmac_sha256(key, salt, iterations)
+        self._key = _stretch_key(key, salt, iterations)
 
     def encrypt(self, plain, version, iv=b"", fail_unsafe=True):
         """AES encrypt according to KEF rules defined by version, returns payload bytes"""
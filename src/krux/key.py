@@ -25,13 +25,15 @@ import time
 import urandom as random
 from binascii import hexlify
 from hashlib import sha256
-from embit import bip32, bip39
+from embit import bip32
 from embit.wordlists.bip39 import WORDLIST
 from embit.networks import NETWORKS
 from .settings import (
     TEST_TXT,
     THIN_SPACE,
 )
+from .bip39 import k_mnemonic_to_seed
+from .session_secrets import SecretCache, register_cache
 
 DER_SINGLE = "m/%dh/%dh/%dh"
 DER_MULTI_LEGACY_NO_PATHS = "m/45h"
@@ -142,6 +144,28 @@ POLICY_TYPE_NAMES_MAP = {
 FINGERPRINT_SYMBOL = "⊚"
 DERIVATION_PATH_SYMBOL = "↳"
 
+# BIP39 seeds kept for the session, so rebuilding a Key with another policy,
+# script, account or network doesn't rerun PBKDF2; zeroized by clear_seeds()
+SEEDS_SIZE = 4
+_seeds = SecretCache(SEEDS_SIZE)
+
+
+def _bip39_seed(mnemonic, passphrase):
+    """Returns the BIP39 seed, reusing it if already derived this session"""
+    return _seeds.get(
+        lambda: k_mnemonic_to_seed(mnemonic, passphrase),
+        mnemonic.encode("utf-8"),
+        passphrase.encode("utf-8"),
+    )
+
+
+def clear_seeds():
+    """Zeroizes and forgets all BIP39 seeds of the session"""
+    _seeds.clear()
+
+
+register_cache(__name__, clear_seeds)
+
 
 class Key:
     """Represents a BIP39 mnemonic-based private key"""
@@ -210,7 +234,7 @@ class Key:
     def extract_root(cls, mnemonic, passphrase, network):
         """Calculate and return the BIP32 root key based on mnemonic"""
         return bip32.HDKey.from_seed(
-            bip39.mnemonic_to_seed(mnemonic, passphrase), version=network["xprv"]
+            _bip39_seed(mnemonic, passphrase), version=network["xprv"]
         )
 
     def get_xpub(self, path):
@@ -51,6 +51,9 @@ TC_CODE_PBKDF2_ITERATIONS = 100000
 
 DEFAULT_LOCALE = "en-US"
 
+# Max slugs memoized by t() before the memo is reset
+TRANSLATION_MEMO_SIZE = 64
+
 DEFAULT_TX_PIN = (
     board.config["board_info"]["CONNEXT_A"]
     if "CONNEXT_A" in board.config["board_info"]
@@ -71,22 +74,52 @@ CNC_HEAD_LASER = "laser"
 
 def t(slug):
     """Translates a slug according to the current locale"""
-    if not locale_control.translation:
-        return slug
-    slug_id = binascii.crc32(slug.encode("utf-8"))
-    try:
-        translation_index = locale_control.reference.index(slug_id)
-    except:
+    if not locale_control.catalog:
         return slug
-    return locale_control.translation[translation_index]
+    memo = locale_control.memo
+    if slug in memo:
+        return memo[slug]
+    translation = _catalog_lookup(
+        locale_control.catalog, binascii.crc32(slug.encode("utf-8"))
+    )
+    if translation is None:
+        translation = slug
+    if len(memo) >= TRANSLATION_MEMO_SIZE:
+        memo.clear()
+    memo[slug] = translation
+    return translation
+
+
+def _catalog_lookup(catalog, slug_id):
+    """Binary searches a baked catalog for the slug's crc32, returning the
+    translation read from the catalog's heap, or None if not translated
+    """
+    count = int.from_bytes(catalog[:2], "little")
+    offsets = 2 + 4 * count
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        index = 2 + 4 * middle
+        middle_id = int.from_bytes(catalog[index : index + 4], "little")
+        if middle_id < slug_id:
+            low = middle + 1
+        elif middle_id > slug_id:
+            high = middle
+        else:
+            index = offsets + 4 * middle
+            heap = offsets + 4 * (count + 1)
+            start = heap + int.from_bytes(catalog[index : index + 4], "little")
+            end = heap + int.from_bytes(catalog[index + 4 : index + 8], "little")
+            return catalog[start:end].decode("utf-8")
+    return None
 
 
 class LocaleControl:
     """Manages the current locale and available translations"""
 
     def __init__(self):
-        self.reference = None
-        self.translation = None
+        self.catalog = None
+        self.memo = {}
         self.locales = []
         self.update_locales()
 
@@ -99,11 +132,11 @@ class LocaleControl:
         self.locales.extend(available_languages)
 
     def load_locale(self, locale):
-        """Loads translation based on the given locale"""
+        """Loads the baked translation catalog of the given locale"""
 
+        self.memo.clear()
         if locale == DEFAULT_LOCALE:
-            self.reference = None
-            self.translation = None
+            self.catalog = None
             return
         module_path = "krux.translations.{}".format(locale[:2])
         translation_module = __import__(module_path)
@@ -111,11 +144,8 @@ class LocaleControl:
         for part in module_path.split(".")[1:]:
             translation_module = getattr(translation_module, part)
 
-        self.translation = getattr(translation_module, "translation_array")
-        if self.reference is None:
-            from .translations import ref_array
-
-            self.reference = ref_array
+        # Strings stay in the catalog bytes, decoded one by one when t() needs them
+        self.catalog = getattr(translation_module, "catalog")
 
 
 locale_control = LocaleControl()
@@ -218,7 +248,7 @@ class CNCSettings(SettingsNamespace):
 
     namespace = "settings.printer.cnc"
     invert = CategorySetting("invert", False, [False, True])
-    cut_method = CategorySetting("cut_method", "spiral", ["spiral", "row"])
+    cut_method = CategorySetting("cut_method", "spiral", ["spiral", "row", "runs"])
     unit = CategorySetting("unit", "in", ["in", "mm"])
     flute_diameter = NumberSetting(float, "flute_diameter", 0.02, [0.0001, 10000])
     plunge_rate = NumberSetting(float, "plunge_rate", 30, [0.0001, 10000])
@@ -47,7 +47,7 @@ from ..display import (
     STATUS_BAR_HEIGHT,
     BOTTOM_LINE,
 )
-from ..qr import to_qr_codes, FORMAT_NONE
+from ..qr import QRFrameCache, FORMAT_NONE
 from ..krux_settings import t, Settings
 from ..sd_card import SDHandler
 from ..kboard import kboard
@@ -276,7 +276,7 @@ class Page:
                 t("PAGE to toggle brightness"), cursor_y, theme.frame_color
             )
 
-        code_generator = to_qr_codes(data, qr_data_width, qr_format)
+        frames = QRFrameCache(data, qr_data_width, qr_format)
         qr_foreground = WHITE if theme.bg_color == WHITE else None
         extra_debounce_flag = True
         self.ctx.input.buttons_active = True
@@ -286,11 +286,7 @@ class Page:
         i = 0
         done = False
         while not done:
-            try:
-                code, num_parts = next(code_generator)
-            except:
-                code_generator = to_qr_codes(data, qr_data_width, qr_format)
-                code, num_parts = next(code_generator)
+            code, num_parts = frames.next_frame()
 
             # Draw QR code
             if qr_foreground:
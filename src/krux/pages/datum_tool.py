@@ -538,12 +538,12 @@ class DatumTool(Page):
     def save_sd(self):
         """Reusable handler for saving to SD file"""
         from .file_operations import SaveFile
+        from ..sd_card import iter_chunks
 
         save_page = SaveFile(self.ctx)
         save_page.save_file(
-            self.contents,
+            iter_chunks(self.contents),
             self.title.split(",")[-1].replace(" ", "_"),
-            save_as_binary=isinstance(self.contents, bytes),
             prompt=False,
         )
 
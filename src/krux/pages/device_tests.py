@@ -20,11 +20,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import sys
 from . import Page, Menu, MENU_CONTINUE
 from ..display import DEFAULT_PADDING, FONT_HEIGHT, FONT_WIDTH
 from ..krux_settings import t
 from ..wdt import wdt
 from ..kboard import kboard
+from ..residency import residency
 
 
 class DeviceTests(Page):
@@ -35,6 +37,7 @@ class DeviceTests(Page):
             (t("Check SD Card"), self.sd_check),
             (t("Print Test QR"), self.print_test),
             (t("Test Suite"), self.test_suite),
+            (t("Benchmarks"), self.benchmarks),
         ]
         if kboard.has_touchscreen:
             menu_items += [(t("Touchscreen"), self.test_touch)]
@@ -207,6 +210,73 @@ class DeviceTests(Page):
             return MENU_CONTINUE
         return self.run_one_test(self.results[idx][0])
 
+    def benchmarks(self):
+        """Handler for the 'Benchmarks' menu item"""
+        resident = set(sys.modules)
+        device_benchmarks = residency.load("krux.device_benchmarks")
+        benchmarks = device_benchmarks.all_benchmarks()
+        results = []
+        for idx, benchmark in enumerate(benchmarks):
+            self.ctx.display.clear()
+            self.ctx.display.draw_centered_text(
+                t("Processing…")
+                + " {}/{}\n\n{}".format(idx + 1, len(benchmarks), benchmark[0])
+            )
+            results.append(device_benchmarks.run_benchmark(*benchmark))
+        report = device_benchmarks.report(results)
+        del device_benchmarks, benchmarks
+
+        # Unload the suite and everything its benchmarks imported
+        residency.unload("krux.device_benchmarks")
+        for name in set(sys.modules) - resident:
+            residency.unload(name)
+
+        if self.has_sd_card():
+            import ujson as json
+            from .file_operations import SaveFile
+            from ..sd_card import JSON_FILE_EXTENSION
+
+            filename = "benchmarks-{}-{}".format(report["board"], report["version"])
+            SaveFile(self.ctx).save_file(
+                json.dumps(report),
+                filename,
+                filename,
+                t("Benchmarks") + ":",
+                JSON_FILE_EXTENSION,
+                save_as_binary=False,
+            )
+
+        chars_per_line = (self.ctx.display.width() - DEFAULT_PADDING * 2) // FONT_WIDTH
+        results_menu = Menu(
+            self.ctx,
+            [
+                (
+                    (
+                        "{} {:g} {}".format(
+                            result["name"], result["rate"], result["unit"]
+                        )
+                        if "error" not in result
+                        else result["name"] + " X"
+                    )[:chars_per_line],
+                    lambda result=result: self._benchmark_details(result),
+                )
+                for result in results
+            ],
+        )
+        results_menu.run_loop()
+        return MENU_CONTINUE
+
+    def _benchmark_details(self, result):
+        self.ctx.display.clear()
+        self.ctx.display.draw_hcentered_text(
+            "\n".join(
+                ["{}: {}".format(key, value) for key, value in sorted(result.items())]
+            ),
+            highlight_prefix=":",
+        )
+        self.ctx.input.wait_for_button()
+        return MENU_CONTINUE
+
     def test_touch(self):
         """Check touch detection across the entire screen"""
         from ..buttons import PRESSED
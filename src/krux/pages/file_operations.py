@@ -50,7 +50,7 @@ class SaveFile(Page):
         save_as_binary=True,
         prompt=True,
     ):
-        """File saver handler page"""
+        """File saver handler page, data may also be an iterable of chunks"""
         persisted = False
         try:
             with SDHandler() as sd:
@@ -83,7 +83,9 @@ class SaveFile(Page):
                             self.ctx.display.draw_centered_text(t("Processing…"))
 
                             # Now save the file
-                            if save_as_binary:
+                            if not isinstance(data, (bytes, bytearray, str)):
+                                sd.write_chunks(new_filename, data)
+                            elif save_as_binary:
                                 sd.write_binary(new_filename, data)
                             else:
                                 sd.write(new_filename, data)
@@ -30,6 +30,7 @@ from ..krux_settings import t
 from ..display import BOTTOM_LINE, MINIMAL_PADDING
 from ..wdt import wdt
 from ..firmware import FLASH_SIZE
+from ..flash_blocks import flash_blocks
 from ..camera import ENTROPY_MODE
 from ..kboard import kboard
 
@@ -75,7 +76,6 @@ class FillFlash(Page):
             TOTAL_BLOCKS + display_width - 1
         ) // display_width  # Ceiling division
 
-        empty_buf = b"\xff" * BLOCK_SIZE
         img_bytes = b""
         block_count = 0
         offset_x = (display_width - (TOTAL_BLOCKS // blocks_per_line)) // 2
@@ -105,8 +105,10 @@ class FillFlash(Page):
             chunk = img_bytes[start:end]
 
             try:
-                if flash.read(address, BLOCK_SIZE) == empty_buf:
+                # Blocks known as erased are read again, files may be there now
+                if flash_blocks.is_erased(address, verify=True):
                     flash.write(address, chunk)
+                    flash_blocks.mark_written(address)
                     chunk_index += 1
                     line_color = theme.highlight_color
             except Exception:
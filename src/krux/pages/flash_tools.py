@@ -34,6 +34,9 @@ from ..firmware import (
 from ..kboard import kboard
 
 BLOCK_SIZE = 0x1000
+# Flash is hashed in chunks of several blocks, sparing read calls
+HASH_CHUNK_SIZE = 16 * BLOCK_SIZE
+PROGRESS_INTERVAL_MS = 250
 FLASH_ROWS = 64
 
 
@@ -55,13 +58,12 @@ class FlashTools(Page):
 
     def flash_map(self):
         """Load the flash map page"""
-        import flash
         import image
+        from ..flash_blocks import flash_blocks
 
         image_block_size = self.ctx.display.width() // FLASH_ROWS
         if self.ctx.display.width() >= self.ctx.display.height():
             image_block_size -= 1
-        empty_buf = b"\xff" * BLOCK_SIZE
         column, row = 0, 0
         offset_x = (self.ctx.display.width() - (image_block_size * FLASH_ROWS)) // 2
         offset_y = DEFAULT_PADDING + 2 * FONT_HEIGHT
@@ -119,7 +121,7 @@ class FlashTools(Page):
         for address in range(0, FLASH_SIZE, BLOCK_SIZE):
             wdt.feed()
             color = theme.highlight_color if address < SPIFFS_ADDR else theme.fg_color
-            if flash.read(address, BLOCK_SIZE) == empty_buf:
+            if flash_blocks.is_erased(address):
                 color = theme.disabled_color
             # Draw the block
             mem_bar.draw_rectangle(
@@ -173,13 +175,15 @@ class FlashTools(Page):
         """Erase all SPIFFS, removing all saved configs and mnemonics"""
 
         import flash
+        from ..flash_blocks import flash_blocks
 
-        empty_buf = b"\xff" * ERASE_BLOCK_SIZE
         for address in range(SPIFFS_ADDR, FLASH_SIZE, ERASE_BLOCK_SIZE):
             wdt.feed()
-            if flash.read(address, ERASE_BLOCK_SIZE) == empty_buf:
+            # A wipe reads known erased blocks again rather than trust the bitmap
+            if flash_blocks.is_erased(address, verify=True):
                 continue
             flash.erase(address, ERASE_BLOCK_SIZE)
+            flash_blocks.mark_erased(address)
 
     def erase_users_data(self):
         """Fully formats SPIFFS memory"""
@@ -211,35 +215,40 @@ class FlashHash(Page):
         self.tc_code_hash = tc_code_hash
         self.image_block_size = self.ctx.display.width() // 7
 
-    def hash_pin_with_flash(self, spiffs_region=False):
-        """Hashes the tamper check code, unique ID, and flash memory together."""
+    def hash_pin_with_flash(self):
+        """Hashes the tamper check code and unique ID with the firmware region,
+        then with the SPIFFS region, in a single pass over the flash memory.
+        """
+        import time
         import uhashlib_hw
         import flash
         from machine import unique_id
 
-        counter = SPIFFS_ADDR // BLOCK_SIZE if spiffs_region else 0
-        range_begin = SPIFFS_ADDR if spiffs_region else 0
-        range_end = FLASH_SIZE if spiffs_region else SPIFFS_ADDR
         percentage_offset = (
             DEFAULT_PADDING + 3 * FONT_HEIGHT + self.image_block_size * 5
         )
         if self.ctx.display.width() < self.ctx.display.height():
             percentage_offset += FONT_HEIGHT
         uid = unique_id()
-        sha256 = uhashlib_hw.sha256()
-        sha256.update(self.tc_code_hash)
-        sha256.update(uid)
-        for address in range(range_begin, range_end, BLOCK_SIZE):
-            counter += 1
-            data = flash.read(address, BLOCK_SIZE)
-            sha256.update(data)
-            if counter % 200 == 0:
-                # Update progress
-                self.ctx.display.draw_hcentered_text(
-                    "%d%%" % (counter // 41), percentage_offset
+        hashes = []
+        next_progress = time.ticks_ms()
+        for range_begin, range_end in ((0, SPIFFS_ADDR), (SPIFFS_ADDR, FLASH_SIZE)):
+            sha256 = uhashlib_hw.sha256()
+            sha256.update(self.tc_code_hash)
+            sha256.update(uid)
+            for address in range(range_begin, range_end, HASH_CHUNK_SIZE):
+                sha256.update(
+                    flash.read(address, min(HASH_CHUNK_SIZE, range_end - address))
                 )
                 wdt.feed()
-        return sha256.digest()
+                if time.ticks_ms() >= next_progress:
+                    # Update progress
+                    self.ctx.display.draw_hcentered_text(
+                        "%d%%" % (address * 100 // FLASH_SIZE), percentage_offset
+                    )
+                    next_progress = time.ticks_ms() + PROGRESS_INTERVAL_MS
+            hashes.append(sha256.digest())
+        return hashes[0], hashes[1]
 
     def hash_to_random_color(self, hash_bytes):
         """Generates a random color from part of the hash."""
@@ -301,7 +310,7 @@ class FlashHash(Page):
         """Generates the Tamper Check Flash Hash snapshot."""
         self.ctx.display.clear()
         self.ctx.display.draw_hcentered_text(t("Processing…"))
-        firmware_hash = self.hash_pin_with_flash()
+        firmware_hash, spiffs_hash = self.hash_pin_with_flash()
         self.ctx.display.clear()
         self.ctx.display.draw_hcentered_text("TC Flash Hash")
         y_offset = DEFAULT_PADDING + 2 * FONT_HEIGHT
@@ -316,7 +325,6 @@ class FlashHash(Page):
             )
             * FONT_HEIGHT
         )
-        spiffs_hash = self.hash_pin_with_flash(spiffs_region=True)
         anti_tamper_words = self.hash_to_words(spiffs_hash)
         self.ctx.display.draw_hcentered_text(anti_tamper_words, y_offset)
         self.ctx.input.reset_ios_state()
@@ -345,14 +345,11 @@ class Addresses(Page):
                     checking_match_txt
                     % (num_checked, num_checked + SCAN_ADDRESS_LIMIT - 1)
                 )
-                for some_addr in self.ctx.wallet.obtain_addresses(
-                    num_checked, limit=SCAN_ADDRESS_LIMIT, branch_index=addr_type
-                ):
-                    num_checked += 1
-
-                    found = addr == some_addr
-                    if found:
-                        break
+                index = self.ctx.wallet.find_address(
+                    addr, num_checked + SCAN_ADDRESS_LIMIT, branch_index=addr_type
+                )
+                found = index is not None
+                num_checked = index + 1 if found else num_checked + SCAN_ADDRESS_LIMIT
 
                 gc.collect()
 
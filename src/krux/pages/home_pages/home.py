@@ -244,11 +244,12 @@ class Home(Page):
         return (None, FORMAT_NONE, psbt_filename)
 
     def _sign_menu(self, signer, psbt_filename, outputs):
+        is_stream = signer.is_stream
         submenu = Menu(
             self.ctx,
             [
                 (t("Review Again"), lambda: None),
-                (t("Sign to QR code"), lambda: None),
+                (t("Sign to QR code"), None if is_stream else lambda: None),
                 (
                     t("Sign to SD card"),
                     None if not self.has_sd_card() else lambda: None,
@@ -295,6 +296,9 @@ class Home(Page):
                     return MENU_CONTINUE
 
         # index == 2: Sign to SD card
+        if is_stream:
+            return self._sign_stream_to_sd(signer, psbt_filename)
+
         signer.sign(trim=False)
         psbt_filename = self._format_psbt_file_extension(psbt_filename)
         gc.collect()
@@ -321,6 +325,26 @@ class Home(Page):
 
         return MENU_CONTINUE
 
+    def _sign_stream_to_sd(self, signer, psbt_filename):
+        """Signs a PSBT too large for memory straight into a file on the SD card"""
+        from ...sd_card import SDHandler
+
+        psbt_filename = self._format_psbt_file_extension(psbt_filename)
+        if psbt_filename and psbt_filename != ESC_KEY:
+            self.ctx.display.clear()
+            self.ctx.display.draw_centered_text(t("Signing…"))
+            try:
+                with SDHandler():
+                    signer.sign_to_file(psbt_filename)
+                    self.flash_text(
+                        t("Saved to SD card:") + "\n\n%s" % psbt_filename,
+                        highlight_prefix=":",
+                    )
+            except OSError:
+                self.flash_error(t("SD card not detected."))
+
+        return MENU_CONTINUE
+
     def _format_psbt_file_extension(self, psbt_filename=""):
         """Formats the PSBT filename"""
         from ...sd_card import (
@@ -494,9 +518,17 @@ class Home(Page):
         self.ctx.display.draw_centered_text(t("Loading…"))
 
         qr_format = FORMAT_PMOFN if qr_format == FORMAT_NONE else qr_format
-        from ...psbt import PSBTSigner
+        signer = None
+        if psbt_filename:
+            from ...psbt_stream import PSBTStreamSigner
+
+            if PSBTStreamSigner.is_streamable(psbt_filename):
+                # Too large to be parsed at once, will be signed scope by scope
+                signer = PSBTStreamSigner(self.ctx.wallet, psbt_filename)
+        if signer is None:
+            from ...psbt import PSBTSigner
 
-        signer = PSBTSigner(self.ctx.wallet, data, qr_format, psbt_filename)
+            signer = PSBTSigner(self.ctx.wallet, data, qr_format, psbt_filename)
 
         # memory management
         del data
@@ -334,13 +334,14 @@ class SignMessage(Utils):
 
         save_page = SaveFile(self.ctx)
         if address:
-            file_content = ""
-            file_content = SD_MESSAGE_HEADER + "\n"
-            file_content += message + "\n"
-            file_content += SD_SIGNATURE_HEADER + "\n"
-            file_content += address + "\n"
-            file_content += base_encode(sig, 64) + "\n"
-            file_content += SD_SIGNATURE_FOOTER
+            file_content = (
+                SD_MESSAGE_HEADER + "\n",
+                message,
+                "\n" + SD_SIGNATURE_HEADER + "\n",
+                address + "\n",
+                base_encode(sig, 64) + "\n",
+                SD_SIGNATURE_FOOTER,
+            )
         else:
             file_content = sig
         extension = ".txt" if address else SIGNATURE_FILE_EXTENSION
@@ -21,7 +21,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-import sys
 from embit.networks import NETWORKS
 from . import (
     Menu,
@@ -49,6 +48,7 @@ from ..key import (
 )
 from ..krux_settings import t
 from ..kboard import kboard
+from ..residency import residency
 
 DOUBLE_MNEMONICS_MAX_TRIES = 200
 MASK256 = (1 << 256) - 1
@@ -343,15 +343,15 @@ class Login(MnemonicLoader):
 
     def tools(self):
         """Handler for the 'Tools' menu item"""
-        from .tools import Tools
+        tools = residency.load("krux.pages.tools")
 
         while True:
-            if Tools(self.ctx).run() == MENU_EXIT:
+            if tools.Tools(self.ctx).run() == MENU_EXIT:
                 break
 
-        # Unimport tools
-        sys.modules.pop("krux.pages.tools")
-        del sys.modules["krux.pages"].tools
+        # Keep tools while the residency budget allows
+        del tools
+        residency.release("krux.pages.tools")
 
         return MENU_CONTINUE
 
@@ -26,7 +26,7 @@ from . import Page, Menu, MENU_CONTINUE, MENU_EXIT, ESC_KEY
 from ..themes import theme, WHITE, BLACK, DARKGREY
 from ..krux_settings import t
 from ..settings import THIN_SPACE
-from ..qr import get_size
+from ..qr import get_size, get_row, raster_rows
 from ..display import DEFAULT_PADDING, FONT_HEIGHT, M5STICKV_WIDTH
 from ..input import (
     BUTTON_ENTER,
@@ -291,44 +291,27 @@ class SeedQRView(Page):
     def add_frame(self, binary_image, size):
         """Adds a 1 block frame to QR codes"""
         new_size = size + 2
-        # Create a new bytearray to store the framed image
-        framed_image = bytearray(b"\x00" * ((new_size * new_size + 7) >> 3))
-        # Copy the original image into the center of the framed image
-        for y in range(0, size):
-            for x in range(0, size):
-                original_index = y * size + x
-                original_bit = (
-                    binary_image[original_index >> 3] >> (original_index % 8)
-                ) & 1
-                if original_bit:
-                    framed_index = (y + 1) * new_size + x + 1
-                    framed_image[framed_index >> 3] |= 1 << (framed_index % 8)
-
-        return framed_image, new_size
+        # Shift each original row into the center of the framed image
+        framed_image = 0
+        for y in range(size):
+            framed_image |= get_row(binary_image, size, y) << ((y + 1) * new_size + 1)
+        framed_image = framed_image.to_bytes((new_size * new_size + 7) >> 3, "little")
+        return bytearray(framed_image), new_size
+
+    def _pbm_chunks(self):
+        """Yields the framed PBM image, one packed row at a time"""
+        yield "P4\n{0} {0}\n".format(self.qr_size + 2).encode()
+        for packed, _ in raster_rows(self.code, self.qr_size, border=1):
+            yield packed
 
     def save_pbm_image(self, file_name):
         """Saves QR code image as compact B&W bitmap format file"""
         from ..sd_card import PBM_IMAGE_EXTENSION
         from .file_operations import SaveFile
 
-        code, size = self.add_frame(self.code, self.qr_size)
-        pbm_data = bytearray()
-        pbm_data.extend(("P4\n{0} {0}\n".format(size)).encode())
-        for row in range(size):
-            byte = 0
-            for col in range(size):
-                bit_index = row * size + col
-                if code[bit_index >> 3] & (1 << (bit_index % 8)):
-                    byte |= 1 << (7 - (col % 8))
-
-                # If we filled a byte or reached the end of the row, append it
-                if col % 8 == 7 or col == size - 1:
-                    pbm_data.append(byte)
-                    byte = 0
-
         save_page = SaveFile(self.ctx)
         save_page.save_file(
-            pbm_data,
+            self._pbm_chunks(),
             file_name,
             file_extension=PBM_IMAGE_EXTENSION,
             save_as_binary=True,
@@ -348,25 +331,23 @@ class SeedQRView(Page):
                 self.ctx.display.clear()
                 self.ctx.display.draw_centered_text(t("Processing…"))
 
-                code, size = self.add_frame(self.code, self.qr_size)
-                raw_image = image.Image(size=(size, size))
-                for y_index in range(0, size):
-                    for x_index in range(0, size):
-                        index = y_index * size + x_index
-                        bit_value = (code[index >> 3] >> (index % 8)) & 1
-                        if bit_value:
-                            raw_image.set_pixel((x_index, y_index), lcd.BLACK)
-                        else:
-                            raw_image.set_pixel((x_index, y_index), lcd.WHITE)
+                scale = resolution // (self.qr_size + 2)
                 bmp_img = image.Image(size=(resolution, resolution), copy_to_fb=True)
-                scale = resolution // size
-                bmp_img.draw_image(
-                    raw_image,
-                    0,
-                    0,
-                    x_scale=scale,
-                    y_scale=scale,
+                bmp_img.draw_rectangle(
+                    0, 0, resolution, resolution, lcd.WHITE, fill=True
                 )
+                # Fill each run of dark modules as a single span
+                rows = raster_rows(self.code, self.qr_size, border=1)
+                for y, (_, runs) in enumerate(rows):
+                    for x, length in runs:
+                        bmp_img.draw_rectangle(
+                            x * scale,
+                            y * scale,
+                            length * scale,
+                            scale,
+                            lcd.BLACK,
+                            fill=True,
+                        )
                 save_page = SaveFile(self.ctx)
                 new_filename = save_page.set_filename(
                     file_name, file_extension=BMP_IMAGE_EXTENSION
@@ -382,6 +363,20 @@ class SeedQRView(Page):
         except:
             self.flash_text(t("SD card not detected."))
 
+    def _svg_chunks(self, scale=10):
+        """Yields the SVG image encoded, with one path per run of dark modules"""
+        width = (self.qr_size + 2) * scale
+        yield (
+            '<svg xmlns="http://www.w3.org/2000/svg" width="{0}" height="{0}">\n'
+        ).format(width).encode()
+        rows = raster_rows(self.code, self.qr_size, border=1)
+        for y, (_, runs) in enumerate(rows):
+            for x, length in runs:
+                yield '<path d="M{},{}h{}v{}h-{}z"/>\n'.format(
+                    x * scale, y * scale, length * scale, scale, length * scale
+                ).encode()
+        yield b"</svg>"
+
     def save_svg_image(self, file_name):
         """Save QR code image as .svg file"""
         from ..sd_card import SVG_IMAGE_EXTENSION
@@ -390,55 +385,10 @@ class SeedQRView(Page):
         self.ctx.display.clear()
         self.ctx.display.draw_centered_text(t("Processing…"))
 
-        code, size = self.add_frame(self.code, self.qr_size)
-
-        # Create the SVG file dynamically
-        # given the size of the QR code, the scale
-        # and the x,y coordinates of the squares
-        scale = 10
-        width = size * scale
-        height = width
-
-        # start with the SVG header
-        svg_data = (
-            '<svg xmlns="http://www.w3.org/2000/svg" width="{}" height="{}">\n'.format(
-                width, height
-            )
-        )
-
-        # create squares for each bit in the QR code
-        for y_index in range(0, size):
-            for x_index in range(0, size):
-                index = y_index * size + x_index
-                bit_value = (code[index >> 3] >> (index % 8)) & 1
-                if bit_value:
-                    x = x_index * scale
-                    y = y_index * scale
-                    scale_x = scale
-                    scale_y = scale
-                    square = 'x="{}" y="{}" width="{}" height="{}"'.format(
-                        x, y, scale_x, scale_y
-                    )
-                    svg_data += '<rect stroke="black" stroke-width="0" {} fill="black"/>\n'.format(
-                        square
-                    )
-
-        # close the SVG tag
-        svg_data += "</svg>"
-
-        # Encode the convert svg string
-        svg_encoded = svg_data.encode("utf-8")
-
-        # memory management
-        import gc
-
-        del svg_data
-        gc.collect()
-
-        # Save the SVG data to a file
+        # Save the SVG data to a file, streamed as it is generated
         save_page = SaveFile(self.ctx)
         save_page.save_file(
-            svg_encoded,
+            self._svg_chunks(),
             file_name,
             file_extension=SVG_IMAGE_EXTENSION,
             save_as_binary=True,
@@ -31,6 +31,7 @@ from ..settings import (
     SD_PATH,
     FLASH_PATH,
     SETTINGS_FILENAME,
+    notify_flash_write,
 )
 from ..krux_settings import (
     Settings,
@@ -131,6 +132,7 @@ class SettingsPage(Page):
             try:
                 # Delete settings from flash
                 os.remove("/%s/%s" % (FLASH_PATH, SETTINGS_FILENAME))
+                notify_flash_write()
             except:
                 pass
             self.ctx.power_manager.reboot()
@@ -186,6 +188,7 @@ class SettingsPage(Page):
         # Saves the stretched Tamper Check Code in a file
         with open(TC_CODE_PATH, "wb") as f:
             f.write(secret)
+        notify_flash_write()
         self.ctx.tc_code_enabled = True
         self.flash_text(t("Tamper check code set successfully"))
 
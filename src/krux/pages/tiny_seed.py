@@ -56,6 +56,18 @@ TS_ESC_START_POSITION = TS_LAST_BIT_NO_CS + 1
 TS_ESC_END_POSITION = TS_ESC_START_POSITION + 5
 TS_GO_POSITION = TS_ESC_START_POSITION + 11
 
+# Points sampled per side of a dot, their median is the dot luminosity
+DOT_SAMPLES = 3
+
+# While tracked, the plate is searched in a window around its last position,
+# with the last threshold, and must be found within tolerance of it
+TRACKING_WINDOW_DIVISOR = 4
+TRACKING_TOLERANCE_DIVISOR = 8
+
+# A scan is confirmed when this many of the last frames read agree
+CONSENSUS_FRAMES = 2
+CONSENSUS_WINDOW = 4
+
 
 class TinySeed(Page):
     """Class for handling Tinyseed format"""
@@ -463,12 +475,16 @@ class TinyScanner(Page):
         self.capturing = False  # Flag used for first page of 24-word seed
         self.x_regions = []
         self.y_regions = []
-        self.time_frame = time.ticks_ms()
-        self.previous_seed_numbers = [1] * 12
+        self.recent_numbers = []
         self.grid_settings = self.binary_grid_settings[grid_type]
         self.label = t("Binary Grid") if grid_type == "Binary Grid" else grid_type
         self.g_corners = (0x80, 0x80, 0x80, 0x80)
-        self.blob_otsu = 0x80
+        # Last plate rectangle found and the Otsu threshold it was found with
+        self.tracking = (None, 0x80)
+        # Dots' corners in bit order and the sampled offsets inside a dot
+        self.dots = ([], [], [])
+        # Corners the punch thresholds of every dot were computed from
+        self.thresholds = (None, [])
 
     def _map_punches_region(self, rect_size, page=0):
         """Calculate x and y coordinates for punched grid regions."""
@@ -491,6 +507,37 @@ class TinyScanner(Page):
             y_offset += y_pad
             self.x_regions.append(int(round(x_offset)))
             self.y_regions.append(int(round(y_offset)))
+        self._map_dots()
+
+    def _map_dots(self):
+        """Lists dots' top left corners in bit order, and the offsets of the
+        points sampled inside each dot"""
+        corners = []
+        pad_x = self.x_regions[1] - self.x_regions[0]
+        pad_y = self.y_regions[1] - self.y_regions[0]
+        # Prepare mapping (reverse one axis based on board type)
+        y_map = self.y_regions[:-1][:]
+        x_map = self.x_regions[:-1][:]
+        if kboard.is_amigo:
+            x_map.reverse()
+        else:
+            y_map.reverse()
+        # Think in portrait mode, with Tinyseed tilted 90 degrees
+        for x in x_map:
+            for y in y_map:
+                corners.append((x, y))
+        # Evenly spread samples over the dot area, 2px away from the grid
+        self.dots = (
+            corners,
+            [
+                2 + (2 * i + 1) * (pad_x - 3) // (2 * DOT_SAMPLES)
+                for i in range(DOT_SAMPLES)
+            ],
+            [
+                2 + (2 * i + 1) * (pad_y - 3) // (2 * DOT_SAMPLES)
+                for i in range(DOT_SAMPLES)
+            ],
+        )
 
     def _valid_numbers(self, data):
         for n in data:
@@ -589,8 +636,17 @@ class TinyScanner(Page):
         filtered = (grad_ul + grad_ur + grad_ll + grad_lr + 6 * gradient) // 10
         return filtered
 
+    def _threshold_map(self):
+        """Punch thresholds of all dots, recomputed only when corners change"""
+        if self.thresholds[0] != self.g_corners:
+            self.thresholds = (
+                self.g_corners,
+                [self._gradient_value(index) for index in range(144)],
+            )
+        return self.thresholds[1]
+
     def _detect_tiny_seed(self, img):
-        """Detect the Tinyseed region as a bright blob."""
+        """Detect the Tinyseed region as a bright blob, tracking it between frames."""
         aspect_low = self.grid_settings["aspect_low"]
         aspect_high = self.grid_settings["aspect_high"]
 
@@ -615,24 +671,76 @@ class TinyScanner(Page):
                         best_rect = rect
             return best_rect
 
-        try:
-            self.blob_otsu = img.get_histogram().get_threshold().value()
-        except:
-            pass
-        blob_threshold = [(self.blob_otsu, 255)]
-        blobs = img.find_blobs(
-            blob_threshold, x_stride=30, y_stride=30, area_threshold=5000
-        )
-        # Debug: Optionally draw the blobs to see them during development
-        # for blob in blobs:
-        #     img.draw_rectangle(blob.rect(), color=(255, 125 * attempts, 0), thickness=3)
-        rect = choose_rect([blob.rect() for blob in blobs])
+        tracked, blob_otsu = self.tracking
+        rect = None
+        if tracked:
+            # Search only around the last position, with the same threshold
+            rect = choose_rect(
+                [
+                    blob.rect()
+                    for blob in img.find_blobs(
+                        [(blob_otsu, 255)],
+                        roi=self._tracking_window(tracked, img),
+                        x_stride=30,
+                        y_stride=30,
+                        area_threshold=5000,
+                    )
+                ]
+            )
+            if rect and not self._within_tolerance(rect, tracked):
+                rect = None
+        if not rect:
+            # Tracking lost, search the whole frame
+            try:
+                blob_otsu = img.get_histogram().get_threshold().value()
+            except:
+                pass
+            blob_threshold = [(blob_otsu, 255)]
+            blobs = img.find_blobs(
+                blob_threshold, x_stride=30, y_stride=30, area_threshold=5000
+            )
+            # Debug: Optionally draw the blobs to see them during development
+            # for blob in blobs:
+            #     img.draw_rectangle(blob.rect(), color=(255, 125 * attempts, 0), thickness=3)
+            rect = choose_rect([blob.rect() for blob in blobs])
+        self.tracking = (rect, blob_otsu)
         if rect:
             outline = (rect[0] - 1, rect[1] - 1, rect[2] + 1, rect[3] + 1)
             thickness = 4 if self.capturing else 2
             img.draw_rectangle(outline, lcd.WHITE, thickness=thickness)
         return rect
 
+    def _tracking_window(self, rect, img):
+        """Region around the tracked rectangle where the plate is searched"""
+        margin_x = rect[2] // TRACKING_WINDOW_DIVISOR
+        margin_y = rect[3] // TRACKING_WINDOW_DIVISOR
+        x = max(rect[0] - margin_x, 0)
+        y = max(rect[1] - margin_y, 0)
+        return (
+            x,
+            y,
+            min(rect[0] + rect[2] + margin_x, img.width()) - x,
+            min(rect[1] + rect[3] + margin_y, img.height()) - y,
+        )
+
+    def _within_tolerance(self, rect, tracked):
+        """Whether the plate found is still the tracked one"""
+        tolerance_x = max(tracked[2] // TRACKING_TOLERANCE_DIVISOR, 1)
+        tolerance_y = max(tracked[3] // TRACKING_TOLERANCE_DIVISOR, 1)
+        return (
+            abs(rect[0] - tracked[0]) <= tolerance_x
+            and abs(rect[2] - tracked[2]) <= tolerance_x
+            and abs(rect[1] - tracked[1]) <= tolerance_y
+            and abs(rect[3] - tracked[3]) <= tolerance_y
+        )
+
+    def _consensus(self, page_seed_numbers):
+        """Buffers a frame's numbers, True once enough recent frames agree"""
+        self.recent_numbers.append(page_seed_numbers)
+        if len(self.recent_numbers) > CONSENSUS_WINDOW:
+            self.recent_numbers.pop(0)
+        return self.recent_numbers.count(page_seed_numbers) >= CONSENSUS_FRAMES
+
     def _draw_grid(self, img):
         if not kboard.has_minimal_display:
             for i in range(13):
@@ -654,49 +762,35 @@ class TinyScanner(Page):
     def _detect_and_draw_punches(self, img):
         """Detect punched bits on the grid and update the seed numbers accordingly."""
         page_seed_numbers = [0] * 12
-        index = 0
         pad_x = self.x_regions[1] - self.x_regions[0]
         pad_y = self.y_regions[1] - self.y_regions[0]
         if pad_x < 4 or pad_y < 4:
             return page_seed_numbers
 
-        # Prepare mapping (reverse one axis based on board type)
-        y_map = self.y_regions[:-1][:]
-        x_map = self.x_regions[:-1][:]
-        if kboard.is_amigo:
-            x_map.reverse()
-        else:
-            y_map.reverse()
-        # Think in portrait mode, with Tinyseed tilted 90 degrees
         # Loop ahead will sweep TinySeed bits/dots and evaluate its luminosity
-        for x in x_map:
-            for y in y_map:
-                eval_rect = (x + 2, y + 2, pad_x - 3, pad_y - 3)
-                dot_l = img.get_statistics(roi=eval_rect).median()
-
-                # # Debug gradient
-                # if index == 0:
-                #     img.draw_string(10,10,"0:"+str(gradient_ref))
-                # if index == 11:
-                #     img.draw_string(10,25,"11:"+str(gradient_ref))
-                # if index == 132:
-                #     img.draw_string(70,10,"132:"+str(gradient_ref))
-                # if index == 143:
-                #     img.draw_string(70,25,"143:"+str(gradient_ref))
-
-                # Defines a threshold to evaluate if the dot is considered punched
-                punch_threshold = self._gradient_value(index)
-                punch_thickness = 1 if not kboard.has_minimal_display else 2
-                if dot_l < punch_threshold:
-                    img.draw_rectangle(
-                        eval_rect, thickness=punch_thickness, color=lcd.WHITE
-                    )
-                    word_index = index // 12
-                    bit = 11 - (index % 12)
-                    page_seed_numbers[word_index] = toggle_bit(
-                        page_seed_numbers[word_index], bit
-                    )
-                index += 1
+        # sampling a few points of each dot, instead of a statistics per dot
+        thresholds = self._threshold_map()
+        corners, samples_x, samples_y = self.dots
+        median_index = len(samples_x) * len(samples_y) // 2
+        get_pixel = img.get_pixel
+        punch_thickness = 1 if not kboard.has_minimal_display else 2
+        for index, (x, y) in enumerate(corners):
+            dot_l = sorted(
+                get_pixel(x + dx, y + dy) for dx in samples_x for dy in samples_y
+            )[median_index]
+
+            # Defines a threshold to evaluate if the dot is considered punched
+            if dot_l < thresholds[index]:
+                img.draw_rectangle(
+                    (x + 2, y + 2, pad_x - 3, pad_y - 3),
+                    thickness=punch_thickness,
+                    color=lcd.WHITE,
+                )
+                word_index = index // 12
+                bit = 11 - (index % 12)
+                page_seed_numbers[word_index] = toggle_bit(
+                    page_seed_numbers[word_index], bit
+                )
         return page_seed_numbers
 
     def _run_camera(self):
@@ -728,7 +822,7 @@ class TinyScanner(Page):
         if check_sum_bg(page_seed_numbers) == (
             (page_seed_numbers[11] - 1) & 0b00000001111
         ):
-            if page_seed_numbers == self.previous_seed_numbers:
+            if self._consensus(page_seed_numbers):
                 self._exit_camera()
                 self.ctx.display.draw_centered_text(
                     t("Review scanned data, edit if necessary")
@@ -744,13 +838,11 @@ class TinyScanner(Page):
                     t("Scanning words 1-12 again") + "\n\n" + t("Wait for the capture")
                 )
                 self._run_camera()
-                self.previous_seed_numbers = [1] * 12
-            else:
-                self.previous_seed_numbers = page_seed_numbers
+                self.recent_numbers = []
         return None
 
     def _process_24w_pg0_scan(self, page_seed_numbers):
-        if page_seed_numbers == self.previous_seed_numbers and self.capturing:
+        if self._consensus(page_seed_numbers) and self.capturing:
             self.ctx.input.reset_ios_state()
             self._exit_camera()
             self.ctx.display.draw_centered_text(
@@ -767,14 +859,14 @@ class TinyScanner(Page):
                     t("Scanning words 13-24") + "\n\n" + t("Wait for the capture")
                 )
                 self._run_camera()
+                self.recent_numbers = []
                 return words
             # Esc command was given
             self.flash_text(
                 t("Scanning words 1-12 again") + "\n\n" + t("TOUCH or ENTER to capture")
             )
             self._run_camera()
-        else:
-            self.previous_seed_numbers = page_seed_numbers
+            self.recent_numbers = []
         return None
 
     def scanner(self, w24=False):
@@ -782,7 +874,7 @@ class TinyScanner(Page):
         page = 0
         if w24:
             w24_seed_numbers = [0] * 24
-        self.previous_seed_numbers = [1] * 12
+        self.recent_numbers = []
 
         self.ctx.display.clear()
         message = (
@@ -830,10 +922,9 @@ class TinyScanner(Page):
                         if check_sum_bg(w24_seed_numbers) == (
                             (w24_seed_numbers[23] - 1) & 0b00011111111
                         ):
-                            if page_seed_numbers == self.previous_seed_numbers:
+                            if self._consensus(page_seed_numbers):
                                 self._exit_camera()
                                 return to_words(w24_seed_numbers)
-                            self.previous_seed_numbers = page_seed_numbers
                 else:
                     words = self._process_12w_scan(page_seed_numbers)
                     if words:
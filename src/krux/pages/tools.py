@@ -32,6 +32,7 @@ from . import (
     # NUM_SPECIAL_2,
 )
 from ..krux_settings import t
+from ..residency import residency
 
 # TODO: re-enable "Create a QR Code" (and keypads ^^^) once encryption is possible w/o Datum Tool
 
@@ -78,15 +79,14 @@ class Tools(Page):
 
     def datum_tool(self):
         """Handler for the 'Datum Tool' menu item"""
-        import sys
-        from .datum_tool import DatumToolMenu
+        datum_tool = residency.load("krux.pages.datum_tool")
 
         while True:
-            if DatumToolMenu(self.ctx).run() == MENU_EXIT:
+            if datum_tool.DatumToolMenu(self.ctx).run() == MENU_EXIT:
                 break
 
-        sys.modules.pop("krux.pages.datum_tool")
-        del sys.modules["krux.pages"].datum_tool
+        del datum_tool
+        residency.release("krux.pages.datum_tool")
         return MENU_CONTINUE
 
     # def create_qr(self):
@@ -122,11 +122,10 @@ class Tools(Page):
 
     def device_tests(self):
         """Handler for the 'Device Tests' menu item"""
-        import sys
-        from .device_tests import DeviceTests
+        device_tests = residency.load("krux.pages.device_tests")
 
-        page = DeviceTests(self.ctx)
+        page = device_tests.DeviceTests(self.ctx)
         page.run()
-        sys.modules.pop("krux.pages.device_tests")
-        del sys.modules["krux.pages"].device_tests
+        del page, device_tests
+        residency.release("krux.pages.device_tests")
         return MENU_CONTINUE
@@ -33,6 +33,54 @@ G0_Z = "G0 Z%.4f"
 G1_XY = "G1 X%.4f Y%.4f F%.1f"
 G1_Z = "G1 Z%.4f F%.1f"
 
+CUT_METHOD_RUNS = "runs"
+
+# GRBL's serial receive buffer, lines in flight must fit in it
+GRBL_RX_BUFFER_SIZE = 128
+GRBL_RESPONSE_TIMEOUT_MS = 10000
+GRBL_POLL_MS = 1
+
+
+class GCodeStats:
+    """Tallies the size of emitted gcode and the moves it makes, to estimate
+    machining time without a machine
+    """
+
+    def __init__(self):
+        self.lines = 0
+        self.size = 0
+        self.position = [0.0, 0.0, 0.0]
+        self.feed_rate = 0.0
+        self.cut_distance = 0.0
+        self.rapid_distance = 0.0
+        self.cut_minutes = 0.0
+
+    def add(self, gcode):
+        """Accounts for one line of gcode"""
+        self.lines += 1
+        self.size += len(gcode) + 1
+        words = gcode.split()
+        if not words or words[0] not in ("G0", "G1"):
+            return
+        target = list(self.position)
+        for word in words[1:]:
+            axis = "XYZ".find(word[0])
+            if axis >= 0:
+                target[axis] = float(word[1:])
+            elif word[0] == "F":
+                self.feed_rate = float(word[1:])
+        distance = math.sqrt(sum((a - b) ** 2 for a, b in zip(target, self.position)))
+        self.position = target
+        if words[0] == "G0":
+            self.rapid_distance += distance
+        elif self.feed_rate:
+            self.cut_distance += distance
+            self.cut_minutes += distance / self.feed_rate
+
+    def estimated_minutes(self, rapid_rate):
+        """Machining time, in minutes, if rapid moves run at rapid_rate"""
+        return self.cut_minutes + self.rapid_distance / rapid_rate
+
 
 class GCodeGenerator(Printer):
     """GCodeGenerator takes QR codes and emits gcode via the on_gcode method which
@@ -124,36 +172,106 @@ class GCodeGenerator(Printer):
             self.on_gcode("$32=1")  # enable laser mode
             self.on_gcode("M4")  # enable Dynamic Laser Power Mode
 
+        cut_rows = self.cut_rows(qr_code, size)
+        runs = Settings().hardware.printer.cnc.cut_method == CUT_METHOD_RUNS
         num_passes = math.ceil(self.cut_depth / self.pass_depth)
         for p in range(num_passes):
-            for row in range(size):
+            plunge_depth = min((p + 1) * self.pass_depth, self.cut_depth)
+            if runs:
+                self.cut_runs(cut_rows, size, cell_size, plunge_depth)
+                continue
+            for row, cut_row in enumerate(cut_rows):
+                # Reversing row so milling goes from top to bottom
+                reversed_row = size - 1 - row
                 for col in range(size):
-                    plunge_depth = min((p + 1) * self.pass_depth, self.cut_depth)
-                    # Reversing row so milling goes from top to bottom
-                    reversed_row = size - 1 - row
-                    if self.invert and row == 0:
+                    if (cut_row >> col) & 1:
                         self.cut_cell(col, reversed_row, cell_size, plunge_depth)
-                    elif self.invert and row == (size - 1):
-                        self.cut_cell(col, 0, cell_size, plunge_depth)
-                    elif self.invert and col == 0:
-                        self.cut_cell(0, reversed_row, cell_size, plunge_depth)
-                    elif self.invert and col == (size - 1):
-                        self.cut_cell(size - 1, reversed_row, cell_size, plunge_depth)
+
+    def cut_rows(self, qr_code, size):
+        """Returns the cells to cut as one int per row, from top to bottom,
+        with bit col set when the cell at col must be cut"""
+        from ..qr import get_row
+
+        if not self.invert:
+            return [get_row(qr_code, size, row) for row in range(size)]
+
+        # Inverted codes cut the light cells, framed by a border of cut cells
+        full_row = (1 << size) - 1
+        border = 1 | (1 << (size - 1))
+        rows = [full_row]
+        for row in range(size - 2):
+            rows.append((~get_row(qr_code, size - 2, row) << 1) & full_row | border)
+        rows.append(full_row)
+        return rows
+
+    def cut_runs(self, cut_rows, size, cell_size, plunge_depth):
+        """Cuts each horizontal run of cells as a single pocket, in serpentine
+        order, staying down when moving into a run of the next row that touches
+        the previous one. Needs a bit that cuts sideways, not a drill
+        """
+        flute_radius = self.flute_diameter / 2
+        num_lines = math.floor(cell_size / flute_radius)
+        # Row, first and last columns and x limits of the last run cut
+        last_run = None
+        tool_x = tool_y = 0
+        for row, cut_row in enumerate(cut_rows):
+            runs = []
+            col = 0
+            while col < size:
+                if (cut_row >> col) & 1:
+                    start = col
+                    while col < size and (cut_row >> col) & 1:
+                        col += 1
+                    runs.append((start, col))
+                col += 1
+            # Every other row is cut right to left, to shorten rapid moves
+            reverse = row % 2 == 1
+            if reverse:
+                runs.reverse()
+            y = size - 1 - row
+            for start, end in runs:
+                left = self.border_padding + start * cell_size + flute_radius
+                right = self.border_padding + end * cell_size - flute_radius
+                bottom = self.border_padding + y * cell_size + flute_radius
+                entry_x, exit_x = (right, left) if reverse else (left, right)
+                if (
+                    last_run is not None
+                    and last_run[0] == row - 1
+                    and start < last_run[2]
+                    and end > last_run[1]
+                ):
+                    # Feed down through the columns shared with the last run
+                    shared_x = min(max(tool_x, left, last_run[3]), right, last_run[4])
+                    self.on_xy_gcode(G1_XY % (shared_x, tool_y, self.feed_rate))
+                    self.on_xy_gcode(G1_XY % (shared_x, bottom, self.feed_rate))
+                    self.on_xy_gcode(G1_XY % (entry_x, bottom, self.feed_rate))
+                else:
+                    if last_run is None:
+                        # Lift the bit
+                        self.on_z_gcode(G0_Z % self.pass_depth)
                     else:
-                        # If inverted we need to calculate based on original qr code array size.
-                        if self.invert:
-                            bit_index = (row - 1) * (size - 2) + (col - 1)
-                        else:
-                            bit_index = row * size + col
-                        bit = qr_code[bit_index >> 3] & (1 << (bit_index % 8))
-                        cut = (bit > 0 and not self.invert) or (
-                            bit == 0 and self.invert
-                        )
-                        if cut:
-                            self.cut_cell(col, reversed_row, cell_size, plunge_depth)
-
-    # We could optimize by milling rows instead of cell by cell,
-    # but this would not allow the use of drill bits
+                        # Smoothly lift the bit
+                        self.on_z_gcode(G1_Z % (self.pass_depth, self.plunge_rate))
+                    # Rapid position to the run corner, then smoothly plunge
+                    self.on_gcode(G0_XY % (entry_x, bottom))
+                    self.on_z_gcode(G1_Z % (0, self.plunge_rate))
+                    self.on_z_gcode(G1_Z % (-plunge_depth, self.plunge_rate))
+
+                # Cut line by line along the run, alternating direction
+                for j in range(num_lines):
+                    tool_y = bottom + j * flute_radius
+                    line = (entry_x, exit_x) if j % 2 == 0 else (exit_x, entry_x)
+                    self.on_xy_gcode(G1_XY % (line[0], tool_y, self.feed_rate))
+                    self.on_xy_gcode(G1_XY % (line[1], tool_y, self.feed_rate))
+                    tool_x = line[1]
+                last_run = (row, start, end, left, right)
+
+        if last_run is not None:
+            # Smoothly lift the bit
+            self.on_z_gcode(G1_Z % (self.pass_depth, self.plunge_rate))
+
+    # Cutting cell by cell allows the use of drill bits, the "runs" cut method
+    # mills whole rows instead, see cut_runs
     def cut_cell(self, x, y, cell_size, plunge_depth):
         """Hollows out the specified cell using a cutting method defined in settings"""
         if Settings().hardware.printer.cnc.cut_method == "spiral":
@@ -298,18 +416,36 @@ class FilePrinter(GCodeGenerator):
     def __init__(self):
         super().__init__()
         self.file = None
+        self.stats = None
 
     def on_gcode(self, gcode):
         """Writes each gcode command on a new line in the file"""
         wdt.feed()
+        self.stats.add(gcode)
         self.file.write(gcode + "\n")
 
+    def write_report(self):
+        """Appends the gcode size and estimated machining time as comments"""
+        stats = self.stats
+        self.file.write("(%d lines, %d bytes)\n" % (stats.lines, stats.size))
+        self.file.write(
+            "(cut %.1f%s, rapid %.1f%s)\n"
+            % (stats.cut_distance, self.unit, stats.rapid_distance, self.unit)
+        )
+        # Rapid rates depend on the machine, assume the slowest: the feed rate
+        self.file.write(
+            "(estimated %.1f min, rapids at feed rate)\n"
+            % stats.estimated_minutes(self.feed_rate)
+        )
+
     def print_qr_code(self, qr_code):
         """Creates an nc file on the SD card with commands to cut out the specified QR code"""
         try:
             with SDHandler():
                 self.file = open(SDHandler.PATH_STR % FilePrinter.CNC_FILENAME, "w")
+                self.stats = GCodeStats()
                 super().print_qr_code(qr_code)
+                self.write_report()
         except:
             raise ValueError("SD card not detected.")
         finally:
@@ -385,9 +521,19 @@ class GRBLPrinter(GCodeGenerator):
 
         self.byte_time = 11.0 / float(Settings().hardware.printer.cnc.grbl.baudrate)
 
+        # Character-counting streaming: lengths of the lines sent but not yet
+        # acknowledged, and the partial response received so far
+        self.streaming = True
+        self.in_flight = []
+        self.in_flight_size = 0
+        self.received = b""
+
     def print_qr_code(self, qr_code):
 
         res = self.uart_conn.read()
+        self.in_flight = []
+        self.in_flight_size = 0
+        self.received = b""
 
         gcode = "$I"
         self.write_bytes(*((gcode + "\n").encode()))
@@ -407,8 +553,13 @@ class GRBLPrinter(GCodeGenerator):
                     statuses[0]
                 )
             )
+        if "ok" not in [status.strip() for status in statuses]:
+            # $I is acknowledged after the read, its "ok" is still on the way
+            self.in_flight.append(len(gcode) + 1)
+            self.in_flight_size += len(gcode) + 1
 
         super().print_qr_code(qr_code)
+        self.drain()
 
     def transmit(self, gcode):
         """Sometimes a command is send but seems ignored, we wait 1s and retry in that case"""
@@ -422,6 +573,48 @@ class GRBLPrinter(GCodeGenerator):
 
         raise TimeoutError("Timeout while waiting for response from GRBL")
 
+    def stream(self, gcode):
+        """Sends a line as soon as it fits in GRBL's receive buffer, without
+        waiting for the lines before it to be acknowledged"""
+        line = (gcode + "\n").encode()
+        if len(line) > GRBL_RX_BUFFER_SIZE:
+            raise ValueError("G-code line exceeds GRBL receive buffer")
+        while self.in_flight_size + len(line) > GRBL_RX_BUFFER_SIZE:
+            self.acknowledge()
+        self.uart_conn.write(line)
+        self.in_flight.append(len(line))
+        self.in_flight_size += len(line)
+
+    def acknowledge(self):
+        """Waits for GRBL to acknowledge the oldest line in flight"""
+        start = time.ticks_ms()
+        while True:
+            if b"\n" in self.received:
+                line, self.received = self.received.split(b"\n", 1)
+                line = line.strip()
+                if line == b"ok" or line.startswith(b"error:"):
+                    if self.in_flight:
+                        self.in_flight_size -= self.in_flight.pop(0)
+                    if line == b"ok":
+                        return
+                if line.startswith(b"error:") or line.startswith(b"ALARM:"):
+                    raise ValueError("GRBL replied {}".format(line.decode()))
+                # Other messages ([MSG:...], <status>) don't acknowledge lines
+                continue
+            if time.ticks_diff(time.ticks_ms(), start) > GRBL_RESPONSE_TIMEOUT_MS:
+                raise TimeoutError("Timeout while waiting for response from GRBL")
+            res = self.uart_conn.read()
+            if res:
+                self.received += res
+            else:
+                wdt.feed()
+                time.sleep_ms(GRBL_POLL_MS)
+
+    def drain(self):
+        """Waits until every streamed line has been acknowledged"""
+        while self.in_flight:
+            self.acknowledge()
+
     def write_bytes(self, *args):
         """Writes bytes to the controller at a stable speed"""
         for arg in args:
@@ -437,6 +630,14 @@ class GRBLPrinter(GCodeGenerator):
         """Sends the gcode command to GRBL"""
         wdt.feed()
 
+        if self.streaming:
+            if not gcode.startswith("$"):
+                self.stream(gcode)
+                return None
+            # GRBL stalls its serial input while writing $ settings to EEPROM,
+            # so they are sent alone, once every streamed line is acknowledged
+            self.drain()
+
         res = self.transmit(gcode)
 
         return res.decode().split("\n")[0]
@@ -46,6 +46,26 @@ from ..krux_settings import Settings
 from ..wdt import wdt
 from . import Printer
 
+# Byte expansion tables by scale, see expansion_table()
+_expansion_tables = {}
+
+
+def expansion_table(scale):
+    """Returns a table mapping each byte to an int with its bits repeated scale times"""
+    table = _expansion_tables.get(scale)
+    if table is None:
+        ones = (1 << scale) - 1
+        table = []
+        for byte in range(256):
+            expanded = 0
+            for bit in range(7, -1, -1):
+                expanded <<= scale
+                if (byte >> bit) & 1:
+                    expanded |= ones
+            table.append(expanded)
+        _expansion_tables[scale] = table
+    return table
+
 
 class AdafruitPrinter(Printer):
     """AdafruitPrinter is a minimal wrapper around a serial connection to
@@ -115,7 +135,7 @@ class AdafruitPrinter(Printer):
 
     def print_qr_code(self, qr_code):
         """Prints a QR code, scaling it up as large as possible"""
-        from ..qr import get_size
+        from ..qr import get_size, raster_rows
 
         size = get_size(qr_code)
 
@@ -126,28 +146,17 @@ class AdafruitPrinter(Printer):
 
         line_bytes_size = (size * scale + 7) // 8  # amount of bytes per line
         self.set_bitmap_mode(line_bytes_size, size * scale, 3)
-        for row in range(size):
-            byte = 0
-            line_bytes = bytearray()
-            for col in range(size):
-                bit_index = row * size + col
-                bit = qr_code[bit_index >> 3] & (1 << (bit_index % 8))
-                for i in range(scale):
-                    byte <<= 1
-                    if bit:
-                        byte |= 1
-                    end_line = col == size - 1 and i == scale - 1
-                    shift_index = (col * scale + i) % 8
-                    # If we filled a byte or reached the end of the row, append it
-                    if shift_index == 7 or end_line:
-                        if end_line:
-                            # Shift pending bits if on last byte of row
-                            byte <<= 7 - shift_index
-                        line_bytes.append(byte)
-                        byte = 0
-            for _ in range(scale):
-                self.uart_conn.write(line_bytes)
-                time.sleep_ms(self.dot_print_time)
+        table = expansion_table(scale)
+        # Expanded rows carry the padding of packed bytes, trimmed off the line
+        padding = ((size + 7) // 8) * 8 * scale - line_bytes_size * 8
+        for packed, _ in raster_rows(qr_code, size):
+            expanded = 0
+            for byte in packed:
+                expanded = (expanded << (8 * scale)) | table[byte]
+            line_bytes = (expanded >> padding).to_bytes(line_bytes_size, "big")
+            # A QR row is printed as scale identical dot lines in one transfer
+            self.uart_conn.write(line_bytes * scale)
+            time.sleep_ms(self.dot_print_time * scale)
         self.feed(4)
 
     def set_bitmap_mode(self, width, height, scale_mode=1):
@@ -20,7 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 import gc
-from embit.psbt import PSBT, CompressMode
+from io import BytesIO
+from embit.psbt import PSBT, InputScope, CompressMode, ser_string
 from ur.ur import UR
 from urtypes.crypto.psbt import PSBT as URTYPE_PSBT, CRYPTO_PSBT
 from .baseconv import base_decode
@@ -40,6 +41,20 @@ BTC_SYMBOL = "₿"
 
 MAX_POLICY_COSIGNERS_DISPLAYED = 5
 
+POLICY_MEMO_SIZE = 16
+
+# Input fields a trimmed signed PSBT keeps, those embit doesn't have are skipped
+TRIMMED_INPUT_FIELDS = (
+    "non_witness_utxo",
+    "witness_utxo",
+    "partial_sigs",
+    "redeem_script",
+    "witness_script",
+    "final_scriptwitness",
+    "taproot_key_sig",
+    "taproot_sigs",
+)
+
 
 class Counter(dict):
     """Helper class for dict"""
@@ -49,99 +64,34 @@ class Counter(dict):
         return self.get(key, 0)
 
 
-class PSBTSigner:
-    """Responsible for validating and signing PSBTs"""
+class PSBTReviewer:
+    """Validates a PSBT and describes it for review, before it is signed
 
-    def __init__(self, wallet, psbt_data, qr_format, psbt_filename=None):
+    Must be subclassed, to give access to the PSBT scopes.
+    """
+
+    def __init__(self, wallet):
         self.wallet = wallet
-        self.base_encoding = None
-        self.ur_type = None
-        self.qr_format = qr_format
         self.policy = None
-        self.is_b64_file = False
+        self._xpubs = None
+        self._policies = {}
+        self._derived_xpubs = {}
 
-        # Parse the PSBT
-        if psbt_filename:
-            gc.collect()
-            from .settings import SD_PATH
+    def _input_scopes(self):
+        """Returns the input scopes of the PSBT"""
+        raise NotImplementedError()
 
-            file_path = "/%s/%s" % (SD_PATH, psbt_filename)
-            try:
-                with open(file_path, "rb") as file:
-                    self.psbt = PSBT.read_from(file)
-                self.validate()
-            except:
-                try:
-                    self.policy = None  # Reset policy
-                    self.is_b64_file = self.file_is_base64_encoded(file_path)
-                    if self.is_b64_file:
-                        # BlueWallet exports PSBTs as base64 encoded files
-                        # So it will be decoded and loaded uncompressed
-                        with open(file_path, "r") as file:
-                            psbt_data = file.read()
-                        self.psbt = PSBT.parse(base_decode(psbt_data, 64))
-                    else:
-                        # Try to load the PSBT in compressed mode
-                        with open(file_path, "rb") as file:
-                            file.seek(0)  # Reset the file pointer to the beginning
-                            self.psbt = PSBT.read_from(
-                                file, compress=CompressMode.CLEAR_ALL
-                            )
-                except Exception as e:
-                    raise ValueError("Error loading PSBT file: %s" % e)
-            self.base_encoding = 64  # In case it is exported as QR code
-        elif isinstance(psbt_data, UR):
-            try:
-                self.psbt = PSBT.parse(URTYPE_PSBT.from_cbor(psbt_data.cbor).data)
-                self.ur_type = CRYPTO_PSBT
-                # self.base_encoding = 64
-            except:
-                raise ValueError("invalid PSBT")
-        else:
-            try:
-                self.psbt = PSBT.parse(psbt_data)
-                if self.qr_format == FORMAT_PMOFN:
-                    # We can't return the PSBT as a multi-part sequence of bytes, so convert to
-                    # base64 first
-                    self.base_encoding = 64
-            except:
-                try:
-                    self.psbt = PSBT.parse(base_decode(psbt_data, 64))
-                    self.base_encoding = 64
-                except:
-                    try:
-                        self.psbt = PSBT.parse(base_decode(psbt_data, 58))
-                        self.base_encoding = 58
-                    except:
-                        try:
-                            import base43
+    def _output_scopes(self):
+        """Returns the output scopes of the PSBT paired with their tx outputs"""
+        raise NotImplementedError()
 
-                            self.psbt = PSBT.parse(base43.decode(psbt_data))
-                            self.base_encoding = 43
-                        except:
-                            raise ValueError("invalid PSBT")
-        if self.policy is None:
-            # If not yet validated (e.g. from file and compressed), validate now
-            try:
-                self.validate()
-            except Exception as e:
-                raise ValueError("Invalid PSBT: %s" % e)
+    def _scope_counts(self):
+        """Returns the number of inputs and outputs of the PSBT"""
+        raise NotImplementedError()
 
-    def file_is_base64_encoded(self, file_path, chunk_size=64):
-        """Checks if a file is base64 encoded"""
-        with open(file_path, "rb") as file:
-            chunk = file.read(chunk_size)
-            if not chunk:
-                raise ValueError("Empty file")
-            # Check if chunk length is divisible by 4
-            if len(chunk) % 4 != 0:
-                return False
-            try:
-                # Try to decode the chunk as base64
-                base_decode(chunk.decode(), 64)
-                return True
-            except Exception:
-                return False
+    def _global_xpubs(self):
+        """Returns the xpubs of the PSBT global scope"""
+        raise NotImplementedError()
 
     def validate(self):
         """Validates the PSBT"""
@@ -153,7 +103,7 @@ class PSBTSigner:
         except:
             # Expected to fail to get xpubs from Miniscript PSBT
             pass
-        for inp in self.psbt.inputs:
+        for inp in self._input_scopes():
             # get policy of the input
             try:
                 inp_policy = self.get_policy_from_psbt_input(
@@ -195,13 +145,37 @@ class PSBTSigner:
         else:
             raise ValueError("No UTXO information available in the input.")
 
-        return get_policy(tx_input, scriptpubkey, xpubs, origin_less_xpub)
+        return self._get_policy(tx_input, scriptpubkey, xpubs, origin_less_xpub)
+
+    def _get_policy(self, scope, scriptpubkey, xpubs, origin_less_xpub=None):
+        """Returns the policy of a scope, memoized by its scripts and derivations
+        so inputs and outputs sharing them are only verified once"""
+        policy_key = (
+            scriptpubkey.data,
+            scope.redeem_script.data if scope.redeem_script else None,
+            scope.witness_script.data if scope.witness_script else None,
+            tuple(
+                (pub.sec(), der.fingerprint, tuple(der.derivation))
+                for pub, der in scope.bip32_derivations.items()
+            ),
+            tuple(
+                (pub.sec(), der.fingerprint, tuple(der.derivation))
+                for pub, (_, der) in scope.taproot_bip32_derivations.items()
+            ),
+        )
+        if policy_key not in self._policies:
+            if len(self._policies) >= POLICY_MEMO_SIZE:
+                self._policies.clear()
+            self._policies[policy_key] = get_policy(
+                scope, scriptpubkey, xpubs, origin_less_xpub, self._derived_xpubs
+            )
+        return self._policies[policy_key]
 
     def path_mismatch(self):
         """Verifies if the PSBT key path matches loaded keys's derivation path"""
         mismatched_paths = []
         der_path_nodes = len(self.wallet.key.derivation.split("/")) - 1
-        for _input in self.psbt.inputs:
+        for _input in self._input_scopes():
             if self.policy["type"] == P2TR:
                 derivations = _input.taproot_bip32_derivations
             else:
@@ -299,11 +273,12 @@ class PSBTSigner:
             + "%)"
         )
         if not self.wallet.is_miniscript():
+            num_inputs, num_outputs = self._scope_counts()
             satvb = fee / SatsVB.get_vbytes(
                 self.policy,
                 output_policy_count,
-                len(self.psbt.inputs),
-                len(self.psbt.outputs),
+                num_inputs,
+                num_outputs,
             )
             resume_fee_str += (" ~%.1f" % satvb) + " sat/vB"
 
@@ -324,14 +299,14 @@ class PSBTSigner:
         """Returns a list of messages describing where amounts are going"""
 
         inp_amount = 0
-        for inp in self.psbt.inputs:
+        for inp in self._input_scopes():
             if inp.witness_utxo:
                 inp_amount += inp.witness_utxo.value
             elif inp.non_witness_utxo:  # Legacy
                 # Retrieve the value from the specified output in the non_witness_utxo
                 inp_amount += inp.non_witness_utxo.vout[inp.vout].value
         resume_inputs_str = (
-            (t("Inputs (%d):") % len(self.psbt.inputs))
+            (t("Inputs (%d):") % self._scope_counts()[0])
             + self._btc_render(inp_amount)
             + "\n\n"
         )
@@ -355,9 +330,9 @@ class PSBTSigner:
         except:
             # Expected to fail to get xpubs from Miniscript PSBT
             pass
-        for i, out in enumerate(self.psbt.outputs):
-            out_policy = get_policy(
-                out, self.psbt.tx.vout[i].script_pubkey, xpubs, origin_less_xpub
+        for out, vout in self._output_scopes():
+            out_policy = self._get_policy(
+                out, vout.script_pubkey, xpubs, origin_less_xpub
             )
             output_policy_count[out_policy["type"]] += 1
             output_type = self._classify_output(out_policy, out)
@@ -365,33 +340,27 @@ class PSBTSigner:
             if output_type == CHANGE:
                 change_list.append(
                     (
-                        self.psbt.tx.vout[i].script_pubkey.address(
-                            network=self.wallet.key.network
-                        ),
-                        self.psbt.tx.vout[i].value,
+                        vout.script_pubkey.address(network=self.wallet.key.network),
+                        vout.value,
                     )
                 )
-                change_amount += self.psbt.tx.vout[i].value
+                change_amount += vout.value
             elif output_type == SELF_TRANSFER:
                 self_transfer_list.append(
                     (
-                        self.psbt.tx.vout[i].script_pubkey.address(
-                            network=self.wallet.key.network
-                        ),
-                        self.psbt.tx.vout[i].value,
+                        vout.script_pubkey.address(network=self.wallet.key.network),
+                        vout.value,
                     )
                 )
-                self_amount += self.psbt.tx.vout[i].value
+                self_amount += vout.value
             else:  # Address is from other wallet
                 spend_list.append(
                     (
-                        self.psbt.tx.vout[i].script_pubkey.address(
-                            network=self.wallet.key.network
-                        ),
-                        self.psbt.tx.vout[i].value,
+                        vout.script_pubkey.address(network=self.wallet.key.network),
+                        vout.value,
                     )
                 )
-                spend_amount += self.psbt.tx.vout[i].value
+                spend_amount += vout.value
 
         if len(spend_list) > 0:
             resume_spend_str = (
@@ -444,30 +413,23 @@ class PSBTSigner:
         from embit.transaction import SIGHASH
 
         safe_sighash = {None, SIGHASH.DEFAULT, SIGHASH.ALL}
-        for i, inp in enumerate(self.psbt.inputs):
+        for i, inp in enumerate(self._input_scopes()):
             if inp.sighash_type not in safe_sighash:
                 sighash_val = inp.sighash_type
                 raise ValueError(
                     "Input %d has non-standard sighash type: 0x%02x" % (i, sighash_val)
                 )
 
-    def add_signatures(self):
-        """Add signatures to PSBT"""
-        self.check_sighash()
-        sigs_added = self.psbt.sign_with(self.wallet.key.root)
-        if sigs_added == 0:
-            raise ValueError("cannot sign")
-
     def fill_zero_fingerprint(self):
         """Fix for zeroes in fingerprint that happen when user imports the wallet
         with XPUB only (without derivation path)
         """
         filled = 0
 
-        for inp in self.psbt.inputs:
+        for inp in self._input_scopes():
             filled += self._fill_zero_fingerprint_scope(inp)
 
-        for out in self.psbt.outputs:
+        for out, _ in self._output_scopes():
             filled += self._fill_zero_fingerprint_scope(out)
 
         return filled
@@ -491,85 +453,19 @@ class PSBTSigner:
                     filled += 1
         return filled
 
-    def sign(self, trim=True):
-        """Signs the PSBT and preserves necessary fields for the final transaction"""
-        self.add_signatures()
-
-        if not trim:
-            return
-
-        trimmed_psbt = PSBT(self.psbt.tx)
-        for i, inp in enumerate(self.psbt.inputs):
-            # Copy the final_scriptwitness if present
-            if inp.final_scriptwitness:
-                trimmed_psbt.inputs[i].final_scriptwitness = inp.final_scriptwitness
-
-            # Copy any partial signatures
-            if inp.partial_sigs:
-                trimmed_psbt.inputs[i].partial_sigs = inp.partial_sigs
-
-            # Preserve witness UTXO if present
-            if inp.witness_utxo:
-                trimmed_psbt.inputs[i].witness_utxo = inp.witness_utxo
-
-            # Preserve non-witness UTXO if present (for legacy inputs)
-            if inp.non_witness_utxo:
-                trimmed_psbt.inputs[i].non_witness_utxo = inp.non_witness_utxo
-
-            # Preserve redeem_script for P2SH or nested SegWit
-            if inp.redeem_script:
-                trimmed_psbt.inputs[i].redeem_script = inp.redeem_script
-
-            # Preserve witness_script for P2WSH multisig
-            if inp.witness_script:
-                trimmed_psbt.inputs[i].witness_script = inp.witness_script
-
-            # Preserve taproot_key_sig for Taproot inputs
-            if inp.taproot_key_sig:
-                trimmed_psbt.inputs[i].taproot_key_sig = inp.taproot_key_sig
-
-            # Preserve taproot script path sigs
-            if inp.taproot_sigs:
-                trimmed_psbt.inputs[i].taproot_sigs = inp.taproot_sigs
-
-        self.psbt = trimmed_psbt
-
-    def psbt_qr(self):
-        """Returns the psbt in the same form it was read as a QR code"""
-        psbt_data = self.psbt.serialize()
-
-        self.psbt = None  # Remove PSBT free RAM
-        gc.collect()
-
-        if self.qr_format == FORMAT_BBQR:
-            from .bbqr import encode_bbqr
-
-            psbt_data = encode_bbqr(psbt_data, file_type="P")
-            return psbt_data, self.qr_format
-
-        if self.base_encoding is not None:
-            from .baseconv import base_encode
-
-            psbt_data = base_encode(psbt_data, self.base_encoding)
-
-        if self.ur_type == CRYPTO_PSBT:
-            return (
-                UR(
-                    CRYPTO_PSBT.type,
-                    URTYPE_PSBT(psbt_data).to_cbor(),
-                ),
-                self.qr_format,
-            )
-        return psbt_data, self.qr_format
-
     def xpubs(self):
         """Returns the xpubs in the PSBT mapped to their derivations, falling back to
         the wallet descriptor xpubs if not found
         """
         from embit.psbt import DerivationPath
 
-        if self.psbt.xpubs:
-            return self.psbt.xpubs, None
+        if self._xpubs is not None:
+            return self._xpubs
+
+        psbt_xpubs = self._global_xpubs()
+        if psbt_xpubs:
+            self._xpubs = (psbt_xpubs, None)
+            return self._xpubs
 
         if not self.wallet.descriptor:
             raise ValueError("missing xpubs")
@@ -598,7 +494,8 @@ class PSBTSigner:
                     )
                 origin_less_xpub = descriptor_key.key
 
-        return xpubs, origin_less_xpub
+        self._xpubs = (xpubs, origin_less_xpub)
+        return self._xpubs
 
     def psbt_policy_string(self):
         """Returns the policy string containing script type and cosigners' fingerprints"""
@@ -608,7 +505,7 @@ class PSBTSigner:
         if is_multisig(self.policy):
             policy_str += str(self.policy["m"]) + " of " + str(self.policy["n"]) + "\n"
         fingerprints = []
-        for inp in self.psbt.inputs:
+        for inp in self._input_scopes():
             # Do we need to loop through all the inputs or just one?
             if self.policy["type"] == P2WSH:
                 for pub in inp.bip32_derivations:
@@ -636,6 +533,182 @@ class PSBTSigner:
         return policy_str
 
 
+class PSBTSigner(PSBTReviewer):
+    """Responsible for validating and signing PSBTs"""
+
+    is_stream = False
+
+    def __init__(self, wallet, psbt_data, qr_format, psbt_filename=None):
+        super().__init__(wallet)
+        self.base_encoding = None
+        self.ur_type = None
+        self.qr_format = qr_format
+        self.is_b64_file = False
+        self.trim = False
+
+        # Parse the PSBT
+        if psbt_filename:
+            gc.collect()
+            from .settings import SD_PATH
+
+            file_path = "/%s/%s" % (SD_PATH, psbt_filename)
+            try:
+                with open(file_path, "rb") as file:
+                    self.psbt = PSBT.read_from(file)
+                self.validate()
+            except:
+                try:
+                    self.policy = None  # Reset policy
+                    self.is_b64_file = self.file_is_base64_encoded(file_path)
+                    if self.is_b64_file:
+                        # BlueWallet exports PSBTs as base64 encoded files
+                        # So it will be decoded and loaded uncompressed
+                        with open(file_path, "r") as file:
+                            psbt_data = file.read()
+                        self.psbt = PSBT.parse(base_decode(psbt_data, 64))
+                    else:
+                        # Try to load the PSBT in compressed mode
+                        with open(file_path, "rb") as file:
+                            file.seek(0)  # Reset the file pointer to the beginning
+                            self.psbt = PSBT.read_from(
+                                file, compress=CompressMode.CLEAR_ALL
+                            )
+                except Exception as e:
+                    raise ValueError("Error loading PSBT file: %s" % e)
+            self.base_encoding = 64  # In case it is exported as QR code
+        elif isinstance(psbt_data, UR):
+            try:
+                self.psbt = PSBT.parse(URTYPE_PSBT.from_cbor(psbt_data.cbor).data)
+                self.ur_type = CRYPTO_PSBT
+                # self.base_encoding = 64
+            except:
+                raise ValueError("invalid PSBT")
+        else:
+            try:
+                self.psbt = PSBT.parse(psbt_data)
+                if self.qr_format == FORMAT_PMOFN:
+                    # We can't return the PSBT as a multi-part sequence of bytes, so convert to
+                    # base64 first
+                    self.base_encoding = 64
+            except:
+                try:
+                    self.psbt = PSBT.parse(base_decode(psbt_data, 64))
+                    self.base_encoding = 64
+                except:
+                    try:
+                        self.psbt = PSBT.parse(base_decode(psbt_data, 58))
+                        self.base_encoding = 58
+                    except:
+                        try:
+                            import base43
+
+                            self.psbt = PSBT.parse(base43.decode(psbt_data))
+                            self.base_encoding = 43
+                        except:
+                            raise ValueError("invalid PSBT")
+        if self.policy is None:
+            # If not yet validated (e.g. from file and compressed), validate now
+            try:
+                self.validate()
+            except Exception as e:
+                raise ValueError("Invalid PSBT: %s" % e)
+
+    def file_is_base64_encoded(self, file_path, chunk_size=64):
+        """Checks if a file is base64 encoded"""
+        with open(file_path, "rb") as file:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                raise ValueError("Empty file")
+            # Check if chunk length is divisible by 4
+            if len(chunk) % 4 != 0:
+                return False
+            try:
+                # Try to decode the chunk as base64
+                base_decode(chunk.decode(), 64)
+                return True
+            except Exception:
+                return False
+
+    def _input_scopes(self):
+        """Returns the input scopes of the PSBT"""
+        return self.psbt.inputs
+
+    def _output_scopes(self):
+        """Returns the output scopes of the PSBT paired with their tx outputs"""
+        return zip(self.psbt.outputs, self.psbt.tx.vout)
+
+    def _scope_counts(self):
+        """Returns the number of inputs and outputs of the PSBT"""
+        return len(self.psbt.inputs), len(self.psbt.outputs)
+
+    def _global_xpubs(self):
+        """Returns the xpubs of the PSBT global scope"""
+        return self.psbt.xpubs
+
+    def add_signatures(self):
+        """Add signatures to PSBT"""
+        self.check_sighash()
+        sigs_added = self.psbt.sign_with(self.wallet.key.root)
+        if sigs_added == 0:
+            raise ValueError("cannot sign")
+
+    def sign(self, trim=True):
+        """Signs the PSBT, when trim is set it will be exported with only the
+        fields necessary for the final transaction"""
+        self.add_signatures()
+        self.trim = trim
+
+    def _serialize_trimmed(self):
+        """Serializes the signed PSBT keeping only the unsigned tx and the inputs'
+        UTXOs, scripts and signatures, without building a trimmed copy of it"""
+        stream = BytesIO()
+        stream.write(PSBT.MAGIC)
+        stream.write(b"\x01\x00")
+        ser_string(stream, self.psbt.tx.serialize())
+        stream.write(b"\x00")
+        for inp in self.psbt.inputs:
+            # embit serializes the kept fields, one input at a time
+            trimmed = InputScope()
+            for field in TRIMMED_INPUT_FIELDS:
+                if hasattr(inp, field):
+                    setattr(trimmed, field, getattr(inp, field))
+            trimmed.write_to(stream)
+        # Outputs are kept empty
+        stream.write(b"\x00" * len(self.psbt.outputs))
+        return stream.getvalue()
+
+    def psbt_qr(self):
+        """Returns the psbt in the same form it was read as a QR code"""
+        if self.trim:
+            psbt_data = self._serialize_trimmed()
+        else:
+            psbt_data = self.psbt.serialize()
+
+        self.psbt = None  # Remove PSBT free RAM
+        gc.collect()
+
+        if self.qr_format == FORMAT_BBQR:
+            from .bbqr import encode_bbqr
+
+            psbt_data = encode_bbqr(psbt_data, file_type="P")
+            return psbt_data, self.qr_format
+
+        if self.base_encoding is not None:
+            from .baseconv import base_encode
+
+            psbt_data = base_encode(psbt_data, self.base_encoding)
+
+        if self.ur_type == CRYPTO_PSBT:
+            return (
+                UR(
+                    CRYPTO_PSBT.type,
+                    URTYPE_PSBT(psbt_data).to_cbor(),
+                ),
+                self.qr_format,
+            )
+        return psbt_data, self.qr_format
+
+
 def is_multisig(policy):
     """Returns a boolean indicating if the policy is a multisig"""
     return (
@@ -659,8 +732,19 @@ def is_miniscript(policy):
     )
 
 
+def derive_pubkey(xpub, path, derived_xpubs=None):
+    """Derives the pubkey at path from xpub, reusing the parent xpubs already
+    derived when a derived_xpubs cache is given"""
+    if derived_xpubs is None or len(path) < 2:
+        return xpub.derive(path).key
+    parent_key = (xpub.to_base58(), tuple(path[:-1]))
+    if parent_key not in derived_xpubs:
+        derived_xpubs[parent_key] = xpub.derive(path[:-1])
+    return derived_xpubs[parent_key].derive(path[-1:]).key
+
+
 # From: https://github.com/diybitcoinhardware/embit/blob/master/examples/change.py#L41
-def get_cosigners(pubkeys, derivations, xpubs):
+def get_cosigners(pubkeys, derivations, xpubs, derived_xpubs=None):
     """Returns xpubs used to derive pubkeys using global xpub field from psbt"""
     cosigners = []
     for _, pubkey in enumerate(pubkeys):
@@ -674,7 +758,10 @@ def get_cosigners(pubkeys, derivations, xpubs):
                 # check derivation - last two indexes give pub from xpub
                 if origin_der.derivation == der.derivation[:-2]:
                     # check that it derives to pubkey actually
-                    if xpub.derive(der.derivation[-2:]).key == pubkey:
+                    if (
+                        derive_pubkey(xpub, der.derivation[-2:], derived_xpubs)
+                        == pubkey
+                    ):
                         # append strings so they can be sorted and compared
                         cosigners.append(xpub.to_base58())
                         break
@@ -683,7 +770,7 @@ def get_cosigners(pubkeys, derivations, xpubs):
     return sorted(cosigners)
 
 
-def get_cosigners_miniscript(derivations, xpubs):
+def get_cosigners_miniscript(derivations, xpubs, derived_xpubs=None):
     """Compares the derivations with the xpubs to check and get the cosigners"""
     cosigners = []
     for pubkey, der in derivations.items():
@@ -694,7 +781,10 @@ def get_cosigners_miniscript(derivations, xpubs):
                 # Check that the derivation path matches except for the last two indices
                 if origin_der.derivation == der.derivation[:-2]:
                     # Verify that the xpub derives the pubkey
-                    if xpub.derive(der.derivation[-2:]).key == pubkey:
+                    if (
+                        derive_pubkey(xpub, der.derivation[-2:], derived_xpubs)
+                        == pubkey
+                    ):
                         # Append the xpub as a base58 string
                         cosigners.append(xpub.to_base58())
                         break
@@ -704,7 +794,9 @@ def get_cosigners_miniscript(derivations, xpubs):
     return sorted(cosigners)
 
 
-def get_cosigners_taproot_miniscript(taproot_derivations, xpubs, origin_less_xpub=None):
+def get_cosigners_taproot_miniscript(
+    taproot_derivations, xpubs, origin_less_xpub=None, derived_xpubs=None
+):
     """
     Compares the taproot derivations with the xpubs to check get the cosigners
     """
@@ -724,7 +816,7 @@ def get_cosigners_taproot_miniscript(taproot_derivations, xpubs, origin_less_xpu
                     # Derive the remainder of the path
                     remainder = full_path[len(origin_der.derivation) :]
                     # Verify that the xpub derives to the given xonly_pubkey
-                    derived_key = xpub.derive(remainder).key
+                    derived_key = derive_pubkey(xpub, remainder, derived_xpubs)
                     if derived_key.xonly() == xonly_pubkey.xonly():
                         # Append the xpub as a base58 string
                         cosigners.append(xpub.to_base58())
@@ -744,7 +836,7 @@ def get_cosigners_taproot_miniscript(taproot_derivations, xpubs, origin_less_xpu
 
 # Modified from: https://github.com/diybitcoinhardware/embit/blob/master/examples/change.py#L64
 # and https://github.com/SeedSigner/seedsigner/blob/dev/src/seedsigner/models/psbt_parser.py
-def get_policy(scope, scriptpubkey, xpubs, origin_less_xpub=None):
+def get_policy(scope, scriptpubkey, xpubs, origin_less_xpub=None, derived_xpubs=None):
     """Parse scope and get policy"""
     from embit.finalizer import parse_multisig
 
@@ -775,7 +867,9 @@ def get_policy(scope, scriptpubkey, xpubs, origin_less_xpub=None):
             policy.update({"m": m, "n": len(pubkeys)})
 
             # check pubkeys are derived from cosigners
-            cosigners = get_cosigners(pubkeys, scope.bip32_derivations, xpubs)
+            cosigners = get_cosigners(
+                pubkeys, scope.bip32_derivations, xpubs, derived_xpubs
+            )
             policy.update({"cosigners": cosigners})
         except:
             pass
@@ -790,7 +884,9 @@ def get_policy(scope, scriptpubkey, xpubs, origin_less_xpub=None):
             policy.update({"m": m, "n": len(pubkeys)})
 
             # check pubkeys are derived from cosigners
-            cosigners = get_cosigners(pubkeys, scope.bip32_derivations, xpubs)
+            cosigners = get_cosigners(
+                pubkeys, scope.bip32_derivations, xpubs, derived_xpubs
+            )
             policy.update({"cosigners": cosigners})
         except:
             try:
@@ -798,7 +894,9 @@ def get_policy(scope, scriptpubkey, xpubs, origin_less_xpub=None):
                 policy.update({"miniscript": P2WSH})
 
                 # Will succeed to verify cosigners only if the descriptor is loaded
-                cosigners = get_cosigners_miniscript(scope.bip32_derivations, xpubs)
+                cosigners = get_cosigners_miniscript(
+                    scope.bip32_derivations, xpubs, derived_xpubs
+                )
                 policy.update({"cosigners": cosigners})
             except:
                 pass
@@ -813,7 +911,10 @@ def get_policy(scope, scriptpubkey, xpubs, origin_less_xpub=None):
 
             # Will succeed to verify cosigners only if the descriptor is loaded
             cosigners = get_cosigners_taproot_miniscript(
-                scope.taproot_bip32_derivations, xpubs, origin_less_xpub
+                scope.taproot_bip32_derivations,
+                xpubs,
+                origin_less_xpub,
+                derived_xpubs,
             )
             # Only add cosigners if is miniscript (multiple cosigners),
             # otherwise it probably is single-sig taproot
@@ -0,0 +1,370 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2024 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import os
+import hashlib
+from io import BytesIO
+from binascii import a2b_base64, b2a_base64
+from embit.bip32 import HDKey
+from embit.psbt import InputScope, OutputScope, DerivationPath, read_string, skip_string
+from embit.psbtview import PSBTView
+from embit.transaction import SIGHASH
+from .psbt import PSBTReviewer
+from .settings import SD_PATH
+
+# PSBT files larger than this are signed scope by scope
+STREAM_SIZE_THRESHOLD = 16 * 1024
+
+# Base64 encoding of the PSBT magic, as base64 PSBT files start
+BASE64_MAGIC = b"cHNidP8"
+
+# Base64 characters read from a file at a time
+BASE64_CHUNK_SIZE = 2048
+
+# Bytes kept per scope to detect changes of the file between passes
+SCOPE_DIGEST_SIZE = 16
+
+PSBT_GLOBAL_XPUB = 0x01
+
+
+class _ScopeReader:
+    """Hashes every byte read from a file, so scopes can be fingerprinted"""
+
+    def __init__(self, file):
+        self.file = file
+        self.hasher = hashlib.sha256()
+
+    def read(self, size):
+        """Reads size bytes from the file, adding them to the digest"""
+        data = self.file.read(size)
+        self.hasher.update(data)
+        return data
+
+    def digest(self):
+        """Returns the digest of the bytes read since the last call"""
+        digest = self.hasher.digest()[:SCOPE_DIGEST_SIZE]
+        self.hasher = hashlib.sha256()
+        return digest
+
+
+class _Base64File:
+    """Reads a base64 encoded PSBT file as binary, decoding it as it is read.
+    Seeking back returns to the closest position told before and reads ahead"""
+
+    def __init__(self, file):
+        self.file = file
+        self.encoded = b""
+        self.decoded = b""
+        self.index = 0
+        self.position = 0
+        # File position and undecoded data at decoded positions told before
+        self.marks = {0: (0, b"", b"")}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.file.close()
+
+    def read(self, size):
+        """Reads up to size decoded bytes"""
+        while len(self.decoded) - self.index < size:
+            chunk = self.file.read(BASE64_CHUNK_SIZE)
+            if not chunk:
+                break
+            # Line breaks are dropped, a quad may span two chunks
+            self.encoded += b"".join(chunk.split())
+            usable = len(self.encoded) & ~3
+            self.decoded = self.decoded[self.index :] + a2b_base64(
+                self.encoded[:usable]
+            )
+            self.encoded = self.encoded[usable:]
+            self.index = 0
+        data = self.decoded[self.index : self.index + size]
+        self.index += len(data)
+        self.position += len(data)
+        return data
+
+    def tell(self):
+        """Returns the decoded position, marking it to seek back to"""
+        self.marks[self.position] = (
+            self.file.tell(),
+            self.encoded,
+            self.decoded[self.index :],
+        )
+        return self.position
+
+    def seek(self, offset, whence=0):
+        """Seeks to a decoded position"""
+        if whence == 1:
+            offset += self.position
+        if offset < self.position:
+            self.position = max(mark for mark in self.marks if mark <= offset)
+            file_position, self.encoded, self.decoded = self.marks[self.position]
+            self.index = 0
+            self.file.seek(file_position)
+        while self.position < offset:
+            if not self.read(min(offset - self.position, BASE64_CHUNK_SIZE)):
+                break
+        return self.position
+
+
+class _Base64Writer:
+    """Encodes the signed PSBT to base64 as it is written"""
+
+    def __init__(self, file):
+        self.file = file
+        self.pending = b""
+
+    def write(self, data):
+        """Writes data, keeping the bytes not filling a base64 quad"""
+        data = self.pending + data
+        usable = len(data) - len(data) % 3
+        # b2a_base64 ends lines with a newline
+        self.file.write(b2a_base64(data[:usable])[:-1])
+        self.pending = data[usable:]
+        return len(data)
+
+    def flush(self):
+        """Writes the last bytes, padded"""
+        if self.pending:
+            self.file.write(b2a_base64(self.pending)[:-1])
+            self.pending = b""
+
+
+class _NullWriter:
+    """Discards the signatures PSBTView writes, they are kept in the scope"""
+
+    def write(self, data):
+        """Discards data"""
+        return len(data)
+
+
+class _ScopeView(PSBTView):
+    """PSBTView of the global scope kept in RAM, signing the input scope
+    streamed from the SD card instead of reading it again"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scope = None
+        self.amounts_hash = None
+        self.script_pubkeys_hash = None
+
+    def input(self, i, compress=None):
+        return self.scope
+
+    def hash_amounts(self, amounts):
+        return self.amounts_hash
+
+    def hash_script_pubkeys(self, script_pubkeys):
+        return self.script_pubkeys_hash
+
+    def sighash(self, i, sighash=SIGHASH.ALL, input_scope=None, **kwargs):
+        inp = self.scope if input_scope is None else input_scope
+        if inp.is_taproot:
+            # Spent amounts and scripts were hashed when the file was indexed
+            spent = [None] * self.num_inputs
+            return self.sighash_taproot(
+                i, script_pubkeys=spent, values=spent, sighash=sighash, **kwargs
+            )
+        return super().sighash(i, sighash, inp, **kwargs)
+
+    def sign_scope(self, i, scope, root):
+        """Signs the input scope i, adding the signatures to it"""
+        self.scope = scope
+        return self.sign_input(i, root, _NullWriter())
+
+
+class PSBTStreamSigner(PSBTReviewer):
+    """Validates and signs a PSBT from the SD card one scope at a time, so only
+    the global scope and a single input or output are held in memory"""
+
+    is_stream = True
+
+    def __init__(self, wallet, psbt_filename):
+        super().__init__(wallet)
+        self.file_path = "/%s/%s" % (SD_PATH, psbt_filename)
+        self.global_scope = None
+        self.view = None
+        self.psbt_xpubs = {}
+        self.scope_digests = bytearray()
+        self.outputs_offset = None
+        self.fill_fingerprints = False
+        # BlueWallet exports PSBTs as base64 encoded files
+        self.is_b64_file = False
+
+        # Index the file, keeping only its global scope
+        try:
+            self._load_global_scope()
+            self._index_scopes()
+            self.validate()
+        except Exception as e:
+            raise ValueError("Invalid PSBT: %s" % e)
+
+    @staticmethod
+    def is_streamable(psbt_filename):
+        """Returns True if the file is a binary or base64 PSBT too large to be
+        parsed at once"""
+        file_path = "/%s/%s" % (SD_PATH, psbt_filename)
+        try:
+            if os.stat(file_path)[6] <= STREAM_SIZE_THRESHOLD:
+                return False
+            with open(file_path, "rb") as file:
+                magic = file.read(len(BASE64_MAGIC))
+        except OSError:
+            return False
+        return magic == BASE64_MAGIC or magic.startswith(PSBTView.MAGIC)
+
+    def _open(self):
+        """Opens the PSBT file to be read as binary"""
+        file = open(self.file_path, "rb")
+        if self.is_b64_file:
+            return _Base64File(file)
+        return file
+
+    def _load_global_scope(self):
+        """Copies the global scope to RAM, so the reviewed transaction can't
+        change while it is signed"""
+        with open(self.file_path, "rb") as file:
+            self.is_b64_file = file.read(len(BASE64_MAGIC)) == BASE64_MAGIC
+        with self._open() as file:
+            first_scope = PSBTView.view(file).first_scope
+            file.seek(0)
+            self.global_scope = file.read(first_scope)
+        self.view = _ScopeView.view(BytesIO(self.global_scope))
+        if self.view.first_scope != len(self.global_scope):
+            raise ValueError("PSBT file changed")
+        if self.view.tx is None:
+            raise ValueError("missing global transaction")
+
+        stream = BytesIO(self.global_scope)
+        stream.seek(len(PSBTView.MAGIC))
+        while True:
+            key = read_string(stream)
+            # separator
+            if len(key) == 0:
+                break
+            if key[0] == PSBT_GLOBAL_XPUB:
+                xpub = HDKey.parse(key[1:])
+                self.psbt_xpubs[xpub] = DerivationPath.parse(read_string(stream))
+            else:
+                skip_string(stream)
+
+    def _index_scopes(self):
+        """Reads all scopes once, storing their digests and hashing the spent
+        amounts and scripts needed to sign taproot inputs"""
+        amounts = hashlib.sha256()
+        script_pubkeys = hashlib.sha256()
+        for inp in self._input_scopes():
+            utxo = inp.utxo
+            if utxo is None:
+                raise ValueError("missing UTXO")
+            amounts.update(utxo.value.to_bytes(8, "little"))
+            script_pubkeys.update(utxo.script_pubkey.serialize())
+        self.view.amounts_hash = amounts.digest()
+        self.view.script_pubkeys_hash = script_pubkeys.digest()
+        for _ in self._output_scopes():
+            pass
+
+    def _read_scopes(self, start, stop, offset):
+        """Yields the scopes from start to stop with their tx input or output,
+        checking each scope matches the digest stored when it was first read"""
+        num_inputs = self.view.num_inputs
+        with self._open() as file:
+            file.seek(offset)
+            reader = _ScopeReader(file)
+            for i in range(start, stop):
+                if i < num_inputs:
+                    txio = self.view.vin(i)
+                    scope = InputScope.read_from(reader, vin=txio)
+                else:
+                    txio = self.view.vout(i - num_inputs)
+                    scope = OutputScope.read_from(reader, vout=txio)
+                digest = reader.digest()
+                digest_offset = i * SCOPE_DIGEST_SIZE
+                if len(self.scope_digests) == digest_offset:
+                    self.scope_digests.extend(digest)
+                elif (
+                    self.scope_digests[
+                        digest_offset : digest_offset + SCOPE_DIGEST_SIZE
+                    ]
+                    != digest
+                ):
+                    raise ValueError("PSBT file changed")
+                yield scope, txio
+            if stop == num_inputs:
+                self.outputs_offset = file.tell()
+
+    def _input_scopes(self):
+        scopes = self._read_scopes(0, self.view.num_inputs, len(self.global_scope))
+        for inp, _ in scopes:
+            yield inp
+
+    def _output_scopes(self):
+        num_inputs = self.view.num_inputs
+        return self._read_scopes(
+            num_inputs, num_inputs + self.view.num_outputs, self.outputs_offset
+        )
+
+    def _scope_counts(self):
+        return self.view.num_inputs, self.view.num_outputs
+
+    def _global_xpubs(self):
+        return self.psbt_xpubs
+
+    def fill_zero_fingerprint(self):
+        """Counts the zeroed fingerprints to fill, they are filled while signing"""
+        filled = super().fill_zero_fingerprint()
+        self.fill_fingerprints = filled > 0
+        return filled
+
+    def sign_to_file(self, signed_filename):
+        """Signs the PSBT one input at a time, writing each scope to the signed
+        file as soon as it is done"""
+        self.check_sighash()
+        root = self.wallet.key.root
+        version = self.view.version
+        signed_path = "/%s/%s" % (SD_PATH, signed_filename)
+        sigs_added = 0
+        try:
+            with open(signed_path, "wb") as file:
+                # A base64 PSBT is signed to base64 too
+                signed_file = _Base64Writer(file) if self.is_b64_file else file
+                signed_file.write(self.global_scope)
+                for i, inp in enumerate(self._input_scopes()):
+                    if self.fill_fingerprints:
+                        self._fill_zero_fingerprint_scope(inp)
+                    sigs_added += self.view.sign_scope(i, inp, root)
+                    inp.write_to(signed_file, version=version)
+                for out, _ in self._output_scopes():
+                    if self.fill_fingerprints:
+                        self._fill_zero_fingerprint_scope(out)
+                    out.write_to(signed_file, version=version)
+                signed_file.flush()
+            if sigs_added == 0:
+                raise ValueError("cannot sign")
+        except:
+            # Don't leave a partially signed file behind, if it was created
+            try:
+                os.remove(signed_path)
+            except OSError:
+                pass
+            raise
@@ -41,6 +41,9 @@ UR_BYTEWORDS_CRC_LEN = 4  # 32 bits CRC used on Bytewords encoding
 
 UR_MIN_FRAGMENT_LENGTH = 10
 
+# Max bytes of encoded QR codes kept in memory to replay animated QR codes
+QR_FRAME_CACHE_BUDGET = 2**16
+
 # https://www.qrcode.com/en/about/version.html
 # List of capacities, based on versions
 # Tables below are limited to version 20 and we use L (Low) ECC (Error Correction Code) Level
@@ -135,6 +138,7 @@ class QRPartParser:
         self.format = None
         self.decoder = None
         self.bbqr = None
+        self.bbqr_decoder = None
 
     def parsed_count(self):
         """Returns the number of parsed parts so far"""
@@ -184,10 +188,24 @@ class QRPartParser:
             data = data.decode() if isinstance(data, bytes) else data
             self.decoder.receive_part(data)
         elif self.format == FORMAT_BBQR:
-            from .bbqr import parse_bbqr
+            from .bbqr import parse_bbqr, BBQrDecoder
 
             part, index, total = parse_bbqr(data)
-            self.parts[index] = part
+            if self.bbqr_decoder is None:
+                self.bbqr_decoder = BBQrDecoder(
+                    self.bbqr.encoding, self.bbqr.file_type, total
+                )
+            elif total != self.bbqr_decoder.total:
+                # Part of another BBQr, skipped while scanning
+                return None
+            # Each part is decoded only once, as soon as it is scanned
+            if index not in self.parts:
+                try:
+                    self.bbqr_decoder.add_part(index, part, total)
+                except ValueError:
+                    # Skipped, so the part can be scanned again
+                    return None
+                self.parts[index] = None
             self.total = total
             return index
         return None
@@ -213,9 +231,7 @@ class QRPartParser:
             return self.decoder.result
 
         if self.format == FORMAT_BBQR:
-            from .bbqr import decode_bbqr
-
-            return decode_bbqr(self.parts, self.bbqr.encoding, self.bbqr.file_type)
+            return self.bbqr_decoder.result()
 
         code_buffer = io.StringIO("")
         for _, part in sorted(self.parts.items()):
@@ -290,12 +306,109 @@ def to_qr_codes(data, max_width, qr_format):
                 yield (code, num_parts)
 
 
+class QRFrameCache:
+    """Provides the QR codes of to_qr_codes in a loop, encoding each code only on its
+    first loop when all of them fit the memory budget. Fountain encoded UR codes never
+    repeat, so they are always encoded on demand
+    """
+
+    def __init__(self, data, max_width, qr_format, budget=QR_FRAME_CACHE_BUDGET):
+        self.data = data
+        self.max_width = max_width
+        self.qr_format = qr_format
+        self.budget = budget
+        self.code_generator = to_qr_codes(data, max_width, qr_format)
+        self.cacheable = qr_format != FORMAT_UR
+        self.frames = []
+        self.index = 0
+
+    def is_cached(self):
+        """Returns True when all QR codes are cached and no more encoding is needed"""
+        return bool(self.frames) and len(self.frames) == self.frames[0][1]
+
+    def next_frame(self):
+        """Returns the next QR code and the total number of codes"""
+        if self.is_cached():
+            frame = self.frames[self.index]
+            self.index = (self.index + 1) % len(self.frames)
+            return frame
+
+        try:
+            frame = next(self.code_generator)
+        except StopIteration:
+            self.code_generator = to_qr_codes(self.data, self.max_width, self.qr_format)
+            frame = next(self.code_generator)
+
+        if self.cacheable:
+            code, num_parts = frame
+            if not self.frames and len(code) * num_parts > self.budget:
+                # Too big to keep, fall back to encoding on demand
+                self.cacheable = False
+            else:
+                self.frames.append(frame)
+        return frame
+
+
 def get_size(qr_code):
     """Returns the size of the qr code as the number of chars until the first newline"""
     size = math.sqrt(len(qr_code) * 8)
     return int(size)
 
 
+def _reverse_bits(byte):
+    reversed_byte = 0
+    for _ in range(8):
+        reversed_byte = (reversed_byte << 1) | (byte & 1)
+        byte >>= 1
+    return reversed_byte
+
+
+# Maps a byte holding modules LSB first to the MSB first order of bitmaps
+REVERSED_BITS = bytes(_reverse_bits(i) for i in range(256))
+
+
+def get_row(qr_code, size, row):
+    """Returns a row of the qr code as an int, with bit x set if module x is dark"""
+    start = row * size
+    row_bytes = qr_code[start >> 3 : (start + size + 7) >> 3]
+    return (int.from_bytes(row_bytes, "little") >> (start & 7)) & ((1 << size) - 1)
+
+
+def raster_rows(qr_code, size, border=0):
+    """Yields (packed, runs) for each row of the qr code framed by border light
+    modules: packed holds the row MSB first as in PBM, with 1 for dark modules,
+    and runs lists the (x, length) of each horizontal run of dark modules"""
+    width = size + 2 * border
+    row_length = (width + 7) >> 3
+    for y in range(width):
+        if border <= y < size + border:
+            row = get_row(qr_code, size, y - border) << border
+        else:
+            row = 0
+        row_bytes = row.to_bytes(row_length, "little")
+        runs = []
+        run_start = None
+        x = 0
+        for byte in row_bytes:
+            # Skip whole bytes that don't start or end a run
+            if (byte == 0 and run_start is None) or (
+                byte == 0xFF and run_start is not None
+            ):
+                x += 8
+                continue
+            for bit in range(8):
+                if (byte >> bit) & 1:
+                    if run_start is None:
+                        run_start = x
+                elif run_start is not None:
+                    runs.append((run_start, x - run_start))
+                    run_start = None
+                x += 1
+        if run_start is not None:
+            runs.append((run_start, width - run_start))
+        yield bytes(REVERSED_BITS[byte] for byte in row_bytes), runs
+
+
 def max_qr_bytes(max_width, encoding="byte"):
     """Calculates the maximum length, in bytes, a QR code of a given size can store"""
     # Given qr_size = 17 + 4 * version + 2 * frame_size
@@ -0,0 +1,126 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Loads page modules on demand, unloading the least recently used ones past
+a heap budget, and, when recording, what boot and each import cost
+"""
+
+import gc
+import sys
+import time
+
+# Heap released modules may keep before the least recently used are unloaded
+RESIDENCY_BUDGET = 16 * 1024
+
+# Imports recorded for the report, boot only takes a few
+MAX_IMPORTS = 32
+
+
+class ModuleResidency:
+    """Tracks modules loaded on demand, their import time and heap cost"""
+
+    def __init__(self, budget=RESIDENCY_BUDGET):
+        self.budget = budget
+        self.costs = {}
+        self.in_use = {}
+        self.idle = []
+        self.imports = []
+        self.timeline = []
+        # Set by the simulator and tests, the device doesn't read the report
+        self.recording = False
+        # Called with the report once boot is done, when recording
+        self.on_boot = lambda report: None
+
+    def load(self, name):
+        """Returns the module, importing it if it isn't resident"""
+        if name in self.idle:
+            self.idle.remove(name)
+        elif name not in self.costs:
+            if self.recording:
+                gc.collect()
+            heap = gc.mem_alloc()
+            ticks = time.ticks_ms()
+            __import__(name)
+            elapsed = time.ticks_ms() - ticks
+            cost = max(gc.mem_alloc() - heap, 0)
+            self.costs[name] = cost
+            if self.recording and len(self.imports) < MAX_IMPORTS:
+                self.imports.append((name, elapsed, cost))
+        self.in_use[name] = self.in_use.get(name, 0) + 1
+        return sys.modules[name]
+
+    def release(self, name):
+        """Marks the module idle, keeping it while the budget allows"""
+        self.in_use[name] -= 1
+        if self.in_use[name]:
+            return
+        del self.in_use[name]
+        self.idle.append(name)
+        idle_heap = sum(self.costs[idle_name] for idle_name in self.idle)
+        while idle_heap > self.budget:
+            idle_heap -= self.costs[self.idle[0]]
+            self.unload(self.idle[0])
+
+    def unload(self, name):
+        """Removes the module from sys.modules and its package so it can be freed"""
+        if name in self.idle:
+            self.idle.remove(name)
+        self.in_use.pop(name, None)
+        self.costs.pop(name, None)
+        sys.modules.pop(name, None)
+        package, _, attr = name.rpartition(".")
+        if package in sys.modules and hasattr(sys.modules[package], attr):
+            delattr(sys.modules[package], attr)
+        gc.collect()
+
+    def unload_idle(self):
+        """Unloads every released module, whatever the budget"""
+        while self.idle:
+            self.unload(self.idle[0])
+
+    def mark(self, label):
+        """Records a boot timeline step, when recording"""
+        if self.recording:
+            self.timeline.append((label, time.ticks_ms(), gc.mem_alloc()))
+
+    def boot_done(self):
+        """Marks the end of boot and hands the report to the hook"""
+        self.mark("login ready")
+        if self.recording:
+            self.on_boot(self.report())
+
+    def report(self):
+        """Boot timeline and imports, as lines of text"""
+        lines = ["Boot timeline (ms, heap bytes):"]
+        if self.timeline:
+            start = previous = self.timeline[0][1]
+            for label, ticks, heap in self.timeline:
+                lines.append(
+                    "%6d %+6d %8d  %s" % (ticks - start, ticks - previous, heap, label)
+                )
+                previous = ticks
+        lines.append("Imports (ms, heap bytes):")
+        for name, elapsed, cost in self.imports:
+            lines.append("%6d %8d  %s" % (elapsed, cost, name))
+        return "\n".join(lines)
+
+
+residency = ModuleResidency()
@@ -35,6 +35,17 @@ BMP_IMAGE_EXTENSION = ".bmp"
 PBM_IMAGE_EXTENSION = ".pbm"
 SVG_IMAGE_EXTENSION = ".svg"
 
+# Chunked writes are gathered into a buffer of this size before reaching the card
+WRITE_BUFFER_SIZE = 4096
+
+
+def iter_chunks(data, chunk_size=WRITE_BUFFER_SIZE):
+    """Yields data in slices of chunk_size, without copying bytes data"""
+    if not isinstance(data, str):
+        data = memoryview(data)
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
+
 
 class SDHandler:
     """A simple handler to work with files on SDCard"""
@@ -67,6 +78,29 @@ class SDHandler:
         with open(SDHandler.PATH_STR % filename, "w") as file:
             file.write(data)
 
+    def write_chunks(self, filename, chunks, buffer_size=WRITE_BUFFER_SIZE):
+        """Writes an iterable of bytes or str chunks into the filename, truncating
+        the file first, through a fixed size buffer"""
+        buffer = memoryview(bytearray(buffer_size))
+        used = 0
+        with open(SDHandler.PATH_STR % filename, "wb") as file:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode()
+                length = len(chunk)
+                if used + length > buffer_size:
+                    if used:
+                        file.write(buffer[:used])
+                        used = 0
+                    # Chunks that don't fit the buffer go straight to the card
+                    if length > buffer_size:
+                        file.write(chunk)
+                        continue
+                buffer[used : used + length] = chunk
+                used += length
+            if used:
+                file.write(buffer[:used])
+
     def read_binary(self, filename):
         """Reads the filename in binary format and returns the data"""
         with open(SDHandler.PATH_STR % filename, "rb") as file:
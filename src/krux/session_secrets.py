@@ -0,0 +1,106 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2026 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Caches of secrets kept for the session, zeroized when the context is cleared"""
+
+import os
+import hashlib
+
+# Clear function of each registered cache, by module name
+_caches = {}
+
+# HMAC inner and outer pads of the session key caches are looked up with
+_hash_pads = bytearray(128)
+
+
+def _renew_hash_key():
+    key = os.urandom(32) + bytes(32)
+    _hash_pads[:64] = bytes(b ^ 0x36 for b in key)
+    _hash_pads[64:] = bytes(b ^ 0x5C for b in key)
+
+
+_renew_hash_key()
+
+
+def keyed_hash(*parts):
+    """HMAC-SHA256 of the parts with a random session key. Caches are looked up
+    by it, so they don't keep a fast hash of the secrets they derive from"""
+    inner = hashlib.sha256(_hash_pads[:64])
+    for part in parts:
+        inner.update(len(part).to_bytes(4, "big"))
+        inner.update(part)
+    outer = hashlib.sha256(_hash_pads[64:])
+    outer.update(inner.digest())
+    return outer.digest()
+
+
+def zeroize(buffer):
+    """Overwrites a bytearray with zeroes"""
+    for i in range(len(buffer)):
+        buffer[i] = 0
+
+
+class SecretCache:
+    """Bounded cache of secrets derived in the session, least recently used
+    evicted first. Entries are found by a keyed hash of what they're derived
+    from and zeroized when evicted or cleared"""
+
+    def __init__(self, size):
+        self.size = size
+        self.secrets = {}
+        self.order = []
+
+    def get(self, derive, *parts):
+        """Returns the secret derived from parts, calling derive() only if it
+        isn't cached"""
+        cache_key = keyed_hash(*parts)
+        secret = self.secrets.get(cache_key)
+        if secret is None:
+            secret = bytearray(derive())
+            if len(self.order) >= self.size:
+                zeroize(self.secrets.pop(self.order.pop(0)))
+            self.secrets[cache_key] = secret
+        else:
+            self.order.remove(cache_key)
+        self.order.append(cache_key)
+        return bytes(secret)
+
+    def clear(self):
+        """Zeroizes and forgets all secrets"""
+        for secret in self.secrets.values():
+            zeroize(secret)
+        self.secrets.clear()
+        self.order.clear()
+
+
+def register_cache(name, clear):
+    """Registers the function clearing a module's cache of secrets. A module
+    imported again replaces its previous copy, whose cache is cleared first"""
+    if name in _caches:
+        _caches[name]()
+    _caches[name] = clear
+
+
+def clear_caches():
+    """Zeroizes and forgets the secrets of every registered cache"""
+    for clear in _caches.values():
+        clear()
+    _renew_hash_key()
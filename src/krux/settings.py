@@ -26,6 +26,7 @@
 
 import ujson as json
 import os
+import sys
 
 # Settings storage
 SD_PATH = "sd"
@@ -47,6 +48,13 @@ THIN_SPACE = " "  # "\u2009"
 ELLIPSIS = "…"  # "\u2026"
 
 
+def notify_flash_write():
+    """Tells the erased flash blocks map, if in use, that files changed"""
+    flash_blocks = sys.modules.get("krux.flash_blocks")
+    if flash_blocks:
+        flash_blocks.flash_blocks.spiffs_changed()
+
+
 class SettingsNamespace:
     """Represents a settings namespace containing settings and child namespaces"""
 
@@ -265,6 +273,7 @@ class Store:
                 os.remove(Store.get_vfs_location(SD_PATH) + SETTINGS_FILENAME)
             else:
                 os.remove(Store.get_vfs_location(FLASH_PATH) + SETTINGS_FILENAME)
+                notify_flash_write()
         except:
             pass
 
@@ -287,6 +296,8 @@ class Store:
                     with open(settings_filename, "w") as f:
                         f.write(new_contents)
                     persisted = True
+                    if FLASH_PATH in self.file_location:
+                        notify_flash_write()
                 except:
                     pass
             self.dirty = False
@@ -32,381 +32,3 @@ available_languages = [
     "vi-VN",
     "zh-CN",
 ]
-ref_array = [
-    232475068,
-    1185266064,
-    1503087751,
-    417909373,
-    2032388104,
-    3012047951,
-    1178563089,
-    1696437881,
-    2792960854,
-    3348584292,
-    1099786887,
-    2739590230,
-    1310058127,
-    1949634023,
-    2995482424,
-    1043817877,
-    3439746594,
-    4121028614,
-    3270727197,
-    900375497,
-    2693258820,
-    3857613120,
-    1056821534,
-    1868069640,
-    3247612282,
-    3455872521,
-    4151330982,
-    2756316330,
-    2256777600,
-    2568189522,
-    3937333362,
-    2046615409,
-    928727036,
-    2519455027,
-    2363604010,
-    2038226551,
-    3138204438,
-    1207696150,
-    1583186953,
-    2701393562,
-    3768416405,
-    388908871,
-    3442025874,
-    3119547911,
-    1187826970,
-    4011811253,
-    422237057,
-    1464900930,
-    3625040530,
-    4094072796,
-    167798282,
-    678449760,
-    1347214433,
-    3513215254,
-    1741764813,
-    3585411775,
-    728946210,
-    124617190,
-    597912140,
-    2108114910,
-    2504034831,
-    2751113454,
-    1272005728,
-    1438688312,
-    4102535566,
-    3200465747,
-    2940689088,
-    1712856005,
-    4150351825,
-    3278654271,
-    3895447625,
-    1664326073,
-    3836852788,
-    690625786,
-    382368239,
-    2835747520,
-    1677527652,
-    2238845196,
-    3582575312,
-    1244124409,
-    1850904157,
-    2968548114,
-    350279787,
-    2601598799,
-    2012523321,
-    2325729718,
-    3728766873,
-    4046271639,
-    1446326,
-    531519336,
-    3625557340,
-    1781892685,
-    889040671,
-    1505332462,
-    3838465623,
-    1883247725,
-    692902568,
-    1711312434,
-    3981762528,
-    44497516,
-    572371442,
-    383371114,
-    3215045701,
-    2946146830,
-    262248294,
-    104500973,
-    3313339187,
-    859274479,
-    4014189410,
-    3804482397,
-    4006602858,
-    828589330,
-    2777318640,
-    1384661010,
-    1406590538,
-    1077771640,
-    1893243331,
-    1871146425,
-    3549015533,
-    602716148,
-    1198393582,
-    133139382,
-    3384260162,
-    3563141210,
-    2691246967,
-    3903754133,
-    3876651191,
-    299066170,
-    2880010062,
-    3327483300,
-    1102202885,
-    3242179508,
-    649035497,
-    3248804547,
-    2585599782,
-    870847764,
-    4093416954,
-    237577215,
-    4122897393,
-    640219121,
-    3218124392,
-    3000888649,
-    3264569915,
-    3835918229,
-    911419226,
-    766317539,
-    4180141032,
-    3663022166,
-    4275937437,
-    972436696,
-    2176866982,
-    1792105747,
-    2820726296,
-    2369474953,
-    2256441194,
-    237136240,
-    879727077,
-    1936877965,
-    3330705289,
-    1103622893,
-    1806062603,
-    3047003643,
-    3749589954,
-    2251738018,
-    1177338798,
-    2817059741,
-    3252633729,
-    2030045667,
-    762611188,
-    235032255,
-    2938615129,
-    3928301843,
-    1948316555,
-    1584070924,
-    1443208255,
-    1237332019,
-    2939797024,
-    73574491,
-    3634967631,
-    4063104189,
-    2325721074,
-    2474845199,
-    4092516657,
-    3089363813,
-    1577637745,
-    391304453,
-    3262227925,
-    887782534,
-    78697905,
-    995862913,
-    2987800462,
-    3913146360,
-    1293312103,
-    3559456868,
-    4249903283,
-    433951968,
-    3745269737,
-    500286397,
-    3040011773,
-    140802882,
-    2578106186,
-    1703779997,
-    3561756278,
-    784609464,
-    473757803,
-    978980745,
-    1783312036,
-    3113361245,
-    4099367945,
-    3037062877,
-    1194789404,
-    150931127,
-    828971929,
-    3339507095,
-    1123106929,
-    3903571079,
-    3445328511,
-    3593149291,
-    2580599003,
-    3749767527,
-    1693597581,
-    1848310591,
-    1175214440,
-    1720022112,
-    710709610,
-    3338633658,
-    2697857197,
-    1658501467,
-    3739634002,
-    1476462492,
-    1557093280,
-    2817311427,
-    2365886561,
-    348570661,
-    3091105710,
-    2745908239,
-    1662254634,
-    1963678224,
-    770350922,
-    3271055013,
-    432366011,
-    2502134705,
-    3976793317,
-    2736513298,
-    1166743226,
-    817419367,
-    699906428,
-    2163347007,
-    3531742595,
-    4038050830,
-    763824768,
-    4117455079,
-    4038076821,
-    923277590,
-    4006316572,
-    2736506158,
-    2029624154,
-    289960586,
-    1022211991,
-    4255182430,
-    3753172956,
-    2186790517,
-    473154195,
-    563836138,
-    712533907,
-    1959451368,
-    1843401008,
-    1825881236,
-    3656120779,
-    781397661,
-    1061961408,
-    2293863356,
-    2879966040,
-    4282338366,
-    1512492264,
-    1988416729,
-    3672006076,
-    2420425663,
-    1100365444,
-    2281377987,
-    2019512665,
-    2344747135,
-    2863098142,
-    2090568351,
-    1260825919,
-    1075810813,
-    2272013587,
-    1232757391,
-    3303592908,
-    720041451,
-    802128782,
-    2644495149,
-    3514476519,
-    2596024031,
-    2440924821,
-    1898550184,
-    800394111,
-    2270688958,
-    4228215415,
-    2336603177,
-    3679411849,
-    1820163048,
-    1779093997,
-    912182018,
-    3701549678,
-    2612594937,
-    1454688268,
-    1180180513,
-    2258131455,
-    2700207481,
-    725348723,
-    3684696112,
-    2978718564,
-    2732611775,
-    401829098,
-    2061556020,
-    1128404172,
-    2089395053,
-    1374262427,
-    2518890350,
-    2786714360,
-    2674953168,
-    2402455261,
-    1654864668,
-    3308623336,
-    2902186319,
-    1143897823,
-    3336226318,
-    3984160815,
-    4003084591,
-    3846217531,
-    1889659487,
-    4191058607,
-    1254681955,
-    525309547,
-    590330112,
-    1947603760,
-    2070221228,
-    2504354847,
-    2076481321,
-    2297028319,
-    3409743444,
-    4232654916,
-    2587172867,
-    2499782468,
-    2671738224,
-    2667840506,
-    797660533,
-    3742424146,
-    2965123464,
-    903400125,
-    3368232542,
-    3520459693,
-    1303016265,
-    619317523,
-    1688347225,
-    3673250051,
-    2790566116,
-    3432495124,
-    4107345477,
-    1485039972,
-    821291630,
-    1005359484,
-    2171149824,
-    917737941,
-    615831403,
-    3680102825,
-    288746123,
-    202776360,
-    1735708505,
-    1597139208,
-    4083195433,
-    2595315106,
-    2845072720,
-    2904991687,
-    1875891934,
-]
@@ -19,382 +19,335 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-# pylint: disable=C0301
-translation_array = [
-    "% des Betrags.",
-    "%d von %d Multisig",
-    "%d bis %d ",
-    "%s Bits",
-    "%s Bytes",
-    "%s Zchn.",
-    "%s wurde entfernt.",
-    "%s: geladen!",
-    "(%s Bits/px)",
-    "(Experimental)",
-    "(nur zur Betrachtung)",
-    "12 Wörter",
-    "24 Wörter",
-    "Über",
-    "Konto",
-    "Kontoindex",
-    "Wallet-Passphrase hinzufügen oder ändern?",
-    "Zusätzliche Entropie von der Kamera erforderlich für %s",
-    "Adresse",
-    "Richte Kamera und Sicherungsplatte richtig aus.",
-    "Blendschutzmodus",
-    "Aussehen",
-    "Bist Du sicher?",
-    "BGR-Farben",
-    "BIP39-Mnemonik",
-    "Zurück",
-    "Zurück zum Menü",
-    "Mnemonik-Backup",
-    "Ungültige Signatur",
-    "Base64-Passwort",
-    "Baudrate",
-    "Binäres Gitter",
-    "Randpolsterung",
-    "Helligkeit",
-    "Tasten",
-    "Entprellung der Tasten",
-    "Aufnahme abgebrochen",
-    "Change Adresse",
-    "Thema ändern und neu starten?",
-    "Geldbörse ändern?",
-    "Change:",
-    "Änderungen bleiben bis zum Herunterfahren bestehen.",
-    "Prüfe SD-Karte",
-    "Überprüfen, ob diese Adresse zu dieser Wallet gehört?",
-    "Überprüfte %d Adresse ohne Übereinstimmungen.",
-    "SD-Karte wird gesucht…",
-    "Bestätigen Sie den Tamper Check Code",
-    "Datum konvertieren",
-    "Änderungsadresse konnte nicht ermittelt werden.",
-    "QR Code erstellen",
-    "QR-Code aus Text erstellen?",
-    "Erstellt:",
-    "Aktueller Tamper Check Code",
-    "Benutzerdefinierter Link QR-Code",
-    "Custom Text",
-    "Anpassen",
-    "Wenn Sie Ihr Wallet anpassen, wird ein neuer Schlüssel generiert und der Deskriptor entladen.",
-    "Schnitttiefe",
-    "Cut-Methode",
-    "Datum-Werkzeug",
-    "Dezimal",
-    "Entschlüsseln?",
-    "Standard-Wallet",
-    "Diese Datei löschen?",
-    "Tiefe pro Durchgang",
-    "Derivation-Pfad",
-    "BIP85-Entropie ableiten?",
-    "Deskriptor-Adressen",
-    "Gerätetests",
-    "Bildschirm",
-    "Schalten Sie das Gerät nicht aus, es kann eine Weile dauern.",
-    "Konvertierung abgeschlossen",
-    "Fertig?",
-    "Doppelte Gedächtnisstütze",
-    "Driver",
-    "Leer",
-    "Aktivieren?",
-    "Verschlüsseln",
-    "Verschlüsselt",
-    "Verschlüsselter QR-Code",
-    "Speicherung der verschlüsselten Mnemonic mit ID:",
-    "Verschlüsselte Mnemonic wurde nicht gespeichert",
-    "Verschlüsselung",
-    "Verschlüsselungsmodus",
-    "Geben Sie %d BIP39 Wörter ein.",
-    "Geben Sie einen Tamper Check Code mit 6+ Zeichen ein",
-    "Gib jedes Wort Deiner BIP39 Mnemonic als Zahl von 1 bis 2048 ein.",
-    "Gib jedes Wort Deiner BIP39 Mnemonic als Hexadezimalzahl von 1 bis 800 ein.",
-    "Gib jedes Wort Deiner BIP39 Mnemonic als Oktalzahl von 1 bis 4000 ein.",
-    "Gib jedes Wort Deiner BIP39 Mnemonic ein.",
-    "Benutzerdaten löschen",
-    "Benutzerdaten werden gelöscht…",
-    "Fehler:",
-    "Esc",
-    "Dateien durchsuchen?",
-    "Adressen exportieren",
-    "%s wird auf SD-Karte exportiert…",
-    "Öffentlicher Schlüssel",
-    "Werkeinstellungen",
-    "Fehler beim Sammeln der Kameraentropie",
-    "Daten konnten nicht umgewandelt werden.",
-    "Entschlüsselung fehlgeschlagen",
-    "Laden fehlgeschlagen.",
-    "Mnemonic konnte nicht gespeichert werden",
-    "Gebühr:",
-    "Vorschubgeschwindigkeit",
-    "Dateiname",
-    "Dateiname %s existiert auf SD-Karte.",
-    "Den Flash mit Entropie von der Kamera füllen?",
-    "Flash wird gefüllt",
-    "Fingerabdruck in PSBT deaktiviert",
-    "Flash-Karte",
-    "Flash-Tools",
-    "Flash gefüllt mit Kameraentropie",
-    "Flötendurchmesser",
-    "Frei:",
-    "Vom Speicher",
-    "Löschen Sie Ihre SD-Karte vollständig in einem anderen Gerät, um sicherzustellen, dass die Daten nicht wiederhergestellt werden können",
-    "Mnemonik erzeugen",
-    "Go",
-    "Gute Entropie",
-    "Hardware",
-    "Kopfart",
-    "Hex öffentlicher Schlüssel:",
-    "Hexadezimal",
-    "Mnemonics ausblenden",
-    "Hohe Gebühren!",
-    "ID",
-    "ID existiert bereits",
-    "Wenn Ihr Gerätedisplay nach dieser Änderung nicht funktioniert, wird es nach 5 Sekunden automatisch mit den vorherigen Einstellungen neu gestartet.",
-    "Index",
-    "Input (%d):",
-    "Unzureichende Entropie!",
-    "Ungültiger Tamper Check Code",
-    "Ungültige Adresse",
-    "Ungültiger Derivation-Pfad",
-    "Ungültige mnemonische Lange",
-    "Ungültige Wallet:",
-    "Umkehren",
-    "Invertierte Farben",
-    "KEF-verschlüsselt",
-    "Schlüssel",
-    "Schlüssel wurde nicht zur Verfügung gestellt",
-    "Krux Drucker Test-QR",
-    "LCD-Typ",
-    "Sprache",
-    "Lassen Sie das Feld leer, wenn Sie möchten, dass Krux ein gültiges letztes Wort auswählt",
-    "Links",
-    "Länge:",
-    "Leitungsverzögerung",
-    "Linie:",
-    "Adressen auflisten",
-    "Mnemonic laden",
-    "Wallet laden",
-    "Einen vertrauenswürdigen Wallet-Deskriptor laden, um Adressen anzuzeigen?",
-    "Von SD-Karte laden",
-    "Von SD-Karte laden?",
-    "Von der Kamera laden",
-    "Laden?",
-    "Kamera wird geladen…",
-    "Änderungsadressen werden geladen…",
-    "Einlegen des Druckers…",
-    "Empfangsadressen werden geladen…",
-    "Lädt…",
-    "Spracheinstellung",
-    "Speicherort",
-    "Mittel",
-    "Nachricht",
-    "Nachricht:",
-    "Miniscript",
-    "X-Koordinaten spiegeln",
-    "Fehlende Signaturdatei",
-    "Mnemonic",
-    "Mnemonisches XOR",
-    "Mnemotechnik und Passphrase werden beibehalten.",
-    "Geändert:",
-    "Netzwerk",
-    "Neue Mnemonic",
-    "Neue Firmware erkannt.",
-    "Nein",
-    "Keine Passphrase",
-    "Nicht-ASCII-Zeichen wurden in Ihrer Passphrase erkannt. Krux kann nicht garantieren, dass andere Wallets den gleichen Schlüssel ableiten.",
-    "Nicht genug Würfe!",
-    "Zahlen",
-    "Oktal",
-    "Andere Formate",
-    "Überschreiben?",
-    "PAGE zum Umschalten der Bildschirmhelligkeit",
-    "PBKDF2 iter.",
-    "Male gestanzte Punkte schwarz an, damit sie erkannt werden können.",
-    "Papierbreite",
-    "Teil",
-    "Teil M von N",
-    "Teilegröße",
-    "Passphrase",
-    "Passwortlänge",
-    "Pfad stimmt nicht überein",
-    "Muster erkannt!",
-    "Alle gespeicherten verschlüsselten Mnemoniken und Einstellungen dauerhaft vom Flash-Speicher entfernen?",
-    "Speicher",
-    "Pixelabweichungsindex:",
-    "Klartext-QR",
-    "Bitte lade einen Wallet Ausgabedeskriptor",
-    "Tauchrate",
-    "Richtlinientyp",
-    "Schlechte Entropie!",
-    "Leistung",
-    "PAGE zum Abbrechen drücken.",
-    "PAGE für Moduswechsel",
-    "Drucke Test-QR",
-    "Tinyseed drucken?",
-    "Als QR-Code drucken",
-    "Als QR-Code drucken?",
-    "Drucken?",
-    "Drucker",
-    "Druckertreiber nicht gesetzt!",
-    "Druckbild…",
-    "Trotzdem fortfahren?",
-    "Weiter?",
-    "Wird bearbeitet…",
-    "Nachweislich nicht ausgebbar",
-    "QR-Code",
-    "QR-Etikett",
-    "Menge",
-    "RX Pin",
-    "Neustart",
-    "Empfangen",
-    "Region:",
-    "Löschen %s?",
-    "Mnemonic löschen",
-    "Firmware-Dateien von der SD-Karte entfernen?",
-    "Res. - Format",
-    "Werkseinstellungen wiederherstellen und neu starten?",
-    "Ergebnis",
-    "Zurück zum QR-Viewer",
-    "Erneut Überprüfen",
-    "Überprüfe gescannte Daten und bearbeite sie bei Bedarf",
-    "Rechts",
-    "Würfel mindestens %d Mal, um eine Mnemonic zu erzeugen.",
-    "Rollenverteilung:",
-    "Würfe:",
-    "Um 180 Grad drehen",
-    "SD-Karte",
-    "SD-Karte nicht erkannt.",
-    "SHA256 der Würfe:",
-    "SHA256 des Snapshots:",
-    "QR-Bild auf SD-Karte speichern",
-    "Auf SD-Karte speichern",
-    "Auf SD-Karte speichern?",
-    "Auf SD-Karte gespeichert:",
-    "Skala",
-    "Adresse scannen",
-    "Scan BIP39 Passphrase",
-    "Schlüssel QR-Code Scannen",
-    "Wörter 1-12 erneut scannen",
-    "Wörter 13-24 scannen",
-    "Bildschirmschonerzeit",
-    "Script-Art",
-    "Sicherheit",
-    "Selbstübertragung oder Change (%d):",
-    "Selbstübertragung:",
-    "Legen Sie zuerst einen Tamper Check Code fest",
-    "Einstellungen",
-    "Die Einstellungen werden intern auf Flash gespeichert.",
-    "Einstellungen auf SD-Karte gespeichert.",
-    "Shannons Entropie:",
-    "Datum anzeigen",
-    "Ausschalten",
-    "Abschaltzeit",
-    "Abfahren…",
-    "Signieren",
-    "Am QR-Code unterschreiben",
-    "Auf SD-Karte signieren",
-    "Signieren?",
-    "Signatur:",
-    "Signierte Nachricht",
-    "Signierte PSBT",
-    "Signieren von Roh-Hash. Fahren Sie nur fort, wenn Sie der Quelle vertrauen.",
-    "Unterzeichnung…",
-    "Single-Sig",
-    "Größe:",
-    "Einige Schecks können nicht durchgeführt werden.",
-    "Einige Knoten sind nicht gehärtet:",
-    "Ausgabe (%d):",
-    "Ausgaben:",
-    "Standardmodus",
-    "Statisch",
-    "Statistiken für Nerds",
-    "Auf Flash speichern",
-    "Auf der SD-Karte speichern",
-    "Stärke",
-    "Stark",
-    "Wischen um den Modus zu ändern",
-    "TC Flash-Hash",
-    "TC Flash-Hash beim Start",
-    "TOUCH oder ENTER zum Erfassen",
-    "TOUCH oder ENTER zum Installieren.",
-    "TR interner Schlüssel",
-    "TX Pin",
-    "Tamper Check Code",
-    "Tamper Check Code erfolgreich gesetzt",
-    "Tamper Check Codes stimmen nicht überein",
-    "Test-Suite",
-    "Ergebnisse der Testsuite",
-    "Test:",
-    "Text",
-    "Thema",
-    "Thermisch",
-    "Um sicherzustellen, dass die Daten nicht wiederhergestellt werden können, verwenden Sie die Funktion 'Gerät löschen'",
-    "Helligkeit umschalten",
-    "Werkzeuge",
-    "Berühre Schwellenwert",
-    "Touchscreen",
-    "Weiter versuchen?",
-    "BIP39 Passphrase eingeben",
-    "Schlüssel eingeben",
-    "Widerrufen",
-    "Einheit",
-    "KEF-ID aktualisieren?",
-    "QR-Etikett aktualisieren?",
-    "Upgrade abgeschlossen.",
-    "Verwende eine schwarze Hintergrundfläche.",
-    "Verwende die Entropie der Kamera, um eine neue Mnemonic zu erstellen",
-    "Aktueller Wert",
-    "Standard verwenden?",
-    "Standard-PBKDF2-Iteration verwenden.?",
-    "Fingerabdruck als ID verwenden?",
-    "Belegt:",
-    "Benutzerdaten",
-    "Wert %S außerhalb  des Bereichs: [ %s, %s]",
-    "Überprüfung…",
-    "Version",
-    "Via Kamera",
-    "Via D20",
-    "Via D6",
-    "Via manueller Eingabe",
-    "Via Wörter",
-    "Sichtbares Etikett",
-    "Warte auf die Erfassung",
-    "Wallet",
-    "Wallet-Deskriptor",
-    "Geldbörse passt nicht:",
-    "Wallet Ausgabedeskriptor",
-    "Wallet Ausgabedeskriptor geladen!",
-    "Wallet Ausgabedeskriptor nicht gefunden.",
-    "Warnung:",
-    "Schwach",
-    "Wort %d",
-    "Wortnummern",
-    "Wörter",
-    "XOR-Ergebnis",
-    "XOR mit",
-    "XOR-Strommnemotechnik mit einer anderen? (Passphrase und Deskriptor werden verworfen)",
-    "Ja",
-    "Zoommodus",
-    "binär:",
-    "failed:",
-    "aus SECHSKANT",
-    "von base32",
-    "von base43",
-    "von base64",
-    "aus Sechskant",
-    "von utf8",
-    "ist eine gültige Adresse!",
-    "schaltkoffer",
-    "Erfolgsrate:",
-    "wischen",
-    "text:",
-    "zu SECHSKANT",
-    "zu base32",
-    "an base43",
-    "zu base64",
-    "zu Sechskant",
-    "zu utf8",
-    "unbekannt",
-    "wurde in den ersten %d Adressen nicht gefunden",
-]
+# pylint: disable=C0103,C0301
+catalog = (
+    b"[\x01\xb6\x11\x16\x00l\xfa\xa6\x02[\xa8b\x04\xed\x8e:\x06\xe6\x81m\x07B{d\x08\xb7\x06\xff\x08\nf"
+    b'\x00\n(\x1f\x16\x0c\xbcI\xdb\rpi"\x0e\xff#)\x0ef\x97\xa1\x0f\x8arH\x11%\xc4\xc6\x14k\xd8'
+    b"\xe0\x14j\xc7\xd9\x16GG.\x17\x05\xd5R\x17\xeal\xf3\x17}\xca\xe8\x18\x81\xd3*\x19\xbba\xc5\x19\xe0\x94"
+    b'\xdd\x19\x93\xc23\x1ck\xf8<\x1c\xbd\xc3\xd1\x1dhW\xae\x1f\xeat\x9b!\xf2\xb1\x1d"\x00\xb9/#Lj'
+    b"\xa3#k\xd7\xb4$\x13\t\xea$\xf1\xf7(&\xe9~\xaf&`Rp(\xfa\x1c*)\xa8\xdaL)|\xb9"
+    b'\xb7)\x93gx*\xeb\xf5\xea*s\xf1;+"\xd6r+\xf4\x85t-\x80\n\x87-\xe3\x13\xad-J\x9f'
+    b"\xea-\x9d.\x93.\xb80\xc4.uU\x8b/\x7f\x0b\xb5/\x8e\x83\xcf/g\xd4\xb80n\xea\xf30\x12E"
+    b"c1\x99\x1bi1\xef|73\x14\x15\xe83\xe5\x91o4\x86|\xea4\x1f\xaf\xfd4\xc9\xa3\xaa5\xbd\xca"
+    b"\xd85Z'S6\x02\xcb^6\xd5\x91\xb36\x16\x19\x087\xfc?[7\xd84\xf69\x89\x0fZ:\x81\xa9"
+    b"[;|\x91\xec;\x97\xb7\xed<\x95e7>\x1e\xd1\xfd>\xc0>L?\xfd\x91\x1f@x}=@\x87j"
+    b"\x8dA\x84>\x96A\xed\xf2\xc7Aq@\xf1B\xcc\x14BC\xdf~.D\xba\x16\x8bEhY\x0cF\xae\xc3"
+    b",F\x11r?F! XF\x90\xb9\xa5F\x1a\xcd\xccF\x1c\n7G\xee\x08nG\x16\xfb\xfbG\x8fb"
+    b"zI30\xc0I\xf9\xd4'J?\xad&K`D\xd1Kg`\x16MIs\xaaM\x8f\xe6\x15Na\xdc"
+    b"LP\x9b\x94\xe9Q\x12@\x88RJ\xde\xd6S8\xa4\xc0U?\x9c\x05V\x0c\xc8\xb4VB\x9dPW\x9c\x07"
+    b"\x01Xd\xe9\x83X\x87L\x97Y\xe8\xcc&Z\xa0[\xcf\\q\xd7\x08^\t\x84]^\x0c\x01k^\x08i"
+    b'2_\x1c;\xa3b*\xfe\x13c\xb9\x993cd\n\xfdcY"\xa2d\x8d?\xf2dy\x96\x1de\x9d\x9e'
+    b"\x8de2\x8e\x00f\xc5\x1b\x18f`t\x85fY\xcftg\xed\xd1\njM\x865j\xa4.Kj\x13]"
+    b"\xd1j\x0bT\xa6k\xe8{}l\x94\xbc\xd4l0\x11\xe0m?\xfb*n]\x8eRn\x08{Xo\xb9m"
+    b"\x87o\xde\xd6\xcfom\x14@p\xc3\x99\xd8p\xa8\x93)q\x8dirs0\x13\x16t\xe7\r5t\xe8\xda"
+    b"\xcat\x10Z\x0bu\xd9\xd4\x84v9\xab\xf4wYQ_xZ\x9b\xf9x\xe3\t\x00y\x08\xc8#yw\xde"
+    b"|yq\xdf\xfcy4\xd9\xe0z\xac\x11e{m\xa3\x89|\x9f\x8a\x9b|\xdeG\xa7}?\x0e\xf2\x80\x00\x1e"
+    b"i\x81\xa6Z\xc0\x81u\xc6W\x82\x0c\x11r\x85\xa2\xcb6\x86j\x8f~\x86\x80\xb1\x83\x86\xffY\x98\x86\xbe\xf6"
+    b"W\x87\x13-l\x87\xc3\x10\xfb\x87\xbc\x93\xb9\x88\xdf\xde\xe9\x88\xf2\xaf\x9f\x8a\xb6\xd1\x9f\x8a\x7f\x00\xc2\x8b*\xbc"
+    b"\xe1\x8ca\x90\x04\x8d\x89Q;\x8d\xdd\x8e2\x8f\xbf\xc3D\x90\x95\x8e}\x91\x0f$\x83\x93D\xa7\xff\x94\xb1\x8b"
+    b"#\x95\x0f\x8a@\x95\x1flE\x95n7#\x963\xd5+\x96Rv\x13\x99J\xc7\xaa\x99\xdb\xd0\xd0\x99&\x1f"
+    b"\x1d\x9a\x03 5\x9a\xa2]\xb1\x9a\xdf.\xbc\x9aO?\x11\x9b-\xcb\x9f\x9d\xfa\x03\x04\x9fp}?\x9f\xd0\x8b"
+    b"p\x9fw+i\xa0D\xde\x87\xa0\xad\x08\xce\xa0y\xe5\xf1\xa0\x9a\xfe\x03\xa1\xbfX\xe0\xa2.\xc5\x1b\xa3\x12\xe1"
+    b"\x1b\xa3V\xd4J\xa3\x0f<\xab\xa3\xee\xa8\xfa\xa3\xaa\x0cJ\xa4\xf0\x84\x8a\xa5\xf8\xe2\x19\xa6\xe4\xa8T\xa6V3"
+    b"y\xa6\x9d\xeb\xe8\xa7\x18\xde \xa8\xc0\x12\x06\xa9P]\x94\xa9\x1ei\xa7\xaaX\xcb\xa8\xabNw\xa9\xabO\xd9"
+    b"\xfb\xac\xc7\xa7&\xadY\xb5'\xaf \xbe9\xaf\xc0ZG\xaf\x0e\xa2\x9a\xaf\x881\xbc\xb0\x12s\xf0\xb0\x8e7"
+    b"\x16\xb28o\x8b\xb2I\xed\xdd\xb2O4\x88\xb3\xdd\xe6\x05\xb5\xfd\xe52\xb5\xfb\x95\x9d\xb5e\xf3#\xb8\xae\x87"
+    b">\xb8]\x1f\x92\xb9\x07\x86\xf0\xb9\x163\r\xbbS;\xc3\xbeE\xb4\xa1\xbfh\xae\xd0\xbf\xb4\xbb?\xc1z\xa1"
+    b"\x92\xc1\xc3\xd2\xa4\xc1\x81@\xdf\xc1\xd5\xa5q\xc2;b\x95\xc2\x1dV\xf3\xc2\xa5V\xf8\xc2?Kl\xc3\xcc\xd3"
+    b"\xe8\xc4\xe8\x955\xc53\x8b}\xc5\xa4]U\xc6\x89\x87\x86\xc6\x0e\xc6\xda\xc6\xba\x81\xff\xc6\x97\xd5\x0c\xc7^&"
+    b'\xc3\xc8B\xb6\xb7\xc9T\x8e<\xcb\x14\xb8\x97\xcc"^\x06\xcd\x92%)\xcd\x7f\x8a[\xcd\tn\xfc\xcd\x16i'
+    b"g\xd1\xe7\xa7z\xd1\xad\xf3\xd5\xd1\x83\x1d\x82\xd2\xed\xad\x89\xd3d\x00)\xd4v\x16L\xd4Z8a\xd4\xd0\xc2"
+    b"\x89\xd5\xbf\n\xb5\xd5k\x1b+\xd6\x92\xba\x11\xd8\\\x9d\x19\xd8O4\xa9\xd8\xcb\xf9\xeb\xd9VHU\xda\xbc]"
+    b"\xde\xda\x89^O\xdb\xa9\xe9Y\xdb0\x00\xa0\xdb\x99w@\xdeRI\xe6\xdeR\xdc\x10\xdf\xe9G<\xdf\xc23"
+    b"~\xdfg\xe9\x80\xdf\xdc\xdf\xb4\xdf]\xcb\xc3\xe2\x95w\xa3\xe44\xba\xb1\xe4WV\xca\xe4;\x9f@\xe5@\x81"
+    b"\xee\xe5\xb7\x00\x11\xe7I\xd0/\xe8\x87\xc4\xab\xe8\x95\x8f\xae\xe8\xf8\xdf=\xe9\x13!%\xea\xe5\x0c\t\xed\xe0\xdf"
+    b"T\xed/xy\xed/9\x9a\xee\x1c\x8a\xcb\xeej\xe8\xcf\xee\xb5a\x1f\xefb\xabC\xef\x0e\xc4\xaf\xf0\x974"
+    b"-\xf1\xbd\x0c.\xf2)\x9e`\xf31\xd9\xee\xf3\xfa\x95\xfc\xf3\xdc\x97\x06\xf4\tdW\xf4\x8e\xb9\x87\xf4E\x1e"
+    b"\xd1\xf4\xe7`k\xf5\x06\xe8\xa1\xf5\xf1k\xbe\xf5\xd1Wa\xf7\xa6Hp\xf7\xe8\xe3'\xf9\xafz\xce\xf9D0"
+    b"I\xfc^\xee\xa0\xfd\x9d\xa0\xdd\xfe>L?\xff\x00\x00\x00\x00F\x00\x00\x00l\x00\x00\x00y\x00\x00\x00\x90\x00"
+    b"\x00\x00\x9c\x00\x00\x00\xa4\x00\x00\x00\xb7\x00\x00\x00\xd2\x00\x00\x00\xde\x00\x00\x00\xec\x00\x00\x00\xfe\x00\x00\x00\x10\x01"
+    b'\x00\x00\x18\x01\x00\x00"\x01\x00\x00*\x01\x00\x00:\x01\x00\x00Y\x01\x00\x00\x8d\x01\x00\x00\x9b\x01\x00\x00\xb4\x01'
+    b"\x00\x00\xbb\x01\x00\x00\xe0\x01\x00\x00\xe7\x01\x00\x00\xf5\x01\x00\x00\x02\x02\x00\x00\x10\x02\x00\x00\x1f\x02\x00\x00H\x02"
+    b"\x00\x00~\x02\x00\x00\xa5\x02\x00\x00\xba\x02\x00\x00\xc5\x02\x00\x00\xd1\x02\x00\x00\xda\x02\x00\x00\xec\x02\x00\x00\x03\x03"
+    b"\x00\x00\x0c\x03\x00\x00'\x03\x00\x00I\x03\x00\x00g\x03\x00\x00\x8e\x03\x00\x00\xa8\x03\x00\x00\xb1\x03\x00\x00\x0f\x04"
+    b"\x00\x00\x19\x04\x00\x00\x1e\x04\x00\x00%\x04\x00\x00]\x04\x00\x00h\x04\x00\x00q\x04\x00\x00x\x04\x00\x00\x9a\x04"
+    b"\x00\x00\xa1\x04\x00\x00\xb6\x04\x00\x00\xc3\x04\x00\x00\xce\x04\x00\x00\xe2\x04\x00\x00\x06\x05\x00\x00!\x05\x00\x004\x05"
+    b"\x00\x00`\x05\x00\x00g\x05\x00\x00\x96\x05\x00\x00\xa2\x05\x00\x00\xa9\x05\x00\x00\xc1\x05\x00\x00\xcd\x05\x00\x00\xe7\x05"
+    b"\x00\x00\xf5\x05\x00\x00\t\x06\x00\x00\x1c\x06\x00\x00_\x06\x00\x00g\x06\x00\x00q\x06\x00\x00{\x06\x00\x00\x8a\x06"
+    b"\x00\x00\x93\x06\x00\x00\xa0\x06\x00\x00\xa5\x06\x00\x00\xba\x06\x00\x00\xcb\x06\x00\x00\xe1\x06\x00\x00\xe8\x06\x00\x00\xf2\x06"
+    b"\x00\x00\x11\x07\x00\x00#\x07\x00\x00-\x07\x00\x00>\x07\x00\x00P\x07\x00\x00Y\x07\x00\x00k\x07\x00\x00\x9b\x07"
+    b"\x00\x00\xac\x07\x00\x00\xb9\x07\x00\x00\xc7\x07\x00\x00\xdd\x07\x00\x00\xe7\x07\x00\x00\xff\x07\x00\x00\x08\x08\x00\x00\x17\x08"
+    b"\x00\x00#\x08\x00\x00%\x08\x00\x00/\x08\x00\x00J\x08\x00\x00_\x08\x00\x00\x80\x08\x00\x00\x92\x08\x00\x00\xa7\x08"
+    b"\x00\x00\xd6\x08\x00\x00\xdb\x08\x00\x00\xed\x08\x00\x00\xfe\x08\x00\x00\x08\t\x00\x00\x12\t\x00\x00\x1b\t\x00\x00G\t"
+    b"\x00\x00L\t\x00\x00j\t\x00\x00z\t\x00\x00\x83\t\x00\x00\x91\t\x00\x00\xc9\t\x00\x00\xe4\t\x00\x00\xef\t"
+    b"\x00\x00\xf6\t\x00\x00\x12\n\x00\x00\x1e\n\x00\x00)\n\x00\x00A\n\x00\x00T\n\x00\x00Y\n\x00\x00b\n"
+    b"\x00\x00l\n\x00\x00\x8d\n\x00\x00\x95\n\x00\x00\xa7\n\x00\x00\xcb\n\x00\x00\xf4\n\x00\x00\xff\n\x00\x00\r\x0b"
+    b"\x00\x00\x14\x0b\x00\x00E\x0b\x00\x00O\x0b\x00\x00\xd9\x0b\x00\x00\x07\x0c\x00\x00\x1b\x0c\x00\x00'\x0c\x00\x00D\x0c"
+    b"\x00\x00X\x0c\x00\x00c\x0c\x00\x00h\x0c\x00\x00z\x0c\x00\x00\x80\x0c\x00\x00\x93\x0c\x00\x00\xb2\x0c\x00\x00\xba\x0c"
+    b"\x00\x00\xcf\x0c\x00\x00\xd8\x0c\x00\x00\xe0\x0c\x00\x00\xf6\x0c\x00\x00\x05\r\x00\x00\x18\r\x00\x00*\r\x00\x001\r"
+    b"\x00\x00>\r\x00\x00L\r\x00\x00b\r\x00\x00|\r\x00\x00\x82\r\x00\x00\xaf\r\x00\x00\xbd\r\x00\x00\xc5\r"
+    b'\x00\x00\x0f\x0e\x00\x00"\x0e\x00\x00\x99\x0e\x00\x00\xaf\x0e\x00\x00\xb7\x0e\x00\x00\xc1\x0e\x00\x00\xda\x0e\x00\x00\xeb\x0e'
+    b"\x00\x00\xfb\x0e\x00\x00/\x0f\x00\x00a\x0f\x00\x00g\x0f\x00\x00\x9b\x0f\x00\x00\xa7\x0f\x00\x00\xeb\x0f\x00\x006\x10"
+    b"\x00\x00N\x10\x00\x00\xd8\x10\x00\x00\x00\x11\x00\x00\x12\x11\x00\x00\x19\x11\x00\x000\x11\x00\x00I\x11\x00\x00S\x11"
+    b"\x00\x00b\x11\x00\x00x\x11\x00\x00\x7f\x11\x00\x00\x91\x11\x00\x00\xb2\x11\x00\x00\xbe\x11\x00\x00\xcb\x11\x00\x00\xe1\x11"
+    b"\x00\x00\xe6\x11\x00\x00\xed\x11\x00\x00\xf5\x11\x00\x00\x1f\x12\x00\x00*\x12\x00\x00:\x12\x00\x00C\x12\x00\x00X\x12"
+    b"\x00\x00k\x12\x00\x00|\x12\x00\x00\x91\x12\x00\x00\xa8\x12\x00\x00\xb2\x12\x00\x00\xc5\x12\x00\x00\xd4\x12\x00\x00\xe3\x12"
+    b"\x00\x00\xee\x12\x00\x00\x04\x13\x00\x00\x11\x13\x00\x00\x1d\x13\x00\x00(\x13\x00\x006\x13\x00\x00:\x13\x00\x00A\x13"
+    b"\x00\x00d\x13\x00\x00z\x13\x00\x00\x8e\x13\x00\x00\xb3\x13\x00\x00\xbc\x13\x00\x00\xd2\x13\x00\x00\xda\x13\x00\x00\xf2\x13"
+    b"\x00\x00\x1a\x14\x00\x00!\x14\x00\x00Q\x14\x00\x00]\x14\x00\x00b\x14\x00\x00l\x14\x00\x00t\x14\x00\x00\x82\x14"
+    b"\x00\x00\xea\x14\x00\x00\x02\x15\x00\x00\x08\x15\x00\x00\x1d\x15\x00\x009\x15\x00\x00q\x15\x00\x00\x85\x15\x00\x00\x94\x15"
+    b"\x00\x00\xa9\x15\x00\x00\xbb\x15\x00\x00\xc6\x15\x00\x00\xd4\x15\x00\x00\xf1\x15\x00\x00\xf7\x15\x00\x00\x06\x16\x00\x004\x16"
+    b"\x00\x00;\x16\x00\x00L\x16\x00\x00V\x16\x00\x00i\x16\x00\x00|\x16\x00\x00\x85\x16\x00\x00\x1a\x17\x00\x00 \x17"
+    b"\x00\x00'\x17\x00\x00/\x17\x00\x007\x17\x00\x00>\x17\x00\x00E\x17\x00\x00\\\x17\x00\x00f\x17\x00\x00\x91\x17"
+    b"\x00\x00\xa0\x17\x00\x00\xac\x17\x00\x00\xb3\x17\x00\x00\xd3\x17\x00\x00\xf2\x17\x00\x00G\x18\x00\x00^\x18\x00\x00o\x18"
+    b"\x00\x00{\x18\x00\x00\xa4\x18\x00\x00\xc1\x18\x00\x00\xcf\x18\x00\x00\xd7\x18\x00\x00\xeb\x18\x00\x00\x1b\x19\x00\x001\x19"
+    b"\x00\x00G\x19\x00\x00S\x19\x00\x00X\x19\x00\x00f\x19\x00\x00\x8b\x19\x00\x00\x92\x19\x00\x00\xa8\x19\x00\x00\xe9\x19"
+    b"\x00\x00\xf5\x19\x00\x00\x00\x1a\x00\x00\x1a\x1a\x00\x00<\x1a\x00\x00N\x1a\x00\x00a\x1a\x00\x00t\x1a\x00\x00\x88\x1a"
+    b"\x00\x00\x8f\x1a\x00\x00\xa3\x1a\x00\x00\xb3\x1a\x00\x00\xbb\x1a\x00\x00\xca\x1a\x00\x00\x07\x1b\x00\x00$\x1b\x00\x008\x1b"
+    b"\x00\x00<\x1b\x00\x00R\x1b\x00\x00Z\x1b\x00\x00k\x1b\x00\x00x\x1b\x00\x00\xa3\x1b\x00\x00\xbe\x1b\x00\x00\xdf\x1b"
+    b"\x00\x00\xf7\x1b\x00\x00%\x1c\x00\x00>\x1c\x00\x00\x89\x1c\x00\x00\x8d\x1c\x00\x00\x96\x1c\x00\x00\xa9\x1c\x00\x00\xc5\x1c"
+    b"\x00\x00\xd6\x1c\x00\x00\xec\x1c\x00\x00\xff\x1c\x00\x00\t\x1d\x00\x00\x18\x1d\x00\x00Q\x1d\x00\x00Y\x1d\x00\x00e\x1d"
+    b"\x00\x00v\x1d\x00\x00\xd1\x1d\x00\x00\xdb\x1d\x00\x00\xf3\x1d\x00\x00\x17\x1e\x00\x00\x1e\x1e\x00\x00(\x1e\x00\x00Gi"
+    b"b jedes Wort Deiner BIP39 Mnemon"
+    b"ic als Oktalzahl von 1 bis 4000 "
+    b"ein.Fehler beim Sammeln der Kame"
+    b"raentropieNeue MnemonicVorschubg"
+    b"eschwindigkeitSchnitttiefeSpeich"
+    b"erAls QR-Code druckenQR-Code aus"
+    b" Text erstellen?zu SECHSKANT% de"
+    b"s Betrags.Von SD-Karte ladenUng\xc3"
+    b"\xbcltige Wallet:Geb\xc3\xbchr:Script-Art"
+    b"ErgebnisVerschl\xc3\xbcsselungEntschl\xc3"
+    b"\xbcsselung fehlgeschlagen\xc3\x84nderung"
+    b"en bleiben bis zum Herunterfahre"
+    b"n bestehen.Andere FormateBIP39 P"
+    b"assphrase eingeben%s BitsBest\xc3\xa4t"
+    b"igen Sie den Tamper Check CodeW\xc3"
+    b"\xbcrfe:Passwortl\xc3\xa4ngeEinstellungen"
+    b"RichtlinientypMuster erkannt!Gib"
+    b" jedes Wort Deiner BIP39 Mnemoni"
+    b"c ein.Die Einstellungen werden i"
+    b"ntern auf Flash gespeichert.Date"
+    b"n konnten nicht umgewandelt werd"
+    b"en.Via manueller EingabeCut-Meth"
+    b"odeErfolgsrate:ZoommodusInvertie"
+    b"rte FarbenUnzureichende Entropie"
+    b"!Erstellt:Doppelte Ged\xc3\xa4chtnisst"
+    b"\xc3\xbctze%s wird auf SD-Karte export"
+    b"iert\xe2\x80\xa6QR-Bild auf SD-Karte spei"
+    b"chernEinstellungen auf SD-Karte "
+    b"gespeichert.Auf der SD-Karte spe"
+    b"ichernWerkzeugeWenn Sie Ihr Wall"
+    b"et anpassen, wird ein neuer Schl"
+    b"\xc3\xbcssel generiert und der Deskrip"
+    b"tor entladen.Nachricht:SkalaSpra"
+    b"cheW\xc3\xbcrfel mindestens %d Mal, um"
+    b" eine Mnemonic zu erzeugen.Abfah"
+    b"ren\xe2\x80\xa6TauchrateWort %dTOUCH oder"
+    b" ENTER zum Installieren.St\xc3\xa4rkeS"
+    b"HA256 des Snapshots:aus Sechskan"
+    b"tFlash-KarteAls QR-Code drucken?"
+    b"Dateiname %s existiert auf SD-Ka"
+    b"rte.Ung\xc3\xbcltiger Derivation-PfadV"
+    b"on SD-Karte laden?PAGE zum Umsch"
+    b"alten der BildschirmhelligkeitFe"
+    b"hler:Richte Kamera und Sicherung"
+    b"splatte richtig aus.XOR-Ergebnis"
+    b"LCD-TypErgebnisse der Testsuites"
+    b"chaltkofferSchl\xc3\xbcssel QR-Code Sc"
+    b"annenRandpolsterungLeitungsverz\xc3"
+    b"\xb6gerungSchlechte Entropie!Male g"
+    b"estanzte Punkte schwarz an, dami"
+    b"t sie erkannt werden k\xc3\xb6nnen.von"
+    b" utf8SicherheitKontoindexBist Du"
+    b" sicher?SignierenStandardmodusFr"
+    b"ei:(nur zur Betrachtung)Unterzei"
+    b"chnung\xe2\x80\xa6Kamera wird geladen\xe2\x80\xa6D"
+    b"ruckerWiderrufenFingerabdruck al"
+    b"s ID verwenden?SHA256 der W\xc3\xbcrfe"
+    b":QR-EtikettSpracheinstellung%s w"
+    b"urde entfernt.Thermisch%d von %d"
+    b" Multisig\xc3\x9cberpr\xc3\xbcfte %d Adresse"
+    b" ohne \xc3\x9cbereinstimmungen.Tinysee"
+    b"d drucken?Gute EntropieChange Ad"
+    b"resseStatistiken f\xc3\xbcr NerdsGe\xc3\xa4n"
+    b"dert:Verschl\xc3\xbcsselter QR-CodeAus"
+    b"gaben:Standard-WalletTeil M von "
+    b"NJa24 W\xc3\xb6rterAktueller Tamper Ch"
+    b"eck CodeKEF-ID aktualisieren?Fla"
+    b"sh gef\xc3\xbcllt mit KameraentropieFl"
+    b"\xc3\xb6tendurchmesserDiese Datei l\xc3\xb6s"
+    b"chen?Mnemotechnik und Passphrase"
+    b" werden beibehalten.ThemaDatum k"
+    b"onvertierenMnemonic l\xc3\xb6schenvon "
+    b"base64%d bis %d Signatur:Firmwar"
+    b"e-Dateien von der SD-Karte entfe"
+    b"rnen?OktalThema \xc3\xa4ndern und neu "
+    b"starten?Mnemonisches XORan base4"
+    b"3Aktueller Wert\xc3\x9cberpr\xc3\xbcfe gesca"
+    b"nnte Daten und bearbeite sie bei"
+    b" BedarfKonvertierung abgeschloss"
+    b"enAktivieren?bin\xc3\xa4r:Nachweislich"
+    b" nicht ausgebbar%s: geladen!Klar"
+    b"text-QR\xc3\x96ffentlicher Schl\xc3\xbcsselD"
+    b"eskriptor-AdressenMengezu base32"
+    b"Test-SuiteBenutzerdaten werden g"
+    b"el\xc3\xb6scht\xe2\x80\xa6LeistungAdressen aufl"
+    b"isten\xc3\x84nderungsadressen werden g"
+    b"eladen\xe2\x80\xa6Tamper Check Codes stim"
+    b"men nicht \xc3\xbcbereinAusschaltenDat"
+    b"um anzeigenQR-CodeSpeicherung de"
+    b"r verschl\xc3\xbcsselten Mnemonic mit "
+    b"ID:BGR-FarbenL\xc3\xb6schen Sie Ihre S"
+    b"D-Karte vollst\xc3\xa4ndig in einem an"
+    b"deren Ger\xc3\xa4t, um sicherzustellen"
+    b", dass die Daten nicht wiederher"
+    b"gestellt werden k\xc3\xb6nnenwurde in "
+    b"den ersten %d Adressen nicht gef"
+    b"undenAdressen exportierenVom Spe"
+    b"icherTOUCH oder ENTER zum Erfass"
+    b"enVon der Kamera ladenVia W\xc3\xb6rte"
+    b"r\xc3\x9cberShannons Entropie:RechtsSi"
+    b"gnierte NachrichtGeben Sie %d BI"
+    b"P39 W\xc3\xb6rter ein.Gr\xc3\xb6\xc3\x9fe:Bildschi"
+    b"rmschonerzeitNachricht%s BytesEn"
+    b"tprellung der TastenBin\xc3\xa4res Git"
+    b"terSchl\xc3\xbcssel eingebenSichtbares"
+    b" EtikettEinheitAusgabe (%d):Datu"
+    b"m-WerkzeugAuf SD-Karte speichern"
+    b"ist eine g\xc3\xbcltige Adresse!Linie:"
+    b"Legen Sie zuerst einen Tamper Ch"
+    b"eck Code festVerschl\xc3\xbcsselnL\xc3\xa4dt"
+    b"\xe2\x80\xa6Einen vertrauensw\xc3\xbcrdigen Wal"
+    b"let-Deskriptor laden, um Adresse"
+    b"n anzuzeigen?Ung\xc3\xbcltige Signatur"
+    b"Um sicherzustellen, dass die Dat"
+    b"en nicht wiederhergestellt werde"
+    b"n k\xc3\xb6nnen, verwenden Sie die Fun"
+    b"ktion 'Ger\xc3\xa4t l\xc3\xb6schen'TR intern"
+    b"er Schl\xc3\xbcsselStatischSingle-SigA"
+    b"m QR-Code unterschreibenWallet-D"
+    b"eskriptorKeine PassphraseGeben S"
+    b"ie einen Tamper Check Code mit 6"
+    b"+ Zeichen einEinige Schecks k\xc3\xb6n"
+    b"nen nicht durchgef\xc3\xbchrt werden.T"
+    b"astenWerkseinstellungen wiederhe"
+    b"rstellen und neu starten?Wallet "
+    b"ladenVerwende die Entropie der K"
+    b"amera, um eine neue Mnemonic zu "
+    b"erstellenSignieren von Roh-Hash."
+    b" Fahren Sie nur fort, wenn Sie d"
+    b"er Quelle vertrauen.TC Flash-Has"
+    b"h beim StartNicht-ASCII-Zeichen "
+    b"wurden in Ihrer Passphrase erkan"
+    b"nt. Krux kann nicht garantieren,"
+    b" dass andere Wallets den gleiche"
+    b"n Schl\xc3\xbcssel ableiten.Wallet Aus"
+    b"gabedeskriptor nicht gefunden.Um"
+    b" 180 Grad drehenDezimalWarte auf"
+    b" die ErfassungQR-Etikett aktuali"
+    b"sieren?HelligkeitBase64-Passwort"
+    b"Pixelabweichungsindex:Weiter?Ung"
+    b"\xc3\xbcltige AdresseWallet Ausgabedes"
+    b"kriptor geladen!zu SechskantTC F"
+    b"lash-HashVerschl\xc3\xbcsselungsmodusS"
+    b"tarkSchwachWarnung:Verwende eine"
+    b" schwarze Hintergrundfl\xc3\xa4che.Hex"
+    b"adezimalBlendschutzmodusEmpfange"
+    b"nHelligkeit umschaltenGeldb\xc3\xb6rse"
+    b" \xc3\xa4ndern?Weiter versuchen?W\xc3\xb6rte"
+    b"r 13-24 scannenSD-Karte nicht er"
+    b"kannt.12 W\xc3\xb6rterErneut \xc3\x9cberpr\xc3\xbc"
+    b"fenEntschl\xc3\xbcsseln?Mnemonik-Backu"
+    b"pFlash-ToolsUpgrade abgeschlosse"
+    b"n.aus SECHSKANT(%s Bits/px)Speic"
+    b"herortMnemonic ladenLeerzu utf8E"
+    b"inige Knoten sind nicht geh\xc3\xa4rte"
+    b"t:Auf SD-Karte signierenID exist"
+    b"iert bereitsStandard-PBKDF2-Iter"
+    b"ation verwenden.?unbekanntX-Koor"
+    b"dinaten spiegelnNetzwerkBIP85-En"
+    b"tropie ableiten?Mnemonic konnte "
+    b"nicht gespeichert werdenW\xc3\xb6rterV"
+    b"erschl\xc3\xbcsselte Mnemonic wurde ni"
+    b"cht gespeichertPapierbreiteKonto"
+    b"Schl\xc3\xbcssel%s Zchn.Drucke Test-QR"
+    b"Alle gespeicherten verschl\xc3\xbcssel"
+    b"ten Mnemoniken und Einstellungen"
+    b" dauerhaft vom Flash-Speicher en"
+    b"tfernen?Einlegen des Druckers\xe2\x80\xa6"
+    b"ZahlenZur\xc3\xbcck zum QR-ViewerPAGE "
+    b"zum Abbrechen dr\xc3\xbccken.\xc3\x9cberpr\xc3\xbc"
+    b"fen, ob diese Adresse zu dieser "
+    b"Wallet geh\xc3\xb6rt?Aufnahme abgebroc"
+    b"henDerivation-PfadLaden fehlgesc"
+    b"hlagen.KEF-verschl\xc3\xbcsseltInput ("
+    b"%d):BIP39-MnemonikUng\xc3\xbcltiger Ta"
+    b"mper Check CodeMittel\xc3\x9cberschrei"
+    b"ben?Schl\xc3\xbcssel wurde nicht zur V"
+    b"erf\xc3\xbcgung gestelltAdresseRollenv"
+    b"erteilung:BildschirmAuf Flash sp"
+    b"eichernStandard verwenden?Datein"
+    b"ameWenn Ihr Ger\xc3\xa4tedisplay nach "
+    b"dieser \xc3\x84nderung nicht funktioni"
+    b"ert, wird es nach 5 Sekunden aut"
+    b"omatisch mit den vorherigen Eins"
+    b"tellungen neu gestartet.Laden?Be"
+    b"legt:NeustartDrucken?XOR mitKopf"
+    b"artGeldb\xc3\xb6rse passt nicht:von ba"
+    b"se32Wallet-Passphrase hinzuf\xc3\xbcge"
+    b"n oder \xc3\xa4ndern?Pr\xc3\xbcfe SD-KarteDr"
+    b"uckbild\xe2\x80\xa6Zur\xc3\xbcckBenutzerdefinie"
+    b"rter Link QR-CodeWischen um den "
+    b"Modus zu \xc3\xa4ndernXOR-Strommnemote"
+    b"chnik mit einer anderen? (Passph"
+    b"rase und Deskriptor werden verwo"
+    b"rfen)Auf SD-Karte speichern?Mnem"
+    b"onik erzeugenTeilegr\xc3\xb6\xc3\x9feBitte l"
+    b"ade einen Wallet Ausgabedeskript"
+    b"orHex \xc3\xb6ffentlicher Schl\xc3\xbcssel:V"
+    b"erschl\xc3\xbcsseltAnpassenTrotzdem fo"
+    b"rtfahren?\xc3\x84nderungsadresse konnt"
+    b"e nicht ermittelt werden.Benutze"
+    b"rdaten l\xc3\xb6schenNeue Firmware erk"
+    b"annt.AbschaltzeitLinksSignierte "
+    b"PSBTTamper Check Code erfolgreic"
+    b"h gesetztwischenBer\xc3\xbchre Schwell"
+    b"enwertGib jedes Wort Deiner BIP3"
+    b"9 Mnemonic als Zahl von 1 bis 20"
+    b"48 ein.L\xc3\xb6schen %s?WortnummernPf"
+    b"ad stimmt nicht \xc3\xbcbereinEmpfangs"
+    b"adressen werden geladen\xe2\x80\xa6Wird b"
+    b"earbeitet\xe2\x80\xa6Selbst\xc3\xbcbertragung:F"
+    b"lash wird gef\xc3\xbclltKrux Drucker T"
+    b"est-QRFertig?Dateien durchsuchen"
+    b"?\xc3\x9cberpr\xc3\xbcfung\xe2\x80\xa6AussehenHohe Ge"
+    b"b\xc3\xbchren!Schalten Sie das Ger\xc3\xa4t "
+    b"nicht aus, es kann eine Weile da"
+    b"uern.Druckertreiber nicht gesetz"
+    b"t!Mnemonics ausblendenTeilFehlen"
+    b"de SignaturdateiSD-KarteWerkeins"
+    b"tellungenBenutzerdatenWert %S au"
+    b"\xc3\x9ferhalb  des Bereichs: [ %s, %s"
+    b"]W\xc3\xb6rter 1-12 erneut scannenFing"
+    b"erabdruck in PSBT deaktiviertSD-"
+    b"Karte wird gesucht\xe2\x80\xa6Den Flash m"
+    b"it Entropie von der Kamera f\xc3\xbcll"
+    b"en?Auf SD-Karte gespeichert:Gib "
+    b"jedes Wort Deiner BIP39 Mnemonic"
+    b" als Hexadezimalzahl von 1 bis 8"
+    b"00 ein.Neinzu base64Nicht genug "
+    b"W\xc3\xbcrfe!Ung\xc3\xbcltige mnemonische La"
+    b"ngeQR Code erstellenPAGE f\xc3\xbcr Mo"
+    b"duswechselTiefe pro Durchgangvon"
+    b" base43Adresse scannenZus\xc3\xa4tzlic"
+    b"he Entropie von der Kamera erfor"
+    b"derlich f\xc3\xbcr %sUmkehrenGer\xc3\xa4tete"
+    b"stsZur\xc3\xbcck zum Men\xc3\xbcLassen Sie d"
+    b"as Feld leer, wenn Sie m\xc3\xb6chten,"
+    b" dass Krux ein g\xc3\xbcltiges letztes"
+    b" Wort ausw\xc3\xa4hltVia KameraWallet "
+    b"AusgabedeskriptorSelbst\xc3\xbcbertrag"
+    b"ung oder Change (%d):L\xc3\xa4nge:Sign"
+    b"ieren?"
+)
@@ -19,382 +19,345 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-# pylint: disable=C0301
-translation_array = [
-    "% del monto.",
-    "%d de %d multisig",
-    "%d a %d",
-    "%s bits",
-    "%s bytes",
-    "%s carac.",
-    "%s eliminado.",
-    "%s: ¡cargado!",
-    "(%s bits/px)",
-    "(Experimental)",
-    "(Solo para observación)",
-    "12 palabras",
-    "24 palabras",
-    "Nosotros",
-    "Cuenta",
-    "Índice de la cuenta",
-    "¿Añadir o cambiar passphrase de la cartera?",
-    "Se requiere entropía adicional de la cámara para %s",
-    "Dirección",
-    "Alinea la cámara y la placa de respaldo correctamente.",
-    "Modo antirreflejo",
-    "Apariencia",
-    "¿Estás seguro?",
-    "Colores BGR",
-    "Mnemónico BIP39",
-    "Atrás",
-    "Volver al Menú",
-    "Backup del Mnemónico",
-    "Firma incorrecta",
-    "Contraseña Base64",
-    "Baudrate",
-    "Cuadrícula binaria",
-    "Grosor del Borde",
-    "Brillo",
-    "Botones",
-    "Rebote de Botones",
-    "Captura cancelada",
-    "Cambio",
-    "¿Cambiar de tema y reiniciar?",
-    "¿Cambiar cartera?",
-    "Cambio:",
-    "Los cambios durarán hasta que el dispositivo se apague.",
-    "Revisar Tarjeta SD",
-    "¿Verificar que la dirección pertenece a esta cartera?",
-    "Comprobado %d direcciones sin coincidencias.",
-    "Buscando tarjeta SD…",
-    "Confirmar el código de verificación",
-    "Convertir dato",
-    "No se pudo determinar la dirección de cambio.",
-    "Crear código QR",
-    "¿Crear código QR a partir de texto?",
-    "Creado:",
-    "Código de verificación actual",
-    "Código QR personalizado",
-    "Texto Personalizado",
-    "Personalizar",
-    "Personalizar tu cartera generará una nueva clave y descargará el Descriptor.",
-    "Profundidad de Corte",
-    "Método de Corte",
-    "Herramienta de datos",
-    "Decimal",
-    "¿Descifrar?",
-    "Cartera Predeterminada",
-    "¿Eliminar este archivo?",
-    "Profundidad por Pasada",
-    "Ruta de derivación",
-    "¿Derivar entropía BIP85?",
-    "Direcciones del descriptor",
-    "Pruebas del dispositivo",
-    "Pantalla",
-    "No apagues el dispositivo, puede tardar un tiempo en completarse.",
-    "Listo para convertir",
-    "¿Listo?",
-    "Doble mnemónico",
-    "Operador",
-    "Vacío",
-    "¿Permitir?",
-    "Cifrar",
-    "Cifrado",
-    "Código QR Cifrado",
-    "Mnemónico cifrado almacenado con ID:",
-    "Mnemónico cifrado no se almacenó",
-    "Cifrado",
-    "Modo de Cifrado",
-    "Ingrese %d palabras BIP39.",
-    "Introduzca un código de verificación de más de 6 caracteres",
-    "Ingresa cada palabra de tu mnemónico BIP39 como un número del 1 al 2048.",
-    "Ingresa cada palabra de tu mnemónico BIP39 como un número en hexadecimal del 1 al 800.",
-    "Ingresa cada palabra de tu mnemónico BIP39 como un número en octal del 1 al 4000.",
-    "Ingresa cada palabra de tu mnemónico BIP39.",
-    "Borrar datos de usuario",
-    "Borrando los datos del usuario…",
-    "Error:",
-    "Esc",
-    "¿Explorar archivos?",
-    "Exportar direcciones",
-    "Exportando %s a la tarjeta SD…",
-    "Clave Pública Extendida",
-    "Ajustes de Fábrica",
-    "Error al recopilar la entropía de la cámara",
-    "Error al convertir:",
-    "Error al descifrar",
-    "Error al cargar",
-    "No pudo almacenar mnemónico",
-    "Comisión:",
-    "Feed Rate",
-    "Nombre del Archivo",
-    "El nombre de archivo %s existe en la tarjeta SD.",
-    "¿Llenar el flash con entropía de la cámara?",
-    "Llenando Flash",
-    "Huella dactilar no establecida en PSBT",
-    "Mapa Flash",
-    "Herramientas Flash",
-    "Flash lleno de entropía de cámara",
-    "Diámetro de la Flauta",
-    "Libre:",
-    "Desde el Almacenamiento",
-    "Borra completamente su tarjeta SD en otro dispositivo para asegurarse de que los datos sean irrecuperables",
-    "Generar Mnemónico",
-    "Ir",
-    "Buena entropía",
-    "Hardware",
-    "Tipo de cabezal",
-    "Clave Pública Hexadecimal:",
-    "Hexadecimal",
-    "Ocultar Mnemónicos",
-    "¡Tarifas altas!",
-    "Identificador",
-    "ID ya existe",
-    "Si la pantalla de su dispositivo no funciona después de este cambio, se reiniciará automáticamente con la configuración anterior después de 5 segundos.",
-    "Índice",
-    "Entradas (%d):",
-    "¡Entropía Insuficiente!",
-    "Código de verificación no válido",
-    "Dirección inválida",
-    "Ruta de derivación no válida",
-    "Longitud mnemónica no válida",
-    "Cartera inválida:",
-    "Invertir",
-    "Colores Invertidos",
-    "Kef encriptado",
-    "Clave",
-    "No se proporcionó la clave",
-    "Test de impresión QR",
-    "Tipo de LCD",
-    "Idioma",
-    "Déjalo en blanco si quieres que Krux elija una última palabra válida",
-    "Izquierda",
-    "Longitud:",
-    "Retraso de Línea",
-    "Línea:",
-    "Listar direcciones",
-    "Importar Mnemónico",
-    "Cargar Cartera",
-    "¿Cargar un descriptor de monedero de confianza para ver las direcciones?",
-    "Cargar desde tarjeta SD",
-    "¿Cargar desde la tarjeta SD?",
-    "Cargar desde la cámara",
-    "¿Cargar?",
-    "Cargando cámara…",
-    "Cargando direcciones de cambio…",
-    "Cargando impresora…",
-    "Cargando direcciones de recepción…",
-    "Cargando…",
-    "Idioma",
-    "Ubicación",
-    "Medio",
-    "Mensaje",
-    "Mensaje:",
-    "Miniscript",
-    "Espejo de coordenadas X",
-    "Falta archivo de firma",
-    "Mnemónico",
-    "XOR mnemónico",
-    "Mnemónico y passphrase se mantendrán.",
-    "Modificado:",
-    "Red",
-    "Nuevo Mnemónico",
-    "Nuevo firmware detectado.",
-    "No",
-    "Sin Passphrase",
-    "Se detectaron caracteres no ASCII en su frase de contraseña. Krux no puede garantizar que otros monederos obtengan la misma clave.",
-    "¡No hay suficientes tiradas!",
-    "Números",
-    "Octales",
-    "Otros Formatos",
-    "¿Sobrescribir?",
-    "PAGE para alternar el brillo",
-    "PBKDF2 iter.",
-    "Pinte los puntos perforados de negro para que puedan ser detectados.",
-    "Ancho del Papel",
-    "Parte",
-    "Parte M de N",
-    "Tamaño de la Pieza",
-    "Passphrase",
-    "Longitud",
-    "La ruta no coincide",
-    "¡Patrón detectado!",
-    "¿Eliminar permanentemente todos los mnemónicos y configuraciones cifradas almacenadas del flash?",
-    "Guardar",
-    "Índice de desviación de píxeles:",
-    "QR de Texto",
-    "Carga un descriptor de cartera",
-    "Tasa de Caída",
-    "Tipo de póliza",
-    "Baja entropía!",
-    "Potencia",
-    "Pulse PAGE para cancelar.",
-    "PAGE para cambiar el modo",
-    "Prueba de Impresión QR",
-    "¿Imprimir Tinyseed?",
-    "Imprimir como Código QR",
-    "¿Imprimir con Codigo QR?",
-    "¿Impresión?",
-    "Impresora",
-    "¡El controlador de impresora no está configurado!",
-    "Imprimiendo…",
-    "¿Proceder de todas maneras?",
-    "¿Continuar?",
-    "Procesando…",
-    "No se puede gastar",
-    "Código QR",
-    "Etiqueta QR",
-    "Cantidad",
-    "RX Pin",
-    "Reiniciar",
-    "Recepción",
-    "Región:",
-    "Eliminar %s?",
-    "Eliminar Mnemónico",
-    "¿Eliminar archivos de firmware de la tarjeta SD?",
-    "Res. - Formato",
-    "¿Restablecer a la configuración de fábrica y reiniciar?",
-    "Resultados",
-    "Volver al QR",
-    "Revisar nuevamente",
-    "Revisa los datos escaneados, edítalos si es necesario",
-    "Derecha",
-    "Tira el dado al menos %d veces para generar un mnemónico.",
-    "Distribución de tiradas:",
-    "Tiradas:",
-    "Girar 180°",
-    "Tarjeta SD",
-    "Tarjeta SD no detectada.",
-    "SHA256 de las tiradas:",
-    "SHA256 de la instantánea:",
-    "Guardar Imagen QR en la Tarjeta SD",
-    "Guardar en tarjeta SD",
-    "¿Guardar en la tarjeta SD?",
-    "Guardado en la tarjeta SD:",
-    "Escala",
-    "Escanear Dirección",
-    "Escanear Passphrase BIP39",
-    "Escanear el Código QR",
-    "Escaneo de palabras 1-12 de nuevo",
-    "Escaneo de palabras 13-24",
-    "Tiempo de Espera del Protector de Pantalla",
-    "Tipo de Script",
-    "Seguridad",
-    "Autotransferencia o Cambio (%d):",
-    "Autotransferencia:",
-    "Establezca primero un código de verificación",
-    "Ajustes",
-    "Ajustes almacenados internamente en flash.",
-    "Configuración almacenada en la tarjeta SD.",
-    "Entropía de Shannon:",
-    "Mostrar dato",
-    "Apagar",
-    "Tiempo de Apagado",
-    "Apagado…",
-    "Firmar",
-    "Firmar en Código QR",
-    "Firmar en la Tarjeta SD",
-    "¿Firmar?",
-    "Firma:",
-    "Mensaje Firmado",
-    "PSBT Firmado",
-    "Firmar hash sin procesar. Proceda solo si confía en la fuente.",
-    "Firma…",
-    "Single-sig",
-    "Tamaño:",
-    "Algunas comprobaciones no se pueden realizar.",
-    "Algunos nodos no están endurecidos:",
-    "Gastos (%d):",
-    "Gasto:",
-    "Modo estándar",
-    "Estático",
-    "Estadísticas para Entendidos",
-    "Almacenar en Flash",
-    "Almacenar en la Tarjeta SD",
-    "Fuerza",
-    "Fuerte",
-    "Deslizar para cambiar de modo",
-    "TC Hash Flash",
-    "TC Flash Hash al arranque",
-    "TOCA o ENTER para capturar",
-    "TOCA o ENTER para instalar.",
-    "Clave interna TR",
-    "TX Pin",
-    "Código de verificación",
-    "Código de verificación establecido con éxito",
-    "Los códigos de verificación no coinciden",
-    "Suite de Pruebas",
-    "Resultados de la suite de pruebas",
-    "Prueba:",
-    "Texto",
-    "Tema",
-    "Térmico",
-    "Para garantizar que los datos no se puedan recuperar, utiliza la función de borrar dispositivo",
-    "Alternar Brillo",
-    "Herramientas",
-    "Umbral Táctil",
-    "Pantalla Táctil",
-    "¿Intentar con mas?",
-    "Escribe la Passphrase BIP39",
-    "Introduce la clave",
-    "Deshacer",
-    "Unidad",
-    "¿Actualizar ID de Kef?",
-    "¿Actualizar etiqueta QR?",
-    "Actualización completa.",
-    "Usa una superficie de fondo negra.",
-    "Usa la entropía de la cámara para crear una nueva mnemónica",
-    "Valor Actual",
-    "¿Usar el modo predeterminado?",
-    "Utilice el iter PBKDF2 predeterminado.?",
-    "¿Usar huella dactilar como identificación?",
-    "Usado:",
-    "Usuario",
-    "Valor %s fuera del rango: [ %s, %s]",
-    "Verificando…",
-    "Versión",
-    "Desde Cámara",
-    "Vía D20",
-    "Vía D6",
-    "Introducción Manual",
-    "A Través de Palabras",
-    "la etiqueta legible",
-    "Espera la captura",
-    "Cartera",
-    "Descriptor de Cartera",
-    "Cartera no coincide:",
-    "Descriptor de salida de cartera",
-    "¡Se ha cargado el descriptor de salida de la cartera!",
-    "No se encontró el descriptor de salida de la cartera.",
-    "Advertencia:",
-    "Débil",
-    "Palabra %d",
-    "Números de Palabra",
-    "Palabras",
-    "Resultado XOR",
-    "XOR Con",
-    "¿XOR mnemónico actual con otro? (se descartarán la passphrase y el descriptor)",
-    "Sí",
-    "Modo ampliado",
-    "binario:",
-    "failed:",
-    "desde HEXADECIMAL",
-    "desde base32",
-    "desde base43",
-    "desde base64",
-    "desde hexadecimal",
-    "desde utf8",
-    "es una dirección válida!",
-    "caja de cambio",
-    "Tasa de éxito:",
-    "deslizar",
-    "texto:",
-    "a HEXADECIMAL",
-    "a base32",
-    "a base43",
-    "a base64",
-    "a hexadecimal",
-    "a utf8",
-    "desconocido",
-    "NO FUE ENCONTRADO en las primeras %d direcciones",
-]
+# pylint: disable=C0103,C0301
+catalog = (
+    b"f\x01\xb6\x11\x16\x00l\xfa\xa6\x02[\xa8b\x04\xe6\x81m\x07B{d\x08\xb7\x06\xff\x08\nf\x00\n(\x1f"
+    b'\x16\x0c\xbcI\xdb\rpi"\x0e\xff#)\x0e\x88\x1f\xe1\x0ef\x97\xa1\x0f\x8b\xea5\x11\x8arH\x11:c'
+    b"\xd3\x11%\xc4\xc6\x14k\xd8\xe0\x14\xefy\xca\x16j\xc7\xd9\x16GG.\x17\x05\xd5R\x17\xeal\xf3\x17\x81\xd3"
+    b"*\x19\xbba\xc5\x19\xe0\x94\xdd\x19\x93\xc23\x1ck\xf8<\x1c\xbd\xc3\xd1\x1dk\x96O\x1fhW\xae\x1f\xeat"
+    b'\x9b!\xf2\xb1\x1d"\x00\xb9/#Lj\xa3#\xf4\xb7\xec#k\xd7\xb4$\x13\t\xea$\xf1\xf7(&\xe9~'
+    b'\xaf&`Rp(\xfa\x1c*)\xa8\xdaL)|\xb9\xb7)\x93gx*\xeb\xf5\xea*s\xf1;+"\xd6'
+    b"r+\xf4\x85t-\x80\n\x87-\xe3\x13\xad-J\x9f\xea-\x9d.\x93.\xb80\xc4.uU\x8b/\x7f\x0b"
+    b"\xb5/\x8e\x83\xcf/g\xd4\xb80n\xea\xf30\x12Ec1\x99\x1bi1\xef|73\x14\x15\xe83\xe5\x91"
+    b"o4\x86|\xea4\xc9\xa3\xaa5\xbd\xca\xd85Z'S6\x02\xcb^6\xd5\x91\xb36\x16\x19\x087\xfc?"
+    b"[7\xd84\xf69\x89\x0fZ:\x81\xa9[;|\x91\xec;\x97\xb7\xed<\x95e7>\x1e\xd1\xfd>\xc0>"
+    b"L?\xfd\x91\x1f@x}=@\x87j\x8dA\x84>\x96A\x05H\xb2A\xed\xf2\xc7Aq@\xf1B\xcc\x14"
+    b"BC\xdf~.D\xba\x16\x8bEhY\x0cF\xae\xc3,F\x11r?F! XF\x90\xb9\xa5F\x1a\xcd"
+    b"\xccF\x1c\n7G\xee\x08nG\x16\xfb\xfbG\x8fbzI30\xc0I\xf9\xd4'Jc\xed\xc8J?\xad"
+    b"&K`D\xd1Kg`\x16MIs\xaaM\x8f\xe6\x15Na\xdcLP\x9b\x94\xe9Q\x12@\x88RJ\xde"
+    b"\xd6S8\xa4\xc0U?\x9c\x05V\x0c\xc8\xb4VB\x9dPW\x9c\x07\x01Xd\xe9\x83X\x87L\x97Y\xe8\xcc"
+    b"&Z\xa0[\xcf\\q\xd7\x08^\t\x84]^\x0c\x01k^\x08i2_\x1c;\xa3b[\xb9\xdab*\xfe"
+    b'\x13c\xb9\x993cd\n\xfdcY"\xa2d\x8d?\xf2dy\x96\x1de\x9d\x9e\x8de2\x8e\x00f\xc5\x1b'
+    b"\x18f`t\x85fY\xcftg\xcd8\xd1g\xed\xd1\njM\x865j\xa4.Kj\x13]\xd1j\x0bT"
+    b"\xa6k\xe8{}l\x94\xbc\xd4l0\x11\xe0m?\xfb*n]\x8eRn\x08{Xo\xb9m\x87o\xde\xd6"
+    b"\xcfom\x14@p_\xea\xa1p\xc3\x99\xd8p\xa8\x93)q\x8dirs0\x13\x16t\x8b\xf3 t\xe7\r"
+    b"5t\xe8\xda\xcat\x10Z\x0bu\xd9\xd4\x84v9\xab\xf4wYQ_xZ\x9b\xf9x\xe3\t\x00yw\xde"
+    b"|yq\xdf\xfcy4\xd9\xe0z\xac\x11e{)\x97\xc4{m\xa3\x89|\x9f\x8a\x9b|\xdeG\xa7}?\x0e"
+    b"\xf2\x80\x00\x1ei\x81\xa6Z\xc0\x81u\xc6W\x82\x0c\x11r\x85\xa2\xcb6\x86j\x8f~\x86\x80\xb1\x83\x86\xffY"
+    b"\x98\x86\xbe\xf6W\x87\x13-l\x87\xbc\x93\xb9\x88\xdf\xde\xe9\x88\xf2\xaf\x9f\x8a\xb6\xd1\x9f\x8a)\xbcE\x8b\x7f\x00"
+    b"\xc2\x8b*\xbc\xe1\x8ca\x90\x04\x8d\x89Q;\x8d\xdd\x8e2\x8f\xbf\xc3D\x90\x95\x8e}\x91\x0f$\x83\x93D\xa7"
+    b"\xff\x94\xb1\x8b#\x95\x1flE\x95n7#\x963\xd5+\x96Rv\x13\x99J\xc7\xaa\x99\xdb\xd0\xd0\x99&\x1f"
+    b"\x1d\x9a\x03 5\x9a\xa2]\xb1\x9a\xdf.\xbc\x9aO?\x11\x9b\xf9\x08\xb9\x9b-\xcb\x9f\x9d\xfa\x03\x04\x9fp}"
+    b"?\x9f\xd0\x8bp\x9fD\xde\x87\xa0\xad\x08\xce\xa0y\xe5\xf1\xa0\x9a\xfe\x03\xa1\xbfX\xe0\xa2.\xc5\x1b\xa3\x12\xe1"
+    b"\x1b\xa3V\xd4J\xa3\x0f<\xab\xa3\xee\xa8\xfa\xa3\xaa\x0cJ\xa4\xf0\x84\x8a\xa5\xf8\xe2\x19\xa6\xe4\xa8T\xa6\x9d\xeb"
+    b"\xe8\xa7\xc3\xc2\xec\xa7\x18\xde \xa8\xc0\x12\x06\xa9P]\x94\xa9\x1ei\xa7\xaaX\xcb\xa8\xabNw\xa9\xabO\xd9"
+    b"\xfb\xac\xc7\xa7&\xadY\xb5'\xaf \xbe9\xaf\xc0ZG\xaf\x0e\xa2\x9a\xaf\x881\xbc\xb0\x12s\xf0\xb0d\xa3"
+    b"\x8b\xb1\x8e7\x16\xb28o\x8b\xb2I\xed\xdd\xb2O4\x88\xb3\xdd\xe6\x05\xb5\xfd\xe52\xb5\xfb\x95\x9d\xb5e\xf3"
+    b"#\xb8\xae\x87>\xb8]\x1f\x92\xb9\x07\x86\xf0\xb9\x163\r\xbbS;\xc3\xbeE\xb4\xa1\xbfh\xae\xd0\xbf\xb4\xbb"
+    b"?\xc1z\xa1\x92\xc1\xc3\xd2\xa4\xc1\x81@\xdf\xc1\xd5\xa5q\xc2;b\x95\xc2\x1dV\xf3\xc2\xa5V\xf8\xc2?K"
+    b"l\xc3\xcc\xd3\xe8\xc4\xe8\x955\xc53\x8b}\xc5\xa4]U\xc6\x89\x87\x86\xc6\x0e\xc6\xda\xc6\xba\x81\xff\xc6\x97\xd5"
+    b'\x0c\xc7^&\xc3\xc8B\xb6\xb7\xc9T\x8e<\xcb\x14\xb8\x97\xcc"^\x06\xcd\x92%)\xcd\x7f\x8a[\xcd\tn'
+    b"\xfc\xcd\x16ig\xd1\xe7\xa7z\xd1\xad\xf3\xd5\xd1\x83\x1d\x82\xd2\xed\xad\x89\xd3d\x00)\xd4v\x16L\xd4Z8"
+    b"a\xd4\xd0\xc2\x89\xd5\xbf\n\xb5\xd5k\x1b+\xd6\x92\xba\x11\xd8\\\x9d\x19\xd8O4\xa9\xd8\xcb\xf9\xeb\xd9VH"
+    b"U\xda\xbc]\xde\xda\x89^O\xdb\xa9\xe9Y\xdb0\x00\xa0\xdbn*\xa1\xdc\x99w@\xdeRI\xe6\xdeR\xdc"
+    b"\x10\xdf\xe9G<\xdf\xc23~\xdfg\xe9\x80\xdf\xdc\xdf\xb4\xdf\x95x\x9d\xe0]\xcb\xc3\xe2\x95w\xa3\xe44\xba"
+    b"\xb1\xe4WV\xca\xe4;\x9f@\xe5@\x81\xee\xe5\xb7\x00\x11\xe7I\xd0/\xe8\x87\xc4\xab\xe8\x95\x8f\xae\xe8\xf8\xdf"
+    b"=\xe9\x13!%\xea\xe5\x0c\t\xed\xe0\xdfT\xed/xy\xed/9\x9a\xee\x1c\x8a\xcb\xeej\xe8\xcf\xee\xb5a"
+    b"\x1f\xefb\xabC\xef\x0e\xc4\xaf\xf0\x95)\xb0\xf0\x974-\xf1)\x9e`\xf31\xd9\xee\xf3\xfa\x95\xfc\xf3\xdc\x97"
+    b"\x06\xf4\tdW\xf4\x8e\xb9\x87\xf4E\x1e\xd1\xf4\xe7`k\xf5\x06\xe8\xa1\xf5\xf1k\xbe\xf5\xd1Wa\xf7\xa6H"
+    b"p\xf7\xe8\xe3'\xf9\xafz\xce\xf9D0I\xfc^\xee\xa0\xfd\x9d\xa0\xdd\xfe>L?\xff\x00\x00\x00\x00S\x00"
+    b"\x00\x00\x80\x00\x00\x00\x90\x00\x00\x00\xa4\x00\x00\x00\xab\x00\x00\x00\xc3\x00\x00\x00\xe8\x00\x00\x00\xf5\x00\x00\x00\x01\x01"
+    b"\x00\x00\x18\x01\x00\x00*\x01\x00\x00@\x01\x00\x00J\x01\x00\x00P\x01\x00\x00^\x01\x00\x00k\x01\x00\x00u\x01"
+    b"\x00\x00|\x01\x00\x00\x84\x01\x00\x00\x96\x01\x00\x00\xce\x01\x00\x00\xdc\x01\x00\x00\xf7\x01\x00\x00\x1c\x02\x00\x00$\x02"
+    b"\x00\x00,\x02\x00\x003\x02\x00\x00B\x02\x00\x00V\x02\x00\x00]\x02\x00\x00\x89\x02\x00\x00\xb3\x02\x00\x00\xc6\x02"
+    b"\x00\x00\xda\x02\x00\x00\xea\x02\x00\x00\xec\x02\x00\x00\xfb\x02\x00\x00\x08\x03\x00\x00\x1a\x03\x00\x003\x03\x00\x00:\x03"
+    b"\x00\x00J\x03\x00\x00j\x03\x00\x00\x8c\x03\x00\x00\xb7\x03\x00\x00\xd1\x03\x00\x00\xdd\x03\x00\x00+\x04\x00\x003\x04"
+    b"\x00\x009\x04\x00\x00?\x04\x00\x00y\x04\x00\x00\x83\x04\x00\x00\x91\x04\x00\x00\x9b\x04\x00\x00\xb6\x04\x00\x00\xbc\x04"
+    b"\x00\x00\xd6\x04\x00\x00\xe7\x04\x00\x00\xf1\x04\x00\x00\n\x05\x00\x00:\x05\x00\x00X\x05\x00\x00u\x05\x00\x00\x91\x05"
+    b"\x00\x00\xc8\x05\x00\x00\xd5\x05\x00\x00\xe0\x05\x00\x00\x01\x06\x00\x00\x0f\x06\x00\x00%\x06\x00\x005\x06\x00\x00F\x06"
+    b"\x00\x00U\x06\x00\x00\x99\x06\x00\x00\xa3\x06\x00\x00\xac\x06\x00\x00\xc0\x06\x00\x00\xd0\x06\x00\x00\xd6\x06\x00\x00\xe4\x06"
+    b"\x00\x00\xea\x06\x00\x00\x02\x07\x00\x00\n\x07\x00\x00\x11\x07\x00\x00$\x07\x00\x00-\x07\x00\x005\x07\x00\x00a\x07"
+    b"\x00\x00w\x07\x00\x00\x82\x07\x00\x00\x88\x07\x00\x00\x95\x07\x00\x00\x9d\x07\x00\x00\xae\x07\x00\x00\xda\x07\x00\x00\xee\x07"
+    b"\x00\x00\xfd\x07\x00\x00\x03\x08\x00\x00 \x08\x00\x00+\x08\x00\x00=\x08\x00\x00E\x08\x00\x00K\x08\x00\x00a\x08"
+    b"\x00\x00m\x08\x00\x00p\x08\x00\x00{\x08\x00\x00\x9a\x08\x00\x00\xb1\x08\x00\x00\xd4\x08\x00\x00\xea\x08\x00\x00\x02\t"
+    b"\x00\x00)\t\x00\x00-\t\x00\x00;\t\x00\x00N\t\x00\x00Z\t\x00\x00a\t\x00\x00g\t\x00\x00\x98\t"
+    b"\x00\x00\x9f\t\x00\x00\xbd\t\x00\x00\xcb\t\x00\x00\xd3\t\x00\x00\xdf\t\x00\x00\xe7\t\x00\x00\x1d\n\x00\x001\n"
+    b"\x00\x00<\n\x00\x00D\n\x00\x00V\n\x00\x00d\n\x00\x00o\n\x00\x00\x87\n\x00\x00\xa1\n\x00\x00\xa9\n"
+    b"\x00\x00\xb1\n\x00\x00\xc4\n\x00\x00\xd4\n\x00\x00\xf5\n\x00\x00\xfd\n\x00\x00\x0f\x0b\x00\x000\x0b\x00\x00Z\x0b"
+    b"\x00\x00`\x0b\x00\x00l\x0b\x00\x00v\x0b\x00\x00\x9b\x0b\x00\x00\xa6\x0b\x00\x00\x10\x0c\x00\x00@\x0c\x00\x00T\x0c"
+    b"\x00\x00\\\x0c\x00\x00s\x0c\x00\x00\x8d\x0c\x00\x00\xa4\x0c\x00\x00\xb9\x0c\x00\x00\xc3\x0c\x00\x00\xcb\x0c\x00\x00\xe0\x0c"
+    b"\x00\x00\xe7\x0c\x00\x00\xf6\x0c\x00\x00\x10\r\x00\x00\x18\r\x00\x00B\r\x00\x00I\r\x00\x00Z\r\x00\x00m\r"
+    b"\x00\x00\x7f\r\x00\x00\x92\r\x00\x00\x99\r\x00\x00\x9f\r\x00\x00\xab\r\x00\x00\xbf\r\x00\x00\xd4\r\x00\x00\xee\r"
+    b"\x00\x00\xf5\r\x00\x00#\x0e\x00\x00)\x0e\x00\x004\x0e\x00\x00}\x0e\x00\x00\x8d\x0e\x00\x00\xec\x0e\x00\x00\xfc\x0e"
+    b"\x00\x00\x05\x0f\x00\x00\x19\x0f\x00\x00.\x0f\x00\x00<\x0f\x00\x00z\x0f\x00\x00\x92\x0f\x00\x00\xbf\x0f\x00\x00\xc6\x0f"
+    b"\x00\x00\x00\x10\x00\x00\x0e\x10\x00\x00L\x10\x00\x00\x8b\x10\x00\x00\xa4\x10\x00\x00'\x11\x00\x00]\x11\x00\x00h\x11"
+    b"\x00\x00y\x11\x00\x00\x92\x11\x00\x00\x98\x11\x00\x00\xaa\x11\x00\x00\xcd\x11\x00\x00\xd9\x11\x00\x00\xed\x11\x00\x00#\x12"
+    b"\x00\x000\x12\x00\x00=\x12\x00\x00L\x12\x00\x00Q\x12\x00\x00W\x12\x00\x00]\x12\x00\x00i\x12\x00\x00\x8b\x12"
+    b"\x00\x00\x9c\x12\x00\x00\xa6\x12\x00\x00\xb5\x12\x00\x00\xc7\x12\x00\x00\xda\x12\x00\x00\xf3\x12\x00\x00\x0b\x13\x00\x00\x16\x13"
+    b"\x00\x00(\x13\x00\x004\x13\x00\x00I\x13\x00\x00[\x13\x00\x00s\x13\x00\x00\x84\x13\x00\x00\x8e\x13\x00\x00\x9c\x13"
+    b"\x00\x00\xaf\x13\x00\x00\xb5\x13\x00\x00\xbb\x13\x00\x00\xdf\x13\x00\x00\xf6\x13\x00\x00\x02\x14\x00\x00)\x14\x00\x004\x14"
+    b"\x00\x00K\x14\x00\x00N\x14\x00\x00h\x14\x00\x00\x84\x14\x00\x00\x8c\x14\x00\x00\xae\x14\x00\x00\xbe\x14\x00\x00\xcd\x14"
+    b"\x00\x00\xd3\x14\x00\x00\xd8\x14\x00\x00\xe1\x14\x00\x00\xf8\x14\x00\x00Z\x15\x00\x00o\x15\x00\x00w\x15\x00\x00\x83\x15"
+    b'\x00\x00\x9c\x15\x00\x00\xd3\x15\x00\x00\xe4\x15\x00\x00\xf7\x15\x00\x00\x06\x16\x00\x00\x14\x16\x00\x00"\x16\x00\x002\x16'
+    b"\x00\x00U\x16\x00\x00Z\x16\x00\x00i\x16\x00\x00\x84\x16\x00\x00\x8e\x16\x00\x00\xa7\x16\x00\x00\xaf\x16\x00\x00\xc1\x16"
+    b"\x00\x00\xdf\x16\x00\x00\xf1\x16\x00\x00\x8d\x17\x00\x00\x96\x17\x00\x00\x9c\x17\x00\x00\xa5\x17\x00\x00\xb2\x17\x00\x00\xb9\x17"
+    b"\x00\x00\xc8\x17\x00\x00\xdc\x17\x00\x00\xe8\x17\x00\x00\x15\x18\x00\x00'\x18\x00\x005\x18\x00\x00;\x18\x00\x00S\x18"
+    b"\x00\x00p\x18\x00\x00\xc1\x18\x00\x00\xdc\x18\x00\x00\xee\x18\x00\x00\x01\x19\x00\x00\x1f\x19\x00\x00:\x19\x00\x00A\x19"
+    b"\x00\x00M\x19\x00\x00i\x19\x00\x00\x97\x19\x00\x00\xae\x19\x00\x00\xc7\x19\x00\x00\xd8\x19\x00\x00\xe1\x19\x00\x00\xed\x19"
+    b"\x00\x00\x1c\x1a\x00\x00$\x1a\x00\x002\x1a\x00\x009\x1a\x00\x00\x83\x1a\x00\x00\x8f\x1a\x00\x00\xa2\x1a\x00\x00\xb5\x1a"
+    b"\x00\x00\xda\x1a\x00\x00\xe7\x1a\x00\x00\xf9\x1a\x00\x00\x00\x1b\x00\x00\x0e\x1b\x00\x00#\x1b\x00\x00+\x1b\x00\x00?\x1b"
+    b"\x00\x00M\x1b\x00\x00W\x1b\x00\x00g\x1b\x00\x00\xa8\x1b\x00\x00\xdb\x1b\x00\x00\xee\x1b\x00\x00\xf3\x1b\x00\x00\t\x1c"
+    b"\x00\x00\x13\x1c\x00\x00&\x1c\x00\x00-\x1c\x00\x00P\x1c\x00\x00q\x1c\x00\x00\x97\x1c\x00\x00\xad\x1c\x00\x00\xdb\x1c"
+    b"\x00\x00\xf5\x1c\x00\x00\x0e\x1d\x00\x00f\x1d\x00\x00n\x1d\x00\x00\x8b\x1d\x00\x00\xa9\x1d\x00\x00\xb9\x1d\x00\x00\xd2\x1d"
+    b"\x00\x00\xe8\x1d\x00\x00\xf4\x1d\x00\x00\x07\x1e\x00\x00<\x1e\x00\x00D\x1e\x00\x00[\x1e\x00\x00j\x1e\x00\x00\xb1\x1e"
+    b"\x00\x00\xbe\x1e\x00\x00\xdd\x1e\x00\x00\xfd\x1e\x00\x00\x06\x1f\x00\x00\x0f\x1f\x00\x00Ingresa ca"
+    b"da palabra de tu mnem\xc3\xb3nico BIP3"
+    b"9 como un n\xc3\xbamero en octal del 1"
+    b" al 4000.Error al recopilar la e"
+    b"ntrop\xc3\xada de la c\xc3\xa1maraNuevo Mnem"
+    b"\xc3\xb3nicoProfundidad de CorteGuarda"
+    b"rImprimir como C\xc3\xb3digo QR\xc2\xbfCrear"
+    b" c\xc3\xb3digo QR a partir de texto?a "
+    b"HEXADECIMAL% del monto.Cargar de"
+    b"sde tarjeta SDCartera inv\xc3\xa1lida:"
+    b"Pruebas de rendimientoComisi\xc3\xb3n:"
+    b"texto:Tipo de ScriptIdentificado"
+    b"rResultadosCifradoOperadorError "
+    b"al descifrarLos cambios durar\xc3\xa1n"
+    b" hasta que el dispositivo se apa"
+    b"gue.Otros FormatosEscribe la Pas"
+    b"sphrase BIP39Confirmar el c\xc3\xb3dig"
+    b"o de verificaci\xc3\xb3nTiradas:Longit"
+    b"udAjustesTipo de p\xc3\xb3liza\xc2\xa1Patr\xc3\xb3"
+    b"n detectado!V\xc3\xada D6Ingresa cada "
+    b"palabra de tu mnem\xc3\xb3nico BIP39.A"
+    b"justes almacenados internamente "
+    b"en flash.Error al convertir:Intr"
+    b"oducci\xc3\xb3n ManualM\xc3\xa9todo de Corte"
+    b"IrTasa de \xc3\xa9xito:Modo ampliadoCo"
+    b"lores Invertidos\xc2\xa1Entrop\xc3\xada Insu"
+    b"ficiente!Creado:Doble mnem\xc3\xb3nico"
+    b"Exportando %s a la tarjeta SD\xe2\x80\xa6"
+    b"Guardar Imagen QR en la Tarjeta "
+    b"SDConfiguraci\xc3\xb3n almacenada en l"
+    b"a tarjeta SD.Almacenar en la Tar"
+    b"jeta SDHerramientasPersonalizar "
+    b"tu cartera generar\xc3\xa1 una nueva c"
+    b"lave y descargar\xc3\xa1 el Descriptor"
+    b".Mensaje:EscalaIdiomaTira el dad"
+    b"o al menos %d veces para generar"
+    b" un mnem\xc3\xb3nico.Apagado\xe2\x80\xa6Tasa de"
+    b" Ca\xc3\xaddaPalabra %dTOCA o ENTER pa"
+    b"ra instalar.FuerzaSHA256 de la i"
+    b"nstant\xc3\xa1nea:desde hexadecimalMap"
+    b"a Flash\xc2\xbfImprimir con Codigo QR?"
+    b"El nombre de archivo %s existe e"
+    b"n la tarjeta SD.Ruta de derivaci"
+    b"\xc3\xb3n no v\xc3\xa1lida\xc2\xbfCargar desde la "
+    b"tarjeta SD?PAGE para alternar el"
+    b" brilloAlinea la c\xc3\xa1mara y la pl"
+    b"aca de respaldo correctamente.Re"
+    b"sultado XORTipo de LCDResultados"
+    b" de la suite de pruebascaja de c"
+    b"ambioEscanear el C\xc3\xb3digo QRGroso"
+    b"r del BordeRetraso de L\xc3\xadneaBaja"
+    b" entrop\xc3\xada!Pinte los puntos perf"
+    b"orados de negro para que puedan "
+    b"ser detectados.desde utf8Segurid"
+    b"ad\xc3\x8dndice de la cuenta\xc2\xbfEst\xc3\xa1s s"
+    b"eguro?FirmarModo est\xc3\xa1ndarLibre:"
+    b"(Solo para observaci\xc3\xb3n)Firma\xe2\x80\xa6"
+    b"\xc3\x8dndiceCargando c\xc3\xa1mara\xe2\x80\xa6Impres"
+    b"oraDeshacer\xc2\xbfUsar huella dactila"
+    b"r como identificaci\xc3\xb3n?SHA256 de"
+    b" las tiradas:Etiqueta QRIdioma%s"
+    b" eliminado.T\xc3\xa9rmico%d de %d mult"
+    b"isigComprobado %d direcciones si"
+    b"n coincidencias.\xc2\xbfImprimir Tinys"
+    b"eed?Buena entrop\xc3\xadaCambioEstad\xc3\xad"
+    b"sticas para EntendidosModificado"
+    b":C\xc3\xb3digo QR CifradoV\xc3\xada D20Gasto"
+    b":Cartera PredeterminadaParte M d"
+    b"e NS\xc3\xad24 palabrasC\xc3\xb3digo de veri"
+    b"ficaci\xc3\xb3n actual\xc2\xbfActualizar ID "
+    b"de Kef?Flash lleno de entrop\xc3\xada "
+    b"de c\xc3\xa1maraDi\xc3\xa1metro de la Flauta"
+    b"\xc2\xbfEliminar este archivo?Mnem\xc3\xb3ni"
+    b"co y passphrase se mantendr\xc3\xa1n.T"
+    b"emaConvertir datoEliminar Mnem\xc3\xb3"
+    b"nicodesde base64%d a %dFirma:\xc2\xbfE"
+    b"liminar archivos de firmware de "
+    b"la tarjeta SD?Octales\xc2\xbfCambiar d"
+    b"e tema y reiniciar?XOR mnem\xc3\xb3nic"
+    b"oa base43Valor ActualRegi\xc3\xb3n:Rev"
+    b"isa los datos escaneados, ed\xc3\xadta"
+    b"los si es necesarioListo para co"
+    b"nvertir\xc2\xbfPermitir?binario:No se "
+    b"puede gastar%s: \xc2\xa1cargado!QR de "
+    b"TextoClave P\xc3\xbablica ExtendidaDir"
+    b"ecciones del descriptorCantidada"
+    b" base32Texto PersonalizadoSuite "
+    b"de PruebasBorrando los datos del"
+    b" usuario\xe2\x80\xa6PotenciaListar direcc"
+    b"ionesCargando direcciones de cam"
+    b"bio\xe2\x80\xa6Los c\xc3\xb3digos de verificaci"
+    b"\xc3\xb3n no coincidenApagarMostrar da"
+    b"toC\xc3\xb3digo QRMnem\xc3\xb3nico cifrado a"
+    b"lmacenado con ID:Colores BGRBorr"
+    b"a completamente su tarjeta SD en"
+    b" otro dispositivo para asegurars"
+    b"e de que los datos sean irrecupe"
+    b"rablesNO FUE ENCONTRADO en las p"
+    b"rimeras %d direccionesExportar d"
+    b"ireccionesVersi\xc3\xb3nDesde el Almac"
+    b"enamientoTOCA o ENTER para captu"
+    b"rarCargar desde la c\xc3\xa1maraA Trav"
+    b"\xc3\xa9s de PalabrasMnem\xc3\xb3nicoNosotro"
+    b"sEntrop\xc3\xada de Shannon:DerechaMen"
+    b"saje FirmadoIngrese %d palabras "
+    b"BIP39.Tama\xc3\xb1o:Tiempo de Espera d"
+    b"el Protector de PantallaMensajeR"
+    b"ebote de BotonesCuadr\xc3\xadcula bina"
+    b"riaIntroduce la clavela etiqueta"
+    b" legibleCarteraUnidadGastos (%d)"
+    b":Herramienta de datosGuardar en "
+    b"tarjeta SDes una direcci\xc3\xb3n v\xc3\xa1l"
+    b"ida!L\xc3\xadnea:Establezca primero un"
+    b" c\xc3\xb3digo de verificaci\xc3\xb3nCifrarC"
+    b"argando\xe2\x80\xa6\xc2\xbfCargar un descriptor"
+    b" de monedero de confianza para v"
+    b"er las direcciones?Firma incorre"
+    b"ctaPara garantizar que los datos"
+    b" no se puedan recuperar, utiliza"
+    b" la funci\xc3\xb3n de borrar dispositi"
+    b"voClave interna TREst\xc3\xa1ticoFirma"
+    b"r en C\xc3\xb3digo QRDescriptor de Car"
+    b"teraSin PassphraseIntroduzca un "
+    b"c\xc3\xb3digo de verificaci\xc3\xb3n de m\xc3\xa1s"
+    b" de 6 caracteresC\xc3\xb3digo de verif"
+    b"icaci\xc3\xb3nAlgunas comprobaciones n"
+    b"o se pueden realizar.Botones\xc2\xbfRe"
+    b"stablecer a la configuraci\xc3\xb3n de"
+    b" f\xc3\xa1brica y reiniciar?Cargar Car"
+    b"teraUsa la entrop\xc3\xada de la c\xc3\xa1ma"
+    b"ra para crear una nueva mnem\xc3\xb3ni"
+    b"caFirmar hash sin procesar. Proc"
+    b"eda solo si conf\xc3\xada en la fuente"
+    b".TC Flash Hash al arranqueSe det"
+    b"ectaron caracteres no ASCII en s"
+    b"u frase de contrase\xc3\xb1a. Krux no "
+    b"puede garantizar que otros moned"
+    b"eros obtengan la misma clave.No "
+    b"se encontr\xc3\xb3 el descriptor de sa"
+    b"lida de la cartera.Girar 180\xc2\xb0Es"
+    b"pera la captura\xc2\xbfActualizar etiq"
+    b"ueta QR?BrilloContrase\xc3\xb1a Base64"
+    b"\xc3\x8dndice de desviaci\xc3\xb3n de p\xc3\xadxel"
+    b"es:\xc2\xbfContinuar?Direcci\xc3\xb3n inv\xc3\xa1l"
+    b"ida\xc2\xa1Se ha cargado el descriptor"
+    b" de salida de la cartera!a hexad"
+    b"ecimalTC Hash FlashModo de Cifra"
+    b"doTextoFuerteD\xc3\xa9bilAdvertencia:U"
+    b"sa una superficie de fondo negra"
+    b".Modo antirreflejoRecepci\xc3\xb3nAlte"
+    b"rnar Brillo\xc2\xbfCambiar cartera?\xc2\xbfI"
+    b"ntentar con mas?Escaneo de palab"
+    b"ras 13-24Tarjeta SD no detectada"
+    b".12 palabrasRevisar nuevamente\xc2\xbf"
+    b"Descifrar?Backup del Mnem\xc3\xb3nicoH"
+    b"erramientas FlashActualizaci\xc3\xb3n "
+    b"completa.desde HEXADECIMALUbicac"
+    b"i\xc3\xb3nRes. - FormatoImportar Mnem\xc3"
+    b"\xb3nicoVac\xc3\xadoa utf8Algunos nodos n"
+    b"o est\xc3\xa1n endurecidos:Firmar en l"
+    b"a Tarjeta SDID ya existeUtilice "
+    b"el iter PBKDF2 predeterminado.?d"
+    b"esconocidoEspejo de coordenadas "
+    b"XRed\xc2\xbfDerivar entrop\xc3\xada BIP85?No"
+    b" pudo almacenar mnem\xc3\xb3nicoPalabr"
+    b"asMnem\xc3\xb3nico cifrado no se almac"
+    b"en\xc3\xb3Pantalla T\xc3\xa1ctilAncho del Pa"
+    b"pelCuentaClave%s carac.Prueba de"
+    b" Impresi\xc3\xb3n QR\xc2\xbfEliminar permane"
+    b"ntemente todos los mnem\xc3\xb3nicos y"
+    b" configuraciones cifradas almace"
+    b"nadas del flash?Cargando impreso"
+    b"ra\xe2\x80\xa6N\xc3\xbamerosVolver al QRPulse P"
+    b"AGE para cancelar.\xc2\xbfVerificar qu"
+    b"e la direcci\xc3\xb3n pertenece a esta"
+    b" cartera?Captura canceladaRuta d"
+    b"e derivaci\xc3\xb3nError al cargarKef "
+    b"encriptadoEntradas (%d):Mnem\xc3\xb3ni"
+    b"co BIP39C\xc3\xb3digo de verificaci\xc3\xb3n"
+    b" no v\xc3\xa1lidoMedio\xc2\xbfSobrescribir?N"
+    b"o se proporcion\xc3\xb3 la claveDirecc"
+    b"i\xc3\xb3nDistribuci\xc3\xb3n de tiradas:Pan"
+    b"tallaAlmacenar en Flash\xc2\xbfUsar el"
+    b" modo predeterminado?Nombre del "
+    b"ArchivoSi la pantalla de su disp"
+    b"ositivo no funciona despu\xc3\xa9s de "
+    b"este cambio, se reiniciar\xc3\xa1 auto"
+    b"m\xc3\xa1ticamente con la configuraci\xc3"
+    b"\xb3n anterior despu\xc3\xa9s de 5 segund"
+    b"os.\xc2\xbfCargar?Usado:Reiniciar\xc2\xbfImp"
+    b"resi\xc3\xb3n?XOR ConTipo de cabezalCa"
+    b"rtera no coincide:desde base32\xc2\xbf"
+    b"A\xc3\xb1adir o cambiar passphrase de "
+    b"la cartera?Revisar Tarjeta SDImp"
+    b"rimiendo\xe2\x80\xa6Atr\xc3\xa1sC\xc3\xb3digo QR pers"
+    b"onalizadoDeslizar para cambiar d"
+    b"e modo\xc2\xbfXOR mnem\xc3\xb3nico actual co"
+    b"n otro? (se descartar\xc3\xa1n la pass"
+    b"phrase y el descriptor)\xc2\xbfGuardar"
+    b" en la tarjeta SD?Generar Mnem\xc3\xb3"
+    b"nicoTama\xc3\xb1o de la PiezaCarga un "
+    b"descriptor de carteraClave P\xc3\xbabl"
+    b"ica Hexadecimal:CifradoPersonali"
+    b"zar\xc2\xbfProceder de todas maneras?N"
+    b"o se pudo determinar la direcci\xc3"
+    b"\xb3n de cambio.Borrar datos de usu"
+    b"arioNuevo firmware detectado.Tie"
+    b"mpo de ApagadoIzquierdaPSBT Firm"
+    b"adoC\xc3\xb3digo de verificaci\xc3\xb3n esta"
+    b"blecido con \xc3\xa9xitodeslizarUmbral"
+    b" T\xc3\xa1ctilPrueba:Ingresa cada pala"
+    b"bra de tu mnem\xc3\xb3nico BIP39 como "
+    b"un n\xc3\xbamero del 1 al 2048.Elimina"
+    b"r %s?N\xc3\xbameros de PalabraLa ruta "
+    b"no coincideCargando direcciones "
+    b"de recepci\xc3\xb3n\xe2\x80\xa6Procesando\xe2\x80\xa6Aut"
+    b"otransferencia:Cambio:Llenando F"
+    b"lashTest de impresi\xc3\xb3n QR\xc2\xbfListo"
+    b"?\xc2\xbfExplorar archivos?Verificando"
+    b"\xe2\x80\xa6Apariencia\xc2\xa1Tarifas altas!No "
+    b"apagues el dispositivo, puede ta"
+    b"rdar un tiempo en completarse.\xc2\xa1"
+    b"El controlador de impresora no e"
+    b"st\xc3\xa1 configurado!Ocultar Mnem\xc3\xb3n"
+    b"icosParteFalta archivo de firmaT"
+    b"arjeta SDAjustes de F\xc3\xa1bricaUsua"
+    b"rioValor %s fuera del rango: [ %"
+    b"s, %s]Escaneo de palabras 1-12 d"
+    b"e nuevoHuella dactilar no establ"
+    b"ecida en PSBTBuscando tarjeta SD"
+    b"\xe2\x80\xa6\xc2\xbfLlenar el flash con entrop\xc3"
+    b"\xada de la c\xc3\xa1mara?Guardado en la "
+    b"tarjeta SD:Escanear Passphrase B"
+    b"IP39Ingresa cada palabra de tu m"
+    b"nem\xc3\xb3nico BIP39 como un n\xc3\xbamero "
+    b"en hexadecimal del 1 al 800.a ba"
+    b"se64\xc2\xa1No hay suficientes tiradas"
+    b"!Longitud mnem\xc3\xb3nica no v\xc3\xa1lidaC"
+    b"rear c\xc3\xb3digo QRPAGE para cambiar"
+    b" el modoProfundidad por Pasadade"
+    b"sde base43Escanear Direcci\xc3\xb3nSe "
+    b"requiere entrop\xc3\xada adicional de "
+    b"la c\xc3\xa1mara para %sInvertirPrueba"
+    b"s del dispositivoVolver al Men\xc3\xba"
+    b"D\xc3\xa9jalo en blanco si quieres que"
+    b" Krux elija una \xc3\xbaltima palabra "
+    b"v\xc3\xa1lidaDesde C\xc3\xa1maraDescriptor d"
+    b"e salida de carteraAutotransfere"
+    b"ncia o Cambio (%d):Longitud:\xc2\xbfFi"
+    b"rmar?"
+)
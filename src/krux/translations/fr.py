@@ -19,382 +19,365 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-# pylint: disable=C0301
-translation_array = [
-    "% du montant.",
-    "%d de %d multisignature",
-    "%d à %d",
-    "%s bits",
-    "%s octets",
-    "%s car.",
-    "%s supprimé.",
-    "%s\u2009: chargé\u2009!",
-    "(%s bits/px)",
-    "(Expérimental)",
-    "(consultation)",
-    "12 mots",
-    "24 mots",
-    "À propos",
-    "Compte",
-    "Index du compte",
-    "Ajoutez ou modifiez la phrase secrète\u2009?",
-    "Entropie supplémentaire de la caméra requise pour %s",
-    "Adresse",
-    "Alignez correctement la caméra et plaque de sauvegarde.",
-    "Mode anti-reflets",
-    "Apparence",
-    "Es-tu sûr\u2009?",
-    "Couleurs BGR",
-    "Mnémonique BIP39",
-    "Retour",
-    "Retour au menu",
-    "Sauvegarde mnémonique",
-    "Signature non valide",
-    "Mot de passe Base64",
-    "Débit en bauds",
-    "Grille binaire",
-    "Rembourrage de bordure",
-    "Luminosité",
-    "Boutons",
-    "Anti-rebond des boutons",
-    "Capture annulée",
-    "Monnaie",
-    "Changer de thème et redémarrer\u2009?",
-    "Changer portefeuille?",
-    "La monnaie\u2009:",
-    "Les modifications dureront jusqu'à l'arrêt.",
-    "Vérifiez la carte SD",
-    "Vérifiez que l'adresse appartient à ce portefeuille\u2009?",
-    "%d adresses vérifiées sans correspondance.",
-    "Recherche de carte SD…",
-    "Confirmer le code de non compromis",
-    "Convertir le datum",
-    "Impossible de déterminer l'adresse de monnaie.",
-    "Créer un QR Code",
-    "Créer un code QR à partir de texte\u2009?",
-    "Créé\u2009:",
-    "Code de non compromis actuel",
-    "Code QR personnalisé",
-    "Texte personnalisé",
-    "Personnaliser",
-    "La personnalisation de votre portefeuille générera une nouvelle clé et déchargera le Descripteur.",
-    "Profondeur de coupe",
-    "Méthode de coupe",
-    "Outil Datum",
-    "Décimal",
-    "Déchiffrer\u2009?",
-    "Portefeuille par défaut",
-    "Supprimer ce fichier\u2009?",
-    "Profondeur par passage",
-    "Chemin de dérivation",
-    "Dériver l'entropie BIP85\u2009?",
-    "Adresses du descripteur",
-    "Tests de l'appareil",
-    "Affichage",
-    "Ne pas éteindre, cela peut prendre un certain temps.",
-    "Conversion terminée",
-    "Terminé\u2009?",
-    "Double mnémonique",
-    "Pilote",
-    "Vide",
-    "Activer\u2009?",
-    "Chiffrer",
-    "Chiffré",
-    "Code QR chiffré",
-    "Mnémonique chiffré stocké avec ID\u2009:",
-    "Le mnémonique chiffré n'a pas été stocké",
-    "Chiffrement",
-    "Mode de chiffrement",
-    "Entrez %d mots BIP39.",
-    "Saisissez un code de non compromis de plus de 6 caractères",
-    "Entrez chaque mot de votre mnémonique BIP39 sous la forme d'un nombre de 1 à 2048.",
-    "Entrez chaque mot de votre mnémonique BIP39 sous la forme d'un nombre en hexadécimal de 1 à 800.",
-    "Entrez chaque mot de votre mnémonique BIP39 sous la forme d'un nombre en octal de 1 à 4000.",
-    "Entrez chaque mot de votre mnémonique BIP39.",
-    "Effacer les données de l'utilisateur",
-    "Effacement des données de l'utilisateur…",
-    "Erreur\u2009:",
-    "Esc",
-    "Explorer des fichiers\u2009?",
-    "Adresses d'exportation",
-    "Exportation de %s vers la carte SD…",
-    "Clé publique",
-    "Paramètres d'usine",
-    "Échec de la collecte de l'entropie de la caméra",
-    "Échec de la conversion",
-    "Échec du déchiffrement",
-    "Échec lors du chargement",
-    "Échec du stockage mnémonique",
-    "Frais\u2009:",
-    "Taux d'alimentation",
-    "Nom de fichier",
-    "Le nom de fichier %s existe sur la carte SD.",
-    "Remplir le flash avec l'entropie de la caméra\u2009?",
-    "Remplissage du Flash",
-    "Empreinte digitale manquante dans PSBT",
-    "Plan du Flash",
-    "Outils Flash",
-    "Flash rempli par l'entropie de la caméra",
-    "Diamètre de flûte",
-    "Libre\u2009:",
-    "Du stockage",
-    "Effacez complètement votre carte SD dans un autre appareil pour assurer que les données soient irrécupérables",
-    "Générer un mnémonique",
-    "OK",
-    "Bonne entropie",
-    "Matériel",
-    "Type de tête",
-    "Clé publique hexadécimale\u2009:",
-    "Hexadécimal",
-    "Masquer les mnémoniques",
-    "Frais élevés\u2009!",
-    "ID",
-    "Id existe déjà",
-    "En cas d'échec d'affichage, l'appareil redémarrera automatiquement après 5 secondes utilisant les paramètres précédents.",
-    "Index",
-    "Entrées (%d)\u2009:",
-    "Entropie insuffisante\u2009!",
-    "Code de non compromis non valide",
-    "Adresse invalide",
-    "Chemin de dérivation non valide",
-    "Longueur mnémonique invalide",
-    "Portefeuille invalide\u2009:",
-    "Inverser",
-    "Couleurs inversées",
-    "KEF chiffré",
-    "Clé",
-    "La clé n'a pas été fournie",
-    "Test de l'imprimante Krux QR",
-    "Type d'écran LCD",
-    "Langue",
-    "Laissez vide si vous souhaitez que Krux choisisse un dernier mot valide",
-    "Gauche",
-    "Longueur\u2009:",
-    "Délai de Ligne",
-    "Ligne\u2009:",
-    "Listage d'Addresses",
-    "Charger Mnémonique",
-    "Charger le portefeuille",
-    "Charger un descripteur de portefeuille de confiance pour afficher les adresses\u2009?",
-    "Charger depuis la carte SD",
-    "Charger depuis la carte SD\u2009?",
-    "Charger depuis la caméra",
-    "Charger\u2009?",
-    "Chargement de la caméra…",
-    "Chargement des adresses de monnaie…",
-    "Chargement de l'imprimante…",
-    "Chargement des adresses de réception…",
-    "Chargement…",
-    "Paramètres régionaux",
-    "Emplacement",
-    "Moyen",
-    "Message",
-    "Message\u2009:",
-    "Miniscript",
-    "Refléter coordonnées X",
-    "Fichier de signature manquant",
-    "Mnémonique",
-    "Mnémonique XOR",
-    "Mnémonique et phrase secrète seront conservés.",
-    "Modifié\u2009:",
-    "Réseau",
-    "Nouveau Mnémonique",
-    "Nouveau micrologiciel détecté.",
-    "Non",
-    "Pas de phrase secrète",
-    "Des caractères non ASCII ont été détectés dans votre phrase secrète. Krux ne peut garantir que d'autres portefeuilles obtiendront la même clé.",
-    "Pas assez de jets\u2009!",
-    "Nombres",
-    "Octale",
-    "Autres formats",
-    "Écraser\u2009?",
-    "PAGE pour ajuster la luminosité",
-    "PBKDF2 iter.",
-    "Noircissez les points perforés afin qu'ils puissent être détectés.",
-    "Largeur du papier",
-    "Partie",
-    "Partie M de N",
-    "Taille de la pièce",
-    "Phrase secréte",
-    "Longueur du mot de passe",
-    "Inadéquation du chemin",
-    "Motif détecté\u2009!",
-    "Supprimer définitivement tous les mnémoniques et paramètres chiffrés stockés dans le flash\u2009?",
-    "Persistance",
-    "Indice de déviation des pixels\u2009:",
-    "QR en Texte Brut",
-    "Veuillez charger un descripteur de sortie de portefeuille",
-    "Taux de plongée",
-    "Type de politique",
-    "Entropie faible\u2009!",
-    "Puissance",
-    "Appuyez sur PAGE pour annuler.",
-    "PAGE pour changer de mode",
-    "Impression Test QR",
-    "Imprimer Tinyseed\u2009?",
-    "Imprimer Code QR",
-    "Imprimer Code QR\u2009?",
-    "Imprimer\u2009?",
-    "Imprimante",
-    "Le pilote d'imprimante n'est pas défini\u2009!",
-    "Impression…",
-    "Procéder quand même\u2009?",
-    "Procéder\u2009?",
-    "Traitement en cours…",
-    "Non-dépensable prouvé",
-    "Code QR",
-    "Texte d'étiquette QR",
-    "Quantité",
-    "RX Fiche",
-    "Redémarrer",
-    "Recevoir",
-    "Région\u2009:",
-    "Supprimer %s\u2009?",
-    "Supprimer mnémonique",
-    "Supprimer les fichiers micrologiciel de la carte SD\u2009?",
-    "Rés. - Format",
-    "Restaurer les paramètres d'usine et redémarrer\u2009?",
-    "Résultat",
-    "Retour au visualiseur QR",
-    "Revérifier",
-    "Examinez les données numérisées, modifiez-les si nécessaire",
-    "À droite",
-    "Lancez le dé au moins %d fois pour générer un mnémonique.",
-    "Distribution des jets\u2009:",
-    "Jets\u2009:",
-    "Rotation de 180°",
-    "Carte SD",
-    "Carte SD non détectée.",
-    "SHA256 de jets\u2009:",
-    "SHA256 de snapshot\u2009:",
-    "Enregistrer l'image QR sur la carte SD",
-    "Enregistrer sur la carte SD",
-    "Enregistrer sur la carte SD\u2009?",
-    "Enregistré sur la carte SD\u2009:",
-    "L'échelle",
-    "Scannez l'adresse",
-    "Scannez la phrase secrète BIP39",
-    "Scannez le Code QR de la clé",
-    "Analyser à nouveau les mots 1 à 12",
-    "Analyser les mots 13 à 24",
-    "Delai d'Inactivité",
-    "Type de Script",
-    "Sécurité",
-    "Auto-transfert ou monnaie (%d)\u2009:",
-    "Auto-transfert\u2009:",
-    "Définissez d'abord un code de non compromis",
-    "Paramètres",
-    "Paramètres stockés en interne sur flash.",
-    "Paramètres stockés sur la carte SD.",
-    "Entropie de Shannon\u2009:",
-    "Afficher le datum",
-    "Éteindre",
-    "Delai d'Arrêt",
-    "Arrêt en cours…",
-    "Signer",
-    "Signer avec le code QR",
-    "Signer sur la carte SD",
-    "Signer\u2009?",
-    "Signature\u2009:",
-    "Message signé",
-    "PSBT signé",
-    "Signature du hachage brut. Procédez uniquement si vous faites confiance à la source.",
-    "Signature…",
-    "Clé unique",
-    "Capacité\u2009:",
-    "Certains vérifications ne peuvent pas être effectués.",
-    "Certains nœuds ne sont pas durcis :",
-    "Dépense (%d)\u2009:",
-    "Dépense\u2009:",
-    "Mode standard",
-    "Statique",
-    "Statistiques pour les geeks",
-    "Stocker sur flash",
-    "Stocker sur la carte SD",
-    "Force",
-    "Fort",
-    "Faites glisser pour changer de mode",
-    "TC Flash Hash",
-    "TC Flash Hash au démarrage",
-    "TOUCHEZ ou ENTRER pour capturer",
-    "TOUCHEZ ou ENTRER pour installer.",
-    "Clé interne TR",
-    "TX Fiche",
-    "Code de non compromis",
-    "Code de non compromis défini avec succès",
-    "Les codes de non compromis ne correspondent pas",
-    "Suite de Tests",
-    "Résultats de la suite de tests",
-    "Test:",
-    "Texte",
-    "Thème",
-    "Thermique",
-    "Pour assurer que les données soient irrécupérables, utilisez la fonctionnalité 'Effacer l'appareil'",
-    "Ajuster la luminosité",
-    "Outils",
-    "Sensibilité",
-    "Écran Tactile",
-    "Réessayer\u2009?",
-    "Entrez la phrase secrète BIP39",
-    "Taper clé",
-    "Annuler",
-    "Unité",
-    "Mettre à jour l'ID KEF\u2009?",
-    "Mettre à jour l'étiquette QR\u2009?",
-    "Mise à jour complète.",
-    "Utilisez une surface de fond noire.",
-    "Utilisez l'entropie de la caméra pour créer un nouveau mnémonique",
-    "Utiliser valeur actuelle",
-    "Utiliser le mode par défaut\u2009?",
-    "Utiliser l'itération PBKDF2 par défaut.\u2009?",
-    "Utiliser l'empreinte digitale comme pièce d'identité\u2009?",
-    "Utilisé\u2009:",
-    "Utilisateur",
-    "Valeur %s hors de portée: [%s, %s]",
-    "Vérification…",
-    "Version",
-    "Par caméra",
-    "Via D20",
-    "Via D6",
-    "Par saisie manuelle",
-    "Via Mots",
-    "sur une étiquette lisible",
-    "Attendez la capture",
-    "Portefeuille",
-    "Descripteur de Portefeuille",
-    "Portefeuille différent:",
-    "Descripteur de sortie du portefeuille",
-    "Descripteur de sortie du portefeuille chargé\u2009!",
-    "Descripteur de sortie du portefeuille introuvable.",
-    "Avertissement\u2009:",
-    "Faible",
-    "Mot %d",
-    "Numéros de mots",
-    "Mots",
-    "Résultat XOR",
-    "XOR avec",
-    "XOR mnémonique actuel avec un autre\u2009? (la phrase secrète et le descripteur seront supprimés)",
-    "Oui",
-    "Mode zoomé",
-    "binaire\u2009:",
-    "echoué",
-    "depuis HEXA.",
-    "depuis base32",
-    "depuis base43",
-    "depuis base64",
-    "depuis hexa.",
-    "depuis utf8",
-    "Adresse valide\u2009!",
-    "casse des caractères",
-    "Taux de réussite:",
-    "glisser",
-    "texte\u2009:",
-    "vers HEXA.",
-    "vers base32",
-    "vers base43",
-    "vers base64",
-    "vers hexa.",
-    "vers utf8",
-    "inconnu",
-    "INTROUVABLE dans les %d premières adresses",
-]
+# pylint: disable=C0103,C0301
+catalog = (
+    b"l\x01\xb6\x11\x16\x00l\xfa\xa6\x02[\xa8b\x04\xed\x8e:\x06\xe6\x81m\x07\xb6\x8b\xef\x07B{d\x08\xb7\x06"
+    b'\xff\x08\nf\x00\n(\x1f\x16\x0c\xbcI\xdb\rpi"\x0e\xff#)\x0e\x88\x1f\xe1\x0ef\x97\xa1\x0f\x8b\xea'
+    b"5\x11\x8arH\x11%\xc4\xc6\x14k\xd8\xe0\x14\xefy\xca\x16j\xc7\xd9\x16GG.\x17\x05\xd5R\x17\xeal"
+    b"\xf3\x17\x81\xd3*\x19\xbba\xc5\x19\xe0\x94\xdd\x19\x93\xc23\x1ck\xf8<\x1c\xbd\xc3\xd1\x1dhW\xae\x1f\xeat"
+    b'\x9b!\xf2\xb1\x1d"\x00\xb9/#Lj\xa3#\xf4\xb7\xec#k\xd7\xb4$\x13\t\xea$\xf1\xf7(&\xe9~'
+    b"\xaf&`Rp(\xfa\x1c*)\xa8\xdaL)|\xb9\xb7)j\x91\\*\x93gx*\xeb\xf5\xea*s\xf1"
+    b';+"\xd6r+\xf4\x85t-\x80\n\x87-\xe3\x13\xad-J\x9f\xea-\x9d.\x93.\xb80\xc4.uU'
+    b"\x8b/\x7f\x0b\xb5/\x8e\x83\xcf/g\xd4\xb80n\xea\xf30\x12Ec1\x99\x1bi1\xef|73\x14\x15"
+    b"\xe83\xe5\x91o4\x86|\xea4\x1f\xaf\xfd4\xc9\xa3\xaa5\xbd\xca\xd85Z'S6\x02\xcb^6\xd5\x91"
+    b"\xb36\x16\x19\x087\xfc?[7\xd84\xf69\x89\x0fZ:\x81\xa9[;|\x91\xec;\x97\xb7\xed<\x95e"
+    b"7>\x1e\xd1\xfd>\xc0>L?\xfd\x91\x1f@x}=@\x87j\x8dA\x84>\x96A\xed\xf2\xc7Aq@"
+    b"\xf1B\xcc\x14BC\xdf~.D\xba\x16\x8bEhY\x0cF\xae\xc3,F\x11r?F! XF\x90\xb9"
+    b"\xa5F\x1a\xcd\xccF\x1c\n7G\xee\x08nG\x16\xfb\xfbG\x8fbzI30\xc0I\xf9\xd4'J?\xad"
+    b"&K`D\xd1Kg`\x16MIs\xaaM\x8f\xe6\x15Na\xdcLP\x9b\x94\xe9Q\x12@\x88RJ\xde"
+    b"\xd6S8\xa4\xc0U?\x9c\x05V\x0c\xc8\xb4VB\x9dPW\x9c\x07\x01Xd\xe9\x83X\x87L\x97Y\xe8\xcc"
+    b"&Z\xa0[\xcf\\q\xd7\x08^\t\x84]^\x0c\x01k^\x08i2_\x1c;\xa3b[\xb9\xdab*\xfe"
+    b'\x13c\xb9\x993cd\n\xfdcY"\xa2d\x8d?\xf2dy\x96\x1de\x9d\x9e\x8de2\x8e\x00f\xc5\x1b'
+    b"\x18f`t\x85fY\xcftg\xcd8\xd1g\xed\xd1\njM\x865j\xa4.Kj\x13]\xd1j\x0bT"
+    b"\xa6k\xe8{}l\x94\xbc\xd4l0\x11\xe0m?\xfb*n]\x8eRn\x08{Xo\xb9m\x87o\xde\xd6"
+    b"\xcfom\x14@p\xc3\x99\xd8p\xa8\x93)q\x8dirs0\x13\x16t\x8b\xf3 t\xe7\r5t\xe8\xda"
+    b"\xcat\x10Z\x0bu\xd9\xd4\x84v9\xab\xf4wYQ_xZ\x9b\xf9x\x08\xc8#yw\xde|yq\xdf"
+    b"\xfcy4\xd9\xe0z\xac\x11e{)\x97\xc4{m\xa3\x89|\x9f\x8a\x9b|\xdeG\xa7}?\x0e\xf2\x80\x00\x1e"
+    b"i\x81\xa6Z\xc0\x81u\xc6W\x82\x0c\x11r\x85\xa2\xcb6\x86j\x8f~\x86\x80\xb1\x83\x86\xffY\x98\x86\xbe\xf6"
+    b"W\x87\x13-l\x87\xc3\x10\xfb\x87\xbc\x93\xb9\x88\xdf\xde\xe9\x88\xf2\xaf\x9f\x8a\xb6\xd1\x9f\x8a)\xbcE\x8b\x7f\x00"
+    b"\xc2\x8b*\xbc\xe1\x8ca\x90\x04\x8d\x89Q;\x8d\xdd\x8e2\x8f\xbf\xc3D\x90\x95\x8e}\x91\x0f$\x83\x93D\xa7"
+    b"\xff\x94\xb1\x8b#\x95\x0f\x8a@\x95\x1flE\x95n7#\x963\xd5+\x96Rv\x13\x99J\xc7\xaa\x99\xdb\xd0"
+    b"\xd0\x99&\x1f\x1d\x9a\x03 5\x9a\xa2]\xb1\x9aO?\x11\x9b\xf9\x08\xb9\x9b-\xcb\x9f\x9d\xfa\x03\x04\x9fp}"
+    b"?\x9f\xd0\x8bp\x9fw+i\xa0D\xde\x87\xa0\xad\x08\xce\xa0y\xe5\xf1\xa0\x9a\xfe\x03\xa1\xbfX\xe0\xa2.\xc5"
+    b"\x1b\xa3\x12\xe1\x1b\xa3V\xd4J\xa3\x0f<\xab\xa3\xee\xa8\xfa\xa3\xaa\x0cJ\xa4\xf0\x84\x8a\xa5\xf8\xe2\x19\xa6\xe4\xa8"
+    b"T\xa6\x9d\xeb\xe8\xa7\xc3\xc2\xec\xa7\x18\xde \xa8\xc0\x12\x06\xa9P]\x94\xa9\x1ei\xa7\xaaX\xcb\xa8\xabNw"
+    b"\xa9\xabO\xd9\xfb\xac\xc7\xa7&\xadY\xb5'\xaf \xbe9\xaf\xc0ZG\xaf\x0e\xa2\x9a\xaf\x881\xbc\xb0\x12s"
+    b"\xf0\xb0d\xa3\x8b\xb1\x8e7\x16\xb28o\x8b\xb2I\xed\xdd\xb2O4\x88\xb3\xdd\xe6\x05\xb5\xfd\xe52\xb5\xfb\x95"
+    b"\x9d\xb5e\xf3#\xb8\xae\x87>\xb8]\x1f\x92\xb9\x07\x86\xf0\xb9\x163\r\xbbS;\xc3\xbeE\xb4\xa1\xbfh\xae"
+    b"\xd0\xbf\xb4\xbb?\xc1z\xa1\x92\xc1\xc3\xd2\xa4\xc1\x81@\xdf\xc1\xd5\xa5q\xc2;b\x95\xc2\x1dV\xf3\xc2\xa5V"
+    b"\xf8\xc2?Kl\xc3\xcc\xd3\xe8\xc4\xe8\x955\xc53\x8b}\xc5\xa4]U\xc6\x89\x87\x86\xc6\x0e\xc6\xda\xc6\xba\x81"
+    b'\xff\xc6\x97\xd5\x0c\xc7dW\x97\xc7^&\xc3\xc8B\xb6\xb7\xc9T\x8e<\xcb\x14\xb8\x97\xcc"^\x06\xcd\x92%'
+    b")\xcd\x7f\x8a[\xcd\tn\xfc\xcd\x16ig\xd1\xe7\xa7z\xd1\xad\xf3\xd5\xd1\x83\x1d\x82\xd2\xed\xad\x89\xd3d\x00"
+    b")\xd4v\x16L\xd4Z8a\xd4\xd0\xc2\x89\xd5\xbf\n\xb5\xd5k\x1b+\xd6\x92\xba\x11\xd8\\\x9d\x19\xd8O4"
+    b"\xa9\xd8\xcb\xf9\xeb\xd9VHU\xda\xbc]\xde\xda\x03Y\xf1\xda\x89^O\xdb\xa9\xe9Y\xdb0\x00\xa0\xdb\x99w"
+    b"@\xdeRI\xe6\xdeR\xdc\x10\xdf\xe9G<\xdf\xc23~\xdfg\xe9\x80\xdf\xdc\xdf\xb4\xdf\x95x\x9d\xe0]\xcb"
+    b"\xc3\xe2\x95w\xa3\xe44\xba\xb1\xe4WV\xca\xe4;\x9f@\xe5@\x81\xee\xe5\xb7\x00\x11\xe7I\xd0/\xe8\x87\xc4"
+    b"\xab\xe8\x95\x8f\xae\xe8\xf8\xdf=\xe9\x13!%\xear\xf0\xae\xea\xe5\x0c\t\xed\xe0\xdfT\xed/xy\xed/9"
+    b"\x9a\xee\x1c\x8a\xcb\xeej\xe8\xcf\xee\xb5a\x1f\xefb\xabC\xef\x0e\xc4\xaf\xf0\x95)\xb0\xf0\x974-\xf1\xbd\x0c"
+    b".\xf2)\x9e`\xf31\xd9\xee\xf3\xfa\x95\xfc\xf3\xdc\x97\x06\xf4\tdW\xf4\x8e\xb9\x87\xf4E\x1e\xd1\xf4\xe7`"
+    b"k\xf5\x06\xe8\xa1\xf5\xf1k\xbe\xf5\xd1Wa\xf7\xa6Hp\xf7\xe8\xe3'\xf9\xafz\xce\xf9wr\x05\xfcD0"
+    b"I\xfc\xb3`P\xfd^\xee\xa0\xfd\x9d\xa0\xdd\xfe>L?\xff\x00\x00\x00\x00]\x00\x00\x00\x8e\x00\x00\x00\xa1\x00"
+    b"\x00\x00\xb4\x00\x00\x00\xc7\x00\x00\x00\xd0\x00\x00\x00\xdb\x00\x00\x00\xeb\x00\x00\x00\x13\x01\x00\x00\x1d\x01\x00\x00*\x01"
+    b"\x00\x00D\x01\x00\x00]\x01\x00\x00q\x01\x00\x00z\x01\x00\x00\x83\x01\x00\x00\x91\x01\x00\x00\x9a\x01\x00\x00\xa5\x01"
+    b"\x00\x00\xab\x01\x00\x00\xc3\x01\x00\x00\xf0\x01\x00\x00\xfe\x01\x00\x00\x1d\x02\x00\x00?\x02\x00\x00G\x02\x00\x00_\x02"
+    b"\x00\x00j\x02\x00\x00{\x02\x00\x00\x8e\x02\x00\x00\xbb\x02\x00\x00\xe5\x02\x00\x00\xfc\x02\x00\x00\x0f\x03\x00\x00 \x03"
+    b'\x00\x00"\x03\x00\x004\x03\x00\x00?\x03\x00\x00R\x03\x00\x00k\x03\x00\x00u\x03\x00\x00\x87\x03\x00\x00\xac\x03'
+    b"\x00\x00\xd2\x03\x00\x00\xda\x03\x00\x00\xff\x03\x00\x00\x16\x04\x00\x00\x1c\x04\x00\x00\x81\x04\x00\x00\x8c\x04\x00\x00\x96\x04"
+    b"\x00\x00\x9c\x04\x00\x00\xd9\x04\x00\x00\xeb\x04\x00\x00\xfb\x04\x00\x00\x01\x05\x00\x00\"\x05\x00\x00'\x05\x00\x00=\x05"
+    b"\x00\x00I\x05\x00\x00V\x05\x00\x00j\x05\x00\x00\x96\x05\x00\x00\xb6\x05\x00\x00\xd4\x05\x00\x00\xf4\x05\x00\x00\xfe\x05"
+    b"\x00\x006\x06\x00\x00C\x06\x00\x00T\x06\x00\x00s\x06\x00\x00\x88\x06\x00\x00\xa5\x06\x00\x00\xbb\x06\x00\x00\xca\x06"
+    b"\x00\x00\xdd\x06\x00\x00#\x07\x00\x00.\x07\x00\x008\x07\x00\x00G\x07\x00\x00U\x07\x00\x00[\x07\x00\x00h\x07"
+    b"\x00\x00q\x07\x00\x00\x7f\x07\x00\x00\x8b\x07\x00\x00\xa6\x07\x00\x00\xb0\x07\x00\x00\xb7\x07\x00\x00\xf1\x07\x00\x00\x03\x08"
+    b"\x00\x00\x18\x08\x00\x00.\x08\x00\x00;\x08\x00\x00D\x08\x00\x00[\x08\x00\x00\x87\x08\x00\x00\x9c\x08\x00\x00\xaa\x08"
+    b"\x00\x00\xb1\x08\x00\x00\xcc\x08\x00\x00\xd8\x08\x00\x00\xe8\x08\x00\x00\xf4\x08\x00\x00\x0c\t\x00\x00\x19\t\x00\x00\x1c\t"
+    b"\x00\x00#\t\x00\x00?\t\x00\x00Z\t\x00\x00\x83\t\x00\x00\x96\t\x00\x00\xae\t\x00\x00\xdf\t\x00\x00\xe5\t"
+    b"\x00\x00\xf7\t\x00\x00\x0c\n\x00\x00\x19\n\x00\x00!\n\x00\x00.\n\x00\x00e\n\x00\x00k\n\x00\x00\x8f\n"
+    b"\x00\x00\x9e\n\x00\x00\xa9\n\x00\x00\xc1\n\x00\x00\xcc\n\x00\x00\x0b\x0b\x00\x00\x1f\x0b\x00\x00*\x0b\x00\x005\x0b"
+    b"\x00\x00L\x0b\x00\x00^\x0b\x00\x00n\x0b\x00\x00{\x0b\x00\x00\x92\x0b\x00\x00\x9b\x0b\x00\x00\xa6\x0b\x00\x00\xb9\x0b"
+    b"\x00\x00\xc7\x0b\x00\x00\xf2\x0b\x00\x00\xfb\x0b\x00\x00\x0e\x0c\x00\x003\x0c\x00\x00b\x0c\x00\x00k\x0c\x00\x00|\x0c"
+    b"\x00\x00\x83\x0c\x00\x00\xab\x0c\x00\x00\xb7\x0c\x00\x00(\r\x00\x00S\r\x00\x00i\r\x00\x00t\r\x00\x00\x93\r"
+    b"\x00\x00\xac\r\x00\x00\xb4\r\x00\x00\xbf\r\x00\x00\xc8\r\x00\x00\xdf\r\x00\x00\xe8\r\x00\x00\xf6\r\x00\x00\x0b\x0e"
+    b"\x00\x00\x18\x0e\x00\x00+\x0e\x00\x004\x0e\x00\x00K\x0e\x00\x00Y\x0e\x00\x00c\x0e\x00\x00}\x0e\x00\x00\x89\x0e"
+    b"\x00\x00\x8f\x0e\x00\x00\xa0\x0e\x00\x00\xab\x0e\x00\x00\xc6\x0e\x00\x00\xd8\x0e\x00\x00\xe1\x0e\x00\x00\r\x0f\x00\x00\x15\x0f"
+    b"\x00\x00\"\x0f\x00\x00t\x0f\x00\x00\x88\x0f\x00\x00\xef\x0f\x00\x00\xfe\x0f\x00\x00\x06\x10\x00\x00\x11\x10\x00\x00'\x10"
+    b"\x00\x00B\x10\x00\x00X\x10\x00\x00\x93\x10\x00\x00\xa8\x10\x00\x00\xe0\x10\x00\x00\xe7\x10\x00\x00\x1b\x11\x00\x002\x11"
+    b"\x00\x00v\x11\x00\x00\xcc\x11\x00\x00\xe7\x11\x00\x00}\x12\x00\x00\xaf\x12\x00\x00\xc0\x12\x00\x00\xc8\x12\x00\x00\xdb\x12"
+    b"\x00\x00\xfd\x12\x00\x00\x08\x13\x00\x00\x1b\x13\x00\x00>\x13\x00\x00K\x13\x00\x00[\x13\x00\x00\x8c\x13\x00\x00\x96\x13"
+    b"\x00\x00\xa9\x13\x00\x00\xae\x13\x00\x00\xb2\x13\x00\x00\xb8\x13\x00\x00\xc9\x13\x00\x00\xec\x13\x00\x00\xf8\x13\x00\x00\t\x14"
+    b"\x00\x00\x11\x14\x00\x00'\x14\x00\x00<\x14\x00\x00J\x14\x00\x00d\x14\x00\x00|\x14\x00\x00\x83\x14\x00\x00\x8e\x14"
+    b"\x00\x00\x9d\x14\x00\x00\xb3\x14\x00\x00\xbf\x14\x00\x00\xd6\x14\x00\x00\xe2\x14\x00\x00\xed\x14\x00\x00\xfb\x14\x00\x00\x0e\x15"
+    b"\x00\x00\x12\x15\x00\x00\x1b\x15\x00\x00?\x15\x00\x00U\x15\x00\x00e\x15\x00\x00\x92\x15\x00\x00\x99\x15\x00\x00\xb1\x15"
+    b"\x00\x00\xb8\x15\x00\x00\xd5\x15\x00\x00\xf3\x15\x00\x00\xf7\x15\x00\x00$\x16\x00\x002\x16\x00\x00C\x16\x00\x00I\x16"
+    b"\x00\x00M\x16\x00\x00T\x16\x00\x00f\x16\x00\x00\xc9\x16\x00\x00\xe6\x16\x00\x00\xed\x16\x00\x00\x05\x17\x00\x00#\x17"
+    b"\x00\x00\\\x17\x00\x00l\x17\x00\x00\x81\x17\x00\x00\x9a\x17\x00\x00\xa6\x17\x00\x00\xb7\x17\x00\x00\xc8\x17\x00\x00\xe8\x17"
+    b"\x00\x00\xed\x17\x00\x00\xf9\x17\x00\x00\x16\x18\x00\x00\x1d\x18\x00\x006\x18\x00\x00?\x18\x00\x00P\x18\x00\x00p\x18"
+    b"\x00\x00~\x18\x00\x00\xfc\x18\x00\x00\x07\x19\x00\x00\x13\x19\x00\x00\x1e\x19\x00\x00*\x19\x00\x009\x19\x00\x00A\x19"
+    b"\x00\x00N\x19\x00\x00f\x19\x00\x00s\x19\x00\x00\x9d\x19\x00\x00\xb2\x19\x00\x00\xbf\x19\x00\x00\xc5\x19\x00\x00\xda\x19"
+    b"\x00\x00\xfd\x19\x00\x00^\x1a\x00\x00}\x1a\x00\x00\x95\x1a\x00\x00\xa8\x1a\x00\x00\xe1\x1a\x00\x00\x00\x1b\x00\x00\x08\x1b"
+    b"\x00\x00\x15\x1b\x00\x00.\x1b\x00\x00]\x1b\x00\x00\x82\x1b\x00\x00\xa2\x1b\x00\x00\xb0\x1b\x00\x00\xb6\x1b\x00\x00\xc1\x1b"
+    b"\x00\x00\xc8\x1b\x00\x00\xf2\x1b\x00\x00\xf9\x1b\x00\x00\x05\x1c\x00\x00Y\x1c\x00\x00i\x1c\x00\x00y\x1c\x00\x00\x90\x1c"
+    b"\x00\x00\xb8\x1c\x00\x00\xce\x1c\x00\x00\xe0\x1c\x00\x00\xee\x1c\x00\x00\x02\x1d\x00\x00\x1e\x1d\x00\x00*\x1d\x00\x00C\x1d"
+    b"\x00\x00S\x1d\x00\x00\\\x1d\x00\x00n\x1d\x00\x00\xa3\x1d\x00\x00\xcf\x1d\x00\x00\xe7\x1d\x00\x00\xed\x1d\x00\x00\n\x1e"
+    b"\x00\x00\x19\x1e\x00\x00!\x1e\x00\x004\x1e\x00\x00?\x1e\x00\x00b\x1e\x00\x00\x86\x1e\x00\x00\xac\x1e\x00\x00\xc4\x1e"
+    b"\x00\x00\xf6\x1e\x00\x00\x15\x1f\x00\x005\x1f\x00\x00\x98\x1f\x00\x00\x9b\x1f\x00\x00\xa6\x1f\x00\x00\xbb\x1f\x00\x00\xd8\x1f"
+    b"\x00\x00\xe9\x1f\x00\x00\x02 \x00\x00\x18 \x00\x00% \x00\x006 \x00\x00l \x00\x00t \x00\x00\x87 "
+    b"\x00\x00\x95 \x00\x00\xdc \x00\x00\xe7 \x00\x00\xef \x00\x00\x14!\x00\x00#!\x00\x00E!\x00\x00Q!"
+    b"\x00\x00[!\x00\x00Entrez chaque mot de votre"
+    b" mn\xc3\xa9monique BIP39 sous la forme"
+    b" d'un nombre en octal de 1 \xc3\xa0 40"
+    b"00.\xc3\x89chec de la collecte de l'en"
+    b"tropie de la cam\xc3\xa9raNouveau Mn\xc3\xa9"
+    b"moniqueTaux d'alimentationProfon"
+    b"deur de coupeMat\xc3\xa9rielPersistanc"
+    b"eImprimer Code QRCr\xc3\xa9er un code "
+    b"QR \xc3\xa0 partir de texte\xe2\x80\x89?vers HE"
+    b"XA.% du montant.Charger depuis l"
+    b"a carte SDPortefeuille invalide\xe2"
+    b"\x80\x89:Tests de performanceFrais\xe2\x80\x89:"
+    b"texte\xe2\x80\x89:Type de ScriptR\xc3\xa9sultat"
+    b"ChiffrementPilote\xc3\x89chec du d\xc3\xa9ch"
+    b"iffrementLes modifications durer"
+    b"ont jusqu'\xc3\xa0 l'arr\xc3\xaat.Autres for"
+    b"matsEntrez la phrase secr\xc3\xa8te BI"
+    b"P39Confirmer le code de non comp"
+    b"romisJets\xe2\x80\x89:Longueur du mot de "
+    b"passeParam\xc3\xa8tresType de politiqu"
+    b"eMotif d\xc3\xa9tect\xc3\xa9\xe2\x80\x89!Entrez chaqu"
+    b"e mot de votre mn\xc3\xa9monique BIP39"
+    b".Param\xc3\xa8tres stock\xc3\xa9s en interne"
+    b" sur flash.\xc3\x89chec de la conversi"
+    b"onPar saisie manuelleM\xc3\xa9thode de"
+    b" coupeOKTaux de r\xc3\xa9ussite:Mode z"
+    b"oom\xc3\xa9Couleurs invers\xc3\xa9esEntropie"
+    b" insuffisante\xe2\x80\x89!Cr\xc3\xa9\xc3\xa9\xe2\x80\x89:Doubl"
+    b"e mn\xc3\xa9moniqueExportation de %s v"
+    b"ers la carte SD\xe2\x80\xa6Enregistrer l'"
+    b"image QR sur la carte SDRX Fiche"
+    b"Param\xc3\xa8tres stock\xc3\xa9s sur la cart"
+    b"e SD.Stocker sur la carte SDOuti"
+    b"lsLa personnalisation de votre p"
+    b"ortefeuille g\xc3\xa9n\xc3\xa9rera une nouve"
+    b"lle cl\xc3\xa9 et d\xc3\xa9chargera le Descr"
+    b"ipteur.Message\xe2\x80\x89:L'\xc3\xa9chelleLang"
+    b"ueLancez le d\xc3\xa9 au moins %d fois"
+    b" pour g\xc3\xa9n\xc3\xa9rer un mn\xc3\xa9monique.A"
+    b"rr\xc3\xaat en cours\xe2\x80\xa6Taux de plong\xc3\xa9"
+    b"eMot %dTOUCHEZ ou ENTRER pour in"
+    b"staller.ForceSHA256 de snapshot\xe2"
+    b"\x80\x89:depuis hexa.Plan du FlashImpr"
+    b"imer Code QR\xe2\x80\x89?Le nom de fichie"
+    b"r %s existe sur la carte SD.Chem"
+    b"in de d\xc3\xa9rivation non valideChar"
+    b"ger depuis la carte SD\xe2\x80\x89?PAGE p"
+    b"our ajuster la luminosit\xc3\xa9Erreur"
+    b"\xe2\x80\x89:Alignez correctement la cam\xc3"
+    b"\xa9ra et plaque de sauvegarde.R\xc3\xa9s"
+    b"ultat XORType d'\xc3\xa9cran LCDR\xc3\xa9sul"
+    b"tats de la suite de testscasse d"
+    b"es caract\xc3\xa8resScannez le Code QR"
+    b" de la cl\xc3\xa9Rembourrage de bordur"
+    b"eD\xc3\xa9lai de LigneEntropie faible\xe2"
+    b"\x80\x89!Noircissez les points perfor\xc3"
+    b"\xa9s afin qu'ils puissent \xc3\xaatre d\xc3"
+    b"\xa9tect\xc3\xa9s.depuis utf8S\xc3\xa9curit\xc3\xa9In"
+    b"dex du compteEs-tu s\xc3\xbbr\xe2\x80\x89?Signe"
+    b"rMode standardLibre\xe2\x80\x89:(consulta"
+    b"tion)Signature\xe2\x80\xa6Chargement de l"
+    b"a cam\xc3\xa9ra\xe2\x80\xa6ImprimanteAnnulerUti"
+    b"liser l'empreinte digitale comme"
+    b" pi\xc3\xa8ce d'identit\xc3\xa9\xe2\x80\x89?SHA256 de"
+    b" jets\xe2\x80\x89:Texte d'\xc3\xa9tiquette QRPa"
+    b"ram\xc3\xa8tres r\xc3\xa9gionaux%s supprim\xc3\xa9"
+    b".Thermique%d de %d multisignatur"
+    b"e%d adresses v\xc3\xa9rifi\xc3\xa9es sans co"
+    b"rrespondance.Imprimer Tinyseed\xe2\x80"
+    b"\x89?Bonne entropieMonnaieStatistiq"
+    b"ues pour les geeksModifi\xc3\xa9\xe2\x80\x89:Co"
+    b"de QR chiffr\xc3\xa9D\xc3\xa9pense\xe2\x80\x89:Portef"
+    b"euille par d\xc3\xa9fautPartie M de NO"
+    b"ui24 motsCode de non compromis a"
+    b"ctuelMettre \xc3\xa0 jour l'ID KEF\xe2\x80\x89?"
+    b"Flash rempli par l'entropie de l"
+    b"a cam\xc3\xa9raDiam\xc3\xa8tre de fl\xc3\xbbteSupp"
+    b"rimer ce fichier\xe2\x80\x89?Mn\xc3\xa9monique "
+    b"et phrase secr\xc3\xa8te seront conser"
+    b"v\xc3\xa9s.Th\xc3\xa8meConvertir le datumSup"
+    b"primer mn\xc3\xa9moniquedepuis base64%"
+    b"d \xc3\xa0 %dSignature\xe2\x80\x89:Supprimer le"
+    b"s fichiers micrologiciel de la c"
+    b"arte SD\xe2\x80\x89?OctaleChanger de th\xc3\xa8"
+    b"me et red\xc3\xa9marrer\xe2\x80\x89?Mn\xc3\xa9monique"
+    b" XORvers base43Utiliser valeur a"
+    b"ctuelleR\xc3\xa9gion\xe2\x80\x89:Examinez les d"
+    b"onn\xc3\xa9es num\xc3\xa9ris\xc3\xa9es, modifiez-l"
+    b"es si n\xc3\xa9cessaireConversion term"
+    b"in\xc3\xa9eActiver\xe2\x80\x89?binaire\xe2\x80\x89:Non-d"
+    b"\xc3\xa9pensable prouv\xc3\xa9%s\xe2\x80\x89: charg\xc3\xa9"
+    b"\xe2\x80\x89!QR en Texte BrutCl\xc3\xa9 publiqu"
+    b"eAdresses du descripteurQuantit\xc3"
+    b"\xa9vers base32Texte personnalis\xc3\xa9S"
+    b"uite de TestsEffacement des donn"
+    b"\xc3\xa9es de l'utilisateur\xe2\x80\xa6Puissanc"
+    b"eListage d'AddressesChargement d"
+    b"es adresses de monnaie\xe2\x80\xa6Les cod"
+    b"es de non compromis ne correspon"
+    b"dent pas\xc3\x89teindreAfficher le dat"
+    b"umCode QRMn\xc3\xa9monique chiffr\xc3\xa9 st"
+    b"ock\xc3\xa9 avec ID\xe2\x80\x89:Couleurs BGREff"
+    b"acez compl\xc3\xa8tement votre carte S"
+    b"D dans un autre appareil pour as"
+    b"surer que les donn\xc3\xa9es soient ir"
+    b"r\xc3\xa9cup\xc3\xa9rablesINTROUVABLE dans l"
+    b"es %d premi\xc3\xa8res adressesAdresse"
+    b"s d'exportationDu stockageTOUCHE"
+    b"Z ou ENTRER pour capturerCharger"
+    b" depuis la cam\xc3\xa9raVia MotsMn\xc3\xa9mo"
+    b"nique\xc3\x80 proposEntropie de Shanno"
+    b"n\xe2\x80\x89:\xc3\x80 droiteMessage sign\xc3\xa9Entr"
+    b"ez %d mots BIP39.Capacit\xc3\xa9\xe2\x80\x89:De"
+    b"lai d'Inactivit\xc3\xa9%s octetsAnti-r"
+    b"ebond des boutonsGrille binaireT"
+    b"aper cl\xc3\xa9sur une \xc3\xa9tiquette lisi"
+    b"blePortefeuilleUnit\xc3\xa9D\xc3\xa9pense (%"
+    b"d)\xe2\x80\x89:Outil DatumEnregistrer sur"
+    b" la carte SDAdresse valide\xe2\x80\x89!Li"
+    b"gne\xe2\x80\x89:D\xc3\xa9finissez d'abord un co"
+    b"de de non compromisChiffrerCharg"
+    b"ement\xe2\x80\xa6Charger un descripteur d"
+    b"e portefeuille de confiance pour"
+    b" afficher les adresses\xe2\x80\x89?Signat"
+    b"ure non validePour assurer que l"
+    b"es donn\xc3\xa9es soient irr\xc3\xa9cup\xc3\xa9rab"
+    b"les, utilisez la fonctionnalit\xc3\xa9"
+    b" 'Effacer l'appareil'Cl\xc3\xa9 intern"
+    b"e TRStatiqueCl\xc3\xa9 uniqueSigner av"
+    b"ec le code QRDescripteur de Port"
+    b"efeuillePas de phrase secr\xc3\xa8teSa"
+    b"isissez un code de non compromis"
+    b" de plus de 6 caract\xc3\xa8resCode de"
+    b" non compromisCertains v\xc3\xa9rifica"
+    b"tions ne peuvent pas \xc3\xaatre effec"
+    b"tu\xc3\xa9s.BoutonsRestaurer les param"
+    b"\xc3\xa8tres d'usine et red\xc3\xa9marrer\xe2\x80\x89"
+    b"?Charger le portefeuilleUtilisez"
+    b" l'entropie de la cam\xc3\xa9ra pour c"
+    b"r\xc3\xa9er un nouveau mn\xc3\xa9moniqueSign"
+    b"ature du hachage brut. Proc\xc3\xa9dez"
+    b" uniquement si vous faites confi"
+    b"ance \xc3\xa0 la source.TC Flash Hash "
+    b"au d\xc3\xa9marrageDes caract\xc3\xa8res non"
+    b" ASCII ont \xc3\xa9t\xc3\xa9 d\xc3\xa9tect\xc3\xa9s dans"
+    b" votre phrase secr\xc3\xa8te. Krux ne "
+    b"peut garantir que d'autres porte"
+    b"feuilles obtiendront la m\xc3\xaame cl"
+    b"\xc3\xa9.Descripteur de sortie du port"
+    b"efeuille introuvable.Rotation de"
+    b" 180\xc2\xb0D\xc3\xa9cimalAttendez la captur"
+    b"eMettre \xc3\xa0 jour l'\xc3\xa9tiquette QR\xe2"
+    b"\x80\x89?Luminosit\xc3\xa9Mot de passe Base6"
+    b"4Indice de d\xc3\xa9viation des pixels"
+    b"\xe2\x80\x89:Proc\xc3\xa9der\xe2\x80\x89?Adresse invalid"
+    b"eDescripteur de sortie du portef"
+    b"euille charg\xc3\xa9\xe2\x80\x89!vers hexa.Mode"
+    b" de chiffrementTexteFortFaibleAv"
+    b"ertissement\xe2\x80\x89:Utilisez une surf"
+    b"ace de fond noire.Hexad\xc3\xa9cimalMo"
+    b"de anti-refletsRecevoirAjuster l"
+    b"a luminosit\xc3\xa9Changer portefeuill"
+    b"e?R\xc3\xa9essayer\xe2\x80\x89?Analyser les mot"
+    b"s 13 \xc3\xa0 24Carte SD non d\xc3\xa9tect\xc3\xa9"
+    b"e.12 motsRev\xc3\xa9rifierD\xc3\xa9chiffrer\xe2"
+    b"\x80\x89?Sauvegarde mn\xc3\xa9moniqueOutils "
+    b"FlashMise \xc3\xa0 jour compl\xc3\xa8te.depu"
+    b"is HEXA.EmplacementR\xc3\xa9s. - Forma"
+    b"tCharger Mn\xc3\xa9moniqueVidevers utf"
+    b"8Certains n\xc5\x93uds ne sont pas dur"
+    b"cis :Signer sur la carte SDId ex"
+    b"iste d\xc3\xa9j\xc3\xa0Utiliser l'it\xc3\xa9ration"
+    b" PBKDF2 par d\xc3\xa9faut.\xe2\x80\x89?inconnuR"
+    b"efl\xc3\xa9ter coordonn\xc3\xa9es XR\xc3\xa9seauD\xc3"
+    b"\xa9river l'entropie BIP85\xe2\x80\x89?\xc3\x89che"
+    b"c du stockage mn\xc3\xa9moniqueMotsLe "
+    b"mn\xc3\xa9monique chiffr\xc3\xa9 n'a pas \xc3\xa9t"
+    b"\xc3\xa9 stock\xc3\xa9\xc3\x89cran TactileLargeur "
+    b"du papierCompteCl\xc3\xa9%s car.Impres"
+    b"sion Test QRSupprimer d\xc3\xa9finitiv"
+    b"ement tous les mn\xc3\xa9moniques et p"
+    b"aram\xc3\xa8tres chiffr\xc3\xa9s stock\xc3\xa9s da"
+    b"ns le flash\xe2\x80\x89?Chargement de l'i"
+    b"mprimante\xe2\x80\xa6NombresRetour au vis"
+    b"ualiseur QRAppuyez sur PAGE pour"
+    b" annuler.V\xc3\xa9rifiez que l'adresse"
+    b" appartient \xc3\xa0 ce portefeuille\xe2\x80"
+    b"\x89?Capture annul\xc3\xa9eChemin de d\xc3\xa9r"
+    b"ivation\xc3\x89chec lors du chargement"
+    b"KEF chiffr\xc3\xa9Entr\xc3\xa9es (%d)\xe2\x80\x89:Mn\xc3"
+    b"\xa9monique BIP39Code de non compro"
+    b"mis non valideMoyen\xc3\x89craser\xe2\x80\x89?L"
+    b"a cl\xc3\xa9 n'a pas \xc3\xa9t\xc3\xa9 fournieAdre"
+    b"sseDistribution des jets\xe2\x80\x89:Affi"
+    b"chageStocker sur flashUtiliser l"
+    b"e mode par d\xc3\xa9faut\xe2\x80\x89?Nom de fic"
+    b"hierEn cas d'\xc3\xa9chec d'affichage,"
+    b" l'appareil red\xc3\xa9marrera automat"
+    b"iquement apr\xc3\xa8s 5 secondes utili"
+    b"sant les param\xc3\xa8tres pr\xc3\xa9c\xc3\xa9dent"
+    b"s.Charger\xe2\x80\x89?Utilis\xc3\xa9\xe2\x80\x89:Red\xc3\xa9ma"
+    b"rrerImprimer\xe2\x80\x89?(Exp\xc3\xa9rimental)X"
+    b"OR avecType de t\xc3\xaatePortefeuille"
+    b" diff\xc3\xa9rent:depuis base32Ajoutez"
+    b" ou modifiez la phrase secr\xc3\xa8te\xe2"
+    b"\x80\x89?V\xc3\xa9rifiez la carte SDImpressi"
+    b"on\xe2\x80\xa6RetourCode QR personnalis\xc3\xa9"
+    b"Faites glisser pour changer de m"
+    b"odeXOR mn\xc3\xa9monique actuel avec u"
+    b"n autre\xe2\x80\x89? (la phrase secr\xc3\xa8te "
+    b"et le descripteur seront supprim"
+    b"\xc3\xa9s)Enregistrer sur la carte SD\xe2"
+    b"\x80\x89?G\xc3\xa9n\xc3\xa9rer un mn\xc3\xa9moniqueTaill"
+    b"e de la pi\xc3\xa8ceVeuillez charger u"
+    b"n descripteur de sortie de porte"
+    b"feuilleCl\xc3\xa9 publique hexad\xc3\xa9cima"
+    b"le\xe2\x80\x89:Chiffr\xc3\xa9PersonnaliserProc\xc3"
+    b"\xa9der quand m\xc3\xaame\xe2\x80\x89?Impossible d"
+    b"e d\xc3\xa9terminer l'adresse de monna"
+    b"ie.Effacer les donn\xc3\xa9es de l'uti"
+    b"lisateurNouveau micrologiciel d\xc3"
+    b"\xa9tect\xc3\xa9.Delai d'Arr\xc3\xaatGauchePSBT"
+    b" sign\xc3\xa9echou\xc3\xa9Code de non compro"
+    b"mis d\xc3\xa9fini avec succ\xc3\xa8sglisserS"
+    b"ensibilit\xc3\xa9Entrez chaque mot de "
+    b"votre mn\xc3\xa9monique BIP39 sous la "
+    b"forme d'un nombre de 1 \xc3\xa0 2048.S"
+    b"upprimer %s\xe2\x80\x89?Num\xc3\xa9ros de motsI"
+    b"nad\xc3\xa9quation du cheminChargement"
+    b" des adresses de r\xc3\xa9ception\xe2\x80\xa6Tr"
+    b"aitement en cours\xe2\x80\xa6Auto-transfe"
+    b"rt\xe2\x80\x89:La monnaie\xe2\x80\x89:Remplissage "
+    b"du FlashTest de l'imprimante Kru"
+    b"x QRTermin\xc3\xa9\xe2\x80\x89?Explorer des fic"
+    b"hiers\xe2\x80\x89?V\xc3\xa9rification\xe2\x80\xa6Apparen"
+    b"ceFrais \xc3\xa9lev\xc3\xa9s\xe2\x80\x89!Ne pas \xc3\xa9tei"
+    b"ndre, cela peut prendre un certa"
+    b"in temps.Le pilote d'imprimante "
+    b"n'est pas d\xc3\xa9fini\xe2\x80\x89!Masquer les"
+    b" mn\xc3\xa9moniquesPartieFichier de si"
+    b"gnature manquantD\xc3\xa9bit en baudsC"
+    b"arte SDParam\xc3\xa8tres d'usineUtilis"
+    b"ateurValeur %s hors de port\xc3\xa9e: "
+    b"[%s, %s]Analyser \xc3\xa0 nouveau les "
+    b"mots 1 \xc3\xa0 12Empreinte digitale m"
+    b"anquante dans PSBTRecherche de c"
+    b"arte SD\xe2\x80\xa6Remplir le flash avec "
+    b"l'entropie de la cam\xc3\xa9ra\xe2\x80\x89?Enre"
+    b"gistr\xc3\xa9 sur la carte SD\xe2\x80\x89:Scann"
+    b"ez la phrase secr\xc3\xa8te BIP39Entre"
+    b"z chaque mot de votre mn\xc3\xa9moniqu"
+    b"e BIP39 sous la forme d'un nombr"
+    b"e en hexad\xc3\xa9cimal de 1 \xc3\xa0 800.No"
+    b"nvers base64Pas assez de jets\xe2\x80\x89"
+    b"!Longueur mn\xc3\xa9monique invalideCr"
+    b"\xc3\xa9er un QR CodePAGE pour changer"
+    b" de modeProfondeur par passagede"
+    b"puis base43Scannez l'adresseEntr"
+    b"opie suppl\xc3\xa9mentaire de la cam\xc3\xa9"
+    b"ra requise pour %sInverserTests "
+    b"de l'appareilRetour au menuLaiss"
+    b"ez vide si vous souhaitez que Kr"
+    b"ux choisisse un dernier mot vali"
+    b"dePar cam\xc3\xa9raTX FicheDescripteur"
+    b" de sortie du portefeuillePhrase"
+    b" secr\xc3\xa9teAuto-transfert ou monna"
+    b"ie (%d)\xe2\x80\x89:Longueur\xe2\x80\x89:Signer\xe2\x80\x89"
+    b"?"
+)
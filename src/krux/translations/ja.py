@@ -19,382 +19,429 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-# pylint: disable=C0301
-translation_array = [
-    "% の金額.",
-    "%d の%d マルチシグネチャ",
-    "%d へ %d",
-    "%sビット",
-    "%s バイト",
-    "%s 文字",
-    "%s 削除されました.",
-    "%s:読み込まれました!",
-    "(%sビット/px)",
-    "(実験的)",
-    "(閲覧専用)",
-    "12の単語",
-    "24の単語",
-    "概要",
-    "アカウント",
-    "アカウントインデックス",
-    "ウォレットのパスフレーズを追加または変更しますか?",
-    "%sにはカメラからの追加エントロピーが必要です",
-    "アドレス",
-    "カメラとバックプレートを正しく整列させてください.",
-    "アンチグレアモード",
-    "外観",
-    "よろしいですか?",
-    "BGRカラー",
-    "BIP39 Mnemonic",
-    "戻る",
-    "メニューへ戻る",
-    "ニーモニックのバックアップ",
-    "無効なサイン",
-    "Base64パスワード",
-    "Baudrate",
-    "バイナリグリッド",
-    "ボーダーパディング",
-    "明るさ",
-    "ボタン",
-    "ボタンのデバウンス",
-    "キャプチャがキャンセルされました",
-    "お釣り",
-    "テーマの変更と再起動しますか?",
-    "ウォレット変更?",
-    "お釣り:",
-    "変更はシャットダウンするまで持続します.",
-    "SDカードを確認する",
-    "このアドレスがこのウォレットに属しているか確認しますか?",
-    "%d のアドレスを確認しましたが、一致するものはありませんでした.",
-    "SDカードを確認しています…",
-    "改ざんチェックコードの確認",
-    "データムの変換",
-    "変更先住所を特定できませんでした.",
-    "QRコードを作成",
-    "テキストからQRコードを作成しますか?",
-    "作成されました:",
-    "現在の改ざんチェックコード",
-    "カスタムQRコード",
-    "カスタムテキスト",
-    "カスタマイズする",
-    "ウォレットをカスタマイズすると、新しいキーが生成され、記述子がアンロードされます.",
-    "カットの深さ",
-    "カット方法",
-    "データムツール",
-    "デシマル",
-    "デクリプト?",
-    "デフォルトの財布",
-    "このファイルを削除しますか?",
-    "パスごとの深さ",
-    "導出パス",
-    "BIP85エントロピーを導出しますか?",
-    "ディスクリプタアドレス",
-    "デバイステスト",
-    "ディスプレイ",
-    "完了するまで電源を切らないでください.",
-    "変換を完了する",
-    "完了?",
-    "ダブルニーモニック",
-    "ドライバー",
-    "空",
-    "有効化?",
-    "暗号化",
-    "暗号化されました",
-    "暗号化されたQRコード",
-    "暗号化されたニーモニックがIDとともに保存されました:",
-    "暗号化されたニーモニックが保存されませんでした",
-    "暗号化",
-    "暗号化モード",
-    "%d のBIP39ワードを入力してください.",
-    "6文字以上の改ざんチェックコードを入力してください",
-    "あなたのBIP39ニーモニックの各単語を1から2048の番号で入力してください.",
-    "あなたのBIP39ニーモニックの各単語を1から800の16進数で入力してください.",
-    "あなたのBIP39ニーモニックの各単語を1から4000の8進数で入力してください.",
-    "あなたのBIP39ニーモニックの各単語を入力してください.",
-    "ユーザーのデータを消去する",
-    "ユーザーのデータを消去しています…",
-    "エラー:",
-    "エスク",
-    "アーカイブ探索?",
-    "住所をエクスポート",
-    "%sをSDカードにエクスポートしています…",
-    "拡張公開キー",
-    "初期設定",
-    "カメラエントロピーの収集に失敗しました",
-    '"CRL変換に失敗"',
-    "復号化に失敗しました",
-    "ロードに失敗しました",
-    "mnemonicの保存に失敗しました",
-    "手数料:",
-    "フィードレート",
-    "ファイル名",
-    "ファイル名 %s が SD カードに存在します.",
-    "カメラからのエントロピーでフラッシュを埋めますか?",
-    "フラッシュを充填中",
-    "PSBTでデジタル指紋が未設定",
-    "フラッシュマップ",
-    "Flashツール",
-    "カメラエントロピーで満たされたフラッシュ",
-    "フルートディアメーター",
-    "フリー:",
-    "ストレージから",
-    "データが復元できないように、他のデバイスでSDカードを完全に消去してください",
-    "Mnemonicを生成する",
-    "行く",
-    "良いentropy",
-    "ハードウェア",
-    "ヘッドタイプ",
-    "Hex公開キー:",
-    "エクサデシマル",
-    "Mnemonicsを隠す",
-    "高い手数料！",
-    "ID",
-    "IDはすでに存在します",
-    "この変更後にデバイスのディスプレイが動作しない場合、5秒後に以前の設定で自動的に再起動します.",
-    "インデックス",
-    "インプット(%d):",
-    "不十分なエントロピー!",
-    "無効な改ざんチェックコード",
-    "無効なアドレス",
-    "無効な導出パス",
-    "無効なニーモニックの長さ",
-    "無効なウォレット:",
-    "反転する",
-    "反転した色",
-    "暗号化されたKEF",
-    "キー",
-    "キーが提供されていません",
-    "KruxプリンターテストQR",
-    "LCDタイプ",
-    "言語 ",
-    "有効な最終単語をKruxに選んでもらいたい場合は、空白のままにしてください",
-    "左",
-    "長さ:",
-    "ライン遅延",
-    "ライン:",
-    "アドレスリスト",
-    "ニーモニックをロード",
-    "ウォレットをロード",
-    "信頼できるウォレット記述子をロードしてアドレスを表示しますか?",
-    "SDカードからロード ",
-    "SDカードからロードしますか?",
-    "カメラからロード",
-    "ロードしますか?",
-    "カメラを読み込んでいます…",
-    "変更住所を読み込んでいます…",
-    "プリンタを読み込んでいます…",
-    "受信アドレスを読み込んでいます…",
-    "読込中…",
-    "ロケール",
-    "場所",
-    "中間",
-    "メッセージ",
-    "メッセージ:",
-    "ミニスクリプト",
-    "ミラーX座標",
-    "署名ファイルが欠落しています",
-    "Mnemonic",
-    "ニーモニックXOR",
-    "Mnemonicとパスフレーズは保持されます.",
-    "修正されました:",
-    "ネットワーク",
-    "新しい Mnemonic",
-    "新しいファームウェアが検出されました.",
-    "いいえ",
-    "パスフレーズなし",
-    "パスフレーズに非ASCII文字が検出されました.Kruxは、他のウォレットが同じキーを取得することを保証することはできません.",
-    "ロールが足りません!",
-    "数字",
-    "Octal",
-    "他のフォーマット",
-    "上書きしますか?",
-    "明るさを切り替えるPAGE",
-    "PBKDF 2 iter.",
-    "検出できるように、穴あけされた点を黒く塗ってください.",
-    "用紙幅 ",
-    "パーツ",
-    "NのパートM",
-    "パーツサイズ",
-    "パスワード",
-    "パスワードの長さ",
-    "パスの不一致",
-    "パターンが検出されました!",
-    "フラッシュからすべての保存された暗号化mnemonicsと設定を永久に削除しますか?",
-    "永続させる",
-    "ピクセル偏差指数:",
-    "プレーンテキストQR",
-    "ウォレットの出力記述子をロードしてください",
-    "沈下率",
-    "証券の種類",
-    "低品質なエントロピー!",
-    "出力",
-    "PAGEを押してキャンセルします.",
-    "PAGEを押してモードを切り替えます",
-    "テストQRを印刷",
-    "Tinyseedを印刷しますか?",
-    "QRを印刷",
-    "QRを印刷しますか?",
-    "印刷?",
-    "プリンター ",
-    "プリンタードライバーが設定されていません!",
-    "印刷しています…",
-    "そのまま進みますか?",
-    "進みますか?",
-    "処理中…",
-    "証明可能に使用不能",
-    "QRコード",
-    "QRラベル",
-    "数量",
-    "RXピン",
-    "再起動",
-    "受け取る",
-    "地域:",
-    "%sを削除しますか?",
-    "ニーモニックを削除",
-    "SDカードからファームウェアファイルを削除しますか?",
-    "Res. - フォーマット",
-    "初期化を復元して再起動しますか?",
-    "結果",
-    "QRビューワーに戻る",
-    "もう一度確認する",
-    "スキャンしたデータを確認し、必要に応じて編集します",
-    "右",
-    "mnemonicを生成するには、少なくとも%d回サイコロを振ってください.",
-    "ロールの分布:",
-    "ロール:",
-    "180°回転",
-    "SDカード",
-    "SDカードが検出されません.",
-    "ロールのSHA256:",
-    "画像のSHA256:",
-    "QR画像をSDカードに保存する",
-    "SDカードに保存する",
-    "SDカードに保存しますか?",
-    "SDカードに保存しました:",
-    "スケール",
-    "アドレススキャン",
-    "BIP39パスフレーズをスキャンする",
-    "キーのQRコードをスキャンする",
-    "単語1-12を再度スキャン中",
-    "単語13-24をスキャン中",
-    "スクリーンセーバーの時間",
-    "スクリプトタイプ",
-    "セキュリティa",
-    "自己転送または変更（%d）:",
-    "自己転送:",
-    "最初に改ざんチェックコードを設定する",
-    "設定",
-    "設定はフラッシュメモリに内部保存されています.",
-    "設定はSDカードに保存されています.",
-    "シャノンのエントロピー:",
-    "データムを表示",
-    "シャットダウン",
-    "シャットダウン時間",
-    "シャットダウンしています…",
-    "署名",
-    "QRコードにサインする",
-    "SDカードにサインする",
-    "サインしますか?",
-    "サイン:",
-    "サイン付きメッセージ",
-    "サインされたPSBT",
-    "生のハッシュに署名します.ソースを信頼している場合にのみ続行します.",
-    "署名…",
-    "シングルサイン",
-    "サイズ:",
-    "一部のチェックを実行できません.",
-    "一部のノードは硬化されていません:",
-    "支出（%d）:",
-    "支出:",
-    "標準モード",
-    "静止画",
-    "オタクのための統計",
-    "フラッシュに保存する",
-    "SDカードに保存する",
-    "強度",
-    "強力",
-    "スワイプしてモードを変更する",
-    "TCフラッシュハッシュ",
-    "起動時のTCフラッシュハッシュ",
-    "タッチまたはENTERでキャプチャする",
-    "タップするかEnterキーを押してインストールします.",
-    "TR内部キー",
-    "TXピン",
-    "改ざんチェックコード",
-    "改ざんチェックコードが正常に設定されました",
-    "改ざんチェックコードが一致しません",
-    "テストスイート",
-    "テストスイートの結果",
-    "テスト:",
-    "テキスト",
-    "テーマ",
-    "サーマル",
-    "データが復元不可能であることを確実にするには、デバイス消去機能を使用してください",
-    "明るさを切り替える",
-    "ツール",
-    "タッチスレッショルド",
-    "タッチスクリーン",
-    "もっと試してみますか?",
-    "BIP39パスフレーズを入力してください",
-    "キーを入力する",
-    "取り消し",
-    "ユニット",
-    "KEF IDを更新しますか?",
-    "QRラベルを更新しますか?",
-    "アップグレードが完了しました.",
-    "黒い背景面を使用してください.",
-    "カメラのエントロピーを使用して新しいmnemonicを作成してください",
-    "現在価値",
-    "1行目をデフォルトにする",
-    "デフォルトのPBKDF 2イテールを使用します.",
-    "指紋をIDとして使用しますか?",
-    "使用済み:",
-    "ユーザーのデータ",
-    "値%sが範囲外です: [ %s, %s]",
-    "認証中…",
-    "バージョン",
-    "カメラ経由",
-    "D20経由",
-    "D6経由",
-    "手動入力経由",
-    "言葉経由",
-    "表示ラベル",
-    "キャプチャを待ってください",
-    "ワレット",
-    "ウォレットディスクリプター",
-    "ウォレット不一致:",
-    "ウォレット出力ディスクリプター",
-    "ウォレット出力ディスクリプターがロードされました！",
-    "ウォレット出力ディスクリプターが見つかりません.",
-    "警告:",
-    "脆弱",
-    "単語 %d",
-    "単語番号",
-    "単語",
-    "XOR結果",
-    "XOR With",
-    "XOR現在のニーモニックと別のニーモニック? (パスフレーズと記述子は破棄されます)",
-    "はい",
-    "ズームモード",
-    "バイナリ:",
-    "失敗",
-    "16進数から",
-    "base 32から",
-    "base 43から",
-    "base 64から",
-    "16進数から",
-    "utf 8から",
-    "有効なアドレスです！",
-    "シフトケース",
-    "成功率:",
-    "スワイプ",
-    "テキスト:",
-    "16進数に",
-    "base 32に",
-    "base 43に",
-    "base 64に",
-    "16進数に",
-    "utf 8へ",
-    "不明",
-    "最初の%dアドレスに見つかりませんでした",
-]
+# pylint: disable=C0103,C0301
+catalog = (
+    b"s\x01\xb6\x11\x16\x00l\xfa\xa6\x02[\xa8b\x04\xb1\xd5\xb0\x04\xed\x8e:\x06\xe6\x81m\x07\xb6\x8b\xef\x07B{"
+    b'd\x08\xb7\x06\xff\x08\nf\x00\n(\x1f\x16\x0c\xbcI\xdb\r\xbfN\x02\x0epi"\x0e\xff#)\x0e\x88\x1f'
+    b"\xe1\x0ef\x97\xa1\x0f\x8b\xea5\x11\x8arH\x11%\xc4\xc6\x14k\xd8\xe0\x14\xefy\xca\x16j\xc7\xd9\x16GG"
+    b".\x17\x05\xd5R\x17\xeal\xf3\x17}\xca\xe8\x18\x81\xd3*\x19\xbba\xc5\x19\xe0\x94\xdd\x19\x93\xc23\x1ck\xf8"
+    b'<\x1c\xbd\xc3\xd1\x1dk\x96O\x1fhW\xae\x1f\xeat\x9b!\xf2\xb1\x1d"\x00\xb9/#Lj\xa3#\xf4\xb7'
+    b"\xec#k\xd7\xb4$\x13\t\xea$\xf1\xf7(&\xe9~\xaf&`Rp(\xfa\x1c*)\xa8\xdaL)|\xb9"
+    b'\xb7)j\x91\\*\x93gx*\xeb\xf5\xea*s\xf1;+"\xd6r+\xf4\x85t-\x80\n\x87-\xe3\x13'
+    b"\xad-J\x9f\xea-\x9d.\x93.\xb80\xc4.uU\x8b/\x7f\x0b\xb5/\x8e\x83\xcf/g\xd4\xb80n\xea"
+    b"\xf30\x12Ec1\x99\x1bi1\xef|73\x14\x15\xe83\xe5\x91o4\x86|\xea4\x1f\xaf\xfd4\xc9\xa3"
+    b"\xaa5\xbd\xca\xd85Z'S6\x02\xcb^6\xd5\x91\xb36\x16\x19\x087\xfc?[7\xd84\xf69\x89\x0f"
+    b"Z:\x81\xa9[;|\x91\xec;\x97\xb7\xed<\x95e7>\x1e\xd1\xfd>\xc0>L?\xfd\x91\x1f@x}"
+    b"=@\x87j\x8dA\x84>\x96A\x05H\xb2A\xed\xf2\xc7Aq@\xf1B\xcc\x14BC\xdf~.D\xba\x16"
+    b"\x8bEhY\x0cF\xae\xc3,F\x11r?F! XF\x90\xb9\xa5F\x1a\xcd\xccF\x1c\n7G\xee\x08"
+    b"nG\x16\xfb\xfbG\x8fbzI30\xc0I\xf9\xd4'Jc\xed\xc8J?\xad&K`D\xd1Kg`"
+    b"\x16MIs\xaaM\x8f\xe6\x15Na\xdcLP\x9b\x94\xe9Q\x12@\x88RJ\xde\xd6S8\xa4\xc0U?\x9c"
+    b"\x05V\x0c\xc8\xb4VB\x9dPW\x9c\x07\x01Xd\xe9\x83X\x87L\x97Y\xee\x8c\xb9Y\xe8\xcc&Z\xa0["
+    b"\xcf\\\t\x84]^\x0c\x01k^\x08i2_\x1c;\xa3b[\xb9\xdab*\xfe\x13c\xb9\x993cd\n"
+    b'\xfdcY"\xa2d\x8d?\xf2dy\x96\x1de\x9d\x9e\x8de2\x8e\x00f\xc5\x1b\x18f`t\x85fY\xcf'
+    b"tg\xcd8\xd1g\xed\xd1\njM\x865j\xa4.Kj\x13]\xd1j\x0bT\xa6k\xe8{}l\x94\xbc"
+    b"\xd4l0\x11\xe0m?\xfb*n]\x8eRn\x08{Xo\xb9m\x87o\xde\xd6\xcfom\x14@p_\xea"
+    b"\xa1p\xc3\x99\xd8p\xa8\x93)q\x8dirs0\x13\x16t\xe7\r5t\xe8\xda\xcat\x10Z\x0bu\xd9\xd4"
+    b"\x84v9\xab\xf4wYQ_xZ\x9b\xf9x\xe3\t\x00y\x08\xc8#yw\xde|yq\xdf\xfcy4\xd9"
+    b"\xe0z\xac\x11e{)\x97\xc4{m\xa3\x89|\x9f\x8a\x9b|\xdeG\xa7}?\x0e\xf2\x80\x00\x1ei\x81\xa6Z"
+    b"\xc0\x81u\xc6W\x82\x0c\x11r\x85\xa2\xcb6\x86j\x8f~\x86\x80\xb1\x83\x86\xffY\x98\x86\xbe\xf6W\x87\x13-"
+    b"l\x87\xc3\x10\xfb\x87\xbc\x93\xb9\x88\xdf\xde\xe9\x88\xf2\xaf\x9f\x8a\xb6\xd1\x9f\x8a)\xbcE\x8b\x7f\x00\xc2\x8b*\xbc"
+    b"\xe1\x8ca\x90\x04\x8d\x89Q;\x8d\xdd\x8e2\x8f\xbf\xc3D\x90\x95\x8e}\x91\x0f$\x83\x93D\xa7\xff\x94\xb1\x8b"
+    b"#\x95\x0f\x8a@\x95\x1flE\x95n7#\x963\xd5+\x96Rv\x13\x99J\xc7\xaa\x99\xdb\xd0\xd0\x99&\x1f"
+    b"\x1d\x9a\x03 5\x9a\xa2]\xb1\x9a\xdf.\xbc\x9aO?\x11\x9b\xf9\x08\xb9\x9b-\xcb\x9f\x9d\xfa\x03\x04\x9fp}"
+    b"?\x9f\xd0\x8bp\x9fw+i\xa0D\xde\x87\xa0\xad\x08\xce\xa0y\xe5\xf1\xa0\x9a\xfe\x03\xa1\xbfX\xe0\xa2.\xc5"
+    b"\x1b\xa3\x12\xe1\x1b\xa3V\xd4J\xa3\x0f<\xab\xa3\xee\xa8\xfa\xa3\xaa\x0cJ\xa4\xf0\x84\x8a\xa5\xf8\xe2\x19\xa6\xe4\xa8"
+    b"T\xa6V3y\xa6\x9d\xeb\xe8\xa7\xc3\xc2\xec\xa7\x18\xde \xa8\xc0\x12\x06\xa9P]\x94\xa9\x1ei\xa7\xaaX\xcb"
+    b"\xa8\xabNw\xa9\xabO\xd9\xfb\xac\xc7\xa7&\xadY\xb5'\xaf \xbe9\xaf\xc0ZG\xaf\x0e\xa2\x9a\xaf\x881"
+    b"\xbc\xb0\x12s\xf0\xb0d\xa3\x8b\xb1\x8e7\x16\xb28o\x8b\xb2I\xed\xdd\xb2O4\x88\xb3\xdd\xe6\x05\xb5\xfd\xe5"
+    b"2\xb5\xfb\x95\x9d\xb5e\xf3#\xb8\xae\x87>\xb8]\x1f\x92\xb9\x07\x86\xf0\xb9\x163\r\xbbS;\xc3\xbeE\xb4"
+    b"\xa1\xbfh\xae\xd0\xbf\xb4\xbb?\xc1\xc3\xd2\xa4\xc1\x81@\xdf\xc1\xd5\xa5q\xc2;b\x95\xc2\x1dV\xf3\xc2\xa5V"
+    b"\xf8\xc2?Kl\xc3\xcc\xd3\xe8\xc4\xe8\x955\xc53\x8b}\xc5\xa4]U\xc6\x89\x87\x86\xc6\x0e\xc6\xda\xc6\xba\x81"
+    b'\xff\xc6\x97\xd5\x0c\xc7dW\x97\xc7B\xb6\xb7\xc9T\x8e<\xcb\x14\xb8\x97\xcc"^\x06\xcd\x92%)\xcd\x7f\x8a'
+    b"[\xcd\tn\xfc\xcd\x16ig\xd1\xe7\xa7z\xd1\xad\xf3\xd5\xd1\x83\x1d\x82\xd2\xed\xad\x89\xd3d\x00)\xd4v\x16"
+    b"L\xd4Z8a\xd4\xd0\xc2\x89\xd5\xbf\n\xb5\xd5k\x1b+\xd6\x92\xba\x11\xd8\\\x9d\x19\xd8O4\xa9\xd8\xcb\xf9"
+    b"\xeb\xd9VHU\xda\xbc]\xde\xda\x03Y\xf1\xda\x89^O\xdb\xa9\xe9Y\xdb0\x00\xa0\xdbn*\xa1\xdc\x99w"
+    b"@\xdeRI\xe6\xdeR\xdc\x10\xdf\xe9G<\xdf\xc23~\xdfg\xe9\x80\xdf\xdc\xdf\xb4\xdf\x95x\x9d\xe0]\xcb"
+    b"\xc3\xe2\x95w\xa3\xe44\xba\xb1\xe4WV\xca\xe4;\x9f@\xe5@\x81\xee\xe5\xb7\x00\x11\xe7I\xd0/\xe8\x87\xc4"
+    b"\xab\xe8\x95\x8f\xae\xe8\xf8\xdf=\xe9\x13!%\xea\xe5\x0c\t\xed\xe0\xdfT\xed/xy\xed/9\x9a\xee\x1c\x8a"
+    b"\xcb\xeej\xe8\xcf\xee\xb5a\x1f\xefb\xabC\xef\x0e\xc4\xaf\xf0\x95)\xb0\xf0\x974-\xf1\xbd\x0c.\xf2)\x9e"
+    b"`\xf31\xd9\xee\xf3\xfa\x95\xfc\xf3\xdc\x97\x06\xf4\tdW\xf4\x8e\xb9\x87\xf4E\x1e\xd1\xf4\xe7`k\xf5\x06\xe8"
+    b"\xa1\xf5\xf1k\xbe\xf5\xd1Wa\xf7\xa6Hp\xf7\xe8\xe3'\xf9\xafz\xce\xf9wr\x05\xfcD0I\xfc\xb3`"
+    b"P\xfd^\xee\xa0\xfd\x9d\xa0\xdd\xfe>L?\xff\x00\x00\x00\x00c\x00\x00\x00\x9c\x00\x00\x00\xae\x00\x00\x00\xbb\x00"
+    b"\x00\x00\xd0\x00\x00\x00\xe2\x00\x00\x00\xf4\x00\x00\x00\x03\x01\x00\x00\x0e\x01\x00\x00A\x01\x00\x00L\x01\x00\x00X\x01"
+    b"\x00\x00m\x01\x00\x00\x88\x01\x00\x00\xa1\x01\x00\x00\xb3\x01\x00\x00\xbd\x01\x00\x00\xca\x01\x00\x00\xe2\x01\x00\x00\xe8\x01"
+    b"\x00\x00\xf1\x01\x00\x00\x00\x02\x00\x00\x1e\x02\x00\x00X\x02\x00\x00p\x02\x00\x00\xa2\x02\x00\x00\xad\x02\x00\x00\xd4\x02"
+    b"\x00\x00\xde\x02\x00\x00\xf6\x02\x00\x00\xfc\x02\x00\x00\x0b\x03\x00\x000\x03\x00\x008\x03\x00\x00\x83\x03\x00\x00\xc6\x03"
+    b"\x00\x00\xda\x03\x00\x00\xec\x03\x00\x00\xfb\x03\x00\x00\x01\x04\x00\x00\x0b\x04\x00\x00\x1d\x04\x00\x00,\x04\x00\x00K\x04"
+    b"\x00\x00a\x04\x00\x00|\x04\x00\x00\xb3\x04\x00\x00\xd8\x04\x00\x00\xe0\x04\x00\x00\x10\x05\x00\x00*\x05\x00\x003\x05"
+    b"\x00\x00\xac\x05\x00\x00\xbc\x05\x00\x00\xc8\x05\x00\x00\xcf\x05\x00\x00(\x06\x00\x00O\x06\x00\x00X\x06\x00\x00a\x06"
+    b"\x00\x00\xa6\x06\x00\x00\xac\x06\x00\x00\xbc\x06\x00\x00\xca\x06\x00\x00\xe2\x06\x00\x00\xfa\x06\x00\x000\x07\x00\x00E\x07"
+    b"\x00\x00l\x07\x00\x00\x8b\x07\x00\x00\x95\x07\x00\x00\xde\x07\x00\x00\xe7\x07\x00\x00\xf3\x07\x00\x00\x11\x08\x00\x00#\x08"
+    b"\x00\x00L\x08\x00\x00g\x08\x00\x00v\x08\x00\x00\x95\x08\x00\x00\xe4\x08\x00\x00\xef\x08\x00\x00\x02\t\x00\x00#\t"
+    b"\x00\x009\t\x00\x00?\t\x00\x00N\t\x00\x00X\t\x00\x00f\t\x00\x00o\t\x00\x00\x81\t\x00\x00\xa8\t"
+    b"\x00\x00\xb8\t\x00\x00\xc4\t\x00\x00\xeb\t\x00\x00\xfe\t\x00\x00\t\n\x00\x00\x15\n\x00\x00.\n\x00\x00:\n"
+    b"\x00\x00[\n\x00\x00\xb6\n\x00\x00\xd4\n\x00\x00\xe1\n\x00\x00\xea\n\x00\x00\x05\x0b\x00\x00\x1b\x0b\x00\x008\x0b"
+    b"\x00\x00A\x0b\x00\x00H\x0b\x00\x00`\x0b\x00\x00n\x0b\x00\x00t\x0b\x00\x00\x7f\x0b\x00\x00\xa6\x0b\x00\x00\xc2\x0b"
+    b"\x00\x00\xfe\x0b\x00\x00\x1f\x0c\x00\x00G\x0c\x00\x00z\x0c\x00\x00\x83\x0c\x00\x00\x98\x0c\x00\x00\xb3\x0c\x00\x00\xc0\x0c"
+    b"\x00\x00\xc9\x0c\x00\x00\xd2\x0c\x00\x00\xdc\x0c\x00\x00$\r\x00\x00O\r\x00\x00d\r\x00\x00n\r\x00\x00z\r"
+    b"\x00\x00\x81\r\x00\x00\xcc\r\x00\x00\xe1\r\x00\x00\xeb\r\x00\x00\xf8\r\x00\x00\x13\x0e\x00\x00/\x0e\x00\x00I\x0e"
+    b"\x00\x00[\x0e\x00\x00|\x0e\x00\x00\x82\x0e\x00\x00\x8c\x0e\x00\x00\xa4\x0e\x00\x00\xb9\x0e\x00\x00\xec\x0e\x00\x00\xf2\x0e"
+    b"\x00\x00\x07\x0f\x00\x001\x0f\x00\x00d\x0f\x00\x00y\x0f\x00\x00\x8e\x0f\x00\x00\x99\x0f\x00\x00\xe4\x0f\x00\x00\xf0\x0f"
+    b"\x00\x00^\x10\x00\x00\x96\x10\x00\x00\xb1\x10\x00\x00\xc0\x10\x00\x00\xd5\x10\x00\x00\x04\x11\x00\x00\x1c\x11\x00\x00(\x11"
+    b"\x00\x00.\x11\x00\x00P\x11\x00\x00S\x11\x00\x00q\x11\x00\x00\xa1\x11\x00\x00\xab\x11\x00\x00\xcf\x11\x00\x00\xde\x11"
+    b"\x00\x00\xea\x11\x00\x00\x05\x12\x00\x00\x1d\x12\x00\x002\x12\x00\x00A\x12\x00\x00M\x12\x00\x00Y\x12\x00\x00h\x12"
+    b"\x00\x00}\x12\x00\x00\x97\x12\x00\x00\xb5\x12\x00\x00\xbf\x12\x00\x00\xf5\x12\x00\x00\xfe\x12\x00\x00\n\x13\x00\x00e\x13"
+    b"\x00\x00w\x13\x00\x00\xef\x13\x00\x00\xfd\x13\x00\x00\x06\x14\x00\x00\x1b\x14\x00\x008\x14\x00\x00_\x14\x00\x00w\x14"
+    b"\x00\x00\xc0\x14\x00\x00\xde\x14\x00\x00\x0c\x15\x00\x00\x15\x15\x00\x00C\x15\x00\x00^\x15\x00\x00\xb7\x15\x00\x00\x19\x16"
+    b"\x00\x00B\x16\x00\x00\xe9\x16\x00\x00/\x17\x00\x00:\x17\x00\x00F\x17\x00\x00m\x17\x00\x00\x8e\x17\x00\x00\x97\x17"
+    b"\x00\x00\xac\x17\x00\x00\xc5\x17\x00\x00\xd5\x17\x00\x00\xea\x17\x00\x005\x18\x00\x00@\x18\x00\x00]\x18\x00\x00o\x18"
+    b"\x00\x00{\x18\x00\x00\x81\x18\x00\x00\x87\x18\x00\x00\x8e\x18\x00\x00\xb9\x18\x00\x00\xce\x18\x00\x00\xe9\x18\x00\x00\xf5\x18"
+    b"\x00\x00\x10\x19\x00\x00&\x19\x00\x00E\x19\x00\x00b\x19\x00\x00\x86\x19\x00\x00\x91\x19\x00\x00\xa9\x19\x00\x00\xb9\x19"
+    b"\x00\x00\xe0\x19\x00\x00\xee\x19\x00\x00\x19\x1a\x00\x00'\x1a\x00\x007\x1a\x00\x00=\x1a\x00\x00V\x1a\x00\x00t\x1a"
+    b'\x00\x00w\x1a\x00\x00\x7f\x1a\x00\x00\xb0\x1a\x00\x00\xcd\x1a\x00\x00\xea\x1a\x00\x00"\x1b\x00\x00(\x1b\x00\x008\x1b'
+    b"\x00\x00J\x1b\x00\x00w\x1b\x00\x00\x9d\x1b\x00\x00\xa3\x1b\x00\x00\xe8\x1b\x00\x00\x00\x1c\x00\x00\n\x1c\x00\x00\x19\x1c"
+    b"\x00\x00\x1f\x1c\x00\x00(\x1c\x00\x00<\x1c\x00\x00\xa6\x1c\x00\x00\xd0\x1c\x00\x00\xd6\x1c\x00\x00\xf0\x1c\x00\x00\x19\x1d"
+    b"\x00\x00k\x1d\x00\x00\x9b\x1d\x00\x00\xa7\x1d\x00\x00\xc5\x1d\x00\x00\xda\x1d\x00\x00\xee\x1d\x00\x00\x15\x1e\x00\x00\x1b\x1e"
+    b"\x00\x001\x1e\x00\x00U\x1e\x00\x00a\x1e\x00\x00t\x1e\x00\x00\x86\x1e\x00\x00\xa4\x1e\x00\x00\xc6\x1e\x00\x00\xd5\x1e"
+    b"\x00\x00^\x1f\x00\x00t\x1f\x00\x00\x81\x1f\x00\x00\x8a\x1f\x00\x00\x91\x1f\x00\x00\x9c\x1f\x00\x00\xae\x1f\x00\x00\xc7\x1f"
+    b"\x00\x00\xd4\x1f\x00\x00\x1d \x00\x007 \x00\x00O \x00\x00U \x00\x00l \x00\x00\x96 \x00\x00\x06!"
+    b"\x00\x00'!\x00\x00>!\x00\x00P!\x00\x00\x8f!\x00\x00\x9f!\x00\x00\xb7!\x00\x00\xcf!\x00\x00\xeb!"
+    b'\x00\x00\x1c"\x00\x00C"\x00\x00z"\x00\x00\x95"\x00\x00\x98"\x00\x00\xae"\x00\x00\xb4"\x00\x00\xf3"'
+    b"\x00\x00\xff\"\x00\x00\x1d#\x00\x00'#\x00\x00\x89#\x00\x00\xa1#\x00\x00\xad#\x00\x00\xbf#\x00\x00\xef#"
+    b"\x00\x00\xfb#\x00\x00\x08$\x00\x00\x12$\x00\x00-$\x00\x00K$\x00\x00R$\x00\x00h$\x00\x00t$"
+    b"\x00\x00z$\x00\x00\x8c$\x00\x00\xc3$\x00\x00\x00%\x00\x00\x12%\x00\x00\x1b%\x00\x00E%\x00\x00P%"
+    b"\x00\x00\\%\x00\x00t%\x00\x00\x96%\x00\x00\xb8%\x00\x00\xdd%\x00\x00\x03&\x00\x00L&\x00\x00m&"
+    b"\x00\x00\x99&\x00\x00\xfc&\x00\x00\x05'\x00\x00\x0f'\x00\x00+'\x00\x00O'\x00\x00c'\x00\x00\x91'"
+    b"\x00\x00\xa6'\x00\x00\xb3'\x00\x00\xcb'\x00\x00\x0c(\x00\x00\x18(\x00\x00-(\x00\x00B(\x00\x00\xa9("
+    b"\x00\x00\xb8(\x00\x00\xc0(\x00\x00\xed(\x00\x00\xfc(\x00\x00 )\x00\x00')\x00\x00=)\x00\x00\xe3\x81"
+    b"\x82\xe3\x81\xaa\xe3\x81\x9f\xe3\x81\xaeBIP39\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82"
+    b"\xaf\xe3\x81\xae\xe5\x90\x84\xe5\x8d\x98\xe8\xaa\x9e\xe3\x82\x921\xe3\x81\x8b\xe3\x82\x894000\xe3\x81\xae8\xe9"
+    b"\x80\xb2\xe6\x95\xb0\xe3\x81\xa7\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84"
+    b".\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc\xe3\x81\xae\xe5"
+    b"\x8f\x8e\xe9\x9b\x86\xe3\x81\xab\xe5\xa4\xb1\xe6\x95\x97\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f\xe6\x96\xb0\xe3\x81\x97"
+    b"\xe3\x81\x84 MnemonicPBKDF 2 iter.\xe3\x83\x95\xe3\x82\xa3\xe3"
+    b"\x83\xbc\xe3\x83\x89\xe3\x83\xac\xe3\x83\xbc\xe3\x83\x88\xe3\x82\xab\xe3\x83\x83\xe3\x83\x88\xe3\x81\xae\xe6\xb7\xb1\xe3\x81\x95"
+    b"\xe3\x83\x8f\xe3\x83\xbc\xe3\x83\x89\xe3\x82\xa6\xe3\x82\xa7\xe3\x82\xa2\xe6\xb0\xb8\xe7\xb6\x9a\xe3\x81\x95\xe3\x81\x9b\xe3\x82"
+    b"\x8bQR\xe3\x82\x92\xe5\x8d\xb0\xe5\x88\xb7\xe3\x83\x86\xe3\x82\xad\xe3\x82\xb9\xe3\x83\x88\xe3\x81\x8b\xe3\x82\x89QR"
+    b"\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe4\xbd\x9c\xe6\x88\x90\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?1"
+    b"6\xe9\x80\xb2\xe6\x95\xb0\xe3\x81\xab% \xe3\x81\xae\xe9\x87\x91\xe9\xa1\x8d.\xe3\x83\x9f\xe3\x83\x8b\xe3\x82\xb9\xe3"
+    b"\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x83\x88SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x8b\xe3\x82\x89\xe3\x83\xad\xe3"
+    b"\x83\xbc\xe3\x83\x89 \xe7\x84\xa1\xe5\x8a\xb9\xe3\x81\xaa\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88:\xe3"
+    b"\x83\x99\xe3\x83\xb3\xe3\x83\x81\xe3\x83\x9e\xe3\x83\xbc\xe3\x82\xaf\xe6\x89\x8b\xe6\x95\xb0\xe6\x96\x99:\xe3\x83\x86\xe3\x82"
+    b"\xad\xe3\x82\xb9\xe3\x83\x88:\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x83\x88\xe3\x82\xbf\xe3\x82\xa4\xe3\x83\x97"
+    b"\xe7\xb5\x90\xe6\x9e\x9c\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96\xe3\x83\x89\xe3\x83\xa9\xe3\x82\xa4\xe3\x83\x90\xe3\x83\xbc\xe5\xbe"
+    b"\xa9\xe5\x8f\xb7\xe5\x8c\x96\xe3\x81\xab\xe5\xa4\xb1\xe6\x95\x97\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f\xe5\xa4\x89\xe6"
+    b"\x9b\xb4\xe3\x81\xaf\xe3\x82\xb7\xe3\x83\xa3\xe3\x83\x83\xe3\x83\x88\xe3\x83\x80\xe3\x82\xa6\xe3\x83\xb3\xe3\x81\x99\xe3\x82\x8b"
+    b"\xe3\x81\xbe\xe3\x81\xa7\xe6\x8c\x81\xe7\xb6\x9a\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99.\xe4\xbb\x96\xe3\x81\xae\xe3\x83\x95\xe3"
+    b"\x82\xa9\xe3\x83\xbc\xe3\x83\x9e\xe3\x83\x83\xe3\x83\x88BIP39\xe3\x83\x91\xe3\x82\xb9\xe3\x83\x95\xe3\x83\xac\xe3"
+    b"\x83\xbc\xe3\x82\xba\xe3\x82\x92\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84"
+    b"%s\xe3\x83\x93\xe3\x83\x83\xe3\x83\x88\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf"
+    b"\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xae\xe7\xa2\xba\xe8\xaa\x8d\xe3\x83\xad\xe3\x83\xbc\xe3\x83\xab:\xe3\x83\x91\xe3"
+    b"\x82\xb9\xe3\x83\xaf\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xae\xe9\x95\xb7\xe3\x81\x95\xe8\xa8\xad\xe5\xae\x9a\xe8\xa8\xbc\xe5\x88\xb8"
+    b"\xe3\x81\xae\xe7\xa8\xae\xe9\xa1\x9e\xe3\x83\x91\xe3\x82\xbf\xe3\x83\xbc\xe3\x83\xb3\xe3\x81\x8c\xe6\xa4\x9c\xe5\x87\xba\xe3\x81"
+    b"\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f!D6\xe7\xb5\x8c\xe7\x94\xb1\xe3\x81\x82\xe3\x81\xaa\xe3\x81\x9f\xe3"
+    b"\x81\xaeBIP39\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\xae\xe5\x90\x84\xe5"
+    b"\x8d\x98\xe8\xaa\x9e\xe3\x82\x92\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84"
+    b".\xe8\xa8\xad\xe5\xae\x9a\xe3\x81\xaf\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x83\xa1\xe3\x83\xa2\xe3"
+    b"\x83\xaa\xe3\x81\xab\xe5\x86\x85\xe9\x83\xa8\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe"
+    b'\xe3\x81\x99."CRL\xe5\xa4\x89\xe6\x8f\x9b\xe3\x81\xab\xe5\xa4\xb1\xe6\x95\x97"\xe6\x89\x8b\xe5\x8b\x95\xe5\x85'
+    b"\xa5\xe5\x8a\x9b\xe7\xb5\x8c\xe7\x94\xb1\xe3\x82\xab\xe3\x83\x83\xe3\x83\x88\xe6\x96\xb9\xe6\xb3\x95\xe8\xa1\x8c\xe3\x81\x8f\xe6"
+    b"\x88\x90\xe5\x8a\x9f\xe7\x8e\x87:\xe3\x82\xba\xe3\x83\xbc\xe3\x83\xa0\xe3\x83\xa2\xe3\x83\xbc\xe3\x83\x89\xe5\x8f\x8d\xe8\xbb"
+    b"\xa2\xe3\x81\x97\xe3\x81\x9f\xe8\x89\xb2\xe4\xb8\x8d\xe5\x8d\x81\xe5\x88\x86\xe3\x81\xaa\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3"
+    b"\x83\xad\xe3\x83\x94\xe3\x83\xbc!\xe4\xbd\x9c\xe6\x88\x90\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f:\xe3"
+    b"\x83\x80\xe3\x83\x96\xe3\x83\xab\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf%s\xe3\x82\x92S"
+    b"D\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe3\x82\xa8\xe3\x82\xaf\xe3\x82\xb9\xe3\x83\x9d\xe3\x83\xbc\xe3\x83\x88\xe3"
+    b"\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6QR\xe7\x94\xbb\xe5\x83\x8f\xe3\x82\x92SD\xe3\x82"
+    b"\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x99\xe3\x82\x8bRX\xe3\x83\x94\xe3\x83\xb3\xe8\xa8"
+    b"\xad\xe5\xae\x9a\xe3\x81\xafSD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x95\xe3\x82"
+    b"\x8c\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99.SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe4\xbf\x9d\xe5"
+    b"\xad\x98\xe3\x81\x99\xe3\x82\x8b\xe3\x83\x84\xe3\x83\xbc\xe3\x83\xab\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88"
+    b"\xe3\x82\x92\xe3\x82\xab\xe3\x82\xb9\xe3\x82\xbf\xe3\x83\x9e\xe3\x82\xa4\xe3\x82\xba\xe3\x81\x99\xe3\x82\x8b\xe3\x81\xa8\xe3\x80"
+    b"\x81\xe6\x96\xb0\xe3\x81\x97\xe3\x81\x84\xe3\x82\xad\xe3\x83\xbc\xe3\x81\x8c\xe7\x94\x9f\xe6\x88\x90\xe3\x81\x95\xe3\x82\x8c\xe3"
+    b"\x80\x81\xe8\xa8\x98\xe8\xbf\xb0\xe5\xad\x90\xe3\x81\x8c\xe3\x82\xa2\xe3\x83\xb3\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x95"
+    b"\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x99.\xe3\x83\xa1\xe3\x83\x83\xe3\x82\xbb\xe3\x83\xbc\xe3\x82\xb8:\xe3\x82\xb9\xe3\x82\xb1"
+    b"\xe3\x83\xbc\xe3\x83\xab\xe8\xa8\x80\xe8\xaa\x9e mnemonic\xe3\x82\x92\xe7\x94\x9f\xe6\x88\x90\xe3\x81"
+    b"\x99\xe3\x82\x8b\xe3\x81\xab\xe3\x81\xaf\xe3\x80\x81\xe5\xb0\x91\xe3\x81\xaa\xe3\x81\x8f\xe3\x81\xa8\xe3\x82\x82%d\xe5\x9b"
+    b"\x9e\xe3\x82\xb5\xe3\x82\xa4\xe3\x82\xb3\xe3\x83\xad\xe3\x82\x92\xe6\x8c\xaf\xe3\x81\xa3\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3"
+    b"\x81\x95\xe3\x81\x84.\xe3\x82\xb7\xe3\x83\xa3\xe3\x83\x83\xe3\x83\x88\xe3\x83\x80\xe3\x82\xa6\xe3\x83\xb3\xe3\x81\x97\xe3\x81"
+    b"\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6\xe6\xb2\x88\xe4\xb8\x8b\xe7\x8e\x87\xe5\x8d\x98\xe8\xaa\x9e %d\xe3"
+    b"\x82\xbf\xe3\x83\x83\xe3\x83\x97\xe3\x81\x99\xe3\x82\x8b\xe3\x81\x8bEnter\xe3\x82\xad\xe3\x83\xbc\xe3\x82\x92\xe6"
+    b"\x8a\xbc\xe3\x81\x97\xe3\x81\xa6\xe3\x82\xa4\xe3\x83\xb3\xe3\x82\xb9\xe3\x83\x88\xe3\x83\xbc\xe3\x83\xab\xe3\x81\x97\xe3\x81\xbe"
+    b"\xe3\x81\x99.\xe5\xbc\xb7\xe5\xba\xa6\xe7\x94\xbb\xe5\x83\x8f\xe3\x81\xaeSHA256:16\xe9\x80\xb2\xe6"
+    b"\x95\xb0\xe3\x81\x8b\xe3\x82\x89\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x83\x9e\xe3\x83\x83\xe3\x83\x97"
+    b"QR\xe3\x82\x92\xe5\x8d\xb0\xe5\x88\xb7\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?\xe3\x83\x95\xe3\x82\xa1\xe3\x82"
+    b"\xa4\xe3\x83\xab\xe5\x90\x8d %s \xe3\x81\x8c SD \xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe5\xad"
+    b"\x98\xe5\x9c\xa8\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99.\xe7\x84\xa1\xe5\x8a\xb9\xe3\x81\xaa\xe5\xb0\x8e\xe5\x87\xba\xe3\x83\x91"
+    b"\xe3\x82\xb9SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x8b\xe3\x82\x89\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x97"
+    b"\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?\xe6\x98\x8e\xe3\x82\x8b\xe3\x81\x95\xe3\x82\x92\xe5\x88\x87\xe3\x82\x8a\xe6\x9b\xbf\xe3"
+    b"\x81\x88\xe3\x82\x8bPAGE\xe3\x82\xa8\xe3\x83\xa9\xe3\x83\xbc:\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x81\xa8\xe3"
+    b"\x83\x90\xe3\x83\x83\xe3\x82\xaf\xe3\x83\x97\xe3\x83\xac\xe3\x83\xbc\xe3\x83\x88\xe3\x82\x92\xe6\xad\xa3\xe3\x81\x97\xe3\x81\x8f"
+    b"\xe6\x95\xb4\xe5\x88\x97\xe3\x81\x95\xe3\x81\x9b\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84.XOR\xe7"
+    b"\xb5\x90\xe6\x9e\x9cLCD\xe3\x82\xbf\xe3\x82\xa4\xe3\x83\x97\xe3\x83\x86\xe3\x82\xb9\xe3\x83\x88\xe3\x82\xb9\xe3\x82\xa4"
+    b"\xe3\x83\xbc\xe3\x83\x88\xe3\x81\xae\xe7\xb5\x90\xe6\x9e\x9c\xe3\x82\xb7\xe3\x83\x95\xe3\x83\x88\xe3\x82\xb1\xe3\x83\xbc\xe3\x82"
+    b"\xb9\xe3\x82\xad\xe3\x83\xbc\xe3\x81\xaeQR\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe3\x82\xb9\xe3\x82\xad\xe3\x83"
+    b"\xa3\xe3\x83\xb3\xe3\x81\x99\xe3\x82\x8b\xe3\x83\x9c\xe3\x83\xbc\xe3\x83\x80\xe3\x83\xbc\xe3\x83\x91\xe3\x83\x87\xe3\x82\xa3\xe3"
+    b"\x83\xb3\xe3\x82\xb0\xe3\x83\xa9\xe3\x82\xa4\xe3\x83\xb3\xe9\x81\x85\xe5\xbb\xb6\xe4\xbd\x8e\xe5\x93\x81\xe8\xb3\xaa\xe3\x81\xaa"
+    b"\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc!\xe6\xa4\x9c\xe5\x87\xba\xe3\x81\xa7\xe3\x81\x8d\xe3"
+    b"\x82\x8b\xe3\x82\x88\xe3\x81\x86\xe3\x81\xab\xe3\x80\x81\xe7\xa9\xb4\xe3\x81\x82\xe3\x81\x91\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9f"
+    b"\xe7\x82\xb9\xe3\x82\x92\xe9\xbb\x92\xe3\x81\x8f\xe5\xa1\x97\xe3\x81\xa3\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81"
+    b"\x84.utf 8\xe3\x81\x8b\xe3\x82\x89\xe3\x82\xbb\xe3\x82\xad\xe3\x83\xa5\xe3\x83\xaa\xe3\x83\x86\xe3\x82\xa3a"
+    b"\xe3\x82\xa2\xe3\x82\xab\xe3\x82\xa6\xe3\x83\xb3\xe3\x83\x88\xe3\x82\xa4\xe3\x83\xb3\xe3\x83\x87\xe3\x83\x83\xe3\x82\xaf\xe3\x82"
+    b"\xb9\xe3\x82\x88\xe3\x82\x8d\xe3\x81\x97\xe3\x81\x84\xe3\x81\xa7\xe3\x81\x99\xe3\x81\x8b?\xe7\xbd\xb2\xe5\x90\x8d\xe6\xa8\x99"
+    b"\xe6\xba\x96\xe3\x83\xa2\xe3\x83\xbc\xe3\x83\x89\xe3\x83\x95\xe3\x83\xaa\xe3\x83\xbc:(\xe9\x96\xb2\xe8\xa6\xa7\xe5\xb0\x82"
+    b"\xe7\x94\xa8)\xe7\xbd\xb2\xe5\x90\x8d\xe2\x80\xa6\xe3\x82\xa4\xe3\x83\xb3\xe3\x83\x87\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb9\xe3"
+    b"\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x82\x92\xe8\xaa\xad\xe3\x81\xbf\xe8\xbe\xbc\xe3\x82\x93\xe3\x81\xa7\xe3\x81\x84\xe3\x81\xbe"
+    b"\xe3\x81\x99\xe2\x80\xa6\xe3\x83\x97\xe3\x83\xaa\xe3\x83\xb3\xe3\x82\xbf\xe3\x83\xbc \xe5\x8f\x96\xe3\x82\x8a\xe6\xb6\x88\xe3"
+    b"\x81\x97\xe6\x8c\x87\xe7\xb4\x8b\xe3\x82\x92ID\xe3\x81\xa8\xe3\x81\x97\xe3\x81\xa6\xe4\xbd\xbf\xe7\x94\xa8\xe3\x81\x97\xe3"
+    b"\x81\xbe\xe3\x81\x99\xe3\x81\x8b?\xe3\x83\xad\xe3\x83\xbc\xe3\x83\xab\xe3\x81\xaeSHA256:QR\xe3\x83"
+    b"\xa9\xe3\x83\x99\xe3\x83\xab\xe3\x83\xad\xe3\x82\xb1\xe3\x83\xbc\xe3\x83\xab%s \xe5\x89\x8a\xe9\x99\xa4\xe3\x81\x95\xe3"
+    b"\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f.\xe3\x82\xb5\xe3\x83\xbc\xe3\x83\x9e\xe3\x83\xab%d \xe3\x81\xae%d"
+    b" \xe3\x83\x9e\xe3\x83\xab\xe3\x83\x81\xe3\x82\xb7\xe3\x82\xb0\xe3\x83\x8d\xe3\x83\x81\xe3\x83\xa3%d \xe3\x81\xae\xe3"
+    b"\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x82\x92\xe7\xa2\xba\xe8\xaa\x8d\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f"
+    b"\xe3\x81\x8c\xe3\x80\x81\xe4\xb8\x80\xe8\x87\xb4\xe3\x81\x99\xe3\x82\x8b\xe3\x82\x82\xe3\x81\xae\xe3\x81\xaf\xe3\x81\x82\xe3\x82"
+    b"\x8a\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93\xe3\x81\xa7\xe3\x81\x97\xe3\x81\x9f.Tinyseed\xe3\x82\x92\xe5"
+    b"\x8d\xb0\xe5\x88\xb7\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?\xe8\x89\xaf\xe3\x81\x84entropy\xe3"
+    b"\x81\x8a\xe9\x87\xa3\xe3\x82\x8a\xe3\x82\xaa\xe3\x82\xbf\xe3\x82\xaf\xe3\x81\xae\xe3\x81\x9f\xe3\x82\x81\xe3\x81\xae\xe7\xb5\xb1"
+    b"\xe8\xa8\x88\xe4\xbf\xae\xe6\xad\xa3\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f:\xe6\x9a\x97\xe5\x8f\xb7\xe5"
+    b"\x8c\x96\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9fQR\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89D20\xe7\xb5\x8c\xe7\x94\xb1\xe6"
+    b"\x94\xaf\xe5\x87\xba:\xe3\x83\x87\xe3\x83\x95\xe3\x82\xa9\xe3\x83\xab\xe3\x83\x88\xe3\x81\xae\xe8\xb2\xa1\xe5\xb8\x83N\xe3"
+    b"\x81\xae\xe3\x83\x91\xe3\x83\xbc\xe3\x83\x88M\xe3\x81\xaf\xe3\x81\x8424\xe3\x81\xae\xe5\x8d\x98\xe8\xaa\x9e\xe7\x8f\xbe"
+    b"\xe5\x9c\xa8\xe3\x81\xae\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83"
+    b"\xbc\xe3\x83\x89KEF ID\xe3\x82\x92\xe6\x9b\xb4\xe6\x96\xb0\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+    b"\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc\xe3\x81\xa7\xe6\xba"
+    b"\x80\xe3\x81\x9f\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9f\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x83\x95\xe3"
+    b"\x83\xab\xe3\x83\xbc\xe3\x83\x88\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xa2\xe3\x83\xa1\xe3\x83\xbc\xe3\x82\xbf\xe3\x83\xbc\xe3\x81\x93"
+    b"\xe3\x81\xae\xe3\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe3\x82\x92\xe5\x89\x8a\xe9\x99\xa4\xe3\x81\x97\xe3\x81\xbe\xe3\x81"
+    b"\x99\xe3\x81\x8b?Mnemonic\xe3\x81\xa8\xe3\x83\x91\xe3\x82\xb9\xe3\x83\x95\xe3\x83\xac\xe3\x83\xbc\xe3"
+    b"\x82\xba\xe3\x81\xaf\xe4\xbf\x9d\xe6\x8c\x81\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x99.\xe3\x83\x86\xe3\x83\xbc\xe3\x83"
+    b"\x9e\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x83\xa0\xe3\x81\xae\xe5\xa4\x89\xe6\x8f\x9b\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3"
+    b"\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x82\x92\xe5\x89\x8a\xe9\x99\xa4base 64\xe3\x81\x8b\xe3\x82\x89%d"
+    b" \xe3\x81\xb8 %d\xe3\x82\xa8\xe3\x82\xb9\xe3\x82\xaf\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3:SD\xe3\x82\xab\xe3"
+    b"\x83\xbc\xe3\x83\x89\xe3\x81\x8b\xe3\x82\x89\xe3\x83\x95\xe3\x82\xa1\xe3\x83\xbc\xe3\x83\xa0\xe3\x82\xa6\xe3\x82\xa7\xe3\x82\xa2"
+    b"\xe3\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe3\x82\x92\xe5\x89\x8a\xe9\x99\xa4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81"
+    b"\x8b?\xe3\x83\x86\xe3\x83\xbc\xe3\x83\x9e\xe3\x81\xae\xe5\xa4\x89\xe6\x9b\xb4\xe3\x81\xa8\xe5\x86\x8d\xe8\xb5\xb7\xe5\x8b\x95"
+    b"\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xafX"
+    b"ORbase 43\xe3\x81\xab\xe7\x8f\xbe\xe5\x9c\xa8\xe4\xbe\xa1\xe5\x80\xa4\xe5\x9c\xb0\xe5\x9f\x9f:\xe3"
+    b"\x82\xb9\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3\xe3\x81\x97\xe3\x81\x9f\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x82\x92\xe7\xa2\xba"
+    b"\xe8\xaa\x8d\xe3\x81\x97\xe3\x80\x81\xe5\xbf\x85\xe8\xa6\x81\xe3\x81\xab\xe5\xbf\x9c\xe3\x81\x98\xe3\x81\xa6\xe7\xb7\xa8\xe9\x9b"
+    b"\x86\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe5\xa4\x89\xe6\x8f\x9b\xe3\x82\x92\xe5\xae\x8c\xe4\xba\x86\xe3\x81\x99\xe3\x82\x8b\xe6"
+    b"\x9c\x89\xe5\x8a\xb9\xe5\x8c\x96?\xe3\x83\x90\xe3\x82\xa4\xe3\x83\x8a\xe3\x83\xaa:\xe8\xa8\xbc\xe6\x98\x8e\xe5\x8f\xaf\xe8"
+    b"\x83\xbd\xe3\x81\xab\xe4\xbd\xbf\xe7\x94\xa8\xe4\xb8\x8d\xe8\x83\xbd%s:\xe8\xaa\xad\xe3\x81\xbf\xe8\xbe\xbc\xe3\x81\xbe"
+    b"\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f!\xe3\x83\x97\xe3\x83\xac\xe3\x83\xbc\xe3\x83\xb3\xe3\x83\x86\xe3\x82\xad\xe3"
+    b"\x82\xb9\xe3\x83\x88QR\xe6\x8b\xa1\xe5\xbc\xb5\xe5\x85\xac\xe9\x96\x8b\xe3\x82\xad\xe3\x83\xbc\xe3\x83\x87\xe3\x82\xa3\xe3"
+    b"\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x82\xbf\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe6\x95\xb0\xe9\x87\x8f"
+    b"base 32\xe3\x81\xab\xe3\x82\xab\xe3\x82\xb9\xe3\x82\xbf\xe3\x83\xa0\xe3\x83\x86\xe3\x82\xad\xe3\x82\xb9\xe3"
+    b"\x83\x88\xe3\x83\x86\xe3\x82\xb9\xe3\x83\x88\xe3\x82\xb9\xe3\x82\xa4\xe3\x83\xbc\xe3\x83\x88\xe3\x83\xa6\xe3\x83\xbc\xe3\x82\xb6"
+    b"\xe3\x83\xbc\xe3\x81\xae\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x82\x92\xe6\xb6\x88\xe5\x8e\xbb\xe3\x81\x97\xe3\x81\xa6\xe3\x81"
+    b"\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6\xe5\x87\xba\xe5\x8a\x9b\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x83\xaa\xe3"
+    b"\x82\xb9\xe3\x83\x88\xe5\xa4\x89\xe6\x9b\xb4\xe4\xbd\x8f\xe6\x89\x80\xe3\x82\x92\xe8\xaa\xad\xe3\x81\xbf\xe8\xbe\xbc\xe3\x82\x93"
+    b"\xe3\x81\xa7\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83"
+    b"\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x8c\xe4\xb8\x80\xe8\x87\xb4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x9b\xe3"
+    b"\x82\x93\xe3\x82\xb7\xe3\x83\xa3\xe3\x83\x83\xe3\x83\x88\xe3\x83\x80\xe3\x82\xa6\xe3\x83\xb3\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf"
+    b"\xe3\x83\xa0\xe3\x82\x92\xe8\xa1\xa8\xe7\xa4\xbaQR\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96"
+    b"\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9f\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\x8cID"
+    b"\xe3\x81\xa8\xe3\x81\xa8\xe3\x82\x82\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81"
+    b"\x9f:BGR\xe3\x82\xab\xe3\x83\xa9\xe3\x83\xbc\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x81\x8c\xe5\xbe\xa9\xe5\x85\x83"
+    b"\xe3\x81\xa7\xe3\x81\x8d\xe3\x81\xaa\xe3\x81\x84\xe3\x82\x88\xe3\x81\x86\xe3\x81\xab\xe3\x80\x81\xe4\xbb\x96\xe3\x81\xae\xe3\x83"
+    b"\x87\xe3\x83\x90\xe3\x82\xa4\xe3\x82\xb9\xe3\x81\xa7SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe5\xae\x8c\xe5\x85"
+    b"\xa8\xe3\x81\xab\xe6\xb6\x88\xe5\x8e\xbb\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84\xe6\x9c\x80\xe5"
+    b"\x88\x9d\xe3\x81\xae%d\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x81\xab\xe8\xa6\x8b\xe3\x81\xa4\xe3\x81\x8b\xe3"
+    b"\x82\x8a\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93\xe3\x81\xa7\xe3\x81\x97\xe3\x81\x9f\xe4\xbd\x8f\xe6\x89\x80\xe3\x82\x92\xe3\x82\xa8"
+    b"\xe3\x82\xaf\xe3\x82\xb9\xe3\x83\x9d\xe3\x83\xbc\xe3\x83\x88\xe3\x83\x90\xe3\x83\xbc\xe3\x82\xb8\xe3\x83\xa7\xe3\x83\xb3\xe3\x82"
+    b"\xb9\xe3\x83\x88\xe3\x83\xac\xe3\x83\xbc\xe3\x82\xb8\xe3\x81\x8b\xe3\x82\x89\xe3\x82\xbf\xe3\x83\x83\xe3\x83\x81\xe3\x81\xbe\xe3"
+    b"\x81\x9f\xe3\x81\xafENTER\xe3\x81\xa7\xe3\x82\xad\xe3\x83\xa3\xe3\x83\x97\xe3\x83\x81\xe3\x83\xa3\xe3\x81\x99\xe3"
+    b"\x82\x8b\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x81\x8b\xe3\x82\x89\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe8\xa8\x80\xe8\x91\x89"
+    b"\xe7\xb5\x8c\xe7\x94\xb1\xe6\xa6\x82\xe8\xa6\x81\xe3\x82\xb7\xe3\x83\xa3\xe3\x83\x8e\xe3\x83\xb3\xe3\x81\xae\xe3\x82\xa8\xe3\x83"
+    b"\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc:\xe5\x8f\xb3\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3\xe4\xbb\x98\xe3\x81\x8d"
+    b"\xe3\x83\xa1\xe3\x83\x83\xe3\x82\xbb\xe3\x83\xbc\xe3\x82\xb8%d \xe3\x81\xaeBIP39\xe3\x83\xaf\xe3\x83\xbc"
+    b"\xe3\x83\x89\xe3\x82\x92\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84.\xe3"
+    b"\x82\xb5\xe3\x82\xa4\xe3\x82\xba:\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\xbc\xe3\x83\xb3\xe3\x82\xbb\xe3\x83\xbc\xe3\x83"
+    b"\x90\xe3\x83\xbc\xe3\x81\xae\xe6\x99\x82\xe9\x96\x93\xe3\x83\xa1\xe3\x83\x83\xe3\x82\xbb\xe3\x83\xbc\xe3\x82\xb8%s \xe3"
+    b"\x83\x90\xe3\x82\xa4\xe3\x83\x88\xe3\x83\x9c\xe3\x82\xbf\xe3\x83\xb3\xe3\x81\xae\xe3\x83\x87\xe3\x83\x90\xe3\x82\xa6\xe3\x83\xb3"
+    b"\xe3\x82\xb9\xe3\x83\x90\xe3\x82\xa4\xe3\x83\x8a\xe3\x83\xaa\xe3\x82\xb0\xe3\x83\xaa\xe3\x83\x83\xe3\x83\x89\xe3\x82\xad\xe3\x83"
+    b"\xbc\xe3\x82\x92\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x99\xe3\x82\x8b\xe8\xa1\xa8\xe7\xa4\xba\xe3\x83\xa9\xe3\x83\x99\xe3\x83\xab\xe3"
+    b"\x83\xaf\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe3\x83\xa6\xe3\x83\x8b\xe3\x83\x83\xe3\x83\x88\xe6\x94\xaf\xe5\x87\xba\xef\xbc\x88"
+    b"%d\xef\xbc\x89:\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x83\xa0\xe3\x83\x84\xe3\x83\xbc\xe3\x83\xabSD\xe3\x82\xab"
+    b"\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x99\xe3\x82\x8b\xe6\x9c\x89\xe5\x8a\xb9\xe3\x81\xaa\xe3\x82"
+    b"\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x81\xa7\xe3\x81\x99\xef\xbc\x81\xe3\x83\xa9\xe3\x82\xa4\xe3\x83\xb3:\xe6\x9c\x80"
+    b"\xe5\x88\x9d\xe3\x81\xab\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83"
+    b"\xbc\xe3\x83\x89\xe3\x82\x92\xe8\xa8\xad\xe5\xae\x9a\xe3\x81\x99\xe3\x82\x8b\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96\xe8\xaa\xad\xe8"
+    b"\xbe\xbc\xe4\xb8\xad\xe2\x80\xa6\xe4\xbf\xa1\xe9\xa0\xbc\xe3\x81\xa7\xe3\x81\x8d\xe3\x82\x8b\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac"
+    b"\xe3\x83\x83\xe3\x83\x88\xe8\xa8\x98\xe8\xbf\xb0\xe5\xad\x90\xe3\x82\x92\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x97\xe3\x81"
+    b"\xa6\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x82\x92\xe8\xa1\xa8\xe7\xa4\xba\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3"
+    b"\x81\x8b?\xe7\x84\xa1\xe5\x8a\xb9\xe3\x81\xaa\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x81"
+    b"\x8c\xe5\xbe\xa9\xe5\x85\x83\xe4\xb8\x8d\xe5\x8f\xaf\xe8\x83\xbd\xe3\x81\xa7\xe3\x81\x82\xe3\x82\x8b\xe3\x81\x93\xe3\x81\xa8\xe3"
+    b"\x82\x92\xe7\xa2\xba\xe5\xae\x9f\xe3\x81\xab\xe3\x81\x99\xe3\x82\x8b\xe3\x81\xab\xe3\x81\xaf\xe3\x80\x81\xe3\x83\x87\xe3\x83\x90"
+    b"\xe3\x82\xa4\xe3\x82\xb9\xe6\xb6\x88\xe5\x8e\xbb\xe6\xa9\x9f\xe8\x83\xbd\xe3\x82\x92\xe4\xbd\xbf\xe7\x94\xa8\xe3\x81\x97\xe3\x81"
+    b"\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84TR\xe5\x86\x85\xe9\x83\xa8\xe3\x82\xad\xe3\x83\xbc\xe9\x9d\x99\xe6\xad"
+    b"\xa2\xe7\x94\xbb\xe3\x82\xb7\xe3\x83\xb3\xe3\x82\xb0\xe3\x83\xab\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3QR\xe3\x82\xb3\xe3\x83"
+    b"\xbc\xe3\x83\x89\xe3\x81\xab\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3\xe3\x81\x99\xe3\x82\x8b\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3"
+    b"\x83\x83\xe3\x83\x88\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x82\xbf\xe3\x83\xbc\xe3\x83\x91"
+    b"\xe3\x82\xb9\xe3\x83\x95\xe3\x83\xac\xe3\x83\xbc\xe3\x82\xba\xe3\x81\xaa\xe3\x81\x976\xe6\x96\x87\xe5\xad\x97\xe4\xbb\xa5\xe4"
+    b"\xb8\x8a\xe3\x81\xae\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc"
+    b"\xe3\x83\x89\xe3\x82\x92\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84\xe6\x94"
+    b"\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe4\xb8\x80\xe9"
+    b"\x83\xa8\xe3\x81\xae\xe3\x83\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\x92\xe5\xae\x9f\xe8\xa1\x8c\xe3\x81\xa7\xe3\x81\x8d"
+    b"\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93.\xe3\x83\x9c\xe3\x82\xbf\xe3\x83\xb3\xe5\x88\x9d\xe6\x9c\x9f\xe5\x8c\x96\xe3\x82\x92\xe5"
+    b"\xbe\xa9\xe5\x85\x83\xe3\x81\x97\xe3\x81\xa6\xe5\x86\x8d\xe8\xb5\xb7\xe5\x8b\x95\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b"
+    b"?\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe3\x82\x92\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x82\xab\xe3"
+    b"\x83\xa1\xe3\x83\xa9\xe3\x81\xae\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc\xe3\x82\x92\xe4\xbd\xbf"
+    b"\xe7\x94\xa8\xe3\x81\x97\xe3\x81\xa6\xe6\x96\xb0\xe3\x81\x97\xe3\x81\x84mnemonic\xe3\x82\x92\xe4\xbd\x9c"
+    b"\xe6\x88\x90\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84\xe7\x94\x9f\xe3\x81\xae\xe3\x83\x8f\xe3\x83"
+    b"\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x81\xab\xe7\xbd\xb2\xe5\x90\x8d\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99.\xe3\x82\xbd\xe3\x83\xbc"
+    b"\xe3\x82\xb9\xe3\x82\x92\xe4\xbf\xa1\xe9\xa0\xbc\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x82\x8b\xe5\xa0\xb4\xe5\x90\x88\xe3\x81"
+    b"\xab\xe3\x81\xae\xe3\x81\xbf\xe7\xb6\x9a\xe8\xa1\x8c\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99.\xe8\xb5\xb7\xe5\x8b\x95\xe6\x99\x82"
+    b"\xe3\x81\xaeTC\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x83\x8f\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5"
+    b"\xe3\x83\x91\xe3\x82\xb9\xe3\x83\x95\xe3\x83\xac\xe3\x83\xbc\xe3\x82\xba\xe3\x81\xab\xe9\x9d\x9eASCII\xe6\x96\x87"
+    b"\xe5\xad\x97\xe3\x81\x8c\xe6\xa4\x9c\xe5\x87\xba\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f.Krux"
+    b"\xe3\x81\xaf\xe3\x80\x81\xe4\xbb\x96\xe3\x81\xae\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe3\x81\x8c\xe5\x90"
+    b"\x8c\xe3\x81\x98\xe3\x82\xad\xe3\x83\xbc\xe3\x82\x92\xe5\x8f\x96\xe5\xbe\x97\xe3\x81\x99\xe3\x82\x8b\xe3\x81\x93\xe3\x81\xa8\xe3"
+    b"\x82\x92\xe4\xbf\x9d\xe8\xa8\xbc\xe3\x81\x99\xe3\x82\x8b\xe3\x81\x93\xe3\x81\xa8\xe3\x81\xaf\xe3\x81\xa7\xe3\x81\x8d\xe3\x81\xbe"
+    b"\xe3\x81\x9b\xe3\x82\x93.\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe5\x87\xba\xe5\x8a\x9b\xe3\x83\x87\xe3"
+    b"\x82\xa3\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x82\xbf\xe3\x83\xbc\xe3\x81\x8c\xe8\xa6\x8b\xe3\x81\xa4\xe3\x81\x8b"
+    b"\xe3\x82\x8a\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93.180\xc2\xb0\xe5\x9b\x9e\xe8\xbb\xa2\xe3\x83\x87\xe3\x82\xb7\xe3\x83"
+    b"\x9e\xe3\x83\xab\xe3\x82\xad\xe3\x83\xa3\xe3\x83\x97\xe3\x83\x81\xe3\x83\xa3\xe3\x82\x92\xe5\xbe\x85\xe3\x81\xa3\xe3\x81\xa6\xe3"
+    b"\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84QR\xe3\x83\xa9\xe3\x83\x99\xe3\x83\xab\xe3\x82\x92\xe6\x9b\xb4\xe6\x96\xb0\xe3"
+    b"\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?\xe6\x98\x8e\xe3\x82\x8b\xe3\x81\x95Base64\xe3\x83\x91\xe3\x82"
+    b"\xb9\xe3\x83\xaf\xe3\x83\xbc\xe3\x83\x89\xe3\x83\x94\xe3\x82\xaf\xe3\x82\xbb\xe3\x83\xab\xe5\x81\x8f\xe5\xb7\xae\xe6\x8c\x87\xe6"
+    b"\x95\xb0:\xe9\x80\xb2\xe3\x81\xbf\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?\xe7\x84\xa1\xe5\x8a\xb9\xe3\x81\xaa\xe3\x82\xa2\xe3"
+    b"\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe5\x87\xba\xe5\x8a\x9b\xe3\x83\x87"
+    b"\xe3\x82\xa3\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x82\xbf\xe3\x83\xbc\xe3\x81\x8c\xe3\x83\xad\xe3\x83\xbc\xe3\x83"
+    b"\x89\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f\xef\xbc\x8116\xe9\x80\xb2\xe6\x95\xb0\xe3\x81\xabTC"
+    b"\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x83\x8f\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe6\x9a\x97\xe5\x8f"
+    b"\xb7\xe5\x8c\x96\xe3\x83\xa2\xe3\x83\xbc\xe3\x83\x89\xe3\x83\x86\xe3\x82\xad\xe3\x82\xb9\xe3\x83\x88\xe5\xbc\xb7\xe5\x8a\x9b\xe8"
+    b"\x84\x86\xe5\xbc\xb1\xe8\xad\xa6\xe5\x91\x8a:\xe9\xbb\x92\xe3\x81\x84\xe8\x83\x8c\xe6\x99\xaf\xe9\x9d\xa2\xe3\x82\x92\xe4\xbd"
+    b"\xbf\xe7\x94\xa8\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84.\xe3\x82\xa8\xe3\x82\xaf\xe3\x82\xb5"
+    b"\xe3\x83\x87\xe3\x82\xb7\xe3\x83\x9e\xe3\x83\xab\xe3\x82\xa2\xe3\x83\xb3\xe3\x83\x81\xe3\x82\xb0\xe3\x83\xac\xe3\x82\xa2\xe3\x83"
+    b"\xa2\xe3\x83\xbc\xe3\x83\x89\xe5\x8f\x97\xe3\x81\x91\xe5\x8f\x96\xe3\x82\x8b\xe6\x98\x8e\xe3\x82\x8b\xe3\x81\x95\xe3\x82\x92\xe5"
+    b"\x88\x87\xe3\x82\x8a\xe6\x9b\xbf\xe3\x81\x88\xe3\x82\x8b\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe5\xa4\x89"
+    b"\xe6\x9b\xb4?\xe3\x82\x82\xe3\x81\xa3\xe3\x81\xa8\xe8\xa9\xa6\xe3\x81\x97\xe3\x81\xa6\xe3\x81\xbf\xe3\x81\xbe\xe3\x81\x99\xe3"
+    b"\x81\x8b?\xe5\x8d\x98\xe8\xaa\x9e13-24\xe3\x82\x92\xe3\x82\xb9\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3\xe4\xb8\xad"
+    b"SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x8c\xe6\xa4\x9c\xe5\x87\xba\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x9b"
+    b"\xe3\x82\x93.12\xe3\x81\xae\xe5\x8d\x98\xe8\xaa\x9e\xe3\x82\x82\xe3\x81\x86\xe4\xb8\x80\xe5\xba\xa6\xe7\xa2\xba\xe8\xaa"
+    b"\x8d\xe3\x81\x99\xe3\x82\x8b\xe3\x83\x87\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\x97\xe3\x83\x88?\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2"
+    b"\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\xae\xe3\x83\x90\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xa2\xe3\x83\x83\xe3\x83\x97Fl"
+    b"ash\xe3\x83\x84\xe3\x83\xbc\xe3\x83\xab\xe3\x82\xa2\xe3\x83\x83\xe3\x83\x97\xe3\x82\xb0\xe3\x83\xac\xe3\x83\xbc\xe3\x83"
+    b"\x89\xe3\x81\x8c\xe5\xae\x8c\xe4\xba\x86\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f.16\xe9\x80\xb2\xe6\x95\xb0\xe3"
+    b"\x81\x8b\xe3\x82\x89(%s\xe3\x83\x93\xe3\x83\x83\xe3\x83\x88/px)\xe5\xa0\xb4\xe6\x89\x80Res. "
+    b"- \xe3\x83\x95\xe3\x82\xa9\xe3\x83\xbc\xe3\x83\x9e\xe3\x83\x83\xe3\x83\x88\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b"
+    b"\xe3\x83\x83\xe3\x82\xaf\xe3\x82\x92\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe7\xa9\xbautf 8\xe3\x81\xb8\xe4\xb8\x80"
+    b"\xe9\x83\xa8\xe3\x81\xae\xe3\x83\x8e\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xaf\xe7\xa1\xac\xe5\x8c\x96\xe3\x81\x95\xe3\x82\x8c\xe3\x81"
+    b"\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93:SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe3\x82\xb5\xe3"
+    b"\x82\xa4\xe3\x83\xb3\xe3\x81\x99\xe3\x82\x8bID\xe3\x81\xaf\xe3\x81\x99\xe3\x81\xa7\xe3\x81\xab\xe5\xad\x98\xe5\x9c\xa8\xe3"
+    b"\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x83\x87\xe3\x83\x95\xe3\x82\xa9\xe3\x83\xab\xe3\x83\x88\xe3\x81\xaePBKDF "
+    b"2\xe3\x82\xa4\xe3\x83\x86\xe3\x83\xbc\xe3\x83\xab\xe3\x82\x92\xe4\xbd\xbf\xe7\x94\xa8\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99."
+    b"\xe4\xb8\x8d\xe6\x98\x8e\xe3\x83\x9f\xe3\x83\xa9\xe3\x83\xbcX\xe5\xba\xa7\xe6\xa8\x99\xe3\x83\x8d\xe3\x83\x83\xe3\x83\x88\xe3"
+    b"\x83\xaf\xe3\x83\xbc\xe3\x82\xafBIP85\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc\xe3"
+    b"\x82\x92\xe5\xb0\x8e\xe5\x87\xba\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?mnemonic\xe3\x81\xae"
+    b"\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\xab\xe5\xa4\xb1\xe6\x95\x97\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f\xe5\x8d\x98\xe8\xaa"
+    b"\x9e\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9f\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3"
+    b"\x83\x83\xe3\x82\xaf\xe3\x81\x8c\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93\xe3\x81\xa7"
+    b"\xe3\x81\x97\xe3\x81\x9f\xe3\x82\xbf\xe3\x83\x83\xe3\x83\x81\xe3\x82\xb9\xe3\x82\xaf\xe3\x83\xaa\xe3\x83\xbc\xe3\x83\xb3\xe7\x94"
+    b"\xa8\xe7\xb4\x99\xe5\xb9\x85 \xe3\x82\xa2\xe3\x82\xab\xe3\x82\xa6\xe3\x83\xb3\xe3\x83\x88\xe3\x82\xad\xe3\x83\xbc%s "
+    b"\xe6\x96\x87\xe5\xad\x97\xe3\x83\x86\xe3\x82\xb9\xe3\x83\x88QR\xe3\x82\x92\xe5\x8d\xb0\xe5\x88\xb7\xe3\x83\x95\xe3\x83\xa9"
+    b"\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x81\x8b\xe3\x82\x89\xe3\x81\x99\xe3\x81\xb9\xe3\x81\xa6\xe3\x81\xae\xe4\xbf\x9d\xe5\xad"
+    b"\x98\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9f\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96mnemonics\xe3\x81\xa8\xe8"
+    b"\xa8\xad\xe5\xae\x9a\xe3\x82\x92\xe6\xb0\xb8\xe4\xb9\x85\xe3\x81\xab\xe5\x89\x8a\xe9\x99\xa4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99"
+    b"\xe3\x81\x8b?\xe3\x83\x97\xe3\x83\xaa\xe3\x83\xb3\xe3\x82\xbf\xe3\x82\x92\xe8\xaa\xad\xe3\x81\xbf\xe8\xbe\xbc\xe3\x82\x93\xe3"
+    b"\x81\xa7\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6\xe6\x95\xb0\xe5\xad\x97QR\xe3\x83\x93\xe3\x83\xa5\xe3\x83\xbc\xe3"
+    b"\x83\xaf\xe3\x83\xbc\xe3\x81\xab\xe6\x88\xbb\xe3\x82\x8bPAGE\xe3\x82\x92\xe6\x8a\xbc\xe3\x81\x97\xe3\x81\xa6\xe3\x82"
+    b"\xad\xe3\x83\xa3\xe3\x83\xb3\xe3\x82\xbb\xe3\x83\xab\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99.\xe3\x81\x93\xe3\x81\xae\xe3\x82\xa2"
+    b"\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x81\x8c\xe3\x81\x93\xe3\x81\xae\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83"
+    b"\x88\xe3\x81\xab\xe5\xb1\x9e\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x82\x8b\xe3\x81\x8b\xe7\xa2\xba\xe8\xaa\x8d\xe3\x81\x97\xe3"
+    b"\x81\xbe\xe3\x81\x99\xe3\x81\x8b?\xe3\x82\xad\xe3\x83\xa3\xe3\x83\x97\xe3\x83\x81\xe3\x83\xa3\xe3\x81\x8c\xe3\x82\xad\xe3\x83"
+    b"\xa3\xe3\x83\xb3\xe3\x82\xbb\xe3\x83\xab\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f\xe5\xb0\x8e\xe5\x87\xba\xe3"
+    b"\x83\x91\xe3\x82\xb9\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe5\xa4\xb1\xe6\x95\x97\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x97"
+    b"\xe3\x81\x9f\xe6\x9a\x97\xe5\x8f\xb7\xe5\x8c\x96\xe3\x81\x95\xe3\x82\x8c\xe3\x81\x9fKEF\xe3\x82\xa4\xe3\x83\xb3\xe3\x83"
+    b"\x97\xe3\x83\x83\xe3\x83\x88(%d):\xe7\x84\xa1\xe5\x8a\xb9\xe3\x81\xaa\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83"
+    b"\x81\xe3\x82\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe4\xb8\xad\xe9\x96\x93\xe4\xb8\x8a\xe6\x9b\xb8\xe3"
+    b"\x81\x8d\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?\xe3\x82\xad\xe3\x83\xbc\xe3\x81\x8c\xe6\x8f\x90\xe4\xbe\x9b\xe3\x81"
+    b"\x95\xe3\x82\x8c\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3"
+    b"\x83\xad\xe3\x83\xbc\xe3\x83\xab\xe3\x81\xae\xe5\x88\x86\xe5\xb8\x83:\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xb9\xe3\x83\x97\xe3\x83"
+    b"\xac\xe3\x82\xa4\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x99\xe3"
+    b"\x82\x8b1\xe8\xa1\x8c\xe7\x9b\xae\xe3\x82\x92\xe3\x83\x87\xe3\x83\x95\xe3\x82\xa9\xe3\x83\xab\xe3\x83\x88\xe3\x81\xab\xe3\x81"
+    b"\x99\xe3\x82\x8b\xe3\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe5\x90\x8d\xe3\x81\x93\xe3\x81\xae\xe5\xa4\x89\xe6\x9b\xb4\xe5"
+    b"\xbe\x8c\xe3\x81\xab\xe3\x83\x87\xe3\x83\x90\xe3\x82\xa4\xe3\x82\xb9\xe3\x81\xae\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xb9\xe3\x83\x97"
+    b"\xe3\x83\xac\xe3\x82\xa4\xe3\x81\x8c\xe5\x8b\x95\xe4\xbd\x9c\xe3\x81\x97\xe3\x81\xaa\xe3\x81\x84\xe5\xa0\xb4\xe5\x90\x88\xe3\x80"
+    b"\x815\xe7\xa7\x92\xe5\xbe\x8c\xe3\x81\xab\xe4\xbb\xa5\xe5\x89\x8d\xe3\x81\xae\xe8\xa8\xad\xe5\xae\x9a\xe3\x81\xa7\xe8\x87\xaa"
+    b"\xe5\x8b\x95\xe7\x9a\x84\xe3\x81\xab\xe5\x86\x8d\xe8\xb5\xb7\xe5\x8b\x95\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99.\xe3\x83\xad\xe3"
+    b"\x83\xbc\xe3\x83\x89\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?\xe4\xbd\xbf\xe7\x94\xa8\xe6\xb8\x88\xe3\x81\xbf:\xe5"
+    b"\x86\x8d\xe8\xb5\xb7\xe5\x8b\x95\xe5\x8d\xb0\xe5\x88\xb7?(\xe5\xae\x9f\xe9\xa8\x93\xe7\x9a\x84)\xe3\x83\x98\xe3\x83\x83"
+    b"\xe3\x83\x89\xe3\x82\xbf\xe3\x82\xa4\xe3\x83\x97\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe4\xb8\x8d\xe4\xb8"
+    b"\x80\xe8\x87\xb4:base 32\xe3\x81\x8b\xe3\x82\x89\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83"
+    b"\x88\xe3\x81\xae\xe3\x83\x91\xe3\x82\xb9\xe3\x83\x95\xe3\x83\xac\xe3\x83\xbc\xe3\x82\xba\xe3\x82\x92\xe8\xbf\xbd\xe5\x8a\xa0\xe3"
+    b"\x81\xbe\xe3\x81\x9f\xe3\x81\xaf\xe5\xa4\x89\xe6\x9b\xb4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?SD\xe3\x82\xab"
+    b"\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe7\xa2\xba\xe8\xaa\x8d\xe3\x81\x99\xe3\x82\x8b\xe5\x8d\xb0\xe5\x88\xb7\xe3\x81\x97\xe3\x81"
+    b"\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6\xe6\x88\xbb\xe3\x82\x8b\xe3\x82\xab\xe3\x82\xb9\xe3\x82\xbf\xe3\x83\xa0Q"
+    b"R\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x82\xb9\xe3\x83\xaf\xe3\x82\xa4\xe3\x83\x97\xe3\x81\x97\xe3\x81\xa6\xe3\x83\xa2\xe3"
+    b"\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe5\xa4\x89\xe6\x9b\xb4\xe3\x81\x99\xe3\x82\x8bXOR\xe7\x8f\xbe\xe5\x9c\xa8\xe3\x81\xae"
+    b"\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\xa8\xe5\x88\xa5\xe3\x81\xae\xe3\x83\x8b\xe3\x83"
+    b"\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf? (\xe3\x83\x91\xe3\x82\xb9\xe3\x83\x95\xe3\x83\xac\xe3\x83\xbc\xe3"
+    b"\x82\xba\xe3\x81\xa8\xe8\xa8\x98\xe8\xbf\xb0\xe5\xad\x90\xe3\x81\xaf\xe7\xa0\xb4\xe6\xa3\x84\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe"
+    b"\xe3\x81\x99)SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x97\xe3\x81\xbe\xe3\x81"
+    b"\x99\xe3\x81\x8b?Mnemonic\xe3\x82\x92\xe7\x94\x9f\xe6\x88\x90\xe3\x81\x99\xe3\x82\x8b\xe3\x83\x91\xe3"
+    b"\x83\xbc\xe3\x83\x84\xe3\x82\xb5\xe3\x82\xa4\xe3\x82\xba\xe3\x82\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe3\x81\xae"
+    b"\xe5\x87\xba\xe5\x8a\x9b\xe8\xa8\x98\xe8\xbf\xb0\xe5\xad\x90\xe3\x82\x92\xe3\x83\xad\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x97\xe3\x81"
+    b"\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84Hex\xe5\x85\xac\xe9\x96\x8b\xe3\x82\xad\xe3\x83\xbc:\xe6\x9a\x97"
+    b"\xe5\x8f\xb7\xe5\x8c\x96\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f\xe3\x82\xab\xe3\x82\xb9\xe3\x82\xbf\xe3\x83"
+    b"\x9e\xe3\x82\xa4\xe3\x82\xba\xe3\x81\x99\xe3\x82\x8b\xe3\x81\x9d\xe3\x81\xae\xe3\x81\xbe\xe3\x81\xbe\xe9\x80\xb2\xe3\x81\xbf\xe3"
+    b"\x81\xbe\xe3\x81\x99\xe3\x81\x8b?\xe5\xa4\x89\xe6\x9b\xb4\xe5\x85\x88\xe4\xbd\x8f\xe6\x89\x80\xe3\x82\x92\xe7\x89\xb9\xe5\xae"
+    b"\x9a\xe3\x81\xa7\xe3\x81\x8d\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93\xe3\x81\xa7\xe3\x81\x97\xe3\x81\x9f.\xe3\x83\xa6\xe3\x83\xbc"
+    b"\xe3\x82\xb6\xe3\x83\xbc\xe3\x81\xae\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x82\x92\xe6\xb6\x88\xe5\x8e\xbb\xe3\x81\x99\xe3\x82"
+    b"\x8b\xe6\x96\xb0\xe3\x81\x97\xe3\x81\x84\xe3\x83\x95\xe3\x82\xa1\xe3\x83\xbc\xe3\x83\xa0\xe3\x82\xa6\xe3\x82\xa7\xe3\x82\xa2\xe3"
+    b"\x81\x8c\xe6\xa4\x9c\xe5\x87\xba\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f.\xe3\x82\xb7\xe3\x83\xa3\xe3\x83"
+    b"\x83\xe3\x83\x88\xe3\x83\x80\xe3\x82\xa6\xe3\x83\xb3\xe6\x99\x82\xe9\x96\x93\xe5\xb7\xa6\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3\xe3"
+    b"\x81\x95\xe3\x82\x8c\xe3\x81\x9fPSBT\xe5\xa4\xb1\xe6\x95\x97\xe6\x94\xb9\xe3\x81\x96\xe3\x82\x93\xe3\x83\x81\xe3\x82"
+    b"\xa7\xe3\x83\x83\xe3\x82\xaf\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x81\x8c\xe6\xad\xa3\xe5\xb8\xb8\xe3\x81\xab\xe8\xa8\xad\xe5"
+    b"\xae\x9a\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f\xe3\x82\xb9\xe3\x83\xaf\xe3\x82\xa4\xe3\x83\x97\xe3\x82\xbf"
+    b"\xe3\x83\x83\xe3\x83\x81\xe3\x82\xb9\xe3\x83\xac\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa7\xe3\x83\xab\xe3\x83\x89\xe3\x83\x86\xe3\x82"
+    b"\xb9\xe3\x83\x88:\xe3\x81\x82\xe3\x81\xaa\xe3\x81\x9f\xe3\x81\xaeBIP39\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3"
+    b"\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\xae\xe5\x90\x84\xe5\x8d\x98\xe8\xaa\x9e\xe3\x82\x921\xe3\x81\x8b\xe3\x82\x8920"
+    b"48\xe3\x81\xae\xe7\x95\xaa\xe5\x8f\xb7\xe3\x81\xa7\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0"
+    b"\xe3\x81\x95\xe3\x81\x84.%s\xe3\x82\x92\xe5\x89\x8a\xe9\x99\xa4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?\xe5"
+    b"\x8d\x98\xe8\xaa\x9e\xe7\x95\xaa\xe5\x8f\xb7\xe3\x83\x91\xe3\x82\xb9\xe3\x81\xae\xe4\xb8\x8d\xe4\xb8\x80\xe8\x87\xb4\xe5\x8f\x97"
+    b"\xe4\xbf\xa1\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x82\x92\xe8\xaa\xad\xe3\x81\xbf\xe8\xbe\xbc\xe3\x82\x93\xe3\x81"
+    b"\xa7\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80\xa6\xe5\x87\xa6\xe7\x90\x86\xe4\xb8\xad\xe2\x80\xa6\xe8\x87\xaa\xe5\xb7\xb1\xe8"
+    b"\xbb\xa2\xe9\x80\x81:\xe3\x81\x8a\xe9\x87\xa3\xe3\x82\x8a:\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3"
+    b"\x82\x92\xe5\x85\x85\xe5\xa1\xab\xe4\xb8\xadKrux\xe3\x83\x97\xe3\x83\xaa\xe3\x83\xb3\xe3\x82\xbf\xe3\x83\xbc\xe3\x83"
+    b"\x86\xe3\x82\xb9\xe3\x83\x88QR\xe5\xae\x8c\xe4\xba\x86?\xe3\x82\xa2\xe3\x83\xbc\xe3\x82\xab\xe3\x82\xa4\xe3\x83\x96\xe6"
+    b"\x8e\xa2\xe7\xb4\xa2?\xe8\xaa\x8d\xe8\xa8\xbc\xe4\xb8\xad\xe2\x80\xa6\xe5\xa4\x96\xe8\xa6\xb3\xe9\xab\x98\xe3\x81\x84\xe6\x89"
+    b"\x8b\xe6\x95\xb0\xe6\x96\x99\xef\xbc\x81\xe5\xae\x8c\xe4\xba\x86\xe3\x81\x99\xe3\x82\x8b\xe3\x81\xbe\xe3\x81\xa7\xe9\x9b\xbb\xe6"
+    b"\xba\x90\xe3\x82\x92\xe5\x88\x87\xe3\x82\x89\xe3\x81\xaa\xe3\x81\x84\xe3\x81\xa7\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84"
+    b".\xe3\x83\x97\xe3\x83\xaa\xe3\x83\xb3\xe3\x82\xbf\xe3\x83\xbc\xe3\x83\x89\xe3\x83\xa9\xe3\x82\xa4\xe3\x83\x90\xe3\x83\xbc\xe3"
+    b"\x81\x8c\xe8\xa8\xad\xe5\xae\x9a\xe3\x81\x95\xe3\x82\x8c\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x9b\xe3\x82\x93!Mn"
+    b"emonics\xe3\x82\x92\xe9\x9a\xa0\xe3\x81\x99\xe3\x83\x91\xe3\x83\xbc\xe3\x83\x84\xe7\xbd\xb2\xe5\x90\x8d\xe3"
+    b"\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe3\x81\x8c\xe6\xac\xa0\xe8\x90\xbd\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe"
+    b"\xe3\x81\x99SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe5\x88\x9d\xe6\x9c\x9f\xe8\xa8\xad\xe5\xae\x9a\xe3\x83\xa6\xe3\x83\xbc"
+    b"\xe3\x82\xb6\xe3\x83\xbc\xe3\x81\xae\xe3\x83\x87\xe3\x83\xbc\xe3\x82\xbf\xe5\x80\xa4%s\xe3\x81\x8c\xe7\xaf\x84\xe5\x9b\xb2"
+    b"\xe5\xa4\x96\xe3\x81\xa7\xe3\x81\x99: [ %s, %s]\xe5\x8d\x98\xe8\xaa\x9e1-12\xe3\x82"
+    b"\x92\xe5\x86\x8d\xe5\xba\xa6\xe3\x82\xb9\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3\xe4\xb8\xadPSBT\xe3\x81\xa7\xe3\x83\x87"
+    b"\xe3\x82\xb8\xe3\x82\xbf\xe3\x83\xab\xe6\x8c\x87\xe7\xb4\x8b\xe3\x81\x8c\xe6\x9c\xaa\xe8\xa8\xad\xe5\xae\x9aSD\xe3\x82\xab"
+    b"\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe7\xa2\xba\xe8\xaa\x8d\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe2\x80"
+    b"\xa6\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x81\x8b\xe3\x82\x89\xe3\x81\xae\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3"
+    b"\x83\x94\xe3\x83\xbc\xe3\x81\xa7\xe3\x83\x95\xe3\x83\xa9\xe3\x83\x83\xe3\x82\xb7\xe3\x83\xa5\xe3\x82\x92\xe5\x9f\x8b\xe3\x82\x81"
+    b"\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?SD\xe3\x82\xab\xe3\x83\xbc\xe3\x83\x89\xe3\x81\xab\xe4\xbf\x9d\xe5\xad\x98\xe3\x81"
+    b"\x97\xe3\x81\xbe\xe3\x81\x97\xe3\x81\x9f:BIP39\xe3\x83\x91\xe3\x82\xb9\xe3\x83\x95\xe3\x83\xac\xe3\x83\xbc\xe3"
+    b"\x82\xba\xe3\x82\x92\xe3\x82\xb9\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3\xe3\x81\x99\xe3\x82\x8b\xe3\x81\x82\xe3\x81\xaa\xe3\x81\x9f"
+    b"\xe3\x81\xaeBIP39\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83\x83\xe3\x82\xaf\xe3\x81\xae\xe5\x90\x84"
+    b"\xe5\x8d\x98\xe8\xaa\x9e\xe3\x82\x921\xe3\x81\x8b\xe3\x82\x89800\xe3\x81\xae16\xe9\x80\xb2\xe6\x95\xb0\xe3\x81"
+    b"\xa7\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84.\xe3\x81\x84\xe3\x81\x84"
+    b"\xe3\x81\x88base 64\xe3\x81\xab\xe3\x83\xad\xe3\x83\xbc\xe3\x83\xab\xe3\x81\x8c\xe8\xb6\xb3\xe3\x82\x8a\xe3"
+    b"\x81\xbe\xe3\x81\x9b\xe3\x82\x93!\xe7\x84\xa1\xe5\x8a\xb9\xe3\x81\xaa\xe3\x83\x8b\xe3\x83\xbc\xe3\x83\xa2\xe3\x83\x8b\xe3\x83"
+    b"\x83\xe3\x82\xaf\xe3\x81\xae\xe9\x95\xb7\xe3\x81\x95QR\xe3\x82\xb3\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe4\xbd\x9c\xe6\x88"
+    b"\x90PAGE\xe3\x82\x92\xe6\x8a\xbc\xe3\x81\x97\xe3\x81\xa6\xe3\x83\xa2\xe3\x83\xbc\xe3\x83\x89\xe3\x82\x92\xe5\x88\x87"
+    b"\xe3\x82\x8a\xe6\x9b\xbf\xe3\x81\x88\xe3\x81\xbe\xe3\x81\x99\xe3\x83\x91\xe3\x82\xb9\xe3\x81\x94\xe3\x81\xa8\xe3\x81\xae\xe6\xb7"
+    b"\xb1\xe3\x81\x95base 43\xe3\x81\x8b\xe3\x82\x89\xe3\x82\xa2\xe3\x83\x89\xe3\x83\xac\xe3\x82\xb9\xe3\x82\xb9"
+    b"\xe3\x82\xad\xe3\x83\xa3\xe3\x83\xb3%s\xe3\x81\xab\xe3\x81\xaf\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe3\x81\x8b\xe3\x82\x89"
+    b"\xe3\x81\xae\xe8\xbf\xbd\xe5\x8a\xa0\xe3\x82\xa8\xe3\x83\xb3\xe3\x83\x88\xe3\x83\xad\xe3\x83\x94\xe3\x83\xbc\xe3\x81\x8c\xe5\xbf"
+    b"\x85\xe8\xa6\x81\xe3\x81\xa7\xe3\x81\x99\xe5\x8f\x8d\xe8\xbb\xa2\xe3\x81\x99\xe3\x82\x8b\xe3\x83\x87\xe3\x83\x90\xe3\x82\xa4\xe3"
+    b"\x82\xb9\xe3\x83\x86\xe3\x82\xb9\xe3\x83\x88\xe3\x83\xa1\xe3\x83\x8b\xe3\x83\xa5\xe3\x83\xbc\xe3\x81\xb8\xe6\x88\xbb\xe3\x82\x8b"
+    b"\xe6\x9c\x89\xe5\x8a\xb9\xe3\x81\xaa\xe6\x9c\x80\xe7\xb5\x82\xe5\x8d\x98\xe8\xaa\x9e\xe3\x82\x92Krux\xe3\x81\xab\xe9"
+    b"\x81\xb8\xe3\x82\x93\xe3\x81\xa7\xe3\x82\x82\xe3\x82\x89\xe3\x81\x84\xe3\x81\x9f\xe3\x81\x84\xe5\xa0\xb4\xe5\x90\x88\xe3\x81\xaf"
+    b"\xe3\x80\x81\xe7\xa9\xba\xe7\x99\xbd\xe3\x81\xae\xe3\x81\xbe\xe3\x81\xbe\xe3\x81\xab\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81"
+    b"\xa0\xe3\x81\x95\xe3\x81\x84\xe3\x82\xab\xe3\x83\xa1\xe3\x83\xa9\xe7\xb5\x8c\xe7\x94\xb1TX\xe3\x83\x94\xe3\x83\xb3\xe3\x82"
+    b"\xa6\xe3\x82\xa9\xe3\x83\xac\xe3\x83\x83\xe3\x83\x88\xe5\x87\xba\xe5\x8a\x9b\xe3\x83\x87\xe3\x82\xa3\xe3\x82\xb9\xe3\x82\xaf\xe3"
+    b"\x83\xaa\xe3\x83\x97\xe3\x82\xbf\xe3\x83\xbc\xe3\x83\x91\xe3\x82\xb9\xe3\x83\xaf\xe3\x83\xbc\xe3\x83\x89\xe8\x87\xaa\xe5\xb7\xb1"
+    b"\xe8\xbb\xa2\xe9\x80\x81\xe3\x81\xbe\xe3\x81\x9f\xe3\x81\xaf\xe5\xa4\x89\xe6\x9b\xb4\xef\xbc\x88%d\xef\xbc\x89:\xe9\x95"
+    b"\xb7\xe3\x81\x95:\xe3\x82\xb5\xe3\x82\xa4\xe3\x83\xb3\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x81\x8b?"
+)
@@ -19,382 +19,383 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-# pylint: disable=C0301
-translation_array = [
-    "수량: %",
-    "%d의 %d 멀티시그",
-    "%d 부터 %d",
-    "%s 비트",
-    "%s 바이트",
-    "%s 자",
-    "%s 제거되었습니다.",
-    "%s: 로드됨!",
-    "(%s 비트/픽셀)",
-    "(실험적 기능)",
-    "(잔액조회 전용)",
-    "12단어",
-    "24단어",
-    "기본 정보",
-    "계정",
-    "계정 인덱스",
-    "패스프레이즈를 추가하거나 변경하시겠습니까?",
-    "%s 에 필요한 카메라의 추가 엔트로피",
-    "주소",
-    "카메라와 보조 플레이트를 올바르게 정렬하십시오.",
-    "눈부심 방지 모드",
-    "디스플레이",
-    "계속하시겠습니까?",
-    "BGR 색상",
-    "BIP39 니모닉",
-    "뒤로",
-    "메뉴로 돌아가기",
-    "니모닉 백업",
-    "잘못된 서명",
-    "Base64 비밀번호",
-    "Baudrate",
-    "이진수 그리드",
-    "테두리 여백",
-    "밝기",
-    "버튼",
-    "버튼 바운스 방지",
-    "캡처 취소됨",
-    "잔돈",
-    "테마를 변경하고 재부팅하시겠습니까?",
-    "지갑 변경?",
-    "잔돈:",
-    "변경 사항은 종료될때까지 유지됩니다.",
-    "SD카드 확인",
-    "해당 주소가 이 지갑에 속하는지 확인하시겠습니까?",
-    "일치하는 주소가 없는 %d 개를 확인했습니다.",
-    "SD 카드 확인 중…",
-    "탬퍼 체크 코드 확인",
-    "날짜 변환",
-    "변경 주소를 확인할 수 없습니다.",
-    "QR 코드 생성",
-    "문자 메시지로 QR 코드를 만드시겠어요?",
-    "생성됨:",
-    "현재 탬퍼 체크 코드",
-    "사용자 지정 QR 코드",
-    "사용자 텍스트",
-    "사용자 정의",
-    "지갑을 사용자 정의하면 새 키가 생성되고 설명자가 언로드됩니다.",
-    "Cut Depth",
-    "Cut Method",
-    "Datum Tool",
-    "10진수",
-    "복호화하시겠습니까?",
-    "지갑 기본설정",
-    "이 파일 삭제?",
-    "Depth Per Pass",
-    "파생 경로",
-    "BIP85 엔트로피를 유독하시겠습니까?",
-    "디스크립터 주소",
-    "장치 테스트",
-    "디스플레이",
-    "전원을 끄지 마십시오. 완료하는 데 시간이 걸릴 수 있습니다.",
-    "변환 완료",
-    "완료되었습니까?",
-    "이중 니모닉",
-    "드라이버",
-    "비어 있음",
-    "활성화?",
-    "암호화하다",
-    "암호화 후 저장",
-    "암호화된 QR 코드",
-    "암호화된 니모닉을 다음 아이디와 함께 저장했습니다:",
-    "암호화된 니모닉을 저장하지 못했습니다",
-    "암호화",
-    "암호화 모드",
-    "%d개의 BIP39 단어를 입력하십시오.",
-    "6자 이상의 탬퍼 체크 코드를 입력하세요",
-    "BIP39 니모닉의 각 단어를 1에서 2048 사이의 숫자로 입력하십시오.",
-    "BIP39 니모닉의 각 단어를 1에서 800 사이의 16진수 숫자로 입력하십시오.",
-    "BIP39 니모닉의 각 단어를 1에서 4000 사이의 8진수 숫자로 입력하십시오.",
-    "BIP39 니모닉의 각 단어를 입력하십시오.",
-    "사용자 데이터 지우기",
-    "사용자 데이터 삭제 중…",
-    "오류:",
-    "Esc",
-    "파일을 탐색하시겠습니까?",
-    "주소 내보내기",
-    "%s 을 (를) SD 카드로 내보내는 중…",
-    "XPUB 내보내기",
-    "공장 초기 설정",
-    "카메라 엔트로피 수집 실패",
-    "변환 실패",
-    "복호화에 실패했습니다",
-    "로드 실패",
-    "니모닉을 저장하지 못했습니다",
-    "수수료:",
-    "Feed Rate",
-    "파일명",
-    "%s 파일명이 SD카드에 이미 존재합니다.",
-    "카메라의 엔트로피로 플래시를 채우시겠습니까?",
-    "플래시 채우기",
-    "PSBT에서 지문이 설정되지 않았습니다",
-    "플래시 맵",
-    "플래시 도구",
-    "카메라 엔트로피로 가득 찬 플래시",
-    "플루트 직경",
-    "여유 공간:",
-    "저장공간에서 불러오기",
-    "다른 장치에서 데이터 복구가 불가능하도록 SD카드를 완전히 지우십시오",
-    "니모닉 생성",
-    "선택",
-    "엔트로피가 충분합니다",
-    "하드웨어",
-    "헤드 종류",
-    "16진수 공개키:",
-    "16진수",
-    "니모닉 숨기기",
-    "수수료가 높습니다!",
-    "ID",
-    "아이디가 이미 존재합니다",
-    "이 변경 후에도 장치 디스플레이가 작동하지 않으면 5초 후에 이전 설정으로 자동으로 재부팅됩니다.",
-    "인덱스",
-    "Input (%d):",
-    "엔트로피가 충분하지 않습니다!",
-    "유효하지 않은 탬퍼 체크 코드",
-    "주소가 잘못되었습니다",
-    "잘못된 파생 경로",
-    "니모닉 길이가 잘못되었습니다",
-    "지갑이 잘못되었습니다:",
-    "반전",
-    "반전된 색상",
-    "KEF 암호화됨",
-    "키",
-    "키가 제공되지 않았습니다",
-    "Krux 프린터 테스트 QR",
-    "LCD 유형",
-    "언어",
-    "마지막 단어를 Krux가 선택하도록 하려면 비워두십시오",
-    "왼쪽",
-    "길이:",
-    "줄 지연",
-    "줄:",
-    "주소 목록",
-    "니모닉 불러오기",
-    "이대로 불러오기",
-    "주소를 보기위해 신뢰할 수 있는 월렛 디스크립터를 불러오시겠습니까?",
-    "SD카드에서 불러오기",
-    "SD카드에서 불러오시겠습니까?",
-    "카메라로 불러오기",
-    "불러오시겠습니까?",
-    "카메라 로드 중…",
-    "변경 주소 로드 중…",
-    "프린터 로드 중…",
-    "수신 주소 로드 중…",
-    "로드 중…",
-    "언어 설정",
-    "기본 저장소",
-    "중간",
-    "메시지",
-    "메시지:",
-    "미니스크립트",
-    "미러 X 좌표",
-    "서명 파일이 누락되었습니다",
-    "니모닉",
-    "니모닉 XOR",
-    "니모닉과 암호는 유지됩니다.",
-    "수정되었습니다:",
-    "네트워크",
-    "새로운 니모닉",
-    "새로운 펌웨어가 감지되었습니다.",
-    "아니요",
-    "패스프레이즈 없음",
-    "암호에서 ASCII가 아닌 문자가 감지되었습니다. Krux는 다른 지갑이 동일한 키를 파생할 것이라고 보장할 수 없습니다.",
-    "주사위 횟수가 충분하지 않습니다!",
-    "시드문구 순번",
-    "8진수",
-    "기타 형식",
-    "덮어쓰시겠습니까?",
-    "밝기를 전환하는 PAGE",
-    "PBKDF2 iter.",
-    "카메라가 감지할 수 있도록 펀치된 점을 검게 칠하십시오.",
-    "종이 너비",
-    "파트",
-    "N의 파트 M",
-    "파트 사이즈",
-    "패스프레이즈",
-    "비밀번호 길이",
-    "경로 불일치",
-    "패턴이 감지되었습니다!",
-    "저장된 모든 니모닉 및 설정값을 영구적으로 제거하시겠습니까?",
-    "저장",
-    "픽셀 편차 지수:",
-    "일반텍스트 QR",
-    "지갑 출력 디스크립터를 불러오십시오",
-    "침수율",
-    "정책 유형",
-    "엔트로피가 부족합니다!",
-    "출력",
-    "PAGE로 취소.",
-    "모드를 전환하려면 PAGE를 누르세요",
-    "QR 테스트 인쇄",
-    "Tinyseed를 인쇄하시겠습니까?",
-    "QR로 인쇄",
-    "QR로 인쇄하시겠습니까?",
-    "인쇄하시겠습니까?",
-    "프린터",
-    "프린터 드라이버가 설정되지 않았습니다!",
-    "출력중…",
-    "계속하시겠습니까?",
-    "계속하시겠습니까?",
-    "처리 중…",
-    "충분히 사용할 수 없음",
-    "QR 코드",
-    "QR 라벨",
-    "수량",
-    "RX 핀",
-    "종료",
-    "받기",
-    "지역:",
-    "%s을 제거하시겠습니까?",
-    "니모닉 제거",
-    "SD카드에서 펌웨어 파일을 제거하시겠습니까?",
-    "Res. - 형식",
-    "공장 설정을 복원하고 재부팅하시겠습니까?",
-    "결과",
-    "QR 뷰어로 돌아가기",
-    "다시 검토",
-    "스캔된 데이터를 검토하고 필요한 경우 수정하십시오",
-    "오른쪽",
-    "니모닉을 생성하려면 주사위를 최소 %d번 굴리십시오.",
-    "주사위값 분포:",
-    "주사위 횟수:",
-    "180° 회전",
-    "SD카드",
-    "SD카드가 감지되지 않았습니다.",
-    "주사위의 SHA256:",
-    "SHA256 스냅샷:",
-    "QR 이미지를 SD카드에 저장",
-    "SD카드에 저장",
-    "SD카드에 저장하시겠습니까?",
-    "SD카드에 저장됨:",
-    "스케일",
-    "주소 스캔하기",
-    "BIP39 패스프레이즈 스캔하기",
-    "비밀번호 QR 스캔",
-    "1번째부터 12번째 단어를 스캔 중입니다",
-    "13번째부터 24번째 단어를 스캔 중입니다",
-    "화면보호기 시간",
-    "지갑 형식",
-    "보안",
-    "본인주소 전송 또는 잔돈 (%d):",
-    "자가 이체:",
-    "먼저 탬퍼 체크 코드를 설정하세요",
-    "설정",
-    "설정은 플래시에서 내부적으로 저장됩니다.",
-    "SD 카드에 저장된 설정.",
-    "Shannon의 엔트로피:",
-    "대추 표시",
-    "종료",
-    "자동 종료시간",
-    "종료 준비 중…",
-    "서명하기",
-    "QR코드로 내보내기",
-    "SD카드로 내보내기",
-    "서명하시겠습니까?",
-    "서명:",
-    "서명된 메시지",
-    "서명된 PSBT",
-    "원시 해시에 서명합니다. 소스를 신뢰하는 경우에만 진행합니다.",
-    "서명…",
-    "단일서명",
-    "크기:",
-    "일부 검사를 수행할 수 없습니다.",
-    "일부 노드가 경화되지 않습니다:",
-    "Spend (%d):",
-    "지출:",
-    "표준 모드",
-    "Static",
-    "전문가를 위한 통계",
-    "플래시 메모리에 저장",
-    "SD카드에 저장",
-    "강력",
-    "강한",
-    "모드를 변경하려면 화면을 옆으로 쓸어내리세요",
-    "TC Flash Hash",
-    "부팅 시 플래시 탬퍼 확인 해시",
-    "터치하거나 엔터를 눌러 캡처하십시오",
-    "설치하려면 터치하거나 입력하세요.",
-    "TR 내부 키",
-    "TX 핀",
-    "탬퍼 체크 코드",
-    "탬퍼 검사 코드가 성공적으로 설정되었습니다",
-    "탬퍼 검사 코드가 일치하지 않습니다",
-    "테스트 스위트",
-    "테스트 제품군 결과",
-    "Test:",
-    "텍스트",
-    "테마",
-    "Thermal",
-    "데이터 복구가 불가능하도록 장치 전체지우기 기능을 사용하십시오",
-    "밝기 전환",
-    "도구",
-    "터치 민감도",
-    "터치스크린",
-    "더 하시겠습니까?",
-    "BIP39 패스프레이즈 입력",
-    "비밀번호 입력",
-    "실행 취소",
-    "단위",
-    "KEF ID를 업데이트하시겠습니까?",
-    "QR 레이블을 업데이트하시겠습니까?",
-    "업그레이드가 완료되었습니다.",
-    "검은색 배경 화면을 사용하십시오.",
-    "카메라의 엔트로피를 사용하여 새로운 니모닉을 생성하십시오",
-    "현재 수치",
-    "기본 모드를 사용하시겠습니까?",
-    "기본 PBKDF2 반복문을 사용하십시오.?",
-    "지문을 신분증으로 사용하시겠어요?",
-    "이미 사용됨:",
-    "사용자 데이터",
-    "%s는 [%s, %s] 범위를 벗어났습니다",
-    "확인…",
-    "버전",
-    "카메라",
-    "20면체 주사위",
-    "일반 주사위",
-    "직접 입력",
-    "니모닉 단어 입력",
-    "표시 레이블",
-    "캡처될때까지 기다리십시오",
-    "지갑 설정",
-    "지갑 디스크립터",
-    "지갑 불일치:",
-    "지갑 출력 디스크립터",
-    "지갑 출력 디스크립터가 로드되었습니다!",
-    "지갑 출력 디스크립터를 찾을 수 없습니다.",
-    "경고:",
-    "약한",
-    "%d 단어",
-    "단어 번호(1-2048)",
-    "시드문구",
-    "XOR 결과",
-    "XOR With",
-    "다른 XOR 전류 니모닉? (패스프레이즈와 디스크립터가 폐기됩니다)",
-    "예",
-    "확대 모드",
-    "바이너리:",
-    "실패",
-    "16진수부터",
-    "base32에서",
-    "base43에서",
-    "base64에서",
-    "16진수부터",
-    "utf8에서",
-    "는 유효한 주소입니다!",
-    "시프트 케이스",
-    "성공률:",
-    "스와이프",
-    "텍스트:",
-    "16진수로",
-    "base32로",
-    "to base43",
-    "base64로",
-    "16진수로",
-    "utf8로",
-    "알 수 없음",
-    "첫 번째 %d개의 주소에서 찾을 수 없습니다",
-]
+# pylint: disable=C0103,C0301
+catalog = (
+    b"i\x01\xb6\x11\x16\x00l\xfa\xa6\x02[\xa8b\x04\xb6\x8b\xef\x07B{d\x08\xb7\x06\xff\x08\nf\x00\n(\x1f"
+    b'\x16\x0c\xbcI\xdb\r\xbfN\x02\x0epi"\x0e\xff#)\x0e\x88\x1f\xe1\x0ef\x97\xa1\x0f\x8b\xea5\x11\x8ar'
+    b"H\x11%\xc4\xc6\x14k\xd8\xe0\x14\xefy\xca\x16j\xc7\xd9\x16GG.\x17\x05\xd5R\x17\xeal\xf3\x17}\xca"
+    b"\xe8\x18\x81\xd3*\x19\xbba\xc5\x19\xe0\x94\xdd\x19\x93\xc23\x1ck\xf8<\x1c\xbd\xc3\xd1\x1dk\x96O\x1fhW"
+    b'\xae\x1f\xeat\x9b!\xf2\xb1\x1d"\x00\xb9/#\xf4\xb7\xec#k\xd7\xb4$\x13\t\xea$\xf1\xf7(&\xe9~'
+    b"\xaf&`Rp(\xfa\x1c*)\xa8\xdaL)|\xb9\xb7)j\x91\\*\x93gx*\xeb\xf5\xea*s\xf1"
+    b';+"\xd6r+\xf4\x85t-\x80\n\x87-\xe3\x13\xad-J\x9f\xea-\x9d.\x93.\xb80\xc4.uU'
+    b"\x8b/\x7f\x0b\xb5/\x8e\x83\xcf/g\xd4\xb80n\xea\xf30\x12Ec1\x99\x1bi1\xef|73\x14\x15"
+    b"\xe83\xe5\x91o4\x86|\xea4\x1f\xaf\xfd4\xc9\xa3\xaa5\xbd\xca\xd85Z'S6\x02\xcb^6\xd5\x91"
+    b"\xb36\x16\x19\x087\xfc?[7\xd84\xf69\x89\x0fZ:\x81\xa9[;|\x91\xec;\x97\xb7\xed<\x95e"
+    b"7>\x1e\xd1\xfd>\xc0>L?\xfd\x91\x1f@x}=@\x87j\x8dA\x84>\x96A\x05H\xb2A\xed\xf2"
+    b"\xc7Aq@\xf1B\xcc\x14BC\xdf~.D\xba\x16\x8bEhY\x0cF\xae\xc3,F\x11r?F\x90\xb9"
+    b"\xa5F\x1a\xcd\xccF\x1c\n7G\xee\x08nG\x16\xfb\xfbG\x8fbzI30\xc0I\xf9\xd4'Jc\xed"
+    b"\xc8J?\xad&K`D\xd1Kg`\x16MIs\xaaM\x8f\xe6\x15Na\xdcLP\x9b\x94\xe9Q\x12@"
+    b"\x88RJ\xde\xd6S8\xa4\xc0U?\x9c\x05V\x0c\xc8\xb4VB\x9dPW\x9c\x07\x01Xd\xe9\x83X\x87L"
+    b"\x97Y\xe8\xcc&Z\xa0[\xcf\\q\xd7\x08^\t\x84]^\x0c\x01k^\x1c;\xa3b[\xb9\xdab*\xfe"
+    b'\x13c\xb9\x993cd\n\xfdcY"\xa2d\x8d?\xf2dy\x96\x1de\x9d\x9e\x8de2\x8e\x00f\xc5\x1b'
+    b"\x18f`t\x85fY\xcftg\xcd8\xd1g\xed\xd1\njM\x865j\xa4.Kj\x13]\xd1j\x0bT"
+    b"\xa6k\xe8{}l\x94\xbc\xd4l0\x11\xe0m?\xfb*n]\x8eRn\x08{Xo\xb9m\x87o\xde\xd6"
+    b"\xcfom\x14@p_\xea\xa1p\xc3\x99\xd8p\xa8\x93)q\x8dirs0\x13\x16t\x8b\xf3 t\xe7\r"
+    b"5t\xe8\xda\xcat\x10Z\x0bu\xd9\xd4\x84v9\xab\xf4wYQ_xZ\x9b\xf9x\xe3\t\x00y\x08\xc8"
+    b"#yw\xde|yq\xdf\xfcy4\xd9\xe0z\xac\x11e{)\x97\xc4{m\xa3\x89|?\x0e\xf2\x80\x00\x1e"
+    b"i\x81\xa6Z\xc0\x81u\xc6W\x82\x0c\x11r\x85\xa2\xcb6\x86j\x8f~\x86\x80\xb1\x83\x86\xffY\x98\x86\xbe\xf6"
+    b"W\x87\xc3\x10\xfb\x87\xbc\x93\xb9\x88\xdf\xde\xe9\x88\xf2\xaf\x9f\x8a\xb6\xd1\x9f\x8a)\xbcE\x8b\x7f\x00\xc2\x8b*\xbc"
+    b"\xe1\x8ca\x90\x04\x8d\x89Q;\x8d\xdd\x8e2\x8f\xbf\xc3D\x90\x95\x8e}\x91\x0f$\x83\x93D\xa7\xff\x94\xb1\x8b"
+    b"#\x95\x0f\x8a@\x95\x1flE\x95n7#\x963\xd5+\x96Rv\x13\x99J\xc7\xaa\x99\xdb\xd0\xd0\x99&\x1f"
+    b"\x1d\x9a\x03 5\x9a\xa2]\xb1\x9aO?\x11\x9b\xf9\x08\xb9\x9b-\xcb\x9f\x9d\xfa\x03\x04\x9fp}?\x9f\xd0\x8b"
+    b"p\x9fw+i\xa0D\xde\x87\xa0\xad\x08\xce\xa0y\xe5\xf1\xa0\x9a\xfe\x03\xa1\xbfX\xe0\xa2.\xc5\x1b\xa3\x12\xe1"
+    b"\x1b\xa3V\xd4J\xa3\x0f<\xab\xa3\xee\xa8\xfa\xa3\xaa\x0cJ\xa4\xf0\x84\x8a\xa5\xf8\xe2\x19\xa6\xe4\xa8T\xa6V3"
+    b"y\xa6\x9d\xeb\xe8\xa7\xc3\xc2\xec\xa7\x18\xde \xa8\xc0\x12\x06\xa9P]\x94\xa9\x1ei\xa7\xaaX\xcb\xa8\xabNw"
+    b"\xa9\xabO\xd9\xfb\xac\xc7\xa7&\xadY\xb5'\xaf \xbe9\xaf\xc0ZG\xaf\x0e\xa2\x9a\xaf\x881\xbc\xb0\x12s"
+    b"\xf0\xb0d\xa3\x8b\xb1\x8e7\x16\xb28o\x8b\xb2I\xed\xdd\xb2O4\x88\xb3\xdd\xe6\x05\xb5\xfd\xe52\xb5\xfb\x95"
+    b"\x9d\xb5e\xf3#\xb8\xae\x87>\xb8]\x1f\x92\xb9\x07\x86\xf0\xb9\x163\r\xbbS;\xc3\xbeE\xb4\xa1\xbfh\xae"
+    b"\xd0\xbf\xb4\xbb?\xc1z\xa1\x92\xc1\xc3\xd2\xa4\xc1\x81@\xdf\xc1\xd5\xa5q\xc2;b\x95\xc2\x1dV\xf3\xc2\xa5V"
+    b"\xf8\xc2?Kl\xc3\xcc\xd3\xe8\xc4\xe8\x955\xc53\x8b}\xc5\xa4]U\xc6\x89\x87\x86\xc6\x0e\xc6\xda\xc6\xba\x81"
+    b'\xff\xc6\x97\xd5\x0c\xc7dW\x97\xc7B\xb6\xb7\xc9T\x8e<\xcb\x14\xb8\x97\xcc"^\x06\xcd\x92%)\xcd\x7f\x8a'
+    b"[\xcd\tn\xfc\xcd\x16ig\xd1\xe7\xa7z\xd1\xad\xf3\xd5\xd1\x83\x1d\x82\xd2\xed\xad\x89\xd3d\x00)\xd4v\x16"
+    b"L\xd4Z8a\xd4\xd0\xc2\x89\xd5\xbf\n\xb5\xd5k\x1b+\xd6\x92\xba\x11\xd8\\\x9d\x19\xd8O4\xa9\xd8\xcb\xf9"
+    b"\xeb\xd9VHU\xda\xbc]\xde\xda\x03Y\xf1\xda\x89^O\xdb\xa9\xe9Y\xdb0\x00\xa0\xdb\x99w@\xdeRI"
+    b"\xe6\xdeR\xdc\x10\xdf\xe9G<\xdf\xc23~\xdfg\xe9\x80\xdf\xdc\xdf\xb4\xdf\x95x\x9d\xe0]\xcb\xc3\xe2\x95w"
+    b"\xa3\xe44\xba\xb1\xe4WV\xca\xe4;\x9f@\xe5@\x81\xee\xe5\xb7\x00\x11\xe7I\xd0/\xe8\x87\xc4\xab\xe8\x95\x8f"
+    b"\xae\xe8\xf8\xdf=\xe9\x13!%\xea\xe5\x0c\t\xed\xe0\xdfT\xed/xy\xed/9\x9a\xee\x1c\x8a\xcb\xeej\xe8"
+    b"\xcf\xee\xb5a\x1f\xefb\xabC\xef\x0e\xc4\xaf\xf0\x95)\xb0\xf0\x974-\xf1\xbd\x0c.\xf2)\x9e`\xf31\xd9"
+    b"\xee\xf3\xfa\x95\xfc\xf3\xdc\x97\x06\xf4\tdW\xf4E\x1e\xd1\xf4\xe7`k\xf5\x06\xe8\xa1\xf5\xf1k\xbe\xf5\xd1W"
+    b"a\xf7\xa6Hp\xf7\xe8\xe3'\xf9\xafz\xce\xf9wr\x05\xfcD0I\xfc\xb3`P\xfd^\xee\xa0\xfd\x9d\xa0"
+    b"\xdd\xfe>L?\xff\x00\x00\x00\x00]\x00\x00\x00\x81\x00\x00\x00\x94\x00\x00\x00\xa0\x00\x00\x00\xa6\x00\x00\x00\xb2\x00"
+    b"\x00\x00\xe6\x00\x00\x00\xf1\x00\x00\x00\xfa\x00\x00\x00\x0c\x01\x00\x00'\x01\x00\x00G\x01\x00\x00S\x01\x00\x00]\x01"
+    b"\x00\x00g\x01\x00\x00t\x01\x00\x00z\x01\x00\x00\x83\x01\x00\x00\x8f\x01\x00\x00\xae\x01\x00\x00\xe2\x01\x00\x00\xef\x01"
+    b"\x00\x00\x0e\x02\x00\x00\x17\x02\x00\x002\x02\x00\x00C\x02\x00\x00V\x02\x00\x00\\\x02\x00\x00i\x02\x00\x00\x89\x02"
+    b"\x00\x00\x99\x02\x00\x00\xcd\x02\x00\x00\x07\x03\x00\x00\x14\x03\x00\x00!\x03\x00\x00'\x03\x00\x001\x03\x00\x00>\x03"
+    b"\x00\x00N\x03\x00\x00x\x03\x00\x00\x82\x03\x00\x00\x92\x03\x00\x00\xbf\x03\x00\x00\xe1\x03\x00\x00\xe7\x03\x00\x00\x05\x04"
+    b"\x00\x00\x17\x04\x00\x00\x1d\x04\x00\x00v\x04\x00\x00\x80\x04\x00\x00\x89\x04\x00\x00\x8f\x04\x00\x00\xd6\x04\x00\x00\xea\x04"
+    b"\x00\x00\xf3\x04\x00\x00\xfc\x04\x00\x00,\x05\x00\x002\x05\x00\x00C\x05\x00\x00Q\x05\x00\x00^\x05\x00\x00}\x05"
+    b"\x00\x00\xb0\x05\x00\x00\xc7\x05\x00\x00\xef\x05\x00\x00\n\x06\x00\x00\x11\x06\x00\x00U\x06\x00\x00_\x06\x00\x00i\x06"
+    b"\x00\x00\x83\x06\x00\x00\x96\x06\x00\x00\xac\x06\x00\x00\xbc\x06\x00\x00\xc6\x06\x00\x00\xe6\x06\x00\x003\x07\x00\x00=\x07"
+    b"\x00\x00C\x07\x00\x00S\x07\x00\x00l\x07\x00\x00x\x07\x00\x00\x85\x07\x00\x00\x93\x07\x00\x00\xa8\x07\x00\x00\xb1\x07"
+    b"\x00\x00\xba\x07\x00\x00\xd1\x07\x00\x00\xda\x07\x00\x00\xe7\x07\x00\x00\x17\x08\x00\x00+\x08\x00\x004\x08\x00\x00A\x08"
+    b"\x00\x00Z\x08\x00\x00o\x08\x00\x00\xaa\x08\x00\x00\xcf\x08\x00\x00\xee\x08\x00\x00\xf4\x08\x00\x00\x0e\t\x00\x00$\t"
+    b"\x00\x00:\t\x00\x00L\t\x00\x00S\t\x00\x00f\t\x00\x00s\t\x00\x00v\t\x00\x00~\t\x00\x00\x99\t"
+    b"\x00\x00\xc2\t\x00\x00\xf0\t\x00\x00\x00\n\x00\x00\x12\n\x00\x009\n\x00\x00?\n\x00\x00L\n\x00\x00\\\n"
+    b"\x00\x00h\n\x00\x00t\n\x00\x00{\n\x00\x00\xb7\n\x00\x00\xbe\n\x00\x00\xf1\n\x00\x00\xfe\n\x00\x00\x0b\x0b"
+    b"\x00\x00\x12\x0b\x00\x00Y\x0b\x00\x00f\x0b\x00\x00p\x0b\x00\x00}\x0b\x00\x00\x9b\x0b\x00\x00\xa9\x0b\x00\x00\xbb\x0b"
+    b"\x00\x00\xcc\x0b\x00\x00\xe2\x0b\x00\x00\xe8\x0b\x00\x00\xf1\x0b\x00\x00\x04\x0c\x00\x00\x17\x0c\x00\x008\x0c\x00\x00>\x0c"
+    b"\x00\x00K\x0c\x00\x00f\x0c\x00\x00\x97\x0c\x00\x00\x9d\x0c\x00\x00\xaa\x0c\x00\x00\xb3\x0c\x00\x00\xfb\x0c\x00\x00\x05\r"
+    b"\x00\x00e\r\x00\x00\x9d\r\x00\x00\xb0\r\x00\x00\xb6\r\x00\x00\xd5\r\x00\x00\x08\x0e\x00\x00!\x0e\x00\x008\x0e"
+    b"\x00\x00A\x0e\x00\x00N\x0e\x00\x00f\x0e\x00\x00o\x0e\x00\x00\x82\x0e\x00\x00\xae\x0e\x00\x00\xb5\x0e\x00\x00\xcb\x0e"
+    b"\x00\x00\xd4\x0e\x00\x00\xe0\x0e\x00\x00\xf7\x0e\x00\x00\n\x0f\x00\x00\x1d\x0f\x00\x00-\x0f\x00\x00:\x0f\x00\x00@\x0f"
+    b"\x00\x00R\x0f\x00\x00p\x0f\x00\x00t\x0f\x00\x00\xa2\x0f\x00\x00\xb1\x0f\x00\x00\xbe\x0f\x00\x00\x1d\x10\x00\x00-\x10"
+    b"\x00\x00\x87\x10\x00\x00\x94\x10\x00\x00\xa0\x10\x00\x00\xb8\x10\x00\x00\xce\x10\x00\x00\xe7\x10\x00\x00\x1d\x11\x00\x001\x11"
+    b"\x00\x00]\x11\x00\x00c\x11\x00\x00\x9d\x11\x00\x00\xb3\x11\x00\x00\x06\x12\x00\x00\\\x12\x00\x00\x85\x12\x00\x00\x1f\x13"
+    b"\x00\x00X\x13\x00\x00d\x13\x00\x00l\x13\x00\x00\x91\x13\x00\x00\xc0\x13\x00\x00\xc6\x13\x00\x00\xd9\x13\x00\x00\xee\x13"
+    b"\x00\x00\x07\x14\x00\x00&\x14\x00\x00]\x14\x00\x00h\x14\x00\x00x\x14\x00\x00\x81\x14\x00\x00\x87\x14\x00\x00\x8d\x14"
+    b"\x00\x00\x94\x14\x00\x00\xc2\x14\x00\x00\xca\x14\x00\x00\xe1\x14\x00\x00\xe7\x14\x00\x00\xf4\x14\x00\x00\x02\x15\x00\x00\x19\x15"
+    b"\x00\x00N\x15\x00\x00w\x15\x00\x00\x7f\x15\x00\x00\x8c\x15\x00\x00\xa8\x15\x00\x00\xb8\x15\x00\x00\xc8\x15\x00\x00\xf1\x15"
+    b"\x00\x00\xff\x15\x00\x00\x11\x16\x00\x00!\x16\x00\x00.\x16\x00\x00D\x16\x00\x00Q\x16\x00\x00X\x16\x00\x00\x83\x16"
+    b"\x00\x00\x9b\x16\x00\x00\xbe\x16\x00\x00\xed\x16\x00\x00\xfb\x16\x00\x00\n\x17\x00\x00\x16\x17\x00\x00E\x17\x00\x00n\x17"
+    b"\x00\x00z\x17\x00\x00\xb0\x17\x00\x00\xbf\x17\x00\x00\xcc\x17\x00\x00\xd2\x17\x00\x00\xd5\x17\x00\x00\xdb\x17\x00\x00\xee\x17"
+    b"\x00\x00C\x18\x00\x00Z\x18\x00\x00m\x18\x00\x00\x86\x18\x00\x00\x95\x18\x00\x00\xda\x18\x00\x00\xea\x18\x00\x00\xf7\x18"
+    b"\x00\x00\x04\x19\x00\x00\x14\x19\x00\x00\x1f\x19\x00\x00.\x19\x00\x00V\x19\x00\x00\\\x19\x00\x00u\x19\x00\x00\x98\x19"
+    b"\x00\x00\x9e\x19\x00\x00\xb2\x19\x00\x00\xc1\x19\x00\x00\xde\x19\x00\x00\x08\x1a\x00\x00\x11\x1a\x00\x00\x97\x1a\x00\x00\xb0\x1a"
+    b"\x00\x00\xc1\x1a\x00\x00\xc7\x1a\x00\x00\xe0\x1a\x00\x00\xf2\x1a\x00\x00\xff\x1a\x00\x00\x10\x1b\x00\x00\x1c\x1b\x00\x00[\x1b"
+    b"\x00\x00j\x1b\x00\x00v\x1b\x00\x00|\x1b\x00\x00\x96\x1b\x00\x00\xd6\x1b\x00\x00-\x1c\x00\x00R\x1c\x00\x00b\x1c"
+    b"\x00\x00r\x1c\x00\x00\xa5\x1c\x00\x00\xb8\x1c\x00\x00\xcc\x1c\x00\x00\xdc\x1c\x00\x00\xf5\x1c\x00\x00!\x1d\x00\x00>\x1d"
+    b"\x00\x00k\x1d\x00\x00~\x1d\x00\x00\x84\x1d\x00\x00\x92\x1d\x00\x00\x98\x1d\x00\x00\xd5\x1d\x00\x00\xe1\x1d\x00\x00\xf1\x1d"
+    b"\x00\x00F\x1e\x00\x00e\x1e\x00\x00z\x1e\x00\x00\x8a\x1e\x00\x00\xa5\x1e\x00\x00\xb2\x1e\x00\x00\xc0\x1e\x00\x00\xc7\x1e"
+    b"\x00\x00\xda\x1e\x00\x00\xf5\x1e\x00\x00\x0b\x1f\x00\x00.\x1f\x00\x007\x1f\x00\x00F\x1f\x00\x00`\x1f\x00\x00\xb2\x1f"
+    b"\x00\x00\xe9\x1f\x00\x00\xfc\x1f\x00\x00\x02 \x00\x00( \x00\x000 \x00\x00D \x00\x00W \x00\x00\x82 "
+    b"\x00\x00\xb6 \x00\x00\xe7 \x00\x00\xfe \x00\x00>!\x00\x00T!\x00\x00y!\x00\x00\xd6!\x00\x00\xdf!"
+    b'\x00\x00\xe8!\x00\x00\x16"\x00\x00?"\x00\x00O"\x00\x00}"\x00\x00\x89"\x00\x00\x9c"\x00\x00\xcd"'
+    b'\x00\x00\xd3"\x00\x00\xe3"\x00\x00\xf9"\x00\x00A#\x00\x00J#\x00\x00P#\x00\x00m#\x00\x00\x7f#'
+    b"\x00\x00\xa6#\x00\x00\xad#\x00\x00\xc6#\x00\x00BIP39 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x98"
+    b" \xea\xb0\x81 \xeb\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc 1\xec\x97\x90\xec\x84\x9c 4000 \xec\x82\xac\xec"
+    b"\x9d\xb4\xec\x9d\x98 8\xec\xa7\x84\xec\x88\x98 \xec\x88\xab\xec\x9e\x90\xeb\xa1\x9c \xec\x9e\x85\xeb\xa0\xa5\xed\x95"
+    b"\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4.\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc \xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94"
+    b"\xbc \xec\x88\x98\xec\xa7\x91 \xec\x8b\xa4\xed\x8c\xa8\xec\x83\x88\xeb\xa1\x9c\xec\x9a\xb4 \xeb\x8b\x88\xeb\xaa\xa8\xeb"
+    b"\x8b\x89\xed\x95\x98\xeb\x93\x9c\xec\x9b\xa8\xec\x96\xb4\xec\xa0\x80\xec\x9e\xa5QR\xeb\xa1\x9c \xec\x9d\xb8\xec\x87\x84"
+    b"\xeb\xac\xb8\xec\x9e\x90 \xeb\xa9\x94\xec\x8b\x9c\xec\xa7\x80\xeb\xa1\x9c QR \xec\xbd\x94\xeb\x93\x9c\xeb\xa5\xbc"
+    b" \xeb\xa7\x8c\xeb\x93\x9c\xec\x8b\x9c\xea\xb2\xa0\xec\x96\xb4\xec\x9a\x94?16\xec\xa7\x84\xec\x88\x98\xeb\xa1\x9c\xec"
+    b"\x88\x98\xeb\x9f\x89: %\xeb\xaf\xb8\xeb\x8b\x88\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x8a\xb8SD\xec\xb9\xb4\xeb"
+    b"\x93\x9c\xec\x97\x90\xec\x84\x9c \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xea\xb8\xb0\xec\xa7\x80\xea\xb0\x91\xec\x9d\xb4 \xec"
+    b"\x9e\x98\xeb\xaa\xbb\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4:\xeb\xb2\xa4\xec\xb9\x98\xeb\xa7\x88\xed\x81"
+    b"\xac\xec\x88\x98\xec\x88\x98\xeb\xa3\x8c:\xed\x85\x8d\xec\x8a\xa4\xed\x8a\xb8:\xec\xa7\x80\xea\xb0\x91 \xed\x98\x95\xec"
+    b"\x8b\x9d\xea\xb2\xb0\xea\xb3\xbc\xec\x95\x94\xed\x98\xb8\xed\x99\x94\xeb\x93\x9c\xeb\x9d\xbc\xec\x9d\xb4\xeb\xb2\x84\xeb\xb3\xb5"
+    b"\xed\x98\xb8\xed\x99\x94\xec\x97\x90 \xec\x8b\xa4\xed\x8c\xa8\xed\x96\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4\xeb\xb3\x80\xea"
+    b"\xb2\xbd \xec\x82\xac\xed\x95\xad\xec\x9d\x80 \xec\xa2\x85\xeb\xa3\x8c\xeb\x90\xa0\xeb\x95\x8c\xea\xb9\x8c\xec\xa7\x80 "
+    b"\xec\x9c\xa0\xec\xa7\x80\xeb\x90\xa9\xeb\x8b\x88\xeb\x8b\xa4.\xea\xb8\xb0\xed\x83\x80 \xed\x98\x95\xec\x8b\x9dBIP"
+    b"39 \xed\x8c\xa8\xec\x8a\xa4\xed\x94\x84\xeb\xa0\x88\xec\x9d\xb4\xec\xa6\x88 \xec\x9e\x85\xeb\xa0\xa5%s \xeb"
+    b"\xb9\x84\xed\x8a\xb8\xed\x83\xac\xed\x8d\xbc \xec\xb2\xb4\xed\x81\xac \xec\xbd\x94\xeb\x93\x9c \xed\x99\x95\xec\x9d\xb8"
+    b"\xec\xa3\xbc\xec\x82\xac\xec\x9c\x84 \xed\x9a\x9f\xec\x88\x98:\xeb\xb9\x84\xeb\xb0\x80\xeb\xb2\x88\xed\x98\xb8 \xea\xb8"
+    b"\xb8\xec\x9d\xb4\xec\x84\xa4\xec\xa0\x95\xec\xa0\x95\xec\xb1\x85 \xec\x9c\xa0\xed\x98\x95\xed\x8c\xa8\xed\x84\xb4\xec\x9d\xb4"
+    b" \xea\xb0\x90\xec\xa7\x80\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4!\xec\x9d\xbc\xeb\xb0\x98 \xec\xa3"
+    b"\xbc\xec\x82\xac\xec\x9c\x84BIP39 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x98 \xea\xb0\x81 \xeb\x8b"
+    b"\xa8\xec\x96\xb4\xeb\xa5\xbc \xec\x9e\x85\xeb\xa0\xa5\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4.\xec\x84\xa4\xec\xa0"
+    b"\x95\xec\x9d\x80 \xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c\xec\x97\x90\xec\x84\x9c \xeb\x82\xb4\xeb\xb6\x80\xec\xa0\x81\xec\x9c"
+    b"\xbc\xeb\xa1\x9c \xec\xa0\x80\xec\x9e\xa5\xeb\x90\xa9\xeb\x8b\x88\xeb\x8b\xa4.\xeb\xb3\x80\xed\x99\x98 \xec\x8b\xa4\xed"
+    b"\x8c\xa8\xec\xa7\x81\xec\xa0\x91 \xec\x9e\x85\xeb\xa0\xa5\xec\x84\xa0\xed\x83\x9d\xec\x84\xb1\xea\xb3\xb5\xeb\xa5\xa0:\xed"
+    b"\x99\x95\xeb\x8c\x80 \xeb\xaa\xa8\xeb\x93\x9c\xeb\xb0\x98\xec\xa0\x84\xeb\x90\x9c \xec\x83\x89\xec\x83\x81\xec\x97\x94\xed"
+    b"\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc\xea\xb0\x80 \xec\xb6\xa9\xeb\xb6\x84\xed\x95\x98\xec\xa7\x80 \xec\x95\x8a\xec\x8a\xb5\xeb"
+    b"\x8b\x88\xeb\x8b\xa4!\xec\x83\x9d\xec\x84\xb1\xeb\x90\xa8:\xec\x9d\xb4\xec\xa4\x91 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89"
+    b"%s \xec\x9d\x84 (\xeb\xa5\xbc) SD \xec\xb9\xb4\xeb\x93\x9c\xeb\xa1\x9c \xeb\x82\xb4\xeb\xb3\xb4"
+    b"\xeb\x82\xb4\xeb\x8a\x94 \xec\xa4\x91\xe2\x80\xa6QR \xec\x9d\xb4\xeb\xaf\xb8\xec\xa7\x80\xeb\xa5\xbc SD\xec"
+    b"\xb9\xb4\xeb\x93\x9c\xec\x97\x90 \xec\xa0\x80\xec\x9e\xa5RX \xed\x95\x80SD \xec\xb9\xb4\xeb\x93\x9c\xec\x97"
+    b"\x90 \xec\xa0\x80\xec\x9e\xa5\xeb\x90\x9c \xec\x84\xa4\xec\xa0\x95.SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90 \xec"
+    b"\xa0\x80\xec\x9e\xa5\xeb\x8f\x84\xea\xb5\xac\xec\xa7\x80\xea\xb0\x91\xec\x9d\x84 \xec\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xec"
+    b"\xa0\x95\xec\x9d\x98\xed\x95\x98\xeb\xa9\xb4 \xec\x83\x88 \xed\x82\xa4\xea\xb0\x80 \xec\x83\x9d\xec\x84\xb1\xeb\x90\x98"
+    b"\xea\xb3\xa0 \xec\x84\xa4\xeb\xaa\x85\xec\x9e\x90\xea\xb0\x80 \xec\x96\xb8\xeb\xa1\x9c\xeb\x93\x9c\xeb\x90\xa9\xeb\x8b\x88"
+    b"\xeb\x8b\xa4.\xeb\xa9\x94\xec\x8b\x9c\xec\xa7\x80:\xec\x8a\xa4\xec\xbc\x80\xec\x9d\xbc\xec\x96\xb8\xec\x96\xb4\xeb\x8b\x88"
+    b"\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x84 \xec\x83\x9d\xec\x84\xb1\xed\x95\x98\xeb\xa0\xa4\xeb\xa9\xb4 \xec\xa3\xbc\xec\x82\xac"
+    b"\xec\x9c\x84\xeb\xa5\xbc \xec\xb5\x9c\xec\x86\x8c %d\xeb\xb2\x88 \xea\xb5\xb4\xeb\xa6\xac\xec\x8b\xad\xec\x8b\x9c"
+    b"\xec\x98\xa4.\xec\xa2\x85\xeb\xa3\x8c \xec\xa4\x80\xeb\xb9\x84 \xec\xa4\x91\xe2\x80\xa6\xec\xb9\xa8\xec\x88\x98\xec\x9c"
+    b"\xa8%d \xeb\x8b\xa8\xec\x96\xb4\xec\x84\xa4\xec\xb9\x98\xed\x95\x98\xeb\xa0\xa4\xeb\xa9\xb4 \xed\x84\xb0\xec\xb9\x98"
+    b"\xed\x95\x98\xea\xb1\xb0\xeb\x82\x98 \xec\x9e\x85\xeb\xa0\xa5\xed\x95\x98\xec\x84\xb8\xec\x9a\x94.\xea\xb0\x95\xeb\xa0\xa5"
+    b"SHA256 \xec\x8a\xa4\xeb\x83\x85\xec\x83\xb7:16\xec\xa7\x84\xec\x88\x98\xeb\xb6\x80\xed\x84\xb0\xed"
+    b"\x94\x8c\xeb\x9e\x98\xec\x8b\x9c \xeb\xa7\xb5QR\xeb\xa1\x9c \xec\x9d\xb8\xec\x87\x84\xed\x95\x98\xec\x8b\x9c\xea\xb2"
+    b"\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?%s \xed\x8c\x8c\xec\x9d\xbc\xeb\xaa\x85\xec\x9d\xb4 SD\xec\xb9\xb4"
+    b"\xeb\x93\x9c\xec\x97\x90 \xec\x9d\xb4\xeb\xaf\xb8 \xec\xa1\xb4\xec\x9e\xac\xed\x95\xa9\xeb\x8b\x88\xeb\x8b\xa4.\xec\x9e"
+    b"\x98\xeb\xaa\xbb\xeb\x90\x9c \xed\x8c\x8c\xec\x83\x9d \xea\xb2\xbd\xeb\xa1\x9cSD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90"
+    b"\xec\x84\x9c \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xeb\xb0\x9d"
+    b"\xea\xb8\xb0\xeb\xa5\xbc \xec\xa0\x84\xed\x99\x98\xed\x95\x98\xeb\x8a\x94 PAGE\xec\x98\xa4\xeb\xa5\x98:\xec"
+    b"\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc\xec\x99\x80 \xeb\xb3\xb4\xec\xa1\xb0 \xed\x94\x8c\xeb\xa0\x88\xec\x9d\xb4\xed\x8a\xb8\xeb"
+    b"\xa5\xbc \xec\x98\xac\xeb\xb0\x94\xeb\xa5\xb4\xea\xb2\x8c \xec\xa0\x95\xeb\xa0\xac\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec"
+    b"\x98\xa4.XOR \xea\xb2\xb0\xea\xb3\xbcLCD \xec\x9c\xa0\xed\x98\x95\xed\x85\x8c\xec\x8a\xa4\xed\x8a\xb8"
+    b" \xec\xa0\x9c\xed\x92\x88\xea\xb5\xb0 \xea\xb2\xb0\xea\xb3\xbc\xec\x8b\x9c\xed\x94\x84\xed\x8a\xb8 \xec\xbc\x80\xec\x9d"
+    b"\xb4\xec\x8a\xa4\xeb\xb9\x84\xeb\xb0\x80\xeb\xb2\x88\xed\x98\xb8 QR \xec\x8a\xa4\xec\xba\x94\xed\x85\x8c\xeb\x91\x90"
+    b"\xeb\xa6\xac \xec\x97\xac\xeb\xb0\xb1\xec\xa4\x84 \xec\xa7\x80\xec\x97\xb0\xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc"
+    b"\xea\xb0\x80 \xeb\xb6\x80\xec\xa1\xb1\xed\x95\xa9\xeb\x8b\x88\xeb\x8b\xa4!\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc\xea\xb0\x80"
+    b" \xea\xb0\x90\xec\xa7\x80\xed\x95\xa0 \xec\x88\x98 \xec\x9e\x88\xeb\x8f\x84\xeb\xa1\x9d \xed\x8e\x80\xec\xb9\x98\xeb"
+    b"\x90\x9c \xec\xa0\x90\xec\x9d\x84 \xea\xb2\x80\xea\xb2\x8c \xec\xb9\xa0\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4"
+    b".utf8\xec\x97\x90\xec\x84\x9c\xeb\xb3\xb4\xec\x95\x88\xea\xb3\x84\xec\xa0\x95 \xec\x9d\xb8\xeb\x8d\xb1\xec\x8a"
+    b"\xa4\xea\xb3\x84\xec\x86\x8d\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xec\x84\x9c\xeb\xaa\x85"
+    b"\xed\x95\x98\xea\xb8\xb0\xed\x91\x9c\xec\xa4\x80 \xeb\xaa\xa8\xeb\x93\x9c\xec\x97\xac\xec\x9c\xa0 \xea\xb3\xb5\xea\xb0\x84"
+    b":(\xec\x9e\x94\xec\x95\xa1\xec\xa1\xb0\xed\x9a\x8c \xec\xa0\x84\xec\x9a\xa9)\xec\x84\x9c\xeb\xaa\x85\xe2\x80\xa6\xec"
+    b"\x9d\xb8\xeb\x8d\xb1\xec\x8a\xa4\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc \xeb\xa1\x9c\xeb\x93\x9c \xec\xa4\x91\xe2\x80\xa6\xed"
+    b"\x94\x84\xeb\xa6\xb0\xed\x84\xb0\xec\x8b\xa4\xed\x96\x89 \xec\xb7\xa8\xec\x86\x8c\xec\xa7\x80\xeb\xac\xb8\xec\x9d\x84 \xec"
+    b"\x8b\xa0\xeb\xb6\x84\xec\xa6\x9d\xec\x9c\xbc\xeb\xa1\x9c \xec\x82\xac\xec\x9a\xa9\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x96"
+    b"\xb4\xec\x9a\x94?\xec\xa3\xbc\xec\x82\xac\xec\x9c\x84\xec\x9d\x98 SHA256:QR \xeb\x9d\xbc\xeb"
+    b"\xb2\xa8\xec\x96\xb8\xec\x96\xb4 \xec\x84\xa4\xec\xa0\x95%s \xec\xa0\x9c\xea\xb1\xb0\xeb\x90\x98\xec\x97\x88\xec\x8a"
+    b"\xb5\xeb\x8b\x88\xeb\x8b\xa4.%d\xec\x9d\x98 %d \xeb\xa9\x80\xed\x8b\xb0\xec\x8b\x9c\xea\xb7\xb8\xec\x9d\xbc"
+    b"\xec\xb9\x98\xed\x95\x98\xeb\x8a\x94 \xec\xa3\xbc\xec\x86\x8c\xea\xb0\x80 \xec\x97\x86\xeb\x8a\x94 %d \xea\xb0"
+    b"\x9c\xeb\xa5\xbc \xed\x99\x95\xec\x9d\xb8\xed\x96\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4.Tinyseed"
+    b"\xeb\xa5\xbc \xec\x9d\xb8\xec\x87\x84\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xec\x97\x94"
+    b"\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc\xea\xb0\x80 \xec\xb6\xa9\xeb\xb6\x84\xed\x95\xa9\xeb\x8b\x88\xeb\x8b\xa4\xec\x9e\x94\xeb"
+    b"\x8f\x88\xec\xa0\x84\xeb\xac\xb8\xea\xb0\x80\xeb\xa5\xbc \xec\x9c\x84\xed\x95\x9c \xed\x86\xb5\xea\xb3\x84\xec\x88\x98\xec"
+    b"\xa0\x95\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4:\xec\x95\x94\xed\x98\xb8\xed\x99\x94\xeb\x90\x9c Q"
+    b"R \xec\xbd\x94\xeb\x93\x9c20\xeb\xa9\xb4\xec\xb2\xb4 \xec\xa3\xbc\xec\x82\xac\xec\x9c\x84\xec\xa7\x80\xec\xb6\x9c"
+    b":\xec\xa7\x80\xea\xb0\x91 \xea\xb8\xb0\xeb\xb3\xb8\xec\x84\xa4\xec\xa0\x95N\xec\x9d\x98 \xed\x8c\x8c\xed\x8a\xb8 "
+    b"M\xec\x98\x8824\xeb\x8b\xa8\xec\x96\xb4\xed\x98\x84\xec\x9e\xac \xed\x83\xac\xed\x8d\xbc \xec\xb2\xb4\xed\x81\xac"
+    b" \xec\xbd\x94\xeb\x93\x9cKEF ID\xeb\xa5\xbc \xec\x97\x85\xeb\x8d\xb0\xec\x9d\xb4\xed\x8a\xb8\xed\x95\x98"
+    b"\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc \xec\x97\x94\xed\x8a\xb8"
+    b"\xeb\xa1\x9c\xed\x94\xbc\xeb\xa1\x9c \xea\xb0\x80\xeb\x93\x9d \xec\xb0\xac \xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c\xed\x94"
+    b"\x8c\xeb\xa3\xa8\xed\x8a\xb8 \xec\xa7\x81\xea\xb2\xbd\xec\x9d\xb4 \xed\x8c\x8c\xec\x9d\xbc \xec\x82\xad\xec\xa0\x9c?"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xea\xb3\xbc \xec\x95\x94\xed\x98\xb8\xeb\x8a\x94 \xec\x9c\xa0\xec\xa7\x80\xeb\x90\xa9"
+    b"\xeb\x8b\x88\xeb\x8b\xa4.\xed\x85\x8c\xeb\xa7\x88\xeb\x82\xa0\xec\xa7\x9c \xeb\xb3\x80\xed\x99\x98\xeb\x8b\x88\xeb\xaa\xa8"
+    b"\xeb\x8b\x89 \xec\xa0\x9c\xea\xb1\xb0base64\xec\x97\x90\xec\x84\x9c%d \xeb\xb6\x80\xed\x84\xb0 "
+    b"%d\xec\x84\x9c\xeb\xaa\x85:SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90\xec\x84\x9c \xed\x8e\x8c\xec\x9b\xa8\xec\x96"
+    b"\xb4 \xed\x8c\x8c\xec\x9d\xbc\xec\x9d\x84 \xec\xa0\x9c\xea\xb1\xb0\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b"
+    b"\x88\xea\xb9\x8c?8\xec\xa7\x84\xec\x88\x98\xed\x85\x8c\xeb\xa7\x88\xeb\xa5\xbc \xeb\xb3\x80\xea\xb2\xbd\xed\x95\x98\xea"
+    b"\xb3\xa0 \xec\x9e\xac\xeb\xb6\x80\xed\x8c\x85\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xeb"
+    b"\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 XOR\xed\x98\x84\xec\x9e\xac \xec\x88\x98\xec\xb9\x98\xec\xa7\x80\xec\x97\xad:"
+    b"\xec\x8a\xa4\xec\xba\x94\xeb\x90\x9c \xeb\x8d\xb0\xec\x9d\xb4\xed\x84\xb0\xeb\xa5\xbc \xea\xb2\x80\xed\x86\xa0\xed\x95\x98"
+    b"\xea\xb3\xa0 \xed\x95\x84\xec\x9a\x94\xed\x95\x9c \xea\xb2\xbd\xec\x9a\xb0 \xec\x88\x98\xec\xa0\x95\xed\x95\x98\xec\x8b"
+    b"\xad\xec\x8b\x9c\xec\x98\xa4\xeb\xb3\x80\xed\x99\x98 \xec\x99\x84\xeb\xa3\x8c\xed\x99\x9c\xec\x84\xb1\xed\x99\x94?\xeb\xb0"
+    b"\x94\xec\x9d\xb4\xeb\x84\x88\xeb\xa6\xac:\xec\xb6\xa9\xeb\xb6\x84\xed\x9e\x88 \xec\x82\xac\xec\x9a\xa9\xed\x95\xa0 \xec"
+    b"\x88\x98 \xec\x97\x86\xec\x9d\x8c%s: \xeb\xa1\x9c\xeb\x93\x9c\xeb\x90\xa8!\xec\x9d\xbc\xeb\xb0\x98\xed\x85\x8d"
+    b"\xec\x8a\xa4\xed\x8a\xb8 QRXPUB \xeb\x82\xb4\xeb\xb3\xb4\xeb\x82\xb4\xea\xb8\xb0\xeb\x94\x94\xec\x8a\xa4"
+    b"\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0 \xec\xa3\xbc\xec\x86\x8c\xec\x88\x98\xeb\x9f\x89base32\xeb\xa1\x9c\xec"
+    b"\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xed\x85\x8d\xec\x8a\xa4\xed\x8a\xb8\xed\x85\x8c\xec\x8a\xa4\xed\x8a\xb8 \xec\x8a\xa4\xec"
+    b"\x9c\x84\xed\x8a\xb8\xec\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xeb\x8d\xb0\xec\x9d\xb4\xed\x84\xb0 \xec\x82\xad\xec\xa0\x9c "
+    b"\xec\xa4\x91\xe2\x80\xa6\xec\xb6\x9c\xeb\xa0\xa5\xec\xa3\xbc\xec\x86\x8c \xeb\xaa\xa9\xeb\xa1\x9d\xeb\xb3\x80\xea\xb2\xbd "
+    b"\xec\xa3\xbc\xec\x86\x8c \xeb\xa1\x9c\xeb\x93\x9c \xec\xa4\x91\xe2\x80\xa6\xed\x83\xac\xed\x8d\xbc \xea\xb2\x80\xec\x82"
+    b"\xac \xec\xbd\x94\xeb\x93\x9c\xea\xb0\x80 \xec\x9d\xbc\xec\xb9\x98\xed\x95\x98\xec\xa7\x80 \xec\x95\x8a\xec\x8a\xb5\xeb"
+    b"\x8b\x88\xeb\x8b\xa4\xec\xa2\x85\xeb\xa3\x8c\xeb\x8c\x80\xec\xb6\x94 \xed\x91\x9c\xec\x8b\x9cQR \xec\xbd\x94\xeb\x93"
+    b"\x9c\xec\x95\x94\xed\x98\xb8\xed\x99\x94\xeb\x90\x9c \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x84 \xeb\x8b\xa4\xec\x9d"
+    b"\x8c \xec\x95\x84\xec\x9d\xb4\xeb\x94\x94\xec\x99\x80 \xed\x95\xa8\xea\xbb\x98 \xec\xa0\x80\xec\x9e\xa5\xed\x96\x88\xec"
+    b"\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4:BGR \xec\x83\x89\xec\x83\x81\xeb\x8b\xa4\xeb\xa5\xb8 \xec\x9e\xa5\xec\xb9\x98"
+    b"\xec\x97\x90\xec\x84\x9c \xeb\x8d\xb0\xec\x9d\xb4\xed\x84\xb0 \xeb\xb3\xb5\xea\xb5\xac\xea\xb0\x80 \xeb\xb6\x88\xea\xb0"
+    b"\x80\xeb\x8a\xa5\xed\x95\x98\xeb\x8f\x84\xeb\xa1\x9d SD\xec\xb9\xb4\xeb\x93\x9c\xeb\xa5\xbc \xec\x99\x84\xec\xa0\x84"
+    b"\xed\x9e\x88 \xec\xa7\x80\xec\x9a\xb0\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4\xec\xb2\xab \xeb\xb2\x88\xec\xa7\xb8 %d"
+    b"\xea\xb0\x9c\xec\x9d\x98 \xec\xa3\xbc\xec\x86\x8c\xec\x97\x90\xec\x84\x9c \xec\xb0\xbe\xec\x9d\x84 \xec\x88\x98 \xec"
+    b"\x97\x86\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4\xec\xa3\xbc\xec\x86\x8c \xeb\x82\xb4\xeb\xb3\xb4\xeb\x82\xb4\xea\xb8\xb0\xeb\xb2"
+    b"\x84\xec\xa0\x84\xec\xa0\x80\xec\x9e\xa5\xea\xb3\xb5\xea\xb0\x84\xec\x97\x90\xec\x84\x9c \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4"
+    b"\xea\xb8\xb0\xed\x84\xb0\xec\xb9\x98\xed\x95\x98\xea\xb1\xb0\xeb\x82\x98 \xec\x97\x94\xed\x84\xb0\xeb\xa5\xbc \xeb\x88\x8c"
+    b"\xeb\x9f\xac \xec\xba\xa1\xec\xb2\x98\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc\xeb"
+    b"\xa1\x9c \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xea\xb8\xb0\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 \xeb\x8b\xa8\xec\x96\xb4 "
+    b"\xec\x9e\x85\xeb\xa0\xa5\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xea\xb8\xb0\xeb\xb3\xb8 \xec\xa0\x95\xeb\xb3\xb4Shan"
+    b"non\xec\x9d\x98 \xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc:\xec\x98\xa4\xeb\xa5\xb8\xec\xaa\xbd\xec\x84\x9c"
+    b"\xeb\xaa\x85\xeb\x90\x9c \xeb\xa9\x94\xec\x8b\x9c\xec\xa7\x80%d\xea\xb0\x9c\xec\x9d\x98 BIP39 \xeb"
+    b"\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc \xec\x9e\x85\xeb\xa0\xa5\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4.\xed\x81\xac\xea"
+    b"\xb8\xb0:\xed\x99\x94\xeb\xa9\xb4\xeb\xb3\xb4\xed\x98\xb8\xea\xb8\xb0 \xec\x8b\x9c\xea\xb0\x84\xeb\xa9\x94\xec\x8b\x9c\xec"
+    b"\xa7\x80%s \xeb\xb0\x94\xec\x9d\xb4\xed\x8a\xb8\xeb\xb2\x84\xed\x8a\xbc \xeb\xb0\x94\xec\x9a\xb4\xec\x8a\xa4 \xeb"
+    b"\xb0\xa9\xec\xa7\x80\xec\x9d\xb4\xec\xa7\x84\xec\x88\x98 \xea\xb7\xb8\xeb\xa6\xac\xeb\x93\x9c\xeb\xb9\x84\xeb\xb0\x80\xeb\xb2"
+    b"\x88\xed\x98\xb8 \xec\x9e\x85\xeb\xa0\xa5\xed\x91\x9c\xec\x8b\x9c \xeb\xa0\x88\xec\x9d\xb4\xeb\xb8\x94\xec\xa7\x80\xea\xb0"
+    b"\x91 \xec\x84\xa4\xec\xa0\x95\xeb\x8b\xa8\xec\x9c\x84SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90 \xec\xa0\x80\xec\x9e\xa5"
+    b"\xeb\x8a\x94 \xec\x9c\xa0\xed\x9a\xa8\xed\x95\x9c \xec\xa3\xbc\xec\x86\x8c\xec\x9e\x85\xeb\x8b\x88\xeb\x8b\xa4!\xec\xa4"
+    b"\x84:\xeb\xa8\xbc\xec\xa0\x80 \xed\x83\xac\xed\x8d\xbc \xec\xb2\xb4\xed\x81\xac \xec\xbd\x94\xeb\x93\x9c\xeb\xa5\xbc"
+    b" \xec\x84\xa4\xec\xa0\x95\xed\x95\x98\xec\x84\xb8\xec\x9a\x94\xec\x95\x94\xed\x98\xb8\xed\x99\x94\xed\x95\x98\xeb\x8b\xa4\xeb"
+    b"\xa1\x9c\xeb\x93\x9c \xec\xa4\x91\xe2\x80\xa6\xec\xa3\xbc\xec\x86\x8c\xeb\xa5\xbc \xeb\xb3\xb4\xea\xb8\xb0\xec\x9c\x84\xed"
+    b"\x95\xb4 \xec\x8b\xa0\xeb\xa2\xb0\xed\x95\xa0 \xec\x88\x98 \xec\x9e\x88\xeb\x8a\x94 \xec\x9b\x94\xeb\xa0\x9b \xeb"
+    b"\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0\xeb\xa5\xbc \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xec\x8b\x9c\xea\xb2"
+    b"\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xec\x9e\x98\xeb\xaa\xbb\xeb\x90\x9c \xec\x84\x9c\xeb\xaa\x85\xeb\x8d\xb0\xec\x9d"
+    b"\xb4\xed\x84\xb0 \xeb\xb3\xb5\xea\xb5\xac\xea\xb0\x80 \xeb\xb6\x88\xea\xb0\x80\xeb\x8a\xa5\xed\x95\x98\xeb\x8f\x84\xeb\xa1"
+    b"\x9d \xec\x9e\xa5\xec\xb9\x98 \xec\xa0\x84\xec\xb2\xb4\xec\xa7\x80\xec\x9a\xb0\xea\xb8\xb0 \xea\xb8\xb0\xeb\x8a\xa5\xec"
+    b"\x9d\x84 \xec\x82\xac\xec\x9a\xa9\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4TR \xeb\x82\xb4\xeb\xb6\x80 \xed"
+    b"\x82\xa4\xeb\x8b\xa8\xec\x9d\xbc\xec\x84\x9c\xeb\xaa\x85QR\xec\xbd\x94\xeb\x93\x9c\xeb\xa1\x9c \xeb\x82\xb4\xeb\xb3\xb4"
+    b"\xeb\x82\xb4\xea\xb8\xb0\xec\xa7\x80\xea\xb0\x91 \xeb\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0\xed\x8c\xa8\xec"
+    b"\x8a\xa4\xed\x94\x84\xeb\xa0\x88\xec\x9d\xb4\xec\xa6\x88 \xec\x97\x86\xec\x9d\x8c6\xec\x9e\x90 \xec\x9d\xb4\xec\x83\x81"
+    b"\xec\x9d\x98 \xed\x83\xac\xed\x8d\xbc \xec\xb2\xb4\xed\x81\xac \xec\xbd\x94\xeb\x93\x9c\xeb\xa5\xbc \xec\x9e\x85\xeb"
+    b"\xa0\xa5\xed\x95\x98\xec\x84\xb8\xec\x9a\x94\xed\x83\xac\xed\x8d\xbc \xec\xb2\xb4\xed\x81\xac \xec\xbd\x94\xeb\x93\x9c\xec"
+    b"\x9d\xbc\xeb\xb6\x80 \xea\xb2\x80\xec\x82\xac\xeb\xa5\xbc \xec\x88\x98\xed\x96\x89\xed\x95\xa0 \xec\x88\x98 \xec\x97"
+    b"\x86\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4.\xeb\xb2\x84\xed\x8a\xbc\xea\xb3\xb5\xec\x9e\xa5 \xec\x84\xa4\xec\xa0\x95\xec\x9d"
+    b"\x84 \xeb\xb3\xb5\xec\x9b\x90\xed\x95\x98\xea\xb3\xa0 \xec\x9e\xac\xeb\xb6\x80\xed\x8c\x85\xed\x95\x98\xec\x8b\x9c\xea\xb2"
+    b"\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xec\x9d\xb4\xeb\x8c\x80\xeb\xa1\x9c \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xea\xb8"
+    b"\xb0\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc\xec\x9d\x98 \xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc\xeb\xa5\xbc \xec\x82"
+    b"\xac\xec\x9a\xa9\xed\x95\x98\xec\x97\xac \xec\x83\x88\xeb\xa1\x9c\xec\x9a\xb4 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d"
+    b"\x84 \xec\x83\x9d\xec\x84\xb1\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4\xec\x9b\x90\xec\x8b\x9c \xed\x95\xb4\xec\x8b"
+    b"\x9c\xec\x97\x90 \xec\x84\x9c\xeb\xaa\x85\xed\x95\xa9\xeb\x8b\x88\xeb\x8b\xa4. \xec\x86\x8c\xec\x8a\xa4\xeb\xa5\xbc "
+    b"\xec\x8b\xa0\xeb\xa2\xb0\xed\x95\x98\xeb\x8a\x94 \xea\xb2\xbd\xec\x9a\xb0\xec\x97\x90\xeb\xa7\x8c \xec\xa7\x84\xed\x96\x89"
+    b"\xed\x95\xa9\xeb\x8b\x88\xeb\x8b\xa4.\xeb\xb6\x80\xed\x8c\x85 \xec\x8b\x9c \xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c \xed"
+    b"\x83\xac\xed\x8d\xbc \xed\x99\x95\xec\x9d\xb8 \xed\x95\xb4\xec\x8b\x9c\xec\x95\x94\xed\x98\xb8\xec\x97\x90\xec\x84\x9c "
+    b"ASCII\xea\xb0\x80 \xec\x95\x84\xeb\x8b\x8c \xeb\xac\xb8\xec\x9e\x90\xea\xb0\x80 \xea\xb0\x90\xec\xa7\x80"
+    b"\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4. Krux\xeb\x8a\x94 \xeb\x8b\xa4\xeb\xa5\xb8 "
+    b"\xec\xa7\x80\xea\xb0\x91\xec\x9d\xb4 \xeb\x8f\x99\xec\x9d\xbc\xed\x95\x9c \xed\x82\xa4\xeb\xa5\xbc \xed\x8c\x8c\xec\x83"
+    b"\x9d\xed\x95\xa0 \xea\xb2\x83\xec\x9d\xb4\xeb\x9d\xbc\xea\xb3\xa0 \xeb\xb3\xb4\xec\x9e\xa5\xed\x95\xa0 \xec\x88\x98 "
+    b"\xec\x97\x86\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4.\xec\xa7\x80\xea\xb0\x91 \xec\xb6\x9c\xeb\xa0\xa5 \xeb\x94\x94\xec\x8a"
+    b"\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0\xeb\xa5\xbc \xec\xb0\xbe\xec\x9d\x84 \xec\x88\x98 \xec\x97\x86\xec\x8a\xb5\xeb"
+    b"\x8b\x88\xeb\x8b\xa4.180\xc2\xb0 \xed\x9a\x8c\xec\xa0\x8410\xec\xa7\x84\xec\x88\x98\xec\xba\xa1\xec\xb2\x98"
+    b"\xeb\x90\xa0\xeb\x95\x8c\xea\xb9\x8c\xec\xa7\x80 \xea\xb8\xb0\xeb\x8b\xa4\xeb\xa6\xac\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4Q"
+    b"R \xeb\xa0\x88\xec\x9d\xb4\xeb\xb8\x94\xec\x9d\x84 \xec\x97\x85\xeb\x8d\xb0\xec\x9d\xb4\xed\x8a\xb8\xed\x95\x98\xec\x8b"
+    b"\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xeb\xb0\x9d\xea\xb8\xb0Base64 \xeb\xb9\x84\xeb\xb0"
+    b"\x80\xeb\xb2\x88\xed\x98\xb8\xed\x94\xbd\xec\x85\x80 \xed\x8e\xb8\xec\xb0\xa8 \xec\xa7\x80\xec\x88\x98:\xea\xb3\x84\xec"
+    b"\x86\x8d\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xec\xa3\xbc\xec\x86\x8c\xea\xb0\x80 \xec"
+    b"\x9e\x98\xeb\xaa\xbb\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4\xec\xa7\x80\xea\xb0\x91 \xec\xb6\x9c\xeb\xa0"
+    b"\xa5 \xeb\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0\xea\xb0\x80 \xeb\xa1\x9c\xeb\x93\x9c\xeb\x90\x98\xec\x97"
+    b"\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4!16\xec\xa7\x84\xec\x88\x98\xeb\xa1\x9c\xec\x95\x94\xed\x98\xb8\xed\x99\x94 "
+    b"\xeb\xaa\xa8\xeb\x93\x9c\xed\x85\x8d\xec\x8a\xa4\xed\x8a\xb8\xea\xb0\x95\xed\x95\x9c\xec\x95\xbd\xed\x95\x9c\xea\xb2\xbd\xea\xb3"
+    b"\xa0:\xea\xb2\x80\xec\x9d\x80\xec\x83\x89 \xeb\xb0\xb0\xea\xb2\xbd \xed\x99\x94\xeb\xa9\xb4\xec\x9d\x84 \xec\x82\xac"
+    b"\xec\x9a\xa9\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4.16\xec\xa7\x84\xec\x88\x98\xeb\x88\x88\xeb\xb6\x80\xec\x8b"
+    b"\xac \xeb\xb0\xa9\xec\xa7\x80 \xeb\xaa\xa8\xeb\x93\x9c\xeb\xb0\x9b\xea\xb8\xb0\xeb\xb0\x9d\xea\xb8\xb0 \xec\xa0\x84\xed"
+    b"\x99\x98\xec\xa7\x80\xea\xb0\x91 \xeb\xb3\x80\xea\xb2\xbd?\xeb\x8d\x94 \xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5"
+    b"\xeb\x8b\x88\xea\xb9\x8c?13\xeb\xb2\x88\xec\xa7\xb8\xeb\xb6\x80\xed\x84\xb0 24\xeb\xb2\x88\xec\xa7\xb8 \xeb"
+    b"\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc \xec\x8a\xa4\xec\xba\x94 \xec\xa4\x91\xec\x9e\x85\xeb\x8b\x88\xeb\x8b\xa4SD\xec\xb9"
+    b"\xb4\xeb\x93\x9c\xea\xb0\x80 \xea\xb0\x90\xec\xa7\x80\xeb\x90\x98\xec\xa7\x80 \xec\x95\x8a\xec\x95\x98\xec\x8a\xb5\xeb\x8b"
+    b"\x88\xeb\x8b\xa4.12\xeb\x8b\xa8\xec\x96\xb4\xeb\x8b\xa4\xec\x8b\x9c \xea\xb2\x80\xed\x86\xa0\xeb\xb3\xb5\xed\x98\xb8"
+    b"\xed\x99\x94\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 "
+    b"\xeb\xb0\xb1\xec\x97\x85\xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c \xeb\x8f\x84\xea\xb5\xac\xec\x97\x85\xea\xb7\xb8\xeb\xa0\x88\xec"
+    b"\x9d\xb4\xeb\x93\x9c\xea\xb0\x80 \xec\x99\x84\xeb\xa3\x8c\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4.1"
+    b"6\xec\xa7\x84\xec\x88\x98\xeb\xb6\x80\xed\x84\xb0(%s \xeb\xb9\x84\xed\x8a\xb8/\xed\x94\xbd\xec\x85\x80)\xea"
+    b"\xb8\xb0\xeb\xb3\xb8 \xec\xa0\x80\xec\x9e\xa5\xec\x86\x8cRes. - \xed\x98\x95\xec\x8b\x9d\xeb\x8b\x88\xeb"
+    b"\xaa\xa8\xeb\x8b\x89 \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xea\xb8\xb0\xeb\xb9\x84\xec\x96\xb4 \xec\x9e\x88\xec\x9d\x8cu"
+    b"tf8\xeb\xa1\x9c\xec\x9d\xbc\xeb\xb6\x80 \xeb\x85\xb8\xeb\x93\x9c\xea\xb0\x80 \xea\xb2\xbd\xed\x99\x94\xeb\x90\x98"
+    b"\xec\xa7\x80 \xec\x95\x8a\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4:SD\xec\xb9\xb4\xeb\x93\x9c\xeb\xa1\x9c \xeb\x82\xb4"
+    b"\xeb\xb3\xb4\xeb\x82\xb4\xea\xb8\xb0\xec\x95\x84\xec\x9d\xb4\xeb\x94\x94\xea\xb0\x80 \xec\x9d\xb4\xeb\xaf\xb8 \xec\xa1\xb4"
+    b"\xec\x9e\xac\xed\x95\xa9\xeb\x8b\x88\xeb\x8b\xa4\xea\xb8\xb0\xeb\xb3\xb8 PBKDF2 \xeb\xb0\x98\xeb\xb3\xb5"
+    b"\xeb\xac\xb8\xec\x9d\x84 \xec\x82\xac\xec\x9a\xa9\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4.?\xec\x95\x8c \xec"
+    b"\x88\x98 \xec\x97\x86\xec\x9d\x8c\xeb\xaf\xb8\xeb\x9f\xac X \xec\xa2\x8c\xed\x91\x9c\xeb\x84\xa4\xed\x8a\xb8\xec\x9b"
+    b"\x8c\xed\x81\xacBIP85 \xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc\xeb\xa5\xbc \xec\x9c\xa0\xeb\x8f\x85"
+    b"\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x84 "
+    b"\xec\xa0\x80\xec\x9e\xa5\xed\x95\x98\xec\xa7\x80 \xeb\xaa\xbb\xed\x96\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4\xec\x8b\x9c\xeb"
+    b"\x93\x9c\xeb\xac\xb8\xea\xb5\xac\xec\x95\x94\xed\x98\xb8\xed\x99\x94\xeb\x90\x9c \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d"
+    b"\x84 \xec\xa0\x80\xec\x9e\xa5\xed\x95\x98\xec\xa7\x80 \xeb\xaa\xbb\xed\x96\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4\xed\x84"
+    b"\xb0\xec\xb9\x98\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xb0\xec\xa2\x85\xec\x9d\xb4 \xeb\x84\x88\xeb\xb9\x84\xea\xb3\x84\xec\xa0\x95"
+    b"\xed\x82\xa4%s \xec\x9e\x90QR \xed\x85\x8c\xec\x8a\xa4\xed\x8a\xb8 \xec\x9d\xb8\xec\x87\x84\xec\xa0\x80\xec"
+    b"\x9e\xa5\xeb\x90\x9c \xeb\xaa\xa8\xeb\x93\xa0 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 \xeb\xb0\x8f \xec\x84\xa4\xec\xa0"
+    b"\x95\xea\xb0\x92\xec\x9d\x84 \xec\x98\x81\xea\xb5\xac\xec\xa0\x81\xec\x9c\xbc\xeb\xa1\x9c \xec\xa0\x9c\xea\xb1\xb0\xed\x95"
+    b"\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xed\x94\x84\xeb\xa6\xb0\xed\x84\xb0 \xeb\xa1\x9c\xeb\x93"
+    b"\x9c \xec\xa4\x91\xe2\x80\xa6\xec\x8b\x9c\xeb\x93\x9c\xeb\xac\xb8\xea\xb5\xac \xec\x88\x9c\xeb\xb2\x88QR \xeb\xb7"
+    b"\xb0\xec\x96\xb4\xeb\xa1\x9c \xeb\x8f\x8c\xec\x95\x84\xea\xb0\x80\xea\xb8\xb0PAGE\xeb\xa1\x9c \xec\xb7\xa8\xec"
+    b"\x86\x8c.\xed\x95\xb4\xeb\x8b\xb9 \xec\xa3\xbc\xec\x86\x8c\xea\xb0\x80 \xec\x9d\xb4 \xec\xa7\x80\xea\xb0\x91\xec\x97"
+    b"\x90 \xec\x86\x8d\xed\x95\x98\xeb\x8a\x94\xec\xa7\x80 \xed\x99\x95\xec\x9d\xb8\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a"
+    b"\xb5\xeb\x8b\x88\xea\xb9\x8c?\xec\xba\xa1\xec\xb2\x98 \xec\xb7\xa8\xec\x86\x8c\xeb\x90\xa8\xed\x8c\x8c\xec\x83\x9d \xea"
+    b"\xb2\xbd\xeb\xa1\x9c\xeb\xa1\x9c\xeb\x93\x9c \xec\x8b\xa4\xed\x8c\xa8KEF \xec\x95\x94\xed\x98\xb8\xed\x99\x94\xeb"
+    b"\x90\xa8Input (%d):BIP39 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9c\xa0\xed"
+    b"\x9a\xa8\xed\x95\x98\xec\xa7\x80 \xec\x95\x8a\xec\x9d\x80 \xed\x83\xac\xed\x8d\xbc \xec\xb2\xb4\xed\x81\xac \xec\xbd"
+    b"\x94\xeb\x93\x9c\xec\xa4\x91\xea\xb0\x84\xeb\x8d\xae\xec\x96\xb4\xec\x93\xb0\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea"
+    b"\xb9\x8c?\xed\x82\xa4\xea\xb0\x80 \xec\xa0\x9c\xea\xb3\xb5\xeb\x90\x98\xec\xa7\x80 \xec\x95\x8a\xec\x95\x98\xec\x8a\xb5"
+    b"\xeb\x8b\x88\xeb\x8b\xa4\xec\xa3\xbc\xec\x86\x8c\xec\xa3\xbc\xec\x82\xac\xec\x9c\x84\xea\xb0\x92 \xeb\xb6\x84\xed\x8f\xac:"
+    b"\xeb\x94\x94\xec\x8a\xa4\xed\x94\x8c\xeb\xa0\x88\xec\x9d\xb4\xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c \xeb\xa9\x94\xeb\xaa\xa8\xeb"
+    b"\xa6\xac\xec\x97\x90 \xec\xa0\x80\xec\x9e\xa5\xea\xb8\xb0\xeb\xb3\xb8 \xeb\xaa\xa8\xeb\x93\x9c\xeb\xa5\xbc \xec\x82\xac"
+    b"\xec\x9a\xa9\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xed\x8c\x8c\xec\x9d\xbc\xeb\xaa\x85\xec"
+    b"\x9d\xb4 \xeb\xb3\x80\xea\xb2\xbd \xed\x9b\x84\xec\x97\x90\xeb\x8f\x84 \xec\x9e\xa5\xec\xb9\x98 \xeb\x94\x94\xec\x8a"
+    b"\xa4\xed\x94\x8c\xeb\xa0\x88\xec\x9d\xb4\xea\xb0\x80 \xec\x9e\x91\xeb\x8f\x99\xed\x95\x98\xec\xa7\x80 \xec\x95\x8a\xec\x9c"
+    b"\xbc\xeb\xa9\xb4 5\xec\xb4\x88 \xed\x9b\x84\xec\x97\x90 \xec\x9d\xb4\xec\xa0\x84 \xec\x84\xa4\xec\xa0\x95\xec\x9c"
+    b"\xbc\xeb\xa1\x9c \xec\x9e\x90\xeb\x8f\x99\xec\x9c\xbc\xeb\xa1\x9c \xec\x9e\xac\xeb\xb6\x80\xed\x8c\x85\xeb\x90\xa9\xeb\x8b"
+    b"\x88\xeb\x8b\xa4.\xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xec\x9d"
+    b"\xb4\xeb\xaf\xb8 \xec\x82\xac\xec\x9a\xa9\xeb\x90\xa8:\xec\xa2\x85\xeb\xa3\x8c\xec\x9d\xb8\xec\x87\x84\xed\x95\x98\xec\x8b"
+    b"\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?(\xec\x8b\xa4\xed\x97\x98\xec\xa0\x81 \xea\xb8\xb0\xeb\x8a\xa5)"
+    b"\xed\x97\xa4\xeb\x93\x9c \xec\xa2\x85\xeb\xa5\x98\xec\xa7\x80\xea\xb0\x91 \xeb\xb6\x88\xec\x9d\xbc\xec\xb9\x98:ba"
+    b"se32\xec\x97\x90\xec\x84\x9c\xed\x8c\xa8\xec\x8a\xa4\xed\x94\x84\xeb\xa0\x88\xec\x9d\xb4\xec\xa6\x88\xeb\xa5\xbc "
+    b"\xec\xb6\x94\xea\xb0\x80\xed\x95\x98\xea\xb1\xb0\xeb\x82\x98 \xeb\xb3\x80\xea\xb2\xbd\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec"
+    b"\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?SD\xec\xb9\xb4\xeb\x93\x9c \xed\x99\x95\xec\x9d\xb8\xec\xb6\x9c\xeb\xa0\xa5\xec\xa4"
+    b"\x91\xe2\x80\xa6\xeb\x92\xa4\xeb\xa1\x9c\xec\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xec\xa7\x80\xec\xa0\x95 QR \xec\xbd"
+    b"\x94\xeb\x93\x9c\xeb\xaa\xa8\xeb\x93\x9c\xeb\xa5\xbc \xeb\xb3\x80\xea\xb2\xbd\xed\x95\x98\xeb\xa0\xa4\xeb\xa9\xb4 \xed\x99"
+    b"\x94\xeb\xa9\xb4\xec\x9d\x84 \xec\x98\x86\xec\x9c\xbc\xeb\xa1\x9c \xec\x93\xb8\xec\x96\xb4\xeb\x82\xb4\xeb\xa6\xac\xec\x84"
+    b"\xb8\xec\x9a\x94\xeb\x8b\xa4\xeb\xa5\xb8 XOR \xec\xa0\x84\xeb\xa5\x98 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89?"
+    b" (\xed\x8c\xa8\xec\x8a\xa4\xed\x94\x84\xeb\xa0\x88\xec\x9d\xb4\xec\xa6\x88\xec\x99\x80 \xeb\x94\x94\xec\x8a\xa4\xed\x81"
+    b"\xac\xeb\xa6\xbd\xed\x84\xb0\xea\xb0\x80 \xed\x8f\x90\xea\xb8\xb0\xeb\x90\xa9\xeb\x8b\x88\xeb\x8b\xa4)SD\xec\xb9\xb4"
+    b"\xeb\x93\x9c\xec\x97\x90 \xec\xa0\x80\xec\x9e\xa5\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+    b"\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 \xec\x83\x9d\xec\x84\xb1\xed\x8c\x8c\xed\x8a\xb8 \xec\x82\xac\xec\x9d\xb4\xec\xa6\x88"
+    b"\xec\xa7\x80\xea\xb0\x91 \xec\xb6\x9c\xeb\xa0\xa5 \xeb\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0\xeb\xa5\xbc"
+    b" \xeb\xb6\x88\xeb\x9f\xac\xec\x98\xa4\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa416\xec\xa7\x84\xec\x88\x98 \xea\xb3\xb5\xea"
+    b"\xb0\x9c\xed\x82\xa4:\xec\x95\x94\xed\x98\xb8\xed\x99\x94 \xed\x9b\x84 \xec\xa0\x80\xec\x9e\xa5\xec\x82\xac\xec\x9a\xa9"
+    b"\xec\x9e\x90 \xec\xa0\x95\xec\x9d\x98\xea\xb3\x84\xec\x86\x8d\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea"
+    b"\xb9\x8c?\xeb\xb3\x80\xea\xb2\xbd \xec\xa3\xbc\xec\x86\x8c\xeb\xa5\xbc \xed\x99\x95\xec\x9d\xb8\xed\x95\xa0 \xec\x88"
+    b"\x98 \xec\x97\x86\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4.\xec\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xeb\x8d\xb0\xec\x9d\xb4\xed"
+    b"\x84\xb0 \xec\xa7\x80\xec\x9a\xb0\xea\xb8\xb0\xec\x83\x88\xeb\xa1\x9c\xec\x9a\xb4 \xed\x8e\x8c\xec\x9b\xa8\xec\x96\xb4\xea"
+    b"\xb0\x80 \xea\xb0\x90\xec\xa7\x80\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4.\xec\x9e\x90\xeb\x8f\x99 "
+    b"\xec\xa2\x85\xeb\xa3\x8c\xec\x8b\x9c\xea\xb0\x84\xec\x99\xbc\xec\xaa\xbd\xec\x84\x9c\xeb\xaa\x85\xeb\x90\x9c PSBT"
+    b"\xec\x8b\xa4\xed\x8c\xa8\xed\x83\xac\xed\x8d\xbc \xea\xb2\x80\xec\x82\xac \xec\xbd\x94\xeb\x93\x9c\xea\xb0\x80 \xec\x84"
+    b"\xb1\xea\xb3\xb5\xec\xa0\x81\xec\x9c\xbc\xeb\xa1\x9c \xec\x84\xa4\xec\xa0\x95\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88"
+    b"\xeb\x8b\xa4\xec\x8a\xa4\xec\x99\x80\xec\x9d\xb4\xed\x94\x84\xed\x84\xb0\xec\xb9\x98 \xeb\xaf\xbc\xea\xb0\x90\xeb\x8f\x84B"
+    b"IP39 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x98 \xea\xb0\x81 \xeb\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc "
+    b"1\xec\x97\x90\xec\x84\x9c 2048 \xec\x82\xac\xec\x9d\xb4\xec\x9d\x98 \xec\x88\xab\xec\x9e\x90\xeb\xa1\x9c"
+    b" \xec\x9e\x85\xeb\xa0\xa5\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4.%s\xec\x9d\x84 \xec\xa0\x9c\xea\xb1\xb0"
+    b"\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xeb\x8b\xa8\xec\x96\xb4 \xeb\xb2\x88\xed\x98\xb8"
+    b"(1-2048)\xea\xb2\xbd\xeb\xa1\x9c \xeb\xb6\x88\xec\x9d\xbc\xec\xb9\x98\xec\x88\x98\xec\x8b\xa0 \xec"
+    b"\xa3\xbc\xec\x86\x8c \xeb\xa1\x9c\xeb\x93\x9c \xec\xa4\x91\xe2\x80\xa6\xec\xb2\x98\xeb\xa6\xac \xec\xa4\x91\xe2\x80\xa6"
+    b"\xec\x9e\x90\xea\xb0\x80 \xec\x9d\xb4\xec\xb2\xb4:\xec\x9e\x94\xeb\x8f\x88:\xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c \xec"
+    b"\xb1\x84\xec\x9a\xb0\xea\xb8\xb0Krux \xed\x94\x84\xeb\xa6\xb0\xed\x84\xb0 \xed\x85\x8c\xec\x8a\xa4\xed\x8a\xb8"
+    b" QR\xec\x99\x84\xeb\xa3\x8c\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xed\x8c\x8c\xec\x9d\xbc\xec"
+    b"\x9d\x84 \xed\x83\x90\xec\x83\x89\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?\xed\x99\x95\xec"
+    b"\x9d\xb8\xe2\x80\xa6\xeb\x94\x94\xec\x8a\xa4\xed\x94\x8c\xeb\xa0\x88\xec\x9d\xb4\xec\x88\x98\xec\x88\x98\xeb\xa3\x8c\xea\xb0\x80"
+    b" \xeb\x86\x92\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4!\xec\xa0\x84\xec\x9b\x90\xec\x9d\x84 \xeb\x81\x84\xec\xa7\x80 \xeb"
+    b"\xa7\x88\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4. \xec\x99\x84\xeb\xa3\x8c\xed\x95\x98\xeb\x8a\x94 \xeb\x8d\xb0 \xec\x8b"
+    b"\x9c\xea\xb0\x84\xec\x9d\xb4 \xea\xb1\xb8\xeb\xa6\xb4 \xec\x88\x98 \xec\x9e\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4."
+    b"\xed\x94\x84\xeb\xa6\xb0\xed\x84\xb0 \xeb\x93\x9c\xeb\x9d\xbc\xec\x9d\xb4\xeb\xb2\x84\xea\xb0\x80 \xec\x84\xa4\xec\xa0\x95"
+    b"\xeb\x90\x98\xec\xa7\x80 \xec\x95\x8a\xec\x95\x98\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4!\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89"
+    b" \xec\x88\xa8\xea\xb8\xb0\xea\xb8\xb0\xed\x8c\x8c\xed\x8a\xb8\xec\x84\x9c\xeb\xaa\x85 \xed\x8c\x8c\xec\x9d\xbc\xec\x9d\xb4"
+    b" \xeb\x88\x84\xeb\x9d\xbd\xeb\x90\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4SD\xec\xb9\xb4\xeb\x93\x9c\xea\xb3"
+    b"\xb5\xec\x9e\xa5 \xec\xb4\x88\xea\xb8\xb0 \xec\x84\xa4\xec\xa0\x95\xec\x82\xac\xec\x9a\xa9\xec\x9e\x90 \xeb\x8d\xb0\xec"
+    b"\x9d\xb4\xed\x84\xb0%s\xeb\x8a\x94 [%s, %s] \xeb\xb2\x94\xec\x9c\x84\xeb\xa5\xbc \xeb\xb2"
+    b"\x97\xec\x96\xb4\xeb\x82\xac\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa41\xeb\xb2\x88\xec\xa7\xb8\xeb\xb6\x80\xed\x84\xb0 12"
+    b"\xeb\xb2\x88\xec\xa7\xb8 \xeb\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc \xec\x8a\xa4\xec\xba\x94 \xec\xa4\x91\xec\x9e\x85\xeb\x8b"
+    b"\x88\xeb\x8b\xa4PSBT\xec\x97\x90\xec\x84\x9c \xec\xa7\x80\xeb\xac\xb8\xec\x9d\xb4 \xec\x84\xa4\xec\xa0\x95\xeb"
+    b"\x90\x98\xec\xa7\x80 \xec\x95\x8a\xec\x95\x98\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4SD \xec\xb9\xb4\xeb\x93\x9c \xed"
+    b"\x99\x95\xec\x9d\xb8 \xec\xa4\x91\xe2\x80\xa6\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbc\xec\x9d\x98 \xec\x97\x94\xed\x8a\xb8\xeb"
+    b"\xa1\x9c\xed\x94\xbc\xeb\xa1\x9c \xed\x94\x8c\xeb\x9e\x98\xec\x8b\x9c\xeb\xa5\xbc \xec\xb1\x84\xec\x9a\xb0\xec\x8b\x9c\xea"
+    b"\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?SD\xec\xb9\xb4\xeb\x93\x9c\xec\x97\x90 \xec\xa0\x80\xec\x9e\xa5\xeb\x90"
+    b"\xa8:BIP39 \xed\x8c\xa8\xec\x8a\xa4\xed\x94\x84\xeb\xa0\x88\xec\x9d\xb4\xec\xa6\x88 \xec\x8a\xa4\xec\xba"
+    b"\x94\xed\x95\x98\xea\xb8\xb0BIP39 \xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89\xec\x9d\x98 \xea\xb0\x81 \xeb\x8b"
+    b"\xa8\xec\x96\xb4\xeb\xa5\xbc 1\xec\x97\x90\xec\x84\x9c 800 \xec\x82\xac\xec\x9d\xb4\xec\x9d\x98 16"
+    b"\xec\xa7\x84\xec\x88\x98 \xec\x88\xab\xec\x9e\x90\xeb\xa1\x9c \xec\x9e\x85\xeb\xa0\xa5\xed\x95\x98\xec\x8b\xad\xec\x8b\x9c"
+    b"\xec\x98\xa4.\xec\x95\x84\xeb\x8b\x88\xec\x9a\x94base64\xeb\xa1\x9c\xec\xa3\xbc\xec\x82\xac\xec\x9c\x84 "
+    b"\xed\x9a\x9f\xec\x88\x98\xea\xb0\x80 \xec\xb6\xa9\xeb\xb6\x84\xed\x95\x98\xec\xa7\x80 \xec\x95\x8a\xec\x8a\xb5\xeb\x8b\x88"
+    b"\xeb\x8b\xa4!\xeb\x8b\x88\xeb\xaa\xa8\xeb\x8b\x89 \xea\xb8\xb8\xec\x9d\xb4\xea\xb0\x80 \xec\x9e\x98\xeb\xaa\xbb\xeb\x90"
+    b"\x98\xec\x97\x88\xec\x8a\xb5\xeb\x8b\x88\xeb\x8b\xa4QR \xec\xbd\x94\xeb\x93\x9c \xec\x83\x9d\xec\x84\xb1\xeb\xaa\xa8"
+    b"\xeb\x93\x9c\xeb\xa5\xbc \xec\xa0\x84\xed\x99\x98\xed\x95\x98\xeb\xa0\xa4\xeb\xa9\xb4 PAGE\xeb\xa5\xbc \xeb"
+    b"\x88\x84\xeb\xa5\xb4\xec\x84\xb8\xec\x9a\x94base43\xec\x97\x90\xec\x84\x9c\xec\xa3\xbc\xec\x86\x8c \xec\x8a"
+    b"\xa4\xec\xba\x94\xed\x95\x98\xea\xb8\xb0%s \xec\x97\x90 \xed\x95\x84\xec\x9a\x94\xed\x95\x9c \xec\xb9\xb4\xeb\xa9"
+    b"\x94\xeb\x9d\xbc\xec\x9d\x98 \xec\xb6\x94\xea\xb0\x80 \xec\x97\x94\xed\x8a\xb8\xeb\xa1\x9c\xed\x94\xbc\xeb\xb0\x98\xec\xa0"
+    b"\x84\xec\x9e\xa5\xec\xb9\x98 \xed\x85\x8c\xec\x8a\xa4\xed\x8a\xb8\xeb\xa9\x94\xeb\x89\xb4\xeb\xa1\x9c \xeb\x8f\x8c\xec\x95"
+    b"\x84\xea\xb0\x80\xea\xb8\xb0\xeb\xa7\x88\xec\xa7\x80\xeb\xa7\x89 \xeb\x8b\xa8\xec\x96\xb4\xeb\xa5\xbc Krux\xea"
+    b"\xb0\x80 \xec\x84\xa0\xed\x83\x9d\xed\x95\x98\xeb\x8f\x84\xeb\xa1\x9d \xed\x95\x98\xeb\xa0\xa4\xeb\xa9\xb4 \xeb\xb9\x84"
+    b"\xec\x9b\x8c\xeb\x91\x90\xec\x8b\xad\xec\x8b\x9c\xec\x98\xa4\xec\xb9\xb4\xeb\xa9\x94\xeb\x9d\xbcTX \xed\x95\x80\xec\xa7"
+    b"\x80\xea\xb0\x91 \xec\xb6\x9c\xeb\xa0\xa5 \xeb\x94\x94\xec\x8a\xa4\xed\x81\xac\xeb\xa6\xbd\xed\x84\xb0\xed\x8c\xa8\xec\x8a"
+    b"\xa4\xed\x94\x84\xeb\xa0\x88\xec\x9d\xb4\xec\xa6\x88\xeb\xb3\xb8\xec\x9d\xb8\xec\xa3\xbc\xec\x86\x8c \xec\xa0\x84\xec\x86\xa1"
+    b" \xeb\x98\x90\xeb\x8a\x94 \xec\x9e\x94\xeb\x8f\x88 (%d):\xea\xb8\xb8\xec\x9d\xb4:\xec\x84\x9c\xeb\xaa"
+    b"\x85\xed\x95\x98\xec\x8b\x9c\xea\xb2\xa0\xec\x8a\xb5\xeb\x8b\x88\xea\xb9\x8c?"
+)
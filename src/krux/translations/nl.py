@@ -19,382 +19,330 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-# pylint: disable=C0301
-translation_array = [
-    "% van het bedrag.",
-    "%d van %d multisig",
-    "%d tot %d",
-    "%s bits",
-    "%s bytes",
-    "%s tek.",
-    "%s verwijderd.",
-    "%s: geladen!",
-    "(%s bits/px)",
-    "(Experimenteel)",
-    "(alleen inzien)",
-    "12 woorden",
-    "24 woorden",
-    "Over",
-    "Account",
-    "Accountindex",
-    "Wachtwoordzin voor portemonnee toevoegen of wijzigen?",
-    "Extra entropie van camera vereist voor %s",
-    "Adres",
-    "Richt de camera en back-upplaat op de juiste manier.",
-    "Anti-verblindingsmodus",
-    "Uiterlijk",
-    "Weet je het zeker?",
-    "BGR-kleuren",
-    "BIP39 Mnemonic",
-    "Terug",
-    "Terug naar menu",
-    "Backup geheugensteun",
-    "Ongeldige handtekening",
-    "Base64-wachtwoord",
-    "Baudratio",
-    "Binair raster",
-    "Rand opvulling",
-    "Helderheid",
-    "Knoppen",
-    "Debounce van knoppen",
-    "Opname geannuleerd",
-    "Change",
-    "Thema veranderen en opnieuw opstarten?",
-    "Portemonnee wijzigen?",
-    "Wisselgeld:",
-    "Wijzigingen blijven van kracht tot afsluiten.",
-    "Controleer SD kaart",
-    "Controleer of dit adres bij deze portemonnee hoort?",
-    "%d adressen gecontroleerd zonder overeenkomsten.",
-    "Controleren op SD-kaart…",
-    "Bevestig de sabotagecontrolecode",
-    "Datum converteren",
-    "Kan adreswijziging niet bepalen.",
-    "QR-code aanmaken",
-    "QR-code maken van tekst?",
-    "Aangemaakt:",
-    "Huidige sabotagecontrolecode",
-    "Aangepaste QR-code",
-    "Aangepaste tekst",
-    "Aanpassen",
-    "Bij aanpassen van de portemonnee zal er een nieuwe sleutel gegenereerd worden en ontlaadt de Descriptor.",
-    "Snijdiepte",
-    "Snijmethode",
-    "Datum Tool",
-    "Decimaal",
-    "Ontsleutelen?",
-    "Standaard portemonnee",
-    "Dit bestand verwijderen?",
-    "Diepte per pas",
-    "Afleidingspad",
-    "BIP85-entropie afleiden?",
-    "Descriptoradressen",
-    "Apparaattests",
-    "Weergave",
-    "Schakel het apparaat niet uit, het kan even duren voordat het klaar is.",
-    "Converteren gedaan.\r",
-    "Klaar?",
-    "Dubbel geheugensteuntje",
-    "Driver",
-    "Leeg",
-    "Inschakelen?",
-    "Versleutelen",
-    "Versleuteld",
-    "Versleutelde QR code",
-    "Versleutelde geheugensteun is opgeslagen met ID:",
-    "Versleutelde geheugensteun was niet opgeslagen",
-    "Versleutelen",
-    "Versleutel modus",
-    "Voer %d BIP39 woorden in.",
-    "Voer een sabotagecontrolecode van 6 of meer tekens in",
-    "Voer elk woord van jouw BIP39 geheugensteun in als een nummer van 1 tot 2048.",
-    "Voer elk woord van jouw BIP39 geheugensteun in als een hexadecimaal van 1 tot 800.",
-    "Voer elk woord van jouw BIP39 geheugensteun in als een octaal van 1 tot 4000.",
-    "Voer elk woord van jouw BIP39 geheugensteun in.",
-    "Gegevens van gebruiker wissen",
-    "Gebruikersgegevens worden gewist…",
-    "Fout:",
-    "Esc",
-    "Bestanden verkennen?",
-    "Adressen exporteren",
-    "Exporteren van %s naar SD-kaart…",
-    "Uitgebreide publieke sleutel",
-    "Fabrieksinstellingen",
-    "Verzamelen van camera entropie mislukt",
-    "Kon niet geconverteerd worden",
-    "Ontsleutelen is niet gelukt",
-    "Laden mislukt",
-    "Geheugensteun opslaan is niet gelukt",
-    "Tarief:",
-    "Voedingssnelheid",
-    "Bestandsnaam",
-    "Bestandsnaam %s bestaat op SD kaart.",
-    "De flash vullen met entropie van de camera?",
-    "Flash vullen",
-    "Vingerafdruk niet ingesteld in PSBT",
-    "Flash Map",
-    "Flash Tools",
-    "Flash gevuld met camera-entropie",
-    "Fluit diameter",
-    "Vrij:",
-    "Uit data-opslag",
-    "Wis uw SD kaart volledig in een ander apparaat om te zorgen dat de gegevens onherstelbaar zijn",
-    "Geheugensteun genereren",
-    "Ga",
-    "Goede entropie",
-    "Hardware",
-    "Type gereedschapskop",
-    "Hex publieke sleutel:",
-    "Hexadecimaal",
-    "Verberg geheugensteunen",
-    "Hoge kosten!",
-    "ID",
-    "ID bestaat al",
-    "Als het scherm van uw apparaat na deze wijziging niet werkt, wordt het na 5 seconden automatisch opnieuw opgestart met de vorige instellingen.",
-    "Index",
-    "Invoer (%d):",
-    "Onvoldoende Entropie!",
-    "Ongeldige sabotagecontrolecode",
-    "Ongeldig adres",
-    "Ongeldige afleidingspad",
-    "Ongeldige geheugensteun lengte",
-    "Ongeldige portemonnee:",
-    "Omkeren",
-    "Omgekeerde kleuren",
-    "KEF versleuteld",
-    "Sleutel",
-    "Sleutel niet verstrekt",
-    "Krux printer test QR",
-    "LCD-type",
-    "Taal",
-    "Laat leeg als je wilt dat Krux een geldig laatste woord kiest",
-    "Links",
-    "Lengte:",
-    "Lijn vertraging",
-    "Lijn:",
-    "Adressenlijst",
-    "Geheugensteun laden",
-    "Portemonnee laden",
-    "Een vertrouwde portemonnee descriptor laden om adressen te bekijken?",
-    "Laden vanaf SD kaart",
-    "Laden vanaf SD kaart?",
-    "Laden van camera",
-    "Laden?",
-    "Camera wordt geladen…",
-    "Wijzigingsadressen worden geladen…",
-    "Printer wordt geladen…",
-    "Ontvangstadressen worden geladen…",
-    "Laden…",
-    "Taal",
-    "Opslaglocatie",
-    "Gemiddeld",
-    "Bericht",
-    "Bericht:",
-    "Miniscript",
-    "X-coördinaten spiegelen",
-    "Handtekening bestand mist",
-    "Geheugensteun",
-    "Mnemonic XOR",
-    "Geheugensteun en wachtwoord worden bewaard.",
-    "Aangepast:",
-    "Netwerk",
-    "Geheugensteun aanmaken",
-    "Nieuwe firmware gevonden.",
-    "Nee",
-    "Geen wachtwoordzin",
-    "Er zijn niet-ASCII-tekens gedetecteerd in uw wachtwoordzin. Krux kan niet garanderen dat andere portefeuilles dezelfde sleutel zullen afleiden.",
-    "Niet genoeg gedobbeld!",
-    "Nummers",
-    "Octaal",
-    "Andere indelingen",
-    "Overschrijven?",
-    "PAGE om de helderheid aan of uit te schakelen",
-    "PBKDF2 iter.",
-    "Maak geperforeerde stippen zwart zodat ze worden gedetecteerd.",
-    "Papier breedte",
-    "Deel",
-    "Deel M van N",
-    "Deel grootte",
-    "Wachtwoord",
-    "Wachtwoordlengte",
-    "Pad komt niet overeen",
-    "Patroon gevonden!",
-    "Alle opgeslagen versleutelde mnemonics en instellingen permanent uit het flashgeheugen verwijderen?",
-    "Opslag",
-    "Pixelafwijkingsindex:",
-    "Platte tekst QR",
-    "Laadt een portemonnee descriptor in",
-    "Duik tarief",
-    "Type beleid",
-    "Slechte entropie!",
-    "Vermogen",
-    "Druk op PAGE om te annuleren.",
-    "PAGINA om de modus te wisselen",
-    "Test QR afdrukken",
-    "Tinyseed afdrukken?",
-    "Afdrukken naar QR",
-    "Afdrukken naar QR?",
-    "Afdrukken?",
-    "Printer",
-    "Printer driver niet ingesteld!",
-    "Bezig met afdrukken…",
-    "Toch doorgaan?",
-    "Doorgaan?",
-    "Verwerken…",
-    "Bewijsbaar niet besteedbaar",
-    "QR code",
-    "QR-label",
-    "Aantal",
-    "RX pin",
-    "Opnieuw opstarten",
-    "Ontvangen",
-    "Regio:",
-    "Verwijderen %s?",
-    "Geheugensteun verwijderen",
-    "Firmwarebestanden van SD kaart verwijderen?",
-    "Res. - Formaat",
-    "Fabrieksinstellingen herstellen en opnieuw opstarten?",
-    "Resultaat",
-    "Terug naar QR-lezer",
-    "Opnieuw Beoordelen",
-    "Controleer gescande gegevens en bewerk indien nodig",
-    "Rechts",
-    "Dobbel een dobbelsteen minstens %d keer voor het genereren van een geheugensteun.",
-    "Roldistributie:",
-    "Gedobbeld:",
-    "Roteer 180°",
-    "SD kaart",
-    "SD kaart niet gedetecteerd.",
-    "Gedobbelde SHA256:",
-    "Momentopname van SHA256:",
-    "QR-afbeelding opslaan op SD kaart",
-    "Opslaan op SD kaart",
-    "Opslaan op SD kaart?",
-    "Opgeslagen op SD kaart:",
-    "Schaal",
-    "Adres scannen",
-    "BIP39 Wachtwoord Scannen",
-    "QR Code Sleutel Scannen",
-    "Woorden 1 t/m 12 opnieuw scannen",
-    "Woorden 13 t/m 24 scannen",
-    "Schermbeveiligingstijd",
-    "Scripttype",
-    "Beveiliging",
-    "Overschrijving naar jezelf, of wisselgeld (%d):",
-    "Zelf overschrijving:",
-    "Stel eerst een sabotagecontrolecode in",
-    "Instellingen",
-    "Instellingen intern opgeslagen op flitser.",
-    "Instellingen opgeslagen op SD kaart.",
-    "Shannon's entropie:",
-    "Toon datum",
-    "Afsluiten",
-    "Uitschakelingstijd",
-    "Uitschakelen…",
-    "Ondertekenen",
-    "Teken op QR-code",
-    "Teken op SD kaart",
-    "Ondertekenen?",
-    "Handtekening:",
-    "Bericht ondertekend",
-    "PSBT ondertekend",
-    "RAW-hash ondertekenen. Ga alleen verder als je de bron vertrouwt.",
-    "Signing…",
-    "Enkele sleutel",
-    "Grootte:",
-    "Sommige controles kunnen niet worden uitgevoerd.",
-    "Sommige knooppunten zijn niet gehard:",
-    "Uitgaven (%d):",
-    "Uitgaven:",
-    "Standaardmodus",
-    "Statisch",
-    "Statistieken voor nerds",
-    "Opslaan op apparaat",
-    "Opslaan op SD kaart",
-    "Sterkte",
-    "Sterk",
-    "Verander modus",
-    "TC Flash Hash",
-    "Hash Flash bij het opstarten",
-    "TIK of ENTER voor opname",
-    "TIK of ENTER voor installeren.",
-    "TR interne sleutel",
-    "TX pin",
-    "Sabotagecontrolecode",
-    "Sabotagecontrolecode succesvol ingesteld",
-    "Sabotagecontrolecodes komen niet overeen",
-    "testreeks",
-    "Test Suite-resultaten",
-    "Test:",
-    "Tekst",
-    "Thema",
-    "Thermisch",
-    "Gebruik de functie 'Apparaat wissen' om te zorgen dat de gegevens onherstelbaar zijn",
-    "Helderheid schakelen",
-    "Hulpmiddelen",
-    "Aanraak gevoeligheid",
-    "Aanraakscherm",
-    "Meer proberen?",
-    "Voer een BIP39 wachtwoord in",
-    "Voer sleutel in",
-    "Ongedaan maken",
-    "Eenheid",
-    "KEF-ID bijwerken?",
-    "QR-label bijwerken?",
-    "Upgrade afgerond.",
-    "Gebruik een donker achergrond.",
-    "Gebruik de camera als entropie voor het aanmaken van een nieuwe geheugensteun",
-    "Huidige waarde",
-    "Standaard gebruiken?",
-    "Standaard PBKDF2-iter gebruiken.?",
-    "Vingerafdruk gebruiken als ID?",
-    "Gebruikt:",
-    "Gebruiker",
-    "Waarde %s is buiten bereik: [%s, %s]",
-    "Controleren…",
-    "Versie",
-    "Via camera",
-    "Via D20",
-    "Via D6",
-    "Via handmatige invoer",
-    "Via woorden",
-    "Zichtbaar label",
-    "Wacht op opname",
-    "Portemonnee",
-    "Descriptor",
-    "Portemonnee onjuist:",
-    "Portemonnee descriptor",
-    "Portemonnee descriptor geladen!",
-    "Portemonnee descriptor niet gevonden.",
-    "Waarschuwing:",
-    "Zwak",
-    "Woord %d",
-    "Woord nummers",
-    "Woorden",
-    "XOR-resultaat",
-    "XOR met",
-    "XOR huidig geheugensteuntje met een ander? (passphrase en descriptor worden weggegooid)",
-    "Yes",
-    "Ingezoomde modus",
-    "binair:",
-    "mislukt",
-    "van HEX",
-    "vanaf base32",
-    "vanaf basis43",
-    "vanaf base64",
-    "van hex",
-    "van utf8",
-    "is geen geldig adres",
-    "schuifgeval",
-    "Slaagkans:",
-    "veeg",
-    "tekst:",
-    "om te HEXEREN",
-    "naar base32",
-    "naar base43",
-    "naar base64",
-    "om te hexeren",
-    "naar utf8",
-    "onbekend",
-    "werd NIET GEVONDEN in de eerste %d adressen",
-]
+# pylint: disable=C0103,C0301
+catalog = (
+    b"`\x01\xb6\x11\x16\x00l\xfa\xa6\x02[\xa8b\x04\xed\x8e:\x06\xe6\x81m\x07B{d\x08\xb7\x06\xff\x08\nf"
+    b'\x00\n(\x1f\x16\x0c\xbcI\xdb\rpi"\x0e\xff#)\x0ef\x97\xa1\x0f\x8b\xea5\x11\x8arH\x11%\xc4'
+    b"\xc6\x14k\xd8\xe0\x14j\xc7\xd9\x16GG.\x17\x05\xd5R\x17\xeal\xf3\x17\x81\xd3*\x19\xbba\xc5\x19\xe0\x94"
+    b'\xdd\x19\x93\xc23\x1ck\xf8<\x1c\xbd\xc3\xd1\x1dhW\xae\x1f\xeat\x9b!\xf2\xb1\x1d"\x00\xb9/#Lj'
+    b"\xa3#\xf4\xb7\xec#k\xd7\xb4$\x13\t\xea$\xf1\xf7(&\xe9~\xaf&`Rp(\xfa\x1c*)\xa8\xda"
+    b'L)|\xb9\xb7)j\x91\\*\x93gx*\xeb\xf5\xea*s\xf1;+"\xd6r+\xf4\x85t-\x80\n'
+    b"\x87-\xe3\x13\xad-J\x9f\xea-\x9d.\x93.\xb80\xc4.uU\x8b/\x7f\x0b\xb5/\x8e\x83\xcf/g\xd4"
+    b"\xb80n\xea\xf30\x99\x1bi1\xef|73\x14\x15\xe83\xe5\x91o4\x86|\xea4\x1f\xaf\xfd4\xc9\xa3"
+    b"\xaa5\xbd\xca\xd85Z'S6\x02\xcb^6\xd5\x91\xb36\x16\x19\x087\xfc?[7\xd84\xf69\x89\x0f"
+    b"Z:\x81\xa9[;|\x91\xec;\x97\xb7\xed<\x95e7>\x1e\xd1\xfd>\xc0>L?\xfd\x91\x1f@x}"
+    b"=@\x87j\x8dA\xed\xf2\xc7A\xcc\x14BC\xdf~.D\xba\x16\x8bEhY\x0cF\xae\xc3,F\x11r"
+    b"?F! XF\x90\xb9\xa5F\x1a\xcd\xccF\x1c\n7G\xee\x08nG\x8fbzI30\xc0I\xf9\xd4"
+    b"'J?\xad&K`D\xd1Kg`\x16M\x8f\xe6\x15Na\xdcLP\x9b\x94\xe9Q\x12@\x88RJ\xde"
+    b"\xd6S8\xa4\xc0U?\x9c\x05V\x0c\xc8\xb4VB\x9dPW\x9c\x07\x01Xd\xe9\x83X\x87L\x97Y\xe8\xcc"
+    b"&Z\xa0[\xcf\\q\xd7\x08^\t\x84]^\x08i2_\x1c;\xa3b[\xb9\xdab*\xfe\x13c\xb9\x99"
+    b'3cd\n\xfdcY"\xa2d\x8d?\xf2dy\x96\x1de\x9d\x9e\x8de2\x8e\x00f\xc5\x1b\x18f`t'
+    b"\x85fY\xcftg\xcd8\xd1g\xed\xd1\njM\x865j\xa4.Kj\x13]\xd1j\x0bT\xa6k\xe8{"
+    b"}l\x94\xbc\xd4l0\x11\xe0m?\xfb*n]\x8eRn\x08{Xo\xb9m\x87o\xde\xd6\xcfom\x14"
+    b"@p_\xea\xa1p\xc3\x99\xd8p\xa8\x93)q\x8dirs0\x13\x16t\x8b\xf3 t\xe7\r5t\xe8\xda"
+    b"\xcat\x10Z\x0bu\xd9\xd4\x84v9\xab\xf4wYQ_xZ\x9b\xf9x\xe3\t\x00yw\xde|yq\xdf"
+    b"\xfcy4\xd9\xe0z\xac\x11e{)\x97\xc4{m\xa3\x89|\x9f\x8a\x9b|?\x0e\xf2\x80\x00\x1ei\x81\xa6Z"
+    b"\xc0\x81u\xc6W\x82\x0c\x11r\x85\xa2\xcb6\x86j\x8f~\x86\x80\xb1\x83\x86\xffY\x98\x86\xbe\xf6W\x87\x13-"
+    b"l\x87\xc3\x10\xfb\x87\xbc\x93\xb9\x88\xdf\xde\xe9\x88\xf2\xaf\x9f\x8a\xb6\xd1\x9f\x8a)\xbcE\x8b\x7f\x00\xc2\x8b*\xbc"
+    b"\xe1\x8ca\x90\x04\x8d\x89Q;\x8d\xdd\x8e2\x8f\xbf\xc3D\x90\x95\x8e}\x91\x0f$\x83\x93D\xa7\xff\x94\xb1\x8b"
+    b"#\x95\x0f\x8a@\x95\x1flE\x95n7#\x963\xd5+\x96Rv\x13\x99J\xc7\xaa\x99\xdb\xd0\xd0\x99&\x1f"
+    b"\x1d\x9a\x03 5\x9a\xa2]\xb1\x9aO?\x11\x9b\xf9\x08\xb9\x9b-\xcb\x9f\x9d\xfa\x03\x04\x9fp}?\x9f\xd0\x8b"
+    b"p\x9fw+i\xa0D\xde\x87\xa0\xad\x08\xce\xa0y\xe5\xf1\xa0\x9a\xfe\x03\xa1\xbfX\xe0\xa2.\xc5\x1b\xa3\x12\xe1"
+    b"\x1b\xa3V\xd4J\xa3\x0f<\xab\xa3\xee\xa8\xfa\xa3\xaa\x0cJ\xa4\xf8\xe2\x19\xa6\xe4\xa8T\xa6\x9d\xeb\xe8\xa7\xc3\xc2"
+    b"\xec\xa7\x18\xde \xa8\xc0\x12\x06\xa9P]\x94\xa9\x1ei\xa7\xaaX\xcb\xa8\xabNw\xa9\xabO\xd9\xfb\xac\xc7\xa7"
+    b"&\xadY\xb5'\xaf \xbe9\xaf\xc0ZG\xaf\x0e\xa2\x9a\xaf\x881\xbc\xb0\x12s\xf0\xb0d\xa3\x8b\xb1\x8e7"
+    b"\x16\xb2I\xed\xdd\xb2O4\x88\xb3\xdd\xe6\x05\xb5\xfd\xe52\xb5\xfb\x95\x9d\xb5e\xf3#\xb8\xae\x87>\xb8]\x1f"
+    b"\x92\xb9\x07\x86\xf0\xb9\x163\r\xbbS;\xc3\xbeE\xb4\xa1\xbfh\xae\xd0\xbf\xb4\xbb?\xc1\xc3\xd2\xa4\xc1\x81@"
+    b"\xdf\xc1\xd5\xa5q\xc2;b\x95\xc2\x1dV\xf3\xc2\xa5V\xf8\xc2?Kl\xc3\xcc\xd3\xe8\xc4\xe8\x955\xc53\x8b"
+    b"}\xc5\xa4]U\xc6\x89\x87\x86\xc6\x0e\xc6\xda\xc6\xba\x81\xff\xc6\x97\xd5\x0c\xc7dW\x97\xc7^&\xc3\xc8B\xb6"
+    b'\xb7\xc9T\x8e<\xcb\x14\xb8\x97\xcc"^\x06\xcd\x92%)\xcd\x7f\x8a[\xcd\tn\xfc\xcd\x16ig\xd1\xe7\xa7'
+    b"z\xd1\xad\xf3\xd5\xd1\x83\x1d\x82\xd2\xed\xad\x89\xd3d\x00)\xd4v\x16L\xd4Z8a\xd4\xd0\xc2\x89\xd5\xbf\n"
+    b"\xb5\xd5k\x1b+\xd6\x92\xba\x11\xd8\\\x9d\x19\xd8O4\xa9\xd8\xcb\xf9\xeb\xd9VHU\xda\xbc]\xde\xda\x03Y"
+    b"\xf1\xda\x89^O\xdb\xa9\xe9Y\xdb0\x00\xa0\xdb\x99w@\xdeRI\xe6\xdeR\xdc\x10\xdf\xe9G<\xdf\xc23"
+    b"~\xdfg\xe9\x80\xdf\xdc\xdf\xb4\xdf\x95x\x9d\xe0]\xcb\xc3\xe2\x95w\xa3\xe44\xba\xb1\xe4WV\xca\xe4;\x9f"
+    b"@\xe5@\x81\xee\xe5\xb7\x00\x11\xe7I\xd0/\xe8\x87\xc4\xab\xe8\x95\x8f\xae\xe8\xf8\xdf=\xe9\x13!%\xear\xf0"
+    b"\xae\xea\xe5\x0c\t\xed\xe0\xdfT\xed/xy\xed/9\x9a\xee\x1c\x8a\xcb\xeej\xe8\xcf\xee\xb5a\x1f\xefb\xab"
+    b"C\xef\x0e\xc4\xaf\xf0\x95)\xb0\xf0\x974-\xf1\xbd\x0c.\xf2)\x9e`\xf31\xd9\xee\xf3\xfa\x95\xfc\xf3\xdc\x97"
+    b"\x06\xf4\tdW\xf4\x8e\xb9\x87\xf4E\x1e\xd1\xf4\xe7`k\xf5\x06\xe8\xa1\xf5\xf1k\xbe\xf5\xd1Wa\xf7\xa6H"
+    b"p\xf7\xe8\xe3'\xf9\xafz\xce\xf9wr\x05\xfcD0I\xfc\xb3`P\xfd^\xee\xa0\xfd\x9d\xa0\xdd\xfe>L"
+    b"?\xff\x00\x00\x00\x00M\x00\x00\x00s\x00\x00\x00\x89\x00\x00\x00\x99\x00\x00\x00\xa3\x00\x00\x00\xa9\x00\x00\x00\xba\x00"
+    b"\x00\x00\xd2\x00\x00\x00\xdf\x00\x00\x00\xf0\x00\x00\x00\x04\x01\x00\x00\x1a\x01\x00\x00!\x01\x00\x00'\x01\x00\x001\x01"
+    b"\x00\x00:\x01\x00\x00F\x01\x00\x00a\x01\x00\x00\x8e\x01\x00\x00\x9f\x01\x00\x00\xbb\x01\x00\x00\xdb\x01\x00\x00\xe5\x01"
+    b"\x00\x00\xf5\x01\x00\x00\x01\x02\x00\x00\x0c\x02\x00\x00\x1d\x02\x00\x00L\x02\x00\x00v\x02\x00\x00\x93\x02\x00\x00\xa8\x02"
+    b"\x00\x00\xb3\x02\x00\x00\xb5\x02\x00\x00\xbf\x02\x00\x00\xcf\x02\x00\x00\xe1\x02\x00\x00\xf6\x02\x00\x00\x01\x03\x00\x00\x18\x03"
+    b"\x00\x00:\x03\x00\x00[\x03\x00\x00a\x03\x00\x00\x85\x03\x00\x00\x98\x03\x00\x00\xa4\x03\x00\x00\x0c\x04\x00\x00\x14\x04"
+    b"\x00\x00\x1a\x04\x00\x00\x1e\x04\x00\x00o\x04\x00\x00~\x04\x00\x00\x89\x04\x00\x00\x91\x04\x00\x00\xaf\x04\x00\x00\xb6\x04"
+    b'\x00\x00\xce\x04\x00\x00\xd5\x04\x00\x00\xe7\x04\x00\x00\x0b\x05\x00\x00"\x05\x00\x007\x05\x00\x00d\x05\x00\x00i\x05'
+    b"\x00\x00\x9d\x05\x00\x00\xaa\x05\x00\x00\xb2\x05\x00\x00\xc7\x05\x00\x00\xd2\x05\x00\x00\xe9\x05\x00\x00\xf7\x05\x00\x00\x06\x06"
+    b"\x00\x00\x17\x06\x00\x00U\x06\x00\x00]\x06\x00\x00h\x06\x00\x00t\x06\x00\x00\x86\x06\x00\x00\x92\x06\x00\x00\xa0\x06"
+    b"\x00\x00\xa5\x06\x00\x00\xb4\x06\x00\x00\xcb\x06\x00\x00\xd9\x06\x00\x00\xf7\x06\x00\x00\t\x07\x00\x00\x11\x07\x00\x00\x15\x07"
+    b"\x00\x00#\x07\x00\x00,\x07\x00\x00>\x07\x00\x00n\x07\x00\x00\x81\x07\x00\x00\x8f\x07\x00\x00\xa6\x07\x00\x00\xb0\x07"
+    b"\x00\x00\xc4\x07\x00\x00\xcd\x07\x00\x00\xe2\x07\x00\x00\xee\x07\x00\x00\xf8\x07\x00\x00\x14\x08\x00\x00%\x08\x00\x00E\x08"
+    b"\x00\x00S\x08\x00\x00k\x08\x00\x00\x96\x08\x00\x00\x9b\x08\x00\x00\xac\x08\x00\x00\xc5\x08\x00\x00\xd1\x08\x00\x00\xda\x08"
+    b"\x00\x00\xe7\x08\x00\x00\x12\t\x00\x00\x18\t\x00\x00>\t\x00\x00I\t\x00\x00W\t\x00\x00]\t\x00\x00\x90\t"
+    b"\x00\x00\xa4\t\x00\x00\xb0\t\x00\x00\xb7\t\x00\x00\xd2\t\x00\x00\xde\t\x00\x00\xed\t\x00\x00\t\n\x00\x00\x1b\n"
+    b"\x00\x00!\n\x00\x00,\n\x00\x00<\n\x00\x00E\n\x00\x00h\n\x00\x00p\n\x00\x00}\n\x00\x00\xa1\n"
+    b"\x00\x00\xc9\n\x00\x00\xd2\n\x00\x00\xdc\n\x00\x00\xe3\n\x00\x00\x13\x0b\x00\x00\x1e\x0b\x00\x00|\x0b\x00\x00\xa7\x0b"
+    b"\x00\x00\xba\x0b\x00\x00\xc0\x0b\x00\x00\xcf\x0b\x00\x00\xe7\x0b\x00\x00\xf7\x0b\x00\x00\x02\x0c\x00\x00\x0f\x0c\x00\x00\x13\x0c"
+    b"\x00\x00&\x0c\x00\x00,\x0c\x00\x00?\x0c\x00\x00X\x0c\x00\x00`\x0c\x00\x00v\x0c\x00\x00}\x0c\x00\x00\x91\x0c"
+    b"\x00\x00\x9e\x0c\x00\x00\xad\x0c\x00\x00\xbc\x0c\x00\x00\xc7\x0c\x00\x00\xce\x0c\x00\x00\xdc\x0c\x00\x00\xef\x0c\x00\x00\x03\r"
+    b"\x00\x00\x08\r\x00\x00.\r\x00\x00:\r\x00\x00B\r\x00\x00\x86\r\x00\x00\x9c\r\x00\x00\xf0\r\x00\x00\x02\x0e"
+    b"\x00\x00\n\x0e\x00\x00\x18\x0e\x00\x00(\x0e\x00\x002\x0e\x00\x00D\x0e\x00\x00y\x0e\x00\x00\x8d\x0e\x00\x00\xbd\x0e"
+    b"\x00\x00\xc4\x0e\x00\x00\xf9\x0e\x00\x00\n\x0f\x00\x00W\x0f\x00\x00\x98\x0f\x00\x00\xb4\x0f\x00\x00C\x10\x00\x00h\x10"
+    b"\x00\x00t\x10\x00\x00|\x10\x00\x00\x8b\x10\x00\x00\x9e\x10\x00\x00\xa8\x10\x00\x00\xb9\x10\x00\x00\xce\x10\x00\x00\xd7\x10"
+    b"\x00\x00\xe5\x10\x00\x00\x04\x11\x00\x00\x11\x11\x00\x00!\x11\x00\x00&\x11\x00\x00+\x11\x00\x00/\x11\x00\x00<\x11"
+    b"\x00\x00Z\x11\x00\x00f\x11\x00\x00|\x11\x00\x00\x85\x11\x00\x00\x99\x11\x00\x00\xae\x11\x00\x00\xbc\x11\x00\x00\xd5\x11"
+    b"\x00\x00\xf0\x11\x00\x00\xfa\x11\x00\x00\x0c\x12\x00\x00\x19\x12\x00\x00-\x12\x00\x00>\x12\x00\x00E\x12\x00\x00R\x12"
+    b"\x00\x00`\x12\x00\x00s\x12\x00\x00w\x12\x00\x00\x80\x12\x00\x00\xa5\x12\x00\x00\xb6\x12\x00\x00\xc3\x12\x00\x00\xe4\x12"
+    b"\x00\x00\xec\x12\x00\x00\x04\x13\x00\x00\x0b\x13\x00\x00#\x13\x00\x00G\x13\x00\x00N\x13\x00\x00|\x13\x00\x00\x89\x13"
+    b"\x00\x00\x97\x13\x00\x00\x9e\x13\x00\x00\xa5\x13\x00\x00\xb6\x13\x00\x00\x19\x14\x00\x001\x14\x00\x008\x14\x00\x00K\x14"
+    b"\x00\x00h\x14\x00\x00\x9b\x14\x00\x00\xad\x14\x00\x00\xba\x14\x00\x00\xc7\x14\x00\x00\xd6\x14\x00\x00\xe2\x14\x00\x00\x00\x15"
+    b"\x00\x00\t\x15\x00\x00\x17\x15\x00\x00-\x15\x00\x002\x15\x00\x00A\x15\x00\x00I\x15\x00\x00\\\x15\x00\x00p\x15"
+    b"\x00\x00|\x15\x00\x00\n\x16\x00\x00\x10\x16\x00\x00\x19\x16\x00\x00*\x16\x00\x004\x16\x00\x00C\x16\x00\x00J\x16"
+    b"\x00\x00^\x16\x00\x00r\x16\x00\x00~\x16\x00\x00\xb3\x16\x00\x00\xc6\x16\x00\x00\xdc\x16\x00\x00\xe1\x16\x00\x00\xf3\x16"
+    b"\x00\x00\x01\x17\x00\x00X\x17\x00\x00l\x17\x00\x00\x83\x17\x00\x00\x8f\x17\x00\x00\xb2\x17\x00\x00\xc7\x17\x00\x00\xd2\x17"
+    b"\x00\x00\xdb\x17\x00\x00\xe9\x17\x00\x00\t\x18\x00\x00&\x18\x00\x00?\x18\x00\x00Q\x18\x00\x00V\x18\x00\x00f\x18"
+    b"\x00\x00m\x18\x00\x00\x95\x18\x00\x00\x99\x18\x00\x00\xad\x18\x00\x00\xfa\x18\x00\x00\t\x19\x00\x00\x16\x19\x00\x00+\x19"
+    b"\x00\x00N\x19\x00\x00Z\x19\x00\x00n\x19\x00\x00y\x19\x00\x00\x85\x19\x00\x00\x99\x19\x00\x00\x9f\x19\x00\x00\xb3\x19"
+    b"\x00\x00\xc1\x19\x00\x00\xca\x19\x00\x00\xd6\x19\x00\x00\x1d\x1a\x00\x00;\x1a\x00\x00R\x1a\x00\x00V\x1a\x00\x00o\x1a"
+    b"\x00\x00x\x1a\x00\x00\x80\x1a\x00\x00\x94\x1a\x00\x00\x9d\x1a\x00\x00\xc1\x1a\x00\x00\xe1\x1a\x00\x00\x04\x1b\x00\x00\x1e\x1b"
+    b"\x00\x00I\x1b\x00\x00`\x1b\x00\x00x\x1b\x00\x00\xca\x1b\x00\x00\xcd\x1b\x00\x00\xd8\x1b\x00\x00\xee\x1b\x00\x00\x0c\x1c"
+    b"\x00\x00\x1c\x1c\x00\x00:\x1c\x00\x00H\x1c\x00\x00U\x1c\x00\x00b\x1c\x00\x00\x8b\x1c\x00\x00\x92\x1c\x00\x00\x9f\x1c"
+    b"\x00\x00\xae\x1c\x00\x00\xeb\x1c\x00\x00\xf5\x1c\x00\x00\xfb\x1c\x00\x00\x11\x1d\x00\x00\x1b\x1d\x00\x00J\x1d\x00\x00Q\x1d"
+    b"\x00\x00^\x1d\x00\x00Voer elk woord van jouw BI"
+    b"P39 geheugensteun in als een oct"
+    b"aal van 1 tot 4000.Verzamelen va"
+    b"n camera entropie misluktGeheuge"
+    b"nsteun aanmakenVoedingssnelheidS"
+    b"nijdiepteOpslagAfdrukken naar QR"
+    b"QR-code maken van tekst?om te HE"
+    b"XEREN% van het bedrag.Laden vana"
+    b"f SD kaartOngeldige portemonnee:"
+    b"Tarief:tekst:ScripttypeResultaat"
+    b"VersleutelenOntsleutelen is niet"
+    b" geluktWijzigingen blijven van k"
+    b"racht tot afsluiten.Andere indel"
+    b"ingenVoer een BIP39 wachtwoord i"
+    b"nBevestig de sabotagecontrolecod"
+    b"eGedobbeld:WachtwoordlengteInste"
+    b"llingenType beleidPatroon gevond"
+    b"en!Voer elk woord van jouw BIP39"
+    b" geheugensteun in.Instellingen i"
+    b"ntern opgeslagen op flitser.Kon "
+    b"niet geconverteerd wordenVia han"
+    b"dmatige invoerSnijmethodeGaSlaag"
+    b"kans:Ingezoomde modusOmgekeerde "
+    b"kleurenOnvoldoende Entropie!Aang"
+    b"emaakt:Dubbel geheugensteuntjeEx"
+    b"porteren van %s naar SD-kaart\xe2\x80\xa6"
+    b"QR-afbeelding opslaan op SD kaar"
+    b"tRX pinInstellingen opgeslagen o"
+    b"p SD kaart.Opslaan op SD kaartHu"
+    b"lpmiddelenBij aanpassen van de p"
+    b"ortemonnee zal er een nieuwe sle"
+    b"utel gegenereerd worden en ontla"
+    b"adt de Descriptor.Bericht:Schaal"
+    b"TaalDobbel een dobbelsteen minst"
+    b"ens %d keer voor het genereren v"
+    b"an een geheugensteun.Uitschakele"
+    b"n\xe2\x80\xa6Duik tariefWoord %dTIK of EN"
+    b"TER voor installeren.SterkteMome"
+    b"ntopname van SHA256:van hexAfdru"
+    b"kken naar QR?Bestandsnaam %s bes"
+    b"taat op SD kaart.Ongeldige aflei"
+    b"dingspadLaden vanaf SD kaart?PAG"
+    b"E om de helderheid aan of uit te"
+    b" schakelenFout:Richt de camera e"
+    b"n back-upplaat op de juiste mani"
+    b"er.XOR-resultaatLCD-typeTest Sui"
+    b"te-resultatenschuifgevalQR Code "
+    b"Sleutel ScannenRand opvullingLij"
+    b"n vertragingSlechte entropie!Maa"
+    b"k geperforeerde stippen zwart zo"
+    b"dat ze worden gedetecteerd.van u"
+    b"tf8BeveiligingAccountindexWeet j"
+    b"e het zeker?OndertekenenStandaar"
+    b"dmodusVrij:(alleen inzien)Camera"
+    b" wordt geladen\xe2\x80\xa6Ongedaan makenV"
+    b"ingerafdruk gebruiken als ID?Ged"
+    b"obbelde SHA256:QR-labelTaal%s ve"
+    b"rwijderd.Thermisch%d van %d mult"
+    b"isig%d adressen gecontroleerd zo"
+    b"nder overeenkomsten.Tinyseed afd"
+    b"rukken?Goede entropieStatistieke"
+    b"n voor nerdsAangepast:Versleutel"
+    b"de QR codeUitgaven:Standaard por"
+    b"temonneeDeel M van N24 woordenHu"
+    b"idige sabotagecontrolecodeKEF-ID"
+    b" bijwerken?Flash gevuld met came"
+    b"ra-entropieFluit diameterDit bes"
+    b"tand verwijderen?Geheugensteun e"
+    b"n wachtwoord worden bewaard.Them"
+    b"aDatum converterenGeheugensteun "
+    b"verwijderenvanaf base64%d tot %d"
+    b"Handtekening:Firmwarebestanden v"
+    b"an SD kaart verwijderen?OctaalTh"
+    b"ema veranderen en opnieuw opstar"
+    b"ten?naar base43Huidige waardeReg"
+    b"io:Controleer gescande gegevens "
+    b"en bewerk indien nodigConvertere"
+    b"n gedaan.\rInschakelen?binair:Bew"
+    b"ijsbaar niet besteedbaar%s: gela"
+    b"den!Platte tekst QRUitgebreide p"
+    b"ublieke sleutelDescriptoradresse"
+    b"nAantalnaar base32Aangepaste tek"
+    b"sttestreeksGebruikersgegevens wo"
+    b"rden gewist\xe2\x80\xa6VermogenAdressenli"
+    b"jstWijzigingsadressen worden gel"
+    b"aden\xe2\x80\xa6Sabotagecontrolecodes kom"
+    b"en niet overeenAfsluitenToon dat"
+    b"umQR codeVersleutelde geheugenst"
+    b"eun is opgeslagen met ID:BGR-kle"
+    b"urenWis uw SD kaart volledig in "
+    b"een ander apparaat om te zorgen "
+    b"dat de gegevens onherstelbaar zi"
+    b"jnwerd NIET GEVONDEN in de eerst"
+    b"e %d adressenAdressen exporteren"
+    b"VersieUit data-opslagTIK of ENTE"
+    b"R voor opnameLaden van cameraVia"
+    b" woordenGeheugensteunOverShannon"
+    b"'s entropie:RechtsBericht ondert"
+    b"ekendVoer %d BIP39 woorden in.Gr"
+    b"ootte:SchermbeveiligingstijdBeri"
+    b"chtDebounce van knoppenBinair ra"
+    b"sterVoer sleutel inZichtbaar lab"
+    b"elPortemonneeEenheidUitgaven (%d"
+    b"):Opslaan op SD kaartis geen gel"
+    b"dig adresLijn:Stel eerst een sab"
+    b"otagecontrolecode inVersleutelen"
+    b"Laden\xe2\x80\xa6Een vertrouwde portemonn"
+    b"ee descriptor laden om adressen "
+    b"te bekijken?Ongeldige handtekeni"
+    b"ngGebruik de functie 'Apparaat w"
+    b"issen' om te zorgen dat de gegev"
+    b"ens onherstelbaar zijnTR interne"
+    b" sleutelStatischEnkele sleutelTe"
+    b"ken op QR-codeDescriptorGeen wac"
+    b"htwoordzinVoer een sabotagecontr"
+    b"olecode van 6 of meer tekens inS"
+    b"abotagecontrolecodeSommige contr"
+    b"oles kunnen niet worden uitgevoe"
+    b"rd.KnoppenFabrieksinstellingen h"
+    b"erstellen en opnieuw opstarten?P"
+    b"ortemonnee ladenGebruik de camer"
+    b"a als entropie voor het aanmaken"
+    b" van een nieuwe geheugensteunRAW"
+    b"-hash ondertekenen. Ga alleen ve"
+    b"rder als je de bron vertrouwt.Ha"
+    b"sh Flash bij het opstartenEr zij"
+    b"n niet-ASCII-tekens gedetecteerd"
+    b" in uw wachtwoordzin. Krux kan n"
+    b"iet garanderen dat andere portef"
+    b"euilles dezelfde sleutel zullen "
+    b"afleiden.Portemonnee descriptor "
+    b"niet gevonden.Roteer 180\xc2\xb0Decima"
+    b"alWacht op opnameQR-label bijwer"
+    b"ken?HelderheidBase64-wachtwoordP"
+    b"ixelafwijkingsindex:Doorgaan?Ong"
+    b"eldig adresPortemonnee descripto"
+    b"r geladen!om te hexerenVersleute"
+    b"l modusTekstSterkZwakWaarschuwin"
+    b"g:Gebruik een donker achergrond."
+    b"HexadecimaalAnti-verblindingsmod"
+    b"usOntvangenHelderheid schakelenP"
+    b"ortemonnee wijzigen?Meer probere"
+    b"n?Woorden 13 t/m 24 scannenSD ka"
+    b"art niet gedetecteerd.12 woorden"
+    b"Opnieuw BeoordelenOntsleutelen?B"
+    b"ackup geheugensteunUpgrade afger"
+    b"ond.van HEXOpslaglocatieRes. - F"
+    b"ormaatGeheugensteun ladenLeegnaa"
+    b"r utf8Sommige knooppunten zijn n"
+    b"iet gehard:Teken op SD kaartID b"
+    b"estaat alStandaard PBKDF2-iter g"
+    b"ebruiken.?onbekendX-co\xc3\xb6rdinaten"
+    b" spiegelenNetwerkBIP85-entropie "
+    b"afleiden?Geheugensteun opslaan i"
+    b"s niet geluktWoordenVersleutelde"
+    b" geheugensteun was niet opgeslag"
+    b"enAanraakschermPapier breedteSle"
+    b"utel%s tek.Test QR afdrukkenAlle"
+    b" opgeslagen versleutelde mnemoni"
+    b"cs en instellingen permanent uit"
+    b" het flashgeheugen verwijderen?P"
+    b"rinter wordt geladen\xe2\x80\xa6NummersTe"
+    b"rug naar QR-lezerDruk op PAGE om"
+    b" te annuleren.Controleer of dit "
+    b"adres bij deze portemonnee hoort"
+    b"?Opname geannuleerdAfleidingspad"
+    b"Laden misluktKEF versleuteldInvo"
+    b"er (%d):Ongeldige sabotagecontro"
+    b"lecodeGemiddeldOverschrijven?Sle"
+    b"utel niet verstrektAdresRoldistr"
+    b"ibutie:WeergaveOpslaan op appara"
+    b"atStandaard gebruiken?Bestandsna"
+    b"amAls het scherm van uw apparaat"
+    b" na deze wijziging niet werkt, w"
+    b"ordt het na 5 seconden automatis"
+    b"ch opnieuw opgestart met de vori"
+    b"ge instellingen.Laden?Gebruikt:O"
+    b"pnieuw opstartenAfdrukken?(Exper"
+    b"imenteel)XOR metType gereedschap"
+    b"skopPortemonnee onjuist:vanaf ba"
+    b"se32Wachtwoordzin voor portemonn"
+    b"ee toevoegen of wijzigen?Control"
+    b"eer SD kaartBezig met afdrukken\xe2"
+    b"\x80\xa6TerugAangepaste QR-codeVerande"
+    b"r modusXOR huidig geheugensteunt"
+    b"je met een ander? (passphrase en"
+    b" descriptor worden weggegooid)Op"
+    b"slaan op SD kaart?Geheugensteun "
+    b"genererenDeel grootteLaadt een p"
+    b"ortemonnee descriptor inHex publ"
+    b"ieke sleutel:VersleuteldAanpasse"
+    b"nToch doorgaan?Kan adreswijzigin"
+    b"g niet bepalen.Gegevens van gebr"
+    b"uiker wissenNieuwe firmware gevo"
+    b"nden.UitschakelingstijdLinksPSBT"
+    b" ondertekendmisluktSabotagecontr"
+    b"olecode succesvol ingesteldveegA"
+    b"anraak gevoeligheidVoer elk woor"
+    b"d van jouw BIP39 geheugensteun i"
+    b"n als een nummer van 1 tot 2048."
+    b"Verwijderen %s?Woord nummersPad "
+    b"komt niet overeenOntvangstadress"
+    b"en worden geladen\xe2\x80\xa6Verwerken\xe2\x80\xa6"
+    b"Zelf overschrijving:Wisselgeld:F"
+    b"lash vullenKrux printer test QRK"
+    b"laar?Bestanden verkennen?Control"
+    b"eren\xe2\x80\xa6UiterlijkHoge kosten!Scha"
+    b"kel het apparaat niet uit, het k"
+    b"an even duren voordat het klaar "
+    b"is.Printer driver niet ingesteld"
+    b"!Verberg geheugensteunenDeelHand"
+    b"tekening bestand mistBaudratioSD"
+    b" kaartFabrieksinstellingenGebrui"
+    b"kerWaarde %s is buiten bereik: ["
+    b"%s, %s]Woorden 1 t/m 12 opnieuw "
+    b"scannenVingerafdruk niet ingeste"
+    b"ld in PSBTControleren op SD-kaar"
+    b"t\xe2\x80\xa6De flash vullen met entropie"
+    b" van de camera?Opgeslagen op SD "
+    b"kaart:BIP39 Wachtwoord ScannenVo"
+    b"er elk woord van jouw BIP39 gehe"
+    b"ugensteun in als een hexadecimaa"
+    b"l van 1 tot 800.Neenaar base64Ni"
+    b"et genoeg gedobbeld!Ongeldige ge"
+    b"heugensteun lengteQR-code aanmak"
+    b"enPAGINA om de modus te wisselen"
+    b"Diepte per pasvanaf basis43Adres"
+    b" scannenExtra entropie van camer"
+    b"a vereist voor %sOmkerenApparaat"
+    b"testsTerug naar menuLaat leeg al"
+    b"s je wilt dat Krux een geldig la"
+    b"atste woord kiestVia cameraTX pi"
+    b"nPortemonnee descriptorWachtwoor"
+    b"dOverschrijving naar jezelf, of "
+    b"wisselgeld (%d):Lengte:Onderteke"
+    b"nen?"
+)
@@ -19,382 +19,339 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-# pylint: disable=C0301
-translation_array = [
-    "% do total.",
-    "%d de %d multisig",
-    "%d a %d",
-    "%s bits",
-    "%s bytes",
-    "%s carac.",
-    "%s excluído.",
-    "%s: carregado!",
-    "(%s bits/px)",
-    "(Experimental)",
-    "(Somente visualização)",
-    "12 palavras",
-    "24 palavras",
-    "Sobre",
-    "Conta",
-    "Índice da Conta",
-    "Adicionar ou alterar a senha da carteira?",
-    "Entropia adicional da câmera é necessária para %s",
-    "Endereço",
-    "Alinhe a câmera e a placa de backup corretamente.",
-    "Modo antirreflexo",
-    "Aparência",
-    "Tem certeza?",
-    "Cores BGR",
-    "Mnemônico BIP39",
-    "Voltar",
-    "Voltar ao Menu",
-    "Mnemônico Backup",
-    "Assinatura inválida",
-    "Senha em Base64",
-    "Baudrate",
-    "Grade binária",
-    "Espaçamento da borda",
-    "Brilho",
-    "Botões",
-    "Debounce dos botões",
-    "Captura cancelada",
-    "Troco",
-    "Mudar o tema e reiniciar?",
-    "Mudar carteira?",
-    "Troco:",
-    "As alterações só durarão até o desligamento.",
-    "Explorar o cartão SD",
-    "Checar se o endereço pertence a esta carteira?",
-    "%d endereços checados sem correspondência.",
-    "Procurando por cartão SD…",
-    "Confirmar código de verificação de integridade",
-    "Converter dados",
-    "Não foi possível determinar endereços de troco.",
-    "Criar Código QR",
-    "Criar código QR a partir de texto?",
-    "Criado:",
-    "Código atual de verificação de integridade",
-    "Código QR personalizado",
-    "Texto Personalizado",
-    "Personalizar",
-    "Personalizar sua carteira gerará uma nova Chave e descarregará o Descritor.",
-    "Profundidade do corte",
-    "Método de corte",
-    "Datum",
-    "Decimal",
-    "Descriptografar?",
-    "Carteira Padrão",
-    "Excluir este arquivo?",
-    "Profundidade por passe",
-    "Caminho de Derivação",
-    "Derivar entropia BIP85?",
-    "Endereços do descritor",
-    "Testes do Dispositivo",
-    "Display",
-    "Não desligue, pode demorar um pouco para concluir.",
-    "Concluída a conversão",
-    "Concluído?",
-    "Mnemônico duplo",
-    "Driver",
-    "Vazio",
-    "Ativar?",
-    "Criptografar",
-    "Criptografado",
-    "Código QR Criptografado",
-    "Mnemônico criptografado armazenado com ID:",
-    "O mnemônico criptografado não foi armazenado",
-    "Criptografia",
-    "Modo de criptografia",
-    "Insira %d palavras BIP39.",
-    "Insira um código de verificação de integridade com mais de 6 caracteres",
-    "Digite o número de cada palavra do seu mnemônico BIP39, de 1 a 2048.",
-    "Digite o número em hexadecimal de cada palavra do seu mnemônico BIP39, de 1 a 800.",
-    "Digite o número em octal de cada palavra do seu mnemônico BIP39, de 1 a 4000.",
-    "Digite cada palavra do seu mnemônico BIP39.",
-    "Apagar Dados do Usuário",
-    "Apagando dados do usuário…",
-    "Erro:",
-    "Esc",
-    "Explorar arquivos?",
-    "Exportar endereços",
-    "Exportando %s para o cartão SD…",
-    "Chave Pública Estendida",
-    "Configurações de Fábrica",
-    "Falha ao capturar entropia da câmera",
-    "Falha ao converter",
-    "Falha ao descriptografar",
-    "Falha ao carregar",
-    "Falha ao armazenar mnemônico",
-    "Taxa:",
-    "Taxa de alimentação",
-    "Nome do arquivo",
-    "O nome do arquivo %s já existe no cartão SD.",
-    "Preencher a memória flash com entropia da câmera?",
-    "Preenchendo a memória flash",
-    "Fingerprint não definida no PSBT",
-    "Mapa da Flash",
-    "Ferramentas da Flash",
-    "Memória flash preenchida com entropia da câmera",
-    "Diâmetro da Fresa",
-    "Livre:",
-    "Do armazenamento",
-    "Apague totalmente seu cartão SD em outro dispositivo para garantir que os dados sejam irrecuperáveis",
-    "Gerar Mnemônico",
-    "Ir",
-    "Boa entropia",
-    "Hardware",
-    "Tipo de cabeçote",
-    "Chave pública hexadecimal:",
-    "Hexadecimal",
-    "Ocultar Mnemônicos",
-    "Taxas altas!",
-    "ID",
-    "ID já existe",
-    "Se a tela do seu dispositivo não funcionar após essa alteração, ele será reiniciado automaticamente com as configurações anteriores após 5 segundos.",
-    "Índice",
-    "Entradas (%d):",
-    "Entropia insuficiente!",
-    "Código de verificação de integridade inválido",
-    "Endereço inválido",
-    "Caminho de derivação inválido",
-    "Comprimento de mnemônico inválido",
-    "Carteira inválida:",
-    "Inverter",
-    "Cores invertidas",
-    "KEF criptografado",
-    "Chave",
-    "A chave não foi fornecida",
-    "Teste de impressão QR Krux",
-    "Tipo de LCD",
-    "Idioma",
-    "Deixe em branco se quiser que seja escolhida uma palavra final válida",
-    "Esquerda",
-    "Comprimento:",
-    "Atraso de Linha",
-    "Linha:",
-    "Listar Endereços",
-    "Carregar Mnemônico",
-    "Carregar Carteira",
-    "Carregar um descritor de carteira para visualizar endereços?",
-    "Carregar do cartão SD",
-    "Carregar do cartão SD?",
-    "Carregar da câmera",
-    "Carregar?",
-    "Carregando câmera…",
-    "Carregando endereços de alteração…",
-    "Carregando impressora…",
-    "Carregando endereços de recebimento…",
-    "Carregando…",
-    "Região",
-    "Salvar em",
-    "Média",
-    "Mensagem",
-    "Mensagem:",
-    "Miniscript",
-    "Coordenadas X espelhadas",
-    "Arquivo de assinatura não encontrado",
-    "Mnemônico",
-    "XOR Mnemônico",
-    "Mnemônico e senha serão mantidos.",
-    "Alterado:",
-    "Rede",
-    "Novo Mnemônico",
-    "Novo firmware detectado.",
-    "Não",
-    "Sem Senha",
-    "Caracteres não ASCII foram detectados em sua senha. A Krux não pode garantir que outras carteiras obtenham a mesma chave.",
-    "Jogadas insuficientes!",
-    "Números",
-    "Octal",
-    "Outros Formatos",
-    "Substituir?",
-    "PAGE para alternar o brilho",
-    "Iter. do PBKDF2",
-    "Pinte de preto os pontos perfurados para que sejam detectados.",
-    "Largura do papel",
-    "Parte",
-    "Parte M de N",
-    "Tamanho da peça",
-    "Senha",
-    "Comprimento da Senha",
-    "Incompatibilidade de caminho",
-    "Padrão detectado!",
-    "Remover permanentemente todos os mnemônicos criptografados e configurações armazenados na memória flash?",
-    "Salvar",
-    "Índice de desvio de pixels:",
-    "QR de texto simples",
-    "Carregue um descritor da carteira",
-    "Taxa de Mergulho",
-    "Tipo de Política",
-    "Entropia fraca!",
-    "Potência",
-    "Pressione PAGE para cancelar.",
-    "Pressione PAGE para alternar o modo",
-    "Imprimir QR de teste",
-    "Imprimir Tinyseed?",
-    "Imprimir QR",
-    "Imprimir QR?",
-    "Imprimir?",
-    "Impressora",
-    "Driver da impressora não definido!",
-    "Imprimindo…",
-    "Continuar mesmo assim?",
-    "Prosseguir?",
-    "Processando…",
-    "Não se pode gastar",
-    "Código QR",
-    "Etiqueta QR",
-    "Quantidade",
-    "Pino RX",
-    "Reiniciar",
-    "Recebimento",
-    "Região:",
-    "Excluir %s?",
-    "Excluir Mnemônico",
-    "Excluir arquivos de firmware do cartão SD?",
-    "Res. - Formato",
-    "Restaurar as configurações de fábrica e reiniciar?",
-    "Resultado",
-    "Retornar ao Visualizador de QR",
-    "Revisar Novamente",
-    "Revise os dados, edite se necessário",
-    "Direita",
-    "Role o dado pelo menos %d vezes para gerar um mnemônico.",
-    "Distribuição de jogadas:",
-    "Jogadas:",
-    "Rotacionar 180°",
-    "Cartão SD",
-    "Cartão SD não detectado.",
-    "SHA256 das jogadas:",
-    "SHA256 da imagem:",
-    "Salvar imagem do QR no cartão SD",
-    "Salvar no cartão SD",
-    "Salvar no cartão SD?",
-    "Salvo no cartão SD:",
-    "Escala",
-    "Escanear Endereço",
-    "Escanear a senha BIP39",
-    "Escanear Código QR da Chave",
-    "Escaneando as palavras de 1-12 novamente",
-    "Escaneando as palavras de 13-24",
-    "Tempo para proteção de tela",
-    "Tipo de Script",
-    "Segurança",
-    "Autotransferência ou Troco (%d):",
-    "Autotransferência:",
-    "Primeiro, defina um código de verificação de integridade",
-    "Configurações",
-    "Configurações armazenadas internamente na flash.",
-    "Configurações armazenadas no cartão SD.",
-    "Entropia de Shannon:",
-    "Mostrar dados",
-    "Desligar",
-    "Tempo de desligamento",
-    "Desligando…",
-    "Assinar",
-    "Assinar para código QR",
-    "Assinar no cartão SD",
-    "Assinar?",
-    "Assinatura:",
-    "Mensagem assinada",
-    "PSBT assinada",
-    "Assinando hash bruto. Prossiga somente se você confiar na fonte.",
-    "Assinando…",
-    "Single-sig",
-    "Tamanho:",
-    "Algumas verificações não serão realizadas.",
-    "Alguns nós não são hardened:",
-    "Gastos (%d):",
-    "Gasto:",
-    "Modo padrão",
-    "Estático",
-    "Estatísticas para nerds",
-    "Armazenar na memória flash",
-    "Armazenar no cartão SD",
-    "Força",
-    "Forte",
-    "Deslize para mudar de modo",
-    "TC Flash Hash",
-    "TC Flash Hash na Inicialização",
-    "TOQUE ou ENTER para capturar",
-    "TOQUE ou ENTER para instalar.",
-    "Chave interna TR",
-    "Pino TX",
-    "Código de verificação de integridade",
-    "Código de verificação de integridade definido com sucesso",
-    "Os códigos de verificação de integridade não correspondem",
-    "Suíte de testes",
-    "Resultados da suíte de testes",
-    "Teste:",
-    "Texto",
-    "Tema",
-    "Térmica",
-    "Para garantir que os dados sejam irrecuperáveis, use o recurso Limpar Dispositivo",
-    "Alternar brilho",
-    "Ferramentas",
-    "Limiar de Toque",
-    "Touchscreen",
-    "Tentar mais?",
-    "Digitar a senha BIP39",
-    "Digite a Chave",
-    "Desfazer",
-    "Unidade",
-    "Atualizar KEF ID?",
-    "Atualizar etiqueta QR?",
-    "Atualização concluída.",
-    "Use uma superfície de fundo preta.",
-    "Use a entropia da câmera para criar um novo mnemônico",
-    "Usar valor atual?",
-    "Usar o modo padrão?",
-    "Use o iter de chave padrão.?",
-    "Usar fingerprint como ID?",
-    "Usado:",
-    "Usuário",
-    "Valor %s fora do intervalo: [%s, %s]",
-    "Checando…",
-    "Versão",
-    "Pela Câmera",
-    "Via D20",
-    "Via D6",
-    "Por entrada manual",
-    "Via Palavras",
-    "Etiqueta visível",
-    "Aguarde a captura",
-    "Carteira",
-    "Descritor da Carteira",
-    "Carteira diferente:",
-    "Descritor da carteira",
-    "Descritor da carteira carregado!",
-    "O descritor da carteira não foi encontrado.",
-    "Aviso:",
-    "Fraca",
-    "Palavra %d",
-    "Números das Palavras",
-    "Palavras",
-    "Resultado XOR",
-    "XOR com",
-    "XOR mnemônico atual com outro? (senha e descritor serão descartados)",
-    "Sim",
-    "Modo ampliado",
-    "binário:",
-    "falha",
-    "from HEX",
-    "da base32",
-    "da base43",
-    "da base64",
-    "from hex",
-    "de utf8",
-    "é um endereço válido!",
-    "Trocar caixa",
-    "Taxa de sucesso:",
-    "deslize",
-    "texto:",
-    "para HEXADECIMAL",
-    "para base32",
-    "para base43",
-    "para base64",
-    "para hexadecimal",
-    "para utf8",
-    "desconhecida",
-    "NÃO FOI ENCONTRADO nos primeiros %d endereços",
-]
+# pylint: disable=C0103,C0301
+catalog = (
+    b"c\x01\xb6\x11\x16\x00l\xfa\xa6\x02[\xa8b\x04\xb1\xd5\xb0\x04\xed\x8e:\x06\xe6\x81m\x07B{d\x08\xb7\x06"
+    b'\xff\x08\nf\x00\n(\x1f\x16\x0c\xbcI\xdb\rpi"\x0e\xff#)\x0ef\x97\xa1\x0f\x8b\xea5\x11\x8ar'
+    b"H\x11%\xc4\xc6\x14k\xd8\xe0\x14j\xc7\xd9\x16GG.\x17\x05\xd5R\x17\xeal\xf3\x17\x81\xd3*\x19\xbba"
+    b'\xc5\x19\xe0\x94\xdd\x19\x93\xc23\x1ck\xf8<\x1c\xbd\xc3\xd1\x1dhW\xae\x1f\xeat\x9b!\xf2\xb1\x1d"\x00\xb9'
+    b"/#Lj\xa3#\xf4\xb7\xec#k\xd7\xb4$\x13\t\xea$\xf1\xf7(&\xe9~\xaf&`Rp(\xfa\x1c"
+    b'*)\xa8\xdaL)|\xb9\xb7)j\x91\\*\x93gx*\xeb\xf5\xea*s\xf1;+"\xd6r+\xf4\x85'
+    b"t-\x80\n\x87-\xe3\x13\xad-J\x9f\xea-\x9d.\x93.\xb80\xc4.uU\x8b/\x7f\x0b\xb5/\x8e\x83"
+    b"\xcf/g\xd4\xb80\x12Ec1\x99\x1bi1\xef|73\x14\x15\xe83\xe5\x91o4\x86|\xea4\x1f\xaf"
+    b"\xfd4\xc9\xa3\xaa5\xbd\xca\xd85Z'S6\x02\xcb^6\xd5\x91\xb36\x16\x19\x087\xfc?[7\xd84"
+    b"\xf69\x89\x0fZ:\x81\xa9[;|\x91\xec;\x97\xb7\xed<\x95e7>\x1e\xd1\xfd>\xc0>L?\xfd\x91"
+    b"\x1f@x}=@\x87j\x8dA\x84>\x96A\x05H\xb2A\xed\xf2\xc7Aq@\xf1B\xcc\x14BC\xdf~"
+    b".D\xba\x16\x8bEhY\x0cF\xae\xc3,F\x11r?F! XF\x90\xb9\xa5F\x1a\xcd\xccF\x1c\n"
+    b"7G\xee\x08nG\x16\xfb\xfbG\x8fbzI30\xc0I\xf9\xd4'J?\xad&K`D\xd1Kg`"
+    b"\x16MIs\xaaM\x8f\xe6\x15Na\xdcLP\x9b\x94\xe9Q\x12@\x88RJ\xde\xd6S8\xa4\xc0U?\x9c"
+    b"\x05V\x0c\xc8\xb4VB\x9dPW\x9c\x07\x01Xd\xe9\x83X\x87L\x97Y\xe8\xcc&Z\xa0[\xcf\\\t\x84"
+    b']^\x0c\x01k^\x08i2_\x1c;\xa3b[\xb9\xdab*\xfe\x13c\xb9\x993cd\n\xfdcY"'
+    b"\xa2d\x8d?\xf2dy\x96\x1de\x9d\x9e\x8de2\x8e\x00f\xc5\x1b\x18f`t\x85fY\xcftg\xcd8"
+    b"\xd1g\xed\xd1\njM\x865j\xa4.Kj\x13]\xd1j\x0bT\xa6k\xe8{}l\x94\xbc\xd4l0\x11"
+    b"\xe0m?\xfb*n]\x8eRn\x08{Xo\xb9m\x87o\xde\xd6\xcfom\x14@p_\xea\xa1p\xc3\x99"
+    b"\xd8p\xa8\x93)q\x8dirs0\x13\x16t\x8b\xf3 t\xe7\r5t\xe8\xda\xcat\x10Z\x0bu\xd9\xd4"
+    b"\x84v9\xab\xf4wYQ_xZ\x9b\xf9x\xe3\t\x00yw\xde|yq\xdf\xfcy4\xd9\xe0z\xac\x11"
+    b"e{)\x97\xc4{m\xa3\x89|\x9f\x8a\x9b|\xdeG\xa7}?\x0e\xf2\x80\x00\x1ei\x81\xa6Z\xc0\x81u\xc6"
+    b"W\x82\x0c\x11r\x85\xa2\xcb6\x86j\x8f~\x86\x80\xb1\x83\x86\xffY\x98\x86\xbe\xf6W\x87\x13-l\x87\xbc\x93"
+    b"\xb9\x88\xdf\xde\xe9\x88\xf2\xaf\x9f\x8a\xb6\xd1\x9f\x8a)\xbcE\x8b\x7f\x00\xc2\x8b*\xbc\xe1\x8ca\x90\x04\x8d\x89Q"
+    b";\x8d\xdd\x8e2\x8f\xbf\xc3D\x90\x95\x8e}\x91\x0f$\x83\x93D\xa7\xff\x94\xb1\x8b#\x95\x1flE\x95n7"
+    b"#\x963\xd5+\x96Rv\x13\x99J\xc7\xaa\x99\xdb\xd0\xd0\x99&\x1f\x1d\x9a\x03 5\x9a\xa2]\xb1\x9aO?"
+    b"\x11\x9b\xf9\x08\xb9\x9b-\xcb\x9f\x9d\xfa\x03\x04\x9fp}?\x9f\xd0\x8bp\x9fD\xde\x87\xa0\xad\x08\xce\xa0y\xe5"
+    b"\xf1\xa0\x9a\xfe\x03\xa1\xbfX\xe0\xa2.\xc5\x1b\xa3\x12\xe1\x1b\xa3V\xd4J\xa3\x0f<\xab\xa3\xee\xa8\xfa\xa3\xaa\x0c"
+    b"J\xa4\xf0\x84\x8a\xa5\xf8\xe2\x19\xa6\x9d\xeb\xe8\xa7\xc3\xc2\xec\xa7\x18\xde \xa8\xc0\x12\x06\xa9P]\x94\xa9\x1ei"
+    b"\xa7\xaaX\xcb\xa8\xabNw\xa9\xabO\xd9\xfb\xac\xc7\xa7&\xadY\xb5'\xaf \xbe9\xaf\xc0ZG\xaf\x0e\xa2"
+    b"\x9a\xaf\x881\xbc\xb0\x12s\xf0\xb0\x8e7\x16\xb28o\x8b\xb2I\xed\xdd\xb2O4\x88\xb3\xdd\xe6\x05\xb5\xfd\xe5"
+    b"2\xb5\xfb\x95\x9d\xb5e\xf3#\xb8\xae\x87>\xb8]\x1f\x92\xb9\x07\x86\xf0\xb9\x163\r\xbbS;\xc3\xbeE\xb4"
+    b"\xa1\xbfh\xae\xd0\xbf\xb4\xbb?\xc1z\xa1\x92\xc1\xc3\xd2\xa4\xc1\x81@\xdf\xc1\xd5\xa5q\xc2;b\x95\xc2\x1dV"
+    b"\xf3\xc2\xa5V\xf8\xc2\xcc\xd3\xe8\xc4\xe8\x955\xc53\x8b}\xc5\xa4]U\xc6\x89\x87\x86\xc6\x0e\xc6\xda\xc6\xba\x81"
+    b'\xff\xc6\x97\xd5\x0c\xc7^&\xc3\xc8B\xb6\xb7\xc9T\x8e<\xcb\x14\xb8\x97\xcc"^\x06\xcd\x92%)\xcd\x7f\x8a'
+    b"[\xcd\tn\xfc\xcd\x16ig\xd1\xe7\xa7z\xd1\xad\xf3\xd5\xd1\x83\x1d\x82\xd2\xed\xad\x89\xd3d\x00)\xd4v\x16"
+    b"L\xd4Z8a\xd4\xd0\xc2\x89\xd5\xbf\n\xb5\xd5k\x1b+\xd6\x92\xba\x11\xd8\\\x9d\x19\xd8O4\xa9\xd8\xcb\xf9"
+    b"\xeb\xd9VHU\xda\xbc]\xde\xda\x03Y\xf1\xda\x89^O\xdb\xa9\xe9Y\xdb0\x00\xa0\xdbn*\xa1\xdc\x99w"
+    b"@\xdeRI\xe6\xdeR\xdc\x10\xdf\xe9G<\xdf\xc23~\xdfg\xe9\x80\xdf\xdc\xdf\xb4\xdf\x95x\x9d\xe0]\xcb"
+    b"\xc3\xe2\x95w\xa3\xe44\xba\xb1\xe4WV\xca\xe4;\x9f@\xe5@\x81\xee\xe5\xb7\x00\x11\xe7I\xd0/\xe8\x87\xc4"
+    b"\xab\xe8\x95\x8f\xae\xe8\xf8\xdf=\xe9\x13!%\xea\xe5\x0c\t\xed\xe0\xdfT\xed/xy\xed/9\x9a\xee\x1c\x8a"
+    b"\xcb\xeej\xe8\xcf\xee\xb5a\x1f\xefb\xabC\xef\x0e\xc4\xaf\xf0\x95)\xb0\xf0\x974-\xf1\xbd\x0c.\xf2)\x9e"
+    b"`\xf31\xd9\xee\xf3\xfa\x95\xfc\xf3\xdc\x97\x06\xf4\tdW\xf4\x8e\xb9\x87\xf4E\x1e\xd1\xf4\xe7`k\xf5\x06\xe8"
+    b"\xa1\xf5\xf1k\xbe\xf5\xd1Wa\xf7\xa6Hp\xf7\xe8\xe3'\xf9\xafz\xce\xf9wr\x05\xfcD0I\xfc\xb3`"
+    b"P\xfd^\xee\xa0\xfd\x9d\xa0\xdd\xfe>L?\xff\x00\x00\x00\x00O\x00\x00\x00t\x00\x00\x00\x83\x00\x00\x00\x92\x00"
+    b"\x00\x00\xa7\x00\x00\x00\xbc\x00\x00\x00\xc2\x00\x00\x00\xcd\x00\x00\x00\xf0\x00\x00\x00\x00\x01\x00\x00\x0b\x01\x00\x00!\x01"
+    b"\x00\x004\x01\x00\x009\x01\x00\x00?\x01\x00\x00M\x01\x00\x00V\x01\x00\x00b\x01\x00\x00z\x01\x00\x00\xab\x01"
+    b"\x00\x00\xba\x01\x00\x00\xcf\x01\x00\x00\x00\x02\x00\x00\x08\x02\x00\x00\x1c\x02\x00\x00+\x02\x00\x00<\x02\x00\x00N\x02"
+    b"\x00\x00z\x02\x00\x00\xac\x02\x00\x00\xbe\x02\x00\x00\xd0\x02\x00\x00\xe0\x02\x00\x00\xe2\x02\x00\x00\xf2\x02\x00\x00\xff\x02"
+    b"\x00\x00\x0f\x03\x00\x00%\x03\x00\x00,\x03\x00\x00<\x03\x00\x00^\x03\x00\x00\x7f\x03\x00\x00\x86\x03\x00\x00\xb0\x03"
+    b"\x00\x00\xc7\x03\x00\x00\xd2\x03\x00\x00\x1f\x04\x00\x00(\x04\x00\x00.\x04\x00\x004\x04\x00\x00m\x04\x00\x00z\x04"
+    b"\x00\x00\x8a\x04\x00\x00\x94\x04\x00\x00\xb1\x04\x00\x00\xb7\x04\x00\x00\xc8\x04\x00\x00\xd5\x04\x00\x00\xe1\x04\x00\x00\x0f\x05"
+    b"\x00\x00/\x05\x00\x00F\x05\x00\x00a\x05\x00\x00f\x05\x00\x00\x98\x05\x00\x00\xa5\x05\x00\x00\xb0\x05\x00\x00\xce\x05"
+    b"\x00\x00\xda\x05\x00\x00\xf6\x05\x00\x00\x0b\x06\x00\x00\x1a\x06\x00\x00)\x06\x00\x00g\x06\x00\x00n\x06\x00\x00x\x06"
+    b"\x00\x00\x88\x06\x00\x00\x94\x06\x00\x00\x9b\x06\x00\x00\xa7\x06\x00\x00\xad\x06\x00\x00\xc5\x06\x00\x00\xd1\x06\x00\x00\xd8\x06"
+    b"\x00\x00\xed\x06\x00\x00\xf7\x06\x00\x00\xff\x06\x00\x00\x18\x07\x00\x00+\x07\x00\x006\x07\x00\x00=\x07\x00\x00J\x07"
+    b"\x00\x00R\x07\x00\x00c\x07\x00\x00\x8f\x07\x00\x00\xa1\x07\x00\x00\xad\x07\x00\x00\xb2\x07\x00\x00\xca\x07\x00\x00\xd3\x07"
+    b"\x00\x00\xeb\x07\x00\x00\xf1\x07\x00\x00\x01\x08\x00\x00\r\x08\x00\x00\x10\x08\x00\x00\x1b\x08\x00\x00H\x08\x00\x00Y\x08"
+    b"\x00\x00\x8a\x08\x00\x00\x9c\x08\x00\x00\xb1\x08\x00\x00\xd4\x08\x00\x00\xd8\x08\x00\x00\xe7\x08\x00\x00\xf9\x08\x00\x00\x02\t"
+    b"\x00\x00\t\t\x00\x00\x14\t\x00\x00?\t\x00\x00X\t\x00\x00f\t\x00\x00q\t\x00\x00\x82\t\x00\x00\x8a\t"
+    b'\x00\x00\xaf\t\x00\x00\xc6\t\x00\x00\xcd\t\x00\x00\xd6\t\x00\x00\xe9\t\x00\x00\xf7\t\x00\x00\n\n\x00\x00"\n'
+    b"\x00\x009\n\x00\x00C\n\x00\x00N\n\x00\x00a\n\x00\x00q\n\x00\x00\x8e\n\x00\x00\x97\n\x00\x00\xa8\n"
+    b"\x00\x00\xcf\n\x00\x00\x0c\x0b\x00\x00\x14\x0b\x00\x00!\x0b\x00\x00+\x0b\x00\x00V\x0b\x00\x00_\x0b\x00\x00\xc5\x0b"
+    b"\x00\x00\xf4\x0b\x00\x00\x07\x0c\x00\x00\x0e\x0c\x00\x00\x1e\x0c\x00\x00:\x0c\x00\x00M\x0c\x00\x00Y\x0c\x00\x00c\x0c"
+    b"\x00\x00h\x0c\x00\x00|\x0c\x00\x00\x83\x0c\x00\x00\x94\x0c\x00\x00\xad\x0c\x00\x00\xb5\x0c\x00\x00\xd2\x0c\x00\x00\xda\x0c"
+    b"\x00\x00\xee\x0c\x00\x00\xfc\x0c\x00\x00\n\r\x00\x00\x1b\r\x00\x00#\r\x00\x00*\r\x00\x006\r\x00\x00;\r"
+    b"\x00\x00O\r\x00\x00g\r\x00\x00m\r\x00\x00\xa8\r\x00\x00\xb4\r\x00\x00\xc1\r\x00\x00\xfe\r\x00\x00\x12\x0e"
+    b"\x00\x00d\x0e\x00\x00t\x0e\x00\x00}\x0e\x00\x00\x94\x0e\x00\x00\xa9\x0e\x00\x00\xb2\x0e\x00\x00\xfc\x0e\x00\x00#\x0f"
+    b"\x00\x00Q\x0f\x00\x00X\x0f\x00\x00\x8d\x0f\x00\x00\x9e\x0f\x00\x00\xd5\x0f\x00\x00\x16\x10\x00\x006\x10\x00\x00\xb1\x10"
+    b"\x00\x00\xdd\x10\x00\x00\xed\x10\x00\x00\xfe\x10\x00\x00\x14\x11\x00\x00\x1a\x11\x00\x00)\x11\x00\x00E\x11\x00\x00P\x11"
+    b"\x00\x00c\x11\x00\x00\x83\x11\x00\x00\x93\x11\x00\x00\xa7\x11\x00\x00\xac\x11\x00\x00\xb1\x11\x00\x00\xb6\x11\x00\x00\xbc\x11"
+    b"\x00\x00\xdf\x11\x00\x00\xf0\x11\x00\x00\xfb\x11\x00\x00\n\x12\x00\x00\x19\x12\x00\x00%\x12\x00\x00D\x12\x00\x00^\x12"
+    b"\x00\x00i\x12\x00\x00z\x12\x00\x00\x8a\x12\x00\x00\x9b\x12\x00\x00\xaf\x12\x00\x00\xc8\x12\x00\x00\xd1\x12\x00\x00\xdf\x12"
+    b"\x00\x00\xf2\x12\x00\x00\xf7\x12\x00\x00\x00\x13\x00\x00\x1f\x13\x00\x004\x13\x00\x00A\x13\x00\x00^\x13\x00\x00j\x13"
+    b"\x00\x00\x82\x13\x00\x00\x86\x13\x00\x00\x9d\x13\x00\x00\xba\x13\x00\x00\xc2\x13\x00\x00\xf0\x13\x00\x00\x00\x14\x00\x00\x05\x14"
+    b"\x00\x00\n\x14\x00\x00\x13\x14\x00\x00'\x14\x00\x00\x93\x14\x00\x00\xab\x14\x00\x00\xb3\x14\x00\x00\xd1\x14\x00\x00\xee\x14"
+    b"\x00\x00\x1d\x15\x00\x00.\x15\x00\x00D\x15\x00\x00U\x15\x00\x00f\x15\x00\x00t\x15\x00\x00\x84\x15\x00\x00\xb5\x15"
+    b"\x00\x00\xbb\x15\x00\x00\xc6\x15\x00\x00\xe0\x15\x00\x00\xe9\x15\x00\x00\x03\x16\x00\x00\x1e\x16\x00\x002\x16\x00\x00A\x16"
+    b"\x00\x00\xdd\x16\x00\x00\xe6\x16\x00\x00\xec\x16\x00\x00\xf5\x16\x00\x00\xfe\x16\x00\x00\x05\x17\x00\x00\x16\x17\x00\x00)\x17"
+    b"\x00\x002\x17\x00\x00[\x17\x00\x00p\x17\x00\x00}\x17\x00\x00\x83\x17\x00\x00\x9b\x17\x00\x00\xb5\x17\x00\x00\xfb\x17"
+    b"\x00\x00\x10\x18\x00\x00 \x18\x00\x000\x18\x00\x00Q\x18\x00\x00l\x18\x00\x00y\x18\x00\x00\x85\x18\x00\x00\x9b\x18"
+    b"\x00\x00\xcd\x18\x00\x00\xe5\x18\x00\x00\xfd\x18\x00\x00\x12\x19\x00\x00\x1a\x19\x00\x00'\x19\x00\x00,\x19\x00\x00h\x19"
+    b"\x00\x00o\x19\x00\x00~\x19\x00\x00\x84\x19\x00\x00\xca\x19\x00\x00\xd5\x19\x00\x00\xea\x19\x00\x00\x06\x1a\x00\x00-\x1a"
+    b"\x00\x00;\x1a\x00\x00N\x1a\x00\x00T\x1a\x00\x00p\x1a\x00\x00\x8b\x1a\x00\x00\x96\x1a\x00\x00\xa8\x1a\x00\x00\xb3\x1a"
+    b"\x00\x00\xbd\x1a\x00\x00\xc9\x1a\x00\x00\xfc\x1a\x00\x00\x1f\x1b\x00\x002\x1b\x00\x007\x1b\x00\x00\\\x1b\x00\x00f\x1b"
+    b"\x00\x00\x81\x1b\x00\x00\x89\x1b\x00\x00\xad\x1b\x00\x00\xd5\x1b\x00\x00\xf6\x1b\x00\x00\x12\x1c\x00\x00E\x1c\x00\x00Y\x1c"
+    b"\x00\x00o\x1c\x00\x00\xc3\x1c\x00\x00\xc7\x1c\x00\x00\xd2\x1c\x00\x00\xe8\x1c\x00\x00\x0b\x1d\x00\x00\x1b\x1d\x00\x00>\x1d"
+    b"\x00\x00T\x1d\x00\x00]\x1d\x00\x00o\x1d\x00\x00\xa3\x1d\x00\x00\xab\x1d\x00\x00\xc0\x1d\x00\x00\xce\x1d\x00\x00\x14\x1e"
+    b"\x00\x00 \x1e\x00\x00'\x1e\x00\x00<\x1e\x00\x00A\x1e\x00\x00b\x1e\x00\x00n\x1e\x00\x00v\x1e\x00\x00Di"
+    b"gite o n\xc3\xbamero em octal de cada "
+    b"palavra do seu mnem\xc3\xb4nico BIP39,"
+    b" de 1 a 4000.Falha ao capturar e"
+    b"ntropia da c\xc3\xa2meraNovo Mnem\xc3\xb4nic"
+    b"oIter. do PBKDF2Taxa de alimenta"
+    b"\xc3\xa7\xc3\xa3oProfundidade do corteSalvar"
+    b"Imprimir QRCriar c\xc3\xb3digo QR a pa"
+    b"rtir de texto?para HEXADECIMAL% "
+    b"do total.Carregar do cart\xc3\xa3o SDC"
+    b"arteira inv\xc3\xa1lida:Taxa:texto:Tip"
+    b"o de ScriptResultadoCriptografia"
+    b"Falha ao descriptografarAs alter"
+    b"a\xc3\xa7\xc3\xb5es s\xc3\xb3 durar\xc3\xa3o at\xc3\xa9 o desl"
+    b"igamento.Outros FormatosDigitar "
+    b"a senha BIP39Confirmar c\xc3\xb3digo d"
+    b"e verifica\xc3\xa7\xc3\xa3o de integridadeJo"
+    b"gadas:Comprimento da SenhaConfig"
+    b"ura\xc3\xa7\xc3\xb5esTipo de Pol\xc3\xadticaPadr\xc3\xa3"
+    b"o detectado!Digite cada palavra "
+    b"do seu mnem\xc3\xb4nico BIP39.Configur"
+    b"a\xc3\xa7\xc3\xb5es armazenadas internamente"
+    b" na flash.Falha ao converterPor "
+    b"entrada manualM\xc3\xa9todo de corteIr"
+    b"Taxa de sucesso:Modo ampliadoCor"
+    b"es invertidasEntropia insuficien"
+    b"te!Criado:Mnem\xc3\xb4nico duploExport"
+    b"ando %s para o cart\xc3\xa3o SD\xe2\x80\xa6Salv"
+    b"ar imagem do QR no cart\xc3\xa3o SDPin"
+    b"o RXConfigura\xc3\xa7\xc3\xb5es armazenadas "
+    b"no cart\xc3\xa3o SD.Armazenar no cart\xc3"
+    b"\xa3o SDFerramentasPersonalizar sua"
+    b" carteira gerar\xc3\xa1 uma nova Chave"
+    b" e descarregar\xc3\xa1 o Descritor.Men"
+    b"sagem:EscalaIdiomaRole o dado pe"
+    b"lo menos %d vezes para gerar um "
+    b"mnem\xc3\xb4nico.Desligando\xe2\x80\xa6Taxa de "
+    b"MergulhoPalavra %dTOQUE ou ENTER"
+    b" para instalar.For\xc3\xa7aSHA256 da i"
+    b"magem:Mapa da FlashImprimir QR?O"
+    b" nome do arquivo %s j\xc3\xa1 existe n"
+    b"o cart\xc3\xa3o SD.Caminho de deriva\xc3\xa7"
+    b"\xc3\xa3o inv\xc3\xa1lidoCarregar do cart\xc3\xa3o"
+    b" SD?PAGE para alternar o brilhoE"
+    b"rro:Alinhe a c\xc3\xa2mera e a placa d"
+    b"e backup corretamente.Resultado "
+    b"XORTipo de LCDResultados da su\xc3\xad"
+    b"te de testesTrocar caixaEscanear"
+    b" C\xc3\xb3digo QR da ChaveEspa\xc3\xa7amento"
+    b" da bordaAtraso de LinhaEntropia"
+    b" fraca!Pinte de preto os pontos "
+    b"perfurados para que sejam detect"
+    b"ados.de utf8Seguran\xc3\xa7a\xc3\x8dndice da"
+    b" ContaTem certeza?AssinarModo pa"
+    b"dr\xc3\xa3oLivre:(Somente visualiza\xc3\xa7\xc3"
+    b"\xa3o)Assinando\xe2\x80\xa6\xc3\x8dndiceCarregando"
+    b" c\xc3\xa2mera\xe2\x80\xa6ImpressoraDesfazerUsa"
+    b"r fingerprint como ID?SHA256 das"
+    b" jogadas:Etiqueta QRRegi\xc3\xa3o%s ex"
+    b"clu\xc3\xaddo.T\xc3\xa9rmica%d de %d multisi"
+    b"g%d endere\xc3\xa7os checados sem corr"
+    b"espond\xc3\xaancia.Imprimir Tinyseed?B"
+    b"oa entropiaTrocoEstat\xc3\xadsticas pa"
+    b"ra nerdsAlterado:C\xc3\xb3digo QR Crip"
+    b"tografadoGasto:Carteira Padr\xc3\xa3oP"
+    b"arte M de NSim24 palavrasC\xc3\xb3digo"
+    b" atual de verifica\xc3\xa7\xc3\xa3o de integ"
+    b"ridadeAtualizar KEF ID?Mem\xc3\xb3ria "
+    b"flash preenchida com entropia da"
+    b" c\xc3\xa2meraDi\xc3\xa2metro da FresaExclui"
+    b"r este arquivo?Mnem\xc3\xb4nico e senh"
+    b"a ser\xc3\xa3o mantidos.TemaConverter "
+    b"dadosExcluir Mnem\xc3\xb4nicoda base64"
+    b"%d a %dAssinatura:Excluir arquiv"
+    b"os de firmware do cart\xc3\xa3o SD?Mud"
+    b"ar o tema e reiniciar?XOR Mnem\xc3\xb4"
+    b"nicopara base43Usar valor atual?"
+    b"Regi\xc3\xa3o:Revise os dados, edite s"
+    b"e necess\xc3\xa1rioConclu\xc3\xadda a conver"
+    b"s\xc3\xa3oAtivar?bin\xc3\xa1rio:N\xc3\xa3o se pode"
+    b" gastar%s: carregado!QR de texto"
+    b" simplesChave P\xc3\xbablica Estendida"
+    b"Endere\xc3\xa7os do descritorQuantidad"
+    b"epara base32Texto PersonalizadoS"
+    b"u\xc3\xadte de testesApagando dados do"
+    b" usu\xc3\xa1rio\xe2\x80\xa6Pot\xc3\xaanciaListar Ende"
+    b"re\xc3\xa7osCarregando endere\xc3\xa7os de a"
+    b"ltera\xc3\xa7\xc3\xa3o\xe2\x80\xa6Os c\xc3\xb3digos de veri"
+    b"fica\xc3\xa7\xc3\xa3o de integridade n\xc3\xa3o co"
+    b"rrespondemDesligarMostrar dadosC"
+    b"\xc3\xb3digo QRMnem\xc3\xb4nico criptografad"
+    b"o armazenado com ID:Cores BGRApa"
+    b"gue totalmente seu cart\xc3\xa3o SD em"
+    b" outro dispositivo para garantir"
+    b" que os dados sejam irrecuper\xc3\xa1v"
+    b"eisN\xc3\x83O FOI ENCONTRADO nos prime"
+    b"iros %d endere\xc3\xa7osExportar ender"
+    b"e\xc3\xa7osVers\xc3\xa3oDo armazenamentoTOQU"
+    b"E ou ENTER para capturarCarregar"
+    b" da c\xc3\xa2meraVia PalavrasMnem\xc3\xb4nic"
+    b"oSobreEntropia de Shannon:Direit"
+    b"aMensagem assinadaInsira %d pala"
+    b"vras BIP39.Tamanho:Tempo para pr"
+    b"ote\xc3\xa7\xc3\xa3o de telaMensagemDebounce"
+    b" dos bot\xc3\xb5esGrade bin\xc3\xa1riaDigite"
+    b" a ChaveEtiqueta vis\xc3\xadvelCarteir"
+    b"aUnidadeGastos (%d):DatumSalvar "
+    b"no cart\xc3\xa3o SD\xc3\xa9 um endere\xc3\xa7o v\xc3\xa1"
+    b"lido!Linha:Primeiro, defina um c"
+    b"\xc3\xb3digo de verifica\xc3\xa7\xc3\xa3o de integ"
+    b"ridadeCriptografarCarregando\xe2\x80\xa6C"
+    b"arregar um descritor de carteira"
+    b" para visualizar endere\xc3\xa7os?Assi"
+    b"natura inv\xc3\xa1lidaPara garantir qu"
+    b"e os dados sejam irrecuper\xc3\xa1veis"
+    b", use o recurso Limpar Dispositi"
+    b"voChave interna TREst\xc3\xa1ticoAssin"
+    b"ar para c\xc3\xb3digo QRDescritor da C"
+    b"arteiraSem SenhaInsira um c\xc3\xb3dig"
+    b"o de verifica\xc3\xa7\xc3\xa3o de integridad"
+    b"e com mais de 6 caracteresC\xc3\xb3dig"
+    b"o de verifica\xc3\xa7\xc3\xa3o de integridad"
+    b"eAlgumas verifica\xc3\xa7\xc3\xb5es n\xc3\xa3o ser"
+    b"\xc3\xa3o realizadas.Bot\xc3\xb5esRestaurar "
+    b"as configura\xc3\xa7\xc3\xb5es de f\xc3\xa1brica e"
+    b" reiniciar?Carregar CarteiraUse "
+    b"a entropia da c\xc3\xa2mera para criar"
+    b" um novo mnem\xc3\xb4nicoAssinando has"
+    b"h bruto. Prossiga somente se voc"
+    b"\xc3\xaa confiar na fonte.TC Flash Has"
+    b"h na Inicializa\xc3\xa7\xc3\xa3oCaracteres n"
+    b"\xc3\xa3o ASCII foram detectados em su"
+    b"a senha. A Krux n\xc3\xa3o pode garant"
+    b"ir que outras carteiras obtenham"
+    b" a mesma chave.O descritor da ca"
+    b"rteira n\xc3\xa3o foi encontrado.Rotac"
+    b"ionar 180\xc2\xb0Aguarde a capturaAtua"
+    b"lizar etiqueta QR?BrilhoSenha em"
+    b" Base64\xc3\x8dndice de desvio de pixe"
+    b"ls:Prosseguir?Endere\xc3\xa7o inv\xc3\xa1lid"
+    b"oDescritor da carteira carregado"
+    b"!para hexadecimalModo de criptog"
+    b"rafiaTextoForteFracaAviso:Use um"
+    b"a superf\xc3\xadcie de fundo preta.Mod"
+    b"o antirreflexoRecebimentoAlterna"
+    b"r brilhoMudar carteira?Tentar ma"
+    b"is?Escaneando as palavras de 13-"
+    b"24Cart\xc3\xa3o SD n\xc3\xa3o detectado.12 p"
+    b"alavrasRevisar NovamenteDescript"
+    b"ografar?Mnem\xc3\xb4nico BackupFerrame"
+    b"ntas da FlashAtualiza\xc3\xa7\xc3\xa3o concl"
+    b"u\xc3\xadda.Salvar emRes. - FormatoCar"
+    b"regar Mnem\xc3\xb4nicoVaziopara utf8Al"
+    b"guns n\xc3\xb3s n\xc3\xa3o s\xc3\xa3o hardened:Ass"
+    b"inar no cart\xc3\xa3o SDID j\xc3\xa1 existeU"
+    b"se o iter de chave padr\xc3\xa3o.?desc"
+    b"onhecidaCoordenadas X espelhadas"
+    b"RedeDerivar entropia BIP85?Falha"
+    b" ao armazenar mnem\xc3\xb4nicoPalavras"
+    b"O mnem\xc3\xb4nico criptografado n\xc3\xa3o "
+    b"foi armazenadoLargura do papelCo"
+    b"ntaChave%s carac.Imprimir QR de "
+    b"testeRemover permanentemente tod"
+    b"os os mnem\xc3\xb4nicos criptografados"
+    b" e configura\xc3\xa7\xc3\xb5es armazenados n"
+    b"a mem\xc3\xb3ria flash?Carregando impr"
+    b"essora\xe2\x80\xa6N\xc3\xbamerosRetornar ao Vis"
+    b"ualizador de QRPressione PAGE pa"
+    b"ra cancelar.Checar se o endere\xc3\xa7"
+    b"o pertence a esta carteira?Captu"
+    b"ra canceladaCaminho de Deriva\xc3\xa7\xc3"
+    b"\xa3oFalha ao carregarKEF criptogra"
+    b"fadoEntradas (%d):Mnem\xc3\xb4nico BIP"
+    b"39C\xc3\xb3digo de verifica\xc3\xa7\xc3\xa3o de in"
+    b"tegridade inv\xc3\xa1lidoM\xc3\xa9diaSubstit"
+    b"uir?A chave n\xc3\xa3o foi fornecidaEn"
+    b"dere\xc3\xa7oDistribui\xc3\xa7\xc3\xa3o de jogadas"
+    b":Armazenar na mem\xc3\xb3ria flashUsar"
+    b" o modo padr\xc3\xa3o?Nome do arquivoS"
+    b"e a tela do seu dispositivo n\xc3\xa3o"
+    b" funcionar ap\xc3\xb3s essa altera\xc3\xa7\xc3\xa3"
+    b"o, ele ser\xc3\xa1 reiniciado automati"
+    b"camente com as configura\xc3\xa7\xc3\xb5es a"
+    b"nteriores ap\xc3\xb3s 5 segundos.Carre"
+    b"gar?Usado:ReiniciarImprimir?XOR "
+    b"comTipo de cabe\xc3\xa7oteCarteira dif"
+    b"erente:da base32Adicionar ou alt"
+    b"erar a senha da carteira?Explora"
+    b"r o cart\xc3\xa3o SDImprimindo\xe2\x80\xa6Volta"
+    b"rC\xc3\xb3digo QR personalizadoDeslize"
+    b" para mudar de modoXOR mnem\xc3\xb4nic"
+    b"o atual com outro? (senha e desc"
+    b"ritor ser\xc3\xa3o descartados)Salvar "
+    b"no cart\xc3\xa3o SD?Gerar Mnem\xc3\xb4nicoTa"
+    b"manho da pe\xc3\xa7aCarregue um descri"
+    b"tor da carteiraChave p\xc3\xbablica he"
+    b"xadecimal:CriptografadoPersonali"
+    b"zarContinuar mesmo assim?N\xc3\xa3o fo"
+    b"i poss\xc3\xadvel determinar endere\xc3\xa7o"
+    b"s de troco.Apagar Dados do Usu\xc3\xa1"
+    b"rioNovo firmware detectado.Tempo"
+    b" de desligamentoEsquerdaPSBT ass"
+    b"inadafalhaC\xc3\xb3digo de verifica\xc3\xa7\xc3"
+    b"\xa3o de integridade definido com s"
+    b"ucessodeslizeLimiar de ToqueTest"
+    b"e:Digite o n\xc3\xbamero de cada palav"
+    b"ra do seu mnem\xc3\xb4nico BIP39, de 1"
+    b" a 2048.Excluir %s?N\xc3\xbameros das "
+    b"PalavrasIncompatibilidade de cam"
+    b"inhoCarregando endere\xc3\xa7os de rec"
+    b"ebimento\xe2\x80\xa6Processando\xe2\x80\xa6Autotra"
+    b"nsfer\xc3\xaancia:Troco:Preenchendo a "
+    b"mem\xc3\xb3ria flashTeste de impress\xc3\xa3"
+    b"o QR KruxConclu\xc3\xaddo?Explorar arq"
+    b"uivos?Checando\xe2\x80\xa6Apar\xc3\xaanciaTaxas"
+    b" altas!N\xc3\xa3o desligue, pode demor"
+    b"ar um pouco para concluir.Driver"
+    b" da impressora n\xc3\xa3o definido!Ocu"
+    b"ltar Mnem\xc3\xb4nicosParteArquivo de "
+    b"assinatura n\xc3\xa3o encontradoCart\xc3\xa3"
+    b"o SDConfigura\xc3\xa7\xc3\xb5es de F\xc3\xa1bricaU"
+    b"su\xc3\xa1rioValor %s fora do interval"
+    b"o: [%s, %s]Escaneando as palavra"
+    b"s de 1-12 novamenteFingerprint n"
+    b"\xc3\xa3o definida no PSBTProcurando p"
+    b"or cart\xc3\xa3o SD\xe2\x80\xa6Preencher a mem\xc3"
+    b"\xb3ria flash com entropia da c\xc3\xa2me"
+    b"ra?Salvo no cart\xc3\xa3o SD:Escanear "
+    b"a senha BIP39Digite o n\xc3\xbamero em"
+    b" hexadecimal de cada palavra do "
+    b"seu mnem\xc3\xb4nico BIP39, de 1 a 800"
+    b".N\xc3\xa3opara base64Jogadas insufici"
+    b"entes!Comprimento de mnem\xc3\xb4nico "
+    b"inv\xc3\xa1lidoCriar C\xc3\xb3digo QRPressio"
+    b"ne PAGE para alternar o modoProf"
+    b"undidade por passeda base43Escan"
+    b"ear Endere\xc3\xa7oEntropia adicional "
+    b"da c\xc3\xa2mera \xc3\xa9 necess\xc3\xa1ria para %"
+    b"sInverterTestes do DispositivoVo"
+    b"ltar ao MenuDeixe em branco se q"
+    b"uiser que seja escolhida uma pal"
+    b"avra final v\xc3\xa1lidaPela C\xc3\xa2meraPi"
+    b"no TXDescritor da carteiraSenhaA"
+    b"utotransfer\xc3\xaancia ou Troco (%d):"
+    b"Comprimento:Assinar?"
+)
@@ -19,382 +19,539 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-# pylint: disable=C0301
-translation_array = [
-    "% от суммы.",
-    "%d из %d мультиподпись",
-    "%d к %d",
-    "%s бит",
-    "%s байт",
-    "%s симв.",
-    "%s удален.",
-    "%s: загружено!",
-    "(%s бит/пиксель)",
-    "(Эксперементальный)",
-    "(Только часы)",
-    "12 слов",
-    "24 слова",
-    "О Программе",
-    "Учетная запись",
-    "Индекс счета",
-    "Добавить или изменить пароль кошелька?",
-    "Требуется дополнительная энтропия от камеры для %s",
-    "Адрес",
-    "Правильно совместите камеру и резервную пластину.",
-    "Антибликовый режим",
-    "Внешний Вид",
-    "Вы уверены?",
-    "Цвета BGR",
-    "BIP39 Мнемоника",
-    "Назад",
-    "Назад в Mеню",
-    "Резервная мнемоника",
-    "Плохая подпись",
-    "Пароль Base64",
-    "Скорость Передачи Данных",
-    "Двоичная сетка",
-    "Заполнение Границ",
-    "Яркость",
-    "Кнопки",
-    "Антидребезг кнопок",
-    "Захват отменен",
-    "Сдача",
-    "Сменить тему и перезагрузить?",
-    "Сменить кошелёк?",
-    "Сдача:",
-    "Изменения будут храниться до выключения.",
-    "Проверить SD Карту",
-    "Проверить, что адрес принадлежит этому кошельку?",
-    "Проверено %d адресов без совпадений.",
-    "Проверка SD-карты…",
-    "Подтвердите код проверки вскрытия",
-    "Преобразовать датум",
-    "Не удалось определить адрес изменения.",
-    "Создать QR-код",
-    "Создать QR-код из текста?",
-    "Создано:",
-    "Текущий код проверки вскрытия",
-    "Пользовательский QR-код",
-    "Произвольный текст",
-    "Настроить",
-    "Настройка вашего кошелька создаст новый ключ и выгрузит дескриптор.",
-    "Глубина Резки",
-    "Метод Резки",
-    "Datum Tool",
-    "Десятичный",
-    "Расшифровать?",
-    "Кошелек по умолчанию",
-    "Удалить этот файл?",
-    "Глубина за Проход",
-    "Путь деривации",
-    "Вывести энтропию BIP85?",
-    "Адреса дескрипторов",
-    "Испытания устройства",
-    "Дисплеи",
-    "Не выключайте питание, это может занять некоторое время.",
-    "Конвертация завершена",
-    "Готово?",
-    "Двойная мнемоника",
-    "Драйвер",
-    "Пустой",
-    "Включить?",
-    "Зашифровать",
-    "Зашифровано",
-    "Зашифрованный QR Код",
-    "Зашифрованная мнемоника была сохранена с ID:",
-    "Зашифрованная мнемоника не была сохранена",
-    "Шифрование",
-    "Метод Шифрования",
-    "Введите %d слов BIP39.",
-    "Введите более 6 символов кода проверки вскрытия",
-    "Введите каждое слово вашей мнемоники BIP39 в виде числа от 1 до 2048.",
-    "Введите каждое слово вашей мнемоники BIP39 в виде шестнадцатеричного числа от 1 до 800.",
-    "Введите каждое слово вашей мнемоники BIP39 в виде восьмеричного числа от 1 до 4000.",
-    "Введите каждое слово вашей BIP39 мнемоники.",
-    "Удалить данные пользователя",
-    "Удаление данных пользователя…",
-    "Ошибка:",
-    "Выйти",
-    "Исследовать файлы?",
-    "Экспорт адресов",
-    "Экспорт %s на SD-карту…",
-    "Расширенный Публичный Ключ",
-    "Заводские Настройки",
-    "Не удалось собрать энтропию камеры",
-    "Преобразование не выполнено.",
-    "Не удалось расшифровать",
-    "Не удалось ничего загрузить",
-    "Не удалось сохранить мнемонику",
-    "Комиссия:",
-    "Скорость Подачи",
-    "Имя файла",
-    "Файл %s существует на SD карте.",
-    "Заполнить флэш энтропией с камеры?",
-    "Заполнение флэша",
-    "Отпечаток пальца не установлен в PSBT",
-    "Карта флэша",
-    "Flash Tools",
-    "Флэш заполнен энтропией камеры",
-    "Диаметр Флюта",
-    "Свободно:",
-    "Из Памяти",
-    "Полностью стерите SD-карту в другом устройстве, чтобы убедиться, что данные не восстановимы",
-    "Создать Мнемонику",
-    "OK",
-    "Хорошая энтропия",
-    "Аппаратное Обеспечение",
-    "Тип головки",
-    "Шестнадцатеричный Публичный Ключ:",
-    "Шестнадцатеричный",
-    "Скрыть мнемоники",
-    "Высокие комиссии!",
-    "Идентификатор",
-    "ID уже существует",
-    "Если после этого изменения дисплей устройства не работает, он автоматически перезагрузится с предыдущими настройками через 5 секунд.",
-    "Индекс",
-    "Входы (%d):",
-    "Недостаточная Энтропия!",
-    "Недействительный код проверки вскрытия",
-    "Неверный адрес",
-    "Недопустимый путь деривации",
-    "Неверная длина мнемоники",
-    "Неверный кошелек:",
-    "Инвертировать",
-    "Перевернутые цвета",
-    "Зашифровано KEF",
-    "Ключ",
-    "Ключ не предоставлен",
-    "Тестовый QR Принтера Krux",
-    "Тип ЖК-дисплея",
-    "Язык",
-    "Оставьте пустым, если хотите, чтобы Krux выбрал подходящее последнее слово",
-    "Влево",
-    "Длина:",
-    "Задержка Линии",
-    "Линия:",
-    "Список адресов",
-    "Загрузить Мнемонику",
-    "Загрузить кошелек",
-    "Загрузить дескриптор доверенного кошелька для просмотра адресов?",
-    "Загрузка с SD-карты",
-    "Загрузить с SD карты?",
-    "Из камеры",
-    "Загрузить?",
-    "Загрузка списка камер…",
-    "Загрузка адресов изменения…",
-    "Загрузка принтера…",
-    "Загрузка адресов приема…",
-    "Идет загрузка…",
-    "Локаль",
-    "Расположение",
-    "Средний",
-    "Сообщение",
-    "Сообщение:",
-    "Минискрипт",
-    "Координаты зеркала X",
-    "Отсутствует файл подписи",
-    "Мнемоника",
-    "Мнемонический XOR",
-    "Мнемоника и парольная фраза будут сохранены.",
-    "Изменено:",
-    "Сеть",
-    "Новая Мнемоника",
-    "Обнаружена новая прошивка.",
-    "Нет",
-    "Нет Фраза-пароль",
-    "В вашей парольной фразе обнаружены символы, отличные от ASCII. Krux не может гарантировать, что другие кошельки получат тот же ключ.",
-    "Недостаточно бросков!",
-    "Числа",
-    "Восьмеричный",
-    "Другие форматы",
-    "Перезаписать?",
-    "PAGE для переключения яркости",
-    "Итератор PBKDF2.",
-    "Закрасьте перфорированные точки черным цветом, чтобы их можно было обнаружить.",
-    "Ширина Бумаги",
-    "Часть",
-    "Часть M из N",
-    "Размер Части",
-    "Фраза-пароль",
-    "Длина пароля",
-    "Несоответствие пути",
-    "Образец обнаружен!",
-    "Окончательно удалить все сохраненные зашифрованные мнемоники и настройки из флеш-памяти?",
-    "Постоянная Память",
-    "Индекс отклонения пикселей:",
-    "QR Открытым Текстом",
-    "Пожалуйста загрузите выходной дескриптор кошелька",
-    "Скорость Погружения",
-    "Тип политики",
-    "Плохая энтропия!",
-    "Мощность",
-    "Нажмите PAGE, чтобы отменить.",
-    "PAGE, чтобы переключить режим",
-    "Напечатать Тестовый QR",
-    "Распечатать Tinyseed?",
-    "Печать в QR",
-    "Напечатать в виде QR?",
-    "Печатать?",
-    "Принтер",
-    "Драйвер Принтера не установлен!",
-    "Печать…",
-    "Все равно продолжить?",
-    "Продолжить?",
-    "Обработка…",
-    "Доказуемо непотратимый",
-    "QR Код",
-    "QR-метка",
-    "Кол-во",
-    "RX Пин",
-    "Перезагрузить",
-    "Получить",
-    "Регион:",
-    "Удалить %s?",
-    "Удалить Мнемонику",
-    "Удалить файлы прошивки с SD-карты?",
-    "Разреш. - Формат",
-    "Восстановить заводские настройки и перезагрузить?",
-    "Результат",
-    "Вернуться к QR-просмотрщику",
-    "Проверить снова",
-    "Просмотрите отсканированные данные, отредактируйте при необходимости",
-    "Вправо",
-    "Бросьте кубик не менее %d раз, чтобы сгенерировать мнемонику.",
-    "Распределение бросков:",
-    "Броски:",
-    "Поворот на 180°",
-    "SD карта",
-    "SD карта не обнаружена.",
-    "SHA256 бросков:",
-    "SHA256 снэпшота:",
-    "Сохранить QR-изображение на SD-карту",
-    "Сохранить на SD-карту",
-    "Сохранить на SD карту?",
-    "Сохранено на SD карту:",
-    "Шкала",
-    "Отсканировать Адрес",
-    "Отсканировать BIP39 фразу-пароль",
-    "Отсканировать Ключ QR код",
-    "Сканирование слов 1-12 снова",
-    "Сканирование слов 13-24",
-    "Время Экранной Заставки",
-    "Тип скрипта",
-    "Охрана",
-    "Трансфер самому себе или Сдача (%d):",
-    "Перевод самому себе:",
-    "Сначала установите код проверки вскрытия",
-    "Настройки",
-    "Настройки хранятся во флэш-памяти.",
-    "Настройки сохранены на SD-карте.",
-    "Энтропия Шеннона:",
-    "Показать датум",
-    "Выключить",
-    "Время выключения",
-    "Отключение…",
-    "Подписать",
-    "Подписать QR-код",
-    "Подписать на SD-карте",
-    "Подписать?",
-    "Подпись:",
-    "Подписанное Сообщение",
-    "Подписанное PSBT",
-    "Подписание необработанного хэша. Продолжайте, только если вы доверяете источнику.",
-    "Подпись…",
-    "Одна подпись",
-    "Размер:",
-    "Некоторые проверки не могут быть выполнены.",
-    "Некоторые узлы не укреплены:",
-    "Расход (%d):",
-    "Расход:",
-    "Стандартный режим",
-    "Static / Статическое оборудование",
-    "Статистика для Гиков",
-    "Сохранить на Флэш Память",
-    "Сохранить на SD Карту",
-    "Сила",
-    "Сильный",
-    "Свайпните, чтобы сменить режим",
-    "TC Flash Hash",
-    "Проверка хэша Flash при загрузке",
-    "ПРИКОСНИТЕСЬ или нажмите ВВОД, чтобы захватить",
-    "ПРИКОСНИТЕСЬ или нажмите ВВОД, для Установить.",
-    "внутренний ключ",
-    "TX Пин",
-    "Код проверки вскрытия",
-    "Код проверки вскрытия успешно установлен",
-    "Коды проверки вскрытия не совпадают",
-    "набор тестов",
-    "Результаты набора тестов",
-    "Испыт.:",
-    "Текст",
-    "Тема",
-    "Термальный",
-    "Для гарантии невосстановления данных используйте функцию Очистки Устройства",
-    "Регулировка Яркости",
-    "Инструменты",
-    "Чувствительность",
-    "Тачскрин",
-    "Попробовать ещё?",
-    "Ввести BIP39 фразу-пароль",
-    "Ввести Ключ",
-    "Отменить",
-    "Единица Измерения",
-    "Обновить идентификатор KEF?",
-    "Обновить QR-метку?",
-    "Обновление завершено.",
-    "Использовать черную фоновую поверхность.",
-    "Использовать энтропию камеры, чтобы создать новую мнемонику",
-    "Текущее значение",
-    "Использовать по умолчанию?",
-    "Использовать итер PBKDF2 по умолчанию.?",
-    "Использовать отпечаток пальца как ID?",
-    "Использовано:",
-    "Пользователь",
-    "Значение %s вне диапозона: [%s, %s]",
-    "Верификация…",
-    "Версия",
-    "С Помощью Камеры",
-    "С Помощью D20",
-    "С Помощью D6",
-    "С Помощью Ручного Ввода",
-    "Через Слово",
-    "Видимая метка",
-    "Дождитесь Захвата",
-    "Кошелек",
-    "Дескриптор Кошелька",
-    "Кошелёк не совпадает:",
-    "Выходной дескриптор кошелька",
-    "Выходной дескриптор кошелька загружен!",
-    "Выходной дескриптор кошелька не найден.",
-    "Предупреждение:",
-    "Слабый",
-    "Слово %d",
-    "Числа Слов",
-    "Слова",
-    "Результат XOR",
-    "XOR с",
-    "XOR current mnemonic with another one? (парольная фраза и дескриптор будут отброшены)",
-    "Да",
-    "Режим масштабирования",
-    "двоичный:",
-    "неудачно",
-    "от ШЕСТИГРАННИКА",
-    "от базы32",
-    "от основания43",
-    "от base64",
-    "от шестигранника",
-    "от utf8",
-    "корректный адрес",
-    "случай смены",
-    "Коэффициент успеха:",
-    "проведите",
-    "текст:",
-    "к ШЕСТИГРАННОЙ",
-    "к основанию32",
-    "к основанию43",
-    "к base64",
-    "к шестигранной",
-    "to utf8",
-    "неизвестный",
-    "нЕ НАЙДЕНО в первых %d адресах",
-]
+# pylint: disable=C0103,C0301
+catalog = (
+    b"u\x01\xb6\x11\x16\x00l\xfa\xa6\x02[\xa8b\x04\xb1\xd5\xb0\x04\xed\x8e:\x06\xe6\x81m\x07\xb6\x8b\xef\x07B{"
+    b'd\x08\xb7\x06\xff\x08\nf\x00\n(\x1f\x16\x0c\xbcI\xdb\r\xbfN\x02\x0epi"\x0e\xff#)\x0e\x88\x1f'
+    b"\xe1\x0ef\x97\xa1\x0f\x8b\xea5\x11\x8arH\x11:c\xd3\x11%\xc4\xc6\x14k\xd8\xe0\x14\xefy\xca\x16j\xc7"
+    b"\xd9\x16GG.\x17\x05\xd5R\x17\xeal\xf3\x17}\xca\xe8\x18\x81\xd3*\x19\xbba\xc5\x19\xe0\x94\xdd\x19\x93\xc2"
+    b'3\x1ck\xf8<\x1c\xbd\xc3\xd1\x1dk\x96O\x1fhW\xae\x1f\xeat\x9b!\xf2\xb1\x1d"\x00\xb9/#Lj'
+    b"\xa3#\xf4\xb7\xec#k\xd7\xb4$\x13\t\xea$\xf1\xf7(&\xe9~\xaf&`Rp(\xfa\x1c*)\xa8\xda"
+    b'L)|\xb9\xb7)j\x91\\*\x93gx*\xeb\xf5\xea*s\xf1;+"\xd6r+\xf4\x85t-\x80\n'
+    b"\x87-\xe3\x13\xad-J\x9f\xea-\x9d.\x93.\xb80\xc4.uU\x8b/\x7f\x0b\xb5/\x8e\x83\xcf/g\xd4"
+    b"\xb80n\xea\xf30\x12Ec1\x99\x1bi1\xef|73\x14\x15\xe83\xe5\x91o4\x86|\xea4\x1f\xaf"
+    b"\xfd4\xc9\xa3\xaa5\xbd\xca\xd85Z'S6\x02\xcb^6\xd5\x91\xb36\x16\x19\x087\xfc?[7\xd84"
+    b"\xf69\x89\x0fZ:\x81\xa9[;|\x91\xec;\x97\xb7\xed<\x95e7>\x1e\xd1\xfd>\xc0>L?\xfd\x91"
+    b"\x1f@x}=@\x87j\x8dA\x84>\x96A\x05H\xb2A\xed\xf2\xc7Aq@\xf1B\xcc\x14BC\xdf~"
+    b".D\xba\x16\x8bEhY\x0cF\xae\xc3,F\x11r?F! XF\x90\xb9\xa5F\x1a\xcd\xccF\x1c\n"
+    b"7G\xee\x08nG\x16\xfb\xfbG\x8fbzI30\xc0I\xf9\xd4'Jc\xed\xc8J?\xad&K`D"
+    b"\xd1Kg`\x16MIs\xaaM\x8f\xe6\x15Na\xdcLP\x9b\x94\xe9Q\x12@\x88RJ\xde\xd6S8\xa4"
+    b"\xc0U?\x9c\x05V\x0c\xc8\xb4VB\x9dPW\x9c\x07\x01Xd\xe9\x83X\x87L\x97Y\xee\x8c\xb9Y\xe8\xcc"
+    b"&Z\xa0[\xcf\\q\xd7\x08^\t\x84]^\x0c\x01k^\x08i2_\x1c;\xa3b[\xb9\xdab*\xfe"
+    b'\x13c\xb9\x993cd\n\xfdcY"\xa2d\x8d?\xf2dy\x96\x1de\x9d\x9e\x8de2\x8e\x00f\xc5\x1b'
+    b"\x18f`t\x85fY\xcftg\xcd8\xd1g\xed\xd1\njM\x865j\xa4.Kj\x13]\xd1j\x0bT"
+    b"\xa6k\xe8{}l\x94\xbc\xd4l0\x11\xe0m?\xfb*n]\x8eRn\x08{Xo\xb9m\x87o\xde\xd6"
+    b"\xcfom\x14@p_\xea\xa1p\xc3\x99\xd8p\xa8\x93)q\x8dirs0\x13\x16t\x8b\xf3 t\xe7\r"
+    b"5t\xe8\xda\xcat\x10Z\x0bu\xd9\xd4\x84v9\xab\xf4wYQ_xZ\x9b\xf9x\xe3\t\x00y\x08\xc8"
+    b"#yw\xde|yq\xdf\xfcy4\xd9\xe0z\xac\x11e{)\x97\xc4{m\xa3\x89|\x9f\x8a\x9b|?\x0e"
+    b"\xf2\x80\x00\x1ei\x81\xa6Z\xc0\x81u\xc6W\x82\x0c\x11r\x85\xa2\xcb6\x86j\x8f~\x86\x80\xb1\x83\x86\xffY"
+    b"\x98\x86\xbe\xf6W\x87\x13-l\x87\xc3\x10\xfb\x87\xbc\x93\xb9\x88\xdf\xde\xe9\x88\xf2\xaf\x9f\x8a\xb6\xd1\x9f\x8a)\xbc"
+    b"E\x8b\x7f\x00\xc2\x8b*\xbc\xe1\x8ca\x90\x04\x8d\x89Q;\x8d\xdd\x8e2\x8f\xbf\xc3D\x90\x95\x8e}\x91\x0f$"
+    b"\x83\x93D\xa7\xff\x94\xb1\x8b#\x95\x0f\x8a@\x95\x1flE\x95n7#\x963\xd5+\x96Rv\x13\x99J\xc7"
+    b"\xaa\x99\xdb\xd0\xd0\x99&\x1f\x1d\x9a\x03 5\x9a\xa2]\xb1\x9aO?\x11\x9b\xf9\x08\xb9\x9b-\xcb\x9f\x9d\xfa\x03"
+    b"\x04\x9fp}?\x9f\xd0\x8bp\x9fw+i\xa0D\xde\x87\xa0\xad\x08\xce\xa0y\xe5\xf1\xa0\x9a\xfe\x03\xa1\xbfX"
+    b"\xe0\xa2.\xc5\x1b\xa3\x12\xe1\x1b\xa3V\xd4J\xa3\x0f<\xab\xa3\xee\xa8\xfa\xa3\xaa\x0cJ\xa4\xf8\xe2\x19\xa6\xe4\xa8"
+    b"T\xa6V3y\xa6\x9d\xeb\xe8\xa7\xc3\xc2\xec\xa7\x18\xde \xa8\xc0\x12\x06\xa9\x1ei\xa7\xaaX\xcb\xa8\xabNw"
+    b"\xa9\xabO\xd9\xfb\xac\xc7\xa7&\xadY\xb5'\xaf \xbe9\xaf\xc0ZG\xaf\x0e\xa2\x9a\xaf\x881\xbc\xb0\x12s"
+    b"\xf0\xb0d\xa3\x8b\xb1\x8e7\x16\xb28o\x8b\xb2I\xed\xdd\xb2O4\x88\xb3\xdd\xe6\x05\xb5\xfd\xe52\xb5\xfb\x95"
+    b"\x9d\xb5e\xf3#\xb8\xae\x87>\xb8]\x1f\x92\xb9\x07\x86\xf0\xb9\x163\r\xbbS;\xc3\xbeE\xb4\xa1\xbfh\xae"
+    b"\xd0\xbf\xb4\xbb?\xc1z\xa1\x92\xc1\xc3\xd2\xa4\xc1\x81@\xdf\xc1\xd5\xa5q\xc2;b\x95\xc2\x1dV\xf3\xc2\xa5V"
+    b"\xf8\xc2?Kl\xc3\xcc\xd3\xe8\xc4\xe8\x955\xc53\x8b}\xc5\xa4]U\xc6\x89\x87\x86\xc6\x0e\xc6\xda\xc6\xba\x81"
+    b'\xff\xc6\x97\xd5\x0c\xc7dW\x97\xc7^&\xc3\xc8B\xb6\xb7\xc9T\x8e<\xcb\x14\xb8\x97\xcc"^\x06\xcd\x92%'
+    b")\xcd\x7f\x8a[\xcd\tn\xfc\xcd\x16ig\xd1\xe7\xa7z\xd1\xad\xf3\xd5\xd1\x83\x1d\x82\xd2\xed\xad\x89\xd3d\x00"
+    b")\xd4v\x16L\xd4Z8a\xd4\xd0\xc2\x89\xd5\xbf\n\xb5\xd5k\x1b+\xd6\x92\xba\x11\xd8\\\x9d\x19\xd8O4"
+    b"\xa9\xd8\xcb\xf9\xeb\xd9VHU\xda\xbc]\xde\xda\x03Y\xf1\xda\x89^O\xdb\xa9\xe9Y\xdb0\x00\xa0\xdbn*"
+    b"\xa1\xdc\x99w@\xdeRI\xe6\xdeR\xdc\x10\xdf\xe9G<\xdf\xc23~\xdfg\xe9\x80\xdf\xdc\xdf\xb4\xdf\x95x"
+    b"\x9d\xe0]\xcb\xc3\xe2\x95w\xa3\xe44\xba\xb1\xe4WV\xca\xe4;\x9f@\xe5@\x81\xee\xe5\xb7\x00\x11\xe7I\xd0"
+    b"/\xe8\x87\xc4\xab\xe8\x95\x8f\xae\xe8\xf8\xdf=\xe9\x13!%\xear\xf0\xae\xea\xe5\x0c\t\xed\xe0\xdfT\xed/x"
+    b"y\xed/9\x9a\xee\x1c\x8a\xcb\xeej\xe8\xcf\xee\xb5a\x1f\xefb\xabC\xef\x0e\xc4\xaf\xf0\x95)\xb0\xf0\x974"
+    b"-\xf1\xbd\x0c.\xf2)\x9e`\xf31\xd9\xee\xf3\xfa\x95\xfc\xf3\xdc\x97\x06\xf4\tdW\xf4\x8e\xb9\x87\xf4E\x1e"
+    b"\xd1\xf4\xe7`k\xf5\x06\xe8\xa1\xf5\xf1k\xbe\xf5\xd1Wa\xf7\xa6Hp\xf7\xe8\xe3'\xf9\xafz\xce\xf9wr"
+    b"\x05\xfcD0I\xfc\xb3`P\xfd^\xee\xa0\xfd\x9d\xa0\xdd\xfe>L?\xff\x00\x00\x00\x00\x8e\x00\x00\x00\xce\x00"
+    b"\x00\x00\xeb\x00\x00\x00\x03\x01\x00\x00 \x01\x00\x009\x01\x00\x00d\x01\x00\x00\x85\x01\x00\x00\x97\x01\x00\x00\xc2\x01"
+    b"\x00\x00\xdd\x01\x00\x00\xef\x01\x00\x00\x03\x02\x00\x00$\x02\x00\x00D\x02\x00\x00V\x02\x00\x00g\x02\x00\x00r\x02"
+    b"\x00\x00\x87\x02\x00\x00\xa1\x02\x00\x00\xb3\x02\x00\x00\xc7\x02\x00\x00\xd5\x02\x00\x00\x01\x03\x00\x00L\x03\x00\x00g\x03"
+    b"\x00\x00\x91\x03\x00\x00\x9a\x03\x00\x00\xd9\x03\x00\x00\xe6\x03\x00\x00\xfd\x03\x00\x00\x0f\x04\x00\x00&\x04\x00\x00H\x04"
+    b"\x00\x00\\\x04\x00\x00\xa7\x04\x00\x00\xe6\x04\x00\x00\x1b\x05\x00\x00F\x05\x00\x00[\x05\x00\x00]\x05\x00\x00\x81\x05"
+    b"\x00\x00\xaa\x05\x00\x00\xcd\x05\x00\x00\xf9\x05\x00\x00\x08\x06\x00\x00)\x06\x00\x00P\x06\x00\x00\x8f\x06\x00\x00\x98\x06"
+    b"\x00\x00\xd1\x06\x00\x00\xf6\x06\x00\x00\x0c\x07\x00\x00\x89\x07\x00\x00\x9c\x07\x00\x00\xa6\x07\x00\x00\xae\x07\x00\x00\x1c\x08"
+    b"\x00\x003\x08\x00\x00X\x08\x00\x00e\x08\x00\x00\xba\x08\x00\x00\xc2\x08\x00\x00\xda\x08\x00\x00\xf9\x08\x00\x00\x0e\t"
+    b"\x00\x002\t\x00\x00f\t\x00\x00\x9a\t\x00\x00\xbe\t\x00\x00\xf1\t\x00\x00\xfe\t\x00\x00Z\n\x00\x00p\n"
+    b"\x00\x00\x8a\n\x00\x00\xb8\n\x00\x00\xcf\n\x00\x00\xfc\n\x00\x00\x1d\x0b\x00\x008\x0b\x00\x00V\x0b\x00\x00\xe7\x0b"
+    b"\x00\x00\xf0\x0b\x00\x00\xfc\x0b\x00\x00\x13\x0c\x00\x00'\x0c\x00\x009\x0c\x00\x00Z\x0c\x00\x00k\x0c\x00\x00\x82\x0c"
+    b"\x00\x00\x93\x0c\x00\x00\x9f\x0c\x00\x00\xca\x0c\x00\x00\xd8\x0c\x00\x00\xe8\x0c\x00\x00+\r\x00\x00A\r\x00\x00N\r"
+    b"\x00\x00Z\r\x00\x00j\r\x00\x00~\r\x00\x00\xa3\r\x00\x00\xe4\r\x00\x00\x04\x0e\x00\x00#\x0e\x00\x00-\x0e"
+    b"\x00\x00S\x0e\x00\x00d\x0e\x00\x00\x88\x0e\x00\x00\x9d\x0e\x00\x00\xaa\x0e\x00\x00\xd0\x0e\x00\x00\xe3\x0e\x00\x00\xe7\x0e"
+    b"\x00\x00\xf4\x0e\x00\x00+\x0f\x00\x00[\x0f\x00\x00\x94\x0f\x00\x00\xad\x0f\x00\x00\xce\x0f\x00\x00 \x10\x00\x00(\x10"
+    b"\x00\x00M\x10\x00\x00n\x10\x00\x00y\x10\x00\x00\x81\x10\x00\x00\x8b\x10\x00\x00\x9a\x10\x00\x00\xd6\x10\x00\x00\xee\x10"
+    b"\x00\x00$\x11\x00\x00B\x11\x00\x00Y\x11\x00\x00x\x11\x00\x00\x85\x11\x00\x00\x07\x12\x00\x000\x12\x00\x00A\x12"
+    b"\x00\x00R\x12\x00\x00}\x12\x00\x00\x94\x12\x00\x00\xb6\x12\x00\x00\xe8\x12\x00\x00\r\x13\x00\x00\x18\x13\x00\x00/\x13"
+    b"\x00\x00R\x13\x00\x00i\x13\x00\x00\xa2\x13\x00\x00\xb2\x13\x00\x00\xcd\x13\x00\x00\x02\x14\x00\x00D\x14\x00\x00V\x14"
+    b"\x00\x00q\x14\x00\x00z\x14\x00\x00\xca\x14\x00\x00\xd8\x14\x00\x00~\x15\x00\x00\xb3\x15\x00\x00\xd0\x15\x00\x00\xdc\x15"
+    b"\x00\x00\xed\x15\x00\x00C\x16\x00\x00T\x16\x00\x00i\x16\x00\x00{\x16\x00\x00\x90\x16\x00\x00\xb0\x16\x00\x00\xbc\x16"
+    b"\x00\x00\xe5\x16\x00\x00\x06\x17\x00\x00\x13\x17\x00\x00?\x17\x00\x00Q\x17\x00\x00\\\x17\x00\x00\x7f\x17\x00\x00\x9a\x17"
+    b"\x00\x00\xaf\x17\x00\x00\xc8\x17\x00\x00\xd6\x17\x00\x00\xf7\x17\x00\x00\t\x18\x00\x00.\x18\x00\x00M\x18\x00\x00X\x18"
+    b"\x00\x00\xa4\x18\x00\x00\xba\x18\x00\x00\xd6\x18\x00\x00O\x19\x00\x00j\x19\x00\x00\xf9\x19\x00\x00\x16\x1a\x00\x00N\x1a"
+    b"\x00\x00e\x1a\x00\x00\x81\x1a\x00\x00\xa6\x1a\x00\x00\xc4\x1a\x00\x00\x1b\x1b\x00\x00C\x1b\x00\x00\x93\x1b\x00\x00\x9f\x1b"
+    b"\x00\x00\xfc\x1b\x00\x00\x1d\x1c\x00\x00\x8c\x1c\x00\x00#\x1d\x00\x00Z\x1d\x00\x00B\x1e\x00\x00\x8b\x1e\x00\x00\xa4\x1e"
+    b"\x00\x00\xb8\x1e\x00\x00\xd9\x1e\x00\x00\xf8\x1e\x00\x00\x06\x1f\x00\x00\x19\x1f\x00\x00L\x1f\x00\x00a\x1f\x00\x00|\x1f"
+    b'\x00\x00\xc4\x1f\x00\x00\xdf\x1f\x00\x00\xfe\x1f\x00\x00\x08 \x00\x00\x16 \x00\x00" \x00\x00? \x00\x00\x8b '
+    b"\x00\x00\xad \x00\x00\xd0 \x00\x00\xe0 \x00\x00\x05!\x00\x00#!\x00\x00A!\x00\x00h!\x00\x00\x90!"
+    b'\x00\x00\x9b!\x00\x00\xb8!\x00\x00\xd1!\x00\x00\xf6!\x00\x00\x1e"\x00\x00="\x00\x00W"\x00\x00o"'
+    b'\x00\x00\x8b"\x00\x00\xb0"\x00\x00\xbc"\x00\x00\xf0"\x00\x00\x15#\x00\x003#\x00\x00u#\x00\x00\x8b#'
+    b"\x00\x00\xb0#\x00\x00\xb8#\x00\x00\xde#\x00\x00\x17$\x00\x00!$\x00\x00o$\x00\x00\x7f$\x00\x00\x98$"
+    b"\x00\x00\xb3$\x00\x00\xbb$\x00\x00\xc7$\x00\x00\xef$\x00\x00\x94%\x00\x00\xb8%\x00\x00\xc2%\x00\x00\xf3%"
+    b"\x00\x00$&\x00\x00}&\x00\x00\x98&\x00\x00\xb3&\x00\x00\xe6&\x00\x00\x00'\x00\x00\x10'\x00\x00('"
+    b"\x00\x00q'\x00\x00\x7f'\x00\x00\x98'\x00\x00\xbe'\x00\x00\xc8'\x00\x00\xf2'\x00\x00\x00(\x00\x00-("
+    b"\x00\x00^(\x00\x00o(\x00\x00d)\x00\x00w)\x00\x00\x90)\x00\x00\xaa)\x00\x00\xbb)\x00\x00\xdf)"
+    b"\x00\x00\xe5)\x00\x00\xfa)\x00\x00!*\x00\x000*\x00\x00w*\x00\x00\x97*\x00\x00\xa6*\x00\x00\xb0*"
+    b"\x00\x00\xda*\x00\x00\x12+\x00\x00\x8e+\x00\x00\xb4+\x00\x00\xd5+\x00\x00\xec+\x00\x00J,\x00\x00\x89,"
+    b"\x00\x00\x9f,\x00\x00\xb1,\x00\x00\xd8,\x00\x00\x1f-\x00\x00S-\x00\x00\x84-\x00\x00\xa3-\x00\x00\xad-"
+    b"\x00\x00\xc8-\x00\x00\xd8-\x00\x00$.\x00\x006.\x00\x00V.\x00\x00b.\x00\x00\xd5.\x00\x00\xe7."
+    b"\x00\x00\xfa.\x00\x00\x1f/\x00\x00N/\x00\x00c/\x00\x00\x88/\x00\x00\x93/\x00\x00\xb2/\x00\x00\xdb/"
+    b"\x00\x00\xe8/\x00\x00\n0\x00\x00#0\x00\x0080\x00\x00X0\x00\x00\xbf0\x00\x00\xf90\x00\x00\x181"
+    b'\x00\x00"1\x00\x00P1\x00\x00~1\x00\x00\x8b1\x00\x00\xb01\x00\x00\xc81\x00\x00\xff1\x00\x0002'
+    b"\x00\x00q2\x00\x00\x922\x00\x00\xd12\x00\x00\xf72\x00\x00/3\x00\x00\xc63\x00\x00\xcc3\x00\x00\xd53"
+    b"\x00\x00\xfd3\x00\x00+4\x00\x00C4\x00\x00u4\x00\x00\x954\x00\x00\xae4\x00\x00\xd34\x00\x00/5"
+    b"\x00\x00I5\x00\x00p5\x00\x00\x855\x00\x00\n6\x00\x00(6\x00\x0016\x00\x00g6\x00\x00~6"
+    b"\x00\x00\xbc6\x00\x00\xc76\x00\x00\xda6\x00\x00\xd0\x92\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xba\xd0"
+    b"\xb0\xd0\xb6\xd0\xb4\xd0\xbe\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe \xd0\xb2\xd0\xb0\xd1\x88\xd0\xb5\xd0\xb9 "
+    b"\xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb8 BIP39 \xd0\xb2 \xd0\xb2\xd0\xb8"
+    b"\xd0\xb4\xd0\xb5 \xd0\xb2\xd0\xbe\xd1\x81\xd1\x8c\xd0\xbc\xd0\xb5\xd1\x80\xd0\xb8\xd1\x87\xd0\xbd\xd0\xbe\xd0\xb3\xd0\xbe "
+    b"\xd1\x87\xd0\xb8\xd1\x81\xd0\xbb\xd0\xb0 \xd0\xbe\xd1\x82 1 \xd0\xb4\xd0\xbe 4000.\xd0\x9d\xd0\xb5"
+    b" \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xbe\xd1\x81\xd1\x8c \xd1\x81\xd0\xbe\xd0\xb1\xd1\x80\xd0\xb0\xd1\x82\xd1\x8c \xd1"
+    b"\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1\x8e \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x8b\xd0\x9d\xd0\xbe"
+    b"\xd0\xb2\xd0\xb0\xd1\x8f \xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0\xd0\x98\xd1\x82\xd0\xb5\xd1"
+    b"\x80\xd0\xb0\xd1\x82\xd0\xbe\xd1\x80 PBKDF2.\xd0\xa1\xd0\xba\xd0\xbe\xd1\x80\xd0\xbe\xd1\x81\xd1\x82\xd1"
+    b"\x8c \xd0\x9f\xd0\xbe\xd0\xb4\xd0\xb0\xd1\x87\xd0\xb8\xd0\x93\xd0\xbb\xd1\x83\xd0\xb1\xd0\xb8\xd0\xbd\xd0\xb0 \xd0\xa0\xd0"
+    b"\xb5\xd0\xb7\xd0\xba\xd0\xb8\xd0\x90\xd0\xbf\xd0\xbf\xd0\xb0\xd1\x80\xd0\xb0\xd1\x82\xd0\xbd\xd0\xbe\xd0\xb5 \xd0\x9e\xd0\xb1"
+    b"\xd0\xb5\xd1\x81\xd0\xbf\xd0\xb5\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5\xd0\x9f\xd0\xbe\xd1\x81\xd1\x82\xd0\xbe\xd1\x8f\xd0\xbd"
+    b"\xd0\xbd\xd0\xb0\xd1\x8f \xd0\x9f\xd0\xb0\xd0\xbc\xd1\x8f\xd1\x82\xd1\x8c\xd0\x9f\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd1\x8c "
+    b"\xd0\xb2 QR\xd0\xa1\xd0\xbe\xd0\xb7\xd0\xb4\xd0\xb0\xd1\x82\xd1\x8c QR-\xd0\xba\xd0\xbe\xd0\xb4 \xd0\xb8"
+    b"\xd0\xb7 \xd1\x82\xd0\xb5\xd0\xba\xd1\x81\xd1\x82\xd0\xb0?\xd0\xba \xd0\xa8\xd0\x95\xd0\xa1\xd0\xa2\xd0\x98\xd0\x93\xd0"
+    b"\xa0\xd0\x90\xd0\x9d\xd0\x9d\xd0\x9e\xd0\x99% \xd0\xbe\xd1\x82 \xd1\x81\xd1\x83\xd0\xbc\xd0\xbc\xd1\x8b.\xd0\x9c\xd0"
+    b"\xb8\xd0\xbd\xd0\xb8\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0"
+    b"\xb0 \xd1\x81 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x8b\xd0\x9d\xd0\xb5\xd0\xb2\xd0\xb5\xd1\x80\xd0\xbd\xd1\x8b"
+    b"\xd0\xb9 \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd0\xb5\xd0\xba:\xd0\x91\xd0\xb5\xd0\xbd\xd1\x87\xd0\xbc\xd0\xb0\xd1\x80"
+    b"\xd0\xba\xd0\xb8\xd0\x9a\xd0\xbe\xd0\xbc\xd0\xb8\xd1\x81\xd1\x81\xd0\xb8\xd1\x8f:\xd1\x82\xd0\xb5\xd0\xba\xd1\x81\xd1\x82:"
+    b"\xd0\xa2\xd0\xb8\xd0\xbf \xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xb0\xd0\x98\xd0\xb4\xd0\xb5\xd0\xbd\xd1\x82\xd0"
+    b"\xb8\xd1\x84\xd0\xb8\xd0\xba\xd0\xb0\xd1\x82\xd0\xbe\xd1\x80\xd0\xa0\xd0\xb5\xd0\xb7\xd1\x83\xd0\xbb\xd1\x8c\xd1\x82\xd0\xb0\xd1"
+    b"\x82\xd0\xa8\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd0\xb5\xd0\x94\xd1\x80\xd0\xb0\xd0\xb9\xd0\xb2\xd0"
+    b"\xb5\xd1\x80\xd0\x9d\xd0\xb5 \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xbe\xd1\x81\xd1\x8c \xd1\x80\xd0\xb0\xd1\x81\xd1\x88\xd0"
+    b"\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c\xd0\x98\xd0\xb7\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb8\xd1"
+    b"\x8f \xd0\xb1\xd1\x83\xd0\xb4\xd1\x83\xd1\x82 \xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c\xd1\x81\xd1\x8f "
+    b"\xd0\xb4\xd0\xbe \xd0\xb2\xd1\x8b\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f.\xd0\x94\xd1\x80\xd1\x83"
+    b"\xd0\xb3\xd0\xb8\xd0\xb5 \xd1\x84\xd0\xbe\xd1\x80\xd0\xbc\xd0\xb0\xd1\x82\xd1\x8b\xd0\x92\xd0\xb2\xd0\xb5\xd1\x81\xd1\x82\xd0"
+    b"\xb8 BIP39 \xd1\x84\xd1\x80\xd0\xb0\xd0\xb7\xd1\x83-\xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c%"
+    b"s \xd0\xb1\xd0\xb8\xd1\x82\xd0\x9f\xd0\xbe\xd0\xb4\xd1\x82\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5 \xd0"
+    b"\xba\xd0\xbe\xd0\xb4 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1"
+    b"\x8b\xd1\x82\xd0\xb8\xd1\x8f\xd0\x91\xd1\x80\xd0\xbe\xd1\x81\xd0\xba\xd0\xb8:\xd0\x94\xd0\xbb\xd0\xb8\xd0\xbd\xd0\xb0 \xd0"
+    b"\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8f\xd0\x9d\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb8\xd0\xa2\xd0"
+    b"\xb8\xd0\xbf \xd0\xbf\xd0\xbe\xd0\xbb\xd0\xb8\xd1\x82\xd0\xb8\xd0\xba\xd0\xb8\xd0\x9e\xd0\xb1\xd1\x80\xd0\xb0\xd0\xb7\xd0\xb5"
+    b"\xd1\x86 \xd0\xbe\xd0\xb1\xd0\xbd\xd0\xb0\xd1\x80\xd1\x83\xd0\xb6\xd0\xb5\xd0\xbd!\xd0\xa1 \xd0\x9f\xd0\xbe\xd0\xbc\xd0"
+    b"\xbe\xd1\x89\xd1\x8c\xd1\x8e D6\xd0\x92\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xba\xd0\xb0\xd0\xb6\xd0"
+    b"\xb4\xd0\xbe\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe \xd0\xb2\xd0\xb0\xd1\x88\xd0\xb5\xd0\xb9 BIP3"
+    b"9 \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb8.\xd0\x9d\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0"
+    b"\xbe\xd0\xb9\xd0\xba\xd0\xb8 \xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd1\x8f\xd1\x82\xd1\x81\xd1\x8f \xd0\xb2\xd0\xbe \xd1\x84"
+    b"\xd0\xbb\xd1\x8d\xd1\x88-\xd0\xbf\xd0\xb0\xd0\xbc\xd1\x8f\xd1\x82\xd0\xb8.\xd0\x9f\xd1\x80\xd0\xb5\xd0\xbe\xd0\xb1\xd1\x80"
+    b"\xd0\xb0\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd0\xb5 \xd0\xbd\xd0\xb5 \xd0\xb2\xd1\x8b\xd0\xbf\xd0\xbe\xd0\xbb"
+    b"\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xbe.\xd0\xa1 \xd0\x9f\xd0\xbe\xd0\xbc\xd0\xbe\xd1\x89\xd1\x8c\xd1\x8e \xd0\xa0\xd1\x83\xd1"
+    b"\x87\xd0\xbd\xd0\xbe\xd0\xb3\xd0\xbe \xd0\x92\xd0\xb2\xd0\xbe\xd0\xb4\xd0\xb0\xd0\x9c\xd0\xb5\xd1\x82\xd0\xbe\xd0\xb4 \xd0"
+    b"\xa0\xd0\xb5\xd0\xb7\xd0\xba\xd0\xb8OK\xd0\x9a\xd0\xbe\xd1\x8d\xd1\x84\xd1\x84\xd0\xb8\xd1\x86\xd0\xb8\xd0\xb5\xd0\xbd\xd1"
+    b"\x82 \xd1\x83\xd1\x81\xd0\xbf\xd0\xb5\xd1\x85\xd0\xb0:\xd0\xa0\xd0\xb5\xd0\xb6\xd0\xb8\xd0\xbc \xd0\xbc\xd0\xb0\xd1\x81"
+    b"\xd1\x88\xd1\x82\xd0\xb0\xd0\xb1\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8f\xd0\x9f\xd0\xb5\xd1\x80\xd0\xb5"
+    b"\xd0\xb2\xd0\xb5\xd1\x80\xd0\xbd\xd1\x83\xd1\x82\xd1\x8b\xd0\xb5 \xd1\x86\xd0\xb2\xd0\xb5\xd1\x82\xd0\xb0\xd0\x9d\xd0\xb5\xd0"
+    b"\xb4\xd0\xbe\xd1\x81\xd1\x82\xd0\xb0\xd1\x82\xd0\xbe\xd1\x87\xd0\xbd\xd0\xb0\xd1\x8f \xd0\xad\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe"
+    b"\xd0\xbf\xd0\xb8\xd1\x8f!\xd0\xa1\xd0\xbe\xd0\xb7\xd0\xb4\xd0\xb0\xd0\xbd\xd0\xbe:\xd0\x94\xd0\xb2\xd0\xbe\xd0\xb9\xd0\xbd"
+    b"\xd0\xb0\xd1\x8f \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0\xd0\xad\xd0\xba\xd1\x81\xd0\xbf\xd0"
+    b"\xbe\xd1\x80\xd1\x82 %s \xd0\xbd\xd0\xb0 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x83\xe2\x80\xa6\xd0\xa1"
+    b"\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c QR-\xd0\xb8\xd0\xb7\xd0\xbe\xd0\xb1\xd1\x80\xd0\xb0"
+    b"\xd0\xb6\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd0\xbd\xd0\xb0 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x83RX "
+    b"\xd0\x9f\xd0\xb8\xd0\xbd\xd0\x9d\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb8 \xd1\x81\xd0\xbe\xd1\x85\xd1"
+    b"\x80\xd0\xb0\xd0\xbd\xd0\xb5\xd0\xbd\xd1\x8b \xd0\xbd\xd0\xb0 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd0\xb5.\xd0"
+    b"\xa1\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd0\xbd\xd0\xb0 SD \xd0\x9a\xd0\xb0\xd1\x80"
+    b"\xd1\x82\xd1\x83\xd0\x98\xd0\xbd\xd1\x81\xd1\x82\xd1\x80\xd1\x83\xd0\xbc\xd0\xb5\xd0\xbd\xd1\x82\xd1\x8b\xd0\x9d\xd0\xb0\xd1\x81"
+    b"\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb0 \xd0\xb2\xd0\xb0\xd1\x88\xd0\xb5\xd0\xb3\xd0\xbe \xd0\xba\xd0\xbe\xd1\x88"
+    b"\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0 \xd1\x81\xd0\xbe\xd0\xb7\xd0\xb4\xd0\xb0\xd1\x81\xd1\x82 \xd0\xbd\xd0\xbe\xd0\xb2"
+    b"\xd1\x8b\xd0\xb9 \xd0\xba\xd0\xbb\xd1\x8e\xd1\x87 \xd0\xb8 \xd0\xb2\xd1\x8b\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1"
+    b"\x82 \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80.\xd0\xa1\xd0\xbe\xd0\xbe\xd0\xb1\xd1"
+    b"\x89\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5:\xd0\xa8\xd0\xba\xd0\xb0\xd0\xbb\xd0\xb0\xd0\xaf\xd0\xb7\xd1\x8b\xd0\xba\xd0\x91\xd1\x80"
+    b"\xd0\xbe\xd1\x81\xd1\x8c\xd1\x82\xd0\xb5 \xd0\xba\xd1\x83\xd0\xb1\xd0\xb8\xd0\xba \xd0\xbd\xd0\xb5 \xd0\xbc\xd0\xb5\xd0"
+    b"\xbd\xd0\xb5\xd0\xb5 %d \xd1\x80\xd0\xb0\xd0\xb7, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b \xd1\x81\xd0\xb3"
+    b"\xd0\xb5\xd0\xbd\xd0\xb5\xd1\x80\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0"
+    b"\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd1\x83.\xd0\x9e\xd1\x82\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5\xe2\x80"
+    b"\xa6\xd0\xa1\xd0\xba\xd0\xbe\xd1\x80\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c \xd0\x9f\xd0\xbe\xd0\xb3\xd1\x80\xd1\x83\xd0\xb6\xd0\xb5"
+    b"\xd0\xbd\xd0\xb8\xd1\x8f\xd0\xa1\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe %d\xd0\x9f\xd0\xa0\xd0\x98\xd0\x9a\xd0\x9e\xd0\xa1\xd0"
+    b"\x9d\xd0\x98\xd0\xa2\xd0\x95\xd0\xa1\xd0\xac \xd0\xb8\xd0\xbb\xd0\xb8 \xd0\xbd\xd0\xb0\xd0\xb6\xd0\xbc\xd0\xb8\xd1\x82\xd0"
+    b"\xb5 \xd0\x92\xd0\x92\xd0\x9e\xd0\x94, \xd0\xb4\xd0\xbb\xd1\x8f \xd0\xa3\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0"
+    b"\xb2\xd0\xb8\xd1\x82\xd1\x8c.\xd0\xa1\xd0\xb8\xd0\xbb\xd0\xb0SHA256 \xd1\x81\xd0\xbd\xd1\x8d\xd0\xbf\xd1"
+    b"\x88\xd0\xbe\xd1\x82\xd0\xb0:\xd0\xbe\xd1\x82 \xd1\x88\xd0\xb5\xd1\x81\xd1\x82\xd0\xb8\xd0\xb3\xd1\x80\xd0\xb0\xd0\xbd\xd0"
+    b"\xbd\xd0\xb8\xd0\xba\xd0\xb0\xd0\x9a\xd0\xb0\xd1\x80\xd1\x82\xd0\xb0 \xd1\x84\xd0\xbb\xd1\x8d\xd1\x88\xd0\xb0\xd0\x9d\xd0\xb0"
+    b"\xd0\xbf\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd0\xb0\xd1\x82\xd1\x8c \xd0\xb2 \xd0\xb2\xd0\xb8\xd0\xb4\xd0\xb5 QR?"
+    b"\xd0\xa4\xd0\xb0\xd0\xb9\xd0\xbb %s \xd1\x81\xd1\x83\xd1\x89\xd0\xb5\xd1\x81\xd1\x82\xd0\xb2\xd1\x83\xd0\xb5\xd1\x82"
+    b" \xd0\xbd\xd0\xb0 SD \xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd0\xb5.\xd0\x9d\xd0\xb5\xd0\xb4\xd0\xbe\xd0\xbf\xd1\x83"
+    b"\xd1\x81\xd1\x82\xd0\xb8\xd0\xbc\xd1\x8b\xd0\xb9 \xd0\xbf\xd1\x83\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb5\xd1\x80\xd0\xb8\xd0\xb2"
+    b"\xd0\xb0\xd1\x86\xd0\xb8\xd0\xb8\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c \xd1\x81 SD"
+    b" \xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x8b?PAGE \xd0\xb4\xd0\xbb\xd1\x8f \xd0\xbf\xd0\xb5\xd1\x80\xd0\xb5"
+    b"\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f \xd1\x8f\xd1\x80\xd0\xba\xd0\xbe\xd1\x81\xd1\x82\xd0\xb8\xd0"
+    b"\x9e\xd1\x88\xd0\xb8\xd0\xb1\xd0\xba\xd0\xb0:\xd0\x9f\xd1\x80\xd0\xb0\xd0\xb2\xd0\xb8\xd0\xbb\xd1\x8c\xd0\xbd\xd0\xbe \xd1"
+    b"\x81\xd0\xbe\xd0\xb2\xd0\xbc\xd0\xb5\xd1\x81\xd1\x82\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x83"
+    b" \xd0\xb8 \xd1\x80\xd0\xb5\xd0\xb7\xd0\xb5\xd1\x80\xd0\xb2\xd0\xbd\xd1\x83\xd1\x8e \xd0\xbf\xd0\xbb\xd0\xb0\xd1\x81\xd1"
+    b"\x82\xd0\xb8\xd0\xbd\xd1\x83.\xd0\xa0\xd0\xb5\xd0\xb7\xd1\x83\xd0\xbb\xd1\x8c\xd1\x82\xd0\xb0\xd1\x82 XOR\xd0\xa2"
+    b"\xd0\xb8\xd0\xbf \xd0\x96\xd0\x9a-\xd0\xb4\xd0\xb8\xd1\x81\xd0\xbf\xd0\xbb\xd0\xb5\xd1\x8f\xd0\xa0\xd0\xb5\xd0\xb7\xd1\x83"
+    b"\xd0\xbb\xd1\x8c\xd1\x82\xd0\xb0\xd1\x82\xd1\x8b \xd0\xbd\xd0\xb0\xd0\xb1\xd0\xbe\xd1\x80\xd0\xb0 \xd1\x82\xd0\xb5\xd1\x81"
+    b"\xd1\x82\xd0\xbe\xd0\xb2\xd1\x81\xd0\xbb\xd1\x83\xd1\x87\xd0\xb0\xd0\xb9 \xd1\x81\xd0\xbc\xd0\xb5\xd0\xbd\xd1\x8b\xd0\x9e\xd1"
+    b"\x82\xd1\x81\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\x9a\xd0\xbb\xd1\x8e\xd1\x87"
+    b" QR \xd0\xba\xd0\xbe\xd0\xb4\xd0\x97\xd0\xb0\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd0"
+    b"\x93\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x86\xd0\x97\xd0\xb0\xd0\xb4\xd0\xb5\xd1\x80\xd0\xb6\xd0\xba\xd0\xb0 \xd0\x9b\xd0\xb8"
+    b"\xd0\xbd\xd0\xb8\xd0\xb8\xd0\x9f\xd0\xbb\xd0\xbe\xd1\x85\xd0\xb0\xd1\x8f \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0"
+    b"\xb8\xd1\x8f!\xd0\x97\xd0\xb0\xd0\xba\xd1\x80\xd0\xb0\xd1\x81\xd1\x8c\xd1\x82\xd0\xb5 \xd0\xbf\xd0\xb5\xd1\x80\xd1\x84\xd0"
+    b"\xbe\xd1\x80\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5 \xd1\x82\xd0\xbe\xd1\x87\xd0\xba\xd0\xb8"
+    b" \xd1\x87\xd0\xb5\xd1\x80\xd0\xbd\xd1\x8b\xd0\xbc \xd1\x86\xd0\xb2\xd0\xb5\xd1\x82\xd0\xbe\xd0\xbc, \xd1\x87\xd1\x82"
+    b"\xd0\xbe\xd0\xb1\xd1\x8b \xd0\xb8\xd1\x85 \xd0\xbc\xd0\xbe\xd0\xb6\xd0\xbd\xd0\xbe \xd0\xb1\xd1\x8b\xd0\xbb\xd0\xbe "
+    b"\xd0\xbe\xd0\xb1\xd0\xbd\xd0\xb0\xd1\x80\xd1\x83\xd0\xb6\xd0\xb8\xd1\x82\xd1\x8c.\xd0\xbe\xd1\x82 utf8\xd0\x9e"
+    b"\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb0\xd0\x98\xd0\xbd\xd0\xb4\xd0\xb5\xd0\xba\xd1\x81 \xd1\x81\xd1\x87\xd0\xb5\xd1\x82\xd0"
+    b"\xb0\xd0\x92\xd1\x8b \xd1\x83\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb5\xd0\xbd\xd1\x8b?\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1"
+    b"\x81\xd0\xb0\xd1\x82\xd1\x8c\xd0\xa1\xd1\x82\xd0\xb0\xd0\xbd\xd0\xb4\xd0\xb0\xd1\x80\xd1\x82\xd0\xbd\xd1\x8b\xd0\xb9 \xd1\x80"
+    b"\xd0\xb5\xd0\xb6\xd0\xb8\xd0\xbc\xd0\xa1\xd0\xb2\xd0\xbe\xd0\xb1\xd0\xbe\xd0\xb4\xd0\xbd\xd0\xbe:(\xd0\xa2\xd0\xbe\xd0\xbb"
+    b"\xd1\x8c\xd0\xba\xd0\xbe \xd1\x87\xd0\xb0\xd1\x81\xd1\x8b)\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd1\x8c\xe2\x80"
+    b"\xa6\xd0\x98\xd0\xbd\xd0\xb4\xd0\xb5\xd0\xba\xd1\x81\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0\xb0 \xd1\x81"
+    b"\xd0\xbf\xd0\xb8\xd1\x81\xd0\xba\xd0\xb0 \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xe2\x80\xa6\xd0\x9f\xd1\x80\xd0\xb8\xd0\xbd"
+    b"\xd1\x82\xd0\xb5\xd1\x80\xd0\x9e\xd1\x82\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c\xd0\x98\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb"
+    b"\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xbe\xd1\x82\xd0\xbf\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd0\xbe\xd0"
+    b"\xba \xd0\xbf\xd0\xb0\xd0\xbb\xd1\x8c\xd1\x86\xd0\xb0 \xd0\xba\xd0\xb0\xd0\xba ID?SHA256 "
+    b"\xd0\xb1\xd1\x80\xd0\xbe\xd1\x81\xd0\xba\xd0\xbe\xd0\xb2:QR-\xd0\xbc\xd0\xb5\xd1\x82\xd0\xba\xd0\xb0\xd0\x9b\xd0\xbe"
+    b"\xd0\xba\xd0\xb0\xd0\xbb\xd1\x8c%s \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb5\xd0\xbd.\xd0\xa2\xd0\xb5\xd1\x80\xd0\xbc"
+    b"\xd0\xb0\xd0\xbb\xd1\x8c\xd0\xbd\xd1\x8b\xd0\xb9%d \xd0\xb8\xd0\xb7 %d \xd0\xbc\xd1\x83\xd0\xbb\xd1\x8c\xd1"
+    b"\x82\xd0\xb8\xd0\xbf\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd1\x8c\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb5\xd0"
+    b"\xbd\xd0\xbe %d \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2 \xd0\xb1\xd0\xb5\xd0\xb7 \xd1\x81\xd0"
+    b"\xbe\xd0\xb2\xd0\xbf\xd0\xb0\xd0\xb4\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb9.\xd0\xa0\xd0\xb0\xd1\x81\xd0\xbf\xd0\xb5\xd1\x87\xd0\xb0"
+    b"\xd1\x82\xd0\xb0\xd1\x82\xd1\x8c Tinyseed?\xd0\xa5\xd0\xbe\xd1\x80\xd0\xbe\xd1\x88\xd0\xb0\xd1\x8f"
+    b" \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1\x8f\xd0\xa1\xd0\xb4\xd0\xb0\xd1\x87\xd0\xb0\xd0\xa1\xd1\x82\xd0"
+    b"\xb0\xd1\x82\xd0\xb8\xd1\x81\xd1\x82\xd0\xb8\xd0\xba\xd0\xb0 \xd0\xb4\xd0\xbb\xd1\x8f \xd0\x93\xd0\xb8\xd0\xba\xd0\xbe\xd0"
+    b"\xb2\xd0\x98\xd0\xb7\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xbe:\xd0\x97\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe"
+    b"\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb9 QR \xd0\x9a\xd0\xbe\xd0\xb4\xd0\xa1 \xd0\x9f\xd0\xbe\xd0\xbc\xd0"
+    b"\xbe\xd1\x89\xd1\x8c\xd1\x8e D20\xd0\xa0\xd0\xb0\xd1\x81\xd1\x85\xd0\xbe\xd0\xb4:\xd0\x9a\xd0\xbe\xd1\x88\xd0\xb5"
+    b"\xd0\xbb\xd0\xb5\xd0\xba \xd0\xbf\xd0\xbe \xd1\x83\xd0\xbc\xd0\xbe\xd0\xbb\xd1\x87\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8e\xd0\xa7"
+    b"\xd0\xb0\xd1\x81\xd1\x82\xd1\x8c M \xd0\xb8\xd0\xb7 N\xd0\x94\xd0\xb024 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2"
+    b"\xd0\xb0\xd0\xa2\xd0\xb5\xd0\xba\xd1\x83\xd1\x89\xd0\xb8\xd0\xb9 \xd0\xba\xd0\xbe\xd0\xb4 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2"
+    b"\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f\xd0\x9e\xd0\xb1\xd0\xbd\xd0"
+    b"\xbe\xd0\xb2\xd0\xb8\xd1\x82\xd1\x8c \xd0\xb8\xd0\xb4\xd0\xb5\xd0\xbd\xd1\x82\xd0\xb8\xd1\x84\xd0\xb8\xd0\xba\xd0\xb0\xd1\x82"
+    b"\xd0\xbe\xd1\x80 KEF?\xd0\xa4\xd0\xbb\xd1\x8d\xd1\x88 \xd0\xb7\xd0\xb0\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xb5"
+    b"\xd0\xbd \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd0\xb5\xd0\xb9 \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80"
+    b"\xd1\x8b\xd0\x94\xd0\xb8\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x82\xd1\x80 \xd0\xa4\xd0\xbb\xd1\x8e\xd1\x82\xd0\xb0\xd0\xa3\xd0\xb4\xd0"
+    b"\xb0\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c \xd1\x8d\xd1\x82\xd0\xbe\xd1\x82 \xd1\x84\xd0\xb0\xd0\xb9\xd0\xbb?\xd0\x9c\xd0\xbd"
+    b"\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0 \xd0\xb8 \xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xbd"
+    b"\xd0\xb0\xd1\x8f \xd1\x84\xd1\x80\xd0\xb0\xd0\xb7\xd0\xb0 \xd0\xb1\xd1\x83\xd0\xb4\xd1\x83\xd1\x82 \xd1\x81\xd0\xbe\xd1"
+    b"\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb5\xd0\xbd\xd1\x8b.\xd0\xa2\xd0\xb5\xd0\xbc\xd0\xb0\xd0\x9f\xd1\x80\xd0\xb5\xd0\xbe\xd0\xb1"
+    b"\xd1\x80\xd0\xb0\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb0\xd1\x82\xd1\x83\xd0\xbc\xd0\xa3\xd0\xb4\xd0"
+    b"\xb0\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c \xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd1\x83\xd0\xbe\xd1\x82"
+    b" base64%d \xd0\xba %d\xd0\x92\xd1\x8b\xd0\xb9\xd1\x82\xd0\xb8\xd0\x9f\xd0\xbe\xd0\xb4\xd0"
+    b"\xbf\xd0\xb8\xd1\x81\xd1\x8c:\xd0\xa3\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c \xd1\x84\xd0\xb0\xd0\xb9\xd0\xbb\xd1"
+    b"\x8b \xd0\xbf\xd1\x80\xd0\xbe\xd1\x88\xd0\xb8\xd0\xb2\xd0\xba\xd0\xb8 \xd1\x81 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1"
+    b"\x82\xd1\x8b?\xd0\x92\xd0\xbe\xd1\x81\xd1\x8c\xd0\xbc\xd0\xb5\xd1\x80\xd0\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9\xd0\xa1\xd0\xbc"
+    b"\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd1\x82\xd0\xb5\xd0\xbc\xd1\x83 \xd0\xb8 \xd0\xbf\xd0\xb5\xd1\x80\xd0\xb5\xd0"
+    b"\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c?\xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8"
+    b"\xd1\x87\xd0\xb5\xd1\x81\xd0\xba\xd0\xb8\xd0\xb9 XOR\xd0\xba \xd0\xbe\xd1\x81\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb0\xd0"
+    b"\xbd\xd0\xb8\xd1\x8e43\xd0\xa2\xd0\xb5\xd0\xba\xd1\x83\xd1\x89\xd0\xb5\xd0\xb5 \xd0\xb7\xd0\xbd\xd0\xb0\xd1\x87\xd0\xb5"
+    b"\xd0\xbd\xd0\xb8\xd0\xb5\xd0\xa0\xd0\xb5\xd0\xb3\xd0\xb8\xd0\xbe\xd0\xbd:\xd0\x9f\xd1\x80\xd0\xbe\xd1\x81\xd0\xbc\xd0\xbe\xd1"
+    b"\x82\xd1\x80\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xbe\xd1\x82\xd1\x81\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0"
+    b"\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5 \xd0\xb4\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5, \xd0\xbe\xd1\x82\xd1\x80\xd0\xb5\xd0"
+    b"\xb4\xd0\xb0\xd0\xba\xd1\x82\xd0\xb8\xd1\x80\xd1\x83\xd0\xb9\xd1\x82\xd0\xb5 \xd0\xbf\xd1\x80\xd0\xb8 \xd0\xbd\xd0\xb5\xd0"
+    b"\xbe\xd0\xb1\xd1\x85\xd0\xbe\xd0\xb4\xd0\xb8\xd0\xbc\xd0\xbe\xd1\x81\xd1\x82\xd0\xb8\xd0\x9a\xd0\xbe\xd0\xbd\xd0\xb2\xd0\xb5\xd1"
+    b"\x80\xd1\x82\xd0\xb0\xd1\x86\xd0\xb8\xd1\x8f \xd0\xb7\xd0\xb0\xd0\xb2\xd0\xb5\xd1\x80\xd1\x88\xd0\xb5\xd0\xbd\xd0\xb0\xd0\x92"
+    b"\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb8\xd1\x82\xd1\x8c?\xd0\xb4\xd0\xb2\xd0\xbe\xd0\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9:"
+    b"\xd0\x94\xd0\xbe\xd0\xba\xd0\xb0\xd0\xb7\xd1\x83\xd0\xb5\xd0\xbc\xd0\xbe \xd0\xbd\xd0\xb5\xd0\xbf\xd0\xbe\xd1\x82\xd1\x80\xd0"
+    b"\xb0\xd1\x82\xd0\xb8\xd0\xbc\xd1\x8b\xd0\xb9%s: \xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb6\xd0\xb5\xd0\xbd\xd0"
+    b"\xbe!QR \xd0\x9e\xd1\x82\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd1\x8b\xd0\xbc \xd0\xa2\xd0\xb5\xd0\xba\xd1\x81\xd1\x82"
+    b"\xd0\xbe\xd0\xbc\xd0\xa0\xd0\xb0\xd1\x81\xd1\x88\xd0\xb8\xd1\x80\xd0\xb5\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\x9f\xd1\x83\xd0"
+    b"\xb1\xd0\xbb\xd0\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\x9a\xd0\xbb\xd1\x8e\xd1\x87\xd0\x90\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81"
+    b"\xd0\xb0 \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80\xd0\xbe\xd0\xb2\xd0\x9a\xd0\xbe\xd0"
+    b"\xbb-\xd0\xb2\xd0\xbe\xd0\xba \xd0\xbe\xd1\x81\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8e32\xd0\x9f\xd1"
+    b"\x80\xd0\xbe\xd0\xb8\xd0\xb7\xd0\xb2\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xbd\xd1\x8b\xd0\xb9 \xd1\x82\xd0\xb5\xd0\xba\xd1\x81\xd1\x82"
+    b"\xd0\xbd\xd0\xb0\xd0\xb1\xd0\xbe\xd1\x80 \xd1\x82\xd0\xb5\xd1\x81\xd1\x82\xd0\xbe\xd0\xb2\xd0\xa3\xd0\xb4\xd0\xb0\xd0\xbb\xd0"
+    b"\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd0\xb4\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd1\x85 \xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0"
+    b"\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8f\xe2\x80\xa6\xd0\x9c\xd0\xbe\xd1\x89\xd0\xbd\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c"
+    b"\xd0\xa1\xd0\xbf\xd0\xb8\xd1\x81\xd0\xbe\xd0\xba \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2\xd0\x97\xd0\xb0\xd0"
+    b"\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0\xb0 \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2 \xd0\xb8\xd0\xb7\xd0"
+    b"\xbc\xd0\xb5\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f\xe2\x80\xa6\xd0\x9a\xd0\xbe\xd0\xb4\xd1\x8b \xd0\xbf\xd1\x80\xd0\xbe\xd0"
+    b"\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f \xd0\xbd\xd0\xb5 "
+    b"\xd1\x81\xd0\xbe\xd0\xb2\xd0\xbf\xd0\xb0\xd0\xb4\xd0\xb0\xd1\x8e\xd1\x82\xd0\x92\xd1\x8b\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb8"
+    b"\xd1\x82\xd1\x8c\xd0\x9f\xd0\xbe\xd0\xba\xd0\xb0\xd0\xb7\xd0\xb0\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb0\xd1\x82\xd1\x83\xd0\xbcQ"
+    b"R \xd0\x9a\xd0\xbe\xd0\xb4\xd0\x97\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xb0"
+    b"\xd1\x8f \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0 \xd0\xb1\xd1\x8b\xd0\xbb\xd0\xb0 \xd1"
+    b"\x81\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb0 \xd1\x81 ID:\xd0\xa6\xd0\xb2\xd0\xb5\xd1\x82"
+    b"\xd0\xb0 BGR\xd0\x9f\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c\xd1\x8e \xd1\x81\xd1\x82\xd0\xb5\xd1"
+    b"\x80\xd0\xb8\xd1\x82\xd0\xb5 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x83 \xd0\xb2 \xd0\xb4\xd1\x80\xd1\x83\xd0"
+    b"\xb3\xd0\xbe\xd0\xbc \xd1\x83\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd1\x81\xd1\x82\xd0\xb2\xd0\xb5, \xd1\x87\xd1\x82"
+    b"\xd0\xbe\xd0\xb1\xd1\x8b \xd1\x83\xd0\xb1\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd1\x8c\xd1\x81\xd1\x8f, \xd1\x87\xd1\x82\xd0"
+    b"\xbe \xd0\xb4\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5 \xd0\xbd\xd0\xb5 \xd0\xb2\xd0\xbe\xd1\x81\xd1\x81\xd1\x82\xd0\xb0"
+    b"\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb8\xd0\xbc\xd1\x8b\xd0\xbd\xd0\x95 \xd0\x9d\xd0\x90\xd0\x99\xd0\x94\xd0\x95\xd0\x9d\xd0\x9e "
+    b"\xd0\xb2 \xd0\xbf\xd0\xb5\xd1\x80\xd0\xb2\xd1\x8b\xd1\x85 %d \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xb0\xd1"
+    b"\x85\xd0\xad\xd0\xba\xd1\x81\xd0\xbf\xd0\xbe\xd1\x80\xd1\x82 \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2\xd0\x92"
+    b"\xd0\xb5\xd1\x80\xd1\x81\xd0\xb8\xd1\x8f\xd0\x98\xd0\xb7 \xd0\x9f\xd0\xb0\xd0\xbc\xd1\x8f\xd1\x82\xd0\xb8\xd0\x9f\xd0\xa0\xd0"
+    b"\x98\xd0\x9a\xd0\x9e\xd0\xa1\xd0\x9d\xd0\x98\xd0\xa2\xd0\x95\xd0\xa1\xd0\xac \xd0\xb8\xd0\xbb\xd0\xb8 \xd0\xbd\xd0\xb0\xd0"
+    b"\xb6\xd0\xbc\xd0\xb8\xd1\x82\xd0\xb5 \xd0\x92\xd0\x92\xd0\x9e\xd0\x94, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b \xd0"
+    b"\xb7\xd0\xb0\xd1\x85\xd0\xb2\xd0\xb0\xd1\x82\xd0\xb8\xd1\x82\xd1\x8c\xd0\x98\xd0\xb7 \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80"
+    b"\xd1\x8b\xd0\xa7\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb7 \xd0\xa1\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe\xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0"
+    b"\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0\xd0\x9e \xd0\x9f\xd1\x80\xd0\xbe\xd0\xb3\xd1\x80\xd0\xb0\xd0\xbc\xd0\xbc\xd0\xb5\xd0\xad"
+    b"\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1\x8f \xd0\xa8\xd0\xb5\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xbd\xd0\xb0:\xd0\x92"
+    b"\xd0\xbf\xd1\x80\xd0\xb0\xd0\xb2\xd0\xbe\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xb5"
+    b" \xd0\xa1\xd0\xbe\xd0\xbe\xd0\xb1\xd1\x89\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5\xd0\x92\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0"
+    b"\xb5 %d \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2 BIP39.\xd0\xa0\xd0\xb0\xd0\xb7\xd0\xbc\xd0\xb5\xd1\x80"
+    b":\xd0\x92\xd1\x80\xd0\xb5\xd0\xbc\xd1\x8f \xd0\xad\xd0\xba\xd1\x80\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xb9 \xd0\x97\xd0"
+    b"\xb0\xd1\x81\xd1\x82\xd0\xb0\xd0\xb2\xd0\xba\xd0\xb8\xd0\xa1\xd0\xbe\xd0\xbe\xd0\xb1\xd1\x89\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5%"
+    b"s \xd0\xb1\xd0\xb0\xd0\xb9\xd1\x82\xd0\x90\xd0\xbd\xd1\x82\xd0\xb8\xd0\xb4\xd1\x80\xd0\xb5\xd0\xb1\xd0\xb5\xd0\xb7\xd0\xb3"
+    b" \xd0\xba\xd0\xbd\xd0\xbe\xd0\xbf\xd0\xbe\xd0\xba\xd0\x94\xd0\xb2\xd0\xbe\xd0\xb8\xd1\x87\xd0\xbd\xd0\xb0\xd1\x8f \xd1\x81"
+    b"\xd0\xb5\xd1\x82\xd0\xba\xd0\xb0\xd0\x92\xd0\xb2\xd0\xb5\xd1\x81\xd1\x82\xd0\xb8 \xd0\x9a\xd0\xbb\xd1\x8e\xd1\x87\xd0\x92\xd0"
+    b"\xb8\xd0\xb4\xd0\xb8\xd0\xbc\xd0\xb0\xd1\x8f \xd0\xbc\xd0\xb5\xd1\x82\xd0\xba\xd0\xb0\xd0\x9a\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb"
+    b"\xd0\xb5\xd0\xba\xd0\x95\xd0\xb4\xd0\xb8\xd0\xbd\xd0\xb8\xd1\x86\xd0\xb0 \xd0\x98\xd0\xb7\xd0\xbc\xd0\xb5\xd1\x80\xd0\xb5\xd0"
+    b"\xbd\xd0\xb8\xd1\x8f\xd0\xa0\xd0\xb0\xd1\x81\xd1\x85\xd0\xbe\xd0\xb4 (%d):\xd0\xa1\xd0\xbe\xd1\x85\xd1\x80\xd0"
+    b"\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd0\xbd\xd0\xb0 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x83\xd0\xba\xd0\xbe"
+    b"\xd1\x80\xd1\x80\xd0\xb5\xd0\xba\xd1\x82\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\x9b\xd0\xb8\xd0"
+    b"\xbd\xd0\xb8\xd1\x8f:\xd0\xa1\xd0\xbd\xd0\xb0\xd1\x87\xd0\xb0\xd0\xbb\xd0\xb0 \xd1\x83\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0"
+    b"\xbe\xd0\xb2\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xba\xd0\xbe\xd0\xb4 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0"
+    b"\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f\xd0\x97\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe"
+    b"\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c\xd0\x98\xd0\xb4\xd0\xb5\xd1\x82 \xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0"
+    b"\xb0\xe2\x80\xa6\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1"
+    b"\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80 \xd0\xb4\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb5\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xb3"
+    b"\xd0\xbe \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0 \xd0\xb4\xd0\xbb\xd1\x8f \xd0\xbf\xd1\x80\xd0"
+    b"\xbe\xd1\x81\xd0\xbc\xd0\xbe\xd1\x82\xd1\x80\xd0\xb0 \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2?\xd0\x9f\xd0"
+    b"\xbb\xd0\xbe\xd1\x85\xd0\xb0\xd1\x8f \xd0\xbf\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd1\x8c\xd0\x94\xd0\xbb\xd1\x8f \xd0"
+    b"\xb3\xd0\xb0\xd1\x80\xd0\xb0\xd0\xbd\xd1\x82\xd0\xb8\xd0\xb8 \xd0\xbd\xd0\xb5\xd0\xb2\xd0\xbe\xd1\x81\xd1\x81\xd1\x82\xd0\xb0"
+    b"\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f \xd0\xb4\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd1\x85 \xd0\xb8"
+    b"\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd1\x83\xd0\xb9\xd1\x82\xd0\xb5 \xd1\x84\xd1\x83\xd0\xbd\xd0\xba\xd1\x86\xd0"
+    b"\xb8\xd1\x8e \xd0\x9e\xd1\x87\xd0\xb8\xd1\x81\xd1\x82\xd0\xba\xd0\xb8 \xd0\xa3\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd1"
+    b"\x81\xd1\x82\xd0\xb2\xd0\xb0\xd0\xb2\xd0\xbd\xd1\x83\xd1\x82\xd1\x80\xd0\xb5\xd0\xbd\xd0\xbd\xd0\xb8\xd0\xb9 \xd0\xba\xd0\xbb"
+    b"\xd1\x8e\xd1\x87Static / \xd0\xa1\xd1\x82\xd0\xb0\xd1\x82\xd0\xb8\xd1\x87\xd0\xb5\xd1\x81\xd0\xba\xd0"
+    b"\xbe\xd0\xb5 \xd0\xbe\xd0\xb1\xd0\xbe\xd1\x80\xd1\x83\xd0\xb4\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd0\xb5\xd0\x9e\xd0\xb4"
+    b"\xd0\xbd\xd0\xb0 \xd0\xbf\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd1\x8c\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd0"
+    b"\xb0\xd1\x82\xd1\x8c QR-\xd0\xba\xd0\xbe\xd0\xb4\xd0\x94\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0"
+    b"\xbe\xd1\x80 \xd0\x9a\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0\xd0\x9d\xd0\xb5\xd1\x82 \xd0\xa4\xd1\x80\xd0"
+    b"\xb0\xd0\xb7\xd0\xb0-\xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c\xd0\x92\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5"
+    b" \xd0\xb1\xd0\xbe\xd0\xbb\xd0\xb5\xd0\xb5 6 \xd1\x81\xd0\xb8\xd0\xbc\xd0\xb2\xd0\xbe\xd0\xbb\xd0\xbe\xd0\xb2 \xd0"
+    b"\xba\xd0\xbe\xd0\xb4\xd0\xb0 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1"
+    b"\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f\xd0\x9a\xd0\xbe\xd0\xb4 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8"
+    b" \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f\xd0\x9d\xd0\xb5\xd0\xba\xd0\xbe\xd1\x82\xd0\xbe\xd1\x80\xd1"
+    b"\x8b\xd0\xb5 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xbd\xd0\xb5 \xd0\xbc\xd0\xbe\xd0\xb3"
+    b"\xd1\x83\xd1\x82 \xd0\xb1\xd1\x8b\xd1\x82\xd1\x8c \xd0\xb2\xd1\x8b\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xb5\xd0\xbd\xd1\x8b"
+    b".\xd0\x9a\xd0\xbd\xd0\xbe\xd0\xbf\xd0\xba\xd0\xb8\xd0\x92\xd0\xbe\xd1\x81\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0\xb2\xd0"
+    b"\xb8\xd1\x82\xd1\x8c \xd0\xb7\xd0\xb0\xd0\xb2\xd0\xbe\xd0\xb4\xd1\x81\xd0\xba\xd0\xb8\xd0\xb5 \xd0\xbd\xd0\xb0\xd1\x81\xd1"
+    b"\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb8 \xd0\xb8 \xd0\xbf\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1"
+    b"\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c?\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c \xd0\xba\xd0"
+    b"\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd0\xb5\xd0\xba\xd0\x98\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1"
+    b"\x82\xd1\x8c \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1\x8e \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1"
+    b"\x8b, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b \xd1\x81\xd0\xbe\xd0\xb7\xd0\xb4\xd0\xb0\xd1\x82\xd1\x8c \xd0\xbd\xd0"
+    b"\xbe\xd0\xb2\xd1\x83\xd1\x8e \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd1\x83\xd0\x9f\xd0\xbe\xd0\xb4"
+    b"\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb0\xd0\xbd\xd0\xb8\xd0\xb5 \xd0\xbd\xd0\xb5\xd0\xbe\xd0\xb1\xd1\x80\xd0\xb0\xd0\xb1\xd0\xbe\xd1"
+    b"\x82\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xb3\xd0\xbe \xd1\x85\xd1\x8d\xd1\x88\xd0\xb0. \xd0\x9f\xd1\x80\xd0\xbe\xd0\xb4"
+    b"\xd0\xbe\xd0\xbb\xd0\xb6\xd0\xb0\xd0\xb9\xd1\x82\xd0\xb5, \xd1\x82\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xba\xd0\xbe \xd0\xb5\xd1"
+    b"\x81\xd0\xbb\xd0\xb8 \xd0\xb2\xd1\x8b \xd0\xb4\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd1\x8f\xd0\xb5\xd1\x82\xd0\xb5 \xd0\xb8"
+    b"\xd1\x81\xd1\x82\xd0\xbe\xd1\x87\xd0\xbd\xd0\xb8\xd0\xba\xd1\x83.\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0"
+    b"\xb0 \xd1\x85\xd1\x8d\xd1\x88\xd0\xb0 Flash \xd0\xbf\xd1\x80\xd0\xb8 \xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80"
+    b"\xd1\x83\xd0\xb7\xd0\xba\xd0\xb5\xd0\x92 \xd0\xb2\xd0\xb0\xd1\x88\xd0\xb5\xd0\xb9 \xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb"
+    b"\xd1\x8c\xd0\xbd\xd0\xbe\xd0\xb9 \xd1\x84\xd1\x80\xd0\xb0\xd0\xb7\xd0\xb5 \xd0\xbe\xd0\xb1\xd0\xbd\xd0\xb0\xd1\x80\xd1\x83"
+    b"\xd0\xb6\xd0\xb5\xd0\xbd\xd1\x8b \xd1\x81\xd0\xb8\xd0\xbc\xd0\xb2\xd0\xbe\xd0\xbb\xd1\x8b, \xd0\xbe\xd1\x82\xd0\xbb\xd0"
+    b"\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb5 \xd0\xbe\xd1\x82 ASCII. Krux \xd0\xbd\xd0\xb5 "
+    b"\xd0\xbc\xd0\xbe\xd0\xb6\xd0\xb5\xd1\x82 \xd0\xb3\xd0\xb0\xd1\x80\xd0\xb0\xd0\xbd\xd1\x82\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0"
+    b"\xb0\xd1\x82\xd1\x8c, \xd1\x87\xd1\x82\xd0\xbe \xd0\xb4\xd1\x80\xd1\x83\xd0\xb3\xd0\xb8\xd0\xb5 \xd0\xba\xd0\xbe\xd1"
+    b"\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb8 \xd0\xbf\xd0\xbe\xd0\xbb\xd1\x83\xd1\x87\xd0\xb0\xd1\x82 \xd1\x82\xd0\xbe\xd1"
+    b"\x82 \xd0\xb6\xd0\xb5 \xd0\xba\xd0\xbb\xd1\x8e\xd1\x87.\xd0\x92\xd1\x8b\xd1\x85\xd0\xbe\xd0\xb4\xd0\xbd\xd0\xbe\xd0\xb9"
+    b" \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80 \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb"
+    b"\xd1\x8c\xd0\xba\xd0\xb0 \xd0\xbd\xd0\xb5 \xd0\xbd\xd0\xb0\xd0\xb9\xd0\xb4\xd0\xb5\xd0\xbd.\xd0\x9f\xd0\xbe\xd0\xb2\xd0"
+    b"\xbe\xd1\x80\xd0\xbe\xd1\x82 \xd0\xbd\xd0\xb0 180\xc2\xb0\xd0\x94\xd0\xb5\xd1\x81\xd1\x8f\xd1\x82\xd0\xb8\xd1\x87"
+    b"\xd0\xbd\xd1\x8b\xd0\xb9\xd0\x94\xd0\xbe\xd0\xb6\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5\xd1\x81\xd1\x8c \xd0\x97\xd0\xb0\xd1\x85\xd0"
+    b"\xb2\xd0\xb0\xd1\x82\xd0\xb0\xd0\x9e\xd0\xb1\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb8\xd1\x82\xd1\x8c QR-\xd0\xbc\xd0\xb5\xd1"
+    b"\x82\xd0\xba\xd1\x83?\xd0\xaf\xd1\x80\xd0\xba\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c\xd0\x9f\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c"
+    b" Base64\xd0\x98\xd0\xbd\xd0\xb4\xd0\xb5\xd0\xba\xd1\x81 \xd0\xbe\xd1\x82\xd0\xba\xd0\xbb\xd0\xbe\xd0\xbd"
+    b"\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f \xd0\xbf\xd0\xb8\xd0\xba\xd1\x81\xd0\xb5\xd0\xbb\xd0\xb5\xd0\xb9:\xd0\x9f\xd1\x80\xd0\xbe"
+    b"\xd0\xb4\xd0\xbe\xd0\xbb\xd0\xb6\xd0\xb8\xd1\x82\xd1\x8c?\xd0\x9d\xd0\xb5\xd0\xb2\xd0\xb5\xd1\x80\xd0\xbd\xd1\x8b\xd0\xb9 "
+    b"\xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\x92\xd1\x8b\xd1\x85\xd0\xbe\xd0\xb4\xd0\xbd\xd0\xbe\xd0\xb9 \xd0\xb4\xd0\xb5\xd1"
+    b"\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80 \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0"
+    b" \xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb6\xd0\xb5\xd0\xbd!\xd0\xba \xd1\x88\xd0\xb5\xd1\x81\xd1\x82\xd0\xb8\xd0"
+    b"\xb3\xd1\x80\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xb9\xd0\x9c\xd0\xb5\xd1\x82\xd0\xbe\xd0\xb4 \xd0\xa8\xd0\xb8\xd1\x84\xd1\x80"
+    b"\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8f\xd0\xa2\xd0\xb5\xd0\xba\xd1\x81\xd1\x82\xd0\xa1\xd0\xb8\xd0\xbb\xd1\x8c\xd0\xbd"
+    b"\xd1\x8b\xd0\xb9\xd0\xa1\xd0\xbb\xd0\xb0\xd0\xb1\xd1\x8b\xd0\xb9\xd0\x9f\xd1\x80\xd0\xb5\xd0\xb4\xd1\x83\xd0\xbf\xd1\x80\xd0\xb5"
+    b"\xd0\xb6\xd0\xb4\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5:\xd0\x98\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0"
+    b"\xb0\xd1\x82\xd1\x8c \xd1\x87\xd0\xb5\xd1\x80\xd0\xbd\xd1\x83\xd1\x8e \xd1\x84\xd0\xbe\xd0\xbd\xd0\xbe\xd0\xb2\xd1\x83\xd1"
+    b"\x8e \xd0\xbf\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd1\x85\xd0\xbd\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c.\xd0\xa8\xd0\xb5\xd1\x81\xd1"
+    b"\x82\xd0\xbd\xd0\xb0\xd0\xb4\xd1\x86\xd0\xb0\xd1\x82\xd0\xb5\xd1\x80\xd0\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9\xd0\x90\xd0\xbd\xd1"
+    b"\x82\xd0\xb8\xd0\xb1\xd0\xbb\xd0\xb8\xd0\xba\xd0\xbe\xd0\xb2\xd1\x8b\xd0\xb9 \xd1\x80\xd0\xb5\xd0\xb6\xd0\xb8\xd0\xbc\xd0\x9f"
+    b"\xd0\xbe\xd0\xbb\xd1\x83\xd1\x87\xd0\xb8\xd1\x82\xd1\x8c\xd0\xa0\xd0\xb5\xd0\xb3\xd1\x83\xd0\xbb\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2"
+    b"\xd0\xba\xd0\xb0 \xd0\xaf\xd1\x80\xd0\xba\xd0\xbe\xd1\x81\xd1\x82\xd0\xb8\xd0\xa1\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x82\xd1"
+    b"\x8c \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x91\xd0\xba?\xd0\x9f\xd0\xbe\xd0\xbf\xd1\x80\xd0\xbe\xd0\xb1\xd0\xbe\xd0"
+    b"\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xb5\xd1\x89\xd1\x91?\xd0\xa1\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0"
+    b"\xb0\xd0\xbd\xd0\xb8\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2 13-24SD \xd0\xba\xd0\xb0\xd1\x80\xd1"
+    b"\x82\xd0\xb0 \xd0\xbd\xd0\xb5 \xd0\xbe\xd0\xb1\xd0\xbd\xd0\xb0\xd1\x80\xd1\x83\xd0\xb6\xd0\xb5\xd0\xbd\xd0\xb0.12"
+    b" \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb8\xd1\x82\xd1\x8c \xd1\x81\xd0\xbd"
+    b"\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xa0\xd0\xb0\xd1\x81\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c?\xd0"
+    b"\xa0\xd0\xb5\xd0\xb7\xd0\xb5\xd1\x80\xd0\xb2\xd0\xbd\xd0\xb0\xd1\x8f \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8"
+    b"\xd0\xba\xd0\xb0\xd0\x9e\xd0\xb1\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd0\xb7\xd0\xb0\xd0\xb2\xd0"
+    b"\xb5\xd1\x80\xd1\x88\xd0\xb5\xd0\xbd\xd0\xbe.\xd0\xbe\xd1\x82 \xd0\xa8\xd0\x95\xd0\xa1\xd0\xa2\xd0\x98\xd0\x93\xd0\xa0\xd0"
+    b"\x90\xd0\x9d\xd0\x9d\xd0\x98\xd0\x9a\xd0\x90(%s \xd0\xb1\xd0\xb8\xd1\x82/\xd0\xbf\xd0\xb8\xd0\xba\xd1\x81\xd0\xb5"
+    b"\xd0\xbb\xd1\x8c)\xd0\xa0\xd0\xb0\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbe\xd0\xb6\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5\xd0\xa0\xd0"
+    b"\xb0\xd0\xb7\xd1\x80\xd0\xb5\xd1\x88. - \xd0\xa4\xd0\xbe\xd1\x80\xd0\xbc\xd0\xb0\xd1\x82\xd0\x97\xd0\xb0\xd0\xb3\xd1"
+    b"\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c \xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd1\x83\xd0\x9f"
+    b"\xd1\x83\xd1\x81\xd1\x82\xd0\xbe\xd0\xb9\xd0\x9d\xd0\xb5\xd0\xba\xd0\xbe\xd1\x82\xd0\xbe\xd1\x80\xd1\x8b\xd0\xb5 \xd1\x83\xd0"
+    b"\xb7\xd0\xbb\xd1\x8b \xd0\xbd\xd0\xb5 \xd1\x83\xd0\xba\xd1\x80\xd0\xb5\xd0\xbf\xd0\xbb\xd0\xb5\xd0\xbd\xd1\x8b:\xd0\x9f"
+    b"\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb0\xd1\x82\xd1\x8c \xd0\xbd\xd0\xb0 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1"
+    b"\x82\xd0\xb5ID \xd1\x83\xd0\xb6\xd0\xb5 \xd1\x81\xd1\x83\xd1\x89\xd0\xb5\xd1\x81\xd1\x82\xd0\xb2\xd1\x83\xd0\xb5\xd1"
+    b"\x82\xd0\x98\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xb8\xd1\x82\xd0\xb5"
+    b"\xd1\x80 PBKDF2 \xd0\xbf\xd0\xbe \xd1\x83\xd0\xbc\xd0\xbe\xd0\xbb\xd1\x87\xd0\xb0\xd0\xbd\xd0\xb8\xd1"
+    b"\x8e.?\xd0\xbd\xd0\xb5\xd0\xb8\xd0\xb7\xd0\xb2\xd0\xb5\xd1\x81\xd1\x82\xd0\xbd\xd1\x8b\xd0\xb9\xd0\x9a\xd0\xbe\xd0\xbe\xd1"
+    b"\x80\xd0\xb4\xd0\xb8\xd0\xbd\xd0\xb0\xd1\x82\xd1\x8b \xd0\xb7\xd0\xb5\xd1\x80\xd0\xba\xd0\xb0\xd0\xbb\xd0\xb0 X\xd0\xa1"
+    b"\xd0\xb5\xd1\x82\xd1\x8c\xd0\x92\xd1\x8b\xd0\xb2\xd0\xb5\xd1\x81\xd1\x82\xd0\xb8 \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0"
+    b"\xbf\xd0\xb8\xd1\x8e BIP85?\xd0\x9d\xd0\xb5 \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xbe\xd1\x81\xd1\x8c "
+    b"\xd1\x81\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0"
+    b"\xb8\xd0\xba\xd1\x83\xd0\xa1\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xb0\xd0\x97\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0"
+    b"\xb0\xd0\xbd\xd0\xbd\xd0\xb0\xd1\x8f \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0 \xd0\xbd\xd0"
+    b"\xb5 \xd0\xb1\xd1\x8b\xd0\xbb\xd0\xb0 \xd1\x81\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb0\xd0\xa2\xd0"
+    b"\xb0\xd1\x87\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbd\xd0\xa8\xd0\xb8\xd1\x80\xd0\xb8\xd0\xbd\xd0\xb0 \xd0\x91\xd1\x83\xd0\xbc"
+    b"\xd0\xb0\xd0\xb3\xd0\xb8\xd0\xa3\xd1\x87\xd0\xb5\xd1\x82\xd0\xbd\xd0\xb0\xd1\x8f \xd0\xb7\xd0\xb0\xd0\xbf\xd0\xb8\xd1\x81\xd1"
+    b"\x8c\xd0\x9a\xd0\xbb\xd1\x8e\xd1\x87%s \xd1\x81\xd0\xb8\xd0\xbc\xd0\xb2.\xd0\x9d\xd0\xb0\xd0\xbf\xd0\xb5\xd1\x87\xd0"
+    b"\xb0\xd1\x82\xd0\xb0\xd1\x82\xd1\x8c \xd0\xa2\xd0\xb5\xd1\x81\xd1\x82\xd0\xbe\xd0\xb2\xd1\x8b\xd0\xb9 QR\xd0\x9e\xd0"
+    b"\xba\xd0\xbe\xd0\xbd\xd1\x87\xd0\xb0\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xbd\xd0\xbe \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb8"
+    b"\xd1\x82\xd1\x8c \xd0\xb2\xd1\x81\xd0\xb5 \xd1\x81\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xbd\xd1\x8b"
+    b"\xd0\xb5 \xd0\xb7\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5 \xd0\xbc"
+    b"\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb8 \xd0\xb8 \xd0\xbd\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe"
+    b"\xd0\xb9\xd0\xba\xd0\xb8 \xd0\xb8\xd0\xb7 \xd1\x84\xd0\xbb\xd0\xb5\xd1\x88-\xd0\xbf\xd0\xb0\xd0\xbc\xd1\x8f\xd1\x82\xd0"
+    b"\xb8?\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0\xb0 \xd0\xbf\xd1\x80\xd0\xb8\xd0\xbd\xd1\x82\xd0\xb5\xd1"
+    b"\x80\xd0\xb0\xe2\x80\xa6\xd0\xa7\xd0\xb8\xd1\x81\xd0\xbb\xd0\xb0\xd0\x92\xd0\xb5\xd1\x80\xd0\xbd\xd1\x83\xd1\x82\xd1\x8c\xd1\x81"
+    b"\xd1\x8f \xd0\xba QR-\xd0\xbf\xd1\x80\xd0\xbe\xd1\x81\xd0\xbc\xd0\xbe\xd1\x82\xd1\x80\xd1\x89\xd0\xb8\xd0\xba\xd1"
+    b"\x83\xd0\x9d\xd0\xb0\xd0\xb6\xd0\xbc\xd0\xb8\xd1\x82\xd0\xb5 PAGE, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b"
+    b" \xd0\xbe\xd1\x82\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c.\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb8"
+    b"\xd1\x82\xd1\x8c, \xd1\x87\xd1\x82\xd0\xbe \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81 \xd0\xbf\xd1\x80\xd0\xb8\xd0\xbd"
+    b"\xd0\xb0\xd0\xb4\xd0\xbb\xd0\xb5\xd0\xb6\xd0\xb8\xd1\x82 \xd1\x8d\xd1\x82\xd0\xbe\xd0\xbc\xd1\x83 \xd0\xba\xd0\xbe\xd1\x88"
+    b"\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd1\x83?\xd0\x97\xd0\xb0\xd1\x85\xd0\xb2\xd0\xb0\xd1\x82 \xd0\xbe\xd1\x82\xd0\xbc\xd0\xb5"
+    b"\xd0\xbd\xd0\xb5\xd0\xbd\xd0\x9f\xd1\x83\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb5\xd1\x80\xd0\xb8\xd0\xb2\xd0\xb0\xd1\x86\xd0\xb8\xd0"
+    b"\xb8\xd0\x9d\xd0\xb5 \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xbe\xd1\x81\xd1\x8c \xd0\xbd\xd0\xb8\xd1\x87\xd0\xb5\xd0\xb3\xd0"
+    b"\xbe \xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c\xd0\x97\xd0\xb0\xd1\x88\xd0\xb8\xd1\x84\xd1\x80"
+    b"\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbe KEF\xd0\x92\xd1\x85\xd0\xbe\xd0\xb4\xd1\x8b (%d):BI"
+    b"P39 \xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb0\xd0\x9d\xd0\xb5\xd0\xb4\xd0\xb5\xd0\xb9"
+    b"\xd1\x81\xd1\x82\xd0\xb2\xd0\xb8\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\xba\xd0\xbe\xd0\xb4 \xd0\xbf"
+    b"\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f\xd0"
+    b"\xa1\xd1\x80\xd0\xb5\xd0\xb4\xd0\xbd\xd0\xb8\xd0\xb9\xd0\x9f\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb7\xd0\xb0\xd0\xbf\xd0\xb8\xd1\x81\xd0"
+    b"\xb0\xd1\x82\xd1\x8c?\xd0\x9a\xd0\xbb\xd1\x8e\xd1\x87 \xd0\xbd\xd0\xb5 \xd0\xbf\xd1\x80\xd0\xb5\xd0\xb4\xd0\xbe\xd1\x81"
+    b"\xd1\x82\xd0\xb0\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd\xd0\x90\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xa0\xd0\xb0\xd1\x81\xd0\xbf\xd1\x80"
+    b"\xd0\xb5\xd0\xb4\xd0\xb5\xd0\xbb\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd0\xb1\xd1\x80\xd0\xbe\xd1\x81\xd0\xba\xd0\xbe\xd0\xb2:"
+    b"\xd0\x94\xd0\xb8\xd1\x81\xd0\xbf\xd0\xbb\xd0\xb5\xd0\xb8\xd0\xa1\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c"
+    b" \xd0\xbd\xd0\xb0 \xd0\xa4\xd0\xbb\xd1\x8d\xd1\x88 \xd0\x9f\xd0\xb0\xd0\xbc\xd1\x8f\xd1\x82\xd1\x8c\xd0\x98\xd1\x81\xd0"
+    b"\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\xbf\xd0\xbe \xd1\x83\xd0\xbc\xd0\xbe\xd0"
+    b"\xbb\xd1\x87\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8e?\xd0\x98\xd0\xbc\xd1\x8f \xd1\x84\xd0\xb0\xd0\xb9\xd0\xbb\xd0\xb0\xd0\x95\xd1"
+    b"\x81\xd0\xbb\xd0\xb8 \xd0\xbf\xd0\xbe\xd1\x81\xd0\xbb\xd0\xb5 \xd1\x8d\xd1\x82\xd0\xbe\xd0\xb3\xd0\xbe \xd0\xb8\xd0\xb7"
+    b"\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f \xd0\xb4\xd0\xb8\xd1\x81\xd0\xbf\xd0\xbb\xd0\xb5\xd0\xb9 \xd1\x83"
+    b"\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd1\x81\xd1\x82\xd0\xb2\xd0\xb0 \xd0\xbd\xd0\xb5 \xd1\x80\xd0\xb0\xd0\xb1\xd0\xbe"
+    b"\xd1\x82\xd0\xb0\xd0\xb5\xd1\x82, \xd0\xbe\xd0\xbd \xd0\xb0\xd0\xb2\xd1\x82\xd0\xbe\xd0\xbc\xd0\xb0\xd1\x82\xd0\xb8\xd1"
+    b"\x87\xd0\xb5\xd1\x81\xd0\xba\xd0\xb8 \xd0\xbf\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8"
+    b"\xd1\x82\xd1\x81\xd1\x8f \xd1\x81 \xd0\xbf\xd1\x80\xd0\xb5\xd0\xb4\xd1\x8b\xd0\xb4\xd1\x83\xd1\x89\xd0\xb8\xd0\xbc\xd0\xb8"
+    b" \xd0\xbd\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb0\xd0\xbc\xd0\xb8 \xd1\x87\xd0\xb5\xd1\x80\xd0\xb5"
+    b"\xd0\xb7 5 \xd1\x81\xd0\xb5\xd0\xba\xd1\x83\xd0\xbd\xd0\xb4.\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8"
+    b"\xd1\x82\xd1\x8c?\xd0\x98\xd1\x81\xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbe:\xd0\x9f"
+    b"\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd1\x8c\xd0\x9f\xd0\xb5\xd1\x87\xd0\xb0"
+    b"\xd1\x82\xd0\xb0\xd1\x82\xd1\x8c?(\xd0\xad\xd0\xba\xd1\x81\xd0\xbf\xd0\xb5\xd1\x80\xd0\xb5\xd0\xbc\xd0\xb5\xd0\xbd\xd1\x82"
+    b"\xd0\xb0\xd0\xbb\xd1\x8c\xd0\xbd\xd1\x8b\xd0\xb9)XOR \xd1\x81\xd0\xa2\xd0\xb8\xd0\xbf \xd0\xb3\xd0\xbe\xd0\xbb"
+    b"\xd0\xbe\xd0\xb2\xd0\xba\xd0\xb8\xd0\x9a\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x91\xd0\xba \xd0\xbd\xd0\xb5 \xd1\x81\xd0\xbe"
+    b"\xd0\xb2\xd0\xbf\xd0\xb0\xd0\xb4\xd0\xb0\xd0\xb5\xd1\x82:\xd0\xbe\xd1\x82 \xd0\xb1\xd0\xb0\xd0\xb7\xd1\x8b32\xd0\x94"
+    b"\xd0\xbe\xd0\xb1\xd0\xb0\xd0\xb2\xd0\xb8\xd1\x82\xd1\x8c \xd0\xb8\xd0\xbb\xd0\xb8 \xd0\xb8\xd0\xb7\xd0\xbc\xd0\xb5\xd0\xbd"
+    b"\xd0\xb8\xd1\x82\xd1\x8c \xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c"
+    b"\xd0\xba\xd0\xb0?\xd0\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xb8\xd1\x82\xd1\x8c SD \xd0\x9a\xd0\xb0\xd1"
+    b"\x80\xd1\x82\xd1\x83\xd0\x9f\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd1\x8c\xe2\x80\xa6\xd0\x9d\xd0\xb0\xd0\xb7\xd0\xb0\xd0\xb4\xd0\x9f"
+    b"\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8c\xd1\x81\xd0\xba\xd0\xb8\xd0\xb9 Q"
+    b"R-\xd0\xba\xd0\xbe\xd0\xb4\xd0\xa1\xd0\xb2\xd0\xb0\xd0\xb9\xd0\xbf\xd0\xbd\xd0\xb8\xd1\x82\xd0\xb5, \xd1\x87\xd1\x82"
+    b"\xd0\xbe\xd0\xb1\xd1\x8b \xd1\x81\xd0\xbc\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd1\x80\xd0\xb5\xd0\xb6\xd0\xb8\xd0\xbc"
+    b"XOR current mnemonic with anothe"
+    b"r one? (\xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xbd\xd0\xb0\xd1\x8f \xd1\x84\xd1\x80\xd0"
+    b"\xb0\xd0\xb7\xd0\xb0 \xd0\xb8 \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82\xd0\xbe\xd1\x80 \xd0\xb1"
+    b"\xd1\x83\xd0\xb4\xd1\x83\xd1\x82 \xd0\xbe\xd1\x82\xd0\xb1\xd1\x80\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbd\xd1\x8b)\xd0\xa1\xd0\xbe"
+    b"\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd0\xbd\xd0\xb0 SD \xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1"
+    b"\x83?\xd0\xa1\xd0\xbe\xd0\xb7\xd0\xb4\xd0\xb0\xd1\x82\xd1\x8c \xd0\x9c\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0"
+    b"\xba\xd1\x83\xd0\xa0\xd0\xb0\xd0\xb7\xd0\xbc\xd0\xb5\xd1\x80 \xd0\xa7\xd0\xb0\xd1\x81\xd1\x82\xd0\xb8\xd0\x9f\xd0\xbe\xd0\xb6"
+    b"\xd0\xb0\xd0\xbb\xd1\x83\xd0\xb9\xd1\x81\xd1\x82\xd0\xb0 \xd0\xb7\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xb8\xd1\x82\xd0"
+    b"\xb5 \xd0\xb2\xd1\x8b\xd1\x85\xd0\xbe\xd0\xb4\xd0\xbd\xd0\xbe\xd0\xb9 \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0"
+    b"\xbf\xd1\x82\xd0\xbe\xd1\x80 \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0\xd0\xa8\xd0\xb5\xd1\x81\xd1\x82"
+    b"\xd0\xbd\xd0\xb0\xd0\xb4\xd1\x86\xd0\xb0\xd1\x82\xd0\xb5\xd1\x80\xd0\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\x9f\xd1\x83\xd0"
+    b"\xb1\xd0\xbb\xd0\xb8\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\x9a\xd0\xbb\xd1\x8e\xd1\x87:\xd0\x97\xd0\xb0\xd1\x88\xd0\xb8\xd1"
+    b"\x84\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbe\xd0\x9d\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb8\xd1\x82\xd1\x8c\xd0"
+    b"\x92\xd1\x81\xd0\xb5 \xd1\x80\xd0\xb0\xd0\xb2\xd0\xbd\xd0\xbe \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb4\xd0\xbe\xd0\xbb\xd0\xb6\xd0"
+    b"\xb8\xd1\x82\xd1\x8c?\xd0\x9d\xd0\xb5 \xd1\x83\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xbe\xd1\x81\xd1\x8c \xd0\xbe\xd0\xbf\xd1\x80"
+    b"\xd0\xb5\xd0\xb4\xd0\xb5\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c \xd0\xb0\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81 \xd0\xb8\xd0\xb7\xd0\xbc"
+    b"\xd0\xb5\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f.\xd0\xa3\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c \xd0\xb4\xd0\xb0"
+    b"\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5 \xd0\xbf\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd0\xb5\xd0\xbb\xd1"
+    b"\x8f\xd0\x9e\xd0\xb1\xd0\xbd\xd0\xb0\xd1\x80\xd1\x83\xd0\xb6\xd0\xb5\xd0\xbd\xd0\xb0 \xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x8f"
+    b" \xd0\xbf\xd1\x80\xd0\xbe\xd1\x88\xd0\xb8\xd0\xb2\xd0\xba\xd0\xb0.\xd0\x92\xd1\x80\xd0\xb5\xd0\xbc\xd1\x8f \xd0\xb2\xd1"
+    b"\x8b\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f\xd0\x92\xd0\xbb\xd0\xb5\xd0\xb2\xd0\xbe\xd0\x9f\xd0\xbe\xd0"
+    b"\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb0\xd0\xbd\xd0\xbd\xd0\xbe\xd0\xb5 PSBT\xd0\xbd\xd0\xb5\xd1\x83\xd0\xb4\xd0\xb0"
+    b"\xd1\x87\xd0\xbd\xd0\xbe\xd0\x9a\xd0\xbe\xd0\xb4 \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb8 \xd0\xb2"
+    b"\xd1\x81\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f \xd1\x83\xd1\x81\xd0\xbf\xd0\xb5\xd1\x88\xd0\xbd\xd0\xbe \xd1\x83"
+    b"\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd\xd0\xbf\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8"
+    b"\xd1\x82\xd0\xb5\xd0\xa7\xd1\x83\xd0\xb2\xd1\x81\xd1\x82\xd0\xb2\xd0\xb8\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xbd\xd0\xbe\xd1\x81"
+    b"\xd1\x82\xd1\x8c\xd0\x98\xd1\x81\xd0\xbf\xd1\x8b\xd1\x82.:\xd0\x92\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5 \xd0"
+    b"\xba\xd0\xb0\xd0\xb6\xd0\xb4\xd0\xbe\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe \xd0\xb2\xd0\xb0\xd1\x88\xd0\xb5\xd0"
+    b"\xb9 \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb8 BIP39 \xd0\xb2 \xd0\xb2"
+    b"\xd0\xb8\xd0\xb4\xd0\xb5 \xd1\x87\xd0\xb8\xd1\x81\xd0\xbb\xd0\xb0 \xd0\xbe\xd1\x82 1 \xd0\xb4\xd0\xbe 20"
+    b"48.\xd0\xa3\xd0\xb4\xd0\xb0\xd0\xbb\xd0\xb8\xd1\x82\xd1\x8c %s?\xd0\xa7\xd0\xb8\xd1\x81\xd0\xbb\xd0\xb0 "
+    b"\xd0\xa1\xd0\xbb\xd0\xbe\xd0\xb2\xd0\x9d\xd0\xb5\xd1\x81\xd0\xbe\xd0\xbe\xd1\x82\xd0\xb2\xd0\xb5\xd1\x82\xd1\x81\xd1\x82\xd0\xb2"
+    b"\xd0\xb8\xd0\xb5 \xd0\xbf\xd1\x83\xd1\x82\xd0\xb8\xd0\x97\xd0\xb0\xd0\xb3\xd1\x80\xd1\x83\xd0\xb7\xd0\xba\xd0\xb0 \xd0\xb0"
+    b"\xd0\xb4\xd1\x80\xd0\xb5\xd1\x81\xd0\xbe\xd0\xb2 \xd0\xbf\xd1\x80\xd0\xb8\xd0\xb5\xd0\xbc\xd0\xb0\xe2\x80\xa6\xd0\x9e\xd0\xb1"
+    b"\xd1\x80\xd0\xb0\xd0\xb1\xd0\xbe\xd1\x82\xd0\xba\xd0\xb0\xe2\x80\xa6\xd0\x9f\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb2\xd0\xbe\xd0\xb4 "
+    b"\xd1\x81\xd0\xb0\xd0\xbc\xd0\xbe\xd0\xbc\xd1\x83 \xd1\x81\xd0\xb5\xd0\xb1\xd0\xb5:\xd0\xa1\xd0\xb4\xd0\xb0\xd1\x87\xd0\xb0"
+    b":\xd0\x97\xd0\xb0\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd1\x84\xd0\xbb\xd1\x8d\xd1\x88\xd0\xb0"
+    b"\xd0\xa2\xd0\xb5\xd1\x81\xd1\x82\xd0\xbe\xd0\xb2\xd1\x8b\xd0\xb9 QR \xd0\x9f\xd1\x80\xd0\xb8\xd0\xbd\xd1\x82\xd0\xb5"
+    b"\xd1\x80\xd0\xb0 Krux\xd0\x93\xd0\xbe\xd1\x82\xd0\xbe\xd0\xb2\xd0\xbe?\xd0\x98\xd1\x81\xd1\x81\xd0\xbb\xd0\xb5"
+    b"\xd0\xb4\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd1\x84\xd0\xb0\xd0\xb9\xd0\xbb\xd1\x8b?\xd0\x92\xd0\xb5\xd1\x80\xd0\xb8"
+    b"\xd1\x84\xd0\xb8\xd0\xba\xd0\xb0\xd1\x86\xd0\xb8\xd1\x8f\xe2\x80\xa6\xd0\x92\xd0\xbd\xd0\xb5\xd1\x88\xd0\xbd\xd0\xb8\xd0\xb9 "
+    b"\xd0\x92\xd0\xb8\xd0\xb4\xd0\x92\xd1\x8b\xd1\x81\xd0\xbe\xd0\xba\xd0\xb8\xd0\xb5 \xd0\xba\xd0\xbe\xd0\xbc\xd0\xb8\xd1\x81\xd1"
+    b"\x81\xd0\xb8\xd0\xb8!\xd0\x9d\xd0\xb5 \xd0\xb2\xd1\x8b\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb0\xd0\xb9\xd1\x82\xd0\xb5 "
+    b"\xd0\xbf\xd0\xb8\xd1\x82\xd0\xb0\xd0\xbd\xd0\xb8\xd0\xb5, \xd1\x8d\xd1\x82\xd0\xbe \xd0\xbc\xd0\xbe\xd0\xb6\xd0\xb5\xd1"
+    b"\x82 \xd0\xb7\xd0\xb0\xd0\xbd\xd1\x8f\xd1\x82\xd1\x8c \xd0\xbd\xd0\xb5\xd0\xba\xd0\xbe\xd1\x82\xd0\xbe\xd1\x80\xd0\xbe\xd0"
+    b"\xb5 \xd0\xb2\xd1\x80\xd0\xb5\xd0\xbc\xd1\x8f.\xd0\x94\xd1\x80\xd0\xb0\xd0\xb9\xd0\xb2\xd0\xb5\xd1\x80 \xd0\x9f\xd1\x80"
+    b"\xd0\xb8\xd0\xbd\xd1\x82\xd0\xb5\xd1\x80\xd0\xb0 \xd0\xbd\xd0\xb5 \xd1\x83\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0\xb2"
+    b"\xd0\xbb\xd0\xb5\xd0\xbd!\xd0\xa1\xd0\xba\xd1\x80\xd1\x8b\xd1\x82\xd1\x8c \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd"
+    b"\xd0\xb8\xd0\xba\xd0\xb8\xd0\xa7\xd0\xb0\xd1\x81\xd1\x82\xd1\x8c\xd0\x9e\xd1\x82\xd1\x81\xd1\x83\xd1\x82\xd1\x81\xd1\x82\xd0\xb2"
+    b"\xd1\x83\xd0\xb5\xd1\x82 \xd1\x84\xd0\xb0\xd0\xb9\xd0\xbb \xd0\xbf\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1\x81\xd0\xb8\xd0\xa1"
+    b"\xd0\xba\xd0\xbe\xd1\x80\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c \xd0\x9f\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb4\xd0\xb0\xd1\x87\xd0\xb8 "
+    b"\xd0\x94\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8b\xd1\x85SD \xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd0\xb0\xd0\x97\xd0\xb0\xd0\xb2\xd0"
+    b"\xbe\xd0\xb4\xd1\x81\xd0\xba\xd0\xb8\xd0\xb5 \xd0\x9d\xd0\xb0\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd0\xba\xd0\xb8\xd0\x9f"
+    b"\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xb7\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8c\xd0\x97\xd0\xbd\xd0\xb0\xd1\x87\xd0\xb5"
+    b"\xd0\xbd\xd0\xb8\xd0\xb5 %s \xd0\xb2\xd0\xbd\xd0\xb5 \xd0\xb4\xd0\xb8\xd0\xb0\xd0\xbf\xd0\xbe\xd0\xb7\xd0\xbe\xd0"
+    b"\xbd\xd0\xb0: [%s, %s]\xd0\xa1\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd0"
+    b"\xbd\xd0\xb8\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2 1-12 \xd1\x81\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb0\xd0\x9e"
+    b"\xd1\x82\xd0\xbf\xd0\xb5\xd1\x87\xd0\xb0\xd1\x82\xd0\xbe\xd0\xba \xd0\xbf\xd0\xb0\xd0\xbb\xd1\x8c\xd1\x86\xd0\xb0 \xd0\xbd"
+    b"\xd0\xb5 \xd1\x83\xd1\x81\xd1\x82\xd0\xb0\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd \xd0\xb2 PSBT\xd0"
+    b"\x9f\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb5\xd1\x80\xd0\xba\xd0\xb0 SD-\xd0\xba\xd0\xb0\xd1\x80\xd1\x82\xd1\x8b\xe2\x80\xa6"
+    b"\xd0\x97\xd0\xb0\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xb8\xd1\x82\xd1\x8c \xd1\x84\xd0\xbb\xd1\x8d\xd1\x88 \xd1\x8d\xd0\xbd"
+    b"\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd0\xb5\xd0\xb9 \xd1\x81 \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x8b?\xd0"
+    b"\xa1\xd0\xbe\xd1\x85\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb5\xd0\xbd\xd0\xbe \xd0\xbd\xd0\xb0 SD \xd0\xba\xd0\xb0\xd1\x80"
+    b"\xd1\x82\xd1\x83:\xd0\x9e\xd1\x82\xd1\x81\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c "
+    b"BIP39 \xd1\x84\xd1\x80\xd0\xb0\xd0\xb7\xd1\x83-\xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c\xd0\x92\xd0"
+    b"\xb2\xd0\xb5\xd0\xb4\xd0\xb8\xd1\x82\xd0\xb5 \xd0\xba\xd0\xb0\xd0\xb6\xd0\xb4\xd0\xbe\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0"
+    b"\xb2\xd0\xbe \xd0\xb2\xd0\xb0\xd1\x88\xd0\xb5\xd0\xb9 \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0"
+    b"\xb8 BIP39 \xd0\xb2 \xd0\xb2\xd0\xb8\xd0\xb4\xd0\xb5 \xd1\x88\xd0\xb5\xd1\x81\xd1\x82\xd0\xbd\xd0\xb0"
+    b"\xd0\xb4\xd1\x86\xd0\xb0\xd1\x82\xd0\xb5\xd1\x80\xd0\xb8\xd1\x87\xd0\xbd\xd0\xbe\xd0\xb3\xd0\xbe \xd1\x87\xd0\xb8\xd1\x81\xd0"
+    b"\xbb\xd0\xb0 \xd0\xbe\xd1\x82 1 \xd0\xb4\xd0\xbe 800.\xd0\x9d\xd0\xb5\xd1\x82\xd0\xba bas"
+    b"e64\xd0\x9d\xd0\xb5\xd0\xb4\xd0\xbe\xd1\x81\xd1\x82\xd0\xb0\xd1\x82\xd0\xbe\xd1\x87\xd0\xbd\xd0\xbe \xd0\xb1\xd1\x80"
+    b"\xd0\xbe\xd1\x81\xd0\xba\xd0\xbe\xd0\xb2!\xd0\x9d\xd0\xb5\xd0\xb2\xd0\xb5\xd1\x80\xd0\xbd\xd0\xb0\xd1\x8f \xd0\xb4\xd0\xbb"
+    b"\xd0\xb8\xd0\xbd\xd0\xb0 \xd0\xbc\xd0\xbd\xd0\xb5\xd0\xbc\xd0\xbe\xd0\xbd\xd0\xb8\xd0\xba\xd0\xb8\xd0\xa1\xd0\xbe\xd0\xb7\xd0"
+    b"\xb4\xd0\xb0\xd1\x82\xd1\x8c QR-\xd0\xba\xd0\xbe\xd0\xb4PAGE, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1"
+    b"\x8b \xd0\xbf\xd0\xb5\xd1\x80\xd0\xb5\xd0\xba\xd0\xbb\xd1\x8e\xd1\x87\xd0\xb8\xd1\x82\xd1\x8c \xd1\x80\xd0\xb5\xd0\xb6\xd0"
+    b"\xb8\xd0\xbc\xd0\x93\xd0\xbb\xd1\x83\xd0\xb1\xd0\xb8\xd0\xbd\xd0\xb0 \xd0\xb7\xd0\xb0 \xd0\x9f\xd1\x80\xd0\xbe\xd1\x85\xd0"
+    b"\xbe\xd0\xb4\xd0\xbe\xd1\x82 \xd0\xbe\xd1\x81\xd0\xbd\xd0\xbe\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8f43\xd0\x9e\xd1\x82"
+    b"\xd1\x81\xd0\xba\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c \xd0\x90\xd0\xb4\xd1\x80\xd0\xb5\xd1"
+    b"\x81\xd0\xa2\xd1\x80\xd0\xb5\xd0\xb1\xd1\x83\xd0\xb5\xd1\x82\xd1\x81\xd1\x8f \xd0\xb4\xd0\xbe\xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd"
+    b"\xd0\xb8\xd1\x82\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xbd\xd0\xb0\xd1\x8f \xd1\x8d\xd0\xbd\xd1\x82\xd1\x80\xd0\xbe\xd0\xbf\xd0\xb8\xd1"
+    b"\x8f \xd0\xbe\xd1\x82 \xd0\xba\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x8b \xd0\xb4\xd0\xbb\xd1\x8f %s\xd0\x98\xd0"
+    b"\xbd\xd0\xb2\xd0\xb5\xd1\x80\xd1\x82\xd0\xb8\xd1\x80\xd0\xbe\xd0\xb2\xd0\xb0\xd1\x82\xd1\x8c\xd0\x98\xd1\x81\xd0\xbf\xd1\x8b\xd1"
+    b"\x82\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8f \xd1\x83\xd1\x81\xd1\x82\xd1\x80\xd0\xbe\xd0\xb9\xd1\x81\xd1\x82\xd0\xb2\xd0\xb0\xd0\x9d"
+    b"\xd0\xb0\xd0\xb7\xd0\xb0\xd0\xb4 \xd0\xb2 M\xd0\xb5\xd0\xbd\xd1\x8e\xd0\x9e\xd1\x81\xd1\x82\xd0\xb0\xd0\xb2\xd1\x8c\xd1"
+    b"\x82\xd0\xb5 \xd0\xbf\xd1\x83\xd1\x81\xd1\x82\xd1\x8b\xd0\xbc, \xd0\xb5\xd1\x81\xd0\xbb\xd0\xb8 \xd1\x85\xd0\xbe\xd1"
+    b"\x82\xd0\xb8\xd1\x82\xd0\xb5, \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b Krux \xd0\xb2\xd1\x8b\xd0\xb1\xd1"
+    b"\x80\xd0\xb0\xd0\xbb \xd0\xbf\xd0\xbe\xd0\xb4\xd1\x85\xd0\xbe\xd0\xb4\xd1\x8f\xd1\x89\xd0\xb5\xd0\xb5 \xd0\xbf\xd0\xbe\xd1"
+    b"\x81\xd0\xbb\xd0\xb5\xd0\xb4\xd0\xbd\xd0\xb5\xd0\xb5 \xd1\x81\xd0\xbb\xd0\xbe\xd0\xb2\xd0\xbe\xd0\xa1 \xd0\x9f\xd0\xbe\xd0"
+    b"\xbc\xd0\xbe\xd1\x89\xd1\x8c\xd1\x8e \xd0\x9a\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x80\xd1\x8bTX \xd0\x9f\xd0\xb8\xd0\xbd\xd0"
+    b"\x92\xd1\x8b\xd1\x85\xd0\xbe\xd0\xb4\xd0\xbd\xd0\xbe\xd0\xb9 \xd0\xb4\xd0\xb5\xd1\x81\xd0\xba\xd1\x80\xd0\xb8\xd0\xbf\xd1\x82"
+    b"\xd0\xbe\xd1\x80 \xd0\xba\xd0\xbe\xd1\x88\xd0\xb5\xd0\xbb\xd1\x8c\xd0\xba\xd0\xb0\xd0\xa4\xd1\x80\xd0\xb0\xd0\xb7\xd0\xb0-"
+    b"\xd0\xbf\xd0\xb0\xd1\x80\xd0\xbe\xd0\xbb\xd1\x8c\xd0\xa2\xd1\x80\xd0\xb0\xd0\xbd\xd1\x81\xd1\x84\xd0\xb5\xd1\x80 \xd1\x81\xd0"
+    b"\xb0\xd0\xbc\xd0\xbe\xd0\xbc\xd1\x83 \xd1\x81\xd0\xb5\xd0\xb1\xd0\xb5 \xd0\xb8\xd0\xbb\xd0\xb8 \xd0\xa1\xd0\xb4\xd0\xb0"
+    b"\xd1\x87\xd0\xb0 (%d):\xd0\x94\xd0\xbb\xd0\xb8\xd0\xbd\xd0\xb0:\xd0\x9f\xd0\xbe\xd0\xb4\xd0\xbf\xd0\xb8\xd1"
+    b"\x81\xd0\xb0\xd1\x82\xd1\x8c?"
+)
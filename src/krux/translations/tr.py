@@ -19,382 +19,346 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-# pylint: disable=C0301
-translation_array = [
-    "tutarın %'si.",
-    "%d / %d çoklu imza",
-    "%d to %d",
-    "%s bit",
-    "%s bayt",
-    "%s kar.",
-    "%s kaldırıldı.",
-    "%s: yüklendi!",
-    "(%s bit/piksel)",
-    "(Deneysel)",
-    "(sadece izle)",
-    "12 kelime",
-    "24 kelime",
-    "Hakkında",
-    "Hesap",
-    "Hesap Endeksi",
-    "Cüzdan parolası eklensin mi veya değiştirilsin mi?",
-    "%s için kameradan gelen ek entropi gerekli",
-    "Adres",
-    "Kamerayı ve yedek plakay'ı düzgün bir şekilde hizalayın.",
-    "Parlama Önleyici Mod",
-    "Görünüm",
-    "Emin misiniz?",
-    "BGR Renkleri",
-    "BIP39 Anımsatıcı",
-    "Geri",
-    "Menüye Dön",
-    "Yedek Mnemonic",
-    "Geçersiz imza",
-    "Base64 Parola",
-    "Baud Hızı",
-    "İkili Izgara",
-    "Kenarlık Dolgusu",
-    "Parlaklık",
-    "Butonlar",
-    "Buton Geri-sekmesi",
-    "Yakalama iptal edildi",
-    "Para Üstü",
-    "Temayı değiştir ve yeniden başlat?",
-    "Cüzdan değiştir?",
-    "Para Üstü:",
-    "Değişiklikler kapanışa kadar devam edecek.",
-    "SD Kartı Kontrol Et",
-    "Bu adresin, bu cüzdana ait olduğunu kontrol et?",
-    "Eşleşmeyen %d adres kontrol edildi.",
-    "SD kart kontrol ediliyor…",
-    "Kurcalama Kontrol Kodunu Onayla",
-    "Veriyi Dönüştür",
-    "Değişiklik adresi belirlenemedi.",
-    "QR Kodu Oluştur",
-    "Metinden QR kodu oluşturulsun mu?",
-    "Oluşturuldu:",
-    "Mevcut Kurcalama Kontrol Kodu",
-    "Özel QR Kodu",
-    "Özel metin",
-    "Özelleştir",
-    "Cüzdanınızı özelleştirmek yeni bir Anahtar oluşturacaktır ve Tanımlayıcısı kaldıracaktır.",
-    "Kesim Derinliği",
-    "Kesim Yöntemi",
-    "Referans Aracı",
-    "Ondalık",
-    "Şifre çözülsün mü?",
-    "Varsayılan Cüzdan",
-    "Bu dosyayı sil?",
-    "Geçiş Başına Derinlik",
-    "Türetim Yolu",
-    "BIP85 entropisi türetilsin mi?",
-    "Tanımlayıcı Adresler",
-    "Cihaz Testleri",
-    "Ekran",
-    "Kapatmayın, tamamlanması biraz zaman alabilir.",
-    "Dönüştürme Tamamlandı",
-    "Tamamlandı mı?",
-    "Çifte anımsatıcı",
-    "Sürücü",
-    "Boş",
-    "Etkinleştir?",
-    "Şifrele",
-    "Şifrelenmiş",
-    "Şifrelenmiş QR Kodu",
-    "Şifrelenmiş mnemonic ID ile depolandı:",
-    "Şifrelenmiş mnemonic depolanmadı",
-    "Şifreleme",
-    "Şifreleme Modu",
-    "%d BIP39 kelime girin.",
-    "6+ karakterlik bir Kurcalama Kontrol Kodu girin",
-    "BIP39 mnemonic'inizin her kelimesini 1'den 2048'e kadar bir sayı olarak girin.",
-    "BIP39 mnemonic'inizin her kelimesini 1'den 800'e kadar onaltılık bir sayı olarak girin.",
-    "BIP39 mnemonic'inizin her kelimesini 1'den 4000'e kadar sekizlik bir sayı olarak girin.",
-    "BIP39 mnemonic'inizin her kelimesini girin.",
-    "Kullanıcı Verilerini Sil",
-    "Kullanıcının verileri siliniyor…",
-    "Hata:",
-    "Çıkış",
-    "Dosyaları ara?",
-    "Adresleri Dışa Aktar",
-    "%s SD karta aktarılıyor…",
-    "Genişletilmiş Public Key",
-    "Fabrika Ayarları",
-    "Kamera entropisi toplanamadı",
-    "Veri dönüştürme başarısız.",
-    "Şifre çözme başarısız",
-    "Yüklenemedi",
-    "Mnemonic depolama başarısız",
-    "Ücret:",
-    "Besleme Hızı",
-    "Dosya adı",
-    "%s dosya adı SD kartta var.",
-    "Flash'ı kameradan gelen entropi ile doldur?",
-    "Flash Dolduruluyor",
-    "PSBT'de parmak izi ayarı kaldırıldı",
-    "Flash Haritası",
-    "Flash Araçları",
-    "Flash kamera entropisi ile dolduruldu",
-    "Flute Çapı",
-    "Boş:",
-    "Depolamadan Seç",
-    "Verilerin geri kullanılamaz olduğundan emin olmak için SD kartınızı başka bir cihazda tamamen silin",
-    "Mnemonic Oluştur",
-    "Seç",
-    "Yeterli entropi",
-    "Donanım",
-    "Başlık türü",
-    "Hex Public Key:",
-    "Onaltılık",
-    "Mnemonic'leri Gizle",
-    "Yüksek ücret!",
-    "ID",
-    "ID zaten var",
-    "Bu değişiklikten sonra cihazınızın ekranı çalışmazsa, 5 saniye sonra önceki ayarlarla otomatik olarak yeniden başlatılır.",
-    "Dizin",
-    "Girişler (%d):",
-    "Yetersiz entropi!",
-    "Geçersiz Kurcalama Kontrol Kodu",
-    "Geçersiz adres",
-    "Geçersiz türetim yolu",
-    "Geçersiz mnemonic uzunluğu",
-    "Geçersiz cüzdan:",
-    "Ters Çevir",
-    "Ters Renkler",
-    "Kef Şifreli",
-    "Anahtar",
-    "Anahtar sağlanmadı",
-    "Krux Yazıcı Test QR'ı",
-    "LCD Tipi",
-    "Dil",
-    "Krux'un geçerli bir son kelime seçmesini istiyorsanız boş bırakın",
-    "Sol",
-    "Uzunluk:",
-    "Satır Gecikmesi",
-    "Satır:",
-    "Adresleri Listele",
-    "Mnemonic Yükle",
-    "Cüzdan Yükle",
-    "Adresleri görüntülemek için güvenilir bir cüzdan tanımlayıcısı yüklensin mi?",
-    "SD karttan yükle",
-    "SD karttan yüklensin mi?",
-    "Kameradan yükle",
-    "Yüklensin mi?",
-    "Kamera Yükleniyor…",
-    "Değişiklik adresleri yükleniyor…",
-    "Yazıcı yükleniyor…",
-    "Alma adresleri yükleniyor…",
-    "Yükleniyor…",
-    "Yerel",
-    "Konum",
-    "Orta",
-    "Mesaj",
-    "Mesaj:",
-    "Mini senaryo",
-    "Ayna X Koordinatları",
-    "İmza dosyası eksik",
-    "Mnemonic",
-    "Anımsatıcı XOR",
-    "Mnemonik ve parola tutulacaktır.",
-    "Değiştirildi:",
-    "Ağ",
-    "Yeni Mnemonic",
-    "Yeni donanım yazılımı tespit edildi.",
-    "Hayır",
-    "Parola Yok",
-    "Parolanızda ASCII olmayan karakterler algılandı. Krux, diğer cüzdanların aynı anahtarı türeteceğini garanti edemez.",
-    "Yeterli zar atışı yok!",
-    "Numaralar",
-    "Sekizlik",
-    "Diğer Formatlar",
-    "Üzerine yazılsın mı?",
-    "Parlaklığı değiştirmek için PAGE",
-    "PBKDF2 iter.",
-    "İşaretlenmiş noktaları siyaha boyayın ki tespit edilebilsinler.",
-    "Kağıt Genişliği",
-    "Parça",
-    "N'nin M Bölümü",
-    "Parça Boyutu",
-    "Parola",
-    "Parola Uzunluğu",
-    "Yol uyuşmazlığı",
-    "Örüntü algılandı!",
-    "Tüm depolanmış ve şifrelenmiş mnemonic'ler ve ayarlar flash'tan kalıcı olarak kaldırılsın mı?",
-    "Kalıcı Depolama",
-    "Piksel sapma indeksi:",
-    "Düz Metin QR'ı",
-    "Lütfen bir cüzdan çıktı tanımlayıcısı yükleyin",
-    "Dalış Hızı",
-    "Politika türü",
-    "Düşük entropi!",
-    "Güç",
-    "İptal etmek için PAGE tuşuna basın.",
-    "PAGE modunu değiştir",
-    "Test QR'ını Yazdır",
-    "Tinyseed yazdırılsın mı?",
-    "QR'a Yazdır",
-    "QR'a yazdırılsın mı?",
-    "Yazdırılsın mı?",
-    "Yazıcı",
-    "Yazıcı Sürücüsü ayarlanmadı!",
-    "Baskı…",
-    "Yine de devam edilsin mi?",
-    "Devam edilsin mi?",
-    "İşleniyor…",
-    "Kanıtlanabilir harcanamaz",
-    "QR Kodu",
-    "QR Etiket",
-    "Miktar",
-    "RX Pini",
-    "Yeniden Başlat",
-    "Al",
-    "Bölge:",
-    "%s kaldırılsın mı?",
-    "Mnemonic'i Kaldır",
-    "SD Karttan donanım yazılımı dosyaları kaldırılsın mı?",
-    "Çözünürlüğü Sıfırla",
-    "Fabrika ayarlarına geri dönüp ve yeniden başlatılsın mı?",
-    "Sonuç",
-    "QR Görüntüleyiciye Dön",
-    "Tekrar İncele",
-    "Taranan verileri gözden geçirin, gerekirse düzenleyin",
-    "Sağ",
-    "Bir mnemonic oluşturmak için zarı en az %d kez atın.",
-    "Zar atış dağılımı:",
-    "Zar atışları:",
-    "180° döndür",
-    "SD kart",
-    "SD kart algılanmadı.",
-    "Zar atışlarının SHA256'sı:",
-    "Snapshot'ın SHA256'sı:",
-    "QR Görüntüsünü SD Karta Kaydet",
-    "SD karta kaydet",
-    "SD karta kaydedilsin mi?",
-    "SD karta kaydedildi:",
-    "Ölçek",
-    "Adresi Tara",
-    "BIP39 Parolasını Tara",
-    "Anahtar QR Kodunu Tara",
-    "1-12 kelimeleri tekrar taranıyor",
-    "13-24 kelimeleri taranıyor",
-    "Ekran Koruyucu Süresi",
-    "Betik Türü",
-    "Güvenlik",
-    "Kendine-transfer veya Para Üstü (%d):",
-    "Kendine-transfer:",
-    "Önce bir kurcalama kontrol kodu ayarlayın",
-    "Ayarlar",
-    "Ayarlar dahili olarak flaşta saklanır.",
-    "Ayarlar SD karta kaydedildi.",
-    "Shannon entropisi:",
-    "Referans Noktasını Göster",
-    "Kapat",
-    "Kapanma Süresi",
-    "Kapatma…",
-    "İmzala",
-    "QR koduna imzala",
-    "SD karta imzala",
-    "İmzalansın mı?",
-    "İmza:",
-    "İmzalı Mesaj",
-    "İmzalı PSBT",
-    "Ham karma imzalanıyor. Yalnızca kaynağa güveniyorsanız devam edin.",
-    "İmzalama…",
-    "Tek-imza",
-    "Boyut:",
-    "Bazı kontroller yerine getirilemedi.",
-    "Bazı düğümler sertleştirilmemiş:",
-    "Harcama (%d):",
-    "Harcama:",
-    "Standart Mod",
-    "Statik",
-    "İnekler İçin İstatistikler",
-    "Flash'ta Sakla",
-    "SD Kartta Sakla",
-    "Güç",
-    "Güçlü",
-    "Modu değiştirmek için kaydırın",
-    "TC Flash Hash",
-    "Önyüklemede TC Flash Hash",
-    "Yakalamak için DOKUN veya GİR",
-    "Yüklemek için DOKUN veya GİR.",
-    "TR iç anahtar",
-    "TX Pini",
-    "Kurcalama Kontrol Kodu",
-    "Kurcalama kontrol kodu başarıyla ayarlandı",
-    "Kurcalama kontrol kodları eşleşmiyor",
-    "Test Grubu:",
-    "Test Paketi Sonuçları",
-    "Test:",
-    "Metin",
-    "Tema",
-    "Termal",
-    "Verilerin geri kullanılamaz olduğundan emin olmak için Cihazı Sil özelliğini kullanın",
-    "Parlaklığı Değiştir",
-    "Araçlar",
-    "Dokunma Eşiği",
-    "Dokunmatik ekran",
-    "Daha fazla kez denensin mi?",
-    "BIP39 parolasını yazın",
-    "Anahtar Yaz",
-    "Geri Al",
-    "Birim",
-    "Kef Kimliği Güncellensin mi?",
-    "QR Etiketi Güncellensin mi",
-    "Güncelleme tamamlandı.",
-    "Siyah bir arka plan yüzeyi kullanın.",
-    "Yeni bir mnemonic oluşturmak için kameranın entropisini kullanın",
-    "Mevcut Değer",
-    "Varsayılanı Kullan?",
-    "Varsayılan PBKDF2 yinelemesini kullan.?",
-    "Parmak izi ID olarak kullanılmalı mı?",
-    "Kullanılan:",
-    "Kullanıcı",
-    "%s değeri aralık dışında: [%s, %s]",
-    "Doğrulanıyor…",
-    "Sürüm",
-    "Kamera Aracılığıyla",
-    "D20 Aracılığıyla",
-    "D6 Aracılığıyla",
-    "Manuel Giriş Aracılığıyla",
-    "Sözcüklerle",
-    "Görünür Etiket",
-    "Yakalamanın tamamlanmasını bekleyin",
-    "Cüzdan",
-    "Cüzdan Tanımlayıcısı",
-    "Cüzdan uyuşmazlığı:",
-    "Cüzdan çıktı tanımlayıcısı",
-    "Cüzdan çıktı tanımlayıcısı yüklendi!",
-    "Cüzdan çıktı tanımlayıcısı bulunamadı.",
-    "Uyarı:",
-    "Zayıf",
-    "Kelime %d",
-    "Kelime Numaraları",
-    "Kelimeler",
-    "XOR Sonucu",
-    "XOR ile",
-    "XOR başka biriyle geçerli anımsatıcı? (parola ve tanımlayıcı atılacak)",
-    "Evet",
-    "Zoom Mod",
-    "ikili:",
-    "Kalınan: ",
-    "oNALTILIKTAN",
-    "base32 'den",
-    "tabandan43",
-    "base64 'ten",
-    "onaltılıktan",
-    "utf8 'den",
-    "geçerli bir adres!",
-    "vites kutusu",
-    "Başarı Puanı:",
-    "kaydırın",
-    "metin:",
-    "to HEX",
-    "üsse32",
-    "üsse43",
-    "base64 'e",
-    "to hex",
-    "utf8 'e",
-    "bilinmiyor",
-    "ilk %d adreste BULUNAMADI",
-]
+# pylint: disable=C0103,C0301
+catalog = (
+    b"p\x01\xb6\x11\x16\x00l\xfa\xa6\x02[\xa8b\x04\xed\x8e:\x06\xe6\x81m\x07\xb6\x8b\xef\x07B{d\x08\xb7\x06"
+    b'\xff\x08\nf\x00\n\xbcI\xdb\r\xbfN\x02\x0epi"\x0e\xff#)\x0e\x88\x1f\xe1\x0ef\x97\xa1\x0f\x8b\xea'
+    b"5\x11\x8arH\x11%\xc4\xc6\x14k\xd8\xe0\x14\xefy\xca\x16j\xc7\xd9\x16GG.\x17\x05\xd5R\x17\xeal"
+    b"\xf3\x17}\xca\xe8\x18\x81\xd3*\x19\xbba\xc5\x19\xe0\x94\xdd\x19\x93\xc23\x1ck\xf8<\x1c\xbd\xc3\xd1\x1dk\x96"
+    b'O\x1fhW\xae\x1f\xeat\x9b!\xf2\xb1\x1d"\x00\xb9/#Lj\xa3#\xf4\xb7\xec#k\xd7\xb4$\x13\t'
+    b"\xea$\xf1\xf7(&\xe9~\xaf&`Rp(\xfa\x1c*)\xa8\xdaL)|\xb9\xb7)j\x91\\*\x93g"
+    b'x*\xeb\xf5\xea*s\xf1;+"\xd6r+\xf4\x85t-\x80\n\x87-\xe3\x13\xad-J\x9f\xea-\x9d.'
+    b"\x93.\xb80\xc4.uU\x8b/\x7f\x0b\xb5/\x8e\x83\xcf/g\xd4\xb80n\xea\xf30\x12Ec1\x99\x1b"
+    b"i1\xef|73\x14\x15\xe83\xe5\x91o4\x86|\xea4\x1f\xaf\xfd4\xc9\xa3\xaa5\xbd\xca\xd85Z'"
+    b"S6\x02\xcb^6\xd5\x91\xb36\x16\x19\x087\xfc?[7\xd84\xf69\x89\x0fZ:\x81\xa9[;|\x91"
+    b"\xec;\x97\xb7\xed<\x95e7>\x1e\xd1\xfd>\xc0>L?\xfd\x91\x1f@x}=@\x87j\x8dA\x84>"
+    b"\x96A\x05H\xb2A\xed\xf2\xc7Aq@\xf1B\xcc\x14BC\xdf~.D\xba\x16\x8bEhY\x0cF\xae\xc3"
+    b",F\x11r?F! XF\x90\xb9\xa5F\x1a\xcd\xccF\x1c\n7G\xee\x08nG\x16\xfb\xfbG\x8fb"
+    b"zI30\xc0I\xf9\xd4'Jc\xed\xc8J?\xad&K`D\xd1Kg`\x16MIs\xaaM\x8f\xe6"
+    b"\x15Na\xdcLP\x9b\x94\xe9Q\x12@\x88RJ\xde\xd6S8\xa4\xc0U?\x9c\x05V\x0c\xc8\xb4VB\x9d"
+    b"PW\x9c\x07\x01Xd\xe9\x83X\xee\x8c\xb9Y\xe8\xcc&Z\xa0[\xcf\\q\xd7\x08^\t\x84]^\x0c\x01"
+    b'k^\x08i2_\x1c;\xa3b[\xb9\xdab*\xfe\x13c\xb9\x993cd\n\xfdcY"\xa2d\x8d?'
+    b"\xf2dy\x96\x1de\x9d\x9e\x8de2\x8e\x00f\xc5\x1b\x18f`t\x85fY\xcftg\xcd8\xd1g\xed\xd1"
+    b"\njM\x865j\xa4.Kj\x13]\xd1j\x0bT\xa6k\xe8{}l\x94\xbc\xd4l0\x11\xe0m?\xfb"
+    b"*n]\x8eRn\x08{Xo\xb9m\x87o\xde\xd6\xcfom\x14@p_\xea\xa1p\xc3\x99\xd8p\xa8\x93"
+    b")q\x8dirs0\x13\x16t\xe7\r5t\xe8\xda\xcat\x10Z\x0bu\xd9\xd4\x84v9\xab\xf4wYQ"
+    b"_xZ\x9b\xf9x\xe3\t\x00y\x08\xc8#yw\xde|yq\xdf\xfcy4\xd9\xe0z\xac\x11e{)\x97"
+    b"\xc4{m\xa3\x89|\x9f\x8a\x9b|\xdeG\xa7}?\x0e\xf2\x80\x00\x1ei\x81\xa6Z\xc0\x81u\xc6W\x82\x0c\x11"
+    b"r\x85\xa2\xcb6\x86j\x8f~\x86\x80\xb1\x83\x86\xffY\x98\x86\xbe\xf6W\x87\x13-l\x87\xc3\x10\xfb\x87\xbc\x93"
+    b"\xb9\x88\xdf\xde\xe9\x88\xf2\xaf\x9f\x8a\xb6\xd1\x9f\x8a)\xbcE\x8b\x7f\x00\xc2\x8b*\xbc\xe1\x8ca\x90\x04\x8d\x89Q"
+    b";\x8d\xdd\x8e2\x8f\xbf\xc3D\x90\x95\x8e}\x91\x0f$\x83\x93D\xa7\xff\x94\xb1\x8b#\x95\x0f\x8a@\x95\x1fl"
+    b"E\x95n7#\x963\xd5+\x96Rv\x13\x99J\xc7\xaa\x99\xdb\xd0\xd0\x99&\x1f\x1d\x9a\x03 5\x9aO?"
+    b"\x11\x9b\xf9\x08\xb9\x9b-\xcb\x9f\x9d\xfa\x03\x04\x9fp}?\x9f\xd0\x8bp\x9fw+i\xa0D\xde\x87\xa0\xad\x08"
+    b"\xce\xa0y\xe5\xf1\xa0\x9a\xfe\x03\xa1\xbfX\xe0\xa2.\xc5\x1b\xa3\x12\xe1\x1b\xa3V\xd4J\xa3\x0f<\xab\xa3\xee\xa8"
+    b"\xfa\xa3\xaa\x0cJ\xa4\xf0\x84\x8a\xa5\xf8\xe2\x19\xa6\xe4\xa8T\xa6V3y\xa6\x9d\xeb\xe8\xa7\xc3\xc2\xec\xa7\x18\xde"
+    b" \xa8\xc0\x12\x06\xa9P]\x94\xa9\x1ei\xa7\xaaX\xcb\xa8\xabNw\xa9\xabO\xd9\xfb\xac\xc7\xa7&\xadY\xb5"
+    b"'\xaf \xbe9\xaf\xc0ZG\xaf\x0e\xa2\x9a\xaf\x881\xbc\xb0\x12s\xf0\xb0d\xa3\x8b\xb1\x8e7\x16\xb28o"
+    b"\x8b\xb2I\xed\xdd\xb2O4\x88\xb3\xdd\xe6\x05\xb5\xfd\xe52\xb5\xfb\x95\x9d\xb5e\xf3#\xb8\xae\x87>\xb8]\x1f"
+    b"\x92\xb9\x07\x86\xf0\xb9\x163\r\xbbS;\xc3\xbeE\xb4\xa1\xbfh\xae\xd0\xbf\xb4\xbb?\xc1z\xa1\x92\xc1\xc3\xd2"
+    b"\xa4\xc1\x81@\xdf\xc1\xd5\xa5q\xc2;b\x95\xc2\x1dV\xf3\xc2\xa5V\xf8\xc2?Kl\xc3\xcc\xd3\xe8\xc4\xe8\x95"
+    b"5\xc53\x8b}\xc5\xa4]U\xc6\x89\x87\x86\xc6\x0e\xc6\xda\xc6\xba\x81\xff\xc6\x97\xd5\x0c\xc7dW\x97\xc7^&"
+    b'\xc3\xc8B\xb6\xb7\xc9T\x8e<\xcb\x14\xb8\x97\xcc"^\x06\xcd\x92%)\xcd\x7f\x8a[\xcd\tn\xfc\xcd\x16i'
+    b"g\xd1\xe7\xa7z\xd1\xad\xf3\xd5\xd1\x83\x1d\x82\xd2\xed\xad\x89\xd3d\x00)\xd4v\x16L\xd4\xd0\xc2\x89\xd5\xbf\n"
+    b"\xb5\xd5k\x1b+\xd6\x92\xba\x11\xd8\\\x9d\x19\xd8O4\xa9\xd8\xcb\xf9\xeb\xd9VHU\xda\xbc]\xde\xda\x03Y"
+    b"\xf1\xda\x89^O\xdb\xa9\xe9Y\xdb0\x00\xa0\xdb\x99w@\xdeRI\xe6\xdeR\xdc\x10\xdf\xe9G<\xdf\xc23"
+    b"~\xdfg\xe9\x80\xdf\xdc\xdf\xb4\xdf\x95x\x9d\xe0]\xcb\xc3\xe2\x95w\xa3\xe44\xba\xb1\xe4WV\xca\xe4;\x9f"
+    b"@\xe5@\x81\xee\xe5\xb7\x00\x11\xe7I\xd0/\xe8\x87\xc4\xab\xe8\x95\x8f\xae\xe8\xf8\xdf=\xe9\x13!%\xear\xf0"
+    b"\xae\xea\xe5\x0c\t\xed\xe0\xdfT\xed/xy\xed/9\x9a\xee\x1c\x8a\xcb\xeej\xe8\xcf\xee\xb5a\x1f\xefb\xab"
+    b"C\xef\x0e\xc4\xaf\xf0\x95)\xb0\xf0\x974-\xf1\xbd\x0c.\xf2)\x9e`\xf31\xd9\xee\xf3\xfa\x95\xfc\xf3\xdc\x97"
+    b"\x06\xf4\tdW\xf4\x8e\xb9\x87\xf4E\x1e\xd1\xf4\xe7`k\xf5\x06\xe8\xa1\xf5\xf1k\xbe\xf5\xd1Wa\xf7\xa6H"
+    b"p\xf7\xe8\xe3'\xf9\xafz\xce\xf9wr\x05\xfcD0I\xfc\xb3`P\xfd^\xee\xa0\xfd\x9d\xa0\xdd\xfe>L"
+    b"?\xff\x00\x00\x00\x00X\x00\x00\x00u\x00\x00\x00\x82\x00\x00\x00\x90\x00\x00\x00\xa0\x00\x00\x00\xa8\x00\x00\x00\xb9\x00"
+    b"\x00\x00\xc5\x00\x00\x00\xe7\x00\x00\x00\xf5\x00\x00\x00\x01\x01\x00\x00\x12\x01\x00\x00$\x01\x00\x007\x01\x00\x00>\x01"
+    b"\x00\x00D\x01\x00\x00P\x01\x00\x00V\x01\x00\x00`\x01\x00\x00i\x01\x00\x00\x84\x01\x00\x00\xb2\x01\x00\x00\xc2\x01"
+    b"\x00\x00\xdb\x01\x00\x00\xe1\x01\x00\x00\x00\x02\x00\x00\x10\x02\x00\x00 \x02\x00\x00'\x02\x00\x006\x02\x00\x00L\x02"
+    b"\x00\x00_\x02\x00\x00\x8a\x02\x00\x00\xb2\x02\x00\x00\xd3\x02\x00\x00\xf1\x02\x00\x00\xff\x02\x00\x00\x03\x03\x00\x00\x13\x03"
+    b"\x00\x00\x1b\x03\x00\x00'\x03\x00\x008\x03\x00\x00E\x03\x00\x00Y\x03\x00\x00u\x03\x00\x00\x98\x03\x00\x00\x9f\x03"
+    b"\x00\x00\xbb\x03\x00\x00\xca\x03\x00\x00\xd2\x03\x00\x009\x04\x00\x00?\x04\x00\x00F\x04\x00\x00I\x04\x00\x00\x81\x04"
+    b"\x00\x00\x8b\x04\x00\x00\x99\x04\x00\x00\xa2\x04\x00\x00\xc2\x04\x00\x00\xc7\x04\x00\x00\xdf\x04\x00\x00\xed\x04\x00\x00\xfc\x04"
+    b"\x00\x00\x14\x05\x00\x000\x05\x00\x00G\x05\x00\x00`\x05\x00\x00\x86\x05\x00\x00\x8b\x05\x00\x00\xc9\x05\x00\x00\xd3\x05"
+    b"\x00\x00\xdb\x05\x00\x00\xf2\x05\x00\x00\xfe\x05\x00\x00\x14\x06\x00\x00%\x06\x00\x005\x06\x00\x00F\x06\x00\x00\x8a\x06"
+    b"\x00\x00\x93\x06\x00\x00\x9c\x06\x00\x00\xa9\x06\x00\x00\xb6\x06\x00\x00\xbd\x06\x00\x00\xc9\x06\x00\x00\xce\x06\x00\x00\xdb\x06"
+    b"\x00\x00\xe7\x06\x00\x00\xec\x06\x00\x00\x01\x07\x00\x00\t\x07\x00\x00\x10\x07\x00\x008\x07\x00\x00W\x07\x00\x00`\x07"
+    b"\x00\x00e\x07\x00\x00v\x07\x00\x00|\x07\x00\x00\x8f\x07\x00\x00\xb4\x07\x00\x00\xd0\x07\x00\x00\xdf\x07\x00\x00\xea\x07"
+    b"\x00\x00\x08\x08\x00\x00\x17\x08\x00\x00,\x08\x00\x00@\x08\x00\x00H\x08\x00\x00[\x08\x00\x00l\x08\x00\x00p\x08"
+    b"\x00\x00y\x08\x00\x00\x96\x08\x00\x00\xb4\x08\x00\x00\xd9\x08\x00\x00\xe5\x08\x00\x00\xf5\x08\x00\x00\x16\t\x00\x00\x1a\t"
+    b"\x00\x00-\t\x00\x00?\t\x00\x00J\t\x00\x00S\t\x00\x00Y\t\x00\x00\x97\t\x00\x00\x9f\t\x00\x00\xc5\t"
+    b"\x00\x00\xd6\t\x00\x00\xdd\t\x00\x00\xea\t\x00\x00\xf1\t\x00\x00)\n\x00\x00C\n\x00\x00P\n\x00\x00V\n"
+    b"\x00\x00p\n\x00\x00~\n\x00\x00\x8e\n\x00\x00\xa8\n\x00\x00\xbf\n\x00\x00\xc5\n\x00\x00\xcc\n\x00\x00\xd7\n"
+    b"\x00\x00\xe2\n\x00\x00\x07\x0b\x00\x00\x0c\x0b\x00\x00\x1d\x0b\x00\x00B\x0b\x00\x00i\x0b\x00\x00n\x0b\x00\x00\x8a\x0b"
+    b"\x00\x00\x91\x0b\x00\x00\xba\x0b\x00\x00\xc6\x0b\x00\x000\x0c\x00\x00I\x0c\x00\x00_\x0c\x00\x00f\x0c\x00\x00v\x0c"
+    b"\x00\x00\x95\x0c\x00\x00\xa5\x0c\x00\x00\xb2\x0c\x00\x00\xbb\x0c\x00\x00\xcd\x0c\x00\x00\xd1\x0c\x00\x00\xdf\x0c\x00\x00\xf5\x0c"
+    b"\x00\x00\xfb\x0c\x00\x00\x11\r\x00\x00\x16\r\x00\x00\x1d\r\x00\x00/\r\x00\x00<\r\x00\x00G\r\x00\x00X\r"
+    b"\x00\x00_\r\x00\x00d\r\x00\x00q\r\x00\x00\x80\r\x00\x00\x8f\r\x00\x00\xa2\r\x00\x00\xa9\r\x00\x00\xd4\r"
+    b"\x00\x00\xdc\r\x00\x00\xea\r\x00\x00A\x0e\x00\x00O\x0e\x00\x00\xab\x0e\x00\x00\xb9\x0e\x00\x00\xbf\x0e\x00\x00\xc7\x0e"
+    b"\x00\x00\xd7\x0e\x00\x00\xf0\x0e\x00\x00\xfa\x0e\x00\x00)\x0f\x00\x00?\x0f\x00\x00d\x0f\x00\x00l\x0f\x00\x00\xab\x0f"
+    b"\x00\x00\xb9\x0f\x00\x00\xfd\x0f\x00\x00D\x10\x00\x00_\x10\x00\x00\xdc\x10\x00\x00\x0b\x11\x00\x00\x19\x11\x00\x00!\x11"
+    b"\x00\x00G\x11\x00\x00b\x11\x00\x00l\x11\x00\x00y\x11\x00\x00\x8e\x11\x00\x00\x9f\x11\x00\x00\xae\x11\x00\x00\xdb\x11"
+    b"\x00\x00\xea\x11\x00\x00\xef\x11\x00\x00\xf7\x11\x00\x00\xfd\x11\x00\x00\x04\x12\x00\x00*\x12\x00\x005\x12\x00\x00J\x12"
+    b"\x00\x00L\x12\x00\x00d\x12\x00\x00w\x12\x00\x00\x92\x12\x00\x00\xad\x12\x00\x00\xc3\x12\x00\x00\xcc\x12\x00\x00\xda\x12"
+    b"\x00\x00\xf2\x12\x00\x00\x00\x13\x00\x00\x10\x13\x00\x00(\x13\x00\x004\x13\x00\x00C\x13\x00\x00H\x13\x00\x00d\x13"
+    b"\x00\x00s\x13\x00\x00w\x13\x00\x00~\x13\x00\x00\xa4\x13\x00\x00\xb3\x13\x00\x00\xbf\x13\x00\x00\xe7\x13\x00\x00\xf1\x13"
+    b"\x00\x00\x06\x14\x00\x00\t\x14\x00\x00(\x14\x00\x00F\x14\x00\x00O\x14\x00\x00r\x14\x00\x00\x82\x14\x00\x00\x95\x14"
+    b"\x00\x00\x9a\x14\x00\x00\xa1\x14\x00\x00\xa8\x14\x00\x00\xbd\x14\x00\x00%\x15\x00\x00<\x15\x00\x00E\x15\x00\x00_\x15"
+    b"\x00\x00\x86\x15\x00\x00\xb7\x15\x00\x00\xcc\x15\x00\x00\xd9\x15\x00\x00\xe5\x15\x00\x00\xf1\x15\x00\x00\x00\x16\x00\x00\x13\x16"
+    b"\x00\x003\x16\x00\x007\x16\x00\x00O\x16\x00\x00c\x16\x00\x00h\x16\x00\x00\x80\x16\x00\x00\x85\x16\x00\x00\x93\x16"
+    b"\x00\x00\xa8\x16\x00\x00\xb2\x16\x00\x008\x17\x00\x00F\x17\x00\x00R\x17\x00\x00a\x17\x00\x00t\x17\x00\x00~\x17"
+    b"\x00\x00\x85\x17\x00\x00\x94\x17\x00\x00\xac\x17\x00\x00\xb7\x17\x00\x00\xed\x17\x00\x00\x01\x18\x00\x00\n\x18\x00\x00\x0e\x18"
+    b"\x00\x00\x1b\x18\x00\x00>\x18\x00\x00\x8d\x18\x00\x00\xa5\x18\x00\x00\xb6\x18\x00\x00\xc3\x18\x00\x00\xfb\x18\x00\x00\x08\x19"
+    b"\x00\x00\x14\x19\x00\x00-\x19\x00\x00O\x19\x00\x00i\x19\x00\x00\x91\x19\x00\x00\xa0\x19\x00\x00\xa3\x19\x00\x00\xb0\x19"
+    b"\x00\x00\xba\x19\x00\x00\xe7\x19\x00\x00\xf1\x19\x00\x00\x00\x1a\x00\x00O\x1a\x00\x00e\x1a\x00\x00w\x1a\x00\x00\x8a\x1a"
+    b"\x00\x00\xa7\x1a\x00\x00\xb5\x1a\x00\x00\xc6\x1a\x00\x00\xd2\x1a\x00\x00\xe4\x1a\x00\x00\xfc\x1a\x00\x00\x0c\x1b\x00\x00\x1b\x1b"
+    b"\x00\x00,\x1b\x00\x006\x1b\x00\x00E\x1b\x00\x00u\x1b\x00\x00\x98\x1b\x00\x00\xab\x1b\x00\x00\xb1\x1b\x00\x00\xc5\x1b"
+    b"\x00\x00\xd0\x1b\x00\x00\xd7\x1b\x00\x00\xe8\x1b\x00\x00\xf3\x1b\x00\x00\x1a\x1c\x00\x00;\x1c\x00\x00b\x1c\x00\x00}\x1c"
+    b"\x00\x00\xa9\x1c\x00\x00\xbd\x1c\x00\x00\xd4\x1c\x00\x00.\x1d\x00\x004\x1d\x00\x00=\x1d\x00\x00V\x1d\x00\x00r\x1d"
+    b"\x00\x00\x82\x1d\x00\x00\x98\x1d\x00\x00\xb1\x1d\x00\x00\xbb\x1d\x00\x00\xc6\x1d\x00\x00\xf1\x1d\x00\x00\xfc\x1d\x00\x00\n\x1e"
+    b"\x00\x00\x16\x1e\x00\x00]\x1e\x00\x00t\x1e\x00\x00{\x1e\x00\x00\x9d\x1e\x00\x00\xa3\x1e\x00\x00\xca\x1e\x00\x00\xd2\x1e"
+    b"\x00\x00\xe3\x1e\x00\x00BIP39 mnemonic'inizin her "
+    b"kelimesini 1'den 4000'e kadar se"
+    b"kizlik bir say\xc4\xb1 olarak girin.Ka"
+    b"mera entropisi toplanamad\xc4\xb1Yeni "
+    b"MnemonicBesleme H\xc4\xb1z\xc4\xb1Kesim Deri"
+    b"nli\xc4\x9fiDonan\xc4\xb1mKal\xc4\xb1c\xc4\xb1 DepolamaQ"
+    b"R'a Yazd\xc4\xb1rMetinden QR kodu olu\xc5"
+    b"\x9fturulsun mu?tutar\xc4\xb1n %'si.Mini "
+    b"senaryoSD karttan y\xc3\xbckleGe\xc3\xa7ersi"
+    b"z c\xc3\xbczdan:Performans Testleri\xc3\x9cc"
+    b"ret:metin:Betik T\xc3\xbcr\xc3\xbcSonu\xc3\xa7\xc5\x9eif"
+    b"relemeS\xc3\xbcr\xc3\xbcc\xc3\xbc\xc5\x9eifre \xc3\xa7\xc3\xb6zme ba"
+    b"\xc5\x9far\xc4\xb1s\xc4\xb1zDe\xc4\x9fi\xc5\x9fiklikler kapan\xc4"
+    b"\xb1\xc5\x9fa kadar devam edecek.Di\xc4\x9fer F"
+    b"ormatlarBIP39 parolas\xc4\xb1n\xc4\xb1 yaz\xc4\xb1"
+    b"n%s bitKurcalama Kontrol Kodunu "
+    b"OnaylaZar at\xc4\xb1\xc5\x9flar\xc4\xb1:Parola Uzu"
+    b"nlu\xc4\x9fuAyarlarPolitika t\xc3\xbcr\xc3\xbc\xc3\x96r\xc3"
+    b"\xbcnt\xc3\xbc alg\xc4\xb1land\xc4\xb1!D6 Arac\xc4\xb1l\xc4\xb1\xc4\x9f"
+    b"\xc4\xb1ylaBIP39 mnemonic'inizin her k"
+    b"elimesini girin.Ayarlar dahili o"
+    b"larak fla\xc5\x9fta saklan\xc4\xb1r.Veri d\xc3\xb6"
+    b"n\xc3\xbc\xc5\x9ft\xc3\xbcrme ba\xc5\x9far\xc4\xb1s\xc4\xb1z.Manuel "
+    b"Giri\xc5\x9f Arac\xc4\xb1l\xc4\xb1\xc4\x9f\xc4\xb1ylaKesim Y\xc3\xb6"
+    b"ntemiSe\xc3\xa7Ba\xc5\x9far\xc4\xb1 Puan\xc4\xb1:Zoom Mo"
+    b"dTers RenklerYetersiz entropi!Ol"
+    b"u\xc5\x9fturuldu:\xc3\x87ifte an\xc4\xb1msat\xc4\xb1c\xc4\xb1%"
+    b"s SD karta aktar\xc4\xb1l\xc4\xb1yor\xe2\x80\xa6QR G\xc3"
+    b"\xb6r\xc3\xbcnt\xc3\xbcs\xc3\xbcn\xc3\xbc SD Karta KaydetRX"
+    b" PiniAyarlar SD karta kaydedildi"
+    b".SD Kartta SaklaAra\xc3\xa7larC\xc3\xbczdan\xc4"
+    b"\xb1n\xc4\xb1z\xc4\xb1 \xc3\xb6zelle\xc5\x9ftirmek yeni bir"
+    b" Anahtar olu\xc5\x9fturacakt\xc4\xb1r ve Tan"
+    b"\xc4\xb1mlay\xc4\xb1c\xc4\xb1s\xc4\xb1 kald\xc4\xb1racakt\xc4\xb1r.M"
+    b"esaj:\xc3\x96l\xc3\xa7ekDilBir mnemonic olu\xc5"
+    b"\x9fturmak i\xc3\xa7in zar\xc4\xb1 en az %d kez"
+    b" at\xc4\xb1n.Kapatma\xe2\x80\xa6Dal\xc4\xb1\xc5\x9f H\xc4\xb1z\xc4\xb1K"
+    b"elime %dY\xc3\xbcklemek i\xc3\xa7in DOKUN ve"
+    b"ya G\xc4\xb0R.G\xc3\xbc\xc3\xa7Snapshot'\xc4\xb1n SHA256"
+    b"'s\xc4\xb1:onalt\xc4\xb1l\xc4\xb1ktanFlash Haritas"
+    b"\xc4\xb1QR'a yazd\xc4\xb1r\xc4\xb1ls\xc4\xb1n m\xc4\xb1?%s dos"
+    b"ya ad\xc4\xb1 SD kartta var.Ge\xc3\xa7ersiz "
+    b"t\xc3\xbcretim yoluSD karttan y\xc3\xbcklens"
+    b"in mi?Parlakl\xc4\xb1\xc4\x9f\xc4\xb1 de\xc4\x9fi\xc5\x9ftirme"
+    b"k i\xc3\xa7in PAGEHata:Kameray\xc4\xb1 ve ye"
+    b"dek plakay'\xc4\xb1 d\xc3\xbczg\xc3\xbcn bir \xc5\x9feki"
+    b"lde hizalay\xc4\xb1n.XOR SonucuLCD Tip"
+    b"iTest Paketi Sonu\xc3\xa7lar\xc4\xb1vites ku"
+    b"tusuAnahtar QR Kodunu TaraKenarl"
+    b"\xc4\xb1k DolgusuSat\xc4\xb1r GecikmesiD\xc3\xbc\xc5\x9f"
+    b"\xc3\xbck entropi!\xc4\xb0\xc5\x9faretlenmi\xc5\x9f nokt"
+    b"alar\xc4\xb1 siyaha boyay\xc4\xb1n ki tespit"
+    b" edilebilsinler.utf8 'denG\xc3\xbcvenl"
+    b"ikHesap EndeksiEmin misiniz?\xc4\xb0mz"
+    b"alaStandart ModBo\xc5\x9f:(sadece izle"
+    b")\xc4\xb0mzalama\xe2\x80\xa6DizinKamera Y\xc3\xbcklen"
+    b"iyor\xe2\x80\xa6Yaz\xc4\xb1c\xc4\xb1Geri AlParmak izi"
+    b" ID olarak kullan\xc4\xb1lmal\xc4\xb1 m\xc4\xb1?Za"
+    b"r at\xc4\xb1\xc5\x9flar\xc4\xb1n\xc4\xb1n SHA256's\xc4\xb1:QR "
+    b"EtiketYerel%s kald\xc4\xb1r\xc4\xb1ld\xc4\xb1.Term"
+    b"al%d / %d \xc3\xa7oklu imzaE\xc5\x9fle\xc5\x9fmeye"
+    b"n %d adres kontrol edildi.Tinyse"
+    b"ed yazd\xc4\xb1r\xc4\xb1ls\xc4\xb1n m\xc4\xb1?Yeterli en"
+    b"tropiPara \xc3\x9cst\xc3\xbc\xc4\xb0nekler \xc4\xb0\xc3\xa7in "
+    b"\xc4\xb0statistiklerDe\xc4\x9fi\xc5\x9ftirildi:\xc5\x9ei"
+    b"frelenmi\xc5\x9f QR KoduD20 Arac\xc4\xb1l\xc4\xb1\xc4"
+    b"\x9f\xc4\xb1ylaHarcama:Varsay\xc4\xb1lan C\xc3\xbczda"
+    b"nN'nin M B\xc3\xb6l\xc3\xbcm\xc3\xbcEvet24 kelimeM"
+    b"evcut Kurcalama Kontrol KoduKef "
+    b"Kimli\xc4\x9fi G\xc3\xbcncellensin mi?Flash "
+    b"kamera entropisi ile doldurulduF"
+    b"lute \xc3\x87ap\xc4\xb1Bu dosyay\xc4\xb1 sil?Mnemo"
+    b"nik ve parola tutulacakt\xc4\xb1r.Tema"
+    b"Veriyi D\xc3\xb6n\xc3\xbc\xc5\x9ft\xc3\xbcrMnemonic'i Ka"
+    b"ld\xc4\xb1rbase64 'ten\xc3\x87\xc4\xb1k\xc4\xb1\xc5\x9f\xc4\xb0mza:S"
+    b"D Karttan donan\xc4\xb1m yaz\xc4\xb1l\xc4\xb1m\xc4\xb1 d"
+    b"osyalar\xc4\xb1 kald\xc4\xb1r\xc4\xb1ls\xc4\xb1n m\xc4\xb1?Sek"
+    b"izlikTemay\xc4\xb1 de\xc4\x9fi\xc5\x9ftir ve yenid"
+    b"en ba\xc5\x9flat?An\xc4\xb1msat\xc4\xb1c\xc4\xb1 XOR\xc3\xbcss"
+    b"e43Mevcut De\xc4\x9ferB\xc3\xb6lge:Taranan v"
+    b"erileri g\xc3\xb6zden ge\xc3\xa7irin, gereki"
+    b"rse d\xc3\xbczenleyinD\xc3\xb6n\xc3\xbc\xc5\x9ft\xc3\xbcrme Ta"
+    b"mamland\xc4\xb1Etkinle\xc5\x9ftir?ikili:Kan\xc4"
+    b"\xb1tlanabilir harcanamaz%s: y\xc3\xbckle"
+    b"ndi!D\xc3\xbcz Metin QR'\xc4\xb1Geni\xc5\x9fletilm"
+    b"i\xc5\x9f Public KeyTan\xc4\xb1mlay\xc4\xb1c\xc4\xb1 Adr"
+    b"eslerMiktar\xc3\xbcsse32\xc3\x96zel metinTes"
+    b"t Grubu:Kullan\xc4\xb1c\xc4\xb1n\xc4\xb1n verileri"
+    b" siliniyor\xe2\x80\xa6G\xc3\xbc\xc3\xa7Adresleri List"
+    b"eleDe\xc4\x9fi\xc5\x9fiklik adresleri y\xc3\xbckle"
+    b"niyor\xe2\x80\xa6Kurcalama kontrol kodlar"
+    b"\xc4\xb1 e\xc5\x9fle\xc5\x9fmiyorKapatReferans Nok"
+    b"tas\xc4\xb1n\xc4\xb1 G\xc3\xb6sterQR Kodu\xc5\x9eifrelen"
+    b"mi\xc5\x9f mnemonic ID ile depoland\xc4\xb1:"
+    b"BGR RenkleriVerilerin geri kulla"
+    b"n\xc4\xb1lamaz oldu\xc4\x9fundan emin olmak "
+    b"i\xc3\xa7in SD kart\xc4\xb1n\xc4\xb1z\xc4\xb1 ba\xc5\x9fka bir"
+    b" cihazda tamamen silinilk %d adr"
+    b"este BULUNAMADIAdresleri D\xc4\xb1\xc5\x9fa "
+    b"AktarS\xc3\xbcr\xc3\xbcmDepolamadan Se\xc3\xa7Yaka"
+    b"lamak i\xc3\xa7in DOKUN veya G\xc4\xb0RKamer"
+    b"adan y\xc3\xbckleS\xc3\xb6zc\xc3\xbcklerleHakk\xc4\xb1nd"
+    b"aShannon entropisi:Sa\xc4\x9f\xc4\xb0mzal\xc4\xb1 "
+    b"Mesaj%d BIP39 kelime girin.Boyut"
+    b":Ekran Koruyucu S\xc3\xbcresiMesaj%s b"
+    b"aytButon Geri-sekmesi\xc4\xb0kili Izga"
+    b"raAnahtar YazG\xc3\xb6r\xc3\xbcn\xc3\xbcr EtiketC\xc3"
+    b"\xbczdanBirimHarcama (%d):Referans "
+    b"Arac\xc4\xb1SD karta kaydetge\xc3\xa7erli bi"
+    b"r adres!Sat\xc4\xb1r:\xc3\x96nce bir kurcala"
+    b"ma kontrol kodu ayarlay\xc4\xb1n\xc5\x9eifre"
+    b"leY\xc3\xbckleniyor\xe2\x80\xa6Adresleri g\xc3\xb6r\xc3\xbc"
+    b"nt\xc3\xbclemek i\xc3\xa7in g\xc3\xbcvenilir bir c"
+    b"\xc3\xbczdan tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1s\xc4\xb1 y\xc3\xbcklen"
+    b"sin mi?Ge\xc3\xa7ersiz imzaVerilerin g"
+    b"eri kullan\xc4\xb1lamaz oldu\xc4\x9fundan em"
+    b"in olmak i\xc3\xa7in Cihaz\xc4\xb1 Sil \xc3\xb6zel"
+    b"li\xc4\x9fini kullan\xc4\xb1nTR i\xc3\xa7 anahtarS"
+    b"tatikTek-imzaQR koduna imzalaC\xc3\xbc"
+    b"zdan Tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1s\xc4\xb1Parola Yok"
+    b"6+ karakterlik bir Kurcalama Kon"
+    b"trol Kodu girinKurcalama Kontrol"
+    b" KoduBaz\xc4\xb1 kontroller yerine get"
+    b"irilemedi.ButonlarFabrika ayarla"
+    b"r\xc4\xb1na geri d\xc3\xb6n\xc3\xbcp ve yeniden ba"
+    b"\xc5\x9flat\xc4\xb1ls\xc4\xb1n m\xc4\xb1?C\xc3\xbczdan Y\xc3\xbckleY"
+    b"eni bir mnemonic olu\xc5\x9fturmak i\xc3\xa7"
+    b"in kameran\xc4\xb1n entropisini kullan"
+    b"\xc4\xb1nHam karma imzalan\xc4\xb1yor. Yaln\xc4"
+    b"\xb1zca kayna\xc4\x9fa g\xc3\xbcveniyorsan\xc4\xb1z d"
+    b"evam edin.\xc3\x96ny\xc3\xbcklemede TC Flash"
+    b" HashParolan\xc4\xb1zda ASCII olmayan "
+    b"karakterler alg\xc4\xb1land\xc4\xb1. Krux, d"
+    b"i\xc4\x9fer c\xc3\xbczdanlar\xc4\xb1n ayn\xc4\xb1 anahta"
+    b"r\xc4\xb1 t\xc3\xbcretece\xc4\x9fini garanti edeme"
+    b"z.C\xc3\xbczdan \xc3\xa7\xc4\xb1kt\xc4\xb1 tan\xc4\xb1mlay\xc4\xb1c\xc4"
+    b"\xb1s\xc4\xb1 bulunamad\xc4\xb1.180\xc2\xb0 d\xc3\xb6nd\xc3\xbcrO"
+    b"ndal\xc4\xb1kYakalaman\xc4\xb1n tamamlanmas\xc4"
+    b"\xb1n\xc4\xb1 bekleyinQR Etiketi G\xc3\xbcncell"
+    b"ensin miParlakl\xc4\xb1kBase64 ParolaP"
+    b"iksel sapma indeksi:Devam edilsi"
+    b"n mi?Ge\xc3\xa7ersiz adresC\xc3\xbczdan \xc3\xa7\xc4\xb1"
+    b"kt\xc4\xb1 tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1s\xc4\xb1 y\xc3\xbcklendi"
+    b"!\xc5\x9eifreleme ModuMetinG\xc3\xbc\xc3\xa7l\xc3\xbcZay"
+    b"\xc4\xb1fUyar\xc4\xb1:Siyah bir arka plan y\xc3"
+    b"\xbczeyi kullan\xc4\xb1n.Onalt\xc4\xb1l\xc4\xb1kParla"
+    b"ma \xc3\x96nleyici ModAlParlakl\xc4\xb1\xc4\x9f\xc4\xb1 "
+    b"De\xc4\x9fi\xc5\x9ftirC\xc3\xbczdan de\xc4\x9fi\xc5\x9ftir?Dah"
+    b"a fazla kez denensin mi?13-24 ke"
+    b"limeleri taran\xc4\xb1yorSD kart alg\xc4\xb1"
+    b"lanmad\xc4\xb1.12 kelimeTekrar \xc4\xb0ncele"
+    b"\xc5\x9eifre \xc3\xa7\xc3\xb6z\xc3\xbcls\xc3\xbcn m\xc3\xbc?Yedek Mn"
+    b"emonicFlash Ara\xc3\xa7lar\xc4\xb1G\xc3\xbcncellem"
+    b"e tamamland\xc4\xb1.oNALTILIKTAN(%s bi"
+    b"t/piksel)Konum\xc3\x87\xc3\xb6z\xc3\xbcn\xc3\xbcrl\xc3\xbc\xc4\x9f\xc3\xbc"
+    b" S\xc4\xb1f\xc4\xb1rlaMnemonic Y\xc3\xbckleBo\xc5\x9futf"
+    b"8 'eBaz\xc4\xb1 d\xc3\xbc\xc4\x9f\xc3\xbcmler sertle\xc5\x9fti"
+    b"rilmemi\xc5\x9f:SD karta imzalaID zate"
+    b"n varVarsay\xc4\xb1lan PBKDF2 yineleme"
+    b"sini kullan.?bilinmiyorAyna X Ko"
+    b"ordinatlar\xc4\xb1A\xc4\x9fBIP85 entropisi t"
+    b"\xc3\xbcretilsin mi?Mnemonic depolama "
+    b"ba\xc5\x9far\xc4\xb1s\xc4\xb1zKelimeler\xc5\x9eifrelenmi"
+    b"\xc5\x9f mnemonic depolanmad\xc4\xb1Dokunmat"
+    b"ik ekranKa\xc4\x9f\xc4\xb1t Geni\xc5\x9fli\xc4\x9fiHesap"
+    b"Anahtar%s kar.Test QR'\xc4\xb1n\xc4\xb1 Yazd"
+    b"\xc4\xb1rT\xc3\xbcm depolanm\xc4\xb1\xc5\x9f ve \xc5\x9fifrele"
+    b"nmi\xc5\x9f mnemonic'ler ve ayarlar fl"
+    b"ash'tan kal\xc4\xb1c\xc4\xb1 olarak kald\xc4\xb1r\xc4"
+    b"\xb1ls\xc4\xb1n m\xc4\xb1?Yaz\xc4\xb1c\xc4\xb1 y\xc3\xbckleniyor\xe2"
+    b"\x80\xa6NumaralarQR G\xc3\xb6r\xc3\xbcnt\xc3\xbcleyiciye"
+    b" D\xc3\xb6n\xc4\xb0ptal etmek i\xc3\xa7in PAGE tu\xc5"
+    b"\x9funa bas\xc4\xb1n.Bu adresin, bu c\xc3\xbczd"
+    b"ana ait oldu\xc4\x9funu kontrol et?Yak"
+    b"alama iptal edildiT\xc3\xbcretim YoluY"
+    b"\xc3\xbcklenemediKef \xc5\x9eifreliGiri\xc5\x9fler"
+    b" (%d):BIP39 An\xc4\xb1msat\xc4\xb1c\xc4\xb1Ge\xc3\xa7ers"
+    b"iz Kurcalama Kontrol KoduOrta\xc3\x9cz"
+    b"erine yaz\xc4\xb1ls\xc4\xb1n m\xc4\xb1?Anahtar sa\xc4"
+    b"\x9flanmad\xc4\xb1AdresZar at\xc4\xb1\xc5\x9f da\xc4\x9f\xc4\xb1l"
+    b"\xc4\xb1m\xc4\xb1:EkranFlash'ta SaklaVarsay\xc4"
+    b"\xb1lan\xc4\xb1 Kullan?Dosya ad\xc4\xb1Bu de\xc4\x9fi"
+    b"\xc5\x9fiklikten sonra cihaz\xc4\xb1n\xc4\xb1z\xc4\xb1n "
+    b"ekran\xc4\xb1 \xc3\xa7al\xc4\xb1\xc5\x9fmazsa, 5 saniye "
+    b"sonra \xc3\xb6nceki ayarlarla otomatik"
+    b" olarak yeniden ba\xc5\x9flat\xc4\xb1l\xc4\xb1r.Y\xc3"
+    b"\xbcklensin mi?Kullan\xc4\xb1lan:Yeniden "
+    b"Ba\xc5\x9flatYazd\xc4\xb1r\xc4\xb1ls\xc4\xb1n m\xc4\xb1?(Deney"
+    b"sel)XOR ileBa\xc5\x9fl\xc4\xb1k t\xc3\xbcr\xc3\xbcC\xc3\xbczda"
+    b"n uyu\xc5\x9fmazl\xc4\xb1\xc4\x9f\xc4\xb1:base32 'denC\xc3\xbc"
+    b"zdan parolas\xc4\xb1 eklensin mi veya "
+    b"de\xc4\x9fi\xc5\x9ftirilsin mi?SD Kart\xc4\xb1 Kon"
+    b"trol EtBask\xc4\xb1\xe2\x80\xa6Geri\xc3\x96zel QR Kod"
+    b"uModu de\xc4\x9fi\xc5\x9ftirmek i\xc3\xa7in kayd\xc4\xb1"
+    b"r\xc4\xb1nXOR ba\xc5\x9fka biriyle ge\xc3\xa7erli "
+    b"an\xc4\xb1msat\xc4\xb1c\xc4\xb1? (parola ve tan\xc4\xb1m"
+    b"lay\xc4\xb1c\xc4\xb1 at\xc4\xb1lacak)SD karta kayd"
+    b"edilsin mi?Mnemonic Olu\xc5\x9fturPar\xc3"
+    b"\xa7a BoyutuL\xc3\xbctfen bir c\xc3\xbczdan \xc3\xa7\xc4"
+    b"\xb1kt\xc4\xb1 tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1s\xc4\xb1 y\xc3\xbckleyi"
+    b"n\xc5\x9eifrelenmi\xc5\x9f\xc3\x96zelle\xc5\x9ftirYine d"
+    b"e devam edilsin mi?De\xc4\x9fi\xc5\x9fiklik "
+    b"adresi belirlenemedi.Kullan\xc4\xb1c\xc4\xb1"
+    b" Verilerini SilYeni donan\xc4\xb1m yaz"
+    b"\xc4\xb1l\xc4\xb1m\xc4\xb1 tespit edildi.Kapanma S"
+    b"\xc3\xbcresiSol\xc4\xb0mzal\xc4\xb1 PSBTKal\xc4\xb1nan: "
+    b"Kurcalama kontrol kodu ba\xc5\x9far\xc4\xb1y"
+    b"la ayarland\xc4\xb1kayd\xc4\xb1r\xc4\xb1nDokunma E"
+    b"\xc5\x9fi\xc4\x9fiBIP39 mnemonic'inizin her "
+    b"kelimesini 1'den 2048'e kadar bi"
+    b"r say\xc4\xb1 olarak girin.%s kald\xc4\xb1r\xc4"
+    b"\xb1ls\xc4\xb1n m\xc4\xb1?Kelime Numaralar\xc4\xb1Yol"
+    b" uyu\xc5\x9fmazl\xc4\xb1\xc4\x9f\xc4\xb1Alma adresleri y"
+    b"\xc3\xbckleniyor\xe2\x80\xa6\xc4\xb0\xc5\x9fleniyor\xe2\x80\xa6Kendi"
+    b"ne-transfer:Para \xc3\x9cst\xc3\xbc:Flash Do"
+    b"lduruluyorKrux Yaz\xc4\xb1c\xc4\xb1 Test QR'"
+    b"\xc4\xb1Tamamland\xc4\xb1 m\xc4\xb1?Dosyalar\xc4\xb1 ara"
+    b"?Do\xc4\x9frulan\xc4\xb1yor\xe2\x80\xa6G\xc3\xb6r\xc3\xbcn\xc3\xbcmY\xc3\xbck"
+    b"sek \xc3\xbccret!Kapatmay\xc4\xb1n, tamamlan"
+    b"mas\xc4\xb1 biraz zaman alabilir.Yaz\xc4\xb1"
+    b"c\xc4\xb1 S\xc3\xbcr\xc3\xbcc\xc3\xbcs\xc3\xbc ayarlanmad\xc4\xb1!Mn"
+    b"emonic'leri GizlePar\xc3\xa7a\xc4\xb0mza dos"
+    b"yas\xc4\xb1 eksikBaud H\xc4\xb1z\xc4\xb1SD kartFab"
+    b"rika Ayarlar\xc4\xb1Kullan\xc4\xb1c\xc4\xb1%s de\xc4\x9f"
+    b"eri aral\xc4\xb1k d\xc4\xb1\xc5\x9f\xc4\xb1nda: [%s, %s]"
+    b"1-12 kelimeleri tekrar taran\xc4\xb1yo"
+    b"rPSBT'de parmak izi ayar\xc4\xb1 kald\xc4"
+    b"\xb1r\xc4\xb1ld\xc4\xb1SD kart kontrol ediliyor"
+    b"\xe2\x80\xa6Flash'\xc4\xb1 kameradan gelen entr"
+    b"opi ile doldur?SD karta kaydedil"
+    b"di:BIP39 Parolas\xc4\xb1n\xc4\xb1 TaraBIP39 "
+    b"mnemonic'inizin her kelimesini 1"
+    b"'den 800'e kadar onalt\xc4\xb1l\xc4\xb1k bir"
+    b" say\xc4\xb1 olarak girin.Hay\xc4\xb1rbase64"
+    b" 'eYeterli zar at\xc4\xb1\xc5\x9f\xc4\xb1 yok!Ge\xc3\xa7"
+    b"ersiz mnemonic uzunlu\xc4\x9fuQR Kodu "
+    b"Olu\xc5\x9fturPAGE modunu de\xc4\x9fi\xc5\x9ftirGe"
+    b"\xc3\xa7i\xc5\x9f Ba\xc5\x9f\xc4\xb1na Derinliktabandan4"
+    b"3Adresi Tara%s i\xc3\xa7in kameradan g"
+    b"elen ek entropi gerekliTers \xc3\x87ev"
+    b"irCihaz TestleriMen\xc3\xbcye D\xc3\xb6nKrux"
+    b"'un ge\xc3\xa7erli bir son kelime se\xc3\xa7"
+    b"mesini istiyorsan\xc4\xb1z bo\xc5\x9f b\xc4\xb1rak"
+    b"\xc4\xb1nKamera Arac\xc4\xb1l\xc4\xb1\xc4\x9f\xc4\xb1ylaTX Pin"
+    b"iC\xc3\xbczdan \xc3\xa7\xc4\xb1kt\xc4\xb1 tan\xc4\xb1mlay\xc4\xb1c\xc4\xb1"
+    b"s\xc4\xb1ParolaKendine-transfer veya P"
+    b"ara \xc3\x9cst\xc3\xbc (%d):Uzunluk:\xc4\xb0mzalan"
+    b"s\xc4\xb1n m\xc4\xb1?"
+)
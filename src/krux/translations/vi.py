@@ -19,382 +19,388 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-# pylint: disable=C0301
-translation_array = [
-    "% của số tiền.",
-    "%d của %d đa chữ kí",
-    "%d đến %d",
-    "%s bit",
-    "%s byte",
-    "%s ký tự",
-    "%s Đã bỏ.",
-    "%s: đã tải!",
-    "(%s bit/px)",
-    "(Thực nghiệm)",
-    "(chỉ xem)",
-    "12 từ",
-    "24 từ",
-    "Về chúng tôi",
-    "Tài khoản",
-    "Chỉ mục tài khoản",
-    "Thêm hoặc thay đổi cụm mật khẩu ví?",
-    "Entropy bổ sung từ máy ảnh cần thiết cho %s",
-    "Địa chỉ",
-    "Căn chỉnh camera và tấm dự phòng đúng cách.",
-    "Chế độ chống lóa",
-    "Giao diện",
-    "Bạn có chắc không?",
-    "Màu BGR",
-    "Từ gợi nhớ BIP39",
-    "Trở lại",
-    "Quay lại Menu",
-    "Sao lưu Mnemonic",
-    "Chữ ký xấu",
-    "Mật khẩu Base64",
-    "Tốc độ baud",
-    "Lưới nhị phân",
-    "Đệm viền",
-    "Độ sáng",
-    "Nút",
-    "Loại bỏ nhiễu nút",
-    "Hủy chụp hình",
-    "Thay đổi",
-    "Thay đổi giao diện và khởi động lại?",
-    "Đổi ví?",
-    "Thay đổi:",
-    "Thay đổi sẽ kéo dài cho đến khi tắt máy.",
-    "Kiểm tra thẻ SD",
-    "Kiểm tra địa chỉ đó có thuộc về ví này không?",
-    "Đã kiểm tra %d địa chỉ không khớp.",
-    "Đang kiểm tra thẻ SD…",
-    "Xác nhận mã kiểm tra giả mạo",
-    "Chuyển đổi dữ liệu",
-    "Không thể xác định địa chỉ thay đổi.",
-    "Tạo mã QR",
-    "Tạo mã QR từ văn bản?",
-    "Tạo:",
-    "Mã kiểm tra giả mạo hiện tại",
-    "Mã QR tùy chỉnh",
-    "Văn bản tùy chọn",
-    "Tùy chỉnh",
-    "Tùy chỉnh ví của bạn sẽ tạo một Khóa mới và dỡ bỏ Bộ mô tả.",
-    "Chiều sâu cắt",
-    "Phương pháp cắt",
-    "Công cụ Datum",
-    "Số thập phân",
-    "Giải mã?",
-    "Ví mặc định",
-    "Xóa tập tin này?",
-    "Độ sâu mỗi lần cắt CNC",
-    "Đường dẫn phái sinh",
-    "Suy ra entropy BIP85?",
-    "Địa chỉ người mô tả",
-    "Kiểm tra thiết bị",
-    "Hiển thị",
-    "Không được tắt máy, có thể mất một lúc để hoàn thành.",
-    "Hoàn tất chuyển đổi",
-    "Hoàn tất?",
-    "Từ gợi nhớ kép",
-    "Driver",
-    "Trống",
-    "Kích hoạt?",
-    "Mã hóa",
-    "Đã mã hóa",
-    "Mã QR được mã hóa",
-    "Mnemonic được mã hóa không được lưu trữ với ID:",
-    "Mnemonic được mã hóa không được lưu trữ",
-    "Mã hóa",
-    "Chế độ mã hóa",
-    "Nhập %d từ BIP39.",
-    "Nhập mã kiểm tra giả mạo gồm hơn 6 ký tự",
-    "Nhập từng từ của Mnemonic BIP39 của bạn dưới dạng số từ 1 đến 2048.",
-    "Nhập từng từ trong Mnemonic BIP39 của bạn dưới dạng số thập lục phân từ 1 đến 800.",
-    "Nhập từng từ trong Mnemonic BIP39 của bạn dưới dạng số bát phân từ 1 đến 4000.",
-    "Nhập từng từ của Mnemonic BIP39 của bạn.",
-    "Xóa dữ liệu của người dùng",
-    "Đang xóa dữ liệu của người dùng…",
-    "Lỗi:",
-    "Esc",
-    "Khám phá các tập tin?",
-    "Xuất báo cáo",
-    "Đang xuất %s sang thẻ SD…",
-    "Khóa công cộng",
-    "Cài đặt Gốc",
-    "Không thể thu thập entropy của máy ảnh",
-    "Không thể chuyển đổi",
-    "Không giải mã được",
-    "Tải thất bại",
-    "Không lưu trữ Mnemonic được",
-    "Phí:",
-    "Tốc độ cắt CNC",
-    "Tên tệp",
-    "Tên tệp %s tồn tại trên thẻ SD.",
-    "Điền vào flash với entropy từ máy ảnh?",
-    "Đèn Flash Đổ Đầy",
-    "Bỏ dấu vân tay trong PSBT",
-    "Bản đồ Flash",
-    "Công cụ Flash",
-    "Đèn flash chứa đầy entropy của máy ảnh",
-    "Đường kính mũi cắt CNC",
-    "Khả dụng:",
-    "Từ bộ lưu trữ",
-    "Xóa hoàn toàn thẻ SD trong một thiết bị khác để đảm bảo dữ liệu không thể phục hồi",
-    "Tạo Mnemonic",
-    "Chọn",
-    "Entropy tốt",
-    "Phần cứng",
-    "Loại đầu",
-    "Khóa công cộng Hex:",
-    "Thập lục phân",
-    "Ẩn Mnemonics",
-    "Phí cao!",
-    "ID",
-    "Id đã tồn tại",
-    "Nếu màn hình thiết bị của bạn không hoạt động sau khi thay đổi này, màn hình sẽ tự động khởi động lại với các cài đặt trước đó sau 5 giây.",
-    "Chỉ mục",
-    "Đầu vào (%d):",
-    "Entropy không đủ!",
-    "Mã kiểm tra giả mạo không hợp lệ",
-    "Địa chỉ không hợp lệ",
-    "Đường dẫn phái sinh không hợp lệ",
-    "Độ dài mã Mnemonic không hợp lệ",
-    "Ví không hợp lệ:",
-    "Đảo ngược",
-    "Màu đảo ngược",
-    "Đã mã hóa KEF",
-    "Chìa khóa",
-    "Khóa không được cung cấp",
-    "QR kiểm tra máy in Krux",
-    "Loại LCD",
-    "Ngôn ngữ",
-    "Để trống nếu bạn muốn Krux chọn một từ cuối cùng hợp lệ",
-    "Trái",
-    "Độ dài:",
-    "Độ trễ Dòng",
-    "Đường kẻ:",
-    "danh sách địa chỉ",
-    "Tải mã mnemonic",
-    "Nạp Ví",
-    "Tải mô tả ví đáng tin cậy để xem địa chỉ?",
-    "Tải từ thẻ SD",
-    "Tải từ thẻ SD?",
-    "Tải từ máy ảnh",
-    "Tải?",
-    "Đang tải camera…",
-    "Đang tải địa chỉ thay đổi…",
-    "Đang tải máy in…",
-    "Đang tải địa chỉ nhận…",
-    "Đang tải…",
-    "Ngôn ngữ",
-    "Vị trí lưu",
-    "Trung bình",
-    "Tin nhắn",
-    "Tin nhắn:",
-    "Chi tiết nhỏ",
-    "Tọa độ gương X",
-    "Thiếu tập tin chữ ký",
-    "Mã mnemonic",
-    "Mnemonic XOR",
-    "Từ gợi nhớ và cụm mật khẩu sẽ được lưu giữ.",
-    "Đã sửa đổi:",
-    "Mạng lưới",
-    "Mnemonic mới",
-    "Phát hiện phần sụn mới.",
-    "Không",
-    "Không có cụm mật khẩu",
-    "Các ký tự không phải ASCII đã được phát hiện trong cụm mật khẩu của bạn. Krux không thể đảm bảo rằng các ví khác sẽ lấy được cùng một khóa.",
-    "Không đủ số lần quay!",
-    "Số",
-    "Bát phân",
-    "Các định dạng khác",
-    "Ghi đè?",
-    "PAGE để chuyển đổi độ sáng",
-    "PBKDF2 iter.",
-    "Tô các chấm đục lỗ màu đen để chúng có thể được phát hiện.",
-    "Chiều rộng giấy",
-    "Phần",
-    "Phần M/N",
-    "Kích thước một phần",
-    "Cụm mật khẩu",
-    "Độ dài mật khẩu tối thiểu",
-    "Đường dẫn không khớp",
-    "Đã phát hiện mẫu!",
-    "Xóa vĩnh viễn mọi Mnemonics và cài đặt được mã hóa lưu trữ trong flash?",
-    "Vị trí lưu",
-    "Chỉ số độ lệch điểm ảnh:",
-    "QR dạng văn bản",
-    "Vui lòng tải bộ mô tả đầu ra ví",
-    "Tỷ lệ sụt giảm",
-    "Loại Chính sách",
-    "Entropy kém!",
-    "Công suất",
-    "Nhấn PAGE để hủy.",
-    "PAGE để chuyển chế độ",
-    "In kiểm tra QR",
-    "In Tinyseed?",
-    "In ra QR",
-    "In ra mã QR?",
-    "In?",
-    "Máy in",
-    "Trình điều khiển máy in chưa được cài đặt!",
-    "In ấn…",
-    "Vẫn tiếp tục?",
-    "Thực hiện?",
-    "Đang xử lý…",
-    "Chắc chắn không thể chi tiêu",
-    "Mã QR",
-    "Nhãn QR",
-    "Số lượng",
-    "RX Pin",
-    "Khởi động lại",
-    "Nhận được",
-    "Vùng:",
-    "Xóa %s?",
-    "Xóa Mnemonic",
-    "Xóa các tệp firmware khỏi Thẻ SD?",
-    "Độ phân giải - Định dạng",
-    "Khôi phục cài đặt gốc và khởi động lại?",
-    "Kết quả",
-    "Quay lại Trình xem QR",
-    "Xem lại lần nữa",
-    "Xem lại dữ liệu đã quét, chỉnh sửa nếu cần",
-    "Phải",
-    "Lăn xúc xắc ít nhất %d lần để tạo Mnemonic.",
-    "Phân bổ xúc xắc:",
-    "Tổng số lần quay xúc xắc:",
-    "Xoay Chiều 180º",
-    "Thẻ SD",
-    "Thẻ SD không được phát hiện.",
-    "SHA256 của xúc xắc:",
-    "Sha256 của ảnh chụp:",
-    "Lưu Ảnh QR vào Thẻ SD",
-    "Lưu vào thẻ SD",
-    "Lưu vào thẻ SD?",
-    "Đã lưu vào thẻ SD:",
-    "Tỉ lệ",
-    "Quét địa chỉ",
-    "Quét cụm mật khẩu BIP39",
-    "Quét mã QR khóa",
-    "Đang quét lại từ 1-12",
-    "Đang quét từ 13-24",
-    "Thời gian chế độ bảo vệ màn hình",
-    "Kiểu văn lệnh",
-    "Bảo mật",
-    "Tự chuyển nhượng hoặc giao dịch (%d):",
-    "Tự chuyển nhượng:",
-    "Đặt mã kiểm tra giả mạo trước",
-    "Cài đặt",
-    "Cài đặt được lưu trữ nội bộ trên đèn flash.",
-    "Cài đặt được lưu trên thẻ SD.",
-    "Entropy của Shannon:",
-    "Hiển thị dữ liệu",
-    "Tắt máy",
-    "Thời gian tắt máy",
-    "Đang tắt…",
-    "Chữ kí",
-    "Ký vào mã QR",
-    "Ký vào thẻ SD",
-    "Kí?",
-    "Chữ ký:",
-    "Tin nhắn đã ký",
-    "Đã ký PSBT",
-    "Ký mã băm thô. Chỉ tiến hành nếu bạn tin tưởng nguồn.",
-    "Biển báo…",
-    "Khóa đơn",
-    "Dung lượng:",
-    "Một số kiểm tra không thể được thực hiện.",
-    "Một số nút không được làm cứng:",
-    "Chi tiêu (%d):",
-    "Chi tiêu:",
-    "Chế độ Tiêu chuẩn",
-    "Tĩnh",
-    "Số liệu thống kê cho Mọt sách",
-    "Lưu trữ trên flash",
-    "Lưu trữ trên thẻ SD",
-    "Độ mạnh",
-    "Mạnh",
-    "Vuốt để thay đổi chế độ",
-    "TC Flash Hash",
-    "Hash Flash TC khi khởi động",
-    "Chạm màn hình hoặc nhấn nút ENTER để chụp",
-    "Chạm màn hình hoặc nhấn nút ENTER để cài đặt phần mềm.",
-    "Khóa nội bộ TR",
-    "TX Pin",
-    "Mã kiểm tra giả mạo",
-    "Đã đặt mã kiểm tra giả mạo thành công",
-    "Mã kiểm tra giả mạo không khớp",
-    "Bộ thử nghiệm",
-    "Kết quả bộ thử nghiệm",
-    "Kiểm tra bài cũ:",
-    "Văn bản",
-    "Chủ đề",
-    "Nhiệt",
-    "Sử dụng tính năng Xóa dữ liệu trên thiết bị để đảm bảo dữ liệu không thể phục hồi",
-    "Chuyển đổi độ sáng",
-    "Công cụ",
-    "Ngưỡng cảm ứng",
-    "Màn hình cảm ứng",
-    "Thử thêm nữa?",
-    "Nhập cụm mật khẩu BIP39",
-    "Nhập khóa",
-    "Hoàn tác",
-    "Đơn vị",
-    "Cập nhật ID KEF?",
-    "Cập nhật nhãn QR?",
-    "Nâng cấp hoàn tất.",
-    "Sử dụng bề mặt nền đen.",
-    "Sử dụng sự ngẫu nhiên của máy ảnh để tạo ra một Mnemonic mới",
-    "Giá trị hiện tại",
-    "Sử dụng Chế độ mặc định?",
-    "Sử dụng trình lặp PBKDF2 mặc định.?",
-    "Dùng vân tay làm ID?",
-    "Đã sử dụng:",
-    "Người dùng",
-    "Giá trị %s ngoài phạm vi: [ %s, %s]",
-    "Xác minh…",
-    "Phiên Bản",
-    "Qua máy ảnh",
-    "Qua xúc xắc 20 mặt",
-    "Qua xúc xắc 6 mặt",
-    "Thông qua đầu vào thủ công",
-    "Thông qua từ ngữ",
-    "Nhãn có thể nhìn thấy",
-    "Chờ bắt",
-    "Ví",
-    "Trình mô tả ví",
-    "Ví không khớp:",
-    "Ví đầu ra mô tả",
-    "Đã tải bộ mô tả đầu ra của ví!",
-    "Không tìm thấy bộ mô tả đầu ra ví.",
-    "Cảnh báo:",
-    "Yếu",
-    "Kí tự %d",
-    "Từ số",
-    "Từ ngữ",
-    "Kết quả XOR",
-    "XOR với",
-    "Ghi nhớ hiện tại của XOR với một cụm từ khác? (cụm mật khẩu và mô tả sẽ bị loại bỏ)",
-    "Đúng",
-    "Chế độ thu phóng",
-    "nhị phân:",
-    "trượt",
-    "từ HEX",
-    "từ base32",
-    "từ base43",
-    "từ base64",
-    "từ hex",
-    "từ utf8",
-    "là một địa chỉ hợp lệ!",
-    "trường hợp ca làm việc",
-    "Tỉ lệ thành công:",
-    "vuốt",
-    "văn bản:",
-    "thành HEX",
-    "đến base32",
-    "đến base43",
-    "đến base64",
-    "thành hex",
-    "đến utf8",
-    "không rõ",
-    "kHÔNG TÌM THẤY trong %d địa chỉ đầu tiên",
-]
+# pylint: disable=C0103,C0301
+catalog = (
+    b"q\x01\xb6\x11\x16\x00l\xfa\xa6\x02[\xa8b\x04\xed\x8e:\x06\xe6\x81m\x07\xb6\x8b\xef\x07B{d\x08\xb7\x06"
+    b'\xff\x08\nf\x00\n(\x1f\x16\x0c\xbcI\xdb\r\xbfN\x02\x0epi"\x0e\xff#)\x0e\x88\x1f\xe1\x0ef\x97'
+    b"\xa1\x0f\x8b\xea5\x11\x8arH\x11%\xc4\xc6\x14k\xd8\xe0\x14j\xc7\xd9\x16GG.\x17\x05\xd5R\x17\xeal"
+    b"\xf3\x17}\xca\xe8\x18\x81\xd3*\x19\xbba\xc5\x19\xe0\x94\xdd\x19\x93\xc23\x1ck\xf8<\x1c\xbd\xc3\xd1\x1dk\x96"
+    b'O\x1fhW\xae\x1f\xeat\x9b!\xf2\xb1\x1d"\x00\xb9/#Lj\xa3#\xf4\xb7\xec#k\xd7\xb4$\x13\t'
+    b"\xea$\xf1\xf7(&\xe9~\xaf&`Rp(\xfa\x1c*)\xa8\xdaL)|\xb9\xb7)\x93gx*\xeb\xf5"
+    b'\xea*s\xf1;+"\xd6r+\xf4\x85t-\x80\n\x87-\xe3\x13\xad-J\x9f\xea-\x9d.\x93.\xb80'
+    b"\xc4.uU\x8b/\x7f\x0b\xb5/\x8e\x83\xcf/g\xd4\xb80n\xea\xf30\x12Ec1\x99\x1bi1\xef|"
+    b"73\x14\x15\xe83\xe5\x91o4\x86|\xea4\x1f\xaf\xfd4\xc9\xa3\xaa5\xbd\xca\xd85Z'S6\x02\xcb"
+    b"^6\xd5\x91\xb36\x16\x19\x087\xfc?[7\xd84\xf69\x89\x0fZ:\x81\xa9[;|\x91\xec;\x97\xb7"
+    b"\xed<\x95e7>\x1e\xd1\xfd>\xc0>L?\xfd\x91\x1f@x}=@\x87j\x8dA\x84>\x96A\x05H"
+    b"\xb2A\xed\xf2\xc7Aq@\xf1B\xcc\x14BC\xdf~.D\xba\x16\x8bEhY\x0cF\xae\xc3,F\x11r"
+    b"?F! XF\x90\xb9\xa5F\x1a\xcd\xccF\x1c\n7G\xee\x08nG\x16\xfb\xfbG\x8fbzI30"
+    b"\xc0I\xf9\xd4'Jc\xed\xc8J?\xad&K`D\xd1Kg`\x16MIs\xaaM\x8f\xe6\x15Na\xdc"
+    b"LP\x9b\x94\xe9Q\x12@\x88RJ\xde\xd6S8\xa4\xc0U?\x9c\x05V\x0c\xc8\xb4VB\x9dPW\x9c\x07"
+    b"\x01Xd\xe9\x83X\x87L\x97Y\xe8\xcc&Z\xa0[\xcf\\q\xd7\x08^\t\x84]^\x08i2_\x1c;"
+    b'\xa3b[\xb9\xdab*\xfe\x13c\xb9\x993cd\n\xfdcY"\xa2d\x8d?\xf2dy\x96\x1de\x9d\x9e'
+    b"\x8de2\x8e\x00f\xc5\x1b\x18f`t\x85fY\xcftg\xcd8\xd1g\xed\xd1\njM\x865j\xa4."
+    b"Kj\x13]\xd1j\x0bT\xa6k\xe8{}l\x94\xbc\xd4l0\x11\xe0m?\xfb*n]\x8eRn\x08{"
+    b"Xo\xb9m\x87o\xde\xd6\xcfom\x14@p_\xea\xa1p\xc3\x99\xd8p\xa8\x93)q\x8dirs0\x13"
+    b"\x16t\x8b\xf3 t\xe7\r5t\xe8\xda\xcat\x10Z\x0bu\xd9\xd4\x84v9\xab\xf4wYQ_xZ\x9b"
+    b"\xf9x\xe3\t\x00y\x08\xc8#yw\xde|yq\xdf\xfcy4\xd9\xe0z\xac\x11e{)\x97\xc4{m\xa3"
+    b"\x89|\x9f\x8a\x9b|\xdeG\xa7}?\x0e\xf2\x80\x00\x1ei\x81\xa6Z\xc0\x81u\xc6W\x82\x0c\x11r\x85\xa2\xcb"
+    b"6\x86j\x8f~\x86\x80\xb1\x83\x86\xffY\x98\x86\xbe\xf6W\x87\x13-l\x87\xc3\x10\xfb\x87\xbc\x93\xb9\x88\xdf\xde"
+    b"\xe9\x88\xf2\xaf\x9f\x8a\xb6\xd1\x9f\x8a)\xbcE\x8b\x7f\x00\xc2\x8b*\xbc\xe1\x8ca\x90\x04\x8d\x89Q;\x8d\xdd\x8e"
+    b"2\x8f\xbf\xc3D\x90\x95\x8e}\x91\x0f$\x83\x93D\xa7\xff\x94\xb1\x8b#\x95\x0f\x8a@\x95\x1flE\x95n7"
+    b"#\x963\xd5+\x96Rv\x13\x99J\xc7\xaa\x99\xdb\xd0\xd0\x99&\x1f\x1d\x9a\x03 5\x9a\xa2]\xb1\x9aO?"
+    b"\x11\x9b\xf9\x08\xb9\x9b-\xcb\x9f\x9d\xfa\x03\x04\x9fp}?\x9f\xd0\x8bp\x9fw+i\xa0D\xde\x87\xa0\xad\x08"
+    b"\xce\xa0y\xe5\xf1\xa0\x9a\xfe\x03\xa1\xbfX\xe0\xa2.\xc5\x1b\xa3\x12\xe1\x1b\xa3V\xd4J\xa3\x0f<\xab\xa3\xee\xa8"
+    b"\xfa\xa3\xaa\x0cJ\xa4\xf0\x84\x8a\xa5\xf8\xe2\x19\xa6\xe4\xa8T\xa6V3y\xa6\x9d\xeb\xe8\xa7\xc3\xc2\xec\xa7\x18\xde"
+    b" \xa8\xc0\x12\x06\xa9P]\x94\xa9\x1ei\xa7\xaaX\xcb\xa8\xabNw\xa9\xabO\xd9\xfb\xac\xc7\xa7&\xadY\xb5"
+    b"'\xaf \xbe9\xaf\xc0ZG\xaf\x0e\xa2\x9a\xaf\x881\xbc\xb0\x12s\xf0\xb0d\xa3\x8b\xb1\x8e7\x16\xb28o"
+    b"\x8b\xb2I\xed\xdd\xb2O4\x88\xb3\xdd\xe6\x05\xb5\xfd\xe52\xb5\xfb\x95\x9d\xb5e\xf3#\xb8\xae\x87>\xb8]\x1f"
+    b"\x92\xb9\x07\x86\xf0\xb9\x163\r\xbbS;\xc3\xbeE\xb4\xa1\xbfh\xae\xd0\xbf\xb4\xbb?\xc1z\xa1\x92\xc1\xc3\xd2"
+    b"\xa4\xc1\x81@\xdf\xc1\xd5\xa5q\xc2;b\x95\xc2\x1dV\xf3\xc2\xa5V\xf8\xc2?Kl\xc3\xcc\xd3\xe8\xc4\xe8\x95"
+    b"5\xc53\x8b}\xc5\xa4]U\xc6\x89\x87\x86\xc6\x0e\xc6\xda\xc6\xba\x81\xff\xc6\x97\xd5\x0c\xc7dW\x97\xc7^&"
+    b'\xc3\xc8B\xb6\xb7\xc9T\x8e<\xcb\x14\xb8\x97\xcc"^\x06\xcd\x92%)\xcd\x7f\x8a[\xcd\tn\xfc\xcd\x16i'
+    b"g\xd1\xe7\xa7z\xd1\xad\xf3\xd5\xd1\x83\x1d\x82\xd2\xed\xad\x89\xd3d\x00)\xd4v\x16L\xd4Z8a\xd4\xd0\xc2"
+    b"\x89\xd5\xbf\n\xb5\xd5k\x1b+\xd6\x92\xba\x11\xd8\\\x9d\x19\xd8O4\xa9\xd8\xcb\xf9\xeb\xd9VHU\xda\xbc]"
+    b"\xde\xda\x03Y\xf1\xda\x89^O\xdb\xa9\xe9Y\xdb0\x00\xa0\xdbn*\xa1\xdc\x99w@\xdeRI\xe6\xdeR\xdc"
+    b"\x10\xdf\xe9G<\xdf\xc23~\xdfg\xe9\x80\xdf\xdc\xdf\xb4\xdf\x95x\x9d\xe0]\xcb\xc3\xe2\x95w\xa3\xe44\xba"
+    b"\xb1\xe4WV\xca\xe4;\x9f@\xe5@\x81\xee\xe5\xb7\x00\x11\xe7I\xd0/\xe8\x87\xc4\xab\xe8\x95\x8f\xae\xe8\xf8\xdf"
+    b"=\xe9\x13!%\xear\xf0\xae\xea\xe5\x0c\t\xed\xe0\xdfT\xed/xy\xed/9\x9a\xee\x1c\x8a\xcb\xeej\xe8"
+    b"\xcf\xee\xb5a\x1f\xefb\xabC\xef\x0e\xc4\xaf\xf0\x95)\xb0\xf0\x974-\xf1\xbd\x0c.\xf2)\x9e`\xf31\xd9"
+    b"\xee\xf3\xfa\x95\xfc\xf3\xdc\x97\x06\xf4\tdW\xf4\x8e\xb9\x87\xf4E\x1e\xd1\xf4\xe7`k\xf5\x06\xe8\xa1\xf5\xf1k"
+    b"\xbe\xf5\xd1Wa\xf7\xa6Hp\xf7\xe8\xe3'\xf9\xafz\xce\xf9D0I\xfc\xb3`P\xfd^\xee\xa0\xfd\x9d\xa0"
+    b"\xdd\xfe>L?\xff\x00\x00\x00\x00f\x00\x00\x00\x96\x00\x00\x00\xa4\x00\x00\x00\xb9\x00\x00\x00\xcb\x00\x00\x00\xd8\x00"
+    b"\x00\x00\xe6\x00\x00\x00\xee\x00\x00\x00\x0b\x01\x00\x00\x15\x01\x00\x00)\x01\x00\x009\x01\x00\x00L\x01\x00\x00b\x01"
+    b"\x00\x00r\x01\x00\x00w\x01\x00\x00\x82\x01\x00\x00\x94\x01\x00\x00\x9f\x01\x00\x00\xa7\x01\x00\x00\xc1\x01\x00\x00\xf6\x01"
+    b"\x00\x00\x0f\x02\x00\x00.\x02\x00\x004\x02\x00\x00Z\x02\x00\x00|\x02\x00\x00\xa1\x02\x00\x00\xac\x02\x00\x00\xbf\x02"
+    b"\x00\x00\xd7\x02\x00\x00\xed\x02\x00\x00!\x03\x00\x00^\x03\x00\x00z\x03\x00\x00\x9c\x03\x00\x00\xb0\x03\x00\x00\xb6\x03"
+    b"\x00\x00\xcd\x03\x00\x00\xe3\x03\x00\x00\xf7\x03\x00\x00\x0c\x04\x00\x00\x12\x04\x00\x00'\x04\x00\x00G\x04\x00\x00b\x04"
+    b"\x00\x00\x8b\x04\x00\x00\xa4\x04\x00\x00\xae\x04\x00\x00\x04\x05\x00\x00\x0f\x05\x00\x00\x18\x05\x00\x00#\x05\x00\x00\\\x05"
+    b"\x00\x00j\x05\x00\x00\x80\x05\x00\x00\x8b\x05\x00\x00\xd5\x05\x00\x00\xe1\x05\x00\x00\xfb\x05\x00\x00\x03\x06\x00\x00\x14\x06"
+    b"\x00\x00!\x06\x00\x00J\x06\x00\x00v\x06\x00\x00\x8a\x06\x00\x00\xb0\x06\x00\x00\xb6\x06\x00\x00\xed\x06\x00\x00\xfc\x06"
+    b"\x00\x00\x06\x07\x00\x00%\x07\x00\x00C\x07\x00\x00U\x07\x00\x00b\x07\x00\x00s\x07\x00\x00\x80\x07\x00\x00\xd3\x07"
+    b"\x00\x00\xdc\x07\x00\x00\xe7\x07\x00\x00\xff\x07\x00\x00\x17\x08\x00\x00 \x08\x00\x009\x08\x00\x00F\x08\x00\x00Q\x08"
+    b"\x00\x00_\x08\x00\x00j\x08\x00\x00\x7f\x08\x00\x00\x86\x08\x00\x00\x90\x08\x00\x00\xa7\x08\x00\x00\xbf\x08\x00\x00\xc7\x08"
+    b"\x00\x00\xd2\x08\x00\x00\xdf\x08\x00\x00\xe6\x08\x00\x00\xff\x08\x00\x00-\t\x00\x009\t\x00\x00F\t\x00\x00Q\t"
+    b"\x00\x00x\t\x00\x00\x8a\t\x00\x00\xa2\t\x00\x00\xb9\t\x00\x00\xc3\t\x00\x00\xd4\t\x00\x00\xde\t\x00\x00\xe4\t"
+    b"\x00\x00\xeb\t\x00\x00\x12\n\x00\x00&\n\x00\x00X\n\x00\x00v\n\x00\x00\x8a\n\x00\x00\xcb\n\x00\x00\xd6\n"
+    b"\x00\x00\xf1\n\x00\x00\xfe\n\x00\x00\t\x0b\x00\x00\x15\x0b\x00\x00\x1f\x0b\x00\x00H\x0b\x00\x00R\x0b\x00\x00\x83\x0b"
+    b"\x00\x00\x90\x0b\x00\x00\xa7\x0b\x00\x00\xad\x0b\x00\x00\xe8\x0b\x00\x00\x03\x0c\x00\x00\x10\x0c\x00\x00\x1c\x0c\x00\x00@\x0c"
+    b"\x00\x00O\x0c\x00\x00c\x0c\x00\x00u\x0c\x00\x00\x93\x0c\x00\x00\xa0\x0c\x00\x00\xad\x0c\x00\x00\xc3\x0c\x00\x00\xd6\x0c"
+    b"\x00\x00\x04\r\x00\x00\x10\r\x00\x00'\r\x00\x00N\r\x00\x00v\r\x00\x00\x80\r\x00\x00\x98\r\x00\x00\x9e\r"
+    b"\x00\x00\xdd\r\x00\x00\xe5\r\x00\x00V\x0e\x00\x00\x8b\x0e\x00\x00\x9b\x0e\x00\x00\xa7\x0e\x00\x00\xbb\x0e\x00\x00\xf2\x0e"
+    b"\x00\x00\x07\x0f\x00\x00\x1c\x0f\x00\x00(\x0f\x00\x008\x0f\x00\x00N\x0f\x00\x00T\x0f\x00\x00g\x0f\x00\x00|\x0f"
+    b"\x00\x00\x8a\x0f\x00\x00\xb7\x0f\x00\x00\xc1\x0f\x00\x00\xc8\x0f\x00\x00\xe0\x0f\x00\x00\xf3\x0f\x00\x00\xff\x0f\x00\x00\x1b\x10"
+    b"\x00\x00\x1e\x10\x00\x00(\x10\x00\x007\x10\x00\x00G\x10\x00\x00Y\x10\x00\x00{\x10\x00\x00\x8a\x10\x00\x00\xb4\x10"
+    b"\x00\x00\xbc\x10\x00\x00\xca\x10\x00\x00\x05\x11\x00\x00\x14\x11\x00\x00\x88\x11\x00\x00\x9b\x11\x00\x00\xa0\x11\x00\x00\xab\x11"
+    b"\x00\x00\xba\x11\x00\x00\xcd\x11\x00\x00\xea\x11\x00\x00!\x12\x00\x00;\x12\x00\x00u\x12\x00\x00y\x12\x00\x00\xb1\x12"
+    b"\x00\x00\xba\x12\x00\x00\r\x13\x00\x00T\x13\x00\x00t\x13\x00\x002\x14\x00\x00a\x14\x00\x00s\x14\x00\x00\x84\x14"
+    b"\x00\x00\x8f\x14\x00\x00\xa5\x14\x00\x00\xb0\x14\x00\x00\xc3\x14\x00\x00\xe9\x14\x00\x00\xf7\x14\x00\x00\x15\x15\x00\x00B\x15"
+    b"\x00\x00L\x15\x00\x00`\x15\x00\x00j\x15\x00\x00p\x15\x00\x00u\x15\x00\x00\x81\x15\x00\x00\xa3\x15\x00\x00\xb5\x15"
+    b"\x00\x00\xcd\x15\x00\x00\xdc\x15\x00\x00\xf7\x15\x00\x00\x02\x16\x00\x00\x14\x16\x00\x00*\x16\x00\x00P\x16\x00\x00W\x16"
+    b"\x00\x00l\x16\x00\x00w\x16\x00\x00\x88\x16\x00\x00\x98\x16\x00\x00\xb0\x16\x00\x00\xb8\x16\x00\x00\xc3\x16\x00\x00\xd1\x16"
+    b"\x00\x00\xf4\x16\x00\x00\x06\x17\x00\x00\r\x17\x00\x00\x18\x17\x00\x00D\x17\x00\x00U\x17\x00\x00h\x17\x00\x00\x97\x17"
+    b"\x00\x00\xa1\x17\x00\x00\xb6\x17\x00\x00\xc4\x17\x00\x00\xd9\x17\x00\x00\xfc\x17\x00\x00\x06\x18\x00\x00;\x18\x00\x00Q\x18"
+    b"\x00\x00f\x18\x00\x00r\x18\x00\x00}\x18\x00\x00\x88\x18\x00\x00\x98\x18\x00\x00\xf3\x18\x00\x00\t\x19\x00\x00\r\x19"
+    b"\x00\x00%\x19\x00\x00=\x19\x00\x00{\x19\x00\x00\x8d\x19\x00\x00\xa7\x19\x00\x00\xb9\x19\x00\x00\xca\x19\x00\x00\xdb\x19"
+    b"\x00\x00\xf1\x19\x00\x00\x1d\x1a\x00\x00(\x1a\x00\x001\x1a\x00\x00Q\x1a\x00\x00]\x1a\x00\x00s\x1a\x00\x00\x7f\x1a"
+    b"\x00\x00\x95\x1a\x00\x00\xbb\x1a\x00\x00\xc5\x1a\x00\x00\x82\x1b\x00\x00\x88\x1b\x00\x00\x99\x1b\x00\x00\xad\x1b\x00\x00\xb0\x1b"
+    b"\x00\x00\xc1\x1b\x00\x00\xca\x1b\x00\x00\xd7\x1b\x00\x00\xe9\x1b\x00\x00\xf4\x1b\x00\x00$\x1c\x00\x007\x1c\x00\x00A\x1c"
+    b"\x00\x00L\x1c\x00\x00_\x1c\x00\x00\x83\x1c\x00\x00\xf9\x1c\x00\x00\x0c\x1d\x00\x00\x1a\x1d\x00\x005\x1d\x00\x00`\x1d"
+    b"\x00\x00w\x1d\x00\x00\x84\x1d\x00\x00\x90\x1d\x00\x00\xa3\x1d\x00\x00\xd6\x1d\x00\x00\xfb\x1d\x00\x00\x1b\x1e\x00\x001\x1e"
+    b"\x00\x006\x1e\x00\x00C\x1e\x00\x00K\x1e\x00\x00~\x1e\x00\x00\x84\x1e\x00\x00\x99\x1e\x00\x00\xad\x1e\x00\x00\x08\x1f"
+    b"\x00\x00\x10\x1f\x00\x00\x19\x1f\x00\x006\x1f\x00\x00X\x1f\x00\x00i\x1f\x00\x00\x81\x1f\x00\x00\x8d\x1f\x00\x00\xa5\x1f"
+    b"\x00\x00\xbf\x1f\x00\x00\xcb\x1f\x00\x00\xe5\x1f\x00\x00\xf1\x1f\x00\x00\xfc\x1f\x00\x00\x05 \x00\x00O \x00\x00\x89 "
+    b"\x00\x00\x97 \x00\x00\x9d \x00\x00\xb8 \x00\x00\xc8 \x00\x00\xd0 \x00\x00\xe1 \x00\x00\xef \x00\x00\x18!"
+    b'\x00\x003!\x00\x00Q!\x00\x00m!\x00\x00\x9e!\x00\x00\xb6!\x00\x00\xd4!\x00\x00A"\x00\x00G"'
+    b'\x00\x00T"\x00\x00q"\x00\x00\x9a"\x00\x00\xa6"\x00\x00\xc5"\x00\x00\xe5"\x00\x00\xf0"\x00\x00\x02#'
+    b"\x00\x008#\x00\x00G#\x00\x00^#\x00\x00m#\x00\x00\xbc#\x00\x00\xca#\x00\x00\xe0#\x00\x00\xf2#"
+    b'\x00\x00"$\x00\x00-$\x00\x001$\x00\x00Nh\xe1\xba\xadp t\xe1\xbb\xabng t\xe1\xbb\xab'
+    b" trong Mnemonic BIP39 c\xe1\xbb\xa7a b\xe1\xba\xa1"
+    b"n d\xc6\xb0\xe1\xbb\x9bi d\xe1\xba\xa1ng s\xe1\xbb\x91 b\xc3\xa1t ph\xc3\xa2n"
+    b" t\xe1\xbb\xab 1 \xc4\x91\xe1\xba\xbfn 4000.Kh\xc3\xb4ng th\xe1\xbb\x83"
+    b" thu th\xe1\xba\xadp entropy c\xe1\xbb\xa7a m\xc3\xa1y \xe1"
+    b"\xba\xa3nhMnemonic m\xe1\xbb\x9biT\xe1\xbb\x91c \xc4\x91\xe1\xbb\x99 c\xe1"
+    b"\xba\xaft CNCChi\xe1\xbb\x81u s\xc3\xa2u c\xe1\xba\xaftPh\xe1\xba\xa7n "
+    b"c\xe1\xbb\xa9ngV\xe1\xbb\x8b tr\xc3\xad l\xc6\xb0uIn ra QRT\xe1\xba\xa1"
+    b"o m\xc3\xa3 QR t\xe1\xbb\xab v\xc4\x83n b\xe1\xba\xa3n?th\xc3\xa0nh "
+    b"HEX% c\xe1\xbb\xa7a s\xe1\xbb\x91 ti\xe1\xbb\x81n.Chi ti\xe1\xba\xbf"
+    b"t nh\xe1\xbb\x8fT\xe1\xba\xa3i t\xe1\xbb\xab th\xe1\xba\xbb SDV\xc3\xad kh"
+    b"\xc3\xb4ng h\xe1\xbb\xa3p l\xe1\xbb\x87:\xc4\x90o hi\xe1\xbb\x87u n\xc4\x83ng"
+    b"Ph\xc3\xad:v\xc4\x83n b\xe1\xba\xa3n:Ki\xe1\xbb\x83u v\xc4\x83n l\xe1\xbb\x87"
+    b"nhK\xe1\xba\xbft qu\xe1\xba\xa3M\xc3\xa3 h\xc3\xb3aKh\xc3\xb4ng gi\xe1\xba"
+    b"\xa3i m\xc3\xa3 \xc4\x91\xc6\xb0\xe1\xbb\xa3cThay \xc4\x91\xe1\xbb\x95i s\xe1\xba\xbd "
+    b"k\xc3\xa9o d\xc3\xa0i cho \xc4\x91\xe1\xba\xbfn khi t\xe1\xba\xaft m"
+    b"\xc3\xa1y.C\xc3\xa1c \xc4\x91\xe1\xbb\x8bnh d\xe1\xba\xa1ng kh\xc3\xa1cNh\xe1"
+    b"\xba\xadp c\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1\xba\xa9u BIP39%s b"
+    b"itX\xc3\xa1c nh\xe1\xba\xadn m\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1"
+    b"\xba\xa3 m\xe1\xba\xa1oT\xe1\xbb\x95ng s\xe1\xbb\x91 l\xe1\xba\xa7n quay x"
+    b"\xc3\xbac x\xe1\xba\xafc:\xc4\x90\xe1\xbb\x99 d\xc3\xa0i m\xe1\xba\xadt kh\xe1\xba\xa9"
+    b"u t\xe1\xbb\x91i thi\xe1\xbb\x83uC\xc3\xa0i \xc4\x91\xe1\xba\xb7tLo\xe1\xba\xa1i"
+    b" Ch\xc3\xadnh s\xc3\xa1ch\xc4\x90\xc3\xa3 ph\xc3\xa1t hi\xe1\xbb\x87n m"
+    b"\xe1\xba\xabu!Qua x\xc3\xbac x\xe1\xba\xafc 6 m\xe1\xba\xb7tNh\xe1\xba\xad"
+    b"p t\xe1\xbb\xabng t\xe1\xbb\xab c\xe1\xbb\xa7a Mnemonic BIP"
+    b"39 c\xe1\xbb\xa7a b\xe1\xba\xa1n.C\xc3\xa0i \xc4\x91\xe1\xba\xb7t \xc4\x91\xc6\xb0\xe1"
+    b"\xbb\xa3c l\xc6\xb0u tr\xe1\xbb\xaf n\xe1\xbb\x99i b\xe1\xbb\x99 tr\xc3\xaan "
+    b"\xc4\x91\xc3\xa8n flash.Kh\xc3\xb4ng th\xe1\xbb\x83 chuy\xe1\xbb\x83"
+    b"n \xc4\x91\xe1\xbb\x95iTh\xc3\xb4ng qua \xc4\x91\xe1\xba\xa7u v\xc3\xa0o t"
+    b"h\xe1\xbb\xa7 c\xc3\xb4ngPh\xc6\xb0\xc6\xa1ng ph\xc3\xa1p c\xe1\xba\xaftCh"
+    b"\xe1\xbb\x8dnT\xe1\xbb\x89 l\xe1\xbb\x87 th\xc3\xa0nh c\xc3\xb4ng:Ch\xe1\xba\xbf"
+    b" \xc4\x91\xe1\xbb\x99 thu ph\xc3\xb3ngM\xc3\xa0u \xc4\x91\xe1\xba\xa3o ng\xc6"
+    b"\xb0\xe1\xbb\xa3cEntropy kh\xc3\xb4ng \xc4\x91\xe1\xbb\xa7!T\xe1\xba\xa1o:"
+    b"T\xe1\xbb\xab g\xe1\xbb\xa3i nh\xe1\xbb\x9b k\xc3\xa9p\xc4\x90ang xu\xe1\xba\xa5"
+    b"t %s sang th\xe1\xba\xbb SD\xe2\x80\xa6L\xc6\xb0u \xe1\xba\xa2nh "
+    b"QR v\xc3\xa0o Th\xe1\xba\xbb SDC\xc3\xa0i \xc4\x91\xe1\xba\xb7t \xc4\x91\xc6\xb0"
+    b"\xe1\xbb\xa3c l\xc6\xb0u tr\xc3\xaan th\xe1\xba\xbb SD.L\xc6\xb0u tr"
+    b"\xe1\xbb\xaf tr\xc3\xaan th\xe1\xba\xbb SDC\xc3\xb4ng c\xe1\xbb\xa5T\xc3\xb9y"
+    b" ch\xe1\xbb\x89nh v\xc3\xad c\xe1\xbb\xa7a b\xe1\xba\xa1n s\xe1\xba\xbd t\xe1"
+    b"\xba\xa1o m\xe1\xbb\x99t Kh\xc3\xb3a m\xe1\xbb\x9bi v\xc3\xa0 d\xe1\xbb\xa1 b"
+    b"\xe1\xbb\x8f B\xe1\xbb\x99 m\xc3\xb4 t\xe1\xba\xa3.Tin nh\xe1\xba\xafn:T\xe1\xbb"
+    b"\x89 l\xe1\xbb\x87Ng\xc3\xb4n ng\xe1\xbb\xafL\xc4\x83n x\xc3\xbac x\xe1\xba\xafc"
+    b" \xc3\xadt nh\xe1\xba\xa5t %d l\xe1\xba\xa7n \xc4\x91\xe1\xbb\x83 t\xe1\xba\xa1o"
+    b" Mnemonic.\xc4\x90ang t\xe1\xba\xaft\xe2\x80\xa6T\xe1\xbb\xb7 l\xe1\xbb"
+    b"\x87 s\xe1\xbb\xa5t gi\xe1\xba\xa3mK\xc3\xad t\xe1\xbb\xb1 %dCh\xe1\xba\xa1m "
+    b"m\xc3\xa0n h\xc3\xacnh ho\xe1\xba\xb7c nh\xe1\xba\xa5n n\xc3\xbat EN"
+    b"TER \xc4\x91\xe1\xbb\x83 c\xc3\xa0i \xc4\x91\xe1\xba\xb7t ph\xe1\xba\xa7n m\xe1\xbb"
+    b"\x81m.\xc4\x90\xe1\xbb\x99 m\xe1\xba\xa1nhSha256 c\xe1\xbb\xa7a \xe1\xba\xa3n"
+    b"h ch\xe1\xbb\xa5p:t\xe1\xbb\xab hexB\xe1\xba\xa3n \xc4\x91\xe1\xbb\x93 Fla"
+    b"shIn ra m\xc3\xa3 QR?T\xc3\xaan t\xe1\xbb\x87p %s t\xe1\xbb"
+    b"\x93n t\xe1\xba\xa1i tr\xc3\xaan th\xe1\xba\xbb SD.\xc4\x90\xc6\xb0\xe1\xbb\x9dn"
+    b"g d\xe1\xba\xabn ph\xc3\xa1i sinh kh\xc3\xb4ng h\xe1\xbb\xa3p "
+    b"l\xe1\xbb\x87T\xe1\xba\xa3i t\xe1\xbb\xab th\xe1\xba\xbb SD?PAGE \xc4\x91\xe1"
+    b"\xbb\x83 chuy\xe1\xbb\x83n \xc4\x91\xe1\xbb\x95i \xc4\x91\xe1\xbb\x99 s\xc3\xa1ngL\xe1"
+    b"\xbb\x97i:C\xc4\x83n ch\xe1\xbb\x89nh camera v\xc3\xa0 t\xe1\xba\xa5"
+    b"m d\xe1\xbb\xb1 ph\xc3\xb2ng \xc4\x91\xc3\xbang c\xc3\xa1ch.K\xe1\xba\xbft"
+    b" qu\xe1\xba\xa3 XORLo\xe1\xba\xa1i LCDK\xe1\xba\xbft qu\xe1\xba\xa3 "
+    b"b\xe1\xbb\x99 th\xe1\xbb\xad nghi\xe1\xbb\x87mtr\xc6\xb0\xe1\xbb\x9dng h\xe1\xbb"
+    b"\xa3p ca l\xc3\xa0m vi\xe1\xbb\x87cQu\xc3\xa9t m\xc3\xa3 QR kh"
+    b"\xc3\xb3a\xc4\x90\xe1\xbb\x87m vi\xe1\xbb\x81n\xc4\x90\xe1\xbb\x99 tr\xe1\xbb\x85 D\xc3\xb2n"
+    b"gEntropy k\xc3\xa9m!T\xc3\xb4 c\xc3\xa1c ch\xe1\xba\xa5m \xc4\x91"
+    b"\xe1\xbb\xa5c l\xe1\xbb\x97 m\xc3\xa0u \xc4\x91en \xc4\x91\xe1\xbb\x83 ch\xc3\xbang"
+    b" c\xc3\xb3 th\xe1\xbb\x83 \xc4\x91\xc6\xb0\xe1\xbb\xa3c ph\xc3\xa1t hi\xe1\xbb\x87n"
+    b".t\xe1\xbb\xab utf8B\xe1\xba\xa3o m\xe1\xba\xadtCh\xe1\xbb\x89 m\xe1\xbb\xa5c"
+    b" t\xc3\xa0i kho\xe1\xba\xa3nB\xe1\xba\xa1n c\xc3\xb3 ch\xe1\xba\xafc kh"
+    b"\xc3\xb4ng?Ch\xe1\xbb\xaf k\xc3\xadCh\xe1\xba\xbf \xc4\x91\xe1\xbb\x99 Ti\xc3\xaau "
+    b"chu\xe1\xba\xa9nKh\xe1\xba\xa3 d\xe1\xbb\xa5ng:(ch\xe1\xbb\x89 xem)B"
+    b"i\xe1\xbb\x83n b\xc3\xa1o\xe2\x80\xa6Ch\xe1\xbb\x89 m\xe1\xbb\xa5c\xc4\x90ang t\xe1"
+    b"\xba\xa3i camera\xe2\x80\xa6M\xc3\xa1y inHo\xc3\xa0n t\xc3\xa1cD\xc3"
+    b"\xb9ng v\xc3\xa2n tay l\xc3\xa0m ID?SHA256 c\xe1\xbb\xa7"
+    b"a x\xc3\xbac x\xe1\xba\xafc:Nh\xc3\xa3n QRNg\xc3\xb4n ng\xe1\xbb\xaf"
+    b"%s \xc4\x90\xc3\xa3 b\xe1\xbb\x8f.Nhi\xe1\xbb\x87t%d c\xe1\xbb\xa7a %d "
+    b"\xc4\x91a ch\xe1\xbb\xaf k\xc3\xad\xc4\x90\xc3\xa3 ki\xe1\xbb\x83m tra %d "
+    b"\xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 kh\xc3\xb4ng kh\xe1\xbb\x9bp.In Ti"
+    b"nyseed?Entropy t\xe1\xbb\x91tThay \xc4\x91\xe1\xbb\x95iS"
+    b"\xe1\xbb\x91 li\xe1\xbb\x87u th\xe1\xbb\x91ng k\xc3\xaa cho M\xe1\xbb\x8dt"
+    b" s\xc3\xa1ch\xc4\x90\xc3\xa3 s\xe1\xbb\xada \xc4\x91\xe1\xbb\x95i:M\xc3\xa3 QR \xc4"
+    b"\x91\xc6\xb0\xe1\xbb\xa3c m\xc3\xa3 h\xc3\xb3aQua x\xc3\xbac x\xe1\xba\xafc 2"
+    b"0 m\xe1\xba\xb7tChi ti\xc3\xaau:V\xc3\xad m\xe1\xba\xb7c \xc4\x91\xe1\xbb\x8b"
+    b"nhPh\xe1\xba\xa7n M/N\xc4\x90\xc3\xbang24 t\xe1\xbb\xabM\xc3\xa3 ki\xe1"
+    b"\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o hi\xe1\xbb\x87n t\xe1\xba\xa1i"
+    b"C\xe1\xba\xadp nh\xe1\xba\xadt ID KEF?\xc4\x90\xc3\xa8n flash "
+    b"ch\xe1\xbb\xa9a \xc4\x91\xe1\xba\xa7y entropy c\xe1\xbb\xa7a m\xc3\xa1y"
+    b" \xe1\xba\xa3nh\xc4\x90\xc6\xb0\xe1\xbb\x9dng k\xc3\xadnh m\xc5\xa9i c\xe1\xba\xaft"
+    b" CNCX\xc3\xb3a t\xe1\xba\xadp tin n\xc3\xa0y?T\xe1\xbb\xab g\xe1\xbb"
+    b"\xa3i nh\xe1\xbb\x9b v\xc3\xa0 c\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1\xba\xa9u "
+    b"s\xe1\xba\xbd \xc4\x91\xc6\xb0\xe1\xbb\xa3c l\xc6\xb0u gi\xe1\xbb\xaf.Ch\xe1\xbb\xa7 \xc4"
+    b"\x91\xe1\xbb\x81Chuy\xe1\xbb\x83n \xc4\x91\xe1\xbb\x95i d\xe1\xbb\xaf li\xe1\xbb\x87uX"
+    b"\xc3\xb3a Mnemonict\xe1\xbb\xab base64%d \xc4\x91\xe1\xba\xbfn"
+    b" %dCh\xe1\xbb\xaf k\xc3\xbd:X\xc3\xb3a c\xc3\xa1c t\xe1\xbb\x87p fir"
+    b"mware kh\xe1\xbb\x8fi Th\xe1\xba\xbb SD?B\xc3\xa1t ph\xc3\xa2n"
+    b"Thay \xc4\x91\xe1\xbb\x95i giao di\xe1\xbb\x87n v\xc3\xa0 kh\xe1\xbb"
+    b"\x9fi \xc4\x91\xe1\xbb\x99ng l\xe1\xba\xa1i?\xc4\x91\xe1\xba\xbfn base43Gi"
+    b"\xc3\xa1 tr\xe1\xbb\x8b hi\xe1\xbb\x87n t\xe1\xba\xa1iV\xc3\xb9ng:Xem l"
+    b"\xe1\xba\xa1i d\xe1\xbb\xaf li\xe1\xbb\x87u \xc4\x91\xc3\xa3 qu\xc3\xa9t, ch\xe1"
+    b"\xbb\x89nh s\xe1\xbb\xada n\xe1\xba\xbfu c\xe1\xba\xa7nHo\xc3\xa0n t\xe1\xba\xa5"
+    b"t chuy\xe1\xbb\x83n \xc4\x91\xe1\xbb\x95iK\xc3\xadch ho\xe1\xba\xa1t?nh"
+    b"\xe1\xbb\x8b ph\xc3\xa2n:Ch\xe1\xba\xafc ch\xe1\xba\xafn kh\xc3\xb4ng t"
+    b"h\xe1\xbb\x83 chi ti\xc3\xaau%s: \xc4\x91\xc3\xa3 t\xe1\xba\xa3i!QR "
+    b"d\xe1\xba\xa1ng v\xc4\x83n b\xe1\xba\xa3nKh\xc3\xb3a c\xc3\xb4ng c\xe1\xbb"
+    b"\x99ng\xc4\x90\xe1\xbb\x8ba ch\xe1\xbb\x89 ng\xc6\xb0\xe1\xbb\x9di m\xc3\xb4 t\xe1\xba"
+    b"\xa3S\xe1\xbb\x91 l\xc6\xb0\xe1\xbb\xa3ng\xc4\x91\xe1\xba\xbfn base32V\xc4\x83n "
+    b"b\xe1\xba\xa3n t\xc3\xb9y ch\xe1\xbb\x8dnB\xe1\xbb\x99 th\xe1\xbb\xad nghi"
+    b"\xe1\xbb\x87m\xc4\x90ang x\xc3\xb3a d\xe1\xbb\xaf li\xe1\xbb\x87u c\xe1\xbb\xa7a"
+    b" ng\xc6\xb0\xe1\xbb\x9di d\xc3\xb9ng\xe2\x80\xa6C\xc3\xb4ng su\xe1\xba\xa5tda"
+    b"nh s\xc3\xa1ch \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89\xc4\x90ang t\xe1\xba\xa3i"
+    b" \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 thay \xc4\x91\xe1\xbb\x95i\xe2\x80\xa6M\xc3\xa3 "
+    b"ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o kh\xc3\xb4ng kh"
+    b"\xe1\xbb\x9bpT\xe1\xba\xaft m\xc3\xa1yHi\xe1\xbb\x83n th\xe1\xbb\x8b d\xe1\xbb\xaf "
+    b"li\xe1\xbb\x87uM\xc3\xa3 QRMnemonic \xc4\x91\xc6\xb0\xe1\xbb\xa3c m\xc3"
+    b"\xa3 h\xc3\xb3a kh\xc3\xb4ng \xc4\x91\xc6\xb0\xe1\xbb\xa3c l\xc6\xb0u tr\xe1\xbb"
+    b"\xaf v\xe1\xbb\x9bi ID:M\xc3\xa0u BGRX\xc3\xb3a ho\xc3\xa0n to"
+    b"\xc3\xa0n th\xe1\xba\xbb SD trong m\xe1\xbb\x99t thi\xe1\xba\xbft"
+    b" b\xe1\xbb\x8b kh\xc3\xa1c \xc4\x91\xe1\xbb\x83 \xc4\x91\xe1\xba\xa3m b\xe1\xba\xa3o d"
+    b"\xe1\xbb\xaf li\xe1\xbb\x87u kh\xc3\xb4ng th\xe1\xbb\x83 ph\xe1\xbb\xa5c h"
+    b"\xe1\xbb\x93ikH\xc3\x94NG T\xc3\x8cM TH\xe1\xba\xa4Y trong %d "
+    b"\xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 \xc4\x91\xe1\xba\xa7u ti\xc3\xaanXu\xe1\xba\xa5t "
+    b"b\xc3\xa1o c\xc3\xa1oPhi\xc3\xaan B\xe1\xba\xa3nT\xe1\xbb\xab b\xe1\xbb\x99 l"
+    b"\xc6\xb0u tr\xe1\xbb\xafCh\xe1\xba\xa1m m\xc3\xa0n h\xc3\xacnh ho\xe1\xba\xb7"
+    b"c nh\xe1\xba\xa5n n\xc3\xbat ENTER \xc4\x91\xe1\xbb\x83 ch\xe1\xbb\xa5p"
+    b"T\xe1\xba\xa3i t\xe1\xbb\xab m\xc3\xa1y \xe1\xba\xa3nhTh\xc3\xb4ng qua "
+    b"t\xe1\xbb\xab ng\xe1\xbb\xafM\xc3\xa3 mnemonicV\xe1\xbb\x81 ch\xc3\xban"
+    b"g t\xc3\xb4iEntropy c\xe1\xbb\xa7a Shannon:Ph\xe1\xba"
+    b"\xa3iTin nh\xe1\xba\xafn \xc4\x91\xc3\xa3 k\xc3\xbdNh\xe1\xba\xadp %d t"
+    b"\xe1\xbb\xab BIP39.Dung l\xc6\xb0\xe1\xbb\xa3ng:Th\xe1\xbb\x9di g"
+    b"ian ch\xe1\xba\xbf \xc4\x91\xe1\xbb\x99 b\xe1\xba\xa3o v\xe1\xbb\x87 m\xc3\xa0n "
+    b"h\xc3\xacnhTin nh\xe1\xba\xafn%s byteLo\xe1\xba\xa1i b\xe1\xbb"
+    b"\x8f nhi\xe1\xbb\x85u n\xc3\xbatL\xc6\xb0\xe1\xbb\x9bi nh\xe1\xbb\x8b ph\xc3\xa2"
+    b"nNh\xe1\xba\xadp kh\xc3\xb3aNh\xc3\xa3n c\xc3\xb3 th\xe1\xbb\x83 nh\xc3"
+    b"\xacn th\xe1\xba\xa5yV\xc3\xad\xc4\x90\xc6\xa1n v\xe1\xbb\x8bChi ti\xc3\xaau "
+    b"(%d):C\xc3\xb4ng c\xe1\xbb\xa5 DatumL\xc6\xb0u v\xc3\xa0o t"
+    b"h\xe1\xba\xbb SDl\xc3\xa0 m\xe1\xbb\x99t \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 h\xe1"
+    b"\xbb\xa3p l\xe1\xbb\x87!\xc4\x90\xc6\xb0\xe1\xbb\x9dng k\xe1\xba\xbb:\xc4\x90\xe1\xba\xb7t m"
+    b"\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o tr\xc6\xb0\xe1\xbb"
+    b"\x9bcM\xc3\xa3 h\xc3\xb3a\xc4\x90ang t\xe1\xba\xa3i\xe2\x80\xa6T\xe1\xba\xa3i m\xc3"
+    b"\xb4 t\xe1\xba\xa3 v\xc3\xad \xc4\x91\xc3\xa1ng tin c\xe1\xba\xady \xc4\x91\xe1\xbb"
+    b"\x83 xem \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89?Ch\xe1\xbb\xaf k\xc3\xbd x\xe1\xba"
+    b"\xa5uS\xe1\xbb\xad d\xe1\xbb\xa5ng t\xc3\xadnh n\xc4\x83ng X\xc3\xb3a d"
+    b"\xe1\xbb\xaf li\xe1\xbb\x87u tr\xc3\xaan thi\xe1\xba\xbft b\xe1\xbb\x8b \xc4\x91"
+    b"\xe1\xbb\x83 \xc4\x91\xe1\xba\xa3m b\xe1\xba\xa3o d\xe1\xbb\xaf li\xe1\xbb\x87u kh\xc3"
+    b"\xb4ng th\xe1\xbb\x83 ph\xe1\xbb\xa5c h\xe1\xbb\x93iKh\xc3\xb3a n\xe1\xbb\x99"
+    b"i b\xe1\xbb\x99 TRT\xc4\xa9nhKh\xc3\xb3a \xc4\x91\xc6\xa1nK\xc3\xbd v\xc3\xa0"
+    b"o m\xc3\xa3 QRTr\xc3\xacnh m\xc3\xb4 t\xe1\xba\xa3 v\xc3\xadKh\xc3\xb4n"
+    b"g c\xc3\xb3 c\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1\xba\xa9uNh\xe1\xba\xadp m"
+    b"\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o g\xe1\xbb\x93m "
+    b"h\xc6\xa1n 6 k\xc3\xbd t\xe1\xbb\xb1M\xc3\xa3 ki\xe1\xbb\x83m tra gi"
+    b"\xe1\xba\xa3 m\xe1\xba\xa1oM\xe1\xbb\x99t s\xe1\xbb\x91 ki\xe1\xbb\x83m tra k"
+    b"h\xc3\xb4ng th\xe1\xbb\x83 \xc4\x91\xc6\xb0\xe1\xbb\xa3c th\xe1\xbb\xb1c hi\xe1\xbb"
+    b"\x87n.N\xc3\xbatKh\xc3\xb4i ph\xe1\xbb\xa5c c\xc3\xa0i \xc4\x91\xe1\xba\xb7t "
+    b"g\xe1\xbb\x91c v\xc3\xa0 kh\xe1\xbb\x9fi \xc4\x91\xe1\xbb\x99ng l\xe1\xba\xa1i?N"
+    b"\xe1\xba\xa1p V\xc3\xadS\xe1\xbb\xad d\xe1\xbb\xa5ng s\xe1\xbb\xb1 ng\xe1\xba\xabu "
+    b"nhi\xc3\xaan c\xe1\xbb\xa7a m\xc3\xa1y \xe1\xba\xa3nh \xc4\x91\xe1\xbb\x83 t\xe1"
+    b"\xba\xa1o ra m\xe1\xbb\x99t Mnemonic m\xe1\xbb\x9biK\xc3\xbd m"
+    b"\xc3\xa3 b\xc4\x83m th\xc3\xb4. Ch\xe1\xbb\x89 ti\xe1\xba\xbfn h\xc3\xa0nh"
+    b" n\xe1\xba\xbfu b\xe1\xba\xa1n tin t\xc6\xb0\xe1\xbb\x9fng ngu\xe1\xbb\x93"
+    b"n.Hash Flash TC khi kh\xe1\xbb\x9fi \xc4\x91\xe1\xbb\x99"
+    b"ngC\xc3\xa1c k\xc3\xbd t\xe1\xbb\xb1 kh\xc3\xb4ng ph\xe1\xba\xa3i AS"
+    b"CII \xc4\x91\xc3\xa3 \xc4\x91\xc6\xb0\xe1\xbb\xa3c ph\xc3\xa1t hi\xe1\xbb\x87n t"
+    b"rong c\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1\xba\xa9u c\xe1\xbb\xa7a b\xe1"
+    b"\xba\xa1n. Krux kh\xc3\xb4ng th\xe1\xbb\x83 \xc4\x91\xe1\xba\xa3m b\xe1"
+    b"\xba\xa3o r\xe1\xba\xb1ng c\xc3\xa1c v\xc3\xad kh\xc3\xa1c s\xe1\xba\xbd l"
+    b"\xe1\xba\xa5y \xc4\x91\xc6\xb0\xe1\xbb\xa3c c\xc3\xb9ng m\xe1\xbb\x99t kh\xc3\xb3a."
+    b"Kh\xc3\xb4ng t\xc3\xacm th\xe1\xba\xa5y b\xe1\xbb\x99 m\xc3\xb4 t\xe1\xba\xa3"
+    b" \xc4\x91\xe1\xba\xa7u ra v\xc3\xad.Xoay Chi\xe1\xbb\x81u 180\xc2"
+    b"\xbaS\xe1\xbb\x91 th\xe1\xba\xadp ph\xc3\xa2nCh\xe1\xbb\x9d b\xe1\xba\xaftC\xe1\xba"
+    b"\xadp nh\xe1\xba\xadt nh\xc3\xa3n QR?\xc4\x90\xe1\xbb\x99 s\xc3\xa1ngM\xe1"
+    b"\xba\xadt kh\xe1\xba\xa9u Base64Ch\xe1\xbb\x89 s\xe1\xbb\x91 \xc4\x91\xe1\xbb"
+    b"\x99 l\xe1\xbb\x87ch \xc4\x91i\xe1\xbb\x83m \xe1\xba\xa3nh:Th\xe1\xbb\xb1c hi"
+    b"\xe1\xbb\x87n?\xc4\x90\xe1\xbb\x8ba ch\xe1\xbb\x89 kh\xc3\xb4ng h\xe1\xbb\xa3p l"
+    b"\xe1\xbb\x87\xc4\x90\xc3\xa3 t\xe1\xba\xa3i b\xe1\xbb\x99 m\xc3\xb4 t\xe1\xba\xa3 \xc4\x91\xe1\xba"
+    b"\xa7u ra c\xe1\xbb\xa7a v\xc3\xad!th\xc3\xa0nh hexCh\xe1\xba\xbf "
+    b"\xc4\x91\xe1\xbb\x99 m\xc3\xa3 h\xc3\xb3aV\xc4\x83n b\xe1\xba\xa3nM\xe1\xba\xa1nhY\xe1"
+    b"\xba\xbfuC\xe1\xba\xa3nh b\xc3\xa1o:S\xe1\xbb\xad d\xe1\xbb\xa5ng b\xe1\xbb\x81 "
+    b"m\xe1\xba\xb7t n\xe1\xbb\x81n \xc4\x91en.Th\xe1\xba\xadp l\xe1\xbb\xa5c ph"
+    b"\xc3\xa2nCh\xe1\xba\xbf \xc4\x91\xe1\xbb\x99 ch\xe1\xbb\x91ng l\xc3\xb3aNh\xe1\xba\xad"
+    b"n \xc4\x91\xc6\xb0\xe1\xbb\xa3cChuy\xe1\xbb\x83n \xc4\x91\xe1\xbb\x95i \xc4\x91\xe1\xbb\x99 "
+    b"s\xc3\xa1ng\xc4\x90\xe1\xbb\x95i v\xc3\xad?Th\xe1\xbb\xad th\xc3\xaam n\xe1\xbb\xaf"
+    b"a?\xc4\x90ang qu\xc3\xa9t t\xe1\xbb\xab 13-24Th\xe1\xba\xbb SD"
+    b" kh\xc3\xb4ng \xc4\x91\xc6\xb0\xe1\xbb\xa3c ph\xc3\xa1t hi\xe1\xbb\x87n.12"
+    b" t\xe1\xbb\xabXem l\xe1\xba\xa1i l\xe1\xba\xa7n n\xe1\xbb\xafaGi\xe1\xba\xa3i"
+    b" m\xc3\xa3?Sao l\xc6\xb0u MnemonicC\xc3\xb4ng c\xe1\xbb\xa5"
+    b" FlashN\xc3\xa2ng c\xe1\xba\xa5p ho\xc3\xa0n t\xe1\xba\xa5t.t\xe1"
+    b"\xbb\xab HEX(%s bit/px)V\xe1\xbb\x8b tr\xc3\xad l\xc6\xb0u\xc4"
+    b"\x90\xe1\xbb\x99 ph\xc3\xa2n gi\xe1\xba\xa3i - \xc4\x90\xe1\xbb\x8bnh d\xe1\xba\xa1"
+    b"ngT\xe1\xba\xa3i m\xc3\xa3 mnemonicTr\xe1\xbb\x91ng\xc4\x91\xe1\xba\xbf"
+    b"n utf8M\xe1\xbb\x99t s\xe1\xbb\x91 n\xc3\xbat kh\xc3\xb4ng \xc4\x91\xc6"
+    b"\xb0\xe1\xbb\xa3c l\xc3\xa0m c\xe1\xbb\xa9ng:K\xc3\xbd v\xc3\xa0o th\xe1\xba\xbb"
+    b" SDId \xc4\x91\xc3\xa3 t\xe1\xbb\x93n t\xe1\xba\xa1iS\xe1\xbb\xad d\xe1\xbb\xa5n"
+    b"g tr\xc3\xacnh l\xe1\xba\xb7p PBKDF2 m\xe1\xba\xb7c \xc4\x91\xe1\xbb"
+    b"\x8bnh.?kh\xc3\xb4ng r\xc3\xb5T\xe1\xbb\x8da \xc4\x91\xe1\xbb\x99 g\xc6\xb0\xc6\xa1"
+    b"ng XM\xe1\xba\xa1ng l\xc6\xb0\xe1\xbb\x9biSuy ra entropy"
+    b" BIP85?Kh\xc3\xb4ng l\xc6\xb0u tr\xe1\xbb\xaf Mnemoni"
+    b"c \xc4\x91\xc6\xb0\xe1\xbb\xa3cT\xe1\xbb\xab ng\xe1\xbb\xafMnemonic \xc4\x91\xc6"
+    b"\xb0\xe1\xbb\xa3c m\xc3\xa3 h\xc3\xb3a kh\xc3\xb4ng \xc4\x91\xc6\xb0\xe1\xbb\xa3c l"
+    b"\xc6\xb0u tr\xe1\xbb\xafM\xc3\xa0n h\xc3\xacnh c\xe1\xba\xa3m \xe1\xbb\xa9ngC"
+    b"hi\xe1\xbb\x81u r\xe1\xbb\x99ng gi\xe1\xba\xa5yT\xc3\xa0i kho\xe1\xba\xa3n"
+    b"Ch\xc3\xaca kh\xc3\xb3a%s k\xc3\xbd t\xe1\xbb\xb1In ki\xe1\xbb\x83m "
+    b"tra QRX\xc3\xb3a v\xc4\xa9nh vi\xe1\xbb\x85n m\xe1\xbb\x8di Mn"
+    b"emonics v\xc3\xa0 c\xc3\xa0i \xc4\x91\xe1\xba\xb7t \xc4\x91\xc6\xb0\xe1\xbb\xa3c"
+    b" m\xc3\xa3 h\xc3\xb3a l\xc6\xb0u tr\xe1\xbb\xaf trong flash"
+    b"?\xc4\x90ang t\xe1\xba\xa3i m\xc3\xa1y in\xe2\x80\xa6S\xe1\xbb\x91Quay "
+    b"l\xe1\xba\xa1i Tr\xc3\xacnh xem QRNh\xe1\xba\xa5n PAGE \xc4"
+    b"\x91\xe1\xbb\x83 h\xe1\xbb\xa7y.Ki\xe1\xbb\x83m tra \xc4\x91\xe1\xbb\x8ba ch\xe1"
+    b"\xbb\x89 \xc4\x91\xc3\xb3 c\xc3\xb3 thu\xe1\xbb\x99c v\xe1\xbb\x81 v\xc3\xad n\xc3\xa0"
+    b"y kh\xc3\xb4ng?H\xe1\xbb\xa7y ch\xe1\xbb\xa5p h\xc3\xacnh\xc4\x90\xc6\xb0\xe1"
+    b"\xbb\x9dng d\xe1\xba\xabn ph\xc3\xa1i sinhT\xe1\xba\xa3i th\xe1\xba\xa5"
+    b"t b\xe1\xba\xa1i\xc4\x90\xc3\xa3 m\xc3\xa3 h\xc3\xb3a KEF\xc4\x90\xe1\xba\xa7u v"
+    b"\xc3\xa0o (%d):T\xe1\xbb\xab g\xe1\xbb\xa3i nh\xe1\xbb\x9b BIP39M"
+    b"\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o kh\xc3\xb4ng"
+    b" h\xe1\xbb\xa3p l\xe1\xbb\x87Trung b\xc3\xacnhGhi \xc4\x91\xc3\xa8?K"
+    b"h\xc3\xb3a kh\xc3\xb4ng \xc4\x91\xc6\xb0\xe1\xbb\xa3c cung c\xe1\xba\xa5p\xc4"
+    b"\x90\xe1\xbb\x8ba ch\xe1\xbb\x89Ph\xc3\xa2n b\xe1\xbb\x95 x\xc3\xbac x\xe1\xba\xafc"
+    b":Hi\xe1\xbb\x83n th\xe1\xbb\x8bL\xc6\xb0u tr\xe1\xbb\xaf tr\xc3\xaan fl"
+    b"ashS\xe1\xbb\xad d\xe1\xbb\xa5ng Ch\xe1\xba\xbf \xc4\x91\xe1\xbb\x99 m\xe1\xba\xb7c"
+    b" \xc4\x91\xe1\xbb\x8bnh?T\xc3\xaan t\xe1\xbb\x87pN\xe1\xba\xbfu m\xc3\xa0n h\xc3"
+    b"\xacnh thi\xe1\xba\xbft b\xe1\xbb\x8b c\xe1\xbb\xa7a b\xe1\xba\xa1n kh\xc3"
+    b"\xb4ng ho\xe1\xba\xa1t \xc4\x91\xe1\xbb\x99ng sau khi thay "
+    b"\xc4\x91\xe1\xbb\x95i n\xc3\xa0y, m\xc3\xa0n h\xc3\xacnh s\xe1\xba\xbd t\xe1\xbb"
+    b"\xb1 \xc4\x91\xe1\xbb\x99ng kh\xe1\xbb\x9fi \xc4\x91\xe1\xbb\x99ng l\xe1\xba\xa1i v"
+    b"\xe1\xbb\x9bi c\xc3\xa1c c\xc3\xa0i \xc4\x91\xe1\xba\xb7t tr\xc6\xb0\xe1\xbb\x9bc \xc4"
+    b"\x91\xc3\xb3 sau 5 gi\xc3\xa2y.T\xe1\xba\xa3i?\xc4\x90\xc3\xa3 s\xe1\xbb\xad "
+    b"d\xe1\xbb\xa5ng:Kh\xe1\xbb\x9fi \xc4\x91\xe1\xbb\x99ng l\xe1\xba\xa1iIn?(T"
+    b"h\xe1\xbb\xb1c nghi\xe1\xbb\x87m)XOR v\xe1\xbb\x9biLo\xe1\xba\xa1i \xc4"
+    b"\x91\xe1\xba\xa7uV\xc3\xad kh\xc3\xb4ng kh\xe1\xbb\x9bp:t\xe1\xbb\xab base"
+    b"32Th\xc3\xaam ho\xe1\xba\xb7c thay \xc4\x91\xe1\xbb\x95i c\xe1\xbb\xa5m"
+    b" m\xe1\xba\xadt kh\xe1\xba\xa9u v\xc3\xad?Ki\xe1\xbb\x83m tra th\xe1"
+    b"\xba\xbb SDIn \xe1\xba\xa5n\xe2\x80\xa6Tr\xe1\xbb\x9f l\xe1\xba\xa1iM\xc3\xa3 QR"
+    b" t\xc3\xb9y ch\xe1\xbb\x89nhVu\xe1\xbb\x91t \xc4\x91\xe1\xbb\x83 thay \xc4"
+    b"\x91\xe1\xbb\x95i ch\xe1\xba\xbf \xc4\x91\xe1\xbb\x99Ghi nh\xe1\xbb\x9b hi\xe1\xbb\x87"
+    b"n t\xe1\xba\xa1i c\xe1\xbb\xa7a XOR v\xe1\xbb\x9bi m\xe1\xbb\x99t c\xe1"
+    b"\xbb\xa5m t\xe1\xbb\xab kh\xc3\xa1c? (c\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1"
+    b"\xba\xa9u v\xc3\xa0 m\xc3\xb4 t\xe1\xba\xa3 s\xe1\xba\xbd b\xe1\xbb\x8b lo\xe1\xba\xa1"
+    b"i b\xe1\xbb\x8f)L\xc6\xb0u v\xc3\xa0o th\xe1\xba\xbb SD?T\xe1\xba\xa1o "
+    b"MnemonicK\xc3\xadch th\xc6\xb0\xe1\xbb\x9bc m\xe1\xbb\x99t ph\xe1"
+    b"\xba\xa7nVui l\xc3\xb2ng t\xe1\xba\xa3i b\xe1\xbb\x99 m\xc3\xb4 t\xe1\xba\xa3"
+    b" \xc4\x91\xe1\xba\xa7u ra v\xc3\xadKh\xc3\xb3a c\xc3\xb4ng c\xe1\xbb\x99ng"
+    b" Hex:\xc4\x90\xc3\xa3 m\xc3\xa3 h\xc3\xb3aT\xc3\xb9y ch\xe1\xbb\x89nhV\xe1"
+    b"\xba\xabn ti\xe1\xba\xbfp t\xe1\xbb\xa5c?Kh\xc3\xb4ng th\xe1\xbb\x83 x\xc3"
+    b"\xa1c \xc4\x91\xe1\xbb\x8bnh \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 thay \xc4\x91\xe1"
+    b"\xbb\x95i.X\xc3\xb3a d\xe1\xbb\xaf li\xe1\xbb\x87u c\xe1\xbb\xa7a ng\xc6\xb0\xe1"
+    b"\xbb\x9di d\xc3\xb9ngPh\xc3\xa1t hi\xe1\xbb\x87n ph\xe1\xba\xa7n s\xe1\xbb"
+    b"\xa5n m\xe1\xbb\x9bi.Th\xe1\xbb\x9di gian t\xe1\xba\xaft m\xc3\xa1yT"
+    b"r\xc3\xa1i\xc4\x90\xc3\xa3 k\xc3\xbd PSBTtr\xc6\xb0\xe1\xbb\xa3t\xc4\x90\xc3\xa3 \xc4\x91"
+    b"\xe1\xba\xb7t m\xc3\xa3 ki\xe1\xbb\x83m tra gi\xe1\xba\xa3 m\xe1\xba\xa1o "
+    b"th\xc3\xa0nh c\xc3\xb4ngvu\xe1\xbb\x91tNg\xc6\xb0\xe1\xbb\xa1ng c\xe1\xba\xa3"
+    b"m \xe1\xbb\xa9ngKi\xe1\xbb\x83m tra b\xc3\xa0i c\xc5\xa9:Nh\xe1\xba\xad"
+    b"p t\xe1\xbb\xabng t\xe1\xbb\xab c\xe1\xbb\xa7a Mnemonic BIP"
+    b"39 c\xe1\xbb\xa7a b\xe1\xba\xa1n d\xc6\xb0\xe1\xbb\x9bi d\xe1\xba\xa1ng s\xe1"
+    b"\xbb\x91 t\xe1\xbb\xab 1 \xc4\x91\xe1\xba\xbfn 2048.X\xc3\xb3a %s?T\xe1"
+    b"\xbb\xab s\xe1\xbb\x91\xc4\x90\xc6\xb0\xe1\xbb\x9dng d\xe1\xba\xabn kh\xc3\xb4ng kh"
+    b"\xe1\xbb\x9bp\xc4\x90ang t\xe1\xba\xa3i \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89 nh\xe1"
+    b"\xba\xadn\xe2\x80\xa6\xc4\x90ang x\xe1\xbb\xad l\xc3\xbd\xe2\x80\xa6T\xe1\xbb\xb1 chuy"
+    b"\xe1\xbb\x83n nh\xc6\xb0\xe1\xbb\xa3ng:Thay \xc4\x91\xe1\xbb\x95i:\xc4\x90\xc3\xa8n"
+    b" Flash \xc4\x90\xe1\xbb\x95 \xc4\x90\xe1\xba\xa7yQR ki\xe1\xbb\x83m tra"
+    b" m\xc3\xa1y in KruxHo\xc3\xa0n t\xe1\xba\xa5t?Kh\xc3\xa1m p"
+    b"h\xc3\xa1 c\xc3\xa1c t\xe1\xba\xadp tin?X\xc3\xa1c minh\xe2\x80\xa6G"
+    b"iao di\xe1\xbb\x87nPh\xc3\xad cao!Kh\xc3\xb4ng \xc4\x91\xc6\xb0\xe1\xbb"
+    b"\xa3c t\xe1\xba\xaft m\xc3\xa1y, c\xc3\xb3 th\xe1\xbb\x83 m\xe1\xba\xa5t m"
+    b"\xe1\xbb\x99t l\xc3\xbac \xc4\x91\xe1\xbb\x83 ho\xc3\xa0n th\xc3\xa0nh.Tr\xc3"
+    b"\xacnh \xc4\x91i\xe1\xbb\x81u khi\xe1\xbb\x83n m\xc3\xa1y in ch\xc6\xb0"
+    b"a \xc4\x91\xc6\xb0\xe1\xbb\xa3c c\xc3\xa0i \xc4\x91\xe1\xba\xb7t!\xe1\xba\xa8n Mnem"
+    b"onicsPh\xe1\xba\xa7nThi\xe1\xba\xbfu t\xe1\xba\xadp tin ch\xe1"
+    b"\xbb\xaf k\xc3\xbdT\xe1\xbb\x91c \xc4\x91\xe1\xbb\x99 baudTh\xe1\xba\xbb SDC\xc3"
+    b"\xa0i \xc4\x91\xe1\xba\xb7t G\xe1\xbb\x91cNg\xc6\xb0\xe1\xbb\x9di d\xc3\xb9ngGi\xc3"
+    b"\xa1 tr\xe1\xbb\x8b %s ngo\xc3\xa0i ph\xe1\xba\xa1m vi: [ %"
+    b"s, %s]\xc4\x90ang qu\xc3\xa9t l\xe1\xba\xa1i t\xe1\xbb\xab 1-1"
+    b"2B\xe1\xbb\x8f d\xe1\xba\xa5u v\xc3\xa2n tay trong PSBT\xc4"
+    b"\x90ang ki\xe1\xbb\x83m tra th\xe1\xba\xbb SD\xe2\x80\xa6\xc4\x90i\xe1\xbb"
+    b"\x81n v\xc3\xa0o flash v\xe1\xbb\x9bi entropy t\xe1\xbb\xab"
+    b" m\xc3\xa1y \xe1\xba\xa3nh?\xc4\x90\xc3\xa3 l\xc6\xb0u v\xc3\xa0o th\xe1\xba\xbb"
+    b" SD:Qu\xc3\xa9t c\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1\xba\xa9u BIP"
+    b"39Nh\xe1\xba\xadp t\xe1\xbb\xabng t\xe1\xbb\xab trong Mnemo"
+    b"nic BIP39 c\xe1\xbb\xa7a b\xe1\xba\xa1n d\xc6\xb0\xe1\xbb\x9bi d\xe1"
+    b"\xba\xa1ng s\xe1\xbb\x91 th\xe1\xba\xadp l\xe1\xbb\xa5c ph\xc3\xa2n t\xe1\xbb"
+    b"\xab 1 \xc4\x91\xe1\xba\xbfn 800.Kh\xc3\xb4ng\xc4\x91\xe1\xba\xbfn base"
+    b"64Kh\xc3\xb4ng \xc4\x91\xe1\xbb\xa7 s\xe1\xbb\x91 l\xe1\xba\xa7n quay!\xc4"
+    b"\x90\xe1\xbb\x99 d\xc3\xa0i m\xc3\xa3 Mnemonic kh\xc3\xb4ng h\xe1"
+    b"\xbb\xa3p l\xe1\xbb\x87T\xe1\xba\xa1o m\xc3\xa3 QRPAGE \xc4\x91\xe1\xbb\x83 c"
+    b"huy\xe1\xbb\x83n ch\xe1\xba\xbf \xc4\x91\xe1\xbb\x99\xc4\x90\xe1\xbb\x99 s\xc3\xa2u m\xe1"
+    b"\xbb\x97i l\xe1\xba\xa7n c\xe1\xba\xaft CNCt\xe1\xbb\xab base43Qu"
+    b"\xc3\xa9t \xc4\x91\xe1\xbb\x8ba ch\xe1\xbb\x89Entropy b\xe1\xbb\x95 sun"
+    b"g t\xe1\xbb\xab m\xc3\xa1y \xe1\xba\xa3nh c\xe1\xba\xa7n thi\xe1\xba\xbft "
+    b"cho %s\xc4\x90\xe1\xba\xa3o ng\xc6\xb0\xe1\xbb\xa3cKi\xe1\xbb\x83m tra "
+    b"thi\xe1\xba\xbft b\xe1\xbb\x8bQuay l\xe1\xba\xa1i Menu\xc4\x90\xe1\xbb\x83"
+    b" tr\xe1\xbb\x91ng n\xe1\xba\xbfu b\xe1\xba\xa1n mu\xe1\xbb\x91n Krux"
+    b" ch\xe1\xbb\x8dn m\xe1\xbb\x99t t\xe1\xbb\xab cu\xe1\xbb\x91i c\xc3\xb9ng "
+    b"h\xe1\xbb\xa3p l\xe1\xbb\x87Qua m\xc3\xa1y \xe1\xba\xa3nhV\xc3\xad \xc4\x91\xe1\xba"
+    b"\xa7u ra m\xc3\xb4 t\xe1\xba\xa3C\xe1\xbb\xa5m m\xe1\xba\xadt kh\xe1\xba\xa9u"
+    b"T\xe1\xbb\xb1 chuy\xe1\xbb\x83n nh\xc6\xb0\xe1\xbb\xa3ng ho\xe1\xba\xb7c g"
+    b"iao d\xe1\xbb\x8bch (%d):\xc4\x90\xe1\xbb\x99 d\xc3\xa0i:K\xc3\xad?"
+)
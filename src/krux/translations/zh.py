@@ -19,382 +19,293 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-# pylint: disable=C0301
-translation_array = [
-    "% 的金额.",
-    "%d/%d 多签",
-    "%d到%d",
-    "%s位",
-    "%s 字节",
-    "%s 个字符",
-    "已移除%s",
-    "%s :已加载!",
-    "(%s位/像素）",
-    "（实验性）",
-    "（仅观察）",
-    "12 单词",
-    "24 单词",
-    "关于",
-    "账户",
-    "账户索引",
-    "添加或更改钱包密码？",
-    "%s需要摄像头的额外熵",
-    "地址",
-    "正确对齐摄像头和背板.",
-    "防闪模式",
-    "界面",
-    "确定？",
-    "BGR 颜色",
-    "BIP39助记符",
-    "返回",
-    "返回菜单",
-    "备份助记词",
-    "签名无效",
-    "Base64密码",
-    "波特率",
-    "二进制网格",
-    "边框填充",
-    "亮度",
-    "按钮",
-    "按钮去抖动",
-    "截取已取消",
-    "找零",
-    "更改主题并重新启动？",
-    "更换钱包?",
-    "找零:",
-    "更改将在关机前保持.",
-    "检查 SD 卡",
-    "检查该地址是否属于此钱包？",
-    "已检查 %d 个不匹配的地址.",
-    "检查卡…",
-    "确认防篡改检查码",
-    "转换基准",
-    "无法确定更改地址.",
-    "创建二维码",
-    "从短信创建二维码？",
-    "已创建:",
-    "当前防篡改检查码",
-    "自定义二维码",
-    "自定义文本",
-    "自定义",
-    "自定义您的钱包将生成一个新的密钥并卸载描述符.",
-    "切割深度",
-    "切割方法",
-    "基准工具",
-    "十进制",
-    "解密？",
-    "默认钱包",
-    "是否删除此文件？",
-    "每次通过的深度",
-    "源路径",
-    "导出BIP85熵？",
-    "描述符地址",
-    "设备测试",
-    "显示",
-    "请勿断电，可能需要一段时间完成.",
-    "完成转换",
-    "完成了吗？",
-    "双重助记词",
-    "驱动程序",
-    "为空",
-    "启用？",
-    "加密",
-    "已加密",
-    "加密二维码",
-    "加密助记词已存储，ID 为:",
-    "加密助记词未存储",
-    "加密",
-    "加密模式",
-    "输入 %d 个 BIP39 词.",
-    "输入6个以上字符的防篡改检查码",
-    "将 BIP39 助记词的每个词作为 1 到 2048 的数字输入.",
-    "将 BIP39 助记词的每个词作为 1 到 800 的十六进制数输入.",
-    "将 BIP39 助记词的每个词作为 1 到 4000 的八进制数输入.",
-    "输入每个 BIP39 助记词.",
-    "清除用户数据",
-    "正在删除用户数据…",
-    "错误:",
-    "退出",
-    "浏览文件？",
-    "导出地址",
-    "正在将%s导出到SD卡…",
-    "扩展公钥",
-    "出厂设置",
-    "收集摄像头熵失败",
-    "转换失败.",
-    "解密失败",
-    "加载失败",
-    "存储助记词失败",
-    "费用:",
-    "进给速度",
-    "文件名",
-    "文件名 %s 存在于 SD 卡上.",
-    "用摄像头的熵填充Flash？",
-    "填充Flash",
-    "PSBT 中未设置指纹",
-    "Flash地图",
-    "Flash工具",
-    "Flash已用摄像头熵填充",
-    "刀具直径",
-    "空闲:",
-    "从存储中",
-    "在其他设备中完全擦除您的 SD 卡以确保数据不可恢复",
-    "生成助记词",
-    "去",
-    "良好的熵",
-    "硬件",
-    "头部类型",
-    "十六进制公钥:",
-    "十六进制",
-    "隐藏助记词",
-    "高费用！",
-    "ID",
-    "ID 已存在",
-    "如果您的设备显示屏在此更改后无法正常工作,它将在5秒后使用以前的设置自动重新启动.",
-    "索引",
-    "输入 (%d):",
-    "熵不足！",
-    "无效的防篡改检查码",
-    "无效地址",
-    "无效的源路径",
-    "助记词长度无效",
-    "无效钱包:",
-    "反转",
-    "反转颜色",
-    "KEF加密",
-    "密钥",
-    "未提供密钥",
-    "Krux 打印机测试二维码",
-    "LCD 类型",
-    "语言",
-    "如果希望 Krux 自动计算最后一位 Checksum，请留空",
-    "左",
-    "长度:",
-    "行延迟",
-    "行:",
-    "地址",
-    "加载助记词",
-    "加载钱包",
-    "加载受信任的钱包描述符以查看地址？",
-    "从 SD 卡加载",
-    "从 SD 卡加载？",
-    "从相机加载",
-    "加载？",
-    "正在加载摄像头…",
-    "正在加载更改地址…",
-    "正在加载打印机…",
-    "正在加载接收地址…",
-    "加载中…",
-    "语言环境",
-    "位置",
-    "中等",
-    "消息",
-    "消息:",
-    "Miniscript",
-    "镜像X坐标",
-    "缺少签名文件",
-    "助记词",
-    "助记符异或",
-    "助记词和密码将被保留.",
-    "修改时间:",
-    "网络",
-    "新助记词",
-    "检测到新固件.",
-    "否",
-    "无 Passphrase ",
-    "在您的密码短语中检测到非ASCII字符.Krux无法保证其他钱包将获得相同的密钥.",
-    "投掷次数不足！",
-    "数字",
-    "八进制",
-    "其他格式",
-    "覆盖？",
-    "切换亮度的页面",
-    "PBKDF2迭代.",
-    "将打孔点涂黑，以便它们能被检测到.",
-    "纸张宽度",
-    "部分",
-    "N的M部分",
-    "部件尺寸",
-    "Passphrase",
-    "密码长度:",
-    "路径不匹配",
-    "检测到模式！",
-    "从 Flash 中永久删除所有存储的加密助记词和设置？",
-    "保存",
-    "像素偏差指数:",
-    "明文二维码",
-    "请加载钱包输出描述符",
-    "下刀速度",
-    "政策类型",
-    "熵值低!",
-    "功率",
-    "按PAGE取消.",
-    "按 PAGE 切换模式",
-    "打印测试二维码",
-    "打印Tinyseed ？",
-    "打印到二维码",
-    "打印到二维码？",
-    "打印？",
-    "打印机",
-    "打印机驱动程序未设置！",
-    "打印…",
-    "继续吗？",
-    "继续？",
-    "处理中…",
-    "可证明不可使用",
-    "二维码",
-    "二维码标签",
-    "数量",
-    "RX 引脚",
-    "重启",
-    "接收",
-    "区域:",
-    "删除 %s？",
-    "删除助记词",
-    "从 SD 卡中删除固件文件？",
-    "分辨率 - 格式",
-    "恢复出厂设置并重新设备？",
-    "結果",
-    "返回二维码查看器",
-    "再次审核",
-    "请检查扫描的数据，如有必要请编辑",
-    "右",
-    "掷骰子至少 %d 次以生成助记词.",
-    "掷骰子分布:",
-    "掷骰子:",
-    "旋转 180°",
-    "SD 卡",
-    "未检测到 SD 卡.",
-    "掷骰子的 SHA256:",
-    "快照的 SHA256:",
-    "将二维码图像保存到 SD 卡",
-    "保存到 SD 卡",
-    "保存到 SD 卡？",
-    "保存到 SD 卡:",
-    "缩放",
-    "扫描地址",
-    "扫描 BIP39 Passphrase",
-    "扫描私钥二维码",
-    "重新扫扫描第 1-12 个单词",
-    "扫描第 13-24 个单词",
-    "屏保时间",
-    "脚本类型",
-    "安全",
-    "自转或找零 (%d):",
-    "自行转账:",
-    "请先设置防篡改检查码",
-    "设置",
-    "设置存储在 Flash 内部.",
-    "设置存储在SD卡上.",
-    "香农熵:",
-    "显示基准",
-    "关机",
-    "关机时间",
-    "关闭…",
-    "签名",
-    "二维码签名",
-    " SD 卡签名",
-    "是否签名？",
-    "签名:",
-    "签名消息",
-    "已签名 PSBT",
-    "签名原始哈希.仅当您信任源时才继续.",
-    "签名…",
-    "单签",
-    "大小:",
-    "无法执行某些检查.",
-    "有些节点未硬化:",
-    "花费 (%d):",
-    "花费",
-    "标准模式",
-    "Static  静态？",
-    "极客统计数据",
-    "存储到 Flash",
-    "存储到 SD 卡",
-    "强度",
-    "强",
-    "滑动切换模式",
-    "TC Flash Hash",
-    "启动时的 TC Flash Hash",
-    "点击或按下 ENTER 截图",
-    "点击或按下 ENTER 安装.",
-    "TR内部密钥",
-    "TX 引脚",
-    "防篡改检查码",
-    "防篡改检查码设置成功",
-    "防篡改检查码不匹配",
-    "Test Suite",
-    "测试套件结果",
-    "测试:",
-    "文本",
-    "主题",
-    "热敏",
-    "要确保数据不可恢复，请使用擦除设备功能",
-    "调整亮度",
-    "工具",
-    "触摸阈值",
-    "触摸屏",
-    "再次尝试？",
-    "输入 BIP39 Phrasephrase",
-    "输入私钥",
-    "撤销",
-    "单位",
-    "更新KEF ID ？",
-    "更新二维码标签？",
-    "升级已完成.",
-    "使用黑色背景界面.",
-    "使用摄像头的熵创建新助记词",
-    "当前值",
-    "使用默认模式？",
-    "使用默认PBKDF2迭代.?",
-    "使用指纹作为身份证件？",
-    "已用:",
-    "用户数据",
-    "值 %s 超出范围:[ %s,%s ]",
-    "验证中…",
-    "版本",
-    "通过摄像头",
-    "通过 D20",
-    "通过 D6",
-    "通过手动输入",
-    "通过单词",
-    "可见标签",
-    "等待截取",
-    "钱包",
-    "钱包描述",
-    "钱包不匹配:",
-    "钱包输出描述符",
-    "钱包输出描述符加载重复！",
-    "未找到钱包输出描述符.",
-    "警告:",
-    "弱",
-    "词 %d",
-    "单词序号",
-    "单词",
-    "XOR结果",
-    "XOR With",
-    "XOR当前助记符与其他助记符? (密码短语和描述符将被丢弃)",
-    "是",
-    "放大模式",
-    "二进制:",
-    "失败",
-    "从十六进制",
-    "从base32",
-    "从base43",
-    "从base64",
-    "从十六进制",
-    "从utf8",
-    " 非有效地址",
-    "移位案例",
-    "成功率:",
-    "滑动",
-    "文本:",
-    "成为十六进制",
-    "到base32",
-    "到base43",
-    "到base64",
-    "成为十六进制",
-    "to_utf8()",
-    "未知",
-    "在前 %d 个地址中未找到",
-]
+# pylint: disable=C0103,C0301
+catalog = (
+    b"s\x01\xb6\x11\x16\x00l\xfa\xa6\x02[\xa8b\x04\xb1\xd5\xb0\x04\xed\x8e:\x06\xe6\x81m\x07\xb6\x8b\xef\x07B{"
+    b'd\x08\xb7\x06\xff\x08\nf\x00\n(\x1f\x16\x0c\xbcI\xdb\rpi"\x0e\xff#)\x0e\x88\x1f\xe1\x0ef\x97'
+    b"\xa1\x0f\x8b\xea5\x11\x8arH\x11%\xc4\xc6\x14k\xd8\xe0\x14\xefy\xca\x16j\xc7\xd9\x16GG.\x17\x05\xd5"
+    b"R\x17\xeal\xf3\x17}\xca\xe8\x18\x81\xd3*\x19\xbba\xc5\x19\xe0\x94\xdd\x19\x93\xc23\x1ck\xf8<\x1c\xbd\xc3"
+    b'\xd1\x1dk\x96O\x1fhW\xae\x1f\xeat\x9b!\xf2\xb1\x1d"\x00\xb9/#Lj\xa3#\xf4\xb7\xec#k\xd7'
+    b"\xb4$\x13\t\xea$\xf1\xf7(&\xe9~\xaf&`Rp(\xfa\x1c*)\xa8\xdaL)|\xb9\xb7)j\x91"
+    b'\\*\x93gx*\xeb\xf5\xea*s\xf1;+"\xd6r+\xf4\x85t-\x80\n\x87-\xe3\x13\xad-J\x9f'
+    b"\xea-\x9d.\x93.\xb80\xc4.uU\x8b/\x7f\x0b\xb5/\x8e\x83\xcf/g\xd4\xb80n\xea\xf30\x12E"
+    b"c1\x99\x1bi1\xef|73\x14\x15\xe83\xe5\x91o4\x86|\xea4\x1f\xaf\xfd4\xc9\xa3\xaa5\xbd\xca"
+    b"\xd85Z'S6\x02\xcb^6\xd5\x91\xb36\x16\x19\x087\xfc?[7\xd84\xf69\x89\x0fZ:\x81\xa9"
+    b"[;|\x91\xec;\x97\xb7\xed<\x95e7>\x1e\xd1\xfd>\xc0>L?\xfd\x91\x1f@x}=@\x87j"
+    b"\x8dA\x84>\x96A\x05H\xb2A\xed\xf2\xc7Aq@\xf1B\xcc\x14BC\xdf~.D\xba\x16\x8bEhY"
+    b"\x0cF\xae\xc3,F\x11r?F! XF\x90\xb9\xa5F\x1a\xcd\xccF\x1c\n7G\xee\x08nG\x16\xfb"
+    b"\xfbG\x8fbzI30\xc0I\xf9\xd4'Jc\xed\xc8J?\xad&K`D\xd1Kg`\x16MIs"
+    b"\xaaM\x8f\xe6\x15Na\xdcLP\x9b\x94\xe9Q\x12@\x88RJ\xde\xd6S8\xa4\xc0U?\x9c\x05V\x0c\xc8"
+    b"\xb4VB\x9dPW\x9c\x07\x01Xd\xe9\x83X\x87L\x97Y\xee\x8c\xb9Y\xe8\xcc&Z\xa0[\xcf\\q\xd7"
+    b"\x08^\t\x84]^\x0c\x01k^\x08i2_\x1c;\xa3b[\xb9\xdab*\xfe\x13c\xb9\x993cd\n"
+    b'\xfdcY"\xa2d\x8d?\xf2dy\x96\x1de\x9d\x9e\x8de2\x8e\x00f\xc5\x1b\x18f`t\x85fY\xcf'
+    b"tg\xcd8\xd1gM\x865j\xa4.Kj\x13]\xd1j\x0bT\xa6k\xe8{}l\x94\xbc\xd4l0\x11"
+    b"\xe0m?\xfb*n]\x8eRn\x08{Xo\xb9m\x87o\xde\xd6\xcfom\x14@p_\xea\xa1p\xc3\x99"
+    b"\xd8p\xa8\x93)q\x8dirs0\x13\x16t\x8b\xf3 t\xe7\r5t\xe8\xda\xcat\x10Z\x0bu\xd9\xd4"
+    b"\x84v9\xab\xf4wYQ_xZ\x9b\xf9x\xe3\t\x00y\x08\xc8#yw\xde|yq\xdf\xfcy4\xd9"
+    b"\xe0z\xac\x11e{)\x97\xc4{m\xa3\x89|\x9f\x8a\x9b|\xdeG\xa7}?\x0e\xf2\x80\x00\x1ei\x81\xa6Z"
+    b"\xc0\x81u\xc6W\x82\x0c\x11r\x85\xa2\xcb6\x86j\x8f~\x86\x80\xb1\x83\x86\xffY\x98\x86\xbe\xf6W\x87\x13-"
+    b"l\x87\xc3\x10\xfb\x87\xbc\x93\xb9\x88\xdf\xde\xe9\x88\xf2\xaf\x9f\x8a\xb6\xd1\x9f\x8a)\xbcE\x8b\x7f\x00\xc2\x8b*\xbc"
+    b"\xe1\x8ca\x90\x04\x8d\x89Q;\x8d\xdd\x8e2\x8f\xbf\xc3D\x90\x95\x8e}\x91\x0f$\x83\x93D\xa7\xff\x94\xb1\x8b"
+    b"#\x95\x0f\x8a@\x95\x1flE\x95n7#\x963\xd5+\x96Rv\x13\x99J\xc7\xaa\x99\xdb\xd0\xd0\x99&\x1f"
+    b"\x1d\x9a\x03 5\x9a\xa2]\xb1\x9aO?\x11\x9b\xf9\x08\xb9\x9b-\xcb\x9f\x9d\xfa\x03\x04\x9fp}?\x9f\xd0\x8b"
+    b"p\x9fw+i\xa0D\xde\x87\xa0\xad\x08\xce\xa0y\xe5\xf1\xa0\x9a\xfe\x03\xa1\xbfX\xe0\xa2.\xc5\x1b\xa3\x12\xe1"
+    b"\x1b\xa3V\xd4J\xa3\x0f<\xab\xa3\xee\xa8\xfa\xa3\xaa\x0cJ\xa4\xf0\x84\x8a\xa5\xf8\xe2\x19\xa6\xe4\xa8T\xa6V3"
+    b"y\xa6\x9d\xeb\xe8\xa7\xc3\xc2\xec\xa7\x18\xde \xa8\xc0\x12\x06\xa9P]\x94\xa9\x1ei\xa7\xaaX\xcb\xa8\xabNw"
+    b"\xa9\xabO\xd9\xfb\xac\xc7\xa7&\xadY\xb5'\xaf \xbe9\xaf\xc0ZG\xaf\x0e\xa2\x9a\xaf\x881\xbc\xb0\x12s"
+    b"\xf0\xb0d\xa3\x8b\xb1\x8e7\x16\xb28o\x8b\xb2I\xed\xdd\xb2O4\x88\xb3\xdd\xe6\x05\xb5\xfd\xe52\xb5\xfb\x95"
+    b"\x9d\xb5e\xf3#\xb8\xae\x87>\xb8]\x1f\x92\xb9\x07\x86\xf0\xb9\x163\r\xbbS;\xc3\xbeE\xb4\xa1\xbfh\xae"
+    b"\xd0\xbf\xb4\xbb?\xc1z\xa1\x92\xc1\xc3\xd2\xa4\xc1\x81@\xdf\xc1\xd5\xa5q\xc2;b\x95\xc2\x1dV\xf3\xc2\xa5V"
+    b"\xf8\xc2?Kl\xc3\xcc\xd3\xe8\xc4\xe8\x955\xc53\x8b}\xc5\xa4]U\xc6\x89\x87\x86\xc6\x0e\xc6\xda\xc6\xba\x81"
+    b'\xff\xc6\x97\xd5\x0c\xc7dW\x97\xc7B\xb6\xb7\xc9T\x8e<\xcb\x14\xb8\x97\xcc"^\x06\xcd\x92%)\xcd\x7f\x8a'
+    b"[\xcd\tn\xfc\xcd\x16ig\xd1\xe7\xa7z\xd1\xad\xf3\xd5\xd1\x83\x1d\x82\xd2\xed\xad\x89\xd3d\x00)\xd4v\x16"
+    b"L\xd4Z8a\xd4\xd0\xc2\x89\xd5\xbf\n\xb5\xd5k\x1b+\xd6\x92\xba\x11\xd8\\\x9d\x19\xd8O4\xa9\xd8\xcb\xf9"
+    b"\xeb\xd9VHU\xda\xbc]\xde\xda\x03Y\xf1\xda\x89^O\xdb\xa9\xe9Y\xdb0\x00\xa0\xdbn*\xa1\xdc\x99w"
+    b"@\xdeRI\xe6\xdeR\xdc\x10\xdf\xe9G<\xdf\xc23~\xdfg\xe9\x80\xdf\xdc\xdf\xb4\xdf\x95x\x9d\xe0]\xcb"
+    b"\xc3\xe2\x95w\xa3\xe44\xba\xb1\xe4WV\xca\xe4;\x9f@\xe5@\x81\xee\xe5\xb7\x00\x11\xe7I\xd0/\xe8\x87\xc4"
+    b"\xab\xe8\x95\x8f\xae\xe8\xf8\xdf=\xe9\x13!%\xear\xf0\xae\xea\xe5\x0c\t\xed\xe0\xdfT\xed/xy\xed/9"
+    b"\x9a\xee\x1c\x8a\xcb\xeej\xe8\xcf\xee\xb5a\x1f\xefb\xabC\xef\x0e\xc4\xaf\xf0\x95)\xb0\xf0\x974-\xf1\xbd\x0c"
+    b".\xf2)\x9e`\xf31\xd9\xee\xf3\xfa\x95\xfc\xf3\xdc\x97\x06\xf4\tdW\xf4\x8e\xb9\x87\xf4E\x1e\xd1\xf4\xe7`"
+    b"k\xf5\x06\xe8\xa1\xf5\xf1k\xbe\xf5\xd1Wa\xf7\xa6Hp\xf7\xe8\xe3'\xf9\xafz\xce\xf9wr\x05\xfcD0"
+    b"I\xfc^\xee\xa0\xfd\x9d\xa0\xdd\xfe>L?\xff\x00\x00\x00\x00G\x00\x00\x00_\x00\x00\x00k\x00\x00\x00x\x00"
+    b"\x00\x00\x84\x00\x00\x00\x90\x00\x00\x00\x96\x00\x00\x00\x9c\x00\x00\x00\xae\x00\x00\x00\xc9\x00\x00\x00\xdb\x00\x00\x00\xe7\x00"
+    b"\x00\x00\xf7\x00\x00\x00\x04\x01\x00\x00\x10\x01\x00\x00\x17\x01\x00\x00\x1e\x01\x00\x00*\x01\x00\x000\x01\x00\x006\x01"
+    b"\x00\x00B\x01\x00\x00N\x01\x00\x00j\x01\x00\x00v\x01\x00\x00\x8f\x01\x00\x00\x94\x01\x00\x00\xac\x01\x00\x00\xb6\x01"
+    b"\x00\x00\xc3\x01\x00\x00\xc9\x01\x00\x00\xd5\x01\x00\x00\xe7\x01\x00\x00\xf0\x01\x00\x00\r\x02\x00\x00*\x02\x00\x007\x02"
+    b"\x00\x00I\x02\x00\x00U\x02\x00\x00X\x02\x00\x00b\x02\x00\x00n\x02\x00\x00z\x02\x00\x00\x86\x02\x00\x00\x90\x02"
+    b"\x00\x00\x9f\x02\x00\x00\xbb\x02\x00\x00\xdd\x02\x00\x00\xe6\x02\x00\x00\xfe\x02\x00\x00\x0e\x03\x00\x00\x14\x03\x00\x00W\x03"
+    b"\x00\x00^\x03\x00\x00d\x03\x00\x00j\x03\x00\x00\x93\x03\x00\x00\x9c\x03\x00\x00\xa8\x03\x00\x00\xae\x03\x00\x00\xcb\x03"
+    b"\x00\x00\xd1\x03\x00\x00\xe2\x03\x00\x00\xf1\x03\x00\x00\xfc\x03\x00\x00\x11\x04\x00\x002\x04\x00\x00D\x04\x00\x00W\x04"
+    b"\x00\x00l\x04\x00\x00s\x04\x00\x00\x92\x04\x00\x00\x9b\x04\x00\x00\xa5\x04\x00\x00\xb7\x04\x00\x00\xc3\x04\x00\x00\xd8\x04"
+    b"\x00\x00\xe4\x04\x00\x00\xed\x04\x00\x00\xf7\x04\x00\x00(\x05\x00\x00/\x05\x00\x005\x05\x00\x00A\x05\x00\x00J\x05"
+    b"\x00\x00P\x05\x00\x00\\\x05\x00\x00c\x05\x00\x00r\x05\x00\x00{\x05\x00\x00\x81\x05\x00\x00\x99\x05\x00\x00\xa2\x05"
+    b"\x00\x00\xa8\x05\x00\x00\xc9\x05\x00\x00\xdd\x05\x00\x00\xec\x05\x00\x00\xf8\x05\x00\x00\x03\x06\x00\x00\t\x06\x00\x00\x15\x06"
+    b"\x00\x008\x06\x00\x00J\x06\x00\x00V\x06\x00\x00\\\x06\x00\x00n\x06\x00\x00{\x06\x00\x00\x8a\x06\x00\x00\x94\x06"
+    b"\x00\x00\x9a\x06\x00\x00\xa6\x06\x00\x00\xb1\x06\x00\x00\xb4\x06\x00\x00\xbd\x06\x00\x00\xd5\x06\x00\x00\xe5\x06\x00\x00\x02\x07"
+    b"\x00\x00\x0e\x07\x00\x00&\x07\x00\x00E\x07\x00\x00K\x07\x00\x00W\x07\x00\x00f\x07\x00\x00o\x07\x00\x00v\x07"
+    b"\x00\x00|\x07\x00\x00\x83\x07\x00\x00\xa5\x07\x00\x00\xae\x07\x00\x00\xcc\x07\x00\x00\xdb\x07\x00\x00\xe4\x07\x00\x00\xed\x07"
+    b"\x00\x00\xf4\x07\x00\x00$\x08\x00\x000\x08\x00\x009\x08\x00\x00C\x08\x00\x00X\x08\x00\x00f\x08\x00\x00u\x08"
+    b"\x00\x00\x81\x08\x00\x00\x90\x08\x00\x00\x96\x08\x00\x00\x9f\x08\x00\x00\xae\x08\x00\x00\xc9\x08\x00\x00\xcf\x08\x00\x00\xd5\x08"
+    b"\x00\x00\xf0\x08\x00\x00\x0b\t\x00\x00\x11\t\x00\x00\x1d\t\x00\x00&\t\x00\x00H\t\x00\x00R\t\x00\x00\x98\t"
+    b"\x00\x00\xb7\t\x00\x00\xc3\t\x00\x00\xc9\t\x00\x00\xd5\t\x00\x00\xf1\t\x00\x00\x00\n\x00\x00\x0c\n\x00\x00\x15\n"
+    b"\x00\x00\x1b\n\x00\x00%\n\x00\x00(\n\x00\x004\n\x00\x00L\n\x00\x00S\n\x00\x00_\n\x00\x00e\n"
+    b"\x00\x00n\n\x00\x00}\n\x00\x00\x8c\n\x00\x00\x98\n\x00\x00\xa4\n\x00\x00\xaa\n\x00\x00\xb0\n\x00\x00\xbc\n"
+    b"\x00\x00\xc8\n\x00\x00\xd8\n\x00\x00\xe8\n\x00\x00\xec\n\x00\x00\n\x0b\x00\x00\x10\x0b\x00\x00\x1c\x0b\x00\x00O\x0b"
+    b"\x00\x00[\x0b\x00\x00\x94\x0b\x00\x00\xa2\x0b\x00\x00\xb3\x0b\x00\x00\xb9\x0b\x00\x00\xc8\x0b\x00\x00\xd4\x0b\x00\x00\xe3\x0b"
+    b"\x00\x00\x0e\x0c\x00\x00 \x0c\x00\x009\x0c\x00\x00?\x0c\x00\x00c\x0c\x00\x00o\x0c\x00\x00\x96\x0c\x00\x00\xc8\x0c"
+    b"\x00\x00\xe2\x0c\x00\x00G\r\x00\x00f\r\x00\x00r\r\x00\x00{\r\x00\x00\x87\r\x00\x00\x9f\r\x00\x00\xa5\r"
+    b"\x00\x00\xb1\r\x00\x00\xc4\r\x00\x00\xcd\r\x00\x00\xd9\r\x00\x00\xfd\r\x00\x00\x0f\x0e\x00\x00\x1b\x0e\x00\x00!\x0e"
+    b"\x00\x00$\x0e\x00\x00'\x0e\x00\x00.\x0e\x00\x00G\x0e\x00\x00S\x0e\x00\x00_\x0e\x00\x00e\x0e\x00\x00q\x0e"
+    b"\x00\x00~\x0e\x00\x00\x8d\x0e\x00\x00\xa6\x0e\x00\x00\xba\x0e\x00\x00\xc3\x0e\x00\x00\xcf\x0e\x00\x00\xd8\x0e\x00\x00\xe7\x0e"
+    b"\x00\x00\xf2\x0e\x00\x00\x02\x0f\x00\x00\x11\x0f\x00\x00!\x0f\x00\x00'\x0f\x00\x009\x0f\x00\x00H\x0f\x00\x00N\x0f"
+    b"\x00\x00W\x0f\x00\x00m\x0f\x00\x00z\x0f\x00\x00\x86\x0f\x00\x00\xa0\x0f\x00\x00\xa6\x0f\x00\x00\xb3\x0f\x00\x00\xb9\x0f"
+    b"\x00\x00\xca\x0f\x00\x00\xdf\x0f\x00\x00\xe5\x0f\x00\x00\xfd\x0f\x00\x00\x06\x10\x00\x00\x12\x10\x00\x00\x18\x10\x00\x00\x1e\x10"
+    b"\x00\x00*\x10\x00\x00?\x10\x00\x00\x82\x10\x00\x00\x9a\x10\x00\x00\xa0\x10\x00\x00\xb8\x10\x00\x00\xc6\x10\x00\x00\xed\x10"
+    b"\x00\x00\xfc\x10\x00\x00\x05\x11\x00\x00\x11\x11\x00\x00\x1a\x11\x00\x00&\x11\x00\x004\x11\x00\x00O\x11\x00\x00U\x11"
+    b"\x00\x00^\x11\x00\x00m\x11\x00\x00s\x11\x00\x00\x83\x11\x00\x00\x89\x11\x00\x00\x98\x11\x00\x00\xad\x11\x00\x00\xb6\x11"
+    b"\x00\x00+\x12\x00\x004\x12\x00\x00;\x12\x00\x00A\x12\x00\x00J\x12\x00\x00Y\x12\x00\x00e\x12\x00\x00u\x12"
+    b"\x00\x00~\x12\x00\x00\x9c\x12\x00\x00\xa9\x12\x00\x00\xb2\x12\x00\x00\xb8\x12\x00\x00\xca\x12\x00\x00\xdc\x12\x00\x00(\x13"
+    b"\x00\x00;\x13\x00\x00J\x13\x00\x00V\x13\x00\x00t\x13\x00\x00\x87\x13\x00\x00\x90\x13\x00\x00\x99\x13\x00\x00\xa5\x13"
+    b"\x00\x00\xbe\x13\x00\x00\xd0\x13\x00\x00\xe3\x13\x00\x00\xef\x13\x00\x00\xf2\x13\x00\x00\x00\x14\x00\x00\x06\x14\x00\x00$\x14"
+    b"\x00\x00*\x14\x00\x006\x14\x00\x00=\x14\x00\x00~\x14\x00\x00\x8a\x14\x00\x00\x96\x14\x00\x00\xa5\x14\x00\x00\xc0\x14"
+    b"\x00\x00\xcc\x14\x00\x00\xd9\x14\x00\x00\xe0\x14\x00\x00\xeb\x14\x00\x00\x08\x15\x00\x00\x17\x15\x00\x00&\x15\x00\x002\x15"
+    b"\x00\x008\x15\x00\x00D\x15\x00\x00r\x15\x00\x00\x93\x15\x00\x00\xa2\x15\x00\x00\xa8\x15\x00\x00\xba\x15\x00\x00\xc3\x15"
+    b"\x00\x00\xc9\x15\x00\x00\xd5\x15\x00\x00\xe1\x15\x00\x00\xfe\x15\x00\x00\x1f\x16\x00\x006\x16\x00\x00B\x16\x00\x00b\x16"
+    b"\x00\x00s\x16\x00\x00\x8a\x16\x00\x00\xd3\x16\x00\x00\xd6\x16\x00\x00\xdf\x16\x00\x00\xf4\x16\x00\x00\t\x17\x00\x00\x18\x17"
+    b"\x00\x00-\x17\x00\x00B\x17\x00\x00K\x17\x00\x00W\x17\x00\x00t\x17\x00\x00z\x17\x00\x00\x86\x17\x00\x00\x92\x17"
+    b"\x00\x00\xd1\x17\x00\x00\xe0\x17\x00\x00\xe9\x17\x00\x00\xfe\x17\x00\x00\x13\x18\x00\x00\x1a\x18\x00\x00)\x18\x00\x00\xe5\xb0"
+    b"\x86 BIP39 \xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe7\x9a\x84\xe6\xaf\x8f\xe4\xb8\xaa\xe8\xaf\x8d\xe4\xbd\x9c"
+    b"\xe4\xb8\xba 1 \xe5\x88\xb0 4000 \xe7\x9a\x84\xe5\x85\xab\xe8\xbf\x9b\xe5\x88\xb6\xe6\x95\xb0\xe8\xbe"
+    b"\x93\xe5\x85\xa5.\xe6\x94\xb6\xe9\x9b\x86\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4\xe7\x86\xb5\xe5\xa4\xb1\xe8\xb4\xa5\xe6\x96\xb0"
+    b"\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8dPBKDF2\xe8\xbf\xad\xe4\xbb\xa3.\xe8\xbf\x9b\xe7\xbb\x99\xe9\x80\x9f\xe5"
+    b"\xba\xa6\xe5\x88\x87\xe5\x89\xb2\xe6\xb7\xb1\xe5\xba\xa6\xe7\xa1\xac\xe4\xbb\xb6\xe4\xbf\x9d\xe5\xad\x98\xe6\x89\x93\xe5\x8d\xb0"
+    b"\xe5\x88\xb0\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe4\xbb\x8e\xe7\x9f\xad\xe4\xbf\xa1\xe5\x88\x9b\xe5\xbb\xba\xe4\xba\x8c\xe7\xbb"
+    b"\xb4\xe7\xa0\x81\xef\xbc\x9f\xe6\x88\x90\xe4\xb8\xba\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6% \xe7\x9a\x84\xe9\x87"
+    b"\x91\xe9\xa2\x9d.\xe4\xbb\x8e SD \xe5\x8d\xa1\xe5\x8a\xa0\xe8\xbd\xbd\xe6\x97\xa0\xe6\x95\x88\xe9\x92\xb1\xe5\x8c"
+    b"\x85:\xe6\x80\xa7\xe8\x83\xbd\xe6\xb5\x8b\xe8\xaf\x95\xe8\xb4\xb9\xe7\x94\xa8:\xe6\x96\x87\xe6\x9c\xac:\xe8\x84\x9a\xe6"
+    b"\x9c\xac\xe7\xb1\xbb\xe5\x9e\x8b\xe7\xb5\x90\xe6\x9e\x9c\xe5\x8a\xa0\xe5\xaf\x86\xe9\xa9\xb1\xe5\x8a\xa8\xe7\xa8\x8b\xe5\xba\x8f"
+    b"\xe8\xa7\xa3\xe5\xaf\x86\xe5\xa4\xb1\xe8\xb4\xa5\xe6\x9b\xb4\xe6\x94\xb9\xe5\xb0\x86\xe5\x9c\xa8\xe5\x85\xb3\xe6\x9c\xba\xe5\x89"
+    b"\x8d\xe4\xbf\x9d\xe6\x8c\x81.\xe5\x85\xb6\xe4\xbb\x96\xe6\xa0\xbc\xe5\xbc\x8f\xe8\xbe\x93\xe5\x85\xa5 BIP39"
+    b" Phrasephrase%s\xe4\xbd\x8d\xe7\xa1\xae\xe8\xae\xa4\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94"
+    b"\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81\xe6\x8e\xb7\xe9\xaa\xb0\xe5\xad\x90:\xe5\xaf\x86\xe7\xa0\x81\xe9\x95\xbf\xe5\xba\xa6"
+    b":\xe8\xae\xbe\xe7\xbd\xae\xe6\x94\xbf\xe7\xad\x96\xe7\xb1\xbb\xe5\x9e\x8b\xe6\xa3\x80\xe6\xb5\x8b\xe5\x88\xb0\xe6\xa8\xa1\xe5"
+    b"\xbc\x8f\xef\xbc\x81\xe9\x80\x9a\xe8\xbf\x87 D6\xe8\xbe\x93\xe5\x85\xa5\xe6\xaf\x8f\xe4\xb8\xaa BIP39"
+    b" \xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d.\xe8\xae\xbe\xe7\xbd\xae\xe5\xad\x98\xe5\x82\xa8\xe5\x9c\xa8 Flash"
+    b" \xe5\x86\x85\xe9\x83\xa8.\xe8\xbd\xac\xe6\x8d\xa2\xe5\xa4\xb1\xe8\xb4\xa5.\xe9\x80\x9a\xe8\xbf\x87\xe6\x89\x8b\xe5\x8a"
+    b"\xa8\xe8\xbe\x93\xe5\x85\xa5\xe5\x88\x87\xe5\x89\xb2\xe6\x96\xb9\xe6\xb3\x95\xe5\x8e\xbb\xe6\x88\x90\xe5\x8a\x9f\xe7\x8e\x87:"
+    b"\xe6\x94\xbe\xe5\xa4\xa7\xe6\xa8\xa1\xe5\xbc\x8f\xe5\x8f\x8d\xe8\xbd\xac\xe9\xa2\x9c\xe8\x89\xb2\xe7\x86\xb5\xe4\xb8\x8d\xe8\xb6"
+    b"\xb3\xef\xbc\x81\xe5\xb7\xb2\xe5\x88\x9b\xe5\xbb\xba:\xe5\x8f\x8c\xe9\x87\x8d\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe6\xad\xa3"
+    b"\xe5\x9c\xa8\xe5\xb0\x86%s\xe5\xaf\xbc\xe5\x87\xba\xe5\x88\xb0SD\xe5\x8d\xa1\xe2\x80\xa6\xe5\xb0\x86\xe4\xba\x8c\xe7"
+    b"\xbb\xb4\xe7\xa0\x81\xe5\x9b\xbe\xe5\x83\x8f\xe4\xbf\x9d\xe5\xad\x98\xe5\x88\xb0 SD \xe5\x8d\xa1RX \xe5\xbc"
+    b"\x95\xe8\x84\x9a\xe8\xae\xbe\xe7\xbd\xae\xe5\xad\x98\xe5\x82\xa8\xe5\x9c\xa8SD\xe5\x8d\xa1\xe4\xb8\x8a.\xe5\xad\x98\xe5"
+    b"\x82\xa8\xe5\x88\xb0 SD \xe5\x8d\xa1\xe5\xb7\xa5\xe5\x85\xb7\xe8\x87\xaa\xe5\xae\x9a\xe4\xb9\x89\xe6\x82\xa8\xe7\x9a"
+    b"\x84\xe9\x92\xb1\xe5\x8c\x85\xe5\xb0\x86\xe7\x94\x9f\xe6\x88\x90\xe4\xb8\x80\xe4\xb8\xaa\xe6\x96\xb0\xe7\x9a\x84\xe5\xaf\x86\xe9"
+    b"\x92\xa5\xe5\xb9\xb6\xe5\x8d\xb8\xe8\xbd\xbd\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6.\xe6\xb6\x88\xe6\x81\xaf:\xe7\xbc\xa9\xe6"
+    b"\x94\xbe\xe8\xaf\xad\xe8\xa8\x80\xe6\x8e\xb7\xe9\xaa\xb0\xe5\xad\x90\xe8\x87\xb3\xe5\xb0\x91 %d \xe6\xac\xa1\xe4\xbb"
+    b"\xa5\xe7\x94\x9f\xe6\x88\x90\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d.\xe5\x85\xb3\xe9\x97\xad\xe2\x80\xa6\xe4\xb8\x8b\xe5\x88\x80"
+    b"\xe9\x80\x9f\xe5\xba\xa6\xe8\xaf\x8d %d\xe7\x82\xb9\xe5\x87\xbb\xe6\x88\x96\xe6\x8c\x89\xe4\xb8\x8b ENTE"
+    b"R \xe5\xae\x89\xe8\xa3\x85.\xe5\xbc\xba\xe5\xba\xa6\xe5\xbf\xab\xe7\x85\xa7\xe7\x9a\x84 SHA256:"
+    b"\xe4\xbb\x8e\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6Flash\xe5\x9c\xb0\xe5\x9b\xbe\xe6\x89\x93\xe5\x8d\xb0"
+    b"\xe5\x88\xb0\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xef\xbc\x9f\xe6\x96\x87\xe4\xbb\xb6\xe5\x90\x8d %s \xe5\xad\x98\xe5"
+    b"\x9c\xa8\xe4\xba\x8e SD \xe5\x8d\xa1\xe4\xb8\x8a.\xe6\x97\xa0\xe6\x95\x88\xe7\x9a\x84\xe6\xba\x90\xe8\xb7\xaf\xe5"
+    b"\xbe\x84\xe4\xbb\x8e SD \xe5\x8d\xa1\xe5\x8a\xa0\xe8\xbd\xbd\xef\xbc\x9f\xe5\x88\x87\xe6\x8d\xa2\xe4\xba\xae\xe5\xba"
+    b"\xa6\xe7\x9a\x84\xe9\xa1\xb5\xe9\x9d\xa2\xe9\x94\x99\xe8\xaf\xaf:\xe6\xad\xa3\xe7\xa1\xae\xe5\xaf\xb9\xe9\xbd\x90\xe6\x91\x84"
+    b"\xe5\x83\x8f\xe5\xa4\xb4\xe5\x92\x8c\xe8\x83\x8c\xe6\x9d\xbf.XOR\xe7\xbb\x93\xe6\x9e\x9cLCD \xe7\xb1\xbb"
+    b"\xe5\x9e\x8b\xe6\xb5\x8b\xe8\xaf\x95\xe5\xa5\x97\xe4\xbb\xb6\xe7\xbb\x93\xe6\x9e\x9c\xe7\xa7\xbb\xe4\xbd\x8d\xe6\xa1\x88\xe4\xbe"
+    b"\x8b\xe6\x89\xab\xe6\x8f\x8f\xe7\xa7\x81\xe9\x92\xa5\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe8\xbe\xb9\xe6\xa1\x86\xe5\xa1\xab\xe5"
+    b"\x85\x85\xe8\xa1\x8c\xe5\xbb\xb6\xe8\xbf\x9f\xe7\x86\xb5\xe5\x80\xbc\xe4\xbd\x8e!\xe5\xb0\x86\xe6\x89\x93\xe5\xad\x94\xe7\x82"
+    b"\xb9\xe6\xb6\x82\xe9\xbb\x91\xef\xbc\x8c\xe4\xbb\xa5\xe4\xbe\xbf\xe5\xae\x83\xe4\xbb\xac\xe8\x83\xbd\xe8\xa2\xab\xe6\xa3\x80\xe6"
+    b"\xb5\x8b\xe5\x88\xb0.\xe4\xbb\x8eutf8\xe5\xae\x89\xe5\x85\xa8\xe8\xb4\xa6\xe6\x88\xb7\xe7\xb4\xa2\xe5\xbc\x95\xe7"
+    b"\xa1\xae\xe5\xae\x9a\xef\xbc\x9f\xe7\xad\xbe\xe5\x90\x8d\xe6\xa0\x87\xe5\x87\x86\xe6\xa8\xa1\xe5\xbc\x8f\xe7\xa9\xba\xe9\x97\xb2"
+    b":\xef\xbc\x88\xe4\xbb\x85\xe8\xa7\x82\xe5\xaf\x9f\xef\xbc\x89\xe7\xad\xbe\xe5\x90\x8d\xe2\x80\xa6\xe7\xb4\xa2\xe5\xbc\x95\xe6"
+    b"\xad\xa3\xe5\x9c\xa8\xe5\x8a\xa0\xe8\xbd\xbd\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4\xe2\x80\xa6\xe6\x89\x93\xe5\x8d\xb0\xe6\x9c\xba"
+    b"\xe6\x92\xa4\xe9\x94\x80\xe4\xbd\xbf\xe7\x94\xa8\xe6\x8c\x87\xe7\xba\xb9\xe4\xbd\x9c\xe4\xb8\xba\xe8\xba\xab\xe4\xbb\xbd\xe8\xaf"
+    b"\x81\xe4\xbb\xb6\xef\xbc\x9f\xe6\x8e\xb7\xe9\xaa\xb0\xe5\xad\x90\xe7\x9a\x84 SHA256:\xe4\xba\x8c\xe7\xbb"
+    b"\xb4\xe7\xa0\x81\xe6\xa0\x87\xe7\xad\xbe\xe8\xaf\xad\xe8\xa8\x80\xe7\x8e\xaf\xe5\xa2\x83\xe5\xb7\xb2\xe7\xa7\xbb\xe9\x99\xa4%"
+    b"s\xe7\x83\xad\xe6\x95\x8f%d/%d \xe5\xa4\x9a\xe7\xad\xbe\xe5\xb7\xb2\xe6\xa3\x80\xe6\x9f\xa5 %d "
+    b"\xe4\xb8\xaa\xe4\xb8\x8d\xe5\x8c\xb9\xe9\x85\x8d\xe7\x9a\x84\xe5\x9c\xb0\xe5\x9d\x80.\xe6\x89\x93\xe5\x8d\xb0Tiny"
+    b"seed \xef\xbc\x9f\xe8\x89\xaf\xe5\xa5\xbd\xe7\x9a\x84\xe7\x86\xb5\xe6\x89\xbe\xe9\x9b\xb6\xe6\x9e\x81\xe5\xae\xa2"
+    b"\xe7\xbb\x9f\xe8\xae\xa1\xe6\x95\xb0\xe6\x8d\xae\xe4\xbf\xae\xe6\x94\xb9\xe6\x97\xb6\xe9\x97\xb4:\xe5\x8a\xa0\xe5\xaf\x86\xe4"
+    b"\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe9\x80\x9a\xe8\xbf\x87 D20\xe8\x8a\xb1\xe8\xb4\xb9\xe9\xbb\x98\xe8\xae\xa4\xe9\x92"
+    b"\xb1\xe5\x8c\x85N\xe7\x9a\x84M\xe9\x83\xa8\xe5\x88\x86\xe6\x98\xaf24 \xe5\x8d\x95\xe8\xaf\x8d\xe5\xbd\x93\xe5\x89"
+    b"\x8d\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81\xe6\x9b\xb4\xe6\x96\xb0KEF ID "
+    b"\xef\xbc\x9fFlash\xe5\xb7\xb2\xe7\x94\xa8\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4\xe7\x86\xb5\xe5\xa1\xab\xe5\x85\x85"
+    b"\xe5\x88\x80\xe5\x85\xb7\xe7\x9b\xb4\xe5\xbe\x84\xe6\x98\xaf\xe5\x90\xa6\xe5\x88\xa0\xe9\x99\xa4\xe6\xad\xa4\xe6\x96\x87\xe4\xbb"
+    b"\xb6\xef\xbc\x9f\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe5\x92\x8c\xe5\xaf\x86\xe7\xa0\x81\xe5\xb0\x86\xe8\xa2\xab\xe4\xbf\x9d\xe7"
+    b"\x95\x99.\xe4\xb8\xbb\xe9\xa2\x98\xe8\xbd\xac\xe6\x8d\xa2\xe5\x9f\xba\xe5\x87\x86\xe5\x88\xa0\xe9\x99\xa4\xe5\x8a\xa9\xe8\xae"
+    b"\xb0\xe8\xaf\x8d\xe4\xbb\x8ebase64%d\xe5\x88\xb0%d\xe9\x80\x80\xe5\x87\xba\xe7\xad\xbe\xe5\x90\x8d"
+    b":\xe4\xbb\x8e SD \xe5\x8d\xa1\xe4\xb8\xad\xe5\x88\xa0\xe9\x99\xa4\xe5\x9b\xba\xe4\xbb\xb6\xe6\x96\x87\xe4\xbb\xb6"
+    b"\xef\xbc\x9f\xe5\x85\xab\xe8\xbf\x9b\xe5\x88\xb6\xe6\x9b\xb4\xe6\x94\xb9\xe4\xb8\xbb\xe9\xa2\x98\xe5\xb9\xb6\xe9\x87\x8d\xe6\x96"
+    b"\xb0\xe5\x90\xaf\xe5\x8a\xa8\xef\xbc\x9f\xe5\x8a\xa9\xe8\xae\xb0\xe7\xac\xa6\xe5\xbc\x82\xe6\x88\x96\xe5\x88\xb0base"
+    b"43\xe5\xbd\x93\xe5\x89\x8d\xe5\x80\xbc\xe5\x8c\xba\xe5\x9f\x9f:\xe8\xaf\xb7\xe6\xa3\x80\xe6\x9f\xa5\xe6\x89\xab\xe6\x8f"
+    b"\x8f\xe7\x9a\x84\xe6\x95\xb0\xe6\x8d\xae\xef\xbc\x8c\xe5\xa6\x82\xe6\x9c\x89\xe5\xbf\x85\xe8\xa6\x81\xe8\xaf\xb7\xe7\xbc\x96\xe8"
+    b"\xbe\x91\xe5\xae\x8c\xe6\x88\x90\xe8\xbd\xac\xe6\x8d\xa2\xe5\x90\xaf\xe7\x94\xa8\xef\xbc\x9f\xe4\xba\x8c\xe8\xbf\x9b\xe5\x88\xb6"
+    b":\xe5\x8f\xaf\xe8\xaf\x81\xe6\x98\x8e\xe4\xb8\x8d\xe5\x8f\xaf\xe4\xbd\xbf\xe7\x94\xa8%s :\xe5\xb7\xb2\xe5\x8a\xa0"
+    b"\xe8\xbd\xbd!\xe6\x98\x8e\xe6\x96\x87\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe6\x89\xa9\xe5\xb1\x95\xe5\x85\xac\xe9\x92\xa5\xe6"
+    b"\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6\xe5\x9c\xb0\xe5\x9d\x80\xe6\x95\xb0\xe9\x87\x8f\xe5\x88\xb0base32\xe8\x87\xaa"
+    b"\xe5\xae\x9a\xe4\xb9\x89\xe6\x96\x87\xe6\x9c\xac\xe6\xad\xa3\xe5\x9c\xa8\xe5\x88\xa0\xe9\x99\xa4\xe7\x94\xa8\xe6\x88\xb7\xe6\x95"
+    b"\xb0\xe6\x8d\xae\xe2\x80\xa6\xe5\x8a\x9f\xe7\x8e\x87\xe5\x9c\xb0\xe5\x9d\x80\xe6\xad\xa3\xe5\x9c\xa8\xe5\x8a\xa0\xe8\xbd\xbd\xe6"
+    b"\x9b\xb4\xe6\x94\xb9\xe5\x9c\xb0\xe5\x9d\x80\xe2\x80\xa6\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81"
+    b"\xe4\xb8\x8d\xe5\x8c\xb9\xe9\x85\x8d\xe5\x85\xb3\xe6\x9c\xba\xe6\x98\xbe\xe7\xa4\xba\xe5\x9f\xba\xe5\x87\x86\xe4\xba\x8c\xe7\xbb"
+    b"\xb4\xe7\xa0\x81\xe5\x8a\xa0\xe5\xaf\x86\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe5\xb7\xb2\xe5\xad\x98\xe5\x82\xa8\xef\xbc\x8cI"
+    b"D \xe4\xb8\xba:BGR \xe9\xa2\x9c\xe8\x89\xb2\xe5\x9c\xa8\xe5\x85\xb6\xe4\xbb\x96\xe8\xae\xbe\xe5\xa4\x87\xe4"
+    b"\xb8\xad\xe5\xae\x8c\xe5\x85\xa8\xe6\x93\xa6\xe9\x99\xa4\xe6\x82\xa8\xe7\x9a\x84 SD \xe5\x8d\xa1\xe4\xbb\xa5\xe7\xa1"
+    b"\xae\xe4\xbf\x9d\xe6\x95\xb0\xe6\x8d\xae\xe4\xb8\x8d\xe5\x8f\xaf\xe6\x81\xa2\xe5\xa4\x8d\xe5\x9c\xa8\xe5\x89\x8d %d "
+    b"\xe4\xb8\xaa\xe5\x9c\xb0\xe5\x9d\x80\xe4\xb8\xad\xe6\x9c\xaa\xe6\x89\xbe\xe5\x88\xb0\xe5\xaf\xbc\xe5\x87\xba\xe5\x9c\xb0\xe5\x9d"
+    b"\x80\xe7\x89\x88\xe6\x9c\xac\xe4\xbb\x8e\xe5\xad\x98\xe5\x82\xa8\xe4\xb8\xad\xe7\x82\xb9\xe5\x87\xbb\xe6\x88\x96\xe6\x8c\x89\xe4"
+    b"\xb8\x8b ENTER \xe6\x88\xaa\xe5\x9b\xbe\xe4\xbb\x8e\xe7\x9b\xb8\xe6\x9c\xba\xe5\x8a\xa0\xe8\xbd\xbd\xe9\x80"
+    b"\x9a\xe8\xbf\x87\xe5\x8d\x95\xe8\xaf\x8d\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe5\x85\xb3\xe4\xba\x8e\xe9\xa6\x99\xe5\x86\x9c\xe7"
+    b"\x86\xb5:\xe5\x8f\xb3\xe7\xad\xbe\xe5\x90\x8d\xe6\xb6\x88\xe6\x81\xaf\xe8\xbe\x93\xe5\x85\xa5 %d \xe4\xb8\xaa "
+    b"BIP39 \xe8\xaf\x8d.\xe5\xa4\xa7\xe5\xb0\x8f:\xe5\xb1\x8f\xe4\xbf\x9d\xe6\x97\xb6\xe9\x97\xb4\xe6\xb6\x88"
+    b"\xe6\x81\xaf%s \xe5\xad\x97\xe8\x8a\x82\xe6\x8c\x89\xe9\x92\xae\xe5\x8e\xbb\xe6\x8a\x96\xe5\x8a\xa8\xe4\xba\x8c\xe8\xbf"
+    b"\x9b\xe5\x88\xb6\xe7\xbd\x91\xe6\xa0\xbc\xe8\xbe\x93\xe5\x85\xa5\xe7\xa7\x81\xe9\x92\xa5\xe5\x8f\xaf\xe8\xa7\x81\xe6\xa0\x87\xe7"
+    b"\xad\xbe\xe9\x92\xb1\xe5\x8c\x85\xe5\x8d\x95\xe4\xbd\x8d\xe8\x8a\xb1\xe8\xb4\xb9 (%d):\xe5\x9f\xba\xe5\x87\x86"
+    b"\xe5\xb7\xa5\xe5\x85\xb7\xe4\xbf\x9d\xe5\xad\x98\xe5\x88\xb0 SD \xe5\x8d\xa1 \xe9\x9d\x9e\xe6\x9c\x89\xe6\x95\x88"
+    b"\xe5\x9c\xb0\xe5\x9d\x80\xe8\xa1\x8c:\xe8\xaf\xb7\xe5\x85\x88\xe8\xae\xbe\xe7\xbd\xae\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6"
+    b"\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81\xe5\x8a\xa0\xe5\xaf\x86\xe5\x8a\xa0\xe8\xbd\xbd\xe4\xb8\xad\xe2\x80\xa6\xe5\x8a\xa0\xe8\xbd\xbd"
+    b"\xe5\x8f\x97\xe4\xbf\xa1\xe4\xbb\xbb\xe7\x9a\x84\xe9\x92\xb1\xe5\x8c\x85\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6\xe4\xbb\xa5\xe6\x9f"
+    b"\xa5\xe7\x9c\x8b\xe5\x9c\xb0\xe5\x9d\x80\xef\xbc\x9f\xe7\xad\xbe\xe5\x90\x8d\xe6\x97\xa0\xe6\x95\x88\xe8\xa6\x81\xe7\xa1\xae\xe4"
+    b"\xbf\x9d\xe6\x95\xb0\xe6\x8d\xae\xe4\xb8\x8d\xe5\x8f\xaf\xe6\x81\xa2\xe5\xa4\x8d\xef\xbc\x8c\xe8\xaf\xb7\xe4\xbd\xbf\xe7\x94\xa8"
+    b"\xe6\x93\xa6\xe9\x99\xa4\xe8\xae\xbe\xe5\xa4\x87\xe5\x8a\x9f\xe8\x83\xbdTR\xe5\x86\x85\xe9\x83\xa8\xe5\xaf\x86\xe9\x92\xa5"
+    b"Static  \xe9\x9d\x99\xe6\x80\x81\xef\xbc\x9f\xe5\x8d\x95\xe7\xad\xbe\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81"
+    b"\xe7\xad\xbe\xe5\x90\x8d\xe9\x92\xb1\xe5\x8c\x85\xe6\x8f\x8f\xe8\xbf\xb0\xe6\x97\xa0 Passphrase"
+    b" \xe8\xbe\x93\xe5\x85\xa56\xe4\xb8\xaa\xe4\xbb\xa5\xe4\xb8\x8a\xe5\xad\x97\xe7\xac\xa6\xe7\x9a\x84\xe9\x98\xb2\xe7\xaf\xa1"
+    b"\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81\xe6\x97"
+    b"\xa0\xe6\xb3\x95\xe6\x89\xa7\xe8\xa1\x8c\xe6\x9f\x90\xe4\xba\x9b\xe6\xa3\x80\xe6\x9f\xa5.\xe6\x8c\x89\xe9\x92\xae\xe6\x81\xa2"
+    b"\xe5\xa4\x8d\xe5\x87\xba\xe5\x8e\x82\xe8\xae\xbe\xe7\xbd\xae\xe5\xb9\xb6\xe9\x87\x8d\xe6\x96\xb0\xe8\xae\xbe\xe5\xa4\x87\xef\xbc"
+    b"\x9f\xe5\x8a\xa0\xe8\xbd\xbd\xe9\x92\xb1\xe5\x8c\x85\xe4\xbd\xbf\xe7\x94\xa8\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4\xe7\x9a\x84\xe7"
+    b"\x86\xb5\xe5\x88\x9b\xe5\xbb\xba\xe6\x96\xb0\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe7\xad\xbe\xe5\x90\x8d\xe5\x8e\x9f\xe5\xa7\x8b"
+    b"\xe5\x93\x88\xe5\xb8\x8c.\xe4\xbb\x85\xe5\xbd\x93\xe6\x82\xa8\xe4\xbf\xa1\xe4\xbb\xbb\xe6\xba\x90\xe6\x97\xb6\xe6\x89\x8d\xe7"
+    b"\xbb\xa7\xe7\xbb\xad.\xe5\x90\xaf\xe5\x8a\xa8\xe6\x97\xb6\xe7\x9a\x84 TC Flash Hash"
+    b"\xe5\x9c\xa8\xe6\x82\xa8\xe7\x9a\x84\xe5\xaf\x86\xe7\xa0\x81\xe7\x9f\xad\xe8\xaf\xad\xe4\xb8\xad\xe6\xa3\x80\xe6\xb5\x8b\xe5\x88"
+    b"\xb0\xe9\x9d\x9eASCII\xe5\xad\x97\xe7\xac\xa6.Krux\xe6\x97\xa0\xe6\xb3\x95\xe4\xbf\x9d\xe8\xaf\x81"
+    b"\xe5\x85\xb6\xe4\xbb\x96\xe9\x92\xb1\xe5\x8c\x85\xe5\xb0\x86\xe8\x8e\xb7\xe5\xbe\x97\xe7\x9b\xb8\xe5\x90\x8c\xe7\x9a\x84\xe5\xaf"
+    b"\x86\xe9\x92\xa5.\xe6\x9c\xaa\xe6\x89\xbe\xe5\x88\xb0\xe9\x92\xb1\xe5\x8c\x85\xe8\xbe\x93\xe5\x87\xba\xe6\x8f\x8f\xe8\xbf\xb0"
+    b"\xe7\xac\xa6.\xe6\x97\x8b\xe8\xbd\xac 180\xc2\xb0\xe5\x8d\x81\xe8\xbf\x9b\xe5\x88\xb6\xe7\xad\x89\xe5\xbe\x85\xe6"
+    b"\x88\xaa\xe5\x8f\x96\xe6\x9b\xb4\xe6\x96\xb0\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe6\xa0\x87\xe7\xad\xbe\xef\xbc\x9f\xe4\xba\xae"
+    b"\xe5\xba\xa6Base64\xe5\xaf\x86\xe7\xa0\x81\xe5\x83\x8f\xe7\xb4\xa0\xe5\x81\x8f\xe5\xb7\xae\xe6\x8c\x87\xe6\x95"
+    b"\xb0:\xe7\xbb\xa7\xe7\xbb\xad\xef\xbc\x9f\xe6\x97\xa0\xe6\x95\x88\xe5\x9c\xb0\xe5\x9d\x80\xe9\x92\xb1\xe5\x8c\x85\xe8\xbe\x93"
+    b"\xe5\x87\xba\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6\xe5\x8a\xa0\xe8\xbd\xbd\xe9\x87\x8d\xe5\xa4\x8d\xef\xbc\x81\xe6\x88\x90\xe4\xb8"
+    b"\xba\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6\xe5\x8a\xa0\xe5\xaf\x86\xe6\xa8\xa1\xe5\xbc\x8f\xe6\x96\x87\xe6\x9c\xac\xe5"
+    b"\xbc\xba\xe5\xbc\xb1\xe8\xad\xa6\xe5\x91\x8a:\xe4\xbd\xbf\xe7\x94\xa8\xe9\xbb\x91\xe8\x89\xb2\xe8\x83\x8c\xe6\x99\xaf\xe7\x95"
+    b"\x8c\xe9\x9d\xa2.\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6\xe9\x98\xb2\xe9\x97\xaa\xe6\xa8\xa1\xe5\xbc\x8f\xe6\x8e\xa5"
+    b"\xe6\x94\xb6\xe8\xb0\x83\xe6\x95\xb4\xe4\xba\xae\xe5\xba\xa6\xe6\x9b\xb4\xe6\x8d\xa2\xe9\x92\xb1\xe5\x8c\x85?\xe5\x86\x8d\xe6"
+    b"\xac\xa1\xe5\xb0\x9d\xe8\xaf\x95\xef\xbc\x9f\xe6\x89\xab\xe6\x8f\x8f\xe7\xac\xac 13-24 \xe4\xb8\xaa\xe5\x8d"
+    b"\x95\xe8\xaf\x8d\xe6\x9c\xaa\xe6\xa3\x80\xe6\xb5\x8b\xe5\x88\xb0 SD \xe5\x8d\xa1.12 \xe5\x8d\x95\xe8\xaf"
+    b"\x8d\xe5\x86\x8d\xe6\xac\xa1\xe5\xae\xa1\xe6\xa0\xb8\xe8\xa7\xa3\xe5\xaf\x86\xef\xbc\x9f\xe5\xa4\x87\xe4\xbb\xbd\xe5\x8a\xa9\xe8"
+    b"\xae\xb0\xe8\xaf\x8dFlash\xe5\xb7\xa5\xe5\x85\xb7\xe5\x8d\x87\xe7\xba\xa7\xe5\xb7\xb2\xe5\xae\x8c\xe6\x88\x90."
+    b"\xe4\xbb\x8e\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6(%s\xe4\xbd\x8d/\xe5\x83\x8f\xe7\xb4\xa0\xef\xbc\x89\xe4"
+    b"\xbd\x8d\xe7\xbd\xae\xe5\x88\x86\xe8\xbe\xa8\xe7\x8e\x87 - \xe6\xa0\xbc\xe5\xbc\x8f\xe5\x8a\xa0\xe8\xbd\xbd\xe5\x8a\xa9"
+    b"\xe8\xae\xb0\xe8\xaf\x8d\xe4\xb8\xba\xe7\xa9\xbato_utf8()\xe6\x9c\x89\xe4\xba\x9b\xe8\x8a\x82\xe7\x82"
+    b"\xb9\xe6\x9c\xaa\xe7\xa1\xac\xe5\x8c\x96: SD \xe5\x8d\xa1\xe7\xad\xbe\xe5\x90\x8dID \xe5\xb7\xb2\xe5\xad"
+    b"\x98\xe5\x9c\xa8\xe4\xbd\xbf\xe7\x94\xa8\xe9\xbb\x98\xe8\xae\xa4PBKDF2\xe8\xbf\xad\xe4\xbb\xa3.?\xe6\x9c"
+    b"\xaa\xe7\x9f\xa5\xe9\x95\x9c\xe5\x83\x8fX\xe5\x9d\x90\xe6\xa0\x87\xe7\xbd\x91\xe7\xbb\x9c\xe5\xaf\xbc\xe5\x87\xbaBIP"
+    b"85\xe7\x86\xb5\xef\xbc\x9f\xe5\xad\x98\xe5\x82\xa8\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe5\xa4\xb1\xe8\xb4\xa5\xe5\x8d\x95"
+    b"\xe8\xaf\x8d\xe5\x8a\xa0\xe5\xaf\x86\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe6\x9c\xaa\xe5\xad\x98\xe5\x82\xa8\xe8\xa7\xa6\xe6\x91"
+    b"\xb8\xe5\xb1\x8f\xe7\xba\xb8\xe5\xbc\xa0\xe5\xae\xbd\xe5\xba\xa6\xe8\xb4\xa6\xe6\x88\xb7\xe5\xaf\x86\xe9\x92\xa5%s \xe4"
+    b"\xb8\xaa\xe5\xad\x97\xe7\xac\xa6\xe6\x89\x93\xe5\x8d\xb0\xe6\xb5\x8b\xe8\xaf\x95\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe4\xbb\x8e"
+    b" Flash \xe4\xb8\xad\xe6\xb0\xb8\xe4\xb9\x85\xe5\x88\xa0\xe9\x99\xa4\xe6\x89\x80\xe6\x9c\x89\xe5\xad\x98\xe5"
+    b"\x82\xa8\xe7\x9a\x84\xe5\x8a\xa0\xe5\xaf\x86\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe5\x92\x8c\xe8\xae\xbe\xe7\xbd\xae\xef\xbc\x9f"
+    b"\xe6\xad\xa3\xe5\x9c\xa8\xe5\x8a\xa0\xe8\xbd\xbd\xe6\x89\x93\xe5\x8d\xb0\xe6\x9c\xba\xe2\x80\xa6\xe6\x95\xb0\xe5\xad\x97\xe8\xbf"
+    b"\x94\xe5\x9b\x9e\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe6\x9f\xa5\xe7\x9c\x8b\xe5\x99\xa8\xe6\x8c\x89PAGE\xe5\x8f\x96"
+    b"\xe6\xb6\x88.\xe6\xa3\x80\xe6\x9f\xa5\xe8\xaf\xa5\xe5\x9c\xb0\xe5\x9d\x80\xe6\x98\xaf\xe5\x90\xa6\xe5\xb1\x9e\xe4\xba\x8e\xe6"
+    b"\xad\xa4\xe9\x92\xb1\xe5\x8c\x85\xef\xbc\x9f\xe6\x88\xaa\xe5\x8f\x96\xe5\xb7\xb2\xe5\x8f\x96\xe6\xb6\x88\xe6\xba\x90\xe8\xb7\xaf"
+    b"\xe5\xbe\x84\xe5\x8a\xa0\xe8\xbd\xbd\xe5\xa4\xb1\xe8\xb4\xa5KEF\xe5\x8a\xa0\xe5\xaf\x86\xe8\xbe\x93\xe5\x85\xa5 ("
+    b"%d):BIP39\xe5\x8a\xa9\xe8\xae\xb0\xe7\xac\xa6\xe6\x97\xa0\xe6\x95\x88\xe7\x9a\x84\xe9\x98\xb2\xe7\xaf"
+    b"\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81\xe4\xb8\xad\xe7\xad\x89\xe8\xa6\x86\xe7\x9b\x96\xef\xbc\x9f\xe6\x9c\xaa\xe6"
+    b"\x8f\x90\xe4\xbe\x9b\xe5\xaf\x86\xe9\x92\xa5\xe5\x9c\xb0\xe5\x9d\x80\xe6\x8e\xb7\xe9\xaa\xb0\xe5\xad\x90\xe5\x88\x86\xe5\xb8\x83"
+    b":\xe6\x98\xbe\xe7\xa4\xba\xe5\xad\x98\xe5\x82\xa8\xe5\x88\xb0 Flash\xe4\xbd\xbf\xe7\x94\xa8\xe9\xbb\x98\xe8"
+    b"\xae\xa4\xe6\xa8\xa1\xe5\xbc\x8f\xef\xbc\x9f\xe6\x96\x87\xe4\xbb\xb6\xe5\x90\x8d\xe5\xa6\x82\xe6\x9e\x9c\xe6\x82\xa8\xe7\x9a\x84"
+    b"\xe8\xae\xbe\xe5\xa4\x87\xe6\x98\xbe\xe7\xa4\xba\xe5\xb1\x8f\xe5\x9c\xa8\xe6\xad\xa4\xe6\x9b\xb4\xe6\x94\xb9\xe5\x90\x8e\xe6\x97"
+    b"\xa0\xe6\xb3\x95\xe6\xad\xa3\xe5\xb8\xb8\xe5\xb7\xa5\xe4\xbd\x9c,\xe5\xae\x83\xe5\xb0\x86\xe5\x9c\xa85\xe7\xa7\x92\xe5\x90"
+    b"\x8e\xe4\xbd\xbf\xe7\x94\xa8\xe4\xbb\xa5\xe5\x89\x8d\xe7\x9a\x84\xe8\xae\xbe\xe7\xbd\xae\xe8\x87\xaa\xe5\x8a\xa8\xe9\x87\x8d\xe6"
+    b"\x96\xb0\xe5\x90\xaf\xe5\x8a\xa8.\xe5\x8a\xa0\xe8\xbd\xbd\xef\xbc\x9f\xe5\xb7\xb2\xe7\x94\xa8:\xe9\x87\x8d\xe5\x90\xaf\xe6"
+    b"\x89\x93\xe5\x8d\xb0\xef\xbc\x9f\xef\xbc\x88\xe5\xae\x9e\xe9\xaa\x8c\xe6\x80\xa7\xef\xbc\x89\xe5\xa4\xb4\xe9\x83\xa8\xe7\xb1\xbb"
+    b"\xe5\x9e\x8b\xe9\x92\xb1\xe5\x8c\x85\xe4\xb8\x8d\xe5\x8c\xb9\xe9\x85\x8d:\xe4\xbb\x8ebase32\xe6\xb7\xbb\xe5"
+    b"\x8a\xa0\xe6\x88\x96\xe6\x9b\xb4\xe6\x94\xb9\xe9\x92\xb1\xe5\x8c\x85\xe5\xaf\x86\xe7\xa0\x81\xef\xbc\x9f\xe6\xa3\x80\xe6\x9f\xa5"
+    b" SD \xe5\x8d\xa1\xe6\x89\x93\xe5\x8d\xb0\xe2\x80\xa6\xe8\xbf\x94\xe5\x9b\x9e\xe8\x87\xaa\xe5\xae\x9a\xe4\xb9\x89\xe4"
+    b"\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe6\xbb\x91\xe5\x8a\xa8\xe5\x88\x87\xe6\x8d\xa2\xe6\xa8\xa1\xe5\xbc\x8fXOR\xe5\xbd\x93"
+    b"\xe5\x89\x8d\xe5\x8a\xa9\xe8\xae\xb0\xe7\xac\xa6\xe4\xb8\x8e\xe5\x85\xb6\xe4\xbb\x96\xe5\x8a\xa9\xe8\xae\xb0\xe7\xac\xa6? "
+    b"(\xe5\xaf\x86\xe7\xa0\x81\xe7\x9f\xad\xe8\xaf\xad\xe5\x92\x8c\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6\xe5\xb0\x86\xe8\xa2\xab\xe4"
+    b"\xb8\xa2\xe5\xbc\x83)\xe4\xbf\x9d\xe5\xad\x98\xe5\x88\xb0 SD \xe5\x8d\xa1\xef\xbc\x9f\xe7\x94\x9f\xe6\x88\x90\xe5"
+    b"\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe9\x83\xa8\xe4\xbb\xb6\xe5\xb0\xba\xe5\xaf\xb8\xe8\xaf\xb7\xe5\x8a\xa0\xe8\xbd\xbd\xe9\x92\xb1"
+    b"\xe5\x8c\x85\xe8\xbe\x93\xe5\x87\xba\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6\xe5\x8d\x81\xe5\x85\xad\xe8\xbf\x9b\xe5\x88\xb6\xe5\x85"
+    b"\xac\xe9\x92\xa5:\xe5\xb7\xb2\xe5\x8a\xa0\xe5\xaf\x86\xe8\x87\xaa\xe5\xae\x9a\xe4\xb9\x89\xe7\xbb\xa7\xe7\xbb\xad\xe5\x90\x97"
+    b"\xef\xbc\x9f\xe6\x97\xa0\xe6\xb3\x95\xe7\xa1\xae\xe5\xae\x9a\xe6\x9b\xb4\xe6\x94\xb9\xe5\x9c\xb0\xe5\x9d\x80.\xe6\xb8\x85\xe9"
+    b"\x99\xa4\xe7\x94\xa8\xe6\x88\xb7\xe6\x95\xb0\xe6\x8d\xae\xe6\xa3\x80\xe6\xb5\x8b\xe5\x88\xb0\xe6\x96\xb0\xe5\x9b\xba\xe4\xbb\xb6"
+    b".\xe5\x85\xb3\xe6\x9c\xba\xe6\x97\xb6\xe9\x97\xb4\xe5\xb7\xa6\xe5\xb7\xb2\xe7\xad\xbe\xe5\x90\x8d PSBT\xe5\xa4"
+    b"\xb1\xe8\xb4\xa5\xe9\x98\xb2\xe7\xaf\xa1\xe6\x94\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe7\xa0\x81\xe8\xae\xbe\xe7\xbd\xae\xe6\x88\x90\xe5"
+    b"\x8a\x9f\xe6\xbb\x91\xe5\x8a\xa8\xe8\xa7\xa6\xe6\x91\xb8\xe9\x98\x88\xe5\x80\xbc\xe6\xb5\x8b\xe8\xaf\x95:\xe5\xb0\x86 B"
+    b"IP39 \xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe7\x9a\x84\xe6\xaf\x8f\xe4\xb8\xaa\xe8\xaf\x8d\xe4\xbd\x9c\xe4\xb8\xba"
+    b" 1 \xe5\x88\xb0 2048 \xe7\x9a\x84\xe6\x95\xb0\xe5\xad\x97\xe8\xbe\x93\xe5\x85\xa5.\xe5\x88\xa0\xe9"
+    b"\x99\xa4 %s\xef\xbc\x9f\xe5\x8d\x95\xe8\xaf\x8d\xe5\xba\x8f\xe5\x8f\xb7\xe8\xb7\xaf\xe5\xbe\x84\xe4\xb8\x8d\xe5\x8c\xb9"
+    b"\xe9\x85\x8d\xe6\xad\xa3\xe5\x9c\xa8\xe5\x8a\xa0\xe8\xbd\xbd\xe6\x8e\xa5\xe6\x94\xb6\xe5\x9c\xb0\xe5\x9d\x80\xe2\x80\xa6\xe5\xa4"
+    b"\x84\xe7\x90\x86\xe4\xb8\xad\xe2\x80\xa6\xe8\x87\xaa\xe8\xa1\x8c\xe8\xbd\xac\xe8\xb4\xa6:\xe6\x89\xbe\xe9\x9b\xb6:\xe5\xa1"
+    b"\xab\xe5\x85\x85FlashKrux \xe6\x89\x93\xe5\x8d\xb0\xe6\x9c\xba\xe6\xb5\x8b\xe8\xaf\x95\xe4\xba\x8c"
+    b"\xe7\xbb\xb4\xe7\xa0\x81\xe5\xae\x8c\xe6\x88\x90\xe4\xba\x86\xe5\x90\x97\xef\xbc\x9f\xe6\xb5\x8f\xe8\xa7\x88\xe6\x96\x87\xe4\xbb"
+    b"\xb6\xef\xbc\x9f\xe9\xaa\x8c\xe8\xaf\x81\xe4\xb8\xad\xe2\x80\xa6\xe7\x95\x8c\xe9\x9d\xa2\xe9\xab\x98\xe8\xb4\xb9\xe7\x94\xa8\xef"
+    b"\xbc\x81\xe8\xaf\xb7\xe5\x8b\xbf\xe6\x96\xad\xe7\x94\xb5\xef\xbc\x8c\xe5\x8f\xaf\xe8\x83\xbd\xe9\x9c\x80\xe8\xa6\x81\xe4\xb8\x80"
+    b"\xe6\xae\xb5\xe6\x97\xb6\xe9\x97\xb4\xe5\xae\x8c\xe6\x88\x90.\xe6\x89\x93\xe5\x8d\xb0\xe6\x9c\xba\xe9\xa9\xb1\xe5\x8a\xa8\xe7"
+    b"\xa8\x8b\xe5\xba\x8f\xe6\x9c\xaa\xe8\xae\xbe\xe7\xbd\xae\xef\xbc\x81\xe9\x9a\x90\xe8\x97\x8f\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d"
+    b"\xe9\x83\xa8\xe5\x88\x86\xe7\xbc\xba\xe5\xb0\x91\xe7\xad\xbe\xe5\x90\x8d\xe6\x96\x87\xe4\xbb\xb6\xe6\xb3\xa2\xe7\x89\xb9\xe7\x8e"
+    b"\x87SD \xe5\x8d\xa1\xe5\x87\xba\xe5\x8e\x82\xe8\xae\xbe\xe7\xbd\xae\xe7\x94\xa8\xe6\x88\xb7\xe6\x95\xb0\xe6\x8d\xae\xe5"
+    b"\x80\xbc %s \xe8\xb6\x85\xe5\x87\xba\xe8\x8c\x83\xe5\x9b\xb4:[ %s,%s ]\xe9\x87\x8d\xe6"
+    b"\x96\xb0\xe6\x89\xab\xe6\x89\xab\xe6\x8f\x8f\xe7\xac\xac 1-12 \xe4\xb8\xaa\xe5\x8d\x95\xe8\xaf\x8dPSB"
+    b"T \xe4\xb8\xad\xe6\x9c\xaa\xe8\xae\xbe\xe7\xbd\xae\xe6\x8c\x87\xe7\xba\xb9\xe6\xa3\x80\xe6\x9f\xa5\xe5\x8d\xa1\xe2\x80\xa6"
+    b"\xe7\x94\xa8\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4\xe7\x9a\x84\xe7\x86\xb5\xe5\xa1\xab\xe5\x85\x85Flash\xef\xbc\x9f"
+    b"\xe4\xbf\x9d\xe5\xad\x98\xe5\x88\xb0 SD \xe5\x8d\xa1:\xe6\x89\xab\xe6\x8f\x8f BIP39 Pa"
+    b"ssphrase\xe5\xb0\x86 BIP39 \xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe7\x9a\x84\xe6\xaf"
+    b"\x8f\xe4\xb8\xaa\xe8\xaf\x8d\xe4\xbd\x9c\xe4\xb8\xba 1 \xe5\x88\xb0 800 \xe7\x9a\x84\xe5\x8d\x81\xe5\x85"
+    b"\xad\xe8\xbf\x9b\xe5\x88\xb6\xe6\x95\xb0\xe8\xbe\x93\xe5\x85\xa5.\xe5\x90\xa6\xe5\x88\xb0base64\xe6\x8a\x95"
+    b"\xe6\x8e\xb7\xe6\xac\xa1\xe6\x95\xb0\xe4\xb8\x8d\xe8\xb6\xb3\xef\xbc\x81\xe5\x8a\xa9\xe8\xae\xb0\xe8\xaf\x8d\xe9\x95\xbf\xe5\xba"
+    b"\xa6\xe6\x97\xa0\xe6\x95\x88\xe5\x88\x9b\xe5\xbb\xba\xe4\xba\x8c\xe7\xbb\xb4\xe7\xa0\x81\xe6\x8c\x89 PAGE \xe5"
+    b"\x88\x87\xe6\x8d\xa2\xe6\xa8\xa1\xe5\xbc\x8f\xe6\xaf\x8f\xe6\xac\xa1\xe9\x80\x9a\xe8\xbf\x87\xe7\x9a\x84\xe6\xb7\xb1\xe5\xba\xa6"
+    b"\xe4\xbb\x8ebase43\xe6\x89\xab\xe6\x8f\x8f\xe5\x9c\xb0\xe5\x9d\x80%s\xe9\x9c\x80\xe8\xa6\x81\xe6\x91\x84"
+    b"\xe5\x83\x8f\xe5\xa4\xb4\xe7\x9a\x84\xe9\xa2\x9d\xe5\xa4\x96\xe7\x86\xb5\xe5\x8f\x8d\xe8\xbd\xac\xe8\xae\xbe\xe5\xa4\x87\xe6\xb5"
+    b"\x8b\xe8\xaf\x95\xe8\xbf\x94\xe5\x9b\x9e\xe8\x8f\x9c\xe5\x8d\x95\xe5\xa6\x82\xe6\x9e\x9c\xe5\xb8\x8c\xe6\x9c\x9b Kru"
+    b"x \xe8\x87\xaa\xe5\x8a\xa8\xe8\xae\xa1\xe7\xae\x97\xe6\x9c\x80\xe5\x90\x8e\xe4\xb8\x80\xe4\xbd\x8d Check"
+    b"sum\xef\xbc\x8c\xe8\xaf\xb7\xe7\x95\x99\xe7\xa9\xba\xe9\x80\x9a\xe8\xbf\x87\xe6\x91\x84\xe5\x83\x8f\xe5\xa4\xb4TX"
+    b" \xe5\xbc\x95\xe8\x84\x9a\xe9\x92\xb1\xe5\x8c\x85\xe8\xbe\x93\xe5\x87\xba\xe6\x8f\x8f\xe8\xbf\xb0\xe7\xac\xa6\xe8\x87\xaa\xe8"
+    b"\xbd\xac\xe6\x88\x96\xe6\x89\xbe\xe9\x9b\xb6 (%d):\xe9\x95\xbf\xe5\xba\xa6:\xe6\x98\xaf\xe5\x90\xa6\xe7\xad"
+    b"\xbe\xe5\x90\x8d\xef\xbc\x9f"
+)
@@ -19,8 +19,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import hashlib
 from embit.descriptor.descriptor import Descriptor
-from embit.descriptor.arguments import Key
+from embit.descriptor.arguments import Key, KeyOrigin, AllowedDerivation
 from embit.networks import NETWORKS
 from .krux_settings import t
 from .qr import FORMAT_BBQR, FORMAT_NONE
@@ -37,11 +38,27 @@ from .key import (
     TYPE_MINISCRIPT,
 )
 
+# Number of recently derived addresses kept to page back and forth for free
+ADDRESS_CACHE_SIZE = 32
+
+# Bytes of each derived script's sha256 kept in the ownership index
+SCRIPT_DIGEST_SIZE = 4
+
 
 class PolicyMismatchWarning(Exception):
     """An exception for wallet policy type mismatches that require user acceptance"""
 
 
+class _DerivedAddresses:
+    """Recently derived addresses, in a small LRU cache, and the index of
+    derived script digests of each branch"""
+
+    def __init__(self):
+        self.addresses = {}
+        self.order = []
+        self.scripts = {}
+
+
 class Wallet:
     """Represents the wallet that the current key belongs to"""
 
@@ -54,6 +71,8 @@ class Wallet:
         self.policy = None
         self.persisted = False
         self._network = None
+        self._branch_descriptors = {}
+        self._derived = _DerivedAddresses()
         if self.key and self.key.policy_type == TYPE_SINGLESIG:
             if self.key.script_type == P2PKH:
                 self.descriptor = Descriptor.from_string(
@@ -242,6 +261,8 @@ class Wallet:
         self.wallet_data = wallet_data
         self.wallet_qr_format = qr_format
         self.descriptor = to_unambiguous_descriptor(descriptor)
+        self._branch_descriptors = {}
+        self._derived = _DerivedAddresses()
         self.label = label
         if self.descriptor.key and not self.descriptor.taptree:
             if not self.label:
@@ -304,6 +325,97 @@ class Wallet:
             return encode_bbqr(wallet_data, file_type="U"), FORMAT_BBQR
         return (self.wallet_data, self.wallet_qr_format)
 
+    def _branch_descriptor(self, branch_index):
+        """Returns the descriptor of a branch with its keys derived up to the
+        address index, so each address costs a single child derivation per key"""
+        if branch_index not in self._branch_descriptors:
+            descriptor = self.descriptor.branch(branch_index)
+            for key in descriptor.keys:
+                if not key.is_extended or not key.is_wildcard:
+                    continue
+                indexes = key.allowed_derivation.indexes
+                wildcard = indexes.index(None)
+                if wildcard == 0:
+                    continue
+                path = indexes[:wildcard]
+                if key.origin:
+                    key.origin = KeyOrigin(
+                        key.origin.fingerprint, key.origin.derivation + path
+                    )
+                else:
+                    key.origin = KeyOrigin(key.key.my_fingerprint, path)
+                key.key = key.key.derive(path)
+                key.allowed_derivation = AllowedDerivation(indexes[wildcard:])
+            self._branch_descriptors[branch_index] = descriptor
+        return self._branch_descriptors[branch_index]
+
+    def _derive_address(self, i, branch_index):
+        """Returns the address at index i of a branch, keeping the most recent
+        ones in a small LRU cache"""
+        cache_key = (branch_index, i)
+        addresses = self._derived.addresses
+        order = self._derived.order
+        if cache_key in addresses:
+            order.remove(cache_key)
+            order.append(cache_key)
+            return addresses[cache_key]
+
+        address = (
+            self._branch_descriptor(branch_index)
+            .derive(i)
+            .address(network=NETWORKS[self.which_network()])
+        )
+        if len(order) >= ADDRESS_CACHE_SIZE:
+            del addresses[order.pop(0)]
+        addresses[cache_key] = address
+        order.append(cache_key)
+        return address
+
+    def _search_script_index(self, address, digest, start, branch_index):
+        """Returns the index of the address whose script digest is found in a
+        branch index from start, confirming candidates by derivation"""
+        script_index = self._derived.scripts.get(branch_index, b"")
+        pos = script_index.find(digest, start)
+        while pos != -1:
+            if pos % SCRIPT_DIGEST_SIZE == 0:
+                i = pos // SCRIPT_DIGEST_SIZE
+                if self._derive_address(i, branch_index) == address:
+                    return i
+            pos = script_index.find(digest, pos + 1)
+        return None
+
+    def find_address(self, address, limit, branch_index=0):
+        """Returns the index of the address in a branch, searching the scripts
+        already indexed and extending the index up to limit, or None if not found"""
+        from embit.script import address_to_scriptpubkey
+
+        if self.descriptor is None:
+            raise ValueError("No descriptor to derive addresses from")
+
+        digest = hashlib.sha256(address_to_scriptpubkey(address).data).digest()[
+            :SCRIPT_DIGEST_SIZE
+        ]
+        scripts = self._derived.scripts
+        searched = 0
+        while True:
+            i = self._search_script_index(address, digest, searched, branch_index)
+            if i is not None:
+                return i
+            searched = len(scripts.get(branch_index, b""))
+            if searched >= limit * SCRIPT_DIGEST_SIZE:
+                return None
+            descriptor = self._branch_descriptor(branch_index)
+            added = bytearray()
+            for j in range(searched // SCRIPT_DIGEST_SIZE, limit):
+                added.extend(
+                    hashlib.sha256(descriptor.derive(j).script_pubkey().data).digest()[
+                        :SCRIPT_DIGEST_SIZE
+                    ]
+                )
+            # Kept as bytes, searched in place and only copied when it grows,
+            # as MicroPython's bytearray and memoryview have no find
+            scripts[branch_index] = scripts.get(branch_index, b"") + bytes(added)
+
     def obtain_addresses(self, i=0, limit=None, branch_index=0):
         """Returns an iterator deriving addresses (default branch_index is receive)
         for the wallet up to the provided limit"""
@@ -314,9 +426,7 @@ class Wallet:
         starting_index = i
 
         while limit is None or i < starting_index + limit:
-            yield self.descriptor.derive(i, branch_index=branch_index).address(
-                network=NETWORKS[self.which_network()]
-            )
+            yield self._derive_address(i, branch_index)
             i += 1
 
     def has_change_addr(self):
@@ -329,7 +439,7 @@ def to_unambiguous_descriptor(descriptor):
     """If child derivation info is missing to generate receive addresses,
     use the default scheme
     """
-    from embit.descriptor.arguments import KeyHash, AllowedDerivation
+    from embit.descriptor.arguments import KeyHash
 
     if descriptor.key:
         if descriptor.key.allowed_derivation is None:
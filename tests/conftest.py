@@ -14,7 +14,9 @@ from .shared_mocks import (
     encode_to_string,
     encode,
     statvfs,
+    ticks_diff,
     pbkdf2_hmac_sha256_wrapper,
+    pbkdf2_hmac_sha512_wrapper,
     base32_decode,
     base32_encode,
     base43_decode,
@@ -37,6 +39,7 @@ def mp_modules(mocker, monkeypatch):
     import time
     import sys
     import hashlib
+    import gc
 
     monkeypatch.setitem(
         sys.modules,
@@ -71,7 +74,11 @@ def mp_modules(mocker, monkeypatch):
     monkeypatch.setattr(
         time, "ticks_ms", mocker.MagicMock(return_value=1), raising=False
     )
+    monkeypatch.setattr(time, "ticks_diff", ticks_diff, raising=False)
     monkeypatch.setattr(sys, "print_exception", mocker.MagicMock(), raising=False)
+    monkeypatch.setattr(
+        gc, "mem_alloc", mocker.MagicMock(return_value=0), raising=False
+    )
     monkeypatch.setitem(
         sys.modules,
         "uos",
@@ -83,6 +90,7 @@ def mp_modules(mocker, monkeypatch):
         "uhashlib_hw",
         mocker.MagicMock(
             pbkdf2_hmac_sha256=pbkdf2_hmac_sha256_wrapper,
+            pbkdf2_hmac_sha512=pbkdf2_hmac_sha512_wrapper,
             sha256=hashlib.sha256,
         ),
     )
@@ -1703,6 +1703,58 @@ def test_sign_p2tr_zeroes_fingerprint(mocker, m5stickv, tdata):
     assert written_data == tdata.SIGNED_P2TR_PSBT_BIN_SD
 
 
+def test_sign_psbt_streamed_to_sd_card(mocker, m5stickv, tdata, tmp_path):
+    from krux.pages.home_pages.home import Home
+    from krux.wallet import Wallet
+    from krux.input import BUTTON_ENTER, BUTTON_PAGE
+
+    PSBT_FILE_NAME = "test.psbt"
+    SIGNED_PSBT_FILE_NAME = "test-signed.psbt"
+
+    btn_seq = [
+        BUTTON_PAGE,  # Move to "Load from SD card"
+        BUTTON_ENTER,  # Load from SD card
+        BUTTON_ENTER,  # Path mismatch ACK
+        BUTTON_ENTER,  # PSBT resume
+        BUTTON_ENTER,  # output 1
+        BUTTON_ENTER,  # output 2
+        BUTTON_PAGE,  # Move past disabled "Sign to QR code"
+        BUTTON_PAGE,  # Move to "Sign to SD card"
+        BUTTON_ENTER,  # Sign to SD card
+    ]
+
+    # Mock for SDHandler
+    mocker.patch(
+        "os.listdir",
+        return_value=["somefile", "otherfile"],
+    )
+    # Sign scope by scope from a real file, whatever its size
+    mocker.patch("krux.psbt_stream.SD_PATH", str(tmp_path).lstrip("/"))
+    mocker.patch("krux.psbt_stream.STREAM_SIZE_THRESHOLD", 0)
+    (tmp_path / PSBT_FILE_NAME).write_bytes(tdata.P2WPKH_PSBT)
+
+    wallet = Wallet(tdata.SINGLESIG_SIGNING_KEY)
+    ctx = create_ctx(mocker, btn_seq, wallet)
+    home = Home(ctx)
+    mocker.spy(home, "display_qr_codes")
+
+    mocker.patch.object(home, "has_sd_card", new=lambda: True)
+    mock_utils = mocker.patch("krux.pages.utils.Utils")
+    mock_utils.return_value.load_file.return_value = (PSBT_FILE_NAME, None)
+    mocker.patch(
+        "krux.pages.file_operations.SaveFile.set_filename",
+        return_value=SIGNED_PSBT_FILE_NAME,
+    )
+
+    home.sign_psbt()
+
+    assert ctx.input.wait_for_button.call_count == len(btn_seq)
+    home.display_qr_codes.assert_not_called()
+    assert (
+        tmp_path / SIGNED_PSBT_FILE_NAME
+    ).read_bytes() == tdata.SIGNED_P2WPKH_PSBT_SD
+
+
 def test_cancel_sign_high_fee(mocker, m5stickv, tdata):
     from krux.pages.home_pages.home import Home
     from krux.wallet import Wallet
@@ -918,6 +918,12 @@ def test_public_key_save_qr_codes_pbm_43(
         ),
     ]
 
+    # PBM images are saved as chunks, record them joined
+    saved_calls = []
+    mock_save_file.side_effect = lambda data, *args, **kwargs: saved_calls.append(
+        mocker.call(b"".join(data), *args, **kwargs)
+    )
+
     n = 0
     for case in cases:
         print(f"Case: {n}")
@@ -970,5 +976,6 @@ def test_public_key_save_qr_codes_pbm_43(
                 )
             )
 
-        mock_save_file.assert_has_calls(sd_card_save_calls, any_order=True)
+        for save_call in sd_card_save_calls:
+            assert save_call in saved_calls
         assert ctx.input.wait_for_button.call_count == len(case[1])
@@ -722,3 +722,73 @@ def test_test_touch(mocker, amigo):
     ctx.display.fill_rectangle.assert_called()
     ctx.input.wait_for_release.assert_called()
     assert ctx.input.touch.gesture == None
+
+
+def test_benchmarks(m5stickv, mocker):
+    import sys
+    from krux.pages.device_tests import DeviceTests
+    from krux.input import BUTTON_ENTER, BUTTON_PAGE_PREV
+
+    BTN_SEQUENCE = (
+        BUTTON_ENTER,  # open the first result
+        BUTTON_ENTER,  # leave its details
+        BUTTON_PAGE_PREV,  # move to Back
+        BUTTON_ENTER,  # leave results
+    )
+
+    def fast(sample):
+        import krux.baseconv
+
+        return sample, 10, "ops/s"
+
+    mocker.patch(
+        "krux.device_benchmarks.all_benchmarks",
+        return_value=[
+            ("fast", fast),
+            ("broken", mocker.MagicMock(side_effect=ValueError("boom"))),
+        ],
+    )
+    ctx = create_ctx(mocker, BTN_SEQUENCE)
+    page = DeviceTests(ctx)
+    mocker.patch.object(page, "has_sd_card", return_value=False)
+    assert "krux.baseconv" not in sys.modules
+    page.benchmarks()
+
+    # The suite and what its benchmarks imported are unloaded
+    assert "krux.device_benchmarks" not in sys.modules
+    assert "krux.baseconv" not in sys.modules
+
+    ctx.display.draw_hcentered_text.assert_has_calls(
+        [
+            mocker.call(
+                "heap: 0\nms: 1\nname: fast\nrate: 10000.0\nunit: ops/s",
+                highlight_prefix=":",
+            )
+        ]
+    )
+    assert ctx.input.wait_for_button.call_count == len(BTN_SEQUENCE)
+
+
+def test_benchmarks_saves_report(m5stickv, mocker):
+    from krux.pages.device_tests import DeviceTests
+    from krux.input import BUTTON_PAGE_PREV, BUTTON_ENTER
+    from krux.metadata import VERSION
+
+    BTN_SEQUENCE = (BUTTON_PAGE_PREV, BUTTON_ENTER)
+    mocker.patch(
+        "krux.device_benchmarks.all_benchmarks",
+        return_value=[("fast", lambda sample: (sample, 10, "ops/s"))],
+    )
+    save_file = mocker.patch("krux.pages.file_operations.SaveFile.save_file")
+    ctx = create_ctx(mocker, BTN_SEQUENCE)
+    page = DeviceTests(ctx)
+    mocker.patch.object(page, "has_sd_card", return_value=True)
+    page.benchmarks()
+
+    filename = "benchmarks-m5stickv-" + VERSION
+    save_file.assert_called_once()
+    data = save_file.call_args[0][0]
+    assert '"board": "m5stickv"' in data
+    assert '"name": "fast"' in data
+    assert save_file.call_args[0][1:3] == (filename, filename)
+    assert ctx.input.wait_for_button.call_count == len(BTN_SEQUENCE)
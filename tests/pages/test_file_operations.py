@@ -153,3 +153,19 @@ def test_save_file_decline_overwrite(m5stickv, mocker, mock_sd_handler):
     save_file2 = SaveFile(ctx2)
     result2 = save_file2.save_file(b"test_data", "xpub", prompt=True)
     assert result2 == False
+
+
+def test_save_file_chunks(m5stickv, mocker, mock_sd_handler):
+    """Chunked data is streamed with write_chunks"""
+    from krux.pages.file_operations import SaveFile
+
+    ctx = create_ctx(mocker, [])
+    save_file = SaveFile(ctx)
+    mocker.patch.object(save_file, "set_filename", return_value="afile.txt")
+    chunks = (chunk for chunk in (b"test", b"_data"))
+    result = save_file.save_file(chunks, "default_name", prompt=False)
+
+    assert result == True
+    sd = mock_sd_handler.__enter__.return_value
+    sd.write_chunks.assert_called_once_with("afile.txt", chunks)
+    sd.write_binary.assert_not_called()
@@ -17,6 +17,31 @@ def test_erase_users_data(amigo, mocker):
     assert ctx.input.wait_for_button.call_count == len(BTN_SEQUENCE)
 
 
+def test_erase_spiffs_reads_blocks_known_as_erased(amigo, mocker):
+    """Test that the wipe erases data written without updating the bitmap."""
+    from krux.pages.flash_tools import FlashTools
+    from krux.firmware import FLASH_SIZE, SPIFFS_ADDR, ERASE_BLOCK_SIZE
+    from krux.flash_blocks import flash_blocks
+    import flash
+
+    image = bytearray(b"\xff" * FLASH_SIZE)
+    mocker.patch(
+        "flash.read",
+        side_effect=lambda address, size: bytes(image[address : address + size]),
+    )
+    mocker.patch("flash.erase")
+
+    # Bitmap is up to date, then a file is written without notifying it
+    for address in range(SPIFFS_ADDR, FLASH_SIZE, ERASE_BLOCK_SIZE):
+        assert flash_blocks.is_erased(address)
+    used = SPIFFS_ADDR + 3 * ERASE_BLOCK_SIZE
+    image[used] = 0
+
+    FlashTools(create_ctx(mocker, [])).erase_spiffs()
+
+    flash.erase.assert_called_once_with(used, ERASE_BLOCK_SIZE)
+
+
 def test_flash_map(multiple_devices, mocker):
     """Test that the flash map is displayed."""
     from krux.pages.flash_tools import FlashTools
@@ -129,12 +154,56 @@ def test_tc_flash_hash(multiple_devices, mocker):
     for case in cases:
         mocker.patch.object(TCCodeVerification, "capture", return_value=case[0])
         mocker.patch("machine.unique_id", return_value=case[1])
-        mocker.patch.object(flash, "read", return_value=case[2])
+        mocker.patch.object(
+            flash,
+            "read",
+            side_effect=lambda address, size, block=case[2]: block
+            * (size // len(block)),
+        )
         ctx = create_ctx(mocker, BTN_SEQUENCE)
         ctx.tc_code_enabled = True
         test_tools = FlashTools(ctx)
         test_tools.tc_flash_hash()
 
-        assert flash.read.call_count == 4096
+        # 16 MB read in 64 KB chunks
+        assert flash.read.call_count == 256
         assert ctx.input.wait_for_button.call_count == len(BTN_SEQUENCE)
         ctx.display.draw_hcentered_text.assert_has_calls([case[3]], [case[4]])
+
+
+def test_hash_pin_with_flash(amigo, mocker):
+    """Test chunked hashing matches hashing the flash block by block."""
+    import hashlib
+    import itertools
+    import flash
+    from krux.pages.flash_tools import FlashHash, BLOCK_SIZE
+    from krux.firmware import FLASH_SIZE, SPIFFS_ADDR
+
+    pattern = bytes(range(256)) * (BLOCK_SIZE // 128)
+
+    def read(address, size):
+        # Each block holds the pattern shifted by its index
+        return b"".join(
+            pattern[(block >> 12) % 256 :][:BLOCK_SIZE]
+            for block in range(address, address + size, BLOCK_SIZE)
+        )
+
+    tc_code_hash = b"\x0a" * 32
+    uid = b"\x02" * 32
+    mocker.patch("machine.unique_id", return_value=uid)
+    mocker.patch.object(flash, "read", side_effect=read)
+    # Each chunk takes 100ms
+    mocker.patch("time.ticks_ms", side_effect=itertools.count(0, 100))
+    ctx = create_ctx(mocker, [])
+    hashes = FlashHash(ctx, tc_code_hash).hash_pin_with_flash()
+
+    # Progress is drawn at most every 250ms
+    assert ctx.display.draw_hcentered_text.call_count < 256 // 2
+
+    expected = []
+    for range_begin, range_end in ((0, SPIFFS_ADDR), (SPIFFS_ADDR, FLASH_SIZE)):
+        sha256 = hashlib.sha256(tc_code_hash + uid)
+        for address in range(range_begin, range_end, BLOCK_SIZE):
+            sha256.update(read(address, BLOCK_SIZE))
+        expected.append(sha256.digest())
+    assert list(hashes) == expected
@@ -317,13 +317,14 @@ def test_save_pbm_image(amigo, mocker):
     ctx = create_ctx(mocker, BTN_SEQUENCE)
 
     mocker.patch("os.listdir", new=mocker.MagicMock(return_value=["file1"]))
-    with patch("krux.sd_card.SDHandler.write_binary") as mock_write_binary:
+    with patch("krux.sd_card.SDHandler.write_chunks") as mock_write_chunks:
         qr_viewer = SeedQRView(ctx, data=TEST_DATA, title="Test QR Code")
         qr_viewer.save_pbm_image(TEST_TITLE)
 
-        mock_write_binary.assert_called_once_with(
-            TEST_TITLE + PBM_IMAGE_EXTENSION, PBM_TEST_CODE_BINARY_QR
-        )
+        mock_write_chunks.assert_called_once()
+        filename, chunks = mock_write_chunks.call_args.args
+        assert filename == TEST_TITLE + PBM_IMAGE_EXTENSION
+        assert b"".join(chunks) == PBM_TEST_CODE_BINARY_QR
     assert ctx.input.wait_for_button.call_count == len(BTN_SEQUENCE)
 
 
@@ -351,6 +352,12 @@ def test_save_bmp_image(amigo, mocker):
     sys.modules["image"].Image.return_value.save.assert_called_once_with(
         "/sd/" + TEST_TITLE + BMP_IMAGE_EXTENSION
     )
+    # Background and dark runs are filled as spans, not pixel by pixel
+    bmp_img = sys.modules["image"].Image.return_value
+    bmp_img.set_pixel.assert_not_called()
+    assert bmp_img.draw_rectangle.call_args_list[0] == mocker.call(
+        0, 0, 46, 46, sys.modules["lcd"].WHITE, fill=True
+    )
     assert ctx.input.wait_for_button.call_count == len(BTN_SEQUENCE)
 
 
@@ -399,12 +406,14 @@ def test_save_svg_image(amigo, mocker, mocker_sd_card_svg):
     qr_viewer.save_svg_image(TEST_TITLE)
 
     savefile_mock.save_file.assert_called_once_with(
-        svg_content,
+        mocker.ANY,
         TEST_TITLE,
         file_extension=SVG_IMAGE_EXTENSION,
         save_as_binary=True,
         prompt=False,
     )
+    # The SVG is handed over as chunks, to be streamed to the file
+    assert b"".join(savefile_mock.save_file.call_args.args[0]) == svg_content
 
 
 def test_save_qr_image_menu_pbm(amigo, mocker):
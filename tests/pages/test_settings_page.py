@@ -243,15 +243,18 @@ def test_settings_on_amigo_tft(amigo, mocker, mocker_printer):
     import krux
     from krux.pages.settings_page import SettingsPage
     from krux.input import BUTTON_TOUCH
-    from krux.krux_settings import Settings, CategorySetting
-    from krux.translations import available_languages, ref_array
-    from krux.translations.pt import translation_array as br_array
+    from krux.krux_settings import Settings, CategorySetting, _catalog_lookup
+    from krux.translations import available_languages
+    from krux.translations.pt import catalog as br_catalog
     from krux.themes import WHITE, GREEN, ORANGE
 
     index_pt = available_languages.index("pt-BR")
     index_next = (index_pt + 1) % (len(available_languages))
-    slug_index = ref_array.index(1177338798)
-    text_pt = br_array[slug_index] + "\n" + available_languages[index_pt]
+    # crc32 of "Locale"
+    slug_id = 1177338798
+    text_pt = (
+        _catalog_lookup(br_catalog, slug_id) + "\n" + available_languages[index_pt]
+    )
 
     # Get translations for the next language
     next_language = available_languages[index_next]
@@ -259,9 +262,11 @@ def test_settings_on_amigo_tft(amigo, mocker, mocker_printer):
     next_module_path = f"krux.translations.{next_language[:2]}"
     # Import the top-level module (krux)
     next_trans_module = __import__(next_module_path, fromlist=[""])
-    # Access the translation_array variable from the nested module
-    next_trans_array = getattr(next_trans_module, "translation_array")
-    text_next = next_trans_array[slug_index] + "\n" + available_languages[index_next]
+    # Access the catalog variable from the nested module
+    next_catalog = getattr(next_trans_module, "catalog")
+    text_next = (
+        _catalog_lookup(next_catalog, slug_id) + "\n" + available_languages[index_next]
+    )
 
     PREV_INDEX = 0
     GO_INDEX = 1
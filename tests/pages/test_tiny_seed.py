@@ -362,3 +362,134 @@ def test_tinyscanner_initializes_tinyseed_with_label(multiple_devices, mocker):
         else:
             with pytest.raises(expected_exception):
                 tiny_scanner = TinyScanner(ctx, grid_type=grid_type)
+
+
+def test_detect_punches_samples_each_dot_once(multiple_devices, mocker):
+    from krux.pages.tiny_seed import TinyScanner, DOT_SAMPLES
+
+    NUMBERS = [1090, 792, 1005, 1978, 408, 569, 1498, 589, 192, 134, 617, 663]
+    ctx = create_ctx(mocker, [])
+    scanner = TinyScanner(ctx)
+    scanner._map_punches_region((10, 10, 200, 160))
+    pad_x = scanner.x_regions[1] - scanner.x_regions[0]
+    pad_y = scanner.y_regions[1] - scanner.y_regions[0]
+
+    def get_pixel(x, y):
+        for index, (dot_x, dot_y) in enumerate(scanner.dots[0]):
+            if dot_x <= x < dot_x + pad_x and dot_y <= y < dot_y + pad_y:
+                punched = NUMBERS[index // 12] >> (11 - index % 12) & 1
+                return 0x40 if punched else 0xC0
+        raise AssertionError("Sampled outside the grid")
+
+    img = mocker.MagicMock()
+    img.get_pixel.side_effect = get_pixel
+    gradient_value = mocker.spy(scanner, "_gradient_value")
+
+    assert scanner._detect_and_draw_punches(img) == NUMBERS
+    assert img.get_pixel.call_count == 144 * DOT_SAMPLES * DOT_SAMPLES
+    img.get_statistics.assert_not_called()
+    assert gradient_value.call_count == 144
+
+    # Thresholds are only recomputed when the corners change
+    scanner._detect_and_draw_punches(img)
+    assert gradient_value.call_count == 144
+    scanner.g_corners = (0x70, 0x80, 0x80, 0x90)
+    assert scanner._detect_and_draw_punches(img) == NUMBERS
+    assert gradient_value.call_count == 288
+
+
+def test_detect_tiny_seed_tracks_plate(m5stickv, mocker):
+    from krux.pages.tiny_seed import TinyScanner
+
+    class Blob:
+        def __init__(self, rect):
+            self._rect = rect
+
+        def rect(self):
+            return self._rect
+
+    ctx = create_ctx(mocker, [])
+    scanner = TinyScanner(ctx)
+    img = mocker.MagicMock()
+    img.width.return_value = 320
+    img.height.return_value = 240
+    img.get_histogram.return_value.get_threshold.return_value.value.return_value = 0x70
+
+    def frame(*rects):
+        img.find_blobs.reset_mock()
+        img.find_blobs.side_effect = [[Blob(rect)] for rect in rects] + [[]] * 2
+        return scanner._detect_tiny_seed(img)
+
+    # Full frame search while not tracking
+    assert frame((40, 40, 125, 100)) == (40, 40, 125, 100)
+    assert img.get_histogram.call_count == 1
+
+    # The plate is searched around its last position, with the same threshold
+    assert frame((44, 37, 126, 100)) == (44, 37, 126, 100)
+    img.find_blobs.assert_called_once_with(
+        [(0x70, 255)],
+        roi=(9, 15, 187, 150),
+        x_stride=30,
+        y_stride=30,
+        area_threshold=5000,
+    )
+    assert img.get_histogram.call_count == 1
+
+    # Moved beyond tolerance, the whole frame is searched again
+    assert frame((70, 37, 126, 100), (70, 60, 125, 100)) == (70, 60, 125, 100)
+    assert img.find_blobs.call_count == 2
+    assert "roi" not in img.find_blobs.call_args.kwargs
+    assert img.get_histogram.call_count == 2
+
+    # Tracking lost
+    assert frame() is None
+    assert scanner.tracking == (None, 0x70)
+    frame()
+    assert img.find_blobs.call_count == 1
+    assert img.get_histogram.call_count == 4
+
+
+def test_consensus(m5stickv, mocker):
+    from krux.pages.tiny_seed import TinyScanner
+
+    ctx = create_ctx(mocker, [])
+    scanner = TinyScanner(ctx)
+    numbers_a = [1] * 12
+    numbers_b = [2] * 12
+
+    # A misread frame in between doesn't prevent the confirmation
+    assert not scanner._consensus(numbers_a)
+    assert not scanner._consensus(numbers_b)
+    assert scanner._consensus(numbers_a)
+
+    # Only the last frames count
+    for numbers in (numbers_b, numbers_a, numbers_a, numbers_a):
+        scanner._consensus(numbers)
+    assert not scanner._consensus(numbers_b)
+
+
+def test_24w_page_0_consensus_restarts(m5stickv, mocker):
+    from krux.pages.tiny_seed import TinyScanner, TinySeed
+    from krux.input import BUTTON_ENTER
+
+    ctx = create_ctx(mocker, [BUTTON_ENTER, BUTTON_ENTER])
+    scanner = TinyScanner(ctx)
+    mocker.patch.object(scanner, "_exit_camera")
+    mocker.patch.object(scanner, "_run_camera")
+    mocker.patch.object(scanner, "flash_text")
+    numbers = [1] * 12
+
+    for edited in (None, [2] * 12):
+        # Esc, then scanning page 0 again, or continuing to page 1
+        mocker.patch.object(TinySeed, "enter_tiny_seed", return_value=edited)
+        scanner.capturing = True
+        assert not scanner._process_24w_pg0_scan(numbers)
+        assert scanner._process_24w_pg0_scan(numbers) == edited
+        assert scanner.recent_numbers == []
+
+        # A single fresh frame isn't enough to accept the page again
+        scanner.capturing = True
+        TinySeed.enter_tiny_seed.reset_mock()
+        assert scanner._process_24w_pg0_scan(numbers) is None
+        TinySeed.enter_tiny_seed.assert_not_called()
+        scanner.recent_numbers = []
@@ -377,7 +377,12 @@ def test_print_qr_code_to_grbl(mocker, m5stickv, mock_uart_cls):
     mock_write = mocker.patch.object(p.uart_conn, "write")
 
     # now test with a valid connection, a valid IO and a valid handshake
-    mocker.patch.object(p.uart_conn, "read", return_value="[VER:1.1\n".encode())
+    responses = [None, b"[VER:1.1\nok\n"]
+    mocker.patch.object(
+        p.uart_conn,
+        "read",
+        side_effect=lambda: responses.pop(0) if responses else b"ok\n",
+    )
     p.print_qr_code(bytearray(b"\x00"))
     mock_write.assert_has_calls(
         [
@@ -386,6 +391,7 @@ def test_print_qr_code_to_grbl(mocker, m5stickv, mock_uart_cls):
             mocker.call(b"\n"),
         ]
     )
+    assert p.in_flight == []
 
     mocker.patch.object(p.uart_conn, "read", return_value="ok")
     assert p.transmit("M4") == "ok"
@@ -406,7 +412,12 @@ def test_print_qr_code_to_grbl_timeout(mocker, m5stickv, mock_uart_cls):
     mock_write = mocker.patch.object(p.uart_conn, "write")
 
     # now test with a valid connection, a valid IO and a valid handshake
-    mocker.patch.object(p.uart_conn, "read", return_value="[VER:1.1\n".encode())
+    responses = [None, b"[VER:1.1\nok\n"]
+    mocker.patch.object(
+        p.uart_conn,
+        "read",
+        side_effect=lambda: responses.pop(0) if responses else b"ok\n",
+    )
     p.print_qr_code(bytearray(b"\x00"))
     mock_write.assert_has_calls(
         [
@@ -415,6 +426,7 @@ def test_print_qr_code_to_grbl_timeout(mocker, m5stickv, mock_uart_cls):
             mocker.call(b"\n"),
         ]
     )
+    assert p.in_flight == []
 
     # raise an exception when the write method fails
     mocker.patch.object(p.uart_conn, "read", return_value=None)
@@ -527,6 +539,168 @@ def test_transmit_calls_sleep_on_retry(mocker, m5stickv, mock_uart_cls):
     sleep_mock.assert_called_once_with(1000)
 
 
+class FakeGRBL:
+    """Stands in for GRBL on the UART, acknowledging one line per read"""
+
+    def __init__(self, reply=b"ok"):
+        self.reply = reply
+        self.responses = [None, b"[VER:1.1\n[OPT:V,15,128]\n"]
+        self.pending = b""
+        self.lines = []
+        self.max_pending = 0
+
+    def write(self, data):
+        self.pending += data
+        self.max_pending = max(self.max_pending, len(self.pending))
+        assert len(self.pending) <= 128
+
+    def read(self):
+        if self.responses:
+            return self.responses.pop(0)
+        if b"\n" not in self.pending:
+            return None
+        line, self.pending = self.pending.split(b"\n", 1)
+        self.lines.append(line.decode())
+        return b"<Run|MPos:0,0,0>\n" + self.reply + b"\n"
+
+
+def test_grbl_streaming_fills_rx_buffer(
+    mocker, m5stickv, mock_uart_cls, mocker_sd_card
+):
+    mocker.patch("machine.UART", new=mock_uart_cls)
+    from krux.krux_settings import Settings
+    from krux.printers.cnc import GRBLPrinter
+
+    Settings().hardware.printer.cnc.cut_method = "row"
+    Settings().hardware.printer.cnc.invert = False
+
+    _, written = print_to_lines(mocker, TEST_QR_CODE)
+    expected = [line[:-1] for line in written if not line.startswith("(")]
+
+    p = GRBLPrinter()
+    grbl = FakeGRBL()
+    mocker.patch.object(p.uart_conn, "write", side_effect=grbl.write)
+    mocker.patch.object(p.uart_conn, "read", side_effect=grbl.read)
+    transmit = mocker.spy(p, "transmit")
+    p.print_qr_code(TEST_QR_CODE)
+
+    # $I's "ok" arrives after the handshake and is accounted for
+    assert grbl.lines == ["$I"] + expected
+    assert p.in_flight == [] and p.in_flight_size == 0
+    assert grbl.max_pending > 100
+    transmit.assert_not_called()
+
+
+def test_grbl_streaming_error(mocker, m5stickv, mock_uart_cls):
+    mocker.patch("machine.UART", new=mock_uart_cls)
+    from krux.krux_settings import Settings
+    from krux.printers.cnc import GRBLPrinter
+
+    Settings().hardware.printer.cnc.cut_method = "spiral"
+    Settings().hardware.printer.cnc.invert = False
+
+    p = GRBLPrinter()
+    grbl = FakeGRBL(reply=b"error:20")
+    mocker.patch.object(p.uart_conn, "write", side_effect=grbl.write)
+    mocker.patch.object(p.uart_conn, "read", side_effect=grbl.read)
+    with pytest.raises(ValueError) as exc_info:
+        p.print_qr_code(TEST_QR_CODE)
+    assert str(exc_info.value) == "GRBL replied error:20"
+
+
+def test_grbl_streaming_timeout(mocker, m5stickv, mock_uart_cls):
+    mocker.patch("machine.UART", new=mock_uart_cls)
+    from krux.krux_settings import Settings
+    from krux.printers.cnc import GRBLPrinter
+
+    Settings().hardware.printer.cnc.cut_method = "spiral"
+    Settings().hardware.printer.cnc.invert = False
+
+    p = GRBLPrinter()
+    mocker.patch.object(p.uart_conn, "write")
+    responses = [None, b"[VER:1.1\nok\n"]
+    mocker.patch.object(
+        p.uart_conn,
+        "read",
+        side_effect=lambda: responses.pop(0) if responses else None,
+    )
+    ticks = iter(range(0, 10**9, 1000))
+    mocker.patch("krux.printers.cnc.time.ticks_ms", side_effect=lambda: next(ticks))
+    with pytest.raises(TimeoutError) as exc_info:
+        p.print_qr_code(TEST_QR_CODE)
+    assert str(exc_info.value) == "Timeout while waiting for response from GRBL"
+
+
+def test_grbl_streaming_timeout_across_ticks_wrap(mocker, m5stickv, mock_uart_cls):
+    mocker.patch("machine.UART", new=mock_uart_cls)
+    from krux.printers.cnc import GRBLPrinter
+
+    p = GRBLPrinter()
+    p.in_flight = [4]
+    p.in_flight_size = 4
+    mocker.patch.object(p.uart_conn, "read", return_value=None)
+    # The tick counter wraps while waiting for the acknowledgement
+    ticks = iter(range(2**30 - 500, 2**30 + 10**9, 1000))
+    mocker.patch(
+        "krux.printers.cnc.time.ticks_ms", side_effect=lambda: next(ticks) % 2**30
+    )
+    with pytest.raises(TimeoutError):
+        p.acknowledge()
+    assert next(ticks) < 2**30 + 20000
+
+
+def test_grbl_streaming_sends_settings_alone(
+    mocker, m5stickv, mock_uart_cls, mocker_sd_card
+):
+    mocker.patch("machine.UART", new=mock_uart_cls)
+    from krux.krux_settings import Settings
+    from krux.printers.cnc import GRBLPrinter
+
+    Settings().hardware.printer.cnc.head_type = "laser"
+    Settings().hardware.printer.cnc.cut_method = "row"
+    Settings().hardware.printer.cnc.invert = False
+
+    p = GRBLPrinter()
+    grbl = FakeGRBL()
+    mocker.patch.object(p.uart_conn, "write", side_effect=grbl.write)
+    mocker.patch.object(p.uart_conn, "read", side_effect=grbl.read)
+    in_flight = []
+    real_transmit = p.transmit
+
+    def transmit(gcode):
+        in_flight.append(list(p.in_flight))
+        return real_transmit(gcode)
+
+    mocker.patch.object(p, "transmit", side_effect=transmit)
+    p.print_qr_code(TEST_QR_CODE)
+
+    # $32=1 is only sent once the lines before it are acknowledged
+    p.transmit.assert_called_once_with("$32=1")
+    assert in_flight == [[]]
+    assert grbl.lines[grbl.lines.index("$32=1") + 1] == "M4"
+    assert p.in_flight == []
+
+
+def test_grbl_without_streaming_waits_for_each_line(mocker, m5stickv, mock_uart_cls):
+    mocker.patch("machine.UART", new=mock_uart_cls)
+    from krux.krux_settings import Settings
+    from krux.printers.cnc import GRBLPrinter
+
+    Settings().hardware.printer.cnc.cut_method = "spiral"
+    Settings().hardware.printer.cnc.invert = False
+
+    p = GRBLPrinter()
+    p.streaming = False
+    mocker.patch.object(p.uart_conn, "write")
+    mocker.patch.object(p.uart_conn, "read", return_value=b"[VER:1.1\nok\n")
+    transmit = mocker.spy(p, "transmit")
+    stream = mocker.spy(p, "stream")
+    p.print_qr_code(bytearray(b"\x00"))
+
+    transmit.assert_called()
+    stream.assert_not_called()
+
+
 def test_grblprinter_print_string_not_implemented_error(
     mocker, m5stickv, mock_uart_cls
 ):
@@ -547,3 +721,90 @@ def test_grblprinter_clear_not_implemented_error(mocker, m5stickv, mock_uart_cls
     with pytest.raises(NotImplementedError) as exc_info:
         p.clear()
     assert str(exc_info.value) == "Must implement 'clear' method for GRBLPrinter"
+
+
+def print_to_lines(mocker, qr_code):
+    from krux.printers.cnc import FilePrinter
+
+    p = FilePrinter()
+    m = mocker.mock_open()
+    mocker.patch("builtins.open", m, create=True)
+    p.print_qr_code(qr_code)
+    return p, [call.args[0] for call in m().write.call_args_list]
+
+
+def test_print_router_qr_code_with_runs_cutmethod(mocker, m5stickv, mocker_sd_card):
+    from krux.krux_settings import Settings
+    from krux.printers.cnc import GCodeGenerator
+    from krux.qr import get_size
+
+    cnc = Settings().hardware.printer.cnc
+    cnc.invert = False
+    cnc.cut_method = "row"
+    row_printer, row_lines = print_to_lines(mocker, TEST_QR_CODE)
+    cnc.cut_method = "runs"
+    runs_printer, runs_lines = print_to_lines(mocker, TEST_QR_CODE)
+
+    assert runs_printer.stats.lines < row_printer.stats.lines // 2
+    assert runs_printer.stats.rapid_distance < row_printer.stats.rapid_distance
+    assert runs_printer.stats.estimated_minutes(
+        cnc.feed_rate
+    ) < row_printer.stats.estimated_minutes(cnc.feed_rate)
+
+    # While the bit is down, it only moves over cells to be cut
+    size = get_size(TEST_QR_CODE)
+    cell_size = (cnc.part_size - 2 * cnc.border_padding) / size
+    cut_rows = GCodeGenerator().cut_rows(TEST_QR_CODE, size)
+    x = y = z = 0
+    for line in runs_lines:
+        words = line.split()
+        if not words or words[0] not in ("G0", "G1"):
+            continue
+        target = [x, y, z]
+        for word in words[1:]:
+            if word[0] in "XYZ":
+                target["XYZ".index(word[0])] = float(word[1:])
+        if z < 0 and target[2] < 0:
+            for step in range(11):
+                px = x + (target[0] - x) * step / 10
+                py = y + (target[1] - y) * step / 10
+                col = int((px - cnc.border_padding) / cell_size)
+                row = size - 1 - int((py - cnc.border_padding) / cell_size)
+                assert (cut_rows[row] >> col) & 1
+        x, y, z = target
+
+
+def test_print_qr_code_report(mocker, m5stickv, mocker_sd_card):
+    from krux.krux_settings import Settings
+
+    Settings().hardware.printer.cnc.cut_method = "runs"
+    Settings().hardware.printer.cnc.invert = True
+    Settings().hardware.printer.cnc.unit = "mm"
+    p, lines = print_to_lines(mocker, TEST_QR_CODE)
+
+    gcode = lines[:-3]
+    assert p.stats.lines == len(gcode)
+    assert p.stats.size == sum(len(line) for line in gcode)
+    assert lines[-3] == "(%d lines, %d bytes)\n" % (p.stats.lines, p.stats.size)
+    assert lines[-2].startswith("(cut ") and "mm, rapid " in lines[-2]
+    assert lines[-1].startswith("(estimated ")
+
+
+def test_gcode_stats(mocker, m5stickv):
+    from krux.printers.cnc import GCodeStats
+
+    stats = GCodeStats()
+    for gcode in (
+        "G21",
+        "G0 Z1.0000",
+        "G0 X3.0000 Y4.0000",
+        "G1 Z-1.0000 F10.0",
+        "G1 X6.0000 Y8.0000 F100.0",
+    ):
+        stats.add(gcode)
+
+    assert stats.lines == 5
+    assert stats.rapid_distance == 6
+    assert stats.cut_distance == 7
+    assert stats.cut_minutes == 2 / 10 + 5 / 100
+    assert stats.estimated_minutes(600) == stats.cut_minutes + 6 / 600
@@ -54,17 +54,26 @@ def test_print_qr_code(mocker, amigo, mock_uart_cls):
 
     p.print_qr_code(TEST_QR_CODE)
 
+    first_line = b"\xff\xff\xff\xff\xe0\x07\xff\xf0\x7f\xe0\xf8?\xff\xff\xff\xf8"
     mock_write.assert_has_calls(
         [
             mocker.call(b"\x1dv0\x03\x10\x00}\x00"),
-            mocker.call(
-                bytearray(
-                    b"\xff\xff\xff\xff\xe0\x07\xff\xf0\x7f\xe0\xf8?\xff\xff\xff\xf8"
-                )
-            ),
+            # Each QR row is sent as its 5 dot lines at once
+            mocker.call(first_line * 5),
         ]
     )
-    assert mock_write.call_count == 130
+    # Bitmap mode, 25 QR rows and 4 feeds
+    assert mock_write.call_count == 30
+
+    # Every dot line matches the QR, each module scaled to 5x5 dots
+    lines = b"".join(call.args[0] for call in mock_write.call_args_list[1:26])
+    for row in range(25):
+        bits = ""
+        for col in range(25):
+            index = row * 25 + col
+            bits += ("1" if TEST_QR_CODE[index >> 3] & (1 << (index % 8)) else "0") * 5
+        line = int(bits.ljust(128, "0"), 2).to_bytes(16, "big")
+        assert lines[row * 80 : (row + 1) * 80] == line * 5
     p.write_bytes.assert_has_calls(
         [
             mocker.call(10),
@@ -75,6 +84,16 @@ def test_print_qr_code(mocker, amigo, mock_uart_cls):
     krux.printers.thermal.wdt.feed.assert_called()
 
 
+def test_expansion_table(mocker, m5stickv):
+    from krux.printers.thermal import expansion_table
+
+    assert expansion_table(1) == list(range(256))
+    table = expansion_table(3)
+    assert table[0b10000001] == 0b111000000000000000000111
+    assert table[0xFF] == (1 << 24) - 1
+    assert expansion_table(3) is table
+
+
 def test_print_string(mocker, m5stickv, mock_uart_cls):
     mocker.patch("krux.printers.thermal.UART", new=mock_uart_cls)
     from krux.printers.thermal import AdafruitPrinter
@@ -194,6 +194,14 @@ def statvfs(_):
     return (8192, 8192, 1896512, 1338303, 1338303, 0, 0, 0, 0, 255)
 
 
+# MicroPython ticks wrap around at 2**30
+TICKS_PERIOD = 2**30
+
+
+def ticks_diff(end, start):
+    return ((end - start + TICKS_PERIOD // 2) % TICKS_PERIOD) - TICKS_PERIOD // 2
+
+
 class TimeMocker:
     def __init__(self, increment) -> None:
         self.increment = increment
@@ -316,6 +324,23 @@ class MockStats:
         return 0
 
 
+class MockPixels:
+    """Mock pixels sampled on a TinySeed, every dot's samples share the
+    luminosity MockStats gives to that dot"""
+
+    def __init__(self, samples_per_dot=9):
+        self.stats = MockStats()
+        self.samples_per_dot = samples_per_dot
+        self.counter = 0
+        self.value = None
+
+    def __call__(self, x, y):
+        if self.counter % self.samples_per_dot == 0:
+            self.value = self.stats.median()
+        self.counter += 1
+        return self.value
+
+
 SNAP_SUCCESS = 0
 SNAP_ANIMATED_QR = 1
 SNAP_FIND_ANIMATED_SKIPPING = 2
@@ -353,6 +378,7 @@ def snapshot_generator(outcome=SNAP_SUCCESS, animated_qr=[]):
             m.width.return_value = 320
             m.height.return_value = 240
             m.get_statistics.return_value = MockStats()
+            m.get_pixel.side_effect = MockPixels()
         return m
 
     return snapshot
@@ -364,6 +390,12 @@ def pbkdf2_hmac_sha256_wrapper(secret, salt, iterations):
     return hashlib.pbkdf2_hmac("sha256", secret, salt, iterations)
 
 
+def pbkdf2_hmac_sha512_wrapper(secret, salt, iterations):
+    import hashlib
+
+    return hashlib.pbkdf2_hmac("sha512", secret, salt, iterations)
+
+
 def base32_decode(encoded_str):
     """Decodes a Base32 string."""
     try:
@@ -316,70 +316,70 @@ def test_parse_bbqr_rejects_zero_part_total(m5stickv):
         parse_bbqr("B:ZP0000data")
 
 
-def test_decode_bbqr_descriptors(m5stickv):
+def decode_parts(encoded_parts):
     from krux.qr import detect_format
-    from krux.bbqr import decode_bbqr, parse_bbqr
+    from krux.bbqr import BBQrDecoder, parse_bbqr
+
+    _, bbqr = detect_format(encoded_parts[0])
+    decoder = None
+    for encoded_part in encoded_parts:
+        part, index, total = parse_bbqr(encoded_part)
+        if decoder is None:
+            decoder = BBQrDecoder(bbqr.encoding, bbqr.file_type, total)
+        decoder.add_part(index, part, total)
+    return decoder.result()
 
+
+def test_decode_bbqr_descriptors(m5stickv):
     for encoded, decoded in zip(BBQR_ENCODED_DESCRIPTORS, BBQR_DECODED_DESCRIPTORS):
-        parts = {}
-        _, bbqr = detect_format(encoded[0])
-        for encoded_part in encoded:
-            part, index, total = parse_bbqr(encoded_part)
-            parts[index] = part
-        assert decode_bbqr(parts, bbqr.encoding, bbqr.file_type) == decoded
+        assert decode_parts(encoded) == decoded
+        assert decode_parts(list(reversed(encoded))) == decoded
 
 
 def test_decode_bbqr_json_non_compressed_descriptors(m5stickv):
-    from krux.qr import detect_format
-    from krux.bbqr import decode_bbqr, parse_bbqr
-
     for encoded, decoded in zip(
         BBQR_ENCODED_JSON_DESCRIPTOR, BBQR_DECODED_JSON_DESCRIPTOR
     ):
-        parts = {}
-        _, bbqr = detect_format(encoded[0])
-        for encoded_part in encoded:
-            part, index, total = parse_bbqr(encoded_part)
-            parts[index] = part
-        assert decode_bbqr(parts, bbqr.encoding, bbqr.file_type) == decoded
+        assert decode_parts(encoded) == decoded
+        assert decode_parts(list(reversed(encoded))) == decoded
 
 
 def test_decode_bbqr_psbts(m5stickv):
-    from krux.qr import detect_format
-    from krux.bbqr import decode_bbqr, parse_bbqr
-
     for encoded, decoded in zip(BBQR_ENCODED_PSBTS, BBQR_DECODED_PSBTS):
-        parts = {}
-        _, bbqr = detect_format(encoded[0])
-        for encoded_part in encoded:
-            part, index, total = parse_bbqr(encoded_part)
-            parts[index] = part
-        assert decode_bbqr(parts, bbqr.encoding, bbqr.file_type) == decoded
+        assert decode_parts(encoded) == decoded
+        assert decode_parts(list(reversed(encoded))) == decoded
 
 
 def test_decode_hex_encoded_psbt(m5stickv):
-    from krux.qr import detect_format
-    from krux.bbqr import decode_bbqr, parse_bbqr
-
-    parts = {}
-    _, bbqr = detect_format(HEX_ENCODED_SIGNED_PSBT[0])
-    for encoded_part in HEX_ENCODED_SIGNED_PSBT:
-        part, index, total = parse_bbqr(encoded_part)
-        parts[index] = part
-    assert decode_bbqr(parts, bbqr.encoding, bbqr.file_type) == HEX_DECODED_SIGNED_PSBT
+    assert decode_parts(HEX_ENCODED_SIGNED_PSBT) == HEX_DECODED_SIGNED_PSBT
+    assert (
+        decode_parts(list(reversed(HEX_ENCODED_SIGNED_PSBT))) == HEX_DECODED_SIGNED_PSBT
+    )
 
 
 def test_decode_non_compressed_bbqr_psbts(m5stickv):
-    from krux.qr import detect_format
-    from krux.bbqr import decode_bbqr, parse_bbqr
-
     for encoded, decoded in zip(BBQR_NON_COMPRESSED_ENCODED_PSBTS, BBQR_DECODED_PSBTS):
-        parts = {}
-        _, bbqr = detect_format(encoded[0])
-        for encoded_part in encoded:
-            part, index, total = parse_bbqr(encoded_part)
-            parts[index] = part
-        assert decode_bbqr(parts, bbqr.encoding, bbqr.file_type) == decoded
+        assert decode_parts(encoded) == decoded
+        assert decode_parts(list(reversed(encoded))) == decoded
+
+
+def test_bbqr_decoder_rejects_inconsistent_parts(m5stickv):
+    from krux.bbqr import BBQrDecoder, parse_bbqr
+
+    parts = [parse_bbqr(part) for part in BBQR_ENCODED_PSBTS[0]]
+    assert len(parts) > 2
+
+    decoder = BBQrDecoder("Z", "P", parts[0][2])
+    with pytest.raises(ValueError, match="Invalid part total"):
+        decoder.add_part(parts[0][1], parts[0][0], parts[0][2] + 1)
+    with pytest.raises(ValueError, match="Invalid part index"):
+        decoder.add_part(parts[0][2], parts[0][0])
+
+    decoder.add_part(0, parts[0][0])
+    with pytest.raises(ValueError, match="Invalid BBQR part size"):
+        decoder.add_part(1, parts[0][0][:-8])
+    with pytest.raises(ValueError, match="Invalid BBQR part size"):
+        decoder.add_part(parts[0][2] - 1, parts[0][0] + "AAAAAAAA")
 
 
 def test_encode_bbqr_descriptors(m5stickv):
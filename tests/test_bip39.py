@@ -141,3 +141,47 @@ def test_mnemonic_with_formatting_issues():
         assert (
             bip39.mnemonic_is_valid(case) == False
         ), f"Embit: Expected invalid for: {repr(case)}"
+
+
+def test_mnemonic_to_seed(mocker, mp_modules):
+    import sys
+
+    uhashlib_hw = sys.modules["uhashlib_hw"]
+    hw_spy = mocker.patch.object(
+        uhashlib_hw,
+        "pbkdf2_hmac_sha512",
+        side_effect=uhashlib_hw.pbkdf2_hmac_sha512,
+    )
+    mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+    for password in ("", "TREZOR", "pässphrase"):
+        assert kruxbip39.k_mnemonic_to_seed(
+            mnemonic, password
+        ) == bip39.mnemonic_to_seed(mnemonic, password)
+    assert hw_spy.call_count == 3
+
+    # BIP39 test vector
+    assert kruxbip39.k_mnemonic_to_seed(mnemonic, "TREZOR").hex() == (
+        "c55257c360c07c72029aebc1b53c05ed0362ada38ead3e3e9efa3708e5349553"
+        "1f09a6987599d18264c1e1c92f2cf141630c7a3c4ab7c81b2f001698e7463b04"
+    )
+
+
+def test_mnemonic_to_seed_without_hardware(mocker, mp_modules):
+    import sys
+
+    mocker.patch.dict(sys.modules, {"uhashlib_hw": mocker.MagicMock(spec=[])})
+    for _ in range(10):
+        mnemonic = bip39.mnemonic_from_bytes(secrets.token_bytes(32))
+        assert kruxbip39.k_mnemonic_to_seed(mnemonic, "test") == bip39.mnemonic_to_seed(
+            mnemonic, "test"
+        )
+
+
+def test_mnemonic_to_seed_invalid_mnemonic():
+    mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon"
+    with pytest.raises(ValueError, match="Checksum verification failed"):
+        kruxbip39.k_mnemonic_to_seed(mnemonic)
+    # without a wordlist the mnemonic is not checked, as in embit
+    assert kruxbip39.k_mnemonic_to_seed(
+        mnemonic, wordlist=None
+    ) == bip39.mnemonic_to_seed(mnemonic, wordlist=None)
@@ -0,0 +1,52 @@
+import os
+import runpy
+
+BOOT_PATH = os.path.join(os.path.dirname(__file__), "..", "src", "boot.py")
+
+
+def test_boot_timeline(mocker, m5stickv, capsys):
+    import sys
+    from krux.power import power_manager
+    from krux.display import display
+    from krux.residency import residency
+
+    residency.recording = True
+    residency.on_boot = mocker.MagicMock()
+
+    mocker.patch.object(display, "initialize_lcd")
+    mocker.patch.object(display, "draw_centered_text")
+    mocker.patch.object(power_manager, "shutdown")
+    # Shutdown from the login menu
+    login = mocker.patch("krux.pages.login.Login")
+
+    # Login kept Tools resident
+    def run_login(_):
+        from krux.residency import residency
+
+        residency.load("krux.pages.tools")
+        residency.release("krux.pages.tools")
+        return False
+
+    login.return_value.run.side_effect = run_login
+
+    runpy.run_path(BOOT_PATH)
+
+    labels = [label for label, _, _ in residency.timeline]
+    assert labels == [
+        "start",
+        "splash",
+        "updates checked",
+        "context",
+        "splash wait",
+        "tc code verified",
+        "login ready",
+    ]
+    assert residency.imports[0][0] == "krux.pages.login"
+    assert "krux.pages.login" not in sys.modules
+    assert "krux.pages.tools" not in sys.modules
+    assert not residency.idle
+    # The report is left to the hook, boot doesn't print it
+    residency.on_boot.assert_called_once()
+    assert "login ready" in residency.on_boot.call_args[0][0]
+    assert residency.report() not in capsys.readouterr().out
+    power_manager.shutdown.assert_called_once()
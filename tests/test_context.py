@@ -27,6 +27,35 @@ def test_clear(mocker, m5stickv):
     assert c.wallet is None
 
 
+def test_clear_zeroizes_stretched_keys(mocker, m5stickv):
+    mock_modules(mocker)
+    from krux.context import Context
+    from krux import kef
+
+    kef.Cipher(b"key", b"salt", 1000)
+    stretched = list(kef._stretched_keys.secrets.values())
+
+    Context().clear()
+
+    assert not kef._stretched_keys.secrets
+    assert all(buffer == bytearray(len(buffer)) for buffer in stretched)
+
+
+def test_clear_zeroizes_seeds(mocker, m5stickv):
+    mock_modules(mocker)
+    from krux.context import Context
+    from krux import key
+
+    key.Key.extract_fingerprint("abandon " * 11 + "about")
+    seeds = list(key._seeds.secrets.values())
+
+    Context().clear()
+
+    assert seeds
+    assert not key._seeds.secrets
+    assert all(seed == bytearray(len(seed)) for seed in seeds)
+
+
 def test_is_logged_in(mocker, m5stickv):
     from krux.key import TYPE_SINGLESIG
 
@@ -0,0 +1,120 @@
+import pytest
+
+
+@pytest.fixture
+def sd_dir(mocker, tmp_path):
+    mocker.patch("krux.sd_card.SDHandler.PATH_STR", str(tmp_path) + "/%s")
+    return tmp_path
+
+
+def run_named(*names):
+    from krux.device_benchmarks import all_benchmarks, run_benchmark
+
+    return {
+        benchmark[0]: run_benchmark(*benchmark)
+        for benchmark in all_benchmarks()
+        if benchmark[0] in names
+    }
+
+
+def test_all_benchmarks_names(m5stickv):
+    from krux.device_benchmarks import all_benchmarks
+    from krux.kef import VERSIONS
+
+    names = [benchmark[0] for benchmark in all_benchmarks()]
+    assert len(names) == len(set(names))
+    for expected in (
+        "qr encode v1",
+        "qr encode v20",
+        "bbqr decode",
+        "ur decode",
+        "psbt sign 50 in",
+        "address derivation",
+        "pbkdf2 sha256",
+        "pbkdf2 sha512",
+        "sd write",
+        "sd read",
+        "lcd redraw",
+    ):
+        assert expected in names
+    for version in VERSIONS:
+        assert "kef encrypt " + VERSIONS[version]["name"] in names
+        assert "kef decrypt " + VERSIONS[version]["name"] in names
+
+
+def test_run_benchmarks(m5stickv, sd_dir):
+    from krux.device_benchmarks import SD_FILENAME
+
+    names = (
+        "qr encode v1",
+        "qr encode v10",
+        "bbqr decode",
+        "address derivation",
+        "kef encrypt AES-GCM",
+        "kef decrypt AES-GCM",
+        "pbkdf2 sha256",
+        "pbkdf2 sha512",
+        "sd write",
+        "sd read",
+        "lcd redraw",
+    )
+    results = run_named(*names)
+    assert sorted(results) == sorted(names)
+    for result in results.values():
+        assert "error" not in result, result
+        assert result["rate"] > 0
+        assert result["ms"] >= 1
+        assert result["heap"] >= 0
+    assert results["sd write"]["unit"] == "KB/s"
+    assert not (sd_dir / SD_FILENAME).exists()
+
+
+def test_run_ur_benchmarks(m5stickv):
+    results = run_named("ur decode", "psbt sign 1 in")
+    for result in results.values():
+        assert "error" not in result, result
+
+
+def test_run_benchmark_error(m5stickv, mocker):
+    from krux.device_benchmarks import run_benchmark
+    from krux.wdt import wdt
+
+    result = run_benchmark("broken", mocker.MagicMock(side_effect=ValueError("x")))
+    assert result == {"name": "broken", "error": "ValueError('x')"}
+    wdt.feed.assert_called()
+
+
+def test_run_benchmark_heap_and_rate(m5stickv, mocker):
+    import gc
+    import time
+    from krux.device_benchmarks import run_benchmark
+
+    mocker.patch.object(gc, "mem_alloc", side_effect=[0, 100, 400, 250, 150])
+    mocker.patch.object(time, "ticks_ms", side_effect=[1000, 1500])
+
+    def benchmark(sample):
+        def workload():
+            sample()
+            sample()
+
+        return workload, 20, "ops/s"
+
+    assert run_benchmark("heap", benchmark) == {
+        "name": "heap",
+        "rate": 40.0,
+        "unit": "ops/s",
+        "ms": 500,
+        "heap": 300,
+    }
+
+
+def test_report(m5stickv):
+    from krux.device_benchmarks import report
+    from krux.metadata import VERSION
+
+    results = [{"name": "x", "error": "y"}]
+    assert report(results) == {
+        "board": "m5stickv",
+        "version": VERSION,
+        "results": results,
+    }
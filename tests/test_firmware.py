@@ -14,6 +14,22 @@ SD_FIRMWARE_PATH = "/" + SD_PATH + "/" + FIRMWARE_FILENAME
 SD_FIRMWARE_SIG_PATH = "/" + SD_PATH + "/" + FIRMWARE_SIG_FILENAME
 
 
+def mock_stat(size):
+    import os
+
+    return os.stat_result((0x8000, 0, 0, 1, 0, 0, size, 0, 0, 0))
+
+
+def read_firmware(data, chunk_size=2**16):
+    import io
+    from krux.firmware import FirmwareReader
+
+    firmware_reader = FirmwareReader(io.BytesIO(data), len(data))
+    while firmware_reader.read(chunk_size):
+        pass
+    return firmware_reader
+
+
 @pytest.fixture
 def tdata(mocker):
     import os
@@ -12450,12 +12466,33 @@ def test_update_boot_config_sector(mocker, m5stickv, tdata):
         assert after_sector[i * 32 + 8 : i * 32 + 8 + 4] == (1653985).to_bytes(4, "big")
 
 
-def test_fsize(mocker, m5stickv, tdata):
-    from krux.firmware import fsize
+def test_firmware_reader(mocker, m5stickv, tdata):
+    import binascii
+    import io
+    from krux.firmware import FirmwareReader
 
     with open(tdata.TEST_FIRMWARE_FILENAME, "rb") as f:
         expected_size = len(f.read())
-    assert fsize(tdata.TEST_FIRMWARE_FILENAME) == expected_size
+
+    for chunk_size in (2**10, 2**14, 2**16):
+        firmware_reader = read_firmware(tdata.TEST_FIRMWARE, chunk_size)
+        assert firmware_reader.size == expected_size
+        assert firmware_reader.sha256() == binascii.unhexlify(
+            tdata.TEST_FIRMWARE_SHA256
+        )
+        assert firmware_reader.sha256_with_header() == binascii.unhexlify(
+            tdata.TEST_FIRMWARE_WITH_HEADER_SHA256
+        )
+
+    # Data is passed through unchanged
+    firmware_reader = FirmwareReader(io.BytesIO(tdata.TEST_FIRMWARE), expected_size)
+    data = b""
+    while True:
+        chunk = firmware_reader.read(1000)
+        if not chunk:
+            break
+        data += chunk
+    assert data == tdata.TEST_FIRMWARE
 
 
 def test_write_data_with_header_and_sha_suffix(mocker, m5stickv, tdata):
@@ -12900,26 +12937,23 @@ def test_extract_calver():
 
 
 def test_is_this_device(mocker, m5stickv, tdata):
-    from unittest.mock import mock_open, patch
     from krux.firmware import is_this_device
     import board
 
     file_bytes = tdata.TEST_FIRMWARE_25_03_0
 
-    filename = "firmware.bin"
-    with patch("builtins.open", mock_open(read_data=file_bytes)) as mock_file:
-        assert is_this_device(filename) == False
-        mock_file.assert_called_once()
+    assert is_this_device(read_firmware(file_bytes)) == False
 
-    with patch("builtins.open", mock_open(read_data=file_bytes)) as mock_file:
-        board.config["type"] = "amigo"
-        assert is_this_device(filename) == True
-        mock_file.assert_called_once()
+    board.config["type"] = "amigo"
+    assert is_this_device(read_firmware(file_bytes)) == True
 
+    # Pattern split between two chunks
+    pos = file_bytes.find(b'"amigo"')
+    firmware_reader = read_firmware(file_bytes[pos - 1000 :], 1003)
+    assert is_this_device(firmware_reader) == True
 
-def test_is_version_greater(mocker, m5stickv, tdata):
-    from unittest.mock import mock_open, patch
 
+def test_is_version_greater(mocker, m5stickv, tdata):
     from krux.firmware import is_version_greater, VERSION
 
     DATA_22_12_2 = b"\x00\x00\x00[\x0722.12.2\x00\x00\x00\x00\x00\x00\x00\xdf\x07VERSION\x00\x00\x00\x00\x00\x00\x00\xb4\x10krux/metadata.py"
@@ -12977,16 +13011,13 @@ def test_is_version_greater(mocker, m5stickv, tdata):
         ),
     ]
 
-    filename = "firmware.bin"
     for i, case in enumerate(cases):
         print(i)
-        file_bytes = case[0]
         mocker.patch("krux.firmware.VERSION", case[1])
         version_greater = case[2]
-
-        with patch("builtins.open", mock_open(read_data=file_bytes)) as mock_file:
-            assert is_version_greater(filename) == version_greater
-            mock_file.assert_called_once()
+        for chunk_size in (2**10, 2**16):
+            firmware_reader = read_firmware(case[0], chunk_size)
+            assert is_version_greater(firmware_reader) == version_greater
 
     ###################
     # Check ERROR CASES
@@ -13014,11 +13045,9 @@ def test_is_version_greater(mocker, m5stickv, tdata):
     ]
     for i, case in enumerate(cases):
         print(i)
-        file_bytes = case[0]
         mocker.patch("krux.firmware.VERSION", case[1])
-        with patch("builtins.open", mock_open(read_data=file_bytes)) as mock_file:
-            with pytest.raises(ValueError):
-                is_version_greater(filename)
+        with pytest.raises(ValueError):
+            is_version_greater(read_firmware(case[0]))
 
 
 def test_upgrade_succeed(mocker, m5stickv, mock_success_input_cls, tdata):
@@ -13041,7 +13070,7 @@ def test_upgrade_succeed(mocker, m5stickv, mock_success_input_cls, tdata):
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     display_mocker = mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
@@ -13064,8 +13093,8 @@ def test_upgrade_succeed(mocker, m5stickv, mock_success_input_cls, tdata):
     mocker.spy(firmware, "write_data")
     mocker.spy(firmware, "update_boot_config_sector")
 
-    firmware.is_version_greater = lambda filename: "00.00.0"
-    firmware.is_this_device = lambda filename: True
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
+    firmware.is_this_device = lambda firmware_reader: True
     assert firmware.upgrade()
 
     krux.firmware.ec.PublicKey.from_string.assert_called_with(tdata.TEST_SIGNER_PUBKEY)
@@ -13079,7 +13108,7 @@ def test_upgrade_succeed(mocker, m5stickv, mock_success_input_cls, tdata):
         binascii.unhexlify(tdata.TEST_FIRMWARE_SHA256),
     )
 
-    krux.firmware.flash.read.assert_called_with(
+    krux.firmware.flash.read.assert_any_call(
         firmware.MAIN_BOOT_CONFIG_SECTOR_ADDRESS, 4096
     )
 
@@ -13134,7 +13163,7 @@ def test_upgrade_fails_write_data(mocker, m5stickv, mock_success_input_cls, tdat
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
     mocker.patch(
@@ -13151,8 +13180,8 @@ def test_upgrade_fails_write_data(mocker, m5stickv, mock_success_input_cls, tdat
     mocker.patch.object(firmware, "write_data", side_effect=ValueError)
     mocker.spy(firmware, "display")
 
-    firmware.is_version_greater = lambda filename: "00.00.0"
-    firmware.is_this_device = lambda filename: True
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
+    firmware.is_this_device = lambda firmware_reader: True
     assert not firmware.upgrade()
 
     from krux.themes import theme
@@ -13162,6 +13191,58 @@ def test_upgrade_fails_write_data(mocker, m5stickv, mock_success_input_cls, tdat
     )
 
 
+def test_upgrade_fails_when_firmware_changes_after_verifying(
+    mocker, m5stickv, mock_success_input_cls, tdata
+):
+    from unittest import mock
+    from krux import firmware
+    from krux.themes import theme
+
+    # The firmware file is replaced after it was verified and confirmed
+    changed_firmware = bytearray(tdata.TEST_FIRMWARE)
+    changed_firmware[-1] ^= 0xFF
+    firmware_reads = [tdata.TEST_FIRMWARE, bytes(changed_firmware)]
+    files = {SD_FIRMWARE_SIG_PATH: tdata.TEST_FIRMWARE_SIG}
+
+    def open_mock(filename, *args, **kwargs):
+        if filename == SD_FIRMWARE_PATH:
+            return mock.mock_open(read_data=firmware_reads.pop(0)).return_value
+        return mock.mock_open(read_data=files[filename]).return_value
+
+    mocker.patch("builtins.open", new=mocker.MagicMock(side_effect=open_mock))
+    mocker.patch(
+        "os.stat",
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
+    )
+    mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
+    mocker.patch("krux.firmware.SIGNER_PUBKEY", tdata.TEST_SIGNER_PUBKEY)
+    mocker.patch(
+        "krux.firmware.flash.read",
+        new=mocker.MagicMock(
+            return_value=bytes(tdata.SECTOR_WITH_ACTIVE_FIRMWARE_AT_INDEX_1_SLOT_1)
+        ),
+    )
+    mocker.patch(
+        "krux.firmware.ec.PublicKey.from_string",
+        new=mocker.MagicMock(return_value=tdata.TEST_SIGNER_PUBLIC_KEY),
+    )
+    mocker.spy(firmware, "write_data")
+    mocker.spy(firmware, "update_boot_config_sector")
+    mocker.spy(firmware, "display")
+
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
+    firmware.is_this_device = lambda firmware_reader: True
+    assert not firmware.upgrade()
+
+    # Only the inactive slot was written, the boot config was never switched
+    firmware.write_data.assert_called_once()
+    assert firmware.write_data.call_args[0][1] == firmware.FIRMWARE_SLOT_2
+    firmware.update_boot_config_sector.assert_not_called()
+    firmware.display.flash_text.assert_called_with(
+        "Error read/write data", theme.error_color
+    )
+
+
 def test_upgrade_uses_backup_sector_when_main_sector_is_missing_active_firmware(
     mocker, m5stickv, mock_success_input_cls, tdata
 ):
@@ -13184,7 +13265,7 @@ def test_upgrade_uses_backup_sector_when_main_sector_is_missing_active_firmware(
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
@@ -13210,8 +13291,8 @@ def test_upgrade_uses_backup_sector_when_main_sector_is_missing_active_firmware(
     mocker.spy(firmware, "write_data")
     mocker.spy(firmware, "update_boot_config_sector")
 
-    firmware.is_version_greater = lambda filename: "00.00.0"
-    firmware.is_this_device = lambda filename: True
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
+    firmware.is_this_device = lambda firmware_reader: True
     assert firmware.upgrade()
 
     krux.firmware.ec.PublicKey.from_string.assert_called_with(tdata.TEST_SIGNER_PUBKEY)
@@ -13290,7 +13371,7 @@ def test_upgrade_uses_slot_1_when_firmware_is_in_slot_2(
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
@@ -13313,8 +13394,8 @@ def test_upgrade_uses_slot_1_when_firmware_is_in_slot_2(
     mocker.spy(firmware, "write_data")
     mocker.spy(firmware, "update_boot_config_sector")
 
-    firmware.is_version_greater = lambda filename: "00.00.0"
-    firmware.is_this_device = lambda filename: True
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
+    firmware.is_this_device = lambda firmware_reader: True
     assert firmware.upgrade()
 
     krux.firmware.ec.PublicKey.from_string.assert_called_with(tdata.TEST_SIGNER_PUBKEY)
@@ -13328,7 +13409,7 @@ def test_upgrade_uses_slot_1_when_firmware_is_in_slot_2(
         binascii.unhexlify(tdata.TEST_FIRMWARE_SHA256),
     )
 
-    krux.firmware.flash.read.assert_called_with(
+    krux.firmware.flash.read.assert_any_call(
         firmware.MAIN_BOOT_CONFIG_SECTOR_ADDRESS, 4096
     )
 
@@ -13394,7 +13475,7 @@ def test_upgrade_fails_when_user_declines(mocker, m5stickv, mock_fail_input_cls,
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     display_mocker = mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_fail_input_cls)
@@ -13404,16 +13485,20 @@ def test_upgrade_fails_when_user_declines(mocker, m5stickv, mock_fail_input_cls,
     mocker.patch.object(
         firmware, "find_active_firmware", side_effect=tdata.TEST_SECTOR_CASES[0]
     )
-    firmware.is_version_greater = lambda filename: "00.00.0"
-    firmware.is_this_device = lambda filename: True
+    mocker.spy(firmware, "write_data")
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
+    firmware.is_this_device = lambda firmware_reader: True
 
     assert not firmware.upgrade()
     display_mocker.flash_text.assert_not_called()
+    firmware.write_data.assert_not_called()
 
 
 def test_upgrade_fails_when_firmware_too_big(
     mocker, m5stickv, mock_success_input_cls, tdata
 ):
+    from krux.firmware import MAX_FIRMWARE_SIZE
+
     mocker.patch(
         "builtins.open",
         new=get_mock_open(
@@ -13425,17 +13510,16 @@ def test_upgrade_fails_when_firmware_too_big(
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(MAX_FIRMWARE_SIZE + 1)),
     )
     display_mocker = mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
-    mocker.patch("krux.firmware.fsize", new=lambda f: firmware.MAX_FIRMWARE_SIZE + 1)
     from krux import firmware
 
     mocker.patch.object(
         firmware, "find_active_firmware", side_effect=tdata.TEST_SECTOR_CASES[0]
     )
-    firmware.is_version_greater = lambda filename: "00.00.0"
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
 
     assert not firmware.upgrade()
     display_mocker.flash_text.assert_called_with(
@@ -13457,7 +13541,7 @@ def test_upgrade_fails_when_pubkey_is_invalid(
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     display_mocker = mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
@@ -13467,7 +13551,7 @@ def test_upgrade_fails_when_pubkey_is_invalid(
     mocker.patch.object(
         firmware, "find_active_firmware", side_effect=tdata.TEST_SECTOR_CASES[0]
     )
-    firmware.is_version_greater = lambda filename: "00.00.0"
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
 
     assert not firmware.upgrade()
     display_mocker.flash_text.assert_called_with(
@@ -13489,7 +13573,7 @@ def test_upgrade_fails_when_sig_file_missing(
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     display_mocker = mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
@@ -13499,7 +13583,7 @@ def test_upgrade_fails_when_sig_file_missing(
     mocker.patch.object(
         firmware, "find_active_firmware", side_effect=tdata.TEST_SECTOR_CASES[0]
     )
-    firmware.is_version_greater = lambda filename: "00.00.0"
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
 
     assert not firmware.upgrade()
     display_mocker.flash_text.assert_called_with(
@@ -13521,7 +13605,7 @@ def test_upgrade_fails_when_sig_is_invalid(
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     display_mocker = mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
@@ -13531,7 +13615,7 @@ def test_upgrade_fails_when_sig_is_invalid(
     mocker.patch.object(
         firmware, "find_active_firmware", side_effect=tdata.TEST_SECTOR_CASES[0]
     )
-    firmware.is_version_greater = lambda filename: "00.00.0"
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
 
     assert not firmware.upgrade()
     display_mocker.flash_text.assert_called_with(
@@ -13553,7 +13637,7 @@ def test_upgrade_fails_when_sig_is_malformed(
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     display_mocker = mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
@@ -13563,7 +13647,7 @@ def test_upgrade_fails_when_sig_is_malformed(
     mocker.patch.object(
         firmware, "find_active_firmware", side_effect=tdata.TEST_SECTOR_CASES[0]
     )
-    firmware.is_version_greater = lambda filename: "00.00.0"
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
 
     assert not firmware.upgrade()
     display_mocker.flash_text.assert_called_with(
@@ -13583,7 +13667,7 @@ def test_upgrade_fails_when_sig_is_bad(mocker, m5stickv, mock_success_input_cls,
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     display_mocker = mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
@@ -13593,12 +13677,14 @@ def test_upgrade_fails_when_sig_is_bad(mocker, m5stickv, mock_success_input_cls,
     mocker.patch.object(
         firmware, "find_active_firmware", side_effect=tdata.TEST_SECTOR_CASES[0]
     )
-    firmware.is_version_greater = lambda filename: "00.00.0"
+    mocker.spy(firmware, "write_data")
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
 
     assert not firmware.upgrade()
     display_mocker.flash_text.assert_called_with(
         "Bad signature", firmware.theme.error_color
     )
+    firmware.write_data.assert_not_called()
 
 
 def test_upgrade_fails_when_both_sectors_missing_active_firmware(
@@ -13616,7 +13702,7 @@ def test_upgrade_fails_when_both_sectors_missing_active_firmware(
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
@@ -13627,7 +13713,7 @@ def test_upgrade_fails_when_both_sectors_missing_active_firmware(
     )
     from krux import firmware
 
-    firmware.is_version_greater = lambda filename: "00.00.0"
+    firmware.is_version_greater = lambda firmware_reader: "00.00.0"
 
     assert not firmware.upgrade()
 
@@ -13676,10 +13762,10 @@ def test_upgrade_fails_version_lower(mocker, m5stickv, mock_success_input_cls, t
     mocker.spy(firmware, "write_data")
     mocker.spy(firmware, "update_boot_config_sector")
 
-    firmware.is_version_greater = lambda filename: False
+    firmware.is_version_greater = lambda firmware_reader: False
     assert not firmware.upgrade()
 
-    def val_error(filename):
+    def val_error(firmware_reader):
         raise ValueError()
 
     firmware.is_version_greater = val_error
@@ -13761,7 +13847,7 @@ def test_upgrade_fail_version_not_newer(
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     display_mocker = mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
@@ -13784,8 +13870,8 @@ def test_upgrade_fail_version_not_newer(
     mocker.spy(firmware, "write_data")
     mocker.spy(firmware, "update_boot_config_sector")
 
-    firmware.is_version_greater = lambda filename: False
-    firmware.is_this_device = lambda filename: True
+    firmware.is_version_greater = lambda firmware_reader: False
+    firmware.is_this_device = lambda firmware_reader: True
     assert firmware.upgrade() == False
 
     krux.firmware.ec.PublicKey.from_string.assert_called_with(tdata.TEST_SIGNER_PUBKEY)
@@ -13799,12 +13885,13 @@ def test_upgrade_fail_version_not_newer(
         binascii.unhexlify(tdata.TEST_FIRMWARE_SHA256),
     )
 
-    krux.firmware.flash.read.assert_called_with(
+    krux.firmware.flash.read.assert_any_call(
         firmware.MAIN_BOOT_CONFIG_SECTOR_ADDRESS, 4096
     )
 
     firmware.update_boot_config_sector.assert_not_called()
 
+    # Nothing is written to the flash before the firmware is validated
     firmware.write_data.assert_not_called()
 
     display_mocker.flash_text.assert_called_with(
@@ -13835,7 +13922,7 @@ def test_upgrade_fail_version_exception(
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     display_mocker = mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
@@ -13858,7 +13945,7 @@ def test_upgrade_fail_version_exception(
     mocker.spy(firmware, "write_data")
     mocker.spy(firmware, "update_boot_config_sector")
 
-    firmware.is_this_device = lambda filename: True
+    firmware.is_this_device = lambda firmware_reader: True
     assert firmware.upgrade() == False
 
     krux.firmware.ec.PublicKey.from_string.assert_called_with(tdata.TEST_SIGNER_PUBKEY)
@@ -13872,12 +13959,13 @@ def test_upgrade_fail_version_exception(
         binascii.unhexlify(tdata.TEST_FIRMWARE_SHA256),
     )
 
-    krux.firmware.flash.read.assert_called_with(
+    krux.firmware.flash.read.assert_any_call(
         firmware.MAIN_BOOT_CONFIG_SECTOR_ADDRESS, 4096
     )
 
     firmware.update_boot_config_sector.assert_not_called()
 
+    # Nothing is written to the flash before the firmware is validated
     firmware.write_data.assert_not_called()
 
     display_mocker.flash_text.assert_called_with(
@@ -13908,7 +13996,7 @@ def test_upgrade_fail_not_this_device_exception(
     )
     mocker.patch(
         "os.stat",
-        new=mocker.MagicMock(return_value=True),
+        new=mocker.MagicMock(return_value=mock_stat(len(tdata.TEST_FIRMWARE))),
     )
     display_mocker = mocker.patch("krux.firmware.display", new=mocker.MagicMock())
     mocker.patch("krux.firmware.Input", new=mock_success_input_cls)
@@ -13944,12 +14032,13 @@ def test_upgrade_fail_not_this_device_exception(
         binascii.unhexlify(tdata.TEST_FIRMWARE_SHA256),
     )
 
-    krux.firmware.flash.read.assert_called_with(
+    krux.firmware.flash.read.assert_any_call(
         firmware.MAIN_BOOT_CONFIG_SECTOR_ADDRESS, 4096
     )
 
     firmware.update_boot_config_sector.assert_not_called()
 
+    # Nothing is written to the flash before the firmware is validated
     firmware.write_data.assert_not_called()
 
     display_mocker.flash_text.assert_called_with(
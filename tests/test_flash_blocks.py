@@ -0,0 +1,136 @@
+import pytest
+
+
+@pytest.fixture
+def flash_image(m5stickv, mocker):
+    """Flash with firmware written up to SPIFFS and SPIFFS empty"""
+    from krux.firmware import FLASH_SIZE, SPIFFS_ADDR
+
+    image = bytearray(b"\x00" * SPIFFS_ADDR + b"\xff" * (FLASH_SIZE - SPIFFS_ADDR))
+
+    def read(address, size):
+        return bytes(image[address : address + size])
+
+    mocker.patch("flash.read", side_effect=read)
+    return image
+
+
+def test_is_erased(flash_image):
+    from krux.flash_blocks import flash_blocks, PROBE_SIZE, BLOCK_SIZE
+    from krux.firmware import SPIFFS_ADDR
+    import flash
+
+    assert not flash_blocks.is_erased(0)
+    flash.read.assert_called_once_with(0, PROBE_SIZE)
+    assert flash_blocks.is_erased(SPIFFS_ADDR)
+    assert not flash_blocks.is_erased(SPIFFS_ADDR - BLOCK_SIZE)
+
+    # Used blocks cost a probe read, erased blocks a probe and a full read
+    used_blocks = SPIFFS_ADDR // BLOCK_SIZE
+    assert flash.read.call_count == used_blocks + 2
+
+
+def test_is_erased_stops_at_used_byte(flash_image):
+    from krux.flash_blocks import flash_blocks, BLOCK_SIZE
+    from krux.firmware import SPIFFS_ADDR
+
+    flash_image[SPIFFS_ADDR + BLOCK_SIZE - 1] = 0
+    assert not flash_blocks.is_erased(SPIFFS_ADDR)
+    assert flash_blocks.is_erased(SPIFFS_ADDR + BLOCK_SIZE)
+
+
+def test_is_erased_uses_bitmap(flash_image):
+    from krux.flash_blocks import flash_blocks, BLOCK_SIZE
+    from krux.firmware import FLASH_SIZE
+    import flash
+
+    for address in range(0, FLASH_SIZE, BLOCK_SIZE):
+        flash_blocks.is_erased(address)
+    reads = flash.read.call_count
+
+    erased = [
+        flash_blocks.is_erased(address) for address in range(0, FLASH_SIZE, BLOCK_SIZE)
+    ]
+    assert flash.read.call_count == reads
+    assert erased.count(True) == len(erased) - erased.index(True)
+
+
+def test_spiffs_changed(flash_image):
+    from krux.flash_blocks import flash_blocks, BLOCK_SIZE
+    from krux.firmware import FLASH_SIZE, SPIFFS_ADDR
+    import flash
+
+    assert flash_blocks.is_erased(FLASH_SIZE - BLOCK_SIZE)
+    flash_image[SPIFFS_ADDR : SPIFFS_ADDR + BLOCK_SIZE] = b"\x00" * BLOCK_SIZE
+    assert flash_blocks.is_erased(SPIFFS_ADDR)
+
+    flash_blocks.spiffs_changed()
+    flash.read.reset_mock()
+    assert not flash_blocks.is_erased(SPIFFS_ADDR)
+    assert not flash_blocks.is_erased(0)
+    flash.read.assert_called_once_with(SPIFFS_ADDR, 16)
+
+
+def test_settings_save_changes_spiffs(flash_image, mocker):
+    mocker.patch("builtins.open", mocker.mock_open())
+    from krux.flash_blocks import flash_blocks
+    from krux.settings import Store
+    from krux.firmware import SPIFFS_ADDR
+
+    s = Store()
+    flash_blocks.is_erased(SPIFFS_ADDR)
+    assert flash_blocks.stale_from > SPIFFS_ADDR
+
+    s.set("name.space", "setting", "custom_value")
+    assert s.save_settings()
+    assert flash_blocks.stale_from == SPIFFS_ADDR
+
+
+def test_mark_written_and_erased(flash_image):
+    from krux.flash_blocks import flash_blocks
+    from krux.firmware import SPIFFS_ADDR, FLASH_SIZE
+    import flash
+
+    flash_blocks.is_erased(FLASH_SIZE - 1)
+    flash_blocks.mark_written(SPIFFS_ADDR)
+    flash_blocks.mark_erased(0)
+    flash.read.reset_mock()
+
+    assert not flash_blocks.is_erased(SPIFFS_ADDR)
+    assert flash_blocks.is_erased(0)
+    flash.read.assert_not_called()
+
+
+def test_is_erased_verify(flash_image):
+    from krux.flash_blocks import flash_blocks, BLOCK_SIZE
+    from krux.firmware import SPIFFS_ADDR
+    import flash
+
+    assert flash_blocks.is_erased(SPIFFS_ADDR)
+    flash_image[SPIFFS_ADDR] = 0
+    assert flash_blocks.is_erased(SPIFFS_ADDR)
+
+    flash.read.reset_mock()
+    assert not flash_blocks.is_erased(SPIFFS_ADDR, verify=True)
+    assert not flash_blocks.is_erased(SPIFFS_ADDR)
+    assert not flash_blocks.is_erased(0, verify=True)
+    flash.read.assert_called_once_with(SPIFFS_ADDR, 16)
+
+
+def test_is_erased_verify_trusts_blocks_just_read(flash_image):
+    from krux.flash_blocks import flash_blocks, BLOCK_SIZE
+    from krux.firmware import FLASH_SIZE, SPIFFS_ADDR
+    import flash
+
+    # The first scan reads every block once, with or without verify
+    for address in range(0, FLASH_SIZE, BLOCK_SIZE):
+        flash_blocks.is_erased(address, verify=True)
+    used_blocks = SPIFFS_ADDR // BLOCK_SIZE
+    erased_blocks = (FLASH_SIZE - SPIFFS_ADDR) // BLOCK_SIZE
+    assert flash.read.call_count == used_blocks + 2 * erased_blocks
+
+    # Later, only blocks known as erased are read again
+    flash.read.reset_mock()
+    for address in range(0, FLASH_SIZE, BLOCK_SIZE):
+        flash_blocks.is_erased(address, verify=True)
+    assert flash.read.call_count == 2 * erased_blocks
@@ -1,10 +1,20 @@
 import pytest
+import json
+import os
+
+TRANSLATIONS_DIR = os.path.join(os.path.dirname(__file__), "..", "i18n", "translations")
+
+
+def load_translation_file(lang):
+    with open(
+        os.path.join(TRANSLATIONS_DIR, "%s.json" % lang), "r", encoding="utf8"
+    ) as translation_file:
+        return json.load(translation_file)
 
 
 def test_translations(mocker, m5stickv):
     from krux.krux_settings import t, locale_control
-    from krux.translations import available_languages, ref_array
-    import binascii
+    from krux.translations import available_languages
 
     # Test default language
     assert t("Load Mnemonic") == "Load Mnemonic"
@@ -16,15 +26,61 @@ def test_translations(mocker, m5stickv):
     # Test non existent slug
     assert t("New Text") == "New Text"
 
-    # Cross-check available languages reference files
-    crc32_index = binascii.crc32("Load Mnemonic".encode("utf-8"))
-    reference_index = ref_array.index(crc32_index)
+    # Cross-check available languages with their translation files
     for lang in available_languages:
-        # Construct the path to the nested module
-        lang_module_path = f"krux.translations.{lang[:2]}"
-        # Import the top-level module (krux)
-        lang_trans_module = __import__(lang_module_path, fromlist=[""])
-        # Access the translation_array variable from the nested module
-        lang_trans_array = getattr(lang_trans_module, "translation_array")
         locale_control.load_locale(lang)
-        assert t("Load Mnemonic") == lang_trans_array[reference_index]
+        assert t("Load Mnemonic") == load_translation_file(lang)["Load Mnemonic"]
+
+
+def test_translation_catalogs(mocker, m5stickv):
+    from krux.krux_settings import _catalog_lookup
+    from krux.translations import available_languages
+    import binascii
+
+    for lang in available_languages:
+        lang_module = __import__(f"krux.translations.{lang[:2]}", fromlist=[""])
+        catalog = lang_module.catalog
+        count = int.from_bytes(catalog[:2], "little")
+        slug_ids = [
+            int.from_bytes(catalog[2 + 4 * i : 6 + 4 * i], "little")
+            for i in range(count)
+        ]
+        assert slug_ids == sorted(slug_ids)
+
+        # Every baked entry is a translation from the locale's file
+        found = 0
+        for slug, translation in load_translation_file(lang).items():
+            slug_id = binascii.crc32(slug.encode("utf-8"))
+            baked = _catalog_lookup(catalog, slug_id)
+            if baked is not None:
+                assert baked == translation
+                found += 1
+        assert found == count
+
+    assert _catalog_lookup(catalog, 0) is None
+    assert _catalog_lookup(catalog, 0xFFFFFFFF) is None
+
+
+def test_translation_memo(mocker, m5stickv):
+    from krux.krux_settings import t, locale_control, TRANSLATION_MEMO_SIZE
+    import binascii
+
+    locale_control.load_locale("pt_BR")
+    crc32 = mocker.spy(binascii, "crc32")
+
+    # Repeated slugs are served from the memo without hashing again
+    assert t("Load Mnemonic") == "Carregar Mnemônico"
+    assert t("Load Mnemonic") == "Carregar Mnemônico"
+    assert t("New Text") == "New Text"
+    assert t("New Text") == "New Text"
+    assert crc32.call_count == 2
+
+    # Memo is bounded
+    for i in range(TRANSLATION_MEMO_SIZE * 2):
+        t("Slug %d" % i)
+    assert len(locale_control.memo) <= TRANSLATION_MEMO_SIZE
+
+    # Memo is dropped when the locale changes
+    locale_control.load_locale("en-US")
+    assert not locale_control.memo
+    assert t("Load Mnemonic") == "Load Mnemonic"
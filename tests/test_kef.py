@@ -156,6 +156,50 @@ def test_Cipher_initialization(m5stickv):
                 kef.Cipher(valid_key, valid_salt, invalid)
 
 
+def test_Cipher_reuses_stretched_keys(mocker, m5stickv):
+    from krux import kef
+
+    pbkdf2_spy = mocker.patch.object(
+        kef.uhashlib_hw,
+        "pbkdf2_hmac_sha256",
+        side_effect=kef.uhashlib_hw.pbkdf2_hmac_sha256,
+    )
+
+    cipher = kef.Cipher(b"key", b"salt", 1000)
+    again = kef.Cipher("key", "salt", 1000)
+    assert pbkdf2_spy.call_count == 1
+    assert again._key == cipher._key
+
+    # any change of key, salt or iterations stretches a new key
+    kef.Cipher(b"other key", b"salt", 1000)
+    kef.Cipher(b"key", b"other salt", 1000)
+    kef.Cipher(b"key", b"salt", 1001)
+    assert pbkdf2_spy.call_count == 4
+
+    # neither plain keys nor a plain hash of them are kept in the cache
+    from hashlib import sha256
+
+    for cache_key in kef._stretched_keys.secrets:
+        assert b"key" not in cache_key
+        assert sha256(b"key").digest() not in cache_key
+
+
+def test_clear_stretched_keys(mocker, m5stickv):
+    from krux import kef
+
+    cipher = kef.Cipher(b"key", b"salt", 1000)
+    stretched = list(kef._stretched_keys.secrets.values())
+    encrypted = cipher.encrypt(b"sixteen byte msg", 0)
+
+    kef.clear_stretched_keys()
+
+    assert not kef._stretched_keys.secrets and not kef._stretched_keys.order
+    assert all(buffer == bytearray(len(buffer)) for buffer in stretched)
+    # live ciphers keep their own copy of the key
+    assert cipher.decrypt(encrypted, 0) == b"sixteen byte msg"
+    assert cipher._key == kef.Cipher(b"key", b"salt", 1000)._key
+
+
 def test_Cipher_calling_method_encrypt(m5stickv):
     from krux import kef
 
@@ -77,11 +77,15 @@ def tdata(mocker):
 
 
 def mock_modules(mocker):
-    from embit import bip39, bip32
+    from embit import bip32
+    from krux.bip39 import k_mnemonic_to_seed
     import binascii
 
     mocker.patch("krux.key.bip32", new=mocker.MagicMock(wraps=bip32))
-    mocker.patch("krux.key.bip39", new=mocker.MagicMock(wraps=bip39))
+    mocker.patch(
+        "krux.key.k_mnemonic_to_seed",
+        new=mocker.MagicMock(wraps=k_mnemonic_to_seed),
+    )
     mocker.patch("krux.key.hexlify", new=mocker.MagicMock(wraps=binascii.hexlify))
 
 
@@ -728,3 +732,48 @@ def test_classmethod_extract_fingerprint(mocker, m5stickv, tdata):
     fingerprint = Key.extract_fingerprint("this is not a mnemonic", pretty=False)
 
     assert fingerprint == ""
+
+
+def test_rebuilding_key_reuses_seed(mocker, m5stickv, tdata):
+    from krux import key
+    from krux.key import Key, TYPE_SINGLESIG, TYPE_MULTISIG, P2TR
+    from embit.networks import NETWORKS
+
+    seed_spy = mocker.patch.object(
+        key, "k_mnemonic_to_seed", side_effect=key.k_mnemonic_to_seed
+    )
+
+    first = Key(tdata.TEST_12_WORD_MNEMONIC, TYPE_SINGLESIG)
+    # other policy, script, account or network reuse the seed
+    Key(tdata.TEST_12_WORD_MNEMONIC, TYPE_MULTISIG)
+    Key(tdata.TEST_12_WORD_MNEMONIC, TYPE_SINGLESIG, script_type=P2TR)
+    Key(tdata.TEST_12_WORD_MNEMONIC, TYPE_SINGLESIG, account_index=1)
+    main = Key(tdata.TEST_12_WORD_MNEMONIC, TYPE_SINGLESIG, NETWORKS["main"])
+    assert Key.extract_fingerprint(tdata.TEST_12_WORD_MNEMONIC, pretty=False) == (
+        "55f8fc5d"
+    )
+    assert seed_spy.call_count == 1
+    assert main.fingerprint == first.fingerprint
+    assert main.root.to_base58().startswith("xprv")
+
+    # another passphrase or mnemonic derives a new seed
+    Key(tdata.TEST_12_WORD_MNEMONIC, TYPE_SINGLESIG, passphrase="test")
+    Key(tdata.TEST_24_WORD_MNEMONIC, TYPE_SINGLESIG)
+    assert seed_spy.call_count == 3
+
+    # mnemonics and passphrases are not kept in the cache
+    assert all(b"olympic" not in cache_key for cache_key in key._seeds.secrets)
+
+
+def test_clear_seeds(mocker, m5stickv, tdata):
+    from krux import key
+    from krux.key import Key, TYPE_SINGLESIG
+
+    Key(tdata.TEST_12_WORD_MNEMONIC, TYPE_SINGLESIG)
+    seeds = list(key._seeds.secrets.values())
+
+    key.clear_seeds()
+
+    assert not key._seeds.secrets
+    assert not key._seeds.order
+    assert all(seed == bytearray(len(seed)) for seed in seeds)
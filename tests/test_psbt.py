@@ -1506,6 +1506,52 @@ def test_sign_tr_expanding_multisig_from_sdcard(mocker, m5stickv, tdata):
         assert mock_file.write_data == case[2]
 
 
+def test_sign_trims_without_copying_psbt(mocker, m5stickv, tdata):
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner
+    from krux.key import Key, TYPE_SINGLESIG
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
+    signer = PSBTSigner(wallet, tdata.P2WPKH_PSBT, FORMAT_NONE)
+    psbt = signer.psbt
+    psbt_init = mocker.spy(type(psbt), "__init__")
+
+    signer.sign()
+    assert signer.psbt is psbt
+    assert signer.psbt_qr() == (tdata.SIGNED_P2WPKH_PSBT, FORMAT_NONE)
+    psbt_init.assert_not_called()
+
+
+def test_trimmed_psbt_keeps_signatures(mocker, m5stickv, tdata):
+    from embit.networks import NETWORKS
+    from embit.psbt import PSBT
+    from krux.psbt import PSBTSigner
+    from krux.key import Key, TYPE_SINGLESIG, TYPE_MULTISIG
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    cases = [
+        (TYPE_SINGLESIG, tdata.P2PKH_PSBT),
+        (TYPE_SINGLESIG, tdata.P2WPKH_PSBT),
+        (TYPE_SINGLESIG, tdata.P2SH_P2WPKH_PSBT),
+        (TYPE_SINGLESIG, tdata.P2TR_PSBT),
+        (TYPE_MULTISIG, tdata.P2WSH_PSBT),
+    ]
+    for policy_type, psbt_data in cases:
+        wallet = Wallet(Key(tdata.TEST_MNEMONIC, policy_type, NETWORKS["test"]))
+        signer = PSBTSigner(wallet, psbt_data, FORMAT_NONE)
+        signer.sign()
+        trimmed = PSBT.parse(signer._serialize_trimmed())
+        for inp, kept in zip(signer.psbt.inputs, trimmed.inputs):
+            # Guards against embit adding or renaming signature fields
+            for field, value in vars(inp).items():
+                if field != "sighash_type" and ("sig" in field or "utxo" in field):
+                    if value:
+                        assert getattr(kept, field) == value, field
+
+
 def test_sign_fails_with_0_sigs_added(mocker, m5stickv, tdata):
     from embit.networks import NETWORKS
     from krux.psbt import PSBTSigner
@@ -2060,6 +2106,35 @@ def test_outputs_tr_miniscript_provably_unspendable(mocker, m5stickv, tdata):
         assert outputs == case[4]
 
 
+def test_policy_memoized_across_phases(mocker, m5stickv, tdata):
+    import krux.psbt
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner
+    from krux.key import Key, TYPE_MULTISIG, P2WSH
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(
+        Key(tdata.TEST_MNEMONIC, TYPE_MULTISIG, NETWORKS["test"], script_type=P2WSH)
+    )
+    get_policy = mocker.spy(krux.psbt, "get_policy")
+    signer = PSBTSigner(wallet, tdata.P2WSH_PSBT, FORMAT_NONE)
+    assert get_policy.call_count == len(signer.psbt.inputs)
+
+    # xpubs are resolved once and parent keys derived once per cosigner branch
+    assert signer.xpubs() is signer.xpubs()
+    assert len(signer._derived_xpubs) == len(signer.policy["cosigners"])
+
+    messages, _ = signer.outputs()
+    calls = get_policy.call_count
+    assert calls <= len(signer.psbt.inputs) + len(signer.psbt.outputs)
+
+    # Later phases reuse memoized policies
+    signer.validate()
+    assert signer.outputs()[0] == messages
+    assert get_policy.call_count == calls
+
+
 def test_xpubs_fails_with_no_xpubs(mocker, m5stickv, tdata):
     from embit.networks import NETWORKS
     from krux.psbt import PSBTSigner
@@ -2083,6 +2158,7 @@ def test_xpubs_rejects_multiple_origin_less_keys(mocker, m5stickv):
     signer = PSBTSigner.__new__(PSBTSigner)
     signer.psbt = mocker.MagicMock(xpubs=None)
     signer.wallet = mocker.MagicMock()
+    signer._xpubs = None
 
     key_with_origin = mocker.MagicMock()
     key_with_origin.origin.fingerprint = b"\x00\x01\x02\x03"
@@ -2099,6 +2175,7 @@ def test_xpubs_rejects_multiple_origin_less_keys(mocker, m5stickv):
     assert "xpub_with_origin" in xpubs
 
     # Two origin-less keys must be rejected.
+    signer._xpubs = None  # Drop xpubs resolved from the previous descriptor
     signer.wallet.descriptor.keys = [key_with_origin, origin_less_a, origin_less_b]
     with pytest.raises(ValueError, match="multiple xpubs without origin"):
         signer.xpubs()
@@ -0,0 +1,188 @@
+import pytest
+from .test_psbt import tdata
+
+
+@pytest.fixture
+def sd_dir(mocker, tmp_path):
+    mocker.patch("krux.psbt_stream.SD_PATH", str(tmp_path).lstrip("/"))
+    return tmp_path
+
+
+def test_sign_to_file_singlesig(mocker, m5stickv, tdata, sd_dir):
+    from embit.networks import NETWORKS
+    from krux.psbt_stream import PSBTStreamSigner
+    from krux.key import Key, TYPE_SINGLESIG
+    from krux.wallet import Wallet
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
+    cases = [
+        (tdata.P2PKH_PSBT, tdata.SIGNED_P2PKH_PSBT_SD),
+        (tdata.P2WPKH_PSBT, tdata.SIGNED_P2WPKH_PSBT_SD),
+        (tdata.P2SH_P2WPKH_PSBT, tdata.SIGNED_P2SH_P2WPKH_PSBT_SD),
+        (tdata.P2TR_PSBT, tdata.SIGNED_P2TR_PSBT_SD),
+    ]
+    for num, case in enumerate(cases):
+        print("test_sign_to_file_singlesig case: ", num)
+        (sd_dir / "dummy.psbt").write_bytes(case[0])
+        signer = PSBTStreamSigner(wallet, "dummy.psbt")
+        signer.sign_to_file("dummy-signed.psbt")
+        assert (sd_dir / "dummy-signed.psbt").read_bytes() == case[1]
+
+
+def test_sign_to_file_multisig(mocker, m5stickv, tdata, sd_dir):
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner
+    from krux.psbt_stream import PSBTStreamSigner
+    from krux.key import Key, TYPE_MULTISIG
+    from krux.wallet import Wallet
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, TYPE_MULTISIG, NETWORKS["test"]))
+    signer = PSBTSigner(wallet, tdata.P2WSH_PSBT, None)
+    signer.sign(trim=False)
+
+    (sd_dir / "dummy.psbt").write_bytes(tdata.P2WSH_PSBT)
+    stream_signer = PSBTStreamSigner(wallet, "dummy.psbt")
+    assert stream_signer.policy == signer.policy
+    stream_signer.sign_to_file("dummy-signed.psbt")
+    assert (sd_dir / "dummy-signed.psbt").read_bytes() == signer.psbt.serialize()
+
+
+def test_review_matches_in_memory_signer(mocker, m5stickv, tdata, sd_dir):
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner
+    from krux.psbt_stream import PSBTStreamSigner
+    from krux.key import Key, TYPE_MULTISIG
+    from krux.wallet import Wallet
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, TYPE_MULTISIG, NETWORKS["test"]))
+    signer = PSBTSigner(wallet, tdata.P2WSH_PSBT, None)
+    (sd_dir / "dummy.psbt").write_bytes(tdata.P2WSH_PSBT)
+    stream_signer = PSBTStreamSigner(wallet, "dummy.psbt")
+
+    assert stream_signer.outputs() == signer.outputs()
+    assert stream_signer.path_mismatch() == signer.path_mismatch()
+    assert stream_signer.psbt_policy_string() == signer.psbt_policy_string()
+    assert stream_signer.fill_zero_fingerprint() == signer.fill_zero_fingerprint()
+
+
+def test_sign_to_file_rejects_changed_file(mocker, m5stickv, tdata, sd_dir):
+    from embit.networks import NETWORKS
+    from krux.psbt_stream import PSBTStreamSigner
+    from krux.key import Key, TYPE_SINGLESIG
+    from krux.wallet import Wallet
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
+    (sd_dir / "dummy.psbt").write_bytes(tdata.P2WPKH_PSBT)
+    signer = PSBTStreamSigner(wallet, "dummy.psbt")
+
+    # Change the input amount after the PSBT was reviewed
+    changed = bytearray(tdata.P2WPKH_PSBT)
+    changed[len(signer.global_scope) + 4] ^= 0x01
+    (sd_dir / "dummy.psbt").write_bytes(bytes(changed))
+
+    with pytest.raises(ValueError, match="PSBT file changed"):
+        signer.sign_to_file("dummy-signed.psbt")
+    assert not (sd_dir / "dummy-signed.psbt").exists()
+
+
+def test_sign_to_file_fails_with_0_sigs_added(mocker, m5stickv, tdata, sd_dir):
+    from embit.networks import NETWORKS
+    from krux.psbt_stream import PSBTStreamSigner
+    from krux.key import Key, TYPE_SINGLESIG
+    from krux.wallet import Wallet
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
+    (sd_dir / "dummy.psbt").write_bytes(tdata.P2WPKH_PSBT)
+    signer = PSBTStreamSigner(wallet, "dummy.psbt")
+    mocker.patch.object(signer.view, "sign_scope", mocker.MagicMock(return_value=0))
+
+    with pytest.raises(ValueError, match="cannot sign"):
+        signer.sign_to_file("dummy-signed.psbt")
+    assert not (sd_dir / "dummy-signed.psbt").exists()
+
+
+def test_sign_to_file_base64(mocker, m5stickv, tdata, sd_dir):
+    import base64
+    from embit.networks import NETWORKS
+    from krux.psbt_stream import PSBTStreamSigner
+    from krux.key import Key, TYPE_SINGLESIG
+    from krux.wallet import Wallet
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
+    encoded = base64.b64encode(tdata.P2WPKH_PSBT)
+    # Unwrapped, and wrapped in lines decoded across small chunks
+    wrapped = b"\n".join(encoded[i : i + 64] for i in range(0, len(encoded), 64))
+    mocker.patch("krux.psbt_stream.BASE64_CHUNK_SIZE", 37)
+    for data in (encoded, wrapped + b"\n"):
+        (sd_dir / "dummy.psbt.txt").write_bytes(data)
+        signer = PSBTStreamSigner(wallet, "dummy.psbt.txt")
+        assert signer.is_b64_file
+        signer.sign_to_file("dummy-signed.psbt.txt")
+        assert (sd_dir / "dummy-signed.psbt.txt").read_bytes() == base64.b64encode(
+            tdata.SIGNED_P2WPKH_PSBT_SD
+        )
+
+
+def test_sign_to_file_base64_rejects_changed_file(mocker, m5stickv, tdata, sd_dir):
+    import base64
+    from embit.networks import NETWORKS
+    from krux.psbt_stream import PSBTStreamSigner
+    from krux.key import Key, TYPE_SINGLESIG
+    from krux.wallet import Wallet
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
+    (sd_dir / "dummy.psbt.txt").write_bytes(base64.b64encode(tdata.P2WPKH_PSBT))
+    signer = PSBTStreamSigner(wallet, "dummy.psbt.txt")
+
+    changed = bytearray(tdata.P2WPKH_PSBT)
+    changed[len(signer.global_scope) + 4] ^= 0x01
+    (sd_dir / "dummy.psbt.txt").write_bytes(base64.b64encode(bytes(changed)))
+
+    with pytest.raises(ValueError, match="PSBT file changed"):
+        signer.sign_to_file("dummy-signed.psbt.txt")
+    assert not (sd_dir / "dummy-signed.psbt.txt").exists()
+
+
+def test_init_fails_on_invalid_psbt(mocker, m5stickv, tdata, sd_dir):
+    from embit.networks import NETWORKS
+    from krux.psbt_stream import PSBTStreamSigner
+    from krux.key import Key, TYPE_SINGLESIG
+    from krux.wallet import Wallet
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
+    for data in (tdata.P2WPKH_PSBT[:-20], tdata.P2WSH_PSBT, b"psbt\xff\x00"):
+        (sd_dir / "dummy.psbt").write_bytes(data)
+        with pytest.raises(ValueError, match="Invalid PSBT"):
+            PSBTStreamSigner(wallet, "dummy.psbt")
+
+
+def test_is_streamable(mocker, m5stickv, tdata, sd_dir):
+    from krux.psbt_stream import PSBTStreamSigner
+
+    (sd_dir / "dummy.psbt").write_bytes(tdata.P2WPKH_PSBT)
+    (sd_dir / "dummy.psbt.txt").write_text(tdata.P2WPKH_PSBT_B64)
+    assert not PSBTStreamSigner.is_streamable("dummy.psbt")
+    assert not PSBTStreamSigner.is_streamable("missing.psbt")
+
+    mocker.patch("krux.psbt_stream.STREAM_SIZE_THRESHOLD", 0)
+    assert PSBTStreamSigner.is_streamable("dummy.psbt")
+    assert PSBTStreamSigner.is_streamable("dummy.psbt.txt")
+
+    (sd_dir / "dummy.txt").write_text("not a PSBT")
+    assert not PSBTStreamSigner.is_streamable("dummy.txt")
+
+
+def test_sign_to_file_keeps_open_error(mocker, m5stickv, tdata, sd_dir):
+    from embit.networks import NETWORKS
+    from krux.psbt_stream import PSBTStreamSigner
+    from krux.key import Key, TYPE_SINGLESIG
+    from krux.wallet import Wallet
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, TYPE_SINGLESIG, NETWORKS["test"]))
+    (sd_dir / "dummy.psbt").write_bytes(tdata.P2WPKH_PSBT)
+    signer = PSBTStreamSigner(wallet, "dummy.psbt")
+
+    # The signed file can't be created, e.g. the SD card is full
+    with pytest.raises(OSError, match="No space left"):
+        mocker.patch("builtins.open", side_effect=OSError("No space left"))
+        signer.sign_to_file("dummy-signed.psbt")
@@ -204,6 +204,90 @@ def test_to_qr_codes(mocker, m5stickv, tdata):
         assert len(codes) == expected_parts
 
 
+def test_qr_frame_cache(mocker, m5stickv):
+    import krux
+    from krux.qr import QRFrameCache, to_qr_codes, FORMAT_NONE, FORMAT_PMOFN
+    from krux.qr import FORMAT_BBQR
+    from krux.bbqr import BBQrCode
+
+    DATA = "UUucvki6KWyS35DhetbWPw1DiaccbHKywScF96E8VUwEnN1gss947UasRfkN" * 4
+    BBQR_DATA = BBQrCode("MFRGGZDFMZTWQ2LKNNWG23TPOBYXE43UOV3HO6DZPI" * 8, "2", "U")
+    QR_WIDTH = 33
+
+    cases = [
+        (FORMAT_NONE, DATA),
+        (FORMAT_PMOFN, DATA),
+        (FORMAT_BBQR, BBQR_DATA),
+    ]
+    for qr_format, data in cases:
+        code_generator = to_qr_codes(data, QR_WIDTH, qr_format)
+        expected = [next(code_generator)]
+        num_parts = expected[0][1]
+        for _ in range(num_parts - 1):
+            expected.append(next(code_generator))
+        assert num_parts > 1 or qr_format == FORMAT_NONE
+
+        encode = krux.qr.qrcode.encode
+        encode_spy = mocker.patch.object(krux.qr.qrcode, "encode", wraps=encode)
+        frames = QRFrameCache(data, QR_WIDTH, qr_format)
+        for _ in range(3):
+            for frame in expected:
+                assert frames.next_frame() == frame
+        assert frames.is_cached()
+        # Each code encoded only on the first loop
+        assert encode_spy.call_count == num_parts
+        encode_spy.reset_mock()
+
+        # Codes don't fit the budget, so they are encoded on every loop
+        frames = QRFrameCache(data, QR_WIDTH, qr_format, budget=1)
+        for _ in range(3):
+            for frame in expected:
+                assert frames.next_frame() == frame
+        assert not frames.is_cached()
+        assert encode_spy.call_count == 3 * num_parts
+        mocker.stopall()
+
+
+def test_raster_rows(m5stickv):
+    import random
+    from krux.qr import get_row, raster_rows
+
+    rng = random.Random(0)
+    for size, border in ((21, 0), (21, 1), (25, 3), (97, 1)):
+        code = bytearray(rng.getrandbits(8) for _ in range((size * size + 7) >> 3))
+        width = size + 2 * border
+
+        def dark(x, y):
+            x -= border
+            y -= border
+            if not (0 <= x < size and 0 <= y < size):
+                return False
+            index = y * size + x
+            return bool(code[index >> 3] & (1 << (index % 8)))
+
+        rows = list(raster_rows(code, size, border))
+        assert len(rows) == width
+        for y, (packed, runs) in enumerate(rows):
+            assert len(packed) == (width + 7) >> 3
+            expected_runs = []
+            for x in range(width):
+                bit = bool(packed[x >> 3] & (0x80 >> (x % 8)))
+                assert bit == dark(x, y)
+                if bit and (x == 0 or not dark(x - 1, y)):
+                    expected_runs.append([x, 0])
+                if bit:
+                    expected_runs[-1][1] += 1
+            assert runs == [tuple(run) for run in expected_runs]
+            if border <= y < size + border:
+                assert get_row(code, size, y - border) << border == sum(
+                    1 << x for x in range(width) if dark(x, y)
+                )
+
+    # Runs spanning whole bytes and reaching the last module
+    rows = list(raster_rows(b"\xff" * 8, 8))
+    assert rows[0] == (b"\xff", [(0, 8)])
+
+
 def test_detect_plaintext_qr(mocker, m5stickv):
     from krux.qr import detect_format
 
@@ -244,3 +328,21 @@ def test_parse_pmofn_rejects_invalid_index(m5stickv):
 
     with pytest.raises(ValueError, match="Invalid pMofN part index"):
         parse_pmofn_qr_part("p4of3 data")
+
+
+def test_parser_skips_bbqr_parts_it_cannot_decode(mocker, m5stickv, tdata):
+    from krux.qr import QRPartParser
+
+    parts = tdata.TEST_PARTS_FORMAT_MULTIPART_BBQR
+    parser = QRPartParser()
+    assert parser.parse(parts[0]) == 0
+
+    # A part of a BBQr with another total, and a corrupt part
+    assert parser.parse(parts[1][:4] + "06" + parts[1][6:]) is None
+    assert parser.parse(parts[1][:8] + "1" + parts[1][9:]) is None
+    assert parser.parsed_count() == 1
+
+    for part in parts[1:]:
+        parser.parse(part)
+    assert parser.is_complete()
+    assert parser.result() == tdata.TEST_DATA_BBQR_MULTI
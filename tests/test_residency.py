@@ -0,0 +1,163 @@
+import pytest
+
+
+@pytest.fixture
+def heap(mocker):
+    import gc
+
+    # Each import and mark reads the heap before and after
+    allocated = {"bytes": 0}
+    mocker.patch.object(gc, "mem_alloc", side_effect=lambda: allocated["bytes"])
+    return allocated
+
+
+def test_load_records_import_cost(mocker, m5stickv, heap):
+    import sys
+    import builtins
+    from krux.residency import ModuleResidency
+
+    real_import = builtins.__import__
+
+    def costly_import(name, *args, **kwargs):
+        if name == "krux.pages.tools":
+            heap["bytes"] += 4000
+        return real_import(name, *args, **kwargs)
+
+    mocker.patch.object(builtins, "__import__", side_effect=costly_import)
+    residency = ModuleResidency()
+    residency.recording = True
+
+    tools = residency.load("krux.pages.tools")
+    assert tools is sys.modules["krux.pages.tools"]
+    assert residency.costs == {"krux.pages.tools": 4000}
+    assert residency.imports[0][0] == "krux.pages.tools"
+    assert residency.imports[0][2] == 4000
+
+    # Loading a resident module doesn't import it again
+    residency.release("krux.pages.tools")
+    assert residency.load("krux.pages.tools") is tools
+    assert len(residency.imports) == 1
+
+
+def test_release_evicts_least_recently_used(mocker, m5stickv):
+    import sys
+    from krux.residency import ModuleResidency
+
+    residency = ModuleResidency(budget=10)
+    names = ("krux.pages.tools", "krux.pages.datum_tool", "krux.pages.device_tests")
+    for name in names:
+        residency.load(name)
+    residency.costs.update({name: 4 for name in names})
+
+    # Modules in use are never unloaded
+    residency.load(names[0])
+    residency.release(names[0])
+    residency.release(names[1])
+    residency.release(names[2])
+    assert residency.idle == list(names[1:])
+    residency.release(names[0])
+
+    # Releasing the third idle module exceeds the budget
+    assert residency.idle == [names[2], names[0]]
+    assert names[1] not in sys.modules
+    assert not hasattr(sys.modules["krux.pages"], "datum_tool")
+    assert names[2] in sys.modules
+
+
+def test_unload(mocker, m5stickv):
+    import sys
+    from krux.residency import ModuleResidency
+
+    residency = ModuleResidency()
+    residency.load("krux.pages.tools")
+    residency.unload("krux.pages.tools")
+
+    assert "krux.pages.tools" not in sys.modules
+    assert not hasattr(sys.modules["krux.pages"], "tools")
+    assert not residency.costs
+    assert not residency.in_use
+
+
+def test_report(mocker, m5stickv, heap):
+    import time
+    from krux.residency import ModuleResidency
+
+    residency = ModuleResidency()
+    residency.recording = True
+    time.ticks_ms.side_effect = [100, 150, 400]
+    residency.mark("start")
+    residency.mark("splash")
+    heap["bytes"] = 2048
+    residency.mark("login ready")
+    residency.imports.append(("krux.pages.login", 120, 1024))
+
+    assert residency.report().split("\n") == [
+        "Boot timeline (ms, heap bytes):",
+        "     0     +0        0  start",
+        "    50    +50        0  splash",
+        "   300   +250     2048  login ready",
+        "Imports (ms, heap bytes):",
+        "   120     1024  krux.pages.login",
+    ]
+
+
+def test_unload_idle(mocker, m5stickv):
+    import sys
+    from krux.residency import ModuleResidency
+
+    residency = ModuleResidency()
+    for name in ("krux.pages.tools", "krux.pages.datum_tool"):
+        residency.load(name)
+        residency.release(name)
+    residency.load("krux.pages.device_tests")
+    residency.unload_idle()
+
+    assert not residency.idle
+    assert "krux.pages.tools" not in sys.modules
+    assert "krux.pages.datum_tool" not in sys.modules
+    # Modules in use are kept
+    assert "krux.pages.device_tests" in sys.modules
+
+
+def test_imports_are_capped(mocker, m5stickv):
+    from krux.residency import ModuleResidency, MAX_IMPORTS
+
+    residency = ModuleResidency()
+    residency.recording = True
+    for _ in range(MAX_IMPORTS + 1):
+        residency.load("krux.pages.tools")
+        residency.unload("krux.pages.tools")
+    assert len(residency.imports) == MAX_IMPORTS
+
+
+def test_not_recording(mocker, m5stickv):
+    import gc
+    from krux.residency import ModuleResidency
+
+    collect = mocker.patch.object(gc, "collect")
+    residency = ModuleResidency()
+    residency.on_boot = mocker.MagicMock()
+
+    residency.mark("start")
+    residency.load("krux.pages.tools")
+    residency.boot_done()
+
+    # Costs are still kept for the budget
+    assert "krux.pages.tools" in residency.costs
+    assert not residency.timeline
+    assert not residency.imports
+    collect.assert_not_called()
+    residency.on_boot.assert_not_called()
+
+
+def test_boot_done(mocker, m5stickv):
+    from krux.residency import ModuleResidency
+
+    residency = ModuleResidency()
+    residency.recording = True
+    residency.on_boot = mocker.MagicMock()
+    residency.mark("start")
+    residency.boot_done()
+
+    assert [label for label, _, _ in residency.timeline] == ["start", "login ready"]
+    residency.on_boot.assert_called_once_with(residency.report())
@@ -61,6 +61,30 @@ def test_sd_read_with_mock(m5stickv, mocker_sd_card_ok):
     assert ex == False  # runned with mock, everything fine!
 
 
+def test_sd_write_chunks(m5stickv, mocker, mocker_sd_card_ok):
+    from krux.sd_card import SDHandler, iter_chunks
+
+    chunks = [b"header\n", "text\n", b"x" * 10, bytearray(b"y" * 30), b"z" * 3]
+    writes = []
+    mock_open = mocker.patch("builtins.open", mocker.mock_open())
+    # The buffer is reused, so copy what each write receives
+    mock_open().write.side_effect = lambda data: writes.append(bytes(data))
+    with SDHandler() as sd:
+        sd.write_chunks("afile", iter(chunks), buffer_size=16)
+
+    mock_open.assert_called_with("/sd/afile", "wb")
+    assert b"".join(writes) == b"header\ntext\n" + b"x" * 10 + b"y" * 30 + b"z" * 3
+    # Small chunks are gathered up to the buffer size, larger ones written as is
+    assert writes == [b"header\ntext\n", b"x" * 10, b"y" * 30, b"z" * 3]
+
+    assert [bytes(chunk) for chunk in iter_chunks(b"abcde", 2)] == [
+        b"ab",
+        b"cd",
+        b"e",
+    ]
+    assert list(iter_chunks("abcde", 3)) == ["abc", "de"]
+
+
 def test_sd_card_dir_exists(m5stickv, mocker_sd_card_dir_exist):
     from krux.sd_card import SDHandler
 
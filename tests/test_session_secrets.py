@@ -0,0 +1,85 @@
+def test_zeroize():
+    from krux.session_secrets import zeroize
+
+    buffer = bytearray(b"secret")
+    zeroize(buffer)
+    assert buffer == bytearray(6)
+
+
+def test_clear_caches(mocker):
+    from krux.session_secrets import register_cache, clear_caches
+
+    clear_seeds = mocker.MagicMock()
+    clear_keys = mocker.MagicMock()
+    register_cache("krux.test_seeds", clear_seeds)
+    register_cache("krux.test_keys", clear_keys)
+    clear_caches()
+
+    clear_seeds.assert_called_once()
+    clear_keys.assert_called_once()
+
+
+def test_register_cache_again_clears_previous_copy(mocker):
+    from krux.session_secrets import register_cache, clear_caches
+
+    # A module unloaded and imported again registers its new cache
+    clear_old = mocker.MagicMock()
+    clear_new = mocker.MagicMock()
+    register_cache("krux.test_seeds", clear_old)
+    register_cache("krux.test_seeds", clear_new)
+    clear_old.assert_called_once()
+
+    clear_caches()
+    clear_old.assert_called_once()
+    clear_new.assert_called_once()
+
+
+def test_keyed_hash():
+    from hashlib import sha256
+    from krux.session_secrets import keyed_hash, clear_caches
+
+    digest = keyed_hash(b"key", b"salt")
+    assert keyed_hash(b"key", b"salt") == digest
+    assert keyed_hash(b"keys", b"alt") != digest
+    assert digest != sha256(b"keysalt").digest()
+
+    # The session key is renewed when caches are cleared
+    clear_caches()
+    assert keyed_hash(b"key", b"salt") != digest
+
+
+def test_secret_cache(mocker):
+    from hashlib import sha256
+    from krux.session_secrets import SecretCache
+
+    derive = mocker.MagicMock(side_effect=lambda: b"secret")
+    cache = SecretCache(2)
+    assert cache.get(derive, b"a") == b"secret"
+    assert cache.get(derive, b"a") == b"secret"
+    derive.assert_called_once()
+
+    # Cache keys aren't a plain hash of the parts
+    assert sha256(b"a").digest() not in cache.secrets
+
+    secrets = list(cache.secrets.values())
+    cache.clear()
+    assert not cache.secrets and not cache.order
+    assert all(secret == bytearray(len(secret)) for secret in secrets)
+
+
+def test_secret_cache_is_bounded(mocker):
+    from krux.session_secrets import SecretCache
+
+    derive = mocker.MagicMock(side_effect=lambda: b"secret")
+    cache = SecretCache(2)
+    cache.get(derive, b"a")
+    cache.get(derive, b"b")
+    # The most recently used survives eviction
+    cache.get(derive, b"a")
+    evicted = cache.secrets[cache.order[0]]
+    cache.get(derive, b"c")
+
+    assert len(cache.secrets) == 2
+    assert evicted == bytearray(len(evicted))
+    cache.get(derive, b"a")
+    assert derive.call_count == 3
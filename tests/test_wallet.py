@@ -988,6 +988,104 @@ def test_receive_addresses(mocker, m5stickv, tdata):
         n += 1
 
 
+def test_obtain_addresses_matches_descriptor_derivation(mocker, m5stickv, tdata):
+    from krux.wallet import Wallet
+    from embit.networks import NETWORKS
+
+    for wallet_data in (
+        tdata.SPECTER_MULTISIG_NESTED_WALLET_DATA,
+        tdata.BLUEWALLET_LEGACY_DESCRIPTOR,
+        tdata.UR_OUTPUT_MULTISIG_DESCRIPTOR,
+        tdata.LIANA_MINISCRIPT_DESCRIPTOR,
+        tdata.LIANA_TAPROOT_MINISCRIPT_DESCRIPTOR,
+        tdata.LIANA_TAP_EXPANDING_MINISCRIPT_DESCRIPTOR,
+    ):
+        wallet = Wallet(None)
+        wallet.load(wallet_data, None)
+        network = NETWORKS[wallet.which_network()]
+        for branch_index in range(wallet.descriptor.num_branches):
+            expected = [
+                wallet.descriptor.derive(i, branch_index=branch_index).address(
+                    network=network
+                )
+                for i in range(5)
+            ]
+            assert (
+                list(wallet.obtain_addresses(0, limit=5, branch_index=branch_index))
+                == expected
+            )
+
+
+def test_obtain_addresses_cache(mocker, m5stickv, tdata):
+    from krux.wallet import Wallet, ADDRESS_CACHE_SIZE
+
+    wallet = Wallet(None)
+    wallet.load(tdata.SPECTER_MULTISIG_NESTED_WALLET_DATA, None)
+    receive = list(wallet.obtain_addresses(0, limit=10))
+    change = list(wallet.obtain_addresses(0, limit=10, branch_index=1))
+    assert not set(receive) & set(change)
+
+    # Branch keys are derived once, paging back only hits the cache
+    branch_descriptor = mocker.spy(wallet, "_branch_descriptor")
+    assert list(wallet.obtain_addresses(0, limit=10)) == receive
+    branch_descriptor.assert_not_called()
+
+    # Cache is bounded, older addresses are derived again from the branch keys
+    list(wallet.obtain_addresses(10, limit=ADDRESS_CACHE_SIZE))
+    assert len(wallet._derived.addresses) == ADDRESS_CACHE_SIZE
+    assert list(wallet.obtain_addresses(0, limit=10)) == receive
+    assert branch_descriptor.call_count == ADDRESS_CACHE_SIZE + 10
+
+    # Loading a new descriptor drops cached keys and addresses
+    wallet.load(tdata.SPECTER_MULTISIG_WALLET_DATA, None)
+    assert not wallet._derived.addresses
+    assert list(wallet.obtain_addresses(0, limit=10)) != receive
+
+
+def test_find_address(mocker, m5stickv, tdata):
+    from krux.wallet import Wallet, SCRIPT_DIGEST_SIZE
+    from embit.networks import NETWORKS
+    from embit.script import address_to_scriptpubkey
+
+    wallet = Wallet(None)
+    with pytest.raises(ValueError):
+        wallet.find_address("3KLoUhwLihgC5aPQPFHakWUtJ4QoBkT7Aw", 10)
+
+    wallet.load(tdata.SPECTER_MULTISIG_NESTED_WALLET_DATA, None)
+    receive = list(wallet.obtain_addresses(0, limit=20))
+    change = list(wallet.obtain_addresses(0, limit=20, branch_index=1))
+
+    assert wallet.find_address(receive[7], 10) == 7
+    assert wallet.find_address(change[7], 10) is None
+    assert wallet.find_address(change[7], 10, branch_index=1) == 7
+    assert wallet.find_address(receive[15], 10) is None
+    assert wallet.find_address(receive[15], 20) == 15
+
+    # Indexed scripts are answered without extending the index, deriving only
+    # the matching candidate to confirm it
+    derive_address = mocker.spy(wallet, "_derive_address")
+    assert wallet.find_address(receive[3], 10) == 3
+    assert wallet.find_address(receive[19], 10) == 19
+    assert len(wallet._derived.scripts[0]) == 20 * SCRIPT_DIGEST_SIZE
+    assert derive_address.call_count == 2
+
+    # Same script on another network is not the same address
+    testnet_address = address_to_scriptpubkey(receive[3]).address(NETWORKS["test"])
+    assert wallet.find_address(testnet_address, 20) is None
+
+
+def test_find_address_digest_collisions(mocker, m5stickv, tdata):
+    from krux.wallet import Wallet
+
+    # With 1-byte digests, collisions are resolved by deriving the candidates
+    mocker.patch("krux.wallet.SCRIPT_DIGEST_SIZE", 1)
+    wallet = Wallet(None)
+    wallet.load(tdata.LIANA_MINISCRIPT_DESCRIPTOR, None)
+    receive = list(wallet.obtain_addresses(0, limit=300))
+    for i in (0, 150, 299):
+        assert wallet.find_address(receive[i], 300) == i
+
+
 def test_load_multisig(mocker, m5stickv, tdata):
     from krux.wallet import Wallet
     from krux.qr import FORMAT_NONE, FORMAT_PMOFN, FORMAT_UR
@@ -1,2 +1,6 @@
+_.add_frame  # unused method (src/krux/pages/qr_view.py:291)
 GRBLPrinter  # unused class (src/krux/printers/cnc.py:361)
 AdafruitPrinter  # unused class (src/krux/printers/thermal.py:50)
+compress  # unused variable (src/krux/psbt_stream.py:81)
+_.hash_amounts  # unused method (src/krux/psbt_stream.py:84)
+_.hash_script_pubkeys  # unused method (src/krux/psbt_stream.py:87)